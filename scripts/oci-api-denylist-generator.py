@@ -4,11 +4,36 @@ Licensed under the Universal Permissive License v1.0 as shown at
 https://oss.oracle.com/licenses/upl.
 """
 
+import argparse
+import glob
+import logging
 import os
 import re
 import subprocess
+import sys
+import tempfile
+import threading
+import time
 from datetime import datetime
 
+# the crawl uses the help cache of the oci-api MCP server, so the server and
+# this script share one cache per CLI version
+SERVER_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "src", "oci-api-mcp-server"
+)
+sys.path.insert(0, SERVER_DIR)
+from oracle.oci_api_mcp_server.help_cache import (  # noqa: E402
+    HelpCache,
+    parse_subcommands,
+)
+
+# commands of the CLI itself rather than of an OCI service
+CLI_COMMANDS = {"raw-request", "session", "setup"}
+
+PROGRESS_INTERVAL = 5  # seconds between throughput reports
+
+logger = logging.getLogger("oci-api-denylist-generator")
+
 
 def get_oci_version():
     result = subprocess.run(
@@ -17,76 +42,170 @@ def get_oci_version():
     return result.stdout.strip()
 
 
-def get_services():
-    result = subprocess.run(["oci", "--help"], capture_output=True, text=True)
-    output = result.stdout.splitlines()
-    services = []
-    for line in output:
-        match = re.match(r"^\s{4}(\w+(-\w+)*)", line)
-        if match:
-            services.append(match.group(1))
-    services = services[5:]  # Skipping the first 5 lines as they are not services
-    services.sort()
-    return services
+def previous_cache(cache: HelpCache):
+    """Returns the help cache of the most recently crawled other CLI version"""
+    paths = [
+        path
+        for path in glob.glob(os.path.join(cache.cache_dir, "help-*.jsonl"))
+        if path != cache.path
+    ]
+    if not paths:
+        return None
+    path = max(paths, key=os.path.getmtime)
+    print(f"Reusing unchanged commands from {path}")
+    version = re.match(r"help-(.+)\.jsonl$", os.path.basename(path)).group(1)
+    return HelpCache(logger, cache.cache_dir, version=version)
 
 
-def get_sub_commands(command: str):
-    indentation_level = len(command.split())
-    print(f"{'  '*indentation_level}Getting subcommands for: {command}")
-    try:
-        result = subprocess.run(
-            f"oci {command} --help", shell=True, capture_output=True, text=True
+class HelpRunner:
+    """
+    Runs `oci <command> --help` for HelpCache.prebuild, recording failures and
+    printing the throughput every few seconds.
+
+    A command that was a leaf in the previous CLI version's cache is not run
+    when the help of its parent group is unchanged; its previous help is
+    returned instead, so a crawl for a new CLI version only runs the help of
+    the groups that changed.
+    """
+
+    def __init__(self, cache: HelpCache, previous):
+        self.cache = cache
+        self.previous = previous
+        self.errors = {}
+        self.stats = {"run": 0, "reused": 0}
+        self.lock = threading.Lock()
+        self.started = time.monotonic()
+        self.reported = self.started
+
+    def reusable(self, command: str):
+        if self.previous is None:
+            return None
+        previous = self.previous.get(command)
+        if previous is None or parse_subcommands(previous[1]):
+            return None
+        parent = command.rsplit(" ", 1)[0] if " " in command else ""
+        # children are only looked up once their parent is cached
+        if self.previous.get(parent) != self.cache.get(parent):
+            return None
+        return previous[1]
+
+    def __call__(self, command: str):
+        text = self.reusable(command)
+        if text is not None:
+            self.count("reused")
+            return True, text
+        try:
+            result = subprocess.run(
+                ["oci"] + command.split() + ["--help"],
+                capture_output=True,
+                text=True,
+                stdin=subprocess.DEVNULL,
+            )
+        except Exception as e:
+            self.fail(command, str(e))
+            raise
+        self.count("run")
+        if result.returncode != 0:
+            message = result.stderr.strip() or f"exit status {result.returncode}"
+            self.fail(command, message)
+            return False, message
+        return True, result.stdout
+
+    def fail(self, command: str, message: str):
+        print(f"Error getting sub-commands for {command}: {message}")
+        with self.lock:
+            self.errors[command] = message
+
+    def count(self, stat: str):
+        with self.lock:
+            self.stats[stat] += 1
+        self.report()
+
+    def report(self, final: bool = False):
+        with self.lock:
+            now = time.monotonic()
+            if not final and now - self.reported < PROGRESS_INTERVAL:
+                return
+            self.reported = now
+            run, reused = self.stats["run"], self.stats["reused"]
+            failed = len(self.errors)
+        elapsed = max(now - self.started, 1e-9)
+        print(
+            f"{run + reused} commands in {elapsed:.0f}s: {run} run "
+            f"({run / elapsed:.1f}/s), {reused} reused, {failed} failed",
+            flush=True,
         )
-        output = result.stdout.splitlines()
-        sub_commands = []
-        in_commands_section = False
-        for line in output:
-            if "Commands:" in line:
-                in_commands_section = True
-                continue
-            if in_commands_section:
-                if line.startswith("   "):
-                    continue
-                # match = re.match(r"^\s{2}(\w+)", line)
-                match = line.split()[0]
-                if match:
-                    print(f"{'  '*indentation_level}Appending sub command {match}")
-                    sub_commands.append(match)
+
+
+def leaf_commands(cache: HelpCache, services):
+    """Returns the leaf commands below the given services, depth first"""
+    commands = []
+
+    def walk(command):
+        cached = cache.get(command)
+        if cached is None or not cached[0]:
+            return  # its help failed
+        sub_commands = parse_subcommands(cached[1])
         if not sub_commands:
-            return [command]
-        else:
-            commands = []
-            for sub_command in sub_commands:
-                commands.extend(get_sub_commands(f"{command} {sub_command}"))
-            return commands
-    except Exception as e:
-        print(f"Error getting sub-commands for {command}: {e}")
-        return []
-
-
-def get_commands(version):
-    commands_file = f"commands_{version}.txt"
-    if not os.path.exists(commands_file):
-        print(f"Creating {commands_file} file..")
-        services = get_services()
-        with open(commands_file, "w") as f:
-            f.write(
-                (
-                    "# Copyright (c) 2025, Oracle and/or its affiliates.\n"
-                    "# Licensed under the Universal Permissive License v1.0 as shown at\n"
-                    "# https://oss.oracle.com/licenses/upl.\n\n"
-                    "# This list contains all OCI cli commands\n\n"
-                )
-            )
+            commands.append(command)
+        for sub_command in sub_commands:
+            walk(f"{command} {sub_command}")
+
+    for service in services:
+        walk(service)
+    return commands
 
-            for service in services:
-                print(f"Generating commands for service: {service}")
-                commands = get_sub_commands(service)
-                for command in commands:
-                    f.write(command + "\n")
-                    f.flush()
-    else:
+
+def write_atomically(path: str, text: str):
+    """Writes a file through a temporary file, so readers never see it half written"""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(
+        dir=directory, prefix=f".{os.path.basename(path)}."
+    )
+    umask = os.umask(0)
+    os.umask(umask)
+    try:
+        os.chmod(temp_path, 0o666 & ~umask)
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+def get_commands(version, workers, cache_dir):
+    commands_file = f"commands_{version}.txt"
+    if os.path.exists(commands_file):
         print(f"Commands already exist for version {version}")
+        return True
+
+    print(f"Creating {commands_file} file..")
+    cache = HelpCache(logger, cache_dir, version=version)
+    runner = HelpRunner(cache, previous_cache(cache))
+    cache.prebuild(runner, workers)
+    runner.report(final=True)
+
+    if runner.errors:
+        print(
+            f"{len(runner.errors)} help commands failed, {commands_file} was not "
+            "written. Run the script again to retry them; the other commands are cached."
+        )
+        return False
+
+    _, root_help = cache.get("")
+    services = sorted(set(parse_subcommands(root_help)) - CLI_COMMANDS)
+    write_atomically(
+        commands_file,
+        (
+            "# Copyright (c) 2025, Oracle and/or its affiliates.\n"
+            "# Licensed under the Universal Permissive License v1.0 as shown at\n"
+            "# https://oss.oracle.com/licenses/upl.\n\n"
+            "# This list contains all OCI cli commands\n\n"
+        )
+        + "".join(command + "\n" for command in leaf_commands(cache, services)),
+    )
+    return True
 
 
 def create_denylist(version):
@@ -94,12 +213,6 @@ def create_denylist(version):
     denylist_filename = f"{denylist_prefix}_{version}"
     commands_file = f"commands_{version}.txt"
 
-    if os.path.exists(denylist_filename):
-        backup_filename = (
-            f"{denylist_filename}_backup_{datetime.now().strftime('%d%b%y_%H%M')}"
-        )
-        os.rename(denylist_filename, backup_filename)
-
     with open(commands_file, "r") as f:
         commands = [
             line.strip()
@@ -123,22 +236,29 @@ def create_denylist(version):
         if any(cmd.split()[-1].startswith(action) for action in actions)
     ]
 
-    with open(denylist_filename, "w") as f:
-        for command in sorted(denied_commands):
-            f.write(command + "\n")
-
-    with open(denylist_prefix, "w") as f:
-        f.write(
-            (
-                "# Copyright (c) 2025, Oracle and/or its affiliates.\n"
-                "# Licensed under the Universal Permissive License v1.0 as shown at\n"
-                "# https://oss.oracle.com/licenses/upl.\n\n"
-                "# This list contains the list of commands that can change the configuration of the cloud system.\n"  # noqa E501
-                "# These commands will be denied execution and the AI client should immediately stop processing the command.\n"  # noqa E501
-                "# It should also stop suggesting any alternatives to the user\n\n"
-            )
+    if os.path.exists(denylist_filename):
+        backup_filename = (
+            f"{denylist_filename}_backup_{datetime.now().strftime('%d%b%y_%H%M')}"
         )
-        f.write("\n".join(sorted(denied_commands)))
+        os.rename(denylist_filename, backup_filename)
+
+    write_atomically(
+        denylist_filename,
+        "".join(command + "\n" for command in sorted(denied_commands)),
+    )
+
+    write_atomically(
+        denylist_prefix,
+        (
+            "# Copyright (c) 2025, Oracle and/or its affiliates.\n"
+            "# Licensed under the Universal Permissive License v1.0 as shown at\n"
+            "# https://oss.oracle.com/licenses/upl.\n\n"
+            "# This list contains the list of commands that can change the configuration of the cloud system.\n"  # noqa E501
+            "# These commands will be denied execution and the AI client should immediately stop processing the command.\n"  # noqa E501
+            "# It should also stop suggesting any alternatives to the user\n\n"
+        )
+        + "\n".join(sorted(denied_commands)),
+    )
 
     print(f"{denylist_prefix} has been created successfully")
 
@@ -148,9 +268,28 @@ def create_denylist(version):
 
 
 def main():
+    parser = argparse.ArgumentParser(
+        description="Generates the OCI CLI command catalog and denylist"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=2 * (os.cpu_count() or 4),
+        help="number of `oci --help` processes to run at once",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default="",
+        help="directory of the per-version help cache, by default the one of the "
+        "oci-api MCP server (ORACLE_MCP_CLI_HELP_CACHE_DIR or "
+        "~/.cache/oracle.oci-api-mcp-server)",
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     version = get_oci_version()
-    get_commands(version)
-    create_denylist(version)
+    if get_commands(version, args.workers, args.cache_dir):
+        create_denylist(version)
 
 
 if __name__ == "__main__":
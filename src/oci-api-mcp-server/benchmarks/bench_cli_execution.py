@@ -0,0 +1,62 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+
+Measures per-command latency of the CLI executor behind run_oci_command and
+get_oci_command_help, in "subprocess" mode (a fresh `oci` process per command)
+and "warm" mode (a child forked from a fork server that imported the CLI once).
+
+The commands are run the way run_oci_command runs them (with --profile and
+--auth). Without valid credentials they fail quickly after argument parsing,
+which still measures the startup cost the warm mode removes; with credentials
+the numbers also include the service round-trip.
+
+Usage:
+  uv run python benchmarks/bench_cli_execution.py [iterations] [command ...]
+  ORACLE_MCP_CLI_PRELOAD_SERVICES=compute,iam uv run python benchmarks/bench_cli_execution.py
+"""
+
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from oracle.oci_api_mcp_server.executor import CliExecutor
+
+DEFAULT_COMMANDS = ["compute instance list --help", "iam region list"]
+
+
+def time_command(executor: CliExecutor, args: list, env: dict) -> float:
+    start = time.perf_counter()
+    try:
+        executor.run(args, env)
+    except subprocess.CalledProcessError:
+        pass
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    commands = sys.argv[2:] or DEFAULT_COMMANDS
+    profile = os.getenv("OCI_CONFIG_PROFILE", "DEFAULT")
+    env = dict(os.environ)
+    logger = logging.getLogger("bench")
+
+    for mode in ("subprocess", "warm"):
+        executor = CliExecutor(logger, mode=mode)
+        executor.start()
+        for command in commands:
+            args = ["--profile", profile, "--auth", "security_token"] + command.split()
+            time_command(executor, args, env)  # first run loads the service
+            samples = [time_command(executor, args, env) for _ in range(iterations)]
+            print(
+                f"{mode:<11} {command:<32} median {statistics.median(samples):8.1f} ms"
+                f"   min {min(samples):8.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+
+Measures the build time of the command index behind search_oci_commands over
+the shipped command catalog, and the latency of a few typical queries. Set
+ORACLE_MCP_CLI_HELP_CACHE_DIR to include the summaries of a prebuilt help cache.
+
+Usage:
+  uv run python benchmarks/bench_command_search.py [iterations] [query ...]
+"""
+
+import logging
+import statistics
+import sys
+import time
+
+from oracle.oci_api_mcp_server.command_index import CommandIndex
+from oracle.oci_api_mcp_server.help_cache import HelpCache
+
+DEFAULT_QUERIES = [
+    "list instances",
+    "instnace list",
+    "bucket lifecycle",
+    "autonomous database backup",
+    "vcn create",
+]
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    queries = sys.argv[2:] or DEFAULT_QUERIES
+    logger = logging.getLogger("bench")
+
+    start = time.perf_counter()
+    index = CommandIndex(logger)
+    index.sync(HelpCache(logger))
+    print(
+        f"build {len(index)} commands   {(time.perf_counter() - start) * 1000:8.1f} ms"
+    )
+
+    for query in queries:
+        samples = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            results = index.search(query, 5)
+            samples.append((time.perf_counter() - start) * 1000)
+        print(
+            f"{query:<28} median {statistics.median(samples):6.2f} ms"
+            f"   top: {results[0]['command'] if results else '-'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+
+Load test of run_oci_command with many concurrent MCP sessions, one of which
+runs a slow command (think `--all` over a large compartment).
+
+By default the `oci` executable is replaced by a stand-in script that sleeps
+(3 s for the slow command, 0.1 s for the others), so no credentials are needed
+and the numbers only reflect the server's scheduling. The test runs twice:
+"blocking" waits for each command on the event loop thread as the tools did
+before, "async" uses CliExecutor.run_async.
+
+Usage:
+  uv run python benchmarks/bench_concurrent_sessions.py [sessions] [calls per session]
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+from fastmcp import Client
+from oracle.oci_api_mcp_server import server
+
+FAKE_OCI = """#!/bin/sh
+case "$5" in
+  slow) sleep 3;;
+  *) sleep 0.1;;
+esac
+echo '{"data": []}'
+"""
+
+
+async def session(calls: int, command: str) -> list:
+    latencies = []
+    async with Client(server.mcp) as client:
+        for _ in range(calls):
+            start = time.perf_counter()
+            await client.call_tool("run_oci_command", {"command": command})
+            latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+async def load(sessions: int, calls: int):
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        session(1, "slow list --all"),
+        *(session(calls, "fast list") for _ in range(sessions)),
+    )
+    wall = time.perf_counter() - start
+    fast = [latency for latencies in results[1:] for latency in latencies]
+    return wall, fast
+
+
+def main():
+    sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    calls = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    bin_dir = tempfile.mkdtemp()
+    with open(os.path.join(bin_dir, "oci"), "w") as oci:
+        oci.write(FAKE_OCI)
+    os.chmod(os.path.join(bin_dir, "oci"), 0o755)
+    os.environ["PATH"] = f"{bin_dir}{os.pathsep}{os.environ['PATH']}"
+    server.cli_executor.workers = max(server.cli_executor.workers, 8)
+
+    run_async = server.cli_executor.run_async
+
+    async def run_blocking(args, env, on_stdout=None):
+        result = server.cli_executor.run(args, env)
+        on_stdout(result.stdout.encode())
+        return result
+
+    for mode, runner in (("blocking", run_blocking), ("async", run_async)):
+        server.cli_executor.run_async = runner
+        wall, fast = asyncio.run(load(sessions, calls))
+        print(
+            f"{mode:<9} {sessions} sessions x {calls} calls + 1 slow call"
+            f"   wall {wall:6.2f} s   fast call median {statistics.median(fast):6.3f} s"
+            f"   max {max(fast):6.3f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
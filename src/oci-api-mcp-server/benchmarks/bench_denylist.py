@@ -0,0 +1,67 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+
+Compares the denylist lookup of run_oci_command before and after compiling the
+rules into a RuleSet trie: a linear `in` check over the list of rules against a
+trie walk, for the shipped denylist and for synthetic rule sets of growing size
+that mix exact, subtree (`service group *`) and wildcard rules.
+
+Usage:
+  uv run python benchmarks/bench_denylist.py [iterations]
+"""
+
+import logging
+import sys
+import time
+
+from oracle.oci_api_mcp_server.denylist import Denylist, RuleSet
+
+COMMANDS = [
+    "compute instance list",
+    "compute instance terminate",
+    "os bucket delete",
+    "zzz unknown command",
+]
+
+
+def synthetic_rules(count: int) -> list:
+    rules = []
+    for i in range(count):
+        if i % 10 == 0:
+            rules.append(f"service{i} group{i} *")
+        elif i % 10 == 1:
+            rules.append(f"service{i} * delete-*")
+        else:
+            rules.append(f"service{i} group{i} action{i}")
+    return rules
+
+
+def time_per_lookup(check, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for command in COMMANDS:
+            check(command)
+    return (time.perf_counter() - start) * 1e6 / (iterations * len(COMMANDS))
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    shipped = Denylist(logging.getLogger("bench"), allowlist_path="").denylist
+
+    for name, rules in [("shipped", shipped)] + [
+        (f"synthetic {count}", shipped + synthetic_rules(count))
+        for count in (10_000, 50_000)
+    ]:
+        rule_set = RuleSet(rules)
+        linear = time_per_lookup(lambda command: command in rules, iterations // 10)
+        trie = time_per_lookup(rule_set.matches, iterations)
+        print(
+            f"{name:<16} {len(rules):>6} rules   list {linear:9.2f} us"
+            f"   trie {trie:6.2f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
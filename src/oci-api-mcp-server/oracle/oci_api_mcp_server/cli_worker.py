@@ -0,0 +1,82 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+
+Runs OCI CLI commands inside a process forked from a warm fork server.
+
+Importing this module imports the whole oci_cli/oci package tree, which is what
+makes a fresh `oci` process slow to start. The fork server of the warm execution
+mode (see executor.py) imports it once; every command then runs in its own
+forked child, so it starts with the CLI already loaded while still getting a
+private copy of all CLI and SDK state.
+"""
+
+import os
+import sys
+import tempfile
+
+# oci_cli loads service command groups at import time based on sys.argv; import
+# it with a bare argv so no service is loaded into the shared, pre-forked image
+_server_argv = sys.argv
+sys.argv = ["oci"]
+try:
+    import oci_cli  # noqa: F401
+    from oci_cli import dynamic_loader, final_command_processor
+    from oci_cli.cli import cli
+
+    # service command groups listed here are loaded once into the pre-forked
+    # image too, e.g. ORACLE_MCP_CLI_PRELOAD_SERVICES="compute,network,iam"
+    for _service in os.getenv("ORACLE_MCP_CLI_PRELOAD_SERVICES", "").split(","):
+        if _service.strip():
+            dynamic_loader.load_service(_service.strip())
+finally:
+    sys.argv = _server_argv
+
+
+def run_command(args: list, env: dict) -> tuple:
+    """
+    Runs `oci <args>` in the current (forked) process the way the `oci` console
+    script would, and returns (returncode, stdout, stderr).
+    """
+    # capture at the file descriptor level, so output written by any library
+    # (or to sys.__stdout__) is captured and never reaches the server's stdio
+    with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.dup2(out.fileno(), 1)
+        os.dup2(err.fileno(), 2)
+        streams = sys.stdout, sys.stderr
+        sys.stdout = open(1, "w", encoding="utf-8", closefd=False)
+        sys.stderr = open(2, "w", encoding="utf-8", closefd=False)
+
+        os.environ.clear()
+        os.environ.update(env)
+        sys.argv = ["oci"] + list(args)
+        returncode = 0
+        try:
+            # mirror the import-time steps of oci_cli for this command line
+            dynamic_loader.load_service_from_command(sys.argv)
+            final_command_processor.process()
+            cli.main(args=list(args), prog_name="oci")
+        except SystemExit as e:
+            if isinstance(e.code, int):
+                returncode = e.code
+            elif e.code is not None:
+                print(e.code, file=sys.stderr)
+                returncode = 1
+        except Exception as e:
+            print(f"{type(e).__name__}: {e}", file=sys.stderr)
+            returncode = 1
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            sys.stdout, sys.stderr = streams
+
+        out.seek(0)
+        err.seek(0)
+        return (
+            returncode,
+            out.read().decode("utf-8", errors="replace"),
+            err.read().decode("utf-8", errors="replace"),
+        )
@@ -0,0 +1,213 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import bisect
+import os
+import re
+import threading
+from collections import defaultdict
+from typing import Dict, List, Set
+
+from oracle.oci_api_mcp_server.help_cache import HelpCache, parse_subcommand_summaries
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+# score of a query token matching a command path token / summary token, by kind
+_PATH_WEIGHTS = {"exact": 3.0, "prefix": 2.0, "fuzzy": 1.5}
+_SUMMARY_WEIGHTS = {"exact": 1.0, "prefix": 0.6, "fuzzy": 0.5}
+# tokens shorter than these are matched exactly only
+_MIN_PREFIX_LENGTH = 2
+_MIN_FUZZY_LENGTH = 4
+_MAX_PREFIX_EXPANSIONS = 50
+
+
+def _tokens(text: str) -> List[str]:
+    """Returns the lowercase words of text, with a plural -s removed"""
+    return [
+        word[:-1] if len(word) > 3 and word.endswith("s") and word[-2] != "s" else word
+        for word in _TOKEN.findall(text.lower())
+    ]
+
+
+def _deletes(token: str) -> Set[str]:
+    """Returns the strings one deletion away from token"""
+    return {token[:i] + token[i + 1 :] for i in range(len(token))}  # noqa: E203
+
+
+def _describe(help_text: str) -> str:
+    """Returns the first paragraph of the description of a command's help text"""
+    lines = help_text.splitlines()
+    if not lines or not lines[0].startswith("Usage:"):
+        return ""
+    paragraph: List[str] = []
+    for line in lines[1:]:
+        if line.strip():
+            if not line.startswith("  "):
+                break
+            paragraph.append(line.strip())
+        elif paragraph:
+            break
+    return " ".join(paragraph)
+
+
+class _Postings:
+    """Token -> command ids map with exact, prefix and one-edit fuzzy lookup"""
+
+    def __init__(self):
+        self.ids: Dict[str, Set[int]] = defaultdict(set)
+        self.vocabulary: List[str] = []  # sorted, for prefix lookups
+        self.variants: Dict[str, Set[str]] = defaultdict(set)  # deletion -> tokens
+
+    def add(self, token: str, command_id: int):
+        if token not in self.ids:
+            bisect.insort(self.vocabulary, token)
+            if len(token) >= _MIN_FUZZY_LENGTH:
+                self.variants[token].add(token)
+                for variant in _deletes(token):
+                    self.variants[variant].add(token)
+        self.ids[token].add(command_id)
+
+    def matches(self, token: str) -> Dict[str, Set[str]]:
+        """Returns the indexed tokens matching token, keyed by kind of match"""
+        found: Dict[str, Set[str]] = {"exact": set(), "prefix": set(), "fuzzy": set()}
+        if token in self.ids:
+            found["exact"].add(token)
+        if len(token) >= _MIN_PREFIX_LENGTH:
+            start = bisect.bisect_left(self.vocabulary, token)
+            end = min(start + _MAX_PREFIX_EXPANSIONS, len(self.vocabulary))
+            for position in range(start, end):
+                candidate = self.vocabulary[position]
+                if not candidate.startswith(token):
+                    break
+                if candidate != token:
+                    found["prefix"].add(candidate)
+        if len(token) >= _MIN_FUZZY_LENGTH:
+            # symmetric delete lookup: every token within one insertion,
+            # deletion, substitution or adjacent transposition of `token`
+            for variant in _deletes(token) | {token}:
+                found["fuzzy"].update(self.variants.get(variant, ()))
+            found["fuzzy"] -= found["exact"] | found["prefix"]
+        return found
+
+
+class CommandIndex:
+    """
+    In-memory inverted index over OCI CLI command paths and their summaries.
+
+    The command paths come from the catalog shipped with the server (the
+    `commands` file next to this module, generated by
+    scripts/oci-api-denylist-generator.py) and from the entries of the help
+    cache, which also provide the summaries. Query tokens match command path
+    and summary tokens exactly, by prefix, or within one edit.
+    """
+
+    _catalog_path = os.path.join(os.path.dirname(__file__), "commands")
+
+    def __init__(self, logger, catalog_path: str = ""):
+        self.logger = logger
+        self.catalog_path = catalog_path or os.getenv(
+            "ORACLE_MCP_CLI_COMMAND_CATALOG", self._catalog_path
+        )
+        self.commands: List[str] = []
+        self.summaries: List[str] = []
+        self._lengths: List[int] = []  # number of words of each command path
+        self._ids: Dict[str, int] = {}
+        self._path_postings = _Postings()
+        self._summary_postings = _Postings()
+        self._loaded = False
+        self._help_position = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.commands)
+
+    def _load_catalog(self):
+        self._loaded = True
+        try:
+            with open(self.catalog_path, "r") as catalog_file:
+                for line in catalog_file:
+                    if line.strip() and not line.strip().startswith("#"):
+                        self._add(line, "")
+            self.logger.info(
+                f"Indexed {len(self.commands)} commands from {self.catalog_path}"
+            )
+        except OSError as e:
+            self.logger.warning(
+                f"Could not read command catalog {self.catalog_path}: {e}"
+            )
+
+    def _add(self, command: str, summary: str):
+        command = HelpCache.key(command)
+        if not command:
+            return
+        command_id = self._ids.get(command)
+        if command_id is None:
+            command_id = self._ids[command] = len(self.commands)
+            self.commands.append(command)
+            self.summaries.append("")
+            words = set(_tokens(command))
+            self._lengths.append(len(words))
+            for token in words:
+                self._path_postings.add(token, command_id)
+        if summary and not self.summaries[command_id]:
+            self.summaries[command_id] = summary
+            for token in set(_tokens(summary)):
+                self._summary_postings.add(token, command_id)
+
+    def sync(self, help_cache: HelpCache):
+        """Loads the catalog on first use and indexes help cached since the last sync"""
+        with self._lock:
+            if not self._loaded:
+                self._load_catalog()
+            entries, self._help_position = help_cache.entries(self._help_position)
+            for command, ok, text in entries:
+                if not ok:
+                    continue
+                self._add(command, _describe(text))
+                for name, summary in parse_subcommand_summaries(text):
+                    self._add(f"{command} {name}", summary)
+
+    def search(self, query: str, limit: int = 20) -> List[dict]:
+        """Returns up to `limit` commands matching query, best first"""
+        query_tokens = list(dict.fromkeys(_tokens(query)))
+        if not query_tokens or limit <= 0:
+            return []
+        with self._lock:
+            scores: Dict[int, float] = defaultdict(float)
+            matched: Dict[int, int] = defaultdict(int)
+            for token in query_tokens:
+                best: Dict[int, float] = {}
+                for postings, weights in (
+                    (self._path_postings, _PATH_WEIGHTS),
+                    (self._summary_postings, _SUMMARY_WEIGHTS),
+                ):
+                    for kind, candidates in postings.matches(token).items():
+                        for candidate in candidates:
+                            for command_id in postings.ids[candidate]:
+                                if weights[kind] > best.get(command_id, 0.0):
+                                    best[command_id] = weights[kind]
+                for command_id, score in best.items():
+                    scores[command_id] += score
+                    matched[command_id] += 1
+
+            phrase = " ".join(query.lower().split())
+            ranked = []
+            for command_id, score in scores.items():
+                command = self.commands[command_id]
+                # prefer commands matching every query token, then the
+                # query as a literal part of the path, then shorter paths
+                score += 2.0 * (matched[command_id] == len(query_tokens))
+                score += 1.0 * (phrase in command)
+                ranked.append((-score, self._lengths[command_id], command, command_id))
+            ranked.sort()
+            return [
+                {
+                    "command": command,
+                    "summary": self.summaries[command_id],
+                    "score": round(-negative_score, 2),
+                }
+                for negative_score, _, command, command_id in ranked[:limit]
+            ]
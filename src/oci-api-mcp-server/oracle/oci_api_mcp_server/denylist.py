@@ -4,33 +4,188 @@ Licensed under the Universal Permissive License v1.0 as shown at
 https://oss.oracle.com/licenses/upl.
 """
 
+import fnmatch
 import os
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+_WILDCARD_CHARS = frozenset("*?[")
+
+
+class _RuleNode:
+    __slots__ = ("children", "patterns", "terminal", "subtree")
+
+    def __init__(self):
+        self.children: Dict[str, "_RuleNode"] = {}
+        self.patterns: List[Tuple[str, "_RuleNode"]] = []  # tokens with wildcards
+        self.terminal = False  # a rule ends at this node
+        self.subtree = False  # a rule ending in " *" ends at this node
+
+
+class RuleSet:
+    """
+    Command rules compiled into a trie of command tokens. A rule is a command
+    path whose tokens are matched one by one:
+      - `compute instance terminate` matches exactly that command
+      - `compute instance *` matches every command below `compute instance`
+      - tokens with shell-style wildcards match a single token, e.g.
+        `* instance terminate` or `compute instance update-*`
+    A lookup walks the command's tokens, so its cost depends on the length of
+    the command and on the wildcard tokens along its path, not on the number
+    of rules.
+    """
+
+    def __init__(self, rules: Iterable[str] = ()):
+        self.root = _RuleNode()
+        self.size = 0
+        for rule in rules:
+            self.add(rule)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def add(self, rule: str):
+        tokens = rule.split()
+        if not tokens:
+            return
+        subtree = tokens[-1] == "*"
+        if subtree:
+            tokens = tokens[:-1]
+        node = self.root
+        for token in tokens:
+            if _WILDCARD_CHARS.isdisjoint(token):
+                node = node.children.setdefault(token, _RuleNode())
+                continue
+            for pattern, child in node.patterns:
+                if pattern == token:
+                    node = child
+                    break
+            else:
+                child = _RuleNode()
+                node.patterns.append((token, child))
+                node = child
+        if subtree:
+            node.subtree = True
+        else:
+            node.terminal = True
+        self.size += 1
+
+    def matches(self, command: str) -> bool:
+        nodes = [self.root]
+        for token in command.split():
+            next_nodes = []
+            for node in nodes:
+                if node.subtree:
+                    return True
+                child = node.children.get(token)
+                if child is not None:
+                    next_nodes.append(child)
+                for pattern, child in node.patterns:
+                    if fnmatch.fnmatchcase(token, pattern):
+                        next_nodes.append(child)
+            if not next_nodes:
+                return False
+            nodes = next_nodes
+        return any(node.terminal for node in nodes)
 
 
 class Denylist:
+    """
+    Denylist of OCI CLI commands, with an optional allowlist.
+
+    Both files hold one RuleSet rule per line. When an allowlist is configured
+    (ORACLE_MCP_ALLOWLIST_FILE), only commands matching it may run. The files
+    are checked for changes on every lookup and recompiled when they change.
+    """
+
     _denylist_path = os.path.join(os.path.dirname(__file__), "denylist")
 
-    def __init__(self, logger, user_specific_path: str = ""):
+    def __init__(
+        self,
+        logger,
+        user_specific_path: str = "",
+        allowlist_path: Optional[str] = None,
+    ):
         self.logger = logger
-        self.denylist_path = user_specific_path or self._denylist_path
-        self.denylist = self.read_denylist()
-        self.logger.info(
-            "Read denylist from %s successfully. Blocking %d commands",
-            self._denylist_path,
-            len(self.denylist),
+        self.denylist_path = (
+            user_specific_path
+            or os.getenv("ORACLE_MCP_DENYLIST_FILE")
+            or self._denylist_path
+        )
+        self.allowlist_path = (
+            os.getenv("ORACLE_MCP_ALLOWLIST_FILE", "")
+            if allowlist_path is None
+            else allowlist_path
         )
+        self._lock = threading.Lock()
+        self._versions: Dict[str, Optional[Tuple[int, int]]] = {}
+        self.denylist: List[str] = []
+        self.rules = RuleSet()
+        self.allow_rules: Optional[RuleSet] = None
+        self._refresh()
 
-    def read_denylist(self):
+    @staticmethod
+    def _file_version(path: str) -> Optional[Tuple[int, int]]:
         try:
-            with open(self.denylist_path, "r") as denylist_file:
+            stat = os.stat(path)
+            return stat.st_mtime_ns, stat.st_size
+        except OSError:
+            return None
+
+    def _read_rules(self, path: str, kind: str = "Denylist") -> Optional[List[str]]:
+        """Returns the rules of a file, or None if it is missing or unreadable"""
+        try:
+            with open(path, "r") as rules_file:
                 return [
                     line.strip()
-                    for line in denylist_file.read().splitlines()
+                    for line in rules_file.read().splitlines()
                     if line.strip() and not line.strip().startswith("#")
                 ]
         except FileNotFoundError:
-            self.logger.warning(f"Denylist file not found at {self.denylist_path}")
-            return []
+            self.logger.warning(f"{kind} file not found at {path}")
+        except (OSError, UnicodeDecodeError) as e:
+            self.logger.warning(f"Could not read {kind.lower()} file {path}: {e}")
+        return None
+
+    def read_denylist(self):
+        return self._read_rules(self.denylist_path) or []
+
+    def _refresh(self):
+        """Recompiles the denylist and allowlist if their files changed"""
+        with self._lock:
+            version = self._file_version(self.denylist_path)
+            if self._versions.get(self.denylist_path, ()) != version:
+                first_read = self.denylist_path not in self._versions
+                self._versions[self.denylist_path] = version
+                denylist = self._read_rules(self.denylist_path)
+                if denylist is None and not first_read:
+                    # a denylist that fails to reload keeps denying what it did
+                    self.logger.warning(
+                        "Keeping the %d denylist rules read before", len(self.rules)
+                    )
+                else:
+                    self.denylist = denylist or []
+                    self.rules = RuleSet(self.denylist)
+                    self.logger.info(
+                        "Read denylist from %s successfully. Blocking %d commands",
+                        self.denylist_path,
+                        len(self.rules),
+                    )
+            if not self.allowlist_path:
+                return
+            version = self._file_version(self.allowlist_path)
+            if self._versions.get(self.allowlist_path, ()) != version:
+                self._versions[self.allowlist_path] = version
+                # a missing or unreadable allowlist allows nothing rather
+                # than everything
+                self.allow_rules = RuleSet(
+                    self._read_rules(self.allowlist_path, "Allowlist") or []
+                )
+                self.logger.info(
+                    "Read allowlist from %s successfully. Allowing %d commands",
+                    self.allowlist_path,
+                    len(self.allow_rules),
+                )
 
     def remove_params_from_command(self, command: str) -> str:
         """Removes parameters from an OCI CLI command."""
@@ -51,6 +206,16 @@ class Denylist:
         return " ".join(filtered_parts)
 
     def isCommandInDenyList(self, command: str) -> bool:
+        self._refresh()
         command_without_params = self.remove_params_from_command(command.strip())
         self.logger.info("Checking command: %s", command_without_params)
-        return command_without_params in self.denylist
+        return self.rules.matches(command_without_params)
+
+    def isCommandInAllowList(self, command: str) -> bool:
+        """Returns True if no allowlist is configured or the command matches it"""
+        self._refresh()
+        if self.allow_rules is None:
+            return True
+        return self.allow_rules.matches(
+            self.remove_params_from_command(command.strip())
+        )
@@ -0,0 +1,282 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import subprocess
+import threading
+import weakref
+from typing import Callable, Optional
+
+_CLI_WORKER_MODULE = "oracle.oci_api_mcp_server.cli_worker"
+_STDOUT_CHUNK = 64 * 1024
+
+
+def _run_in_warm_child(args, env, conn):
+    """Entry point of a command process forked from the warm fork server"""
+    try:
+        # already imported by the fork server, so this does not reload the CLI
+        from oracle.oci_api_mcp_server import cli_worker
+
+        conn.send(cli_worker.run_command(args, env))
+    except BaseException as e:
+        conn.send((1, "", f"{type(e).__name__}: {e}"))
+    finally:
+        conn.close()
+
+
+class CliExecutor:
+    """
+    Runs OCI CLI commands and returns subprocess.CompletedProcess results, raising
+    subprocess.CalledProcessError on failure and subprocess.TimeoutExpired when a
+    command exceeds its timeout.
+
+    Two modes are supported, selected with ORACLE_MCP_CLI_MODE:
+      - "subprocess" (default): every command starts a fresh `oci` process.
+      - "warm": a fork server imports the CLI once; every command runs in its own
+        child forked from it, which skips the interpreter and CLI import startup
+        while keeping commands isolated from each other. At most
+        ORACLE_MCP_CLI_WORKERS commands run at a time.
+    Both modes apply a per-command timeout of ORACLE_MCP_CLI_TIMEOUT seconds.
+
+    run() blocks the calling thread. run_async() waits for the command without
+    blocking the event loop, runs at most ORACLE_MCP_CLI_WORKERS commands at a
+    time in either mode, and kills the command if the awaiting task is
+    cancelled.
+    """
+
+    def __init__(self, logger, mode: str = "", timeout: float = 0, workers: int = 0):
+        self.logger = logger
+        self.mode = mode or os.getenv("ORACLE_MCP_CLI_MODE", "subprocess")
+        self.timeout = timeout or float(os.getenv("ORACLE_MCP_CLI_TIMEOUT", "300"))
+        self.workers = max(1, workers or int(os.getenv("ORACLE_MCP_CLI_WORKERS", "4")))
+        if self.mode not in ("subprocess", "warm"):
+            self.logger.warning(
+                f"Unknown ORACLE_MCP_CLI_MODE '{self.mode}', using subprocess"
+            )
+            self.mode = "subprocess"
+        if (
+            self.mode == "warm"
+            and "forkserver" not in multiprocessing.get_all_start_methods()
+        ):
+            self.logger.warning("Warm CLI mode needs fork support, using subprocess")
+            self.mode = "subprocess"
+        self._slots = threading.BoundedSemaphore(self.workers)
+        # asyncio semaphores belong to one event loop
+        self._async_slots = weakref.WeakKeyDictionary()
+        self._context = None
+        self._context_lock = threading.Lock()
+
+    def start(self):
+        """Starts the warm fork server ahead of the first command"""
+        if self.mode == "warm":
+            from multiprocessing import forkserver
+
+            self._get_context()
+            forkserver.ensure_running()
+
+    def _get_context(self):
+        with self._context_lock:
+            if self._context is None:
+                self._context = multiprocessing.get_context("forkserver")
+                # preloading __main__ as well keeps children from re-running the
+                # server's entry script on every fork
+                self._context.set_forkserver_preload(["__main__", _CLI_WORKER_MODULE])
+            return self._context
+
+    def run(self, args: list, env: dict) -> subprocess.CompletedProcess:
+        """Runs `oci <args>` with the given environment"""
+        if self.mode == "warm":
+            return self._run_warm(list(args), env)
+        return subprocess.run(
+            ["oci"] + list(args),
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+            shell=False,
+            timeout=self.timeout,
+        )
+
+    def _start_warm(self, args: list, env: dict):
+        context = self._get_context()
+        reader, writer = context.Pipe(duplex=False)
+        process = context.Process(
+            target=_run_in_warm_child, args=(args, dict(env), writer), daemon=True
+        )
+        process.start()
+        writer.close()
+        return reader, process
+
+    @staticmethod
+    def _receive(reader, process) -> tuple:
+        try:
+            result = reader.recv()
+        except EOFError:
+            process.join()
+            result = (process.exitcode or 1, "", "CLI worker exited without a result")
+        process.join()
+        return result
+
+    @staticmethod
+    def _completed(command: list, returncode, stdout, stderr):
+        if returncode != 0:
+            raise subprocess.CalledProcessError(
+                returncode, command, output=stdout, stderr=stderr
+            )
+        return subprocess.CompletedProcess(command, returncode, stdout, stderr)
+
+    def _run_warm(self, args: list, env: dict) -> subprocess.CompletedProcess:
+        command = ["oci"] + args
+        with self._slots:
+            reader, process = self._start_warm(args, env)
+            try:
+                if not reader.poll(self.timeout):
+                    process.kill()
+                    process.join()
+                    raise subprocess.TimeoutExpired(command, self.timeout)
+                returncode, stdout, stderr = self._receive(reader, process)
+            finally:
+                reader.close()
+        return self._completed(command, returncode, stdout, stderr)
+
+    async def run_async(
+        self,
+        args: list,
+        env: dict,
+        on_stdout: Optional[Callable[[bytes], bool]] = None,
+    ) -> subprocess.CompletedProcess:
+        """
+        Runs `oci <args>` with the given environment without blocking the event
+        loop.
+
+        With on_stdout, stdout is passed to on_stdout as it is read instead of
+        being returned (the result and errors then carry an empty stdout). When
+        on_stdout returns False the command is stopped and counts as
+        successful. In warm mode stdout is passed in one chunk at the end.
+        """
+        loop = asyncio.get_running_loop()
+        slots = self._async_slots.get(loop)
+        if slots is None:
+            slots = self._async_slots[loop] = asyncio.Semaphore(self.workers)
+        async with slots:
+            if self.mode != "warm":
+                return await self._run_subprocess_async(list(args), env, on_stdout)
+            try:
+                result = await self._run_warm_async(list(args), env)
+            except subprocess.CalledProcessError as e:
+                if on_stdout is not None:
+                    on_stdout(e.output.encode("utf-8"))
+                    e.output = ""
+                raise
+            if on_stdout is not None:
+                on_stdout(result.stdout.encode("utf-8"))
+                result.stdout = ""
+            return result
+
+    @staticmethod
+    async def _stream(process, on_stdout: Callable[[bytes], bool]) -> tuple:
+        """Reads stdout into on_stdout until EOF or until it returns False"""
+        stderr_reader = asyncio.ensure_future(process.stderr.read())
+        stopped = False
+        try:
+            while True:
+                chunk = await process.stdout.read(_STDOUT_CHUNK)
+                if not chunk:
+                    break
+                if on_stdout(chunk) is False:
+                    stopped = True
+                    process.kill()
+                    break
+            stderr = await stderr_reader
+        finally:
+            stderr_reader.cancel()
+        await process.wait()
+        return stopped, stderr
+
+    async def _run_subprocess_async(
+        self,
+        args: list,
+        env: dict,
+        on_stdout: Optional[Callable[[bytes], bool]] = None,
+    ) -> subprocess.CompletedProcess:
+        command = ["oci"] + args
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=env,
+        )
+        stopped = False
+        try:
+            if on_stdout is None:
+                stdout, stderr = await asyncio.wait_for(
+                    process.communicate(), self.timeout
+                )
+            else:
+                stdout = b""
+                stopped, stderr = await asyncio.wait_for(
+                    self._stream(process, on_stdout), self.timeout
+                )
+        except asyncio.TimeoutError:
+            raise subprocess.TimeoutExpired(command, self.timeout)
+        finally:
+            # on timeout or cancellation of the awaiting task
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+        return self._completed(
+            command,
+            0 if stopped else process.returncode,
+            stdout.decode("utf-8", errors="replace"),
+            stderr.decode("utf-8", errors="replace"),
+        )
+
+    async def _run_warm_async(
+        self, args: list, env: dict
+    ) -> subprocess.CompletedProcess:
+        command = ["oci"] + args
+        reader, process = self._start_warm(args, env)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout
+        ready = loop.create_future()
+        loop.add_reader(reader.fileno(), lambda: ready.done() or ready.set_result(None))
+        receiving = None
+        try:
+            try:
+                await asyncio.wait_for(ready, self.timeout)
+            except asyncio.TimeoutError:
+                raise subprocess.TimeoutExpired(command, self.timeout)
+            finally:
+                loop.remove_reader(reader.fileno())
+            # a large result takes a while to read and the child may still be
+            # exiting, so both are waited for on a thread
+            receiving = asyncio.ensure_future(
+                asyncio.to_thread(self._receive, reader, process)
+            )
+            try:
+                returncode, stdout, stderr = await asyncio.wait_for(
+                    asyncio.shield(receiving), max(0.0, deadline - loop.time())
+                )
+            except asyncio.TimeoutError:
+                raise subprocess.TimeoutExpired(command, self.timeout)
+        finally:
+            # on timeout or cancellation of the awaiting task
+            if receiving is None:
+                if process.is_alive():
+                    process.kill()
+                    process.join()
+                reader.close()
+            elif not receiving.done():
+                # the receiving thread gets EOF once the child is killed, and
+                # joins it; the reader is closed after that thread is done
+                process.kill()
+                receiving.add_done_callback(lambda _: reader.close())
+            else:
+                reader.close()
+        return self._completed(command, returncode, stdout, stderr)
@@ -0,0 +1,214 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import importlib.metadata
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+# subcommand rows of a click "Commands:" section: two spaces of indent for
+# services and groups, four for the categorized service list of `oci --help`
+_COMMAND_ROW = re.compile(r"^ {2}(?: {2})?([a-z0-9][a-z0-9-]*)(?:\s+(.*))?$")
+
+
+def _installed_cli_version() -> str:
+    try:
+        return importlib.metadata.version("oci-cli")
+    except importlib.metadata.PackageNotFoundError:
+        return ""
+
+
+def parse_subcommand_summaries(help_text: str) -> List[Tuple[str, str]]:
+    """Returns the (name, summary) rows of the Commands: section of a help text"""
+    rows: List[Tuple[str, str]] = []
+    in_commands_section = False
+    for line in help_text.splitlines():
+        if line.strip() == "Commands:":
+            in_commands_section = True
+            continue
+        if not in_commands_section:
+            continue
+        match = _COMMAND_ROW.match(line)
+        if match:
+            rows.append((match.group(1), (match.group(2) or "").strip()))
+        elif rows and line.startswith("      ") and line.strip():
+            # a summary wrapped onto the next line
+            name, summary = rows[-1]
+            rows[-1] = (name, f"{summary} {line.strip()}".strip())
+    return rows
+
+
+def parse_subcommands(help_text: str) -> List[str]:
+    """Returns the subcommand names listed in the Commands: section of a help text"""
+    return [name for name, _ in parse_subcommand_summaries(help_text)]
+
+
+class HelpCache:
+    """
+    Cache of `oci <command> --help` results keyed by the installed CLI version.
+
+    Results are kept in memory and appended as JSON lines to
+    help-<version>.jsonl in ORACLE_MCP_CLI_HELP_CACHE_DIR (default
+    ~/.cache/oracle.oci-api-mcp-server), so they survive restarts and are
+    dropped automatically when the CLI is upgraded. Failed lookups may be a
+    timeout or a transient error, so they are only kept in memory, for
+    ORACLE_MCP_CLI_HELP_FAILURE_TTL seconds (default 60).
+    """
+
+    _default_cache_dir = os.path.join(
+        os.path.expanduser("~"), ".cache", "oracle.oci-api-mcp-server"
+    )
+
+    def __init__(self, logger, cache_dir: str = "", version: Optional[str] = None):
+        self.logger = logger
+        self.version = _installed_cli_version() if version is None else version
+        self.cache_dir = cache_dir or os.getenv(
+            "ORACLE_MCP_CLI_HELP_CACHE_DIR", self._default_cache_dir
+        )
+        # without a known CLI version the cache is kept in memory only
+        self.path = (
+            os.path.join(self.cache_dir, f"help-{self.version}.jsonl")
+            if self.version
+            else None
+        )
+        self._entries: Dict[str, Tuple[bool, str]] = {}
+        self.failure_ttl = float(os.getenv("ORACLE_MCP_CLI_HELP_FAILURE_TTL", "60"))
+        # key -> (monotonic expiry, text) of failed lookups
+        self._failures: Dict[str, Tuple[float, str]] = {}
+        # keys in the order they were cached, see entries()
+        self._order: List[str] = []
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(command: str) -> str:
+        return " ".join(command.split())
+
+    def _load(self):
+        self._loaded = True
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r") as cache_file:
+                for line in cache_file:
+                    try:
+                        entry = json.loads(line)
+                        if not entry["ok"]:
+                            continue  # written by a version that persisted failures
+                        self._entries[entry["command"]] = (True, entry["text"])
+                        self._order.append(entry["command"])
+                    except (ValueError, KeyError, TypeError):
+                        continue  # e.g. a line cut short by a crash
+            self.logger.info(
+                f"Loaded {len(self._entries)} cached help entries from {self.path}"
+            )
+        except OSError as e:
+            self.logger.warning(f"Could not read help cache {self.path}: {e}")
+
+    def get(self, command: str) -> Optional[Tuple[bool, str]]:
+        """Returns the cached (ok, text) for a command, or None"""
+        key = self.key(command)
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            failure = self._failures.get(key)
+            if failure is not None:
+                expires, text = failure
+                if time.monotonic() < expires:
+                    return False, text
+                del self._failures[key]
+            return self._entries.get(key)
+
+    def put(self, command: str, ok: bool, text: str):
+        key = self.key(command)
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            if not ok:
+                self._failures[key] = (time.monotonic() + self.failure_ttl, text)
+                return
+            self._failures.pop(key, None)
+            self._entries[key] = (ok, text)
+            self._order.append(key)
+            if not self.path:
+                return
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                with open(self.path, "a") as cache_file:
+                    cache_file.write(
+                        json.dumps({"command": key, "ok": ok, "text": text}) + "\n"
+                    )
+            except OSError as e:
+                self.logger.warning(f"Could not write help cache {self.path}: {e}")
+                self.path = None
+
+    def entries(self, start: int = 0) -> Tuple[List[Tuple[str, bool, str]], int]:
+        """
+        Returns the (command, ok, text) entries cached since position `start`,
+        oldest first, and the position to pass in to get only newer entries.
+        Failed lookups are not listed.
+        """
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            keys = self._order[start:]
+            return [(key, *self._entries[key]) for key in keys], start + len(keys)
+
+    def lookup(
+        self, command: str, run_help: Callable[[str], Tuple[bool, str]]
+    ) -> Tuple[bool, str]:
+        """Returns the cached help for a command, running run_help(command) on a miss"""
+        cached = self.get(command)
+        if cached is not None:
+            return cached
+        ok, text = run_help(self.key(command))
+        self.put(command, ok, text)
+        return ok, text
+
+    async def lookup_async(
+        self, command: str, run_help: Callable[[str], Awaitable[Tuple[bool, str]]]
+    ) -> Tuple[bool, str]:
+        """Same as lookup, awaiting run_help(command) on a miss"""
+        cached = self.get(command)
+        if cached is not None:
+            return cached
+        ok, text = await run_help(self.key(command))
+        self.put(command, ok, text)
+        return ok, text
+
+    def prebuild(
+        self, run_help: Callable[[str], Tuple[bool, str]], workers: int = 8
+    ) -> int:
+        """
+        Crawls the whole command tree from `oci --help` down, running up to
+        `workers` help lookups at a time, and caches every node. Nodes already in
+        the cache are not run again, so an interrupted crawl resumes where it
+        stopped. Returns the number of commands visited.
+        """
+        visited = 0
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            pending = {executor.submit(self.lookup, "", run_help): ""}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    command = pending.pop(future)
+                    visited += 1
+                    try:
+                        ok, text = future.result()
+                    except Exception as e:
+                        self.logger.warning(f"Help crawl failed for '{command}': {e}")
+                        continue
+                    if not ok:
+                        continue
+                    for subcommand in parse_subcommands(text):
+                        child = f"{command} {subcommand}".strip()
+                        pending[executor.submit(self.lookup, child, run_help)] = child
+        self.logger.info(f"Help cache prebuild visited {visited} commands")
+        return visited
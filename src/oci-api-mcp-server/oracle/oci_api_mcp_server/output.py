@@ -0,0 +1,175 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import base64
+import codecs
+import itertools
+import json
+import re
+from typing import Any, List, Optional, Tuple
+
+# the CLI prints list results as {"data": [...], "opc-next-page": ...}
+_LIST_PREFIX = re.compile(r'\s*\{\s*"data"\s*:\s*\[')
+_DECIDE_AFTER = 256  # characters to read before giving up on the list prefix
+_WHITESPACE = " \t\r\n,"
+# actions that only read: the next page of their output is read by running
+# them again, which must not repeat side effects
+_RESUMABLE_ACTIONS = ("list", "get", "search")
+
+
+def is_resumable(command: str) -> bool:
+    """Returns whether a command only reads, so that cursors can be issued for it"""
+    words = list(itertools.takewhile(lambda w: not w.startswith("-"), command.split()))
+    if not words:
+        return False
+    action = words[-1]
+    return (
+        action in _RESUMABLE_ACTIONS
+        or action.startswith(tuple(f"{a}-" for a in _RESUMABLE_ACTIONS))
+        or action.endswith("-search")
+    )
+
+
+def encode_cursor(command: str, offset: int) -> str:
+    raw = json.dumps({"command": " ".join(command.split()), "offset": offset})
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str, command: str) -> int:
+    """Returns the item offset of a cursor issued for the same command"""
+    try:
+        decoded = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        cursor_command, offset = decoded["command"], int(decoded["offset"])
+    except Exception:
+        raise ValueError("cursor is not a cursor returned by run_oci_command")
+    if cursor_command != " ".join(command.split()):
+        raise ValueError("cursor was returned for a different command")
+    if not is_resumable(command):
+        raise ValueError(
+            "cursors are only accepted for list, get and search commands, since "
+            "the next page is read by running the command again"
+        )
+    if offset < 0:
+        raise ValueError("cursor is not a cursor returned by run_oci_command")
+    return offset
+
+
+class OutputPager:
+    """
+    Consumes the stdout of a CLI command chunk by chunk and keeps one page of
+    it within a byte budget and an optional item budget.
+
+    List results ({"data": [...]}) are parsed incrementally, one item at a
+    time: the first `offset` items are skipped, and the page ends with the
+    item that would exceed a budget. Any other output is kept up to the byte
+    budget. feed() returns False once the page is full, so the caller can stop
+    the command instead of reading the rest of its output.
+    """
+
+    def __init__(
+        self, max_bytes: int, max_items: Optional[int] = None, offset: int = 0
+    ):
+        self.max_bytes = max_bytes
+        self.max_items = max_items
+        self.offset = offset
+        self.items: List[Any] = []
+        self.truncated = False
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._decoder_json = json.JSONDecoder()
+        self._buffer = ""
+        # utf-8 size of the buffer, which text mode keeps whole
+        self._buffer_bytes = 0
+        self._mode = None  # "list" or "text" once the output format is known
+        self._list_done = False
+        self._seen = 0  # list items parsed, including skipped ones
+        self._bytes = 0  # size of the kept items
+
+    def feed(self, chunk: bytes) -> bool:
+        if self.truncated:
+            return False
+        text = self._decoder.decode(chunk)
+        self._buffer += text
+        self._buffer_bytes += len(text.encode("utf-8"))
+        if self._mode is None:
+            match = _LIST_PREFIX.match(self._buffer)
+            if match:
+                self._mode = "list"
+                self._buffer = self._buffer[match.end() :]  # noqa: E203
+            elif "[" in self._buffer or len(self._buffer) > _DECIDE_AFTER:
+                self._mode = "text"
+        if self._mode == "list":
+            self._parse_items()
+        elif self._mode == "text" and self._buffer_bytes > self.max_bytes:
+            self.truncated = True
+        return not self.truncated
+
+    def _parse_items(self, final: bool = False):
+        while not self._list_done and not self.truncated:
+            position = 0
+            while (
+                position < len(self._buffer) and self._buffer[position] in _WHITESPACE
+            ):
+                position += 1
+            if position == len(self._buffer):
+                self._buffer = ""
+                return
+            if self._buffer[position] == "]":
+                self._list_done = True
+                self._buffer = self._buffer[position + 1 :]  # noqa: E203
+                return
+            try:
+                item, end = self._decoder_json.raw_decode(self._buffer, position)
+            except ValueError:
+                return  # the item continues in the next chunk
+            if end == len(self._buffer) and not final:
+                return  # e.g. a number, which may continue in the next chunk
+            size = len(self._buffer[position:end].encode("utf-8"))
+            self._buffer = self._buffer[end:]
+            self._seen += 1
+            if self._seen <= self.offset:
+                continue
+            if self.items and (
+                self._bytes + size > self.max_bytes
+                or (self.max_items is not None and len(self.items) >= self.max_items)
+            ):
+                self.truncated = True
+                return
+            self.items.append(item)
+            self._bytes += size
+
+    def result(self) -> Tuple[Any, Optional[int]]:
+        """
+        Returns the page, parsed like the CLI output it came from, and the
+        offset of the next page if the output was truncated
+        """
+        self._buffer += self._decoder.decode(b"", final=True)
+        if self._mode is None:
+            self._mode = "list" if _LIST_PREFIX.match(self._buffer) else "text"
+            if self._mode == "list":
+                self._buffer = _LIST_PREFIX.sub("", self._buffer, count=1)
+        if self._mode == "list":
+            self._parse_items(final=True)
+        if self._mode == "text":
+            text = self._buffer
+            if self.truncated:
+                text = text.encode("utf-8")[: self.max_bytes].decode("utf-8", "ignore")
+                return text, None
+            try:
+                return json.loads(text), None
+            except (TypeError, json.JSONDecodeError):
+                return text, None
+
+        output = {"data": self.items}
+        if self.truncated:
+            return output, self.offset + len(self.items)
+        # the rest of the object after the list, e.g. "opc-next-page"
+        rest = self._buffer.strip().lstrip(",").strip()
+        if rest and rest != "}":
+            try:
+                output.update(json.loads("{" + rest))
+            except json.JSONDecodeError:
+                pass
+        return output, None
@@ -4,17 +4,26 @@ Licensed under the Universal Permissive License v1.0 as shown at
 https://oss.oracle.com/licenses/upl.
 """
 
-import json
 import os
 import subprocess
+import threading
 from logging import Logger
-from typing import Annotated
+from typing import Annotated, Optional, Tuple
 
 import oci
 from fastmcp import FastMCP
 from oracle.oci_api_mcp_server import __project__, __version__
+from oracle.oci_api_mcp_server.command_index import CommandIndex
 from oracle.oci_api_mcp_server.denylist import Denylist
-from oracle.oci_api_mcp_server.utils import initAuditLogger
+from oracle.oci_api_mcp_server.executor import CliExecutor
+from oracle.oci_api_mcp_server.help_cache import HelpCache
+from oracle.oci_api_mcp_server.output import (
+    OutputPager,
+    decode_cursor,
+    encode_cursor,
+    is_resumable,
+)
+from oracle.oci_mcp_common.audit import AuditMiddleware, initAuditLogger
 
 logger = Logger(__project__, level="INFO")
 
@@ -24,12 +33,23 @@ mcp = FastMCP(name=__project__)
 user_agent_name = __project__.split("oracle.", 1)[1].split("-server", 1)[0]
 USER_AGENT = f"{user_agent_name}/{__version__}"
 
-# Initialize the rotating audit logger. It will store logs at /tmp/audit.log
+# Initialize the audit logger. It writes JSON lines to /tmp/audit.log from a
+# background thread
 initAuditLogger(logger)
 
 # Read and setup deny list
 denylist_manager = Denylist(logger)
 
+# Runs CLI commands, either as fresh processes or forked from a warm CLI image
+cli_executor = CliExecutor(logger)
+
+# Help output of the installed CLI version, cached in memory and on disk
+help_cache = HelpCache(logger)
+command_index = CommandIndex(logger)
+
+# Budget of the output returned by one run_oci_command call
+MAX_OUTPUT_BYTES = int(os.getenv("ORACLE_MCP_CLI_MAX_OUTPUT_BYTES", "262144"))
+
 # Initialize the MCP server
 mcp = FastMCP(
     name="oracle.oci-api-mcp-server",
@@ -38,36 +58,78 @@ mcp = FastMCP(
         Use the resource resource://oci-api-commands to get information on OCI services and
         related commands available for each service. You can use this information to identify
         which commands to run for a specific service.
+        Call search_oci_commands to find the commands matching a task by keywords.
         Call get_oci_command_help to provide information about a specific OCI command.
         Call run_oci_command to run a specific OCI command
     """,
 )
 
+# Write an audit record for every tool call
+mcp.add_middleware(AuditMiddleware(logger))
 
-@mcp.resource("resource://oci-api-commands")
-def get_oci_commands() -> str:
-    """Returns helpful information on various OCI services and related commands."""
-    logger.info("get_oci_commands resource has been called into action")
+
+def _truncation_hint(command: str, pager: OutputPager) -> str:
+    if pager.items and is_resumable(command):
+        hint = (
+            f"The output was truncated after {len(pager.items)} items. Pass "
+            "next_cursor as cursor to get the next page."
+        )
+    elif pager.items:
+        hint = f"The output was truncated after {len(pager.items)} items."
+    else:
+        hint = f"The output was truncated to {pager.max_bytes} bytes."
+    flags = command.split()
+    if "--query" not in flags:
+        hint += (
+            " To get less output, select only the fields you need with --query, "
+            'e.g. --query data[].{id:id,name:"display-name"} (no spaces or quotes '
+            "around the expression)."
+        )
+    if "--all" in flags:
+        hint += " Drop --all and use --limit to fetch fewer items per call."
+    elif "--limit" not in flags and pager.items:
+        hint += " Use --limit to fetch fewer items per call."
+    return hint
+
+
+def _cli_env() -> dict:
     env_copy = os.environ.copy()
     env_copy["OCI_SDK_APPEND_USER_AGENT"] = USER_AGENT
+    return env_copy
+
 
+def _run_help(command: str) -> Tuple[bool, str]:
+    """Runs `oci <command> --help` and returns (ok, stdout or stderr)"""
     try:
-        # Run OCI CLI command using subprocess
-        result = subprocess.run(
-            ["oci", "--help"],
-            env=env_copy,
-            capture_output=True,
-            text=True,
-            check=True,
-            shell=False,
-        )
-        return result.stdout
+        result = cli_executor.run(command.split() + ["--help"], _cli_env())
+        return True, result.stdout
     except subprocess.CalledProcessError as e:
-        return f"Error: {e.stderr}"
+        return False, e.stderr
+
+
+async def _run_help_async(command: str) -> Tuple[bool, str]:
+    """Same as _run_help, without blocking the event loop"""
+    try:
+        result = await cli_executor.run_async(command.split() + ["--help"], _cli_env())
+        return True, result.stdout
+    except subprocess.CalledProcessError as e:
+        return False, e.stderr
+
+
+@mcp.resource("resource://oci-api-commands")
+async def get_oci_commands() -> str:
+    """Returns helpful information on various OCI services and related commands."""
+    logger.info("get_oci_commands resource has been called into action")
+
+    try:
+        ok, text = await help_cache.lookup_async("", _run_help_async)
+        return text if ok else f"Error: {text}"
+    except subprocess.TimeoutExpired as e:
+        return f"Error: timed out after {e.timeout} seconds"
 
 
 @mcp.tool
-def get_oci_command_help(command: str) -> str:
+async def get_oci_command_help(command: str) -> str:
     """Returns helpful instructions for running an OCI CLI command.
 
     IMPORTANT:
@@ -108,31 +170,51 @@ def get_oci_command_help(command: str) -> str:
 
     """
     logger.info(f"get_oci_command_help called with command: {command}")
-    env_copy = os.environ.copy()
-    env_copy["OCI_SDK_APPEND_USER_AGENT"] = USER_AGENT
 
     try:
-        # Run OCI CLI command using subprocess
-        result = subprocess.run(
-            ["oci"] + command.split() + ["--help"],
-            env=env_copy,
-            capture_output=True,
-            text=True,
-            check=True,
-            shell=False,
-        )
-        return result.stdout
-    except subprocess.CalledProcessError as e:
-        logger.error(f"Error in get_oci_command_help: {e.stderr}")
-        return f"Error: {e.stderr}"
+        ok, text = await help_cache.lookup_async(command, _run_help_async)
+        if ok:
+            return text
+        logger.error(f"Error in get_oci_command_help: {text}")
+        return f"Error: {text}"
+    except subprocess.TimeoutExpired as e:
+        logger.error(f"get_oci_command_help timed out after {e.timeout} seconds")
+        return f"Error: timed out after {e.timeout} seconds"
 
 
 @mcp.tool
-def run_oci_command(
+def search_oci_commands(
+    query: Annotated[
+        str,
+        "Keywords describing the command, e.g. 'list instances' or 'bucket lifecycle'",
+    ],
+    limit: Annotated[int, "Maximum number of commands to return"] = 20,
+) -> list[dict]:
+    """Searches the OCI CLI commands by keywords and returns the best matches.
+
+    Matches the keywords against every command path (e.g. 'compute instance
+    list') and its summary, tolerating partial words and small typos. Use it to
+    find candidate commands before calling get_oci_command_help on them.
+    Returns a list of {"command", "summary", "score"} objects, best first.
+    """
+    logger.info(f"search_oci_commands called with query: {query}")
+    command_index.sync(help_cache)
+    return command_index.search(query, limit)
+
+
+@mcp.tool
+async def run_oci_command(
     command: Annotated[
         str,
         "The OCI CLI command to run. Do not include 'oci' in your command",
     ],
+    max_items: Annotated[
+        Optional[int], "Maximum number of list items to return in one page"
+    ] = None,
+    cursor: Annotated[
+        Optional[str],
+        "next_cursor of a previous truncated response, to get the next page",
+    ] = None,
 ) -> dict:
     """Runs an OCI CLI command.
     This tool allows you to run OCI CLI commands on the user's behalf.
@@ -146,10 +228,14 @@ def run_oci_command(
     Try your best to avoid using extra flags on the command if possible.
     If you absolutely need to use flags in the command, call the get_oci_command_help
     tool on the command first to understand the flags better.
-    """
 
-    env_copy = os.environ.copy()
-    env_copy["OCI_SDK_APPEND_USER_AGENT"] = USER_AGENT
+    Large outputs are returned one page at a time. A truncated response has
+    "truncated": true, a "hint" on narrowing the output and, for the lists of
+    list, get and search commands, a "next_cursor": call this tool again with
+    the same command and cursor=next_cursor to get the next page. Following a
+    cursor runs the command again and skips the items already returned, so
+    other commands get no cursor.
+    """
 
     profile = os.getenv("OCI_CONFIG_PROFILE", oci.config.DEFAULT_PROFILE)
     logger.info(f"run_oci_command called with command: {command} --profile {profile}")
@@ -166,44 +252,61 @@ def run_oci_command(
         logger.error(error_message)
         return {"error": error_message}
 
-    # Run OCI CLI command using subprocess
+    if not denylist_manager.isCommandInAllowList(command):
+        error_message = (
+            f"Command '{command}' is not in the allowlist. Only the commands listed "
+            "in the allowlist configured for this server can be executed. Please "
+            "terminate any tasks currently related to the execution of this command."
+        )
+        logger.error(error_message)
+        return {"error": error_message}
+
+    try:
+        offset = decode_cursor(cursor, command) if cursor else 0
+    except ValueError as e:
+        return {"command": command, "output": None, "error": str(e), "returncode": None}
+    pager = OutputPager(MAX_OUTPUT_BYTES, max_items, offset)
+
     try:
-        result = subprocess.run(
-            ["oci", "--profile"]
-            + [profile]
-            + ["--auth", "security_token"]
-            + command.split(),
-            env=env_copy,
-            capture_output=True,
-            text=True,
-            check=True,
-            shell=False,
+        result = await cli_executor.run_async(
+            ["--profile", profile, "--auth", "security_token"] + command.split(),
+            _cli_env(),
+            on_stdout=pager.feed,
         )
 
         result.check_returncode()
 
+        output, next_offset = pager.result()
         response = {
             "command": command,
-            "output": result.stdout,
+            "output": output,
             "error": result.stderr,
             "returncode": result.returncode,
         }
-
-        try:
-            response["output"] = json.loads(result.stdout)
-        except TypeError:
-            pass
-        except json.JSONDecodeError:
-            pass
-
+        if pager.truncated:
+            response["truncated"] = True
+            response["next_cursor"] = (
+                encode_cursor(command, next_offset)
+                if next_offset is not None and is_resumable(command)
+                else None
+            )
+            response["hint"] = _truncation_hint(command, pager)
         return response
     except subprocess.CalledProcessError as e:
         return {
             "command": command,
-            "output": e.stdout,
+            "output": pager.result()[0],
             "error": e.stderr,
             "returncode": e.returncode,
         }
+    except subprocess.TimeoutExpired as e:
+        logger.error(f"run_oci_command timed out after {e.timeout} seconds")
+        return {
+            "command": command,
+            "output": None,
+            "error": f"Command timed out after {e.timeout} seconds",
+            "returncode": None,
+        }
 
 
 def main():
@@ -211,6 +314,16 @@ def main():
     host = os.getenv("ORACLE_MCP_HOST")
     port = os.getenv("ORACLE_MCP_PORT")
 
+    cli_executor.start()
+    command_index.sync(help_cache)
+    if (os.getenv("ORACLE_MCP_CLI_HELP_PREBUILD") or "").lower() in ("1", "true"):
+        # crawl the whole command tree in the background; lookups made meanwhile
+        # are answered as usual and cached along the way
+        workers = int(os.getenv("ORACLE_MCP_CLI_HELP_PREBUILD_WORKERS") or 8)
+        threading.Thread(
+            target=help_cache.prebuild, args=(_run_help, workers), daemon=True
+        ).start()
+
     if host and port:
         mcp.run(transport="http", host=host, port=int(port))
     else:
@@ -0,0 +1,52 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import subprocess
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastmcp import Client
+from oracle.oci_api_mcp_server import server
+from oracle.oci_mcp_common.audit import AuditMiddleware
+
+
+class TestAuditMiddleware:
+    @pytest.mark.asyncio
+    async def test_tool_calls_are_audited(self, monkeypatch):
+        logger = MagicMock()
+        middleware = AuditMiddleware(logger)
+        server.mcp.add_middleware(middleware)
+        run = AsyncMock(
+            side_effect=subprocess.CalledProcessError(
+                1, "oci", stderr='ServiceError:\n{"opc-request-id": "REQ-1"}'
+            )
+        )
+        monkeypatch.setattr(server.cli_executor, "run_async", run)
+        monkeypatch.setattr(
+            server.denylist_manager, "isCommandInDenyList", lambda command: False
+        )
+        try:
+            async with Client(server.mcp) as client:
+                await client.call_tool("search_oci_commands", {"query": "instance"})
+                await client.call_tool(
+                    "run_oci_command", {"command": "compute instance get"}
+                )
+                with pytest.raises(Exception):
+                    await client.call_tool("get_oci_command_help", {})
+        finally:
+            server.mcp.middleware.remove(middleware)
+
+        audits = [call.kwargs["extra"]["audit"] for call in logger.info.call_args_list]
+        assert [audit["tool"] for audit in audits] == [
+            "search_oci_commands",
+            "run_oci_command",
+            "get_oci_command_help",
+        ]
+        assert audits[0]["outcome"] == "success"
+        assert audits[1]["outcome"] == "error"
+        assert audits[1]["opc_request_id"] == "REQ-1"
+        assert audits[2]["outcome"] == "exception"
+        assert all(audit["duration_ms"] >= 0 for audit in audits)
@@ -0,0 +1,184 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import glob
+import os
+import re
+from unittest.mock import MagicMock
+
+import pytest
+from fastmcp import Client
+from oracle.oci_api_mcp_server import server
+from oracle.oci_api_mcp_server.command_index import CommandIndex
+from oracle.oci_api_mcp_server.help_cache import HelpCache
+
+CATALOG = """# This list contains all OCI cli commands
+
+compute instance list
+compute instance get
+compute instance terminate
+compute image list
+network vcn create
+network vcn list
+os bucket list
+os object-lifecycle-policy put
+"""
+
+OS_HELP = """Usage: oci os [OPTIONS] COMMAND [ARGS]...
+
+  Object Storage Service
+
+Commands:
+  bucket                   A bucket is a container for storing objects in
+                           a compartment within a namespace.
+  object-lifecycle-policy  The collection of lifecycle rules.
+"""
+
+LEAF_HELP = """Usage: oci os bucket list [OPTIONS]
+
+  Gets a list of all BucketSummary items in a compartment.
+
+Options:
+  --all  Fetches all pages of results.
+"""
+
+
+@pytest.fixture
+def catalog_path(tmp_path):
+    path = tmp_path / "commands"
+    path.write_text(CATALOG)
+    return str(path)
+
+
+@pytest.fixture
+def help_cache(tmp_path):
+    return HelpCache(MagicMock(), str(tmp_path), version="")
+
+
+def commands(results):
+    return [result["command"] for result in results]
+
+
+# the command lists written by scripts/oci-api-denylist-generator.py
+REPO_ROOT = os.path.join(os.path.dirname(__file__), *[".."] * 5)
+GENERATED_CATALOGS = glob.glob(os.path.join(REPO_ROOT, "scripts", "commands_*.txt"))
+
+
+def cli_version(path):
+    version = re.search(r"commands_(.+)\.txt$", os.path.basename(path)).group(1)
+    return tuple(int(part) if part.isdigit() else 0 for part in version.split("."))
+
+
+@pytest.mark.skipif(not GENERATED_CATALOGS, reason="scripts/ is not checked out")
+def test_shipped_catalog_matches_newest_generated_list():
+    newest = max(GENERATED_CATALOGS, key=cli_version)
+    with open(newest, "r") as generated, open(CommandIndex._catalog_path) as shipped:
+        assert shipped.read() == generated.read(), f"copy {newest} to the catalog"
+
+
+class TestCommandIndex:
+    def test_catalog_is_indexed(self, catalog_path, help_cache):
+        index = CommandIndex(MagicMock(), catalog_path)
+        index.sync(help_cache)
+
+        assert len(index) == 8
+        assert commands(index.search("instance list", 1)) == ["compute instance list"]
+
+    def test_plural_and_word_order(self, catalog_path, help_cache):
+        index = CommandIndex(MagicMock(), catalog_path)
+        index.sync(help_cache)
+
+        assert commands(index.search("list instances"))[0] == "compute instance list"
+
+    def test_prefix_match(self, catalog_path, help_cache):
+        index = CommandIndex(MagicMock(), catalog_path)
+        index.sync(help_cache)
+
+        assert commands(index.search("lifecyc"))[0] == "os object-lifecycle-policy put"
+        assert commands(index.search("term"))[0] == "compute instance terminate"
+
+    def test_fuzzy_match(self, catalog_path, help_cache):
+        index = CommandIndex(MagicMock(), catalog_path)
+        index.sync(help_cache)
+
+        results = index.search("instnace lsit")
+        assert results[0]["command"] == "compute instance list"
+        assert results[0]["score"] > results[-1]["score"]
+
+    def test_unknown_and_empty_queries(self, catalog_path, help_cache):
+        index = CommandIndex(MagicMock(), catalog_path)
+        index.sync(help_cache)
+
+        assert index.search("kubernetes") == []
+        assert index.search("  -- ") == []
+        assert index.search("list", limit=0) == []
+        assert len(index.search("list", limit=2)) == 2
+
+    def test_help_cache_adds_commands_and_summaries(self, catalog_path, help_cache):
+        index = CommandIndex(MagicMock(), catalog_path)
+        index.sync(help_cache)
+        assert index.search("container storing") == []
+
+        help_cache.put("os", True, OS_HELP)
+        help_cache.put("os bucket list", True, LEAF_HELP)
+        help_cache.put("os bogus", False, "Error: No such command")
+        index.sync(help_cache)
+
+        results = index.search("container storing")
+        assert results[0] == {
+            "command": "os bucket",
+            "summary": "A bucket is a container for storing objects in a compartment "
+            "within a namespace.",
+            "score": results[0]["score"],
+        }
+        assert index.search("os")[0]["summary"] == "Object Storage Service"
+        assert index.search("bucketsummary")[0]["command"] == "os bucket list"
+        assert "os bogus" not in index.commands
+        assert len(index) == 11
+
+    def test_sync_only_indexes_new_entries(self, catalog_path, help_cache):
+        index = CommandIndex(MagicMock(), catalog_path)
+        help_cache.put("os", True, OS_HELP)
+        index.sync(help_cache)
+        index.sync(help_cache)
+
+        assert index.commands.count("os bucket") == 1
+
+    def test_missing_catalog(self, tmp_path, help_cache):
+        logger = MagicMock()
+        index = CommandIndex(logger, str(tmp_path / "missing"))
+        index.sync(help_cache)
+
+        assert len(index) == 0
+        logger.warning.assert_called_once()
+
+    def test_shipped_catalog(self, help_cache):
+        index = CommandIndex(MagicMock())
+        index.sync(help_cache)
+
+        assert len(index) > 8000
+        assert "compute instance list" in commands(index.search("list instances", 5))
+
+
+class TestSearchTool:
+    @pytest.mark.asyncio
+    async def test_search_oci_commands(self, catalog_path, help_cache, monkeypatch):
+        monkeypatch.setattr(server, "help_cache", help_cache)
+        monkeypatch.setattr(
+            server, "command_index", CommandIndex(server.logger, catalog_path)
+        )
+        help_cache.put("os", True, OS_HELP)
+
+        async with Client(server.mcp) as client:
+            result = (
+                await client.call_tool(
+                    "search_oci_commands", {"query": "vcn create", "limit": 1}
+                )
+            ).structured_content["result"]
+
+        assert result[0]["command"] == "network vcn create"
+        assert len(result) == 1
+        assert "os bucket" in server.command_index.commands
@@ -0,0 +1,180 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import os
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastmcp import Client
+from oracle.oci_api_mcp_server import server
+from oracle.oci_api_mcp_server.denylist import Denylist, RuleSet
+
+
+def write_rules(path, *rules, mtime=None):
+    path.write_text("# rules\n\n" + "\n".join(rules) + "\n")
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+    return str(path)
+
+
+class TestRuleSet:
+    def test_exact_rules(self):
+        rules = RuleSet(["compute instance terminate", "os bucket delete"])
+
+        assert len(rules) == 2
+        assert rules.matches("compute instance terminate")
+        assert rules.matches("  os   bucket delete ")
+        assert not rules.matches("compute instance")
+        assert not rules.matches("compute instance terminate now")
+        assert not rules.matches("compute instance list")
+        assert not rules.matches("")
+
+    def test_subtree_rules(self):
+        rules = RuleSet(["compute instance *"])
+
+        assert rules.matches("compute instance list")
+        assert rules.matches("compute instance action reset")
+        assert not rules.matches("compute instance")
+        assert not rules.matches("compute image list")
+
+    def test_wildcard_tokens(self):
+        rules = RuleSet(["* instance terminate", "os bucket update-*", "db ?b *"])
+
+        assert rules.matches("compute instance terminate")
+        assert rules.matches("bds instance terminate")
+        assert not rules.matches("compute instance list")
+        assert rules.matches("os bucket update-retention")
+        assert not rules.matches("os bucket update")
+        assert rules.matches("db xb anything")
+        assert not rules.matches("db xyb anything")
+
+    def test_overlapping_rules(self):
+        rules = RuleSet(
+            ["compute * delete", "compute instance list", "compute * delete"]
+        )
+
+        assert rules.matches("compute image delete")
+        assert rules.matches("compute instance list")
+        assert not rules.matches("compute image list")
+        assert len(rules.root.children["compute"].patterns) == 1
+
+    def test_blank_rules_are_ignored(self):
+        rules = RuleSet(["", "   "])
+
+        assert len(rules) == 0
+        assert not rules.matches("compute")
+
+
+class TestDenylist:
+    def test_shipped_denylist(self, monkeypatch):
+        monkeypatch.delenv("ORACLE_MCP_DENYLIST_FILE", raising=False)
+        monkeypatch.delenv("ORACLE_MCP_ALLOWLIST_FILE", raising=False)
+        denylist = Denylist(MagicMock())
+
+        assert len(denylist.rules) > 1000
+        assert denylist.isCommandInDenyList(
+            "compute instance terminate --instance-id ocid1.instance.oc1..x --force"
+        )
+        assert not denylist.isCommandInDenyList("compute instance list")
+        assert denylist.isCommandInAllowList("compute instance list")
+
+    def test_denylist_from_environment(self, tmp_path, monkeypatch):
+        path = write_rules(tmp_path / "denylist", "iam *")
+        monkeypatch.setenv("ORACLE_MCP_DENYLIST_FILE", path)
+        denylist = Denylist(MagicMock())
+
+        assert denylist.denylist_path == path
+        assert denylist.isCommandInDenyList("iam user list --all")
+
+    def test_missing_denylist_denies_nothing(self, tmp_path):
+        logger = MagicMock()
+        denylist = Denylist(logger, str(tmp_path / "missing"), allowlist_path="")
+
+        assert not denylist.isCommandInDenyList("compute instance terminate")
+        logger.warning.assert_called_once()
+
+    def test_hot_reload(self, tmp_path):
+        path = tmp_path / "denylist"
+        write_rules(path, "compute instance terminate", mtime=1_000_000)
+        denylist = Denylist(MagicMock(), str(path), allowlist_path="")
+        assert not denylist.isCommandInDenyList("os bucket delete")
+
+        write_rules(path, "os bucket *", mtime=2_000_000)
+        assert denylist.isCommandInDenyList("os bucket delete")
+        assert not denylist.isCommandInDenyList("compute instance terminate")
+
+    def test_failed_reload_keeps_the_rules(self, tmp_path):
+        path = tmp_path / "denylist"
+        write_rules(path, "compute instance terminate", mtime=1_000_000)
+        denylist = Denylist(MagicMock(), str(path), allowlist_path="")
+        assert denylist.isCommandInDenyList("compute instance terminate")
+
+        os.remove(path)
+        assert denylist.isCommandInDenyList("compute instance terminate")
+
+        path.write_bytes(b"\xff\xfe compute \x80\n")
+        assert denylist.isCommandInDenyList("compute instance terminate")
+
+        write_rules(path, "os bucket *", mtime=2_000_000)
+        assert not denylist.isCommandInDenyList("compute instance terminate")
+        assert denylist.isCommandInDenyList("os bucket delete")
+
+    def test_unchanged_file_is_not_reread(self, tmp_path):
+        path = write_rules(tmp_path / "denylist", "os bucket delete")
+        denylist = Denylist(MagicMock(), path, allowlist_path="")
+        rules = denylist.rules
+
+        denylist.isCommandInDenyList("os bucket delete")
+        assert denylist.rules is rules
+
+    def test_allowlist(self, tmp_path):
+        deny = write_rules(tmp_path / "denylist", "compute instance terminate")
+        allow = write_rules(tmp_path / "allowlist", "compute instance *", "iam * list")
+        denylist = Denylist(MagicMock(), deny, allowlist_path=allow)
+
+        assert denylist.isCommandInAllowList("compute instance list --all")
+        assert denylist.isCommandInAllowList("iam user list")
+        assert not denylist.isCommandInAllowList("iam user delete")
+        assert not denylist.isCommandInAllowList("os bucket list")
+        # the denylist still applies to allowed commands
+        assert denylist.isCommandInAllowList("compute instance terminate")
+        assert denylist.isCommandInDenyList("compute instance terminate")
+
+    def test_missing_allowlist_allows_nothing(self, tmp_path):
+        deny = write_rules(tmp_path / "denylist", "os bucket delete")
+        denylist = Denylist(MagicMock(), deny, str(tmp_path / "missing"))
+
+        assert not denylist.isCommandInAllowList("compute instance list")
+
+    def test_unreadable_allowlist_allows_nothing(self, tmp_path):
+        deny = write_rules(tmp_path / "denylist", "os bucket delete")
+        allow = tmp_path / "allowlist"
+        write_rules(allow, "compute instance *", mtime=1_000_000)
+        denylist = Denylist(MagicMock(), deny, str(allow))
+        assert denylist.isCommandInAllowList("compute instance list")
+
+        allow.write_bytes(b"\xff\xfe compute \x80\n")
+        assert not denylist.isCommandInAllowList("compute instance list")
+
+
+class TestRunOciCommandAllowlist:
+    @pytest.mark.asyncio
+    async def test_command_outside_allowlist_is_rejected(self, tmp_path, monkeypatch):
+        deny = write_rules(tmp_path / "denylist", "os bucket delete")
+        allow = write_rules(tmp_path / "allowlist", "os bucket list")
+        monkeypatch.setattr(
+            server, "denylist_manager", Denylist(server.logger, deny, allow)
+        )
+        run = AsyncMock()
+        monkeypatch.setattr(server.cli_executor, "run_async", run)
+
+        async with Client(server.mcp) as client:
+            result = (
+                await client.call_tool("run_oci_command", {"command": "iam user list"})
+            ).data
+
+        assert "not in the allowlist" in result["error"]
+        run.assert_not_called()
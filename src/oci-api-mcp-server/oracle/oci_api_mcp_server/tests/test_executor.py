@@ -0,0 +1,362 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import asyncio
+import importlib
+import json
+import os
+import subprocess
+import sys
+import textwrap
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from oracle.oci_api_mcp_server.executor import CliExecutor
+
+# a stand-in for the oci_cli package with the entry points cli_worker uses
+FAKE_CLI = {
+    "__init__.py": "",
+    "final_command_processor.py": "def process():\n    pass\n",
+    "dynamic_loader.py": textwrap.dedent(
+        """
+        loaded = []
+
+        def load_service(service):
+            loaded.append(service)
+
+        def load_service_from_command(argv):
+            loaded.extend(argv[1:2])
+        """
+    ),
+    "cli.py": textwrap.dedent(
+        """
+        import json
+        import os
+        import sys
+        import time
+
+        from oci_cli import dynamic_loader
+
+
+        class _Cli:
+            def main(self, args, prog_name):
+                if args[0] == "sleep":
+                    time.sleep(30)
+                if args[0] == "fail":
+                    print("bad request", file=sys.stderr)
+                    sys.exit(2)
+                if args[0] == "abort":
+                    sys.exit("Aborted!")
+                if args[0] == "crash":
+                    os._exit(3)
+                if args[0] == "raise":
+                    raise RuntimeError("boom")
+                print(
+                    json.dumps(
+                        {
+                            "args": args,
+                            "argv": sys.argv,
+                            "loaded": dynamic_loader.loaded,
+                            "ua": os.environ.get("OCI_SDK_APPEND_USER_AGENT"),
+                        }
+                    )
+                )
+                sys.exit(0)
+
+
+        cli = _Cli()
+        """
+    ),
+}
+
+
+# a stand-in for the `oci` executable, for the subprocess mode
+FAKE_OCI = """#!/bin/sh
+case "$1" in
+  sleep) echo $$ > "$PID_FILE"; echo started; exec sleep 30;;
+  nap) sleep 0.3;;
+  fail) echo "bad request" >&2; exit 2;;
+esac
+echo "{\\"args\\": \\"$*\\", \\"ua\\": \\"$OCI_SDK_APPEND_USER_AGENT\\"}"
+"""
+
+
+@pytest.fixture
+def fake_oci(tmp_path, monkeypatch):
+    oci = tmp_path / "bin" / "oci"
+    oci.parent.mkdir()
+    oci.write_text(FAKE_OCI)
+    oci.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{oci.parent}{os.pathsep}{os.environ['PATH']}")
+    return {"PATH": os.environ["PATH"], "PID_FILE": str(tmp_path / "pid")}
+
+
+def _is_running(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+        return True
+    except ProcessLookupError:
+        return False
+
+
+@pytest.fixture(scope="module")
+def fake_cli_path(tmp_path_factory):
+    root = tmp_path_factory.mktemp("fake_cli")
+    package = root / "oci_cli"
+    package.mkdir()
+    for name, content in FAKE_CLI.items():
+        (package / name).write_text(content)
+    return str(root)
+
+
+@pytest.fixture
+def warm_cli_path(fake_cli_path, monkeypatch):
+    # the fork server is a fresh interpreter that preloads the CLI before it
+    # applies the parent's sys.path, so an installed oci_cli would shadow the
+    # fake one unless the fake comes first on its PYTHONPATH
+    monkeypatch.syspath_prepend(fake_cli_path)
+    monkeypatch.setenv(
+        "PYTHONPATH",
+        os.pathsep.join(filter(None, [fake_cli_path, os.getenv("PYTHONPATH")])),
+    )
+    return fake_cli_path
+
+
+@pytest.fixture
+def cli_worker(fake_cli_path, monkeypatch):
+    monkeypatch.syspath_prepend(fake_cli_path)
+    monkeypatch.setenv("ORACLE_MCP_CLI_PRELOAD_SERVICES", "compute, iam")
+    for name in list(sys.modules):
+        if name == "oci_cli" or name.startswith("oci_cli."):
+            monkeypatch.delitem(sys.modules, name)
+    monkeypatch.delitem(
+        sys.modules, "oracle.oci_api_mcp_server.cli_worker", raising=False
+    )
+    return importlib.import_module("oracle.oci_api_mcp_server.cli_worker")
+
+
+def _run_in_process(worker, args, env):
+    # run_command redirects fds 1/2 and replaces os.environ, as it would in a
+    # forked child; restore both for the test process afterwards
+    saved_fds = os.dup(1), os.dup(2)
+    saved_env = dict(os.environ)
+    try:
+        return worker.run_command(args, env)
+    finally:
+        os.dup2(saved_fds[0], 1)
+        os.dup2(saved_fds[1], 2)
+        os.close(saved_fds[0])
+        os.close(saved_fds[1])
+        os.environ.clear()
+        os.environ.update(saved_env)
+
+
+class TestCliWorker:
+    def test_run_command_captures_output_and_env(self, cli_worker):
+        returncode, stdout, stderr = _run_in_process(
+            cli_worker,
+            ["compute", "instance", "list"],
+            {"OCI_SDK_APPEND_USER_AGENT": "ua"},
+        )
+
+        output = json.loads(stdout)
+        assert returncode == 0
+        assert output["args"] == ["compute", "instance", "list"]
+        assert output["argv"] == ["oci", "compute", "instance", "list"]
+        assert output["loaded"] == ["compute", "iam", "compute"]
+        assert output["ua"] == "ua"
+        assert stderr == ""
+
+    @pytest.mark.parametrize(
+        "args, returncode, message",
+        [
+            (["fail"], 2, "bad request"),
+            (["abort"], 1, "Aborted!"),
+            (["raise"], 1, "RuntimeError: boom"),
+        ],
+    )
+    def test_run_command_failures(self, cli_worker, args, returncode, message):
+        result = _run_in_process(cli_worker, args, {})
+
+        assert result[0] == returncode
+        assert message in result[2]
+
+
+class TestCliExecutor:
+    def test_unknown_mode_falls_back_to_subprocess(self):
+        logger = MagicMock()
+        executor = CliExecutor(logger, mode="bogus")
+
+        assert executor.mode == "subprocess"
+        logger.warning.assert_called_once()
+        executor.start()  # nothing to start
+
+    def test_warm_mode(self, warm_cli_path):
+        executor = CliExecutor(MagicMock(), mode="warm", timeout=20, workers=2)
+        executor.start()
+
+        result = executor.run(
+            ["iam", "region", "list"], {"OCI_SDK_APPEND_USER_AGENT": "ua"}
+        )
+        assert result.args == ["oci", "iam", "region", "list"]
+        assert json.loads(result.stdout)["ua"] == "ua"
+
+        with pytest.raises(subprocess.CalledProcessError) as failed:
+            executor.run(["fail"], {})
+        assert failed.value.returncode == 2
+        assert "bad request" in failed.value.stderr
+
+        with pytest.raises(subprocess.CalledProcessError) as crashed:
+            executor.run(["crash"], {})
+        assert "without a result" in crashed.value.stderr
+
+        executor.timeout = 0.5
+        with pytest.raises(subprocess.TimeoutExpired):
+            executor.run(["sleep"], {})
+
+    @pytest.mark.asyncio
+    async def test_warm_mode_async(self, warm_cli_path):
+        executor = CliExecutor(MagicMock(), mode="warm", timeout=20, workers=2)
+        executor.start()
+
+        result = await executor.run_async(
+            ["iam", "region", "list"], {"OCI_SDK_APPEND_USER_AGENT": "ua"}
+        )
+        assert json.loads(result.stdout)["ua"] == "ua"
+
+        with pytest.raises(subprocess.CalledProcessError) as failed:
+            await executor.run_async(["fail"], {})
+        assert "bad request" in failed.value.stderr
+
+        with pytest.raises(subprocess.CalledProcessError) as crashed:
+            await executor.run_async(["crash"], {})
+        assert "without a result" in crashed.value.stderr
+
+        chunks = []
+        result = await executor.run_async(["iam"], {}, on_stdout=chunks.append)
+        assert result.stdout == ""
+        assert json.loads(b"".join(chunks))["args"] == ["iam"]
+
+        chunks = []
+        with pytest.raises(subprocess.CalledProcessError) as failed:
+            await executor.run_async(["fail"], {}, on_stdout=chunks.append)
+        assert failed.value.output == ""
+        assert chunks == [b""]
+
+        executor.timeout = 0.5
+        with pytest.raises(subprocess.TimeoutExpired):
+            await executor.run_async(["sleep"], {})
+
+        executor.timeout = 20
+        task = asyncio.create_task(executor.run_async(["sleep"], {}))
+        await asyncio.sleep(0.5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    @pytest.mark.asyncio
+    async def test_warm_receive_does_not_block_the_loop(
+        self, warm_cli_path, monkeypatch
+    ):
+        executor = CliExecutor(MagicMock(), mode="warm", timeout=20, workers=2)
+        executor.start()
+        receive = CliExecutor._receive
+
+        def slow_receive(reader, process):
+            # a result that takes a second to read, e.g. a large output
+            time.sleep(1)
+            return receive(reader, process)
+
+        monkeypatch.setattr(CliExecutor, "_receive", staticmethod(slow_receive))
+        gaps = []
+
+        async def tick():
+            last = time.monotonic()
+            while True:
+                await asyncio.sleep(0.01)
+                now = time.monotonic()
+                gaps.append(now - last)
+                last = now
+
+        ticker = asyncio.create_task(tick())
+        try:
+            result = await executor.run_async(["iam", "region", "list"], {})
+        finally:
+            ticker.cancel()
+
+        assert json.loads(result.stdout)["args"] == ["iam", "region", "list"]
+        assert len(gaps) > 50
+        assert max(gaps) < 0.5
+
+        executor.timeout = 0.5
+        with pytest.raises(subprocess.TimeoutExpired):
+            await executor.run_async(["iam"], {})
+
+
+class TestCliExecutorAsync:
+    @pytest.mark.asyncio
+    async def test_run_async(self, fake_oci):
+        executor = CliExecutor(MagicMock(), mode="subprocess", timeout=20)
+        env = dict(fake_oci, OCI_SDK_APPEND_USER_AGENT="ua")
+
+        result = await executor.run_async(["iam", "region", "list"], env)
+        assert result.args == ["oci", "iam", "region", "list"]
+        assert json.loads(result.stdout) == {"args": "iam region list", "ua": "ua"}
+
+        with pytest.raises(subprocess.CalledProcessError) as failed:
+            await executor.run_async(["fail"], fake_oci)
+        assert failed.value.returncode == 2
+        assert failed.value.stderr == "bad request\n"
+
+    @pytest.mark.asyncio
+    async def test_stopped_stream_kills_command(self, fake_oci):
+        executor = CliExecutor(MagicMock(), mode="subprocess", timeout=20)
+        chunks = []
+
+        def first_chunk_only(chunk):
+            chunks.append(chunk)
+            return False
+
+        result = await executor.run_async(
+            ["sleep"], fake_oci, on_stdout=first_chunk_only
+        )
+        assert result.returncode == 0
+        assert result.stdout == ""
+        assert len(chunks) == 1
+        assert not _is_running(int(open(fake_oci["PID_FILE"]).read()))
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_command(self, fake_oci):
+        executor = CliExecutor(MagicMock(), mode="subprocess", timeout=0.5)
+
+        with pytest.raises(subprocess.TimeoutExpired) as expired:
+            await executor.run_async(["sleep"], fake_oci)
+        assert expired.value.timeout == 0.5
+        assert not _is_running(int(open(fake_oci["PID_FILE"]).read()))
+
+    @pytest.mark.asyncio
+    async def test_cancellation_kills_command(self, fake_oci):
+        executor = CliExecutor(MagicMock(), mode="subprocess", timeout=20)
+
+        task = asyncio.create_task(executor.run_async(["sleep"], fake_oci))
+        while not os.path.exists(fake_oci["PID_FILE"]):
+            await asyncio.sleep(0.05)
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert not _is_running(int(open(fake_oci["PID_FILE"]).read()))
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, fake_oci):
+        executor = CliExecutor(MagicMock(), mode="subprocess", timeout=20, workers=2)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(executor.run_async(["nap"], fake_oci) for _ in range(4)))
+        elapsed = time.perf_counter() - start
+        # four 0.3 s commands, two at a time
+        assert 0.6 <= elapsed < 3
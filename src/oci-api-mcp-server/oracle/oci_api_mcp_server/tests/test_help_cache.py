@@ -0,0 +1,269 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import os
+import subprocess
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastmcp import Client
+from oracle.oci_api_mcp_server import server
+from oracle.oci_api_mcp_server.help_cache import HelpCache, parse_subcommands
+
+ROOT_HELP = """Usage: oci [OPTIONS] COMMAND [ARGS]...
+
+Options:
+  -v, --version  Show the version and exit.
+
+Commands:
+  Compute:
+    compute         Compute Service CLI
+  Identity:
+    iam             Identity and Access Management Service API
+"""
+
+GROUP_HELP = """Usage: oci compute [OPTIONS] COMMAND [ARGS]...
+
+Commands:
+  image     An image is a template of a virtual hard drive.
+  instance  A compute host.
+"""
+
+EXEC = "oracle.oci_api_mcp_server.executor.asyncio.create_subprocess_exec"
+
+
+def mock_process(stdout):
+    process = MagicMock(returncode=0)
+    process.communicate = AsyncMock(return_value=(stdout.encode(), b""))
+    return process
+
+
+# command -> help text of a small command tree; leaves have no Commands: section
+TREE = {
+    "": ROOT_HELP,
+    "compute": GROUP_HELP,
+    "compute image": "Commands:\n  list  Lists images.\n",
+    "compute image list": "Usage: oci compute image list [OPTIONS]\n",
+    "compute instance": "Commands:\n  get  Gets an instance.\n  list  Lists.\n",
+    "compute instance get": "Usage: oci compute instance get [OPTIONS]\n",
+    "compute instance list": "Usage: oci compute instance list [OPTIONS]\n",
+    "iam": "Commands:\n  user  Users.\n",
+    "iam user": "Usage: oci iam user [OPTIONS]\n",
+}
+
+
+def fake_run_help(calls):
+    lock = threading.Lock()
+
+    def run_help(command):
+        with lock:
+            calls.append(command)
+        if command in TREE:
+            return True, TREE[command]
+        return False, f"Error: No such command '{command}'"
+
+    return run_help
+
+
+class TestParseSubcommands:
+    def test_root_categories_are_skipped(self):
+        assert parse_subcommands(ROOT_HELP) == ["compute", "iam"]
+
+    def test_group_commands(self):
+        assert parse_subcommands(GROUP_HELP) == ["image", "instance"]
+
+    def test_leaf_has_no_subcommands(self):
+        assert parse_subcommands(TREE["compute instance list"]) == []
+
+
+class TestHelpCache:
+    def test_lookup_runs_help_once(self, tmp_path):
+        calls = []
+        cache = HelpCache(MagicMock(), str(tmp_path), version="3.0.0")
+
+        assert cache.lookup("compute  instance list", fake_run_help(calls)) == (
+            True,
+            TREE["compute instance list"],
+        )
+        assert cache.lookup("compute instance list", fake_run_help(calls))[0]
+        assert calls == ["compute instance list"]
+
+    def test_entries_persist_per_cli_version(self, tmp_path):
+        calls = []
+        HelpCache(MagicMock(), str(tmp_path), version="3.0.0").lookup(
+            "iam", fake_run_help(calls)
+        )
+
+        same_version = HelpCache(MagicMock(), str(tmp_path), version="3.0.0")
+        assert same_version.get("iam") == (True, TREE["iam"])
+
+        upgraded = HelpCache(MagicMock(), str(tmp_path), version="3.1.0")
+        assert upgraded.get("iam") is None
+        assert sorted(os.listdir(tmp_path)) == ["help-3.0.0.jsonl"]
+
+    def test_failures_are_cached_in_memory_until_they_expire(self, tmp_path):
+        calls = []
+        cache = HelpCache(MagicMock(), str(tmp_path), version="3.0.0")
+
+        ok, text = cache.lookup("compute bogus", fake_run_help(calls))
+        assert not ok
+        assert "No such command" in text
+        assert cache.lookup("compute bogus", fake_run_help(calls)) == (ok, text)
+        assert calls == ["compute bogus"]
+        assert cache.entries() == ([], 0)
+        assert not os.path.exists(cache.path)
+
+        restarted = HelpCache(MagicMock(), str(tmp_path), version="3.0.0")
+        assert restarted.get("compute bogus") is None
+
+        cache.failure_ttl = 0
+        cache.put("compute bogus", False, text)
+        assert cache.lookup("compute bogus", fake_run_help(calls)) == (ok, text)
+        assert calls == ["compute bogus", "compute bogus"]
+
+    def test_success_replaces_a_cached_failure(self, tmp_path):
+        cache = HelpCache(MagicMock(), str(tmp_path), version="3.0.0")
+        cache.put("iam", False, "timed out")
+        cache.put("iam", True, "iam help")
+
+        assert cache.get("iam") == (True, "iam help")
+
+    def test_persisted_failures_are_ignored(self, tmp_path):
+        (tmp_path / "help-3.0.0.jsonl").write_text(
+            '{"command": "iam", "ok": false, "text": "timed out"}\n'
+        )
+
+        assert HelpCache(MagicMock(), str(tmp_path), version="3.0.0").get("iam") is None
+
+    def test_unreadable_lines_are_skipped(self, tmp_path):
+        cache_file = tmp_path / "help-3.0.0.jsonl"
+        cache_file.write_text(
+            '{"command": "iam", "ok": true, "text": "iam help"}\n'
+            "not json\n"
+            '{"command": "iam user"}\n'
+            '{"command": "compute", "ok": true, "te'
+        )
+
+        cache = HelpCache(MagicMock(), str(tmp_path), version="3.0.0")
+        assert cache.get("iam") == (True, "iam help")
+        assert cache.get("iam user") is None
+        assert cache.get("compute") is None
+
+    def test_without_cli_version_cache_is_memory_only(self, tmp_path):
+        cache = HelpCache(MagicMock(), str(tmp_path), version="")
+        cache.put("iam", True, "iam help")
+
+        assert cache.get("iam") == (True, "iam help")
+        assert os.listdir(tmp_path) == []
+
+    def test_unwritable_cache_dir_falls_back_to_memory(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        logger = MagicMock()
+        cache = HelpCache(logger, str(blocker / "cache"), version="3.0.0")
+
+        cache.put("iam", True, "iam help")
+        cache.put("iam user", True, "user help")
+
+        assert cache.get("iam user") == (True, "user help")
+        assert cache.path is None
+        logger.warning.assert_called_once()
+
+    def test_cache_dir_from_environment(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("ORACLE_MCP_CLI_HELP_CACHE_DIR", str(tmp_path))
+        cache = HelpCache(MagicMock(), version="3.0.0")
+
+        assert cache.path == str(tmp_path / "help-3.0.0.jsonl")
+
+    def test_prebuild_crawls_whole_tree(self, tmp_path):
+        calls = []
+        cache = HelpCache(MagicMock(), str(tmp_path), version="3.0.0")
+
+        assert cache.prebuild(fake_run_help(calls), workers=4) == len(TREE)
+        assert sorted(calls) == sorted(TREE)
+        for command, text in TREE.items():
+            assert cache.get(command) == (True, text)
+
+    def test_prebuild_resumes_from_disk(self, tmp_path):
+        first = HelpCache(MagicMock(), str(tmp_path), version="3.0.0")
+        for command in ("", "compute", "compute image"):
+            first.put(command, True, TREE[command])
+
+        calls = []
+        second = HelpCache(MagicMock(), str(tmp_path), version="3.0.0")
+        assert second.prebuild(fake_run_help(calls)) == len(TREE)
+        assert "" not in calls
+        assert "compute image" not in calls
+        assert "compute image list" in calls
+
+    def test_prebuild_continues_past_errors(self, tmp_path):
+        logger = MagicMock()
+        cache = HelpCache(logger, str(tmp_path), version="3.0.0")
+
+        def run_help(command):
+            if command == "compute":
+                raise subprocess.TimeoutExpired(["oci", "compute"], 1)
+            if command == "iam":
+                return False, "broken"
+            return True, TREE[command]
+
+        assert cache.prebuild(run_help, workers=2) == 3
+        logger.warning.assert_called_once()
+
+
+class TestServerHelpCache:
+    @pytest.fixture(autouse=True)
+    def fresh_help_cache(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(
+            server, "help_cache", HelpCache(server.logger, str(tmp_path), "3.0.0")
+        )
+
+    @pytest.mark.asyncio
+    @patch(EXEC)
+    async def test_help_is_served_from_cache(self, mock_run):
+        mock_run.return_value = mock_process("Help output")
+
+        async with Client(server.mcp) as client:
+            for _ in range(3):
+                result = (
+                    await client.call_tool(
+                        "get_oci_command_help", {"command": "compute instance list"}
+                    )
+                ).structured_content["result"]
+                assert result == "Help output"
+
+        mock_run.assert_called_once()
+        assert server.help_cache.get("compute instance list") == (True, "Help output")
+
+    @pytest.mark.asyncio
+    @patch(EXEC)
+    async def test_commands_resource_is_cached(self, mock_run):
+        mock_run.return_value = mock_process("Commands:\n  iam  IAM\n")
+
+        async with Client(server.mcp) as client:
+            for _ in range(2):
+                result = await client.read_resource("resource://oci-api-commands")
+                assert result[0].text == "Commands:\n  iam  IAM\n"
+        mock_run.assert_called_once()
+
+    @patch("oracle.oci_api_mcp_server.server.threading.Thread")
+    @patch("oracle.oci_api_mcp_server.server.mcp.run")
+    def test_main_starts_prebuild(self, mock_mcp_run, mock_thread, monkeypatch):
+        monkeypatch.delenv("ORACLE_MCP_HOST", raising=False)
+        monkeypatch.delenv("ORACLE_MCP_PORT", raising=False)
+        monkeypatch.setenv("ORACLE_MCP_CLI_HELP_PREBUILD", "true")
+        monkeypatch.setenv("ORACLE_MCP_CLI_HELP_PREBUILD_WORKERS", "3")
+
+        server.main()
+
+        mock_thread.assert_called_once_with(
+            target=server.help_cache.prebuild,
+            args=(server._run_help, 3),
+            daemon=True,
+        )
+        mock_thread.return_value.start.assert_called_once()
+        mock_mcp_run.assert_called_once_with()
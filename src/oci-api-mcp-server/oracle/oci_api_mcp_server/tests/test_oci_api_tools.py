@@ -4,29 +4,44 @@ Licensed under the Universal Permissive License v1.0 as shown at
 https://oss.oracle.com/licenses/upl.
 """
 
+import asyncio
 import importlib.metadata
-import json
 import subprocess
-from unittest.mock import ANY, MagicMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import pytest
 from fastmcp import Client
-from oracle.oci_api_mcp_server import __project__
+from oracle.oci_api_mcp_server import __project__, server
+from oracle.oci_api_mcp_server.help_cache import HelpCache
 from oracle.oci_api_mcp_server.server import mcp
 
 __version__ = importlib.metadata.version(__project__)
 user_agent_name = __project__.split("oracle.", 1)[1].split("-server", 1)[0]
 USER_AGENT = f"{user_agent_name}/{__version__}"
+EXEC = "oracle.oci_api_mcp_server.executor.asyncio.create_subprocess_exec"
+
+
+@pytest.fixture(autouse=True)
+def fresh_help_cache(tmp_path, monkeypatch):
+    # every test starts from an empty cache that never touches ~/.cache
+    monkeypatch.setattr(server, "help_cache", HelpCache(server.logger, str(tmp_path)))
+
+
+def mock_process(stdout="", stderr="", returncode=0):
+    process = MagicMock()
+    process.communicate = AsyncMock(return_value=(stdout.encode(), stderr.encode()))
+    process.stdout.read = AsyncMock(side_effect=[stdout.encode(), b""])
+    process.stderr.read = AsyncMock(return_value=stderr.encode())
+    process.wait = AsyncMock()
+    process.returncode = returncode
+    return process
 
 
 class TestOCITools:
     @pytest.mark.asyncio
-    @patch("oracle.oci_api_mcp_server.server.subprocess.run")
-    async def test_get_oci_command_help_success(self, mock_run):
-        mock_result = MagicMock()
-        mock_result.stdout = "Help output"
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
+    @patch(EXEC)
+    async def test_get_oci_command_help_success(self, mock_exec):
+        mock_exec.return_value = mock_process("Help output")
 
         async with Client(mcp) as client:
             result = (
@@ -37,30 +52,25 @@ class TestOCITools:
 
             assert result == "Help output"
             assert (
-                mock_run.call_args.kwargs["env"]["OCI_SDK_APPEND_USER_AGENT"]
+                mock_exec.call_args.kwargs["env"]["OCI_SDK_APPEND_USER_AGENT"]
                 == USER_AGENT
             )
-            mock_run.assert_called_once_with(
-                ["oci", "compute", "instance", "list", "--help"],
+            mock_exec.assert_called_once_with(
+                "oci",
+                "compute",
+                "instance",
+                "list",
+                "--help",
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 env=ANY,
-                capture_output=True,
-                text=True,
-                check=True,
-                shell=False,
             )
 
     @pytest.mark.asyncio
-    @patch("oracle.oci_api_mcp_server.server.subprocess.run")
-    async def test_get_oci_command_help_failure(self, mock_run):
-        mock_result = MagicMock()
-        mock_result.stdout = "Some output"
-        mock_result.stderr = "Some error"
-        mock_run.side_effect = subprocess.CalledProcessError(
-            returncode=1,
-            cmd=["oci", "compute", "instance", "list", "--help"],
-            output=mock_result.stdout,
-            stderr=mock_result.stderr,
-        )
+    @patch(EXEC)
+    async def test_get_oci_command_help_failure(self, mock_exec):
+        mock_exec.return_value = mock_process("Some output", "Some error", 1)
 
         async with Client(mcp) as client:
             result = (
@@ -72,15 +82,10 @@ class TestOCITools:
             assert "Error: Some error" in result
 
     @pytest.mark.asyncio
-    @patch("oracle.oci_api_mcp_server.server.subprocess.run")
-    async def test_run_oci_command_success(self, mock_run):
+    @patch(EXEC)
+    async def test_run_oci_command_success(self, mock_exec):
         command = "compute instance list"
-
-        mock_result = MagicMock()
-        mock_result.stdout = '{"key": "value"}'
-        mock_result.stderr = ""
-        mock_result.returncode = 0
-        mock_run.return_value = mock_result
+        mock_exec.return_value = mock_process('{"key": "value"}')
 
         async with Client(mcp) as client:
             result = (
@@ -89,21 +94,16 @@ class TestOCITools:
 
             assert result == {
                 "command": command,
-                "output": json.loads(mock_result.stdout),
-                "error": mock_result.stderr,
-                "returncode": mock_result.returncode,
+                "output": {"key": "value"},
+                "error": "",
+                "returncode": 0,
             }
 
     @pytest.mark.asyncio
-    @patch("oracle.oci_api_mcp_server.server.subprocess.run")
-    async def test_run_oci_command_string_success(self, mock_run):
+    @patch(EXEC)
+    async def test_run_oci_command_string_success(self, mock_exec):
         command = "compute instance list"
-
-        mock_result = MagicMock()
-        mock_result.stdout = "This is not JSON"
-        mock_result.stderr = ""
-        mock_result.returncode = 0
-        mock_run.return_value = mock_result
+        mock_exec.return_value = mock_process("This is not JSON")
 
         async with Client(mcp) as client:
             result = (
@@ -112,27 +112,16 @@ class TestOCITools:
 
             assert result == {
                 "command": command,
-                "output": mock_result.stdout,
-                "error": mock_result.stderr,
-                "returncode": mock_result.returncode,
+                "output": "This is not JSON",
+                "error": "",
+                "returncode": 0,
             }
 
     @pytest.mark.asyncio
-    @patch("oracle.oci_api_mcp_server.server.subprocess.run")
-    async def test_run_oci_command_failure(self, mock_run):
+    @patch(EXEC)
+    async def test_run_oci_command_failure(self, mock_exec):
         command = "compute instance list"
-
-        mock_result = MagicMock()
-        mock_result.stdout = "Some output"
-        mock_result.stderr = "Some error"
-        mock_result.returncode = 1
-
-        mock_run.side_effect = subprocess.CalledProcessError(
-            returncode=mock_result.returncode,
-            cmd=["oci"] + command.split(),
-            output=mock_result.stdout,
-            stderr=mock_result.stderr,
-        )
+        mock_exec.return_value = mock_process("Some output", "Some error", 1)
 
         async with Client(mcp) as client:
             result = (
@@ -141,47 +130,37 @@ class TestOCITools:
 
             assert result == {
                 "command": command,
-                "output": mock_result.stdout,
-                "error": mock_result.stderr,
-                "returncode": mock_result.returncode,
+                "output": "Some output",
+                "error": "Some error",
+                "returncode": 1,
             }
 
     @pytest.mark.asyncio
-    @patch("oracle.oci_api_mcp_server.server.subprocess.run")
-    async def test_get_oci_commands_success(self, mock_run):
-        mock_result = MagicMock()
-        mock_result.stdout = "OCI commands output"
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
+    @patch(EXEC)
+    async def test_get_oci_commands_success(self, mock_exec):
+        mock_exec.return_value = mock_process("OCI commands output")
 
         async with Client(mcp) as client:
             result = (await client.read_resource("resource://oci-api-commands"))[0].text
 
             assert result == "OCI commands output"
             assert (
-                mock_run.call_args.kwargs["env"]["OCI_SDK_APPEND_USER_AGENT"]
+                mock_exec.call_args.kwargs["env"]["OCI_SDK_APPEND_USER_AGENT"]
                 == USER_AGENT
             )
-            mock_run.assert_called_once_with(
-                ["oci", "--help"],
+            mock_exec.assert_called_once_with(
+                "oci",
+                "--help",
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 env=ANY,
-                capture_output=True,
-                text=True,
-                check=True,
-                shell=False,
             )
 
     @pytest.mark.asyncio
-    @patch("oracle.oci_api_mcp_server.server.subprocess.run")
-    async def test_get_oci_commands_failure(self, mock_run):
-        mock_result = MagicMock()
-        mock_result.stderr = "Some error"
-        mock_run.side_effect = subprocess.CalledProcessError(
-            returncode=1,
-            cmd=["oci", "--help"],
-            output=None,
-            stderr=mock_result.stderr,
-        )
+    @patch(EXEC)
+    async def test_get_oci_commands_failure(self, mock_exec):
+        mock_exec.return_value = mock_process("", "Some error", 1)
 
         async with Client(mcp) as client:
             result = (await client.read_resource("resource://oci-api-commands"))[0].text
@@ -189,14 +168,9 @@ class TestOCITools:
             assert "error" in result
 
     @pytest.mark.asyncio
-    @patch("oracle.oci_api_mcp_server.server.subprocess.run")
-    @patch("oracle.oci_api_mcp_server.server.json.loads")
-    async def test_run_oci_command_denied(self, mock_json_loads, mock_run):
-        mock_result = MagicMock()
-        mock_result.stdout = '{"key": "value"}'
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
-        mock_json_loads.return_value = {"key": "value"}
+    @patch(EXEC)
+    async def test_run_oci_command_denied(self, mock_exec):
+        mock_exec.return_value = mock_process('{"key": "value"}')
 
         async with Client(mcp) as client:
             result = (
@@ -207,6 +181,46 @@ class TestOCITools:
 
             assert "error" in result
             assert any("denied by denylist" in value for value in result.values())
+            mock_exec.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch(EXEC)
+    async def test_commands_time_out(self, mock_exec, monkeypatch):
+        async def never_finishes(*args):
+            await asyncio.sleep(60)
+
+        process = mock_process()
+        process.returncode = None
+        process.communicate = never_finishes
+        process.stdout.read = AsyncMock(side_effect=never_finishes)
+        process.wait = AsyncMock()
+        mock_exec.return_value = process
+        monkeypatch.setattr(server.cli_executor, "timeout", 0.01)
+
+        async with Client(mcp) as client:
+            result = (
+                await client.call_tool(
+                    "run_oci_command", {"command": "compute instance list"}
+                )
+            ).data
+            assert result == {
+                "command": "compute instance list",
+                "output": None,
+                "error": "Command timed out after 0.01 seconds",
+                "returncode": None,
+            }
+
+            result = (
+                await client.call_tool(
+                    "get_oci_command_help", {"command": "compute instance list"}
+                )
+            ).structured_content["result"]
+            assert result == "Error: timed out after 0.01 seconds"
+
+            result = (await client.read_resource("resource://oci-api-commands"))[0].text
+            assert result == "Error: timed out after 0.01 seconds"
+
+        assert process.kill.call_count == 3
 
 
 class TestServer:
@@ -0,0 +1,273 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import json
+import os
+from unittest.mock import MagicMock
+
+import pytest
+from fastmcp import Client
+from oracle.oci_api_mcp_server import server
+from oracle.oci_api_mcp_server.output import (
+    OutputPager,
+    decode_cursor,
+    encode_cursor,
+    is_resumable,
+)
+
+ITEMS = [{"id": f"ocid1.instance.{i}", "display-name": f"vm-{i}"} for i in range(10)]
+LIST_OUTPUT = json.dumps({"data": ITEMS, "opc-next-page": "page-2"}, indent=4)
+
+
+def page(output: str, chunk_size: int, **budget):
+    pager = OutputPager(budget.pop("max_bytes", 10**6), **budget)
+    data = output.encode("utf-8")
+    for start in range(0, len(data), chunk_size):
+        if not pager.feed(data[start : start + chunk_size]):  # noqa: E203
+            break
+    return pager, *pager.result()
+
+
+class TestOutputPager:
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64, 10**6])
+    def test_list_output_is_parsed_incrementally(self, chunk_size):
+        pager, output, next_offset = page(LIST_OUTPUT, chunk_size)
+
+        assert output == json.loads(LIST_OUTPUT)
+        assert next_offset is None
+        assert not pager.truncated
+
+    @pytest.mark.parametrize("chunk_size", [1, 13, 10**6])
+    def test_item_budget(self, chunk_size):
+        pager, output, next_offset = page(LIST_OUTPUT, chunk_size, max_items=4)
+
+        assert output == {"data": ITEMS[:4]}
+        assert next_offset == 4
+        assert pager.truncated
+
+        _, output, next_offset = page(LIST_OUTPUT, chunk_size, max_items=4, offset=8)
+        assert output == {"data": ITEMS[8:], "opc-next-page": "page-2"}
+        assert next_offset is None
+
+    def test_byte_budget_keeps_at_least_one_item(self):
+        item_size = len(json.dumps(ITEMS[0], indent=4).replace("\n", "\n        "))
+
+        _, output, next_offset = page(LIST_OUTPUT, 32, max_bytes=2 * item_size + 1)
+        assert output == {"data": ITEMS[:2]}
+        assert next_offset == 2
+
+        _, output, next_offset = page(LIST_OUTPUT, 32, max_bytes=1)
+        assert output == {"data": ITEMS[:1]}
+        assert next_offset == 1
+
+    def test_feed_after_truncation(self):
+        pager = OutputPager(10**6, max_items=1)
+
+        assert not pager.feed(LIST_OUTPUT.encode())
+        assert not pager.feed(b"more")
+
+    @pytest.mark.parametrize("chunk_size", [1, 10**6])
+    def test_list_of_numbers_split_across_chunks(self, chunk_size):
+        _, output, _ = page('{"data": [12345, 678]}', chunk_size)
+
+        assert output == {"data": [12345, 678]}
+
+    def test_empty_list(self):
+        assert page('{\n  "data": []\n}\n', 3)[1] == {"data": []}
+
+    def test_unicode_split_across_chunks(self):
+        output = json.dumps({"data": ["déjà vu"]}, ensure_ascii=False)
+
+        assert page(output, 1)[1] == {"data": ["déjà vu"]}
+
+    @pytest.mark.parametrize(
+        "output, expected",
+        [
+            ('{"data": {"id": "ocid1.bucket"}}', {"data": {"id": "ocid1.bucket"}}),
+            ("This is not JSON", "This is not JSON"),
+            ("", ""),
+            ('{"data": [1, 2', {"data": [1, 2]}),
+        ],
+    )
+    def test_other_outputs(self, output, expected):
+        pager, result, next_offset = page(output, 5)
+
+        assert result == expected
+        assert next_offset is None
+        assert not pager.truncated
+
+    def test_text_output_budget(self):
+        output = '{"data": {"description": "' + "x" * 1000 + '"}}'
+        pager, result, next_offset = page(output, 64, max_bytes=100)
+
+        assert pager.truncated
+        assert result == output[:100]
+        assert next_offset is None
+
+
+class TestCursor:
+    def test_round_trip(self):
+        cursor = encode_cursor("compute instance list  --all", 40)
+
+        assert decode_cursor(cursor, "compute instance list --all") == 40
+
+    @pytest.mark.parametrize(
+        "cursor, message",
+        [
+            ("not a cursor", "not a cursor"),
+            (encode_cursor("iam user list", 5), "different command"),
+            (encode_cursor("compute instance list", -1), "not a cursor"),
+        ],
+    )
+    def test_invalid_cursors(self, cursor, message):
+        with pytest.raises(ValueError, match=message):
+            decode_cursor(cursor, "compute instance list")
+
+    @pytest.mark.parametrize(
+        "command, resumable",
+        [
+            ("compute instance list --all", True),
+            ("os ns get", True),
+            ("compute instance list-vnics --instance-id ocid1.instance", True),
+            ("search resource structured-search --query-text x", True),
+            ("compute instance launch --from-json file://list", False),
+            ("compute instance action --action STOP", False),
+            ("os object bulk-upload --bucket-name get", False),
+            ("--help", False),
+        ],
+    )
+    def test_only_read_commands_are_resumable(self, command, resumable):
+        assert is_resumable(command) is resumable
+
+    def test_cursor_for_command_with_side_effects_is_rejected(self):
+        command = "compute instance launch --from-json file://instance.json"
+
+        with pytest.raises(ValueError, match="only accepted for list, get and search"):
+            decode_cursor(encode_cursor(command, 5), command)
+
+
+FAKE_OCI = """#!/bin/sh
+echo $$ >> "$PID_FILE"
+if [ "$5" = "text" ]; then
+  head -c 5000 /dev/zero | tr '\\0' x
+  exit 0
+fi
+printf '{\\n  "data": [\\n'
+i=0
+while [ $i -lt 50 ]; do
+  printf '    {"id": "ocid1.instance.%d"},\\n' $i
+  i=$((i + 1))
+done
+if [ "$5" = "endless" ]; then
+  exec sleep 30
+fi
+printf '    {"id": "last"}\\n  ]\\n}\\n'
+"""
+
+
+@pytest.fixture
+def fake_oci(tmp_path, monkeypatch):
+    oci = tmp_path / "bin" / "oci"
+    oci.parent.mkdir()
+    oci.write_text(FAKE_OCI)
+    oci.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{oci.parent}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("PID_FILE", str(tmp_path / "pids"))
+    monkeypatch.setattr(
+        server,
+        "denylist_manager",
+        MagicMock(
+            **{
+                "isCommandInDenyList.return_value": False,
+                "isCommandInAllowList.return_value": True,
+            }
+        ),
+    )
+    return tmp_path / "pids"
+
+
+class TestRunOciCommandPages:
+    @pytest.mark.asyncio
+    async def test_follow_cursor(self, fake_oci):
+        command = "compute instance list --all"
+        pages = []
+        async with Client(server.mcp) as client:
+            arguments = {"command": command, "max_items": 20}
+            while True:
+                result = (await client.call_tool("run_oci_command", arguments)).data
+                pages.append(result)
+                if not result.get("truncated"):
+                    break
+                arguments["cursor"] = result["next_cursor"]
+
+        assert [len(page["output"]["data"]) for page in pages] == [20, 20, 11]
+        ids = [item["id"] for page in pages for item in page["output"]["data"]]
+        assert ids == [f"ocid1.instance.{i}" for i in range(50)] + ["last"]
+        assert pages[0]["returncode"] == 0
+        assert "--query" in pages[0]["hint"]
+        assert "Drop --all" in pages[0]["hint"]
+
+    @pytest.mark.asyncio
+    async def test_truncation_stops_the_command(self, fake_oci):
+        async with Client(server.mcp) as client:
+            result = (
+                await client.call_tool(
+                    "run_oci_command",
+                    {"command": "endless list --query data[].id", "max_items": 5},
+                )
+            ).data
+
+        assert result["truncated"]
+        assert len(result["output"]["data"]) == 5
+        assert "--query" not in result["hint"]
+        assert "--limit" in result["hint"]
+        pid = int(fake_oci.read_text().split()[-1])
+        with pytest.raises(ProcessLookupError):
+            os.kill(pid, 0)
+
+    @pytest.mark.asyncio
+    async def test_byte_budget_on_text_output(self, fake_oci, monkeypatch):
+        monkeypatch.setattr(server, "MAX_OUTPUT_BYTES", 100)
+
+        async with Client(server.mcp) as client:
+            result = (
+                await client.call_tool("run_oci_command", {"command": "text get"})
+            ).data
+
+        assert result["output"] == "x" * 100
+        assert result["truncated"]
+        assert result["next_cursor"] is None
+        assert "truncated to 100 bytes" in result["hint"]
+        assert "--limit" not in result["hint"]
+
+    @pytest.mark.asyncio
+    async def test_no_cursor_for_commands_with_side_effects(self, fake_oci):
+        async with Client(server.mcp) as client:
+            result = (
+                await client.call_tool(
+                    "run_oci_command",
+                    {"command": "compute instance launch", "max_items": 5},
+                )
+            ).data
+
+        assert result["truncated"]
+        assert len(result["output"]["data"]) == 5
+        assert result["next_cursor"] is None
+        assert "next_cursor" not in result["hint"]
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor(self, fake_oci):
+        async with Client(server.mcp) as client:
+            result = (
+                await client.call_tool(
+                    "run_oci_command",
+                    {"command": "compute instance list", "cursor": "bogus"},
+                )
+            ).data
+
+        assert result["error"] == "cursor is not a cursor returned by run_oci_command"
+        assert result["returncode"] is None
+        assert not fake_oci.exists()
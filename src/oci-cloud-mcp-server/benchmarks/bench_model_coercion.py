@@ -0,0 +1,102 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+
+Compares coercing a LaunchInstanceDetails-style payload with the name-based
+heuristics (_coerce_params_to_oci_models) against the compiled per-class plan
+(_coerce_params_with_plan) that invoke_oci_api tries first. Besides the time
+per call, it reports the model types each path produced: the heuristics cannot
+resolve polymorphic fields such as source_details and leave them as dicts.
+
+Usage: uv run python benchmarks/bench_model_coercion.py [iterations]
+"""
+
+import sys
+import time
+
+from oracle.oci_cloud_mcp_server import server
+
+CLIENT_FQN = "oci.core.ComputeClient"
+OPERATION = "launch_instance"
+MODEL_TYPES = {"launch_instance_details": "oci.core.models.LaunchInstanceDetails"}
+
+
+def payload() -> dict:
+    return {
+        "launch_instance_details": {
+            "compartment_id": "ocid1.compartment.oc1..bench",
+            "availability_domain": "Uocm:PHX-AD-1",
+            "display_name": "bench-instance",
+            "shape": "VM.Standard.E4.Flex",
+            "shape_config": {"ocpus": 2, "memory_in_gbs": 16},
+            "source_details": {
+                "source_type": "image",
+                "image_id": "ocid1.image.oc1..bench",
+                "boot_volume_size_in_gbs": 100,
+            },
+            "create_vnic_details": {
+                "subnet_id": "ocid1.subnet.oc1..bench",
+                "assign_public_ip": False,
+                "nsg_ids": ["ocid1.networksecuritygroup.oc1..bench"],
+            },
+            "launch_volume_attachments": [
+                {"type": "paravirtualized", "display_name": f"data-{i}"}
+                for i in range(4)
+            ],
+            "metadata": {"ssh_authorized_keys": "ssh-rsa AAAA bench"},
+            "defined_tags": {"Operations": {"CostCenter": "42"}},
+            "freeform_tags": {"env": "bench"},
+        }
+    }
+
+
+def time_calls(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1000
+
+
+def heuristic():
+    return server._coerce_params_to_oci_models(CLIENT_FQN, OPERATION, payload())
+
+
+def planned():
+    params = server._coerce_params_with_plan(
+        CLIENT_FQN, OPERATION, payload(), MODEL_TYPES
+    )
+    return server._coerce_params_to_oci_models(CLIENT_FQN, OPERATION, params)
+
+
+def describe(params: dict) -> str:
+    details = params["launch_instance_details"]
+    return ", ".join(
+        f"{field}={type(getattr(details, field)).__name__}"
+        for field in ("shape_config", "source_details", "create_vnic_details")
+    )
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    heuristic()  # import the models module outside the timed sections
+    server._model_plans.clear()
+    server._operation_plans.clear()
+    start = time.perf_counter()
+    planned()
+    compile_ms = (time.perf_counter() - start) * 1000
+
+    heuristic_ms = time_calls(heuristic, iterations)
+    planned_ms = time_calls(planned, iterations)
+
+    print(f"iterations:           {iterations}")
+    print(f"plan compile (once):  {compile_ms:.3f} ms")
+    print(f"heuristic per call:   {heuristic_ms:.3f} ms")
+    print(f"compiled per call:    {planned_ms:.3f} ms")
+    print(f"speedup:              {heuristic_ms / planned_ms:.1f}x")
+    print(f"heuristic result:     {describe(heuristic())}")
+    print(f"compiled result:      {describe(planned())}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+
+Serializes a list of Instance models, the shape of a large list_instances
+response, two ways:
+
+- legacy: oci.util.to_dict followed by a json.dumps probe on every leaf
+  (the previous _serialize_oci_data)
+- tree: _serialize_oci_data walking models through cached field plans
+
+Usage: uv run python benchmarks/bench_serialization.py [items]
+"""
+
+import datetime
+import json
+import sys
+import time
+
+import oci
+from oracle.oci_cloud_mcp_server import server
+
+
+def make_instances(count: int) -> list:
+    models = oci.core.models
+    created = datetime.datetime(2026, 1, 1, 12, 0, 0)
+    return [
+        models.Instance(
+            id=f"ocid1.instance.oc1..{i}",
+            compartment_id="ocid1.compartment.oc1..bench",
+            availability_domain="Uocm:PHX-AD-1",
+            display_name=f"instance-{i}",
+            shape="VM.Standard.E4.Flex",
+            lifecycle_state="RUNNING",
+            region="us-phoenix-1",
+            time_created=created,
+            shape_config=models.InstanceShapeConfig(ocpus=2.0, memory_in_gbs=16.0),
+            source_details=models.InstanceSourceViaImageDetails(
+                image_id="ocid1.image.oc1..bench"
+            ),
+            freeform_tags={"env": "bench"},
+            defined_tags={"Operations": {"CostCenter": "42"}},
+            metadata={"ssh_authorized_keys": "ssh-rsa AAAA bench"},
+        )
+        for i in range(count)
+    ]
+
+
+def legacy(data):
+    return json.dumps(server._serialize_fallback(data)).encode("utf-8")
+
+
+def tree(data):
+    return json.dumps(server._serialize_oci_data(data)).encode("utf-8")
+
+
+def timed(fn, data) -> float:
+    start = time.perf_counter()
+    fn(data)
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    data = make_instances(count)
+    assert json.loads(legacy(data)) == json.loads(tree(data))
+
+    print(f"items:                {count}")
+    for name, fn in (("legacy", legacy), ("tree", tree)):
+        best = min(timed(fn, data) for _ in range(3))
+        print(f"{name + ':':<22}{best:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
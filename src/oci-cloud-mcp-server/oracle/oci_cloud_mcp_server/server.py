@@ -4,19 +4,28 @@ Licensed under the Universal Permissive License v1.0 as shown at
 https://oss.oracle.com/licenses/upl.
 """
 
+import base64
+import datetime
+import enum
 import inspect
 import json
 import os
 import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from importlib import import_module
 from logging import Logger
-from typing import Annotated, Any, Callable, Dict, List, Optional, Tuple
+from typing import Annotated, Any, Callable, Dict, List, Optional, Tuple, Union
+from urllib.parse import urlparse
 
 import oci
 from fastmcp import FastMCP
+from oracle.oci_mcp_common.audit import AuditMiddleware, initAuditLogger
+from oracle.oci_mcp_common.client_cache import get_file_mtimes, get_settled_mtimes
 
 from . import __project__, __version__
-from .utils import initAuditLogger
 
 logger = Logger(__name__, level="INFO")
 
@@ -28,10 +37,15 @@ mcp = FastMCP(
         This server provides tools to interact directly with the OCI Python SDK,
         invoking API clients and operations in-process (no CLI).
         - invoke_oci_api: Call any OCI SDK client operation by FQN and method.
+        - invoke_oci_api_batch: Make many independent calls concurrently in one request.
         - list_client_operations: Discover available operations on a client.
+        - evict_oci_clients: Drop cached SDK clients so the next call rebuilds them.
     """,
 )
 
+# Write an audit record for every tool call
+mcp.add_middleware(AuditMiddleware(logger))
+
 _user_agent_name = __project__.split("oracle.", 1)[1].split("-server", 1)[0]
 _ADDITIONAL_UA = f"{_user_agent_name}/{__version__}"
 
@@ -40,6 +54,19 @@ _ADDITIONAL_UA = f"{_user_agent_name}/{__version__}"
 # in any residual fallback checks.
 known_paginated: set = set()
 
+# Bounded LRU of live SDK clients keyed by (client_fqn, config file, profile,
+# region). Each entry holds the client class, the credential files it was built
+# from, their mtimes at build time and the client instance, so warm calls reuse
+# the client's signer and connection pool until the credentials change on disk.
+_CLIENT_CACHE_SIZE = int(os.getenv("ORACLE_MCP_CLIENT_CACHE_SIZE", "32"))
+_client_cache: "OrderedDict[Tuple[str, str, str, Optional[str]], Tuple]" = OrderedDict()
+_client_cache_lock = threading.Lock()
+
+
+def _config_file() -> str:
+    """The OCI config file that clients are built from (OCI_CONFIG_FILE)."""
+    return os.getenv("OCI_CONFIG_FILE", oci.config.DEFAULT_LOCATION)
+
 
 def _get_config_and_signer() -> Tuple[Dict[str, Any], Any]:
     """
@@ -50,7 +77,8 @@ def _get_config_and_signer() -> Tuple[Dict[str, Any], Any]:
     - Otherwise, fall back to API key Signer from config.
     """
     config = oci.config.from_file(
-        profile_name=os.getenv("OCI_CONFIG_PROFILE", oci.config.DEFAULT_PROFILE)
+        file_location=_config_file(),
+        profile_name=os.getenv("OCI_CONFIG_PROFILE", oci.config.DEFAULT_PROFILE),
     )
     config["additional_user_agent"] = _ADDITIONAL_UA
 
@@ -92,10 +120,30 @@ def _get_config_and_signer() -> Tuple[Dict[str, Any], Any]:
     return config, signer
 
 
-def _import_client(client_fqn: str) -> Any:
+def _credential_paths(
+    config_file: str, config: Dict[str, Any]
+) -> Optional[Tuple[str, ...]]:
+    """
+    Return the files a client built from this config depends on, or None when the
+    config does not come from a key file (nothing to watch, so nothing to cache).
+    """
+    if not config.get("key_file"):
+        return None
+    paths = [config_file, config["key_file"]]
+    # the signer falls back to the API key when the token file is missing
+    token_file = os.path.expanduser(config.get("security_token_file", "") or "")
+    if token_file and os.path.exists(token_file):
+        paths.append(token_file)
+    return tuple(paths)
+
+
+def _import_client(client_fqn: str, region: Optional[str] = None) -> Any:
     """
     Import and instantiate an OCI SDK Client given a fully-qualified class name.
     Example: 'oci.core.ComputeClient'
+
+    Instances are cached per (client_fqn, config file, profile, region) and
+    reused until the config, key or security token file changes.
     """
     if "." not in client_fqn:
         raise ValueError(
@@ -106,11 +154,46 @@ def _import_client(client_fqn: str) -> Any:
     cls = getattr(module, class_name)
     if not inspect.isclass(cls):
         raise ValueError(f"{client_fqn} is not a class")
+
+    config_file = _config_file()
+    profile = os.getenv("OCI_CONFIG_PROFILE", oci.config.DEFAULT_PROFILE)
+    cache_key = (client_fqn, config_file, profile, region)
+    with _client_cache_lock:
+        cached = _client_cache.get(cache_key)
+        if cached is not None:
+            cached_cls, paths, mtimes, instance = cached
+            if cached_cls is cls and get_file_mtimes(paths) == mtimes:
+                _client_cache.move_to_end(cache_key)
+                return instance
+            del _client_cache[cache_key]
+
+    started = time.time_ns()
     config, signer = _get_config_and_signer()
+    if region:
+        config = dict(config)
+        config["region"] = region
     instance = cls(config, signer=signer)
+
+    paths = _credential_paths(config_file, config)
+    mtimes = get_settled_mtimes(paths, started) if paths is not None else None
+    if mtimes is not None and _CLIENT_CACHE_SIZE > 0:
+        with _client_cache_lock:
+            _client_cache[cache_key] = (cls, paths, mtimes, instance)
+            _client_cache.move_to_end(cache_key)
+            while len(_client_cache) > _CLIENT_CACHE_SIZE:
+                _client_cache.popitem(last=False)
     return instance
 
 
+def _evict_clients(client_fqn: Optional[str] = None) -> int:
+    """Drop cached clients (all, or only those for client_fqn). Returns the count."""
+    with _client_cache_lock:
+        keys = [k for k in _client_cache if client_fqn is None or k[0] == client_fqn]
+        for k in keys:
+            del _client_cache[k]
+    return len(keys)
+
+
 def _snake_to_camel(name: str) -> str:
     parts = name.split("_")
     return "".join(p.capitalize() for p in parts if p)
@@ -328,6 +411,165 @@ def _coerce_params_to_oci_models(
     return out
 
 
+# compiled coercion plans: for every model class, a converter per swagger attribute
+# derived from its declared type, so payloads are coerced in a single pass without
+# guessing class names. Plans are built once per model class and per operation.
+_model_plans: Dict[Any, Tuple[Dict[str, Any], Dict[str, Optional[Callable]]]] = {}
+_operation_plans: Dict[Tuple[str, str], Dict[str, Callable[[Any], Any]]] = {}
+
+
+class _PlanMismatch(Exception):
+    """Raised when a payload does not fit the declared model types"""
+
+
+def _compile_type_converter(type_name: str, models_module: Any) -> Optional[Callable]:
+    """
+    Returns a converter for a swagger type such as 'LaunchInstanceShapeConfigDetails',
+    'list[AttachVolumeDetails]' or 'dict(str, object)', or None when values of that
+    type are passed through unchanged (primitives, datetimes, plain dicts).
+    """
+    if type_name.startswith("list[") and type_name.endswith("]"):
+        item_converter = _compile_type_converter(type_name[5:-1], models_module)
+        if item_converter is None:
+            return None
+
+        def convert_list(value):
+            if not isinstance(value, list):
+                return value
+            return [item_converter(x) if x is not None else x for x in value]
+
+        return convert_list
+    if type_name.startswith("dict(") and type_name.endswith(")"):
+        _, _, value_type = type_name[5:-1].partition(",")
+        value_converter = _compile_type_converter(value_type.strip(), models_module)
+        if value_converter is None:
+            return None
+
+        def convert_dict(value):
+            if not isinstance(value, dict):
+                return value
+            return {
+                k: value_converter(v) if v is not None else v for k, v in value.items()
+            }
+
+        return convert_dict
+    cls = _resolve_model_class(models_module, type_name) if models_module else None
+    if inspect.isclass(cls):
+        # the model's own plan is compiled lazily on first use, which keeps
+        # self-referencing model types from recursing at compile time
+        return lambda value: _apply_model_plan(cls, value, models_module)
+    return None
+
+
+def _get_model_plan(
+    cls: Any, models_module: Any
+) -> Tuple[Dict[str, Any], Dict[str, Optional[Callable]]]:
+    """Returns (attribute_map, converters) for a model class, compiling it once"""
+    plan = _model_plans.get(cls)
+    if plan is None:
+        swagger_types = getattr(cls, "swagger_types", None)
+        attribute_map = getattr(cls, "attribute_map", None)
+        if not isinstance(swagger_types, dict):
+            # SDK models declare their types per instance in __init__
+            try:
+                instance = cls()
+            except Exception as e:
+                raise _PlanMismatch(f"cannot introspect {cls.__name__}: {e}")
+            swagger_types = getattr(instance, "swagger_types", None)
+            attribute_map = getattr(instance, "attribute_map", None)
+        if not isinstance(swagger_types, dict):
+            raise _PlanMismatch(f"{cls.__name__} does not declare swagger_types")
+        converters = {
+            attr: _compile_type_converter(type_name, models_module)
+            for attr, type_name in swagger_types.items()
+        }
+        plan = (attribute_map or {}, converters)
+        _model_plans[cls] = plan
+    return plan
+
+
+def _apply_model_plan(cls: Any, value: Any, models_module: Any) -> Any:
+    """Builds an instance of cls (or its polymorphic subtype) from a mapping"""
+    if not isinstance(value, dict):
+        # already a model instance (or a scalar the SDK will reject on its own)
+        return value
+    if any(key.startswith("__") for key in value):
+        # explicit model hints are resolved by the heuristic coercion
+        raise _PlanMismatch("payload carries explicit model hints")
+    attribute_map, converters = _get_model_plan(cls, models_module)
+    get_subtype = cls.__dict__.get("get_subtype")
+    if get_subtype is not None and models_module is not None:
+        # polymorphic base: the discriminator is read from the wire-format keys
+        try:
+            wire = {attribute_map.get(k, k): v for k, v in value.items()}
+            subtype = _resolve_model_class(models_module, get_subtype.__func__(wire))
+        except Exception:
+            subtype = None
+        if inspect.isclass(subtype) and subtype is not cls:
+            cls = subtype
+            attribute_map, converters = _get_model_plan(cls, models_module)
+    kwargs = {}
+    for key, item in value.items():
+        if key not in converters:
+            raise _PlanMismatch(f"{cls.__name__} has no attribute '{key}'")
+        converter = converters[key]
+        kwargs[key] = converter(item) if converter and item is not None else item
+    try:
+        return cls(**kwargs)
+    except Exception as e:
+        raise _PlanMismatch(f"cannot construct {cls.__name__}: {e}")
+
+
+def _get_operation_plan(
+    client_fqn: str, operation: str, model_types: Dict[str, str]
+) -> Dict[str, Callable[[Any], Any]]:
+    """
+    Returns the per-parameter converters of an operation, built from the model
+    types its docstring declares (see _build_operation_info) and cached per
+    (client, operation).
+    """
+    key = (client_fqn, operation)
+    plan = _operation_plans.get(key)
+    if plan is None:
+        plan = {}
+        for param, model_fqn in (model_types or {}).items():
+            try:
+                module_name, class_name = model_fqn.rsplit(".", 1)
+                models_module = import_module(module_name)
+                cls = getattr(models_module, class_name)
+            except Exception:
+                continue
+            if inspect.isclass(cls):
+                plan[param] = _compile_type_converter(class_name, models_module)
+        _operation_plans[key] = plan
+    return plan
+
+
+def _coerce_params_with_plan(
+    client_fqn: str,
+    operation: str,
+    params: Dict[str, Any],
+    model_types: Dict[str, str],
+) -> Dict[str, Any]:
+    """
+    Coerce params whose model type the operation declares using the compiled plan.
+    Params without a declared type, or payloads that do not fit it, are returned
+    unchanged for the heuristic coercion in _coerce_params_to_oci_models.
+    """
+    plan = _get_operation_plan(client_fqn, operation, model_types) if params else {}
+    if not plan:
+        return params
+    out = dict(params)
+    for param, converter in plan.items():
+        value = out.get(param)
+        if isinstance(value, dict):
+            try:
+                out[param] = converter(value)
+            except _PlanMismatch as e:
+                logger.debug(f"compiled coercion skipped for {param}: {e}")
+    return out
+
+
 def _align_params_to_signature(
     method: Callable[..., Any], operation_name: str, params: Dict[str, Any]
 ) -> Dict[str, Any]:
@@ -338,8 +580,14 @@ def _align_params_to_signature(
     in the target method signature.
     """
     try:
-        sig = inspect.signature(method)
-        param_names = set(sig.parameters.keys())
+        owner = getattr(method, "__self__", None)
+        if owner is not None:
+            # bound client method: reuse the memoized operation record
+            info = _get_operation_info(type(owner), operation_name, method)
+            param_names = set(info["params"])
+        else:
+            sig = inspect.signature(method)
+            param_names = set(sig.parameters.keys())
     except Exception:
         return params
 
@@ -353,10 +601,51 @@ def _align_params_to_signature(
     return aligned
 
 
-def _serialize_oci_data(data: Any) -> Any:
+# attribute names of each SDK model class, read once from swagger_types
+_serialization_plans: Dict[type, Tuple[str, ...]] = {}
+
+
+def _model_fields(obj: Any) -> Optional[Tuple[str, ...]]:
+    """Returns the cached swagger attribute names of a model, or None for non-models"""
+    cls = type(obj)
+    fields = _serialization_plans.get(cls)
+    if fields is None:
+        swagger_types = getattr(obj, "swagger_types", None)
+        if not isinstance(swagger_types, dict):
+            return None
+        fields = tuple(swagger_types)
+        _serialization_plans[cls] = fields
+    return fields
+
+
+_UNHANDLED = object()
+
+# an attribute a model does not have, which oci.util.to_dict leaves out
+_missing = object()
+
+
+def _serialize_scalar(obj: Any) -> Any:
     """
-    Convert OCI SDK model objects or collections into JSON-serializable structures.
-    Ensures the final result is JSON-serializable even if oci.util.to_dict returns the original object.
+    Converts the non-container values the SDK returns into JSON values, matching
+    oci.util.to_dict (UTC ISO-8601 datetimes). Returns _UNHANDLED otherwise.
+    """
+    if isinstance(obj, (datetime.datetime, datetime.time)):
+        if obj.tzinfo is None:
+            obj = obj.replace(tzinfo=datetime.timezone.utc)
+        return obj.isoformat()
+    if isinstance(obj, datetime.date):
+        return obj.isoformat()
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    if obj is oci.util.NONE_SENTINEL:
+        return None
+    return _UNHANDLED
+
+
+def _serialize_fallback(obj: Any) -> Any:
+    """
+    Slow path for values the model walk does not know: convert with oci.util.to_dict
+    and stringify whatever is still not JSON-serializable.
     """
 
     def ensure_jsonable(obj: Any) -> Any:
@@ -373,12 +662,39 @@ def _serialize_oci_data(data: Any) -> Any:
             return str(obj)
 
     try:
-        converted = oci.util.to_dict(data)
+        converted = oci.util.to_dict(obj)
     except Exception:
-        converted = data
+        converted = obj
     return ensure_jsonable(converted)
 
 
+def _serialize_oci_data(data: Any) -> Any:
+    """
+    Convert OCI SDK model objects or collections into JSON-serializable structures.
+    Models are walked directly through their cached swagger attribute names; values
+    the walk does not recognize go through oci.util.to_dict and are stringified if
+    still not JSON-serializable.
+    """
+    if data is None or isinstance(data, (str, int, float, bool)):
+        return data
+    if isinstance(data, (list, tuple)):
+        return [_serialize_oci_data(x) for x in data]
+    if isinstance(data, dict):
+        return {k: _serialize_oci_data(v) for k, v in data.items()}
+    fields = _model_fields(data)
+    if fields is not None:
+        serialized = {}
+        for name in fields:
+            value = getattr(data, name, _missing)
+            if value is not _missing:
+                serialized[name] = _serialize_oci_data(value)
+        return serialized
+    value = _serialize_scalar(data)
+    if value is not _UNHANDLED:
+        return value
+    return _serialize_fallback(data)
+
+
 def _extract_expected_kwargs_from_source(method: Callable[..., Any]) -> Optional[set]:
     """
     Best-effort extraction of the SDK generator's 'expected_kwargs' list from the method source.
@@ -453,14 +769,145 @@ def _supports_pagination(method: Callable[..., Any], operation_name: str) -> boo
     return operation_name in known_paginated
 
 
+# Memoized per-(client class, operation) introspection results. Building a record
+# runs inspect.getsource/getdoc/signature over the generated SDK method, so it is
+# done once per operation; records for oci.* clients can also be persisted to
+# ORACLE_MCP_INTROSPECTION_CACHE_DIR, keyed by the installed oci SDK version, as
+# one JSON line appended per newly introspected operation.
+_operation_index: Dict[Tuple[Any, str], Dict[str, Any]] = {}
+_operation_index_lock = threading.Lock()
+_persisted_operations: Optional[Dict[str, Dict[str, Any]]] = None
+_persist_lock = threading.Lock()
+
+
+def _introspection_cache_file() -> Optional[str]:
+    cache_dir = os.getenv("ORACLE_MCP_INTROSPECTION_CACHE_DIR")
+    if not cache_dir:
+        return None
+    return os.path.join(
+        os.path.expanduser(cache_dir), f"oci-{oci.__version__}-operations.jsonl"
+    )
+
+
+def _load_persisted_operations() -> Dict[str, Dict[str, Any]]:
+    global _persisted_operations
+    if _persisted_operations is None:
+        _persisted_operations = {}
+        path = _introspection_cache_file()
+        if path and os.path.exists(path):
+            try:
+                with open(path, "r") as f:
+                    for line in f:
+                        try:
+                            entry = json.loads(line)
+                            _persisted_operations[entry["operation"]] = entry["info"]
+                        except (ValueError, KeyError, TypeError):
+                            continue  # a line torn by a crash mid-write
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable introspection cache {path}: {e}")
+    return _persisted_operations
+
+
+def _persist_operation(operation: str, info: Dict[str, Any]) -> None:
+    path = _introspection_cache_file()
+    if not path:
+        return
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        line = json.dumps({"operation": operation, "info": info}) + "\n"
+        with _persist_lock, open(path, "a") as f:
+            f.write(line)
+    except Exception as e:
+        logger.warning(f"Failed to write introspection cache {path}: {e}")
+
+
+def _build_operation_info(method: Callable[..., Any], operation_name: str) -> dict:
+    """
+    Introspect an SDK operation once: pagination support, signature parameter names,
+    required parameters, the generator's expected_kwargs and documented model types
+    (e.g. {'launch_instance_details': 'oci.core.models.LaunchInstanceDetails'}).
+    """
+    params: List[str] = []
+    required: List[str] = []
+    try:
+        for name, p in inspect.signature(method).parameters.items():
+            if p.kind in (p.VAR_POSITIONAL, p.VAR_KEYWORD):
+                continue
+            params.append(name)
+            if p.default is inspect.Parameter.empty:
+                required.append(name)
+    except Exception:
+        params = []
+        required = []
+    expected_kwargs = _extract_expected_kwargs_from_source(method)
+    model_types: Dict[str, str] = {}
+    try:
+        doc = inspect.getdoc(method) or ""
+        for type_name, param_name in re.findall(r":param\s+([\w.]+)\s+(\w+):", doc):
+            if ".models." in type_name:
+                model_types[param_name] = type_name
+    except Exception:
+        model_types = {}
+    return {
+        "paginated": _supports_pagination(method, operation_name),
+        "params": params,
+        "required": required,
+        "expected_kwargs": (
+            sorted(expected_kwargs) if expected_kwargs is not None else None
+        ),
+        "model_types": model_types,
+    }
+
+
+def _get_operation_info(
+    client_cls: Any, operation_name: str, method: Callable[..., Any]
+) -> dict:
+    """Return the memoized introspection record for client_cls.operation_name."""
+    key = (client_cls, operation_name)
+    info = _operation_index.get(key)
+    if info is not None:
+        return info
+
+    module = getattr(client_cls, "__module__", "") or ""
+    persist_key = None
+    if module == "oci" or module.startswith("oci."):
+        persist_key = f"{module}.{client_cls.__qualname__}.{operation_name}"
+
+    with _operation_index_lock:
+        info = _operation_index.get(key)
+        if info is None and persist_key:
+            info = _load_persisted_operations().get(persist_key)
+            if info is not None:
+                _operation_index[key] = info
+        if info is not None:
+            return info
+
+    # introspect without holding the lock; when two calls race on a new
+    # operation, the first record stored is kept and persisted
+    built = _build_operation_info(method, operation_name)
+    with _operation_index_lock:
+        info = _operation_index.setdefault(key, built)
+        if info is not built or not persist_key or not _introspection_cache_file():
+            return info
+        _load_persisted_operations()[persist_key] = info
+    _persist_operation(persist_key, info)
+    return info
+
+
 def _call_with_pagination_if_applicable(
-    method: Callable[..., Any], params: Dict[str, Any], operation_name: str
+    method: Callable[..., Any],
+    params: Dict[str, Any],
+    operation_name: str,
+    paginated: Optional[bool] = None,
 ) -> Tuple[Any, Optional[str]]:
     """
     If the operation appears to be paginated, use the OCI paginator to get all results.
+    Pass paginated when already known (e.g. from the operation index) to skip detection.
     Returns (data, opc_request_id).
     """
-    if _supports_pagination(method, operation_name):
+    if paginated is None:
+        paginated = _supports_pagination(method, operation_name)
+    if paginated:
         logger.info(f"Using paginator for operation {operation_name}")
         response = oci.pagination.list_call_get_all_results(method, **params)
         opc_request_id = None
@@ -521,27 +968,111 @@ def _call_with_pagination_if_applicable(
     return data, opc_request_id
 
 
-@mcp.tool(description="Invoke an OCI Python SDK API via client and operation name.")
-def invoke_oci_api(
-    client_fqn: Annotated[
-        str, "Fully-qualified client class, e.g. 'oci.core.ComputeClient'"
-    ],
-    operation: Annotated[
-        str, "Client method/operation name, e.g. 'list_instances' or 'get_instance'"
-    ],
-    params: Annotated[
-        Dict[str, Any],
-        "Keyword arguments for the operation (JSON object). Use snake_case keys as in SDK.",
-    ] = {},
+def _encode_continuation_token(page: Optional[str], offset: int) -> str:
+    raw = json.dumps({"page": page, "offset": offset}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def _decode_continuation_token(token: str) -> Tuple[Optional[str], int]:
+    try:
+        decoded = json.loads(base64.urlsafe_b64decode(token.encode("ascii")))
+        page, offset = decoded["page"], int(decoded["offset"])
+    except Exception:
+        raise ValueError("continuation_token is not a token returned by invoke_oci_api")
+    if (page is not None and not isinstance(page, str)) or offset < 0:
+        raise ValueError("continuation_token is not a token returned by invoke_oci_api")
+    return page, offset
+
+
+def _page_items(data: Any) -> List[Any]:
+    """Returns the records of one list response page (a list or a *Collection)"""
+    if isinstance(data, list):
+        return data
+    for attr in ("items", "objects"):
+        items = getattr(data, attr, None)
+        if isinstance(items, list):
+            return items
+    return [data] if data is not None else []
+
+
+def _call_with_page_budget(
+    method: Callable[..., Any],
+    params: Dict[str, Any],
+    max_items: Optional[int] = None,
+    max_pages: Optional[int] = None,
+    continuation_token: Optional[str] = None,
+) -> Tuple[List[Any], Optional[str], Optional[str]]:
+    """
+    Follow list pages one at a time until the service runs out of pages or the
+    max_items/max_pages budget is reached. Each page is serialized as soon as it
+    arrives, so only one page of SDK models is alive at a time.
+
+    The continuation token records the page token of the page being consumed and
+    how many of its records were already returned, so resuming never skips or
+    repeats records even when the budget ran out in the middle of a page.
+    Returns (serialized records, opc_request_id, continuation token or None).
+    """
+    if max_items is not None and max_items < 1:
+        raise ValueError("max_items must be a positive integer")
+    if max_pages is not None and max_pages < 1:
+        raise ValueError("max_pages must be a positive integer")
+    page, offset = (
+        _decode_continuation_token(continuation_token)
+        if continuation_token
+        else (params.get("page"), 0)
+    )
+    results: List[Any] = []
+    opc_request_id = None
+    pages = 0
+    while True:
+        call_params = dict(params)
+        call_params.pop("page", None)
+        if page is not None:
+            call_params["page"] = page
+        if max_items is not None and "limit" not in params:
+            # don't ask the service for more records than the budget still allows
+            call_params["limit"] = max_items - len(results) + offset
+        response = method(**call_params)
+        pages += 1
+        try:
+            opc_request_id = response.headers.get("opc-request-id")
+        except Exception:
+            pass
+        items = _page_items(getattr(response, "data", response))
+        next_page = getattr(response, "next_page", None)
+        end = len(items)
+        if max_items is not None:
+            end = min(end, offset + max_items - len(results))
+        results.extend(_serialize_oci_data(item) for item in items[offset:end])
+        if end < len(items):
+            # budget ran out mid-page: resume from this page, past what we returned
+            return results, opc_request_id, _encode_continuation_token(page, end)
+        if next_page is None:
+            return results, opc_request_id, None
+        page, offset = next_page, 0
+        if (max_items is not None and len(results) >= max_items) or (
+            max_pages is not None and pages >= max_pages
+        ):
+            return results, opc_request_id, _encode_continuation_token(page, 0)
+
+
+def _invoke_oci_api(
+    client_fqn: str,
+    operation: str,
+    params: Optional[Dict[str, Any]] = None,
+    region: Optional[str] = None,
+    max_items: Optional[int] = None,
+    max_pages: Optional[int] = None,
+    continuation_token: Optional[str] = None,
+    client: Any = None,
 ) -> dict:
     """
-    Example:
-      client_fqn='oci.core.ComputeClient'
-      operation='list_instances'
-      params={'compartment_id': '<ocid>', 'availability_domain': '...'}
+    Implementation of invoke_oci_api, shared with invoke_oci_api_batch. Pass client
+    when the caller already resolved it. Errors are returned in the result, not raised.
     """
     try:
-        client = _import_client(client_fqn)
+        if client is None:
+            client = _import_client(client_fqn, region)
         if not hasattr(client, operation):
             raise AttributeError(
                 f"Operation '{operation}' not found on client '{client_fqn}'"
@@ -564,8 +1095,14 @@ def invoke_oci_api(
             if src in normalized_params and dst not in normalized_params:
                 normalized_params[dst] = normalized_params.pop(src)
 
+        op_info = _get_operation_info(type(client), operation, method)
+        # params with a declared model type go through the compiled plan; anything
+        # left as a plain mapping falls back to the name-based heuristics
+        planned_params = _coerce_params_with_plan(
+            client_fqn, operation, normalized_params, op_info["model_types"]
+        )
         coerced_params = _coerce_params_to_oci_models(
-            client_fqn, operation, normalized_params
+            client_fqn, operation, planned_params
         )
         # final kwarg aliasing at the top-level prior to invocation to ensure correct SDK kw
         final_params = dict(coerced_params)
@@ -573,9 +1110,28 @@ def invoke_oci_api(
         final_params = _align_params_to_signature(method, operation, final_params)
         logger.debug(f"invoke_oci_api final_params keys: {list(final_params.keys())}")
         logger.debug(f"op: {operation}")
+        budgeted = (
+            max_items is not None or max_pages is not None or bool(continuation_token)
+        )
+        if budgeted and op_info["paginated"]:
+            records, opc_request_id, next_token = _call_with_page_budget(
+                method, final_params, max_items, max_pages, continuation_token
+            )
+            logger.info(
+                f"invoke_oci_api success: client={client_fqn} op={operation} "
+                f"records={len(records)} truncated={next_token is not None}"
+            )
+            return {
+                "client": client_fqn,
+                "operation": operation,
+                "params": params,
+                "opc_request_id": opc_request_id,
+                "data": records,
+                "continuation_token": next_token,
+            }
         try:
             data, opc_request_id = _call_with_pagination_if_applicable(
-                method, final_params, operation
+                method, final_params, operation, op_info["paginated"]
             )
         except TypeError as e:
             msg = str(e)
@@ -590,7 +1146,7 @@ def invoke_oci_api(
                     alt_params = dict(final_params)
                     alt_params[dst] = alt_params.pop(src)
                     data, opc_request_id = _call_with_pagination_if_applicable(
-                        method, alt_params, operation
+                        method, alt_params, operation, op_info["paginated"]
                     )
                 else:
                     raise
@@ -619,6 +1175,287 @@ def invoke_oci_api(
         }
 
 
+@mcp.tool(description="Invoke an OCI Python SDK API via client and operation name.")
+def invoke_oci_api(
+    client_fqn: Annotated[
+        str, "Fully-qualified client class, e.g. 'oci.core.ComputeClient'"
+    ],
+    operation: Annotated[
+        str, "Client method/operation name, e.g. 'list_instances' or 'get_instance'"
+    ],
+    params: Annotated[
+        Dict[str, Any],
+        "Keyword arguments for the operation (JSON object). Use snake_case keys as in SDK.",
+    ] = {},
+    region: Annotated[
+        Optional[str],
+        "Region to call, e.g. 'us-ashburn-1'. Defaults to the region of the configured profile.",
+    ] = None,
+    max_items: Annotated[
+        Optional[int],
+        "For list operations, stop after this many records and return a continuation_token.",
+    ] = None,
+    max_pages: Annotated[
+        Optional[int],
+        "For list operations, stop after this many pages and return a continuation_token.",
+    ] = None,
+    continuation_token: Annotated[
+        Optional[str],
+        "Token returned by a previous budgeted call of the same operation and params, to resume it.",
+    ] = None,
+    compartment_ids: Annotated[
+        Optional[Union[List[str], str]],
+        "Fan out: run the operation once per compartment OCID in this list, or 'all' for "
+        "the tenancy and every accessible compartment. Overrides params['compartment_id'].",
+    ] = None,
+    regions: Annotated[
+        Optional[Union[List[str], str]],
+        "Fan out: run the operation once per region in this list, or 'all' for every "
+        "subscribed region. Overrides region.",
+    ] = None,
+    fan_out_parallelism: Annotated[
+        Optional[int],
+        "Maximum number of fan-out calls in flight. Capped at 16, and at 8 per region "
+        "since the calls for one region share a service endpoint. Defaults to the cap.",
+    ] = None,
+) -> dict:
+    """
+    Example:
+      client_fqn='oci.core.ComputeClient'
+      operation='list_instances'
+      params={'compartment_id': '<ocid>', 'availability_domain': '...'}
+
+    Without max_items/max_pages, list operations return every record. With a budget,
+    the result carries 'continuation_token' (None once the listing is exhausted).
+
+    With compartment_ids and/or regions, the operation runs concurrently for every
+    compartment x region combination and the rows are merged, each tagged with
+    'fanout': {'compartment_id': ..., 'region': ...}. Failed targets are listed in
+    'errors', and 'parallelism' is the number of calls that were kept in flight.
+    Budgets do not apply to fan-out calls.
+    """
+    if compartment_ids or regions:
+        try:
+            return _fan_out(
+                client_fqn,
+                operation,
+                params or {},
+                compartment_ids,
+                regions,
+                fan_out_parallelism,
+            )
+        except Exception as e:
+            logger.error(f"Error fanning out {client_fqn}.{operation}: {e}")
+            return {
+                "client": client_fqn,
+                "operation": operation,
+                "params": params or {},
+                "error": str(e),
+            }
+    return _invoke_oci_api(
+        client_fqn,
+        operation,
+        params,
+        region,
+        max_items=max_items,
+        max_pages=max_pages,
+        continuation_token=continuation_token,
+    )
+
+
+# invoke_oci_api_batch runs entries on a bounded pool, and at most
+# _BATCH_PER_HOST_LIMIT of them against the same service endpoint at once
+_BATCH_MAX_WORKERS = int(os.getenv("ORACLE_MCP_BATCH_MAX_WORKERS", "16"))
+_BATCH_PER_HOST_LIMIT = int(os.getenv("ORACLE_MCP_BATCH_PER_HOST_LIMIT", "8"))
+_host_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+_host_semaphores_lock = threading.Lock()
+
+
+def _client_host(client: Any, client_fqn: str, region: Optional[str]) -> str:
+    """Returns the service host a client talks to, falling back to its class and region"""
+    endpoint = getattr(getattr(client, "base_client", None), "endpoint", None)
+    if isinstance(endpoint, str) and endpoint:
+        return urlparse(endpoint).netloc or endpoint
+    return f"{client_fqn}@{region or 'default'}"
+
+
+def _host_semaphore(host: str) -> threading.BoundedSemaphore:
+    with _host_semaphores_lock:
+        semaphore = _host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = threading.BoundedSemaphore(max(1, _BATCH_PER_HOST_LIMIT))
+            _host_semaphores[host] = semaphore
+        return semaphore
+
+
+def _invoke_batch_entry(entry: Any) -> dict:
+    if not isinstance(entry, dict):
+        return {"error": "each call must be an object with client_fqn and operation"}
+    client_fqn = entry.get("client_fqn")
+    operation = entry.get("operation")
+    params = entry.get("params") or {}
+    region = entry.get("region")
+    if not isinstance(client_fqn, str) or not isinstance(operation, str):
+        return {
+            "client": client_fqn,
+            "operation": operation,
+            "params": params,
+            "error": "each call must have string client_fqn and operation",
+        }
+    try:
+        # clients come from the shared cache, so entries for the same
+        # client class and region reuse one client and connection pool
+        client = _import_client(client_fqn, region)
+    except Exception as e:
+        logger.error(f"Error resolving client {client_fqn}: {e}")
+        return {
+            "client": client_fqn,
+            "operation": operation,
+            "params": params,
+            "error": str(e),
+        }
+    with _host_semaphore(_client_host(client, client_fqn, region)):
+        return _invoke_oci_api(client_fqn, operation, params, region, client=client)
+
+
+def _fan_out_tenancy() -> Tuple[Any, str]:
+    """Returns an identity client and the tenancy OCID of the configured profile"""
+    identity = _import_client("oci.identity.IdentityClient")
+    return identity, identity.base_client.config["tenancy"]
+
+
+def _resolve_all_compartments() -> List[str]:
+    """The tenancy and every active compartment below it the caller can access"""
+    identity, tenancy = _fan_out_tenancy()
+    compartments = oci.pagination.list_call_get_all_results(
+        identity.list_compartments,
+        compartment_id=tenancy,
+        compartment_id_in_subtree=True,
+        access_level="ACCESSIBLE",
+        lifecycle_state="ACTIVE",
+    ).data
+    return [tenancy] + [c.id for c in compartments]
+
+
+def _resolve_all_regions() -> List[str]:
+    """Every region the tenancy is subscribed to and that is ready for use"""
+    identity, tenancy = _fan_out_tenancy()
+    subscriptions = identity.list_region_subscriptions(tenancy).data
+    return [s.region_name for s in subscriptions if s.status == "READY"]
+
+
+def _fan_out(
+    client_fqn: str,
+    operation: str,
+    params: Dict[str, Any],
+    compartment_ids: Any,
+    regions: Any,
+    parallelism: Optional[int] = None,
+) -> dict:
+    """
+    Run one operation for every (compartment, region) target concurrently and merge
+    the rows. Each row is tagged with a 'fanout' object naming its compartment and
+    region; targets that fail are reported in 'errors' without failing the others.
+    """
+    if compartment_ids == "all":
+        compartment_ids = _resolve_all_compartments()
+    if regions == "all":
+        regions = _resolve_all_regions()
+    if isinstance(compartment_ids, str) or isinstance(regions, str):
+        raise ValueError("compartment_ids and regions must be lists or 'all'")
+    targets = [
+        (compartment_id, region)
+        for compartment_id in (compartment_ids or [params.get("compartment_id")])
+        for region in (regions or [None])
+    ]
+    entries = []
+    for compartment_id, region in targets:
+        target_params = dict(params)
+        if compartment_id is not None:
+            target_params["compartment_id"] = compartment_id
+        entries.append(
+            {
+                "client_fqn": client_fqn,
+                "operation": operation,
+                "params": target_params,
+                "region": region,
+            }
+        )
+    # the calls for one region go to the same endpoint, where at most
+    # _BATCH_PER_HOST_LIMIT run at once, so more workers would only wait
+    cap = min(
+        _BATCH_MAX_WORKERS, max(1, _BATCH_PER_HOST_LIMIT) * len(regions or [None])
+    )
+    workers = max(1, min(parallelism or cap, cap, len(entries) or 1))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(_invoke_batch_entry, entries))
+
+    rows: List[Any] = []
+    errors: List[dict] = []
+    for (compartment_id, region), result in zip(targets, results):
+        tag = {"compartment_id": compartment_id, "region": region}
+        if "error" in result:
+            errors.append({**tag, "error": result["error"]})
+            continue
+        data = result.get("data")
+        for row in data if isinstance(data, list) else [data]:
+            if isinstance(row, dict):
+                rows.append({**row, "fanout": tag})
+            else:
+                rows.append({"value": row, "fanout": tag})
+    logger.info(
+        f"invoke_oci_api fan-out: client={client_fqn} op={operation} "
+        f"targets={len(targets)} rows={len(rows)} errors={len(errors)}"
+    )
+    return {
+        "client": client_fqn,
+        "operation": operation,
+        "params": params,
+        "targets": len(targets),
+        "parallelism": workers,
+        "data": rows,
+        "errors": errors,
+    }
+
+
+@mcp.tool(
+    description="Invoke several independent OCI Python SDK operations concurrently. "
+    "Results and errors are returned per call, in input order."
+)
+def invoke_oci_api_batch(
+    calls: Annotated[
+        List[Dict[str, Any]],
+        "Calls to make, each {'client_fqn': ..., 'operation': ..., 'params': {...}} "
+        "with an optional 'region'.",
+    ],
+    max_workers: Annotated[
+        Optional[int],
+        "Maximum number of calls in flight. Defaults to 16.",
+    ] = None,
+) -> dict:
+    """
+    Example:
+      calls=[
+        {'client_fqn': 'oci.core.ComputeClient', 'operation': 'get_instance',
+         'params': {'instance_id': '<ocid1>'}},
+        {'client_fqn': 'oci.core.ComputeClient', 'operation': 'get_instance',
+         'params': {'instance_id': '<ocid2>'}},
+      ]
+    """
+    calls = calls or []
+    workers = max(1, min(max_workers or _BATCH_MAX_WORKERS, _BATCH_MAX_WORKERS))
+    if len(calls) <= 1:
+        results = [_invoke_batch_entry(entry) for entry in calls]
+    else:
+        with ThreadPoolExecutor(max_workers=min(workers, len(calls))) as executor:
+            results = list(executor.map(_invoke_batch_entry, calls))
+    failed = sum(1 for result in results if "error" in result)
+    logger.info(
+        f"invoke_oci_api_batch: calls={len(calls)} succeeded={len(calls) - failed} failed={failed}"
+    )
+    return {"results": results, "succeeded": len(calls) - failed, "failed": failed}
+
+
 @mcp.tool(description="List public callable operations for a given OCI client class.")
 def list_client_operations(
     client_fqn: Annotated[
@@ -653,6 +1490,21 @@ def list_client_operations(
         raise
 
 
+@mcp.tool(
+    description="Evict cached OCI SDK clients so the next invocation rebuilds them "
+    "with freshly loaded configuration and credentials."
+)
+def evict_oci_clients(
+    client_fqn: Annotated[
+        Optional[str],
+        "Only evict clients of this class, e.g. 'oci.core.ComputeClient'. Evicts all when omitted.",
+    ] = None,
+) -> dict:
+    evicted = _evict_clients(client_fqn)
+    logger.info(f"Evicted {evicted} cached OCI client(s)")
+    return {"evicted": evicted, "cached": len(_client_cache)}
+
+
 def main():
     host = os.getenv("ORACLE_MCP_HOST")
     port = os.getenv("ORACLE_MCP_PORT")
@@ -0,0 +1,47 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from fastmcp import Client
+from oracle.oci_cloud_mcp_server import server
+from oracle.oci_mcp_common.audit import AuditMiddleware
+
+
+class TestAuditMiddleware:
+    @pytest.mark.asyncio
+    async def test_tool_calls_are_audited(self, monkeypatch):
+        logger = MagicMock()
+        middleware = AuditMiddleware(logger)
+        server.mcp.add_middleware(middleware)
+        results = iter(
+            [
+                {"data": [], "opc_request_id": "REQ-1"},
+                {"error": "Operation 'nope' not found on client 'x.y.FakeClient'"},
+            ]
+        )
+        monkeypatch.setattr(server, "_invoke_oci_api", lambda *a, **kw: next(results))
+        try:
+            async with Client(server.mcp) as client:
+                for operation in ("list_things", "nope"):
+                    await client.call_tool(
+                        "invoke_oci_api",
+                        {"client_fqn": "x.y.FakeClient", "operation": operation},
+                    )
+                with pytest.raises(Exception):
+                    await client.call_tool("invoke_oci_api", {})
+        finally:
+            server.mcp.middleware.remove(middleware)
+
+        audits = [call.kwargs["extra"]["audit"] for call in logger.info.call_args_list]
+        assert [audit["tool"] for audit in audits] == ["invoke_oci_api"] * 3
+        assert audits[0]["outcome"] == "success"
+        assert audits[0]["opc_request_id"] == "REQ-1"
+        assert audits[1]["outcome"] == "error"
+        assert audits[1]["opc_request_id"] is None
+        assert audits[2]["outcome"] == "exception"
+        assert all(audit["duration_ms"] >= 0 for audit in audits)
@@ -0,0 +1,126 @@
+"""
+Tests for the concurrent invoke_oci_api_batch tool.
+Copyright (c) 2026, Oracle
+Licensed under the UPL v1.0 https://oss.oracle.com/licenses/upl
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from types import SimpleNamespace
+
+import pytest
+from fastmcp import Client
+from oracle.oci_cloud_mcp_server import server
+from oracle.oci_cloud_mcp_server.server import _client_host, mcp
+
+
+class Tracker:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def __enter__(self):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+
+    def __exit__(self, *exc):
+        with self.lock:
+            self.active -= 1
+
+
+@pytest.fixture
+def fake_client(monkeypatch):
+    tracker = Tracker()
+
+    class FakeClient:
+        def __init__(self, config, signer=None):
+            region = config.get("region") or "us-ashburn-1"
+            self.base_client = SimpleNamespace(
+                endpoint=f"https://iaas.{region}.oraclecloud.com"
+            )
+
+        def get_thing(self, thing_id):
+            with tracker:
+                # later entries finish first, so ordering must not depend on timing
+                time.sleep(0.01 * (5 - int(thing_id) % 5))
+            if thing_id == "3":
+                raise RuntimeError("thing 3 is gone")
+            return SimpleNamespace(data={"id": thing_id}, headers={})
+
+    monkeypatch.setattr(server, "_client_cache", OrderedDict())
+    monkeypatch.setattr(server, "_host_semaphores", {})
+    monkeypatch.setattr(
+        server, "import_module", lambda name: SimpleNamespace(FakeClient=FakeClient)
+    )
+    monkeypatch.setattr(server, "_get_config_and_signer", lambda: ({}, object()))
+    return tracker
+
+
+def _get(thing_id, **extra):
+    return {
+        "client_fqn": "x.y.FakeClient",
+        "operation": "get_thing",
+        "params": {"thing_id": thing_id},
+        **extra,
+    }
+
+
+class TestInvokeBatch:
+    @pytest.mark.asyncio
+    async def test_results_in_input_order_with_errors(self, fake_client):
+        calls = [_get(str(i)) for i in range(6)] + [
+            {"client_fqn": "x.y.FakeClient"},
+            _get("9") | {"operation": "missing_op"},
+        ]
+
+        async with Client(mcp) as client:
+            result = (
+                await client.call_tool("invoke_oci_api_batch", {"calls": calls})
+            ).data
+
+        results = result["results"]
+        assert [r.get("data") for r in results[:6]] == [
+            {"id": "0"},
+            {"id": "1"},
+            {"id": "2"},
+            None,
+            {"id": "4"},
+            {"id": "5"},
+        ]
+        assert "thing 3 is gone" in results[3]["error"]
+        assert "client_fqn and operation" in results[6]["error"]
+        assert "missing_op" in results[7]["error"]
+        assert result["succeeded"] == 5
+        assert result["failed"] == 3
+
+    @pytest.mark.asyncio
+    async def test_per_host_limit(self, fake_client, monkeypatch):
+        monkeypatch.setattr(server, "_BATCH_PER_HOST_LIMIT", 2)
+        calls = [_get(str(i)) for i in range(8)]
+
+        async with Client(mcp) as client:
+            await client.call_tool(
+                "invoke_oci_api_batch", {"calls": calls, "max_workers": 8}
+            )
+
+        assert fake_client.peak == 2
+
+    @pytest.mark.asyncio
+    async def test_hosts_are_limited_independently(self, fake_client, monkeypatch):
+        monkeypatch.setattr(server, "_BATCH_PER_HOST_LIMIT", 1)
+        calls = [_get("0", region="r1"), _get("1", region="r2")]
+
+        async with Client(mcp) as client:
+            await client.call_tool("invoke_oci_api_batch", {"calls": calls})
+
+        assert fake_client.peak == 2
+
+    def test_client_host_fallback(self):
+        assert _client_host(object(), "x.y.C", None) == "x.y.C@default"
+        client = SimpleNamespace(
+            base_client=SimpleNamespace(endpoint="https://iaas.r1.oraclecloud.com")
+        )
+        assert _client_host(client, "x.y.C", "r1") == "iaas.r1.oraclecloud.com"
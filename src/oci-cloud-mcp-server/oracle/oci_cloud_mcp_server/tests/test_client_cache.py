@@ -0,0 +1,178 @@
+"""
+Tests for the SDK client instance cache used by invoke_oci_api.
+Copyright (c) 2026, Oracle
+Licensed under the UPL v1.0 https://oss.oracle.com/licenses/upl
+"""
+
+import os
+import time
+from collections import OrderedDict
+from types import SimpleNamespace
+
+import oci
+import pytest
+from fastmcp import Client
+from oracle.oci_cloud_mcp_server import server
+from oracle.oci_cloud_mcp_server.server import _import_client, mcp
+
+
+class FakeClient:
+    def __init__(self, config, signer=None):
+        self.config = config
+        self.signer = signer
+
+
+class OtherClient(FakeClient):
+    pass
+
+
+@pytest.fixture
+def credentials(tmp_path, monkeypatch):
+    config_file = tmp_path / "config"
+    key_file = tmp_path / "key.pem"
+    token_file = tmp_path / "token"
+    config_file.write_text("[DEFAULT]")
+    key_file.write_text("key")
+    token_file.write_text("token")
+    for path in (config_file, key_file, token_file):
+        _set_age(path, 60)
+    calls = []
+
+    def fake_config_and_signer():
+        calls.append(1)
+        return (
+            {
+                "key_file": str(key_file),
+                "security_token_file": str(token_file),
+                "region": "us-ashburn-1",
+            },
+            object(),
+        )
+
+    monkeypatch.delenv("OCI_CONFIG_PROFILE", raising=False)
+    monkeypatch.setenv("OCI_CONFIG_FILE", str(config_file))
+    monkeypatch.setattr(server, "_client_cache", OrderedDict())
+    monkeypatch.setattr(
+        server,
+        "import_module",
+        lambda name: SimpleNamespace(FakeClient=FakeClient, OtherClient=OtherClient),
+    )
+    monkeypatch.setattr(server, "_get_config_and_signer", fake_config_and_signer)
+    return SimpleNamespace(config_file=config_file, token_file=token_file, calls=calls)
+
+
+def _set_age(path, seconds):
+    mtime_ns = time.time_ns() - seconds * 1_000_000_000
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class TestClientCache:
+    def test_reuses_client_until_token_changes(self, credentials):
+        first = _import_client("x.y.FakeClient")
+        second = _import_client("x.y.FakeClient")
+
+        assert first is second
+        assert len(credentials.calls) == 1
+
+        _set_age(credentials.token_file, 30)
+        third = _import_client("x.y.FakeClient")
+
+        assert third is not first
+        assert len(credentials.calls) == 2
+
+    def test_reuses_client_until_config_changes(self, credentials):
+        first = _import_client("x.y.FakeClient")
+
+        _set_age(credentials.config_file, 30)
+
+        assert _import_client("x.y.FakeClient") is not first
+        assert len(credentials.calls) == 2
+
+    def test_missing_config_file_is_not_cached(self, credentials):
+        credentials.config_file.unlink()
+
+        assert _import_client("x.y.FakeClient") is not _import_client("x.y.FakeClient")
+        assert len(server._client_cache) == 0
+
+    def test_just_written_files_are_not_cached(self, credentials):
+        credentials.token_file.write_text("refreshed")
+
+        assert _import_client("x.y.FakeClient") is not _import_client("x.y.FakeClient")
+        assert len(server._client_cache) == 0
+
+    def test_config_file_is_part_of_the_key(self, credentials, monkeypatch):
+        first = _import_client("x.y.FakeClient")
+        other_config = credentials.config_file.with_name("other")
+        other_config.write_text("[DEFAULT]")
+        _set_age(other_config, 60)
+        monkeypatch.setenv("OCI_CONFIG_FILE", str(other_config))
+
+        assert _import_client("x.y.FakeClient") is not first
+        assert len(server._client_cache) == 2
+
+    def test_config_is_loaded_from_the_watched_file(self, monkeypatch):
+        loaded = []
+
+        def from_file(file_location, profile_name):
+            loaded.append(file_location)
+            raise oci.exceptions.ConfigFileNotFound()
+
+        monkeypatch.setenv("OCI_CONFIG_FILE", "/tmp/oci-config")
+        monkeypatch.setattr(server.oci.config, "from_file", from_file)
+
+        with pytest.raises(oci.exceptions.ConfigFileNotFound):
+            server._get_config_and_signer()
+        assert loaded == ["/tmp/oci-config"]
+
+    def test_region_is_part_of_the_key(self, credentials):
+        default = _import_client("x.y.FakeClient")
+        regional = _import_client("x.y.FakeClient", "eu-frankfurt-1")
+
+        assert default is not regional
+        assert default.config["region"] == "us-ashburn-1"
+        assert regional.config["region"] == "eu-frankfurt-1"
+        assert _import_client("x.y.FakeClient", "eu-frankfurt-1") is regional
+
+    def test_cache_is_bounded(self, credentials, monkeypatch):
+        monkeypatch.setattr(server, "_CLIENT_CACHE_SIZE", 2)
+
+        first = _import_client("x.y.FakeClient", "r1")
+        _import_client("x.y.FakeClient", "r2")
+        _import_client("x.y.FakeClient", "r1")  # r1 becomes most recently used
+        _import_client("x.y.FakeClient", "r3")  # evicts r2
+
+        config_file = str(credentials.config_file)
+        assert list(server._client_cache) == [
+            ("x.y.FakeClient", config_file, "DEFAULT", "r1"),
+            ("x.y.FakeClient", config_file, "DEFAULT", "r3"),
+        ]
+        assert _import_client("x.y.FakeClient", "r1") is first
+
+    def test_config_without_key_file_is_not_cached(self, monkeypatch):
+        monkeypatch.setattr(server, "_client_cache", OrderedDict())
+        monkeypatch.setattr(
+            server,
+            "import_module",
+            lambda name: SimpleNamespace(FakeClient=FakeClient),
+        )
+        monkeypatch.setattr(server, "_get_config_and_signer", lambda: ({}, object()))
+
+        assert _import_client("x.y.FakeClient") is not _import_client("x.y.FakeClient")
+        assert len(server._client_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_evict_oci_clients_tool(self, credentials):
+        _import_client("x.y.FakeClient", "r1")
+        _import_client("x.y.FakeClient", "r2")
+        _import_client("x.y.OtherClient", "r1")
+
+        async with Client(mcp) as client:
+            result = (
+                await client.call_tool(
+                    "evict_oci_clients", {"client_fqn": "x.y.OtherClient"}
+                )
+            ).data
+            assert result == {"evicted": 1, "cached": 2}
+
+            result = (await client.call_tool("evict_oci_clients", {})).data
+            assert result == {"evicted": 2, "cached": 0}
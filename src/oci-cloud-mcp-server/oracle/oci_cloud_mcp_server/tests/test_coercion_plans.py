@@ -0,0 +1,137 @@
+"""
+Tests for the compiled model-coercion plans used by invoke_oci_api.
+Copyright (c) 2026, Oracle
+Licensed under the UPL v1.0 https://oss.oracle.com/licenses/upl
+"""
+
+import importlib
+from collections import OrderedDict
+from types import SimpleNamespace
+
+import oci
+import pytest
+from fastmcp import Client
+from oracle.oci_cloud_mcp_server import server
+from oracle.oci_cloud_mcp_server.server import _coerce_params_with_plan, mcp
+
+LAUNCH_TYPES = {"launch_instance_details": "oci.core.models.LaunchInstanceDetails"}
+
+
+@pytest.fixture(autouse=True)
+def fresh_plans(monkeypatch):
+    monkeypatch.setattr(server, "_model_plans", {})
+    monkeypatch.setattr(server, "_operation_plans", {})
+
+
+def _launch_payload(**overrides):
+    details = {
+        "compartment_id": "ocid1.compartment",
+        "availability_domain": "AD-1",
+        "shape": "VM.Standard.E4.Flex",
+        "shape_config": {"ocpus": 2, "memory_in_gbs": 16},
+        "source_details": {"source_type": "image", "image_id": "ocid1.image"},
+        "create_vnic_details": {"subnet_id": "ocid1.subnet"},
+        "launch_volume_attachments": [{"type": "paravirtualized"}],
+        "metadata": {"ssh_authorized_keys": "ssh-rsa AAAA"},
+        "defined_tags": {"ns": {"key": "value"}},
+    }
+    details.update(overrides)
+    return {"launch_instance_details": details}
+
+
+class TestCoercionPlans:
+    def test_builds_nested_and_polymorphic_models(self):
+        out = _coerce_params_with_plan(
+            "oci.core.ComputeClient", "launch_instance", _launch_payload(), LAUNCH_TYPES
+        )
+        details = out["launch_instance_details"]
+
+        models = oci.core.models
+        assert isinstance(details, models.LaunchInstanceDetails)
+        assert isinstance(details.shape_config, models.LaunchInstanceShapeConfigDetails)
+        assert isinstance(details.source_details, models.InstanceSourceViaImageDetails)
+        assert details.source_details.image_id == "ocid1.image"
+        assert isinstance(details.create_vnic_details, models.CreateVnicDetails)
+        assert isinstance(
+            details.launch_volume_attachments[0],
+            models.LaunchAttachParavirtualizedVolumeDetails,
+        )
+        # free-form maps are passed through untouched
+        assert details.metadata == {"ssh_authorized_keys": "ssh-rsa AAAA"}
+        assert details.defined_tags == {"ns": {"key": "value"}}
+
+    def test_unknown_attribute_falls_back_to_heuristics(self):
+        params = _launch_payload(not_a_field=1)
+        out = _coerce_params_with_plan(
+            "oci.core.ComputeClient", "launch_instance", params, LAUNCH_TYPES
+        )
+        assert out["launch_instance_details"] is params["launch_instance_details"]
+
+    def test_model_hints_fall_back_to_heuristics(self):
+        params = _launch_payload(
+            source_details={"__model": "InstanceSourceViaImageDetails"}
+        )
+        out = _coerce_params_with_plan(
+            "oci.core.ComputeClient", "launch_instance", params, LAUNCH_TYPES
+        )
+        assert isinstance(out["launch_instance_details"], dict)
+
+    def test_plans_are_compiled_once(self, monkeypatch):
+        _coerce_params_with_plan(
+            "oci.core.ComputeClient", "launch_instance", _launch_payload(), LAUNCH_TYPES
+        )
+
+        def boom(*args, **kwargs):
+            raise AssertionError("plans should be cached")
+
+        monkeypatch.setattr(server, "_compile_type_converter", boom)
+        out = _coerce_params_with_plan(
+            "oci.core.ComputeClient", "launch_instance", _launch_payload(), LAUNCH_TYPES
+        )
+        assert isinstance(
+            out["launch_instance_details"].source_details,
+            oci.core.models.InstanceSourceViaImageDetails,
+        )
+
+    @pytest.mark.asyncio
+    async def test_invoke_uses_documented_model_type(self, monkeypatch):
+        received = {}
+
+        class FakeClient:
+            def __init__(self, config, signer=None):
+                pass
+
+            def launch_instance(self, launch_instance_details, **kwargs):
+                """
+                :param oci.core.models.LaunchInstanceDetails launch_instance_details: (required)
+                """  # noqa: E501
+                received["details"] = launch_instance_details
+                return SimpleNamespace(data={"ok": True}, headers={})
+
+        def fake_import(name):
+            if name == "x.y":
+                return SimpleNamespace(FakeClient=FakeClient)
+            return importlib.import_module(name)
+
+        monkeypatch.setattr(server, "_client_cache", OrderedDict())
+        monkeypatch.setattr(server, "_operation_index", {})
+        monkeypatch.setattr(server, "import_module", fake_import)
+        monkeypatch.setattr(server, "_get_config_and_signer", lambda: ({}, object()))
+
+        async with Client(mcp) as client:
+            result = (
+                await client.call_tool(
+                    "invoke_oci_api",
+                    {
+                        "client_fqn": "x.y.FakeClient",
+                        "operation": "launch_instance",
+                        "params": _launch_payload(),
+                    },
+                )
+            ).data
+
+        assert result["data"] == {"ok": True}
+        assert isinstance(
+            received["details"].source_details,
+            oci.core.models.InstanceSourceViaImageDetails,
+        )
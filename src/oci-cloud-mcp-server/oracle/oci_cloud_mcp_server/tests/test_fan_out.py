@@ -0,0 +1,135 @@
+"""
+Tests for multi-compartment and multi-region fan-out in invoke_oci_api.
+Copyright (c) 2026, Oracle
+Licensed under the UPL v1.0 https://oss.oracle.com/licenses/upl
+"""
+
+from collections import OrderedDict
+from types import SimpleNamespace
+
+import pytest
+from fastmcp import Client
+from oracle.oci_cloud_mcp_server import server
+from oracle.oci_cloud_mcp_server.server import mcp
+
+
+@pytest.fixture
+def fake_client(monkeypatch):
+    class FakeClient:
+        def __init__(self, config, signer=None):
+            self.region = config.get("region", "home")
+
+        def list_things(self, compartment_id):
+            if compartment_id == "broken":
+                raise RuntimeError("not authorized")
+            return SimpleNamespace(
+                data=[{"id": f"{compartment_id}/{self.region}"}], headers={}
+            )
+
+    monkeypatch.setattr(server, "_client_cache", OrderedDict())
+    monkeypatch.setattr(server, "_operation_index", {})
+    monkeypatch.setattr(server, "_host_semaphores", {})
+    monkeypatch.setattr(
+        server, "import_module", lambda name: SimpleNamespace(FakeClient=FakeClient)
+    )
+    monkeypatch.setattr(
+        server.oci.pagination,
+        "list_call_get_all_results",
+        lambda method, **kwargs: method(**kwargs),
+    )
+    monkeypatch.setattr(server, "_get_config_and_signer", lambda: ({}, object()))
+
+
+async def _invoke(**args):
+    async with Client(mcp) as client:
+        return (
+            await client.call_tool(
+                "invoke_oci_api",
+                {"client_fqn": "x.y.FakeClient", "operation": "list_things", **args},
+            )
+        ).data
+
+
+class TestFanOut:
+    @pytest.mark.asyncio
+    async def test_compartments_by_regions_are_merged_and_tagged(self, fake_client):
+        result = await _invoke(
+            params={"compartment_id": "ignored"},
+            compartment_ids=["c1", "c2"],
+            regions=["r1", "r2"],
+            fan_out_parallelism=2,
+        )
+
+        assert result["targets"] == 4
+        assert result["errors"] == []
+        assert [row["id"] for row in result["data"]] == [
+            "c1/r1",
+            "c1/r2",
+            "c2/r1",
+            "c2/r2",
+        ]
+        assert result["data"][1]["fanout"] == {"compartment_id": "c1", "region": "r2"}
+
+    @pytest.mark.asyncio
+    async def test_parallelism_is_capped_per_region(self, fake_client, monkeypatch):
+        monkeypatch.setattr(server, "_BATCH_MAX_WORKERS", 16)
+        monkeypatch.setattr(server, "_BATCH_PER_HOST_LIMIT", 8)
+        compartment_ids = [f"c{i}" for i in range(20)]
+
+        one_region = await _invoke(params={}, compartment_ids=compartment_ids)
+        three_regions = await _invoke(
+            params={},
+            compartment_ids=compartment_ids,
+            regions=["r1", "r2", "r3"],
+            fan_out_parallelism=32,
+        )
+        requested = await _invoke(
+            params={}, compartment_ids=compartment_ids, fan_out_parallelism=4
+        )
+
+        assert one_region["parallelism"] == 8
+        assert three_regions["parallelism"] == 16
+        assert requested["parallelism"] == 4
+
+    @pytest.mark.asyncio
+    async def test_failing_target_is_isolated(self, fake_client):
+        result = await _invoke(params={}, compartment_ids=["c1", "broken"])
+
+        assert [row["id"] for row in result["data"]] == ["c1/home"]
+        assert result["errors"] == [
+            {"compartment_id": "broken", "region": None, "error": "not authorized"}
+        ]
+
+    @pytest.mark.asyncio
+    async def test_all_is_resolved_from_identity(self, fake_client, monkeypatch):
+        identity = SimpleNamespace(
+            list_compartments=lambda **kwargs: SimpleNamespace(
+                data=[SimpleNamespace(id="child")]
+            ),
+            list_region_subscriptions=lambda tenancy: SimpleNamespace(
+                data=[
+                    SimpleNamespace(region_name="r1", status="READY"),
+                    SimpleNamespace(region_name="r2", status="IN_PROGRESS"),
+                ]
+            ),
+        )
+        monkeypatch.setattr(server, "_fan_out_tenancy", lambda: (identity, "tenancy"))
+
+        result = await _invoke(params={}, compartment_ids="all", regions="all")
+
+        assert [row["id"] for row in result["data"]] == ["tenancy/r1", "child/r1"]
+
+    def test_tenancy_comes_from_the_cached_client(self, fake_client, monkeypatch):
+        identity = SimpleNamespace(
+            base_client=SimpleNamespace(config={"tenancy": "ocid1.tenancy"})
+        )
+        monkeypatch.setattr(server, "_import_client", lambda client_fqn: identity)
+        monkeypatch.setattr(server, "_get_config_and_signer", pytest.fail)
+
+        assert server._fan_out_tenancy() == (identity, "ocid1.tenancy")
+
+    @pytest.mark.asyncio
+    async def test_invalid_target_spec_is_reported(self, fake_client):
+        result = await _invoke(params={}, regions="us-ashburn-1")
+
+        assert "must be lists or 'all'" in result["error"]
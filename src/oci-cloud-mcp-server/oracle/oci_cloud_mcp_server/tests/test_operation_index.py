@@ -0,0 +1,131 @@
+"""
+Tests for the memoized operation-introspection index.
+Copyright (c) 2026, Oracle
+Licensed under the UPL v1.0 https://oss.oracle.com/licenses/upl
+"""
+
+import json
+import os
+from types import MethodType
+
+import oci
+import pytest
+from oracle.oci_cloud_mcp_server import server
+from oracle.oci_cloud_mcp_server.server import _get_operation_info
+
+
+@pytest.fixture
+def fresh_index(monkeypatch):
+    monkeypatch.setattr(server, "_operation_index", {})
+    monkeypatch.setattr(server, "_persisted_operations", None)
+    monkeypatch.delenv("ORACLE_MCP_INTROSPECTION_CACHE_DIR", raising=False)
+
+
+def _bound(cls, operation):
+    return MethodType(getattr(cls, operation), object())
+
+
+class TestOperationIndex:
+    def test_record_for_sdk_operation(self, fresh_index):
+        cls = oci.core.ComputeClient
+        info = _get_operation_info(
+            cls, "launch_instance", _bound(cls, "launch_instance")
+        )
+
+        assert info["paginated"] is False
+        assert info["params"] == ["launch_instance_details"]
+        assert info["required"] == ["launch_instance_details"]
+        assert "opc_retry_token" in info["expected_kwargs"]
+        assert info["model_types"] == {
+            "launch_instance_details": "oci.core.models.LaunchInstanceDetails"
+        }
+
+        listing = _get_operation_info(
+            cls, "list_instances", _bound(cls, "list_instances")
+        )
+        assert listing["paginated"] is True
+        assert listing["required"] == ["compartment_id"]
+        assert {"page", "limit"} <= set(listing["expected_kwargs"])
+
+    def test_record_is_built_once(self, fresh_index, monkeypatch):
+        class FakeClient:
+            def get_thing(self, thing_id):
+                """:param str thing_id: (required)"""
+
+        method = FakeClient().get_thing
+        first = _get_operation_info(FakeClient, "get_thing", method)
+
+        def boom(*args, **kwargs):
+            raise AssertionError("introspection should be memoized")
+
+        monkeypatch.setattr(server, "_build_operation_info", boom)
+        assert _get_operation_info(FakeClient, "get_thing", method) is first
+        assert first["required"] == ["thing_id"]
+        assert first["paginated"] is False
+
+    def test_records_persist_per_sdk_version(self, fresh_index, monkeypatch, tmp_path):
+        monkeypatch.setenv("ORACLE_MCP_INTROSPECTION_CACHE_DIR", str(tmp_path))
+        cls = oci.core.ComputeClient
+        built = _get_operation_info(cls, "get_instance", _bound(cls, "get_instance"))
+
+        cache_file = tmp_path / f"oci-{oci.__version__}-operations.jsonl"
+        assert os.path.exists(cache_file)
+        with open(cache_file) as f:
+            assert [json.loads(line)["operation"] for line in f] == [
+                "oci.core.compute_client.ComputeClient.get_instance"
+            ]
+
+        # a new process (empty in-memory index) is served from disk
+        monkeypatch.setattr(server, "_operation_index", {})
+        monkeypatch.setattr(server, "_persisted_operations", None)
+
+        def boom(*args, **kwargs):
+            raise AssertionError("should be loaded from the disk cache")
+
+        monkeypatch.setattr(server, "_build_operation_info", boom)
+        loaded = _get_operation_info(cls, "get_instance", _bound(cls, "get_instance"))
+        assert loaded == built
+
+    def test_unreadable_cache_file_is_ignored(self, fresh_index, monkeypatch, tmp_path):
+        monkeypatch.setenv("ORACLE_MCP_INTROSPECTION_CACHE_DIR", str(tmp_path))
+        (tmp_path / f"oci-{oci.__version__}-operations.jsonl").write_text("{not json")
+        cls = oci.core.ComputeClient
+
+        info = _get_operation_info(cls, "get_instance", _bound(cls, "get_instance"))
+        assert info["required"] == ["instance_id"]
+
+    def test_new_records_are_appended(self, fresh_index, monkeypatch, tmp_path):
+        monkeypatch.setenv("ORACLE_MCP_INTROSPECTION_CACHE_DIR", str(tmp_path))
+        cache_file = tmp_path / f"oci-{oci.__version__}-operations.jsonl"
+        cls = oci.core.ComputeClient
+        build = server._build_operation_info
+
+        def build_unlocked(method, operation_name):
+            assert not server._operation_index_lock.locked()
+            return build(method, operation_name)
+
+        monkeypatch.setattr(server, "_build_operation_info", build_unlocked)
+        _get_operation_info(cls, "get_instance", _bound(cls, "get_instance"))
+        first_line = cache_file.read_text()
+        _get_operation_info(cls, "list_instances", _bound(cls, "list_instances"))
+        _get_operation_info(cls, "get_instance", _bound(cls, "get_instance"))
+
+        lines = cache_file.read_text().splitlines()
+        assert cache_file.read_text().startswith(first_line)
+        assert [json.loads(line)["operation"] for line in lines] == [
+            "oci.core.compute_client.ComputeClient.get_instance",
+            "oci.core.compute_client.ComputeClient.list_instances",
+        ]
+
+    def test_non_sdk_clients_are_not_persisted(
+        self, fresh_index, monkeypatch, tmp_path
+    ):
+        monkeypatch.setenv("ORACLE_MCP_INTROSPECTION_CACHE_DIR", str(tmp_path))
+
+        class FakeClient:
+            def list_things(self, compartment_id):
+                return []
+
+        info = _get_operation_info(FakeClient, "list_things", FakeClient().list_things)
+        assert info["paginated"] is True
+        assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,122 @@
+"""
+Tests for bounded, resumable pagination of list operations.
+Copyright (c) 2026, Oracle
+Licensed under the UPL v1.0 https://oss.oracle.com/licenses/upl
+"""
+
+from collections import OrderedDict
+from types import SimpleNamespace
+
+import pytest
+from fastmcp import Client
+from oracle.oci_cloud_mcp_server import server
+from oracle.oci_cloud_mcp_server.server import _call_with_page_budget, mcp
+
+RECORDS = [{"id": i} for i in range(25)]
+
+
+class FakeListing:
+    """Serves RECORDS in pages of `limit` (default 10) with positional page tokens"""
+
+    def __init__(self, collection=False):
+        self.calls = []
+        self.collection = collection
+
+    def __call__(self, compartment_id, page=None, limit=10):
+        self.calls.append({"page": page, "limit": limit})
+        start = int(page or 0)
+        end = start + limit
+        data = RECORDS[start:end]
+        next_page = str(end) if end < len(RECORDS) else None
+        if self.collection:
+            data = SimpleNamespace(items=data)
+        return SimpleNamespace(
+            data=data, next_page=next_page, headers={"opc-request-id": "req-1"}
+        )
+
+
+class TestPageBudget:
+    def test_resumes_without_gaps_or_duplicates(self):
+        listing = FakeListing()
+        params = {"compartment_id": "c", "limit": 10}
+        collected, token, rounds = [], None, 0
+        while True:
+            records, opc, token = _call_with_page_budget(
+                listing, params, max_items=7, continuation_token=token
+            )
+            collected.extend(records)
+            rounds += 1
+            if token is None:
+                break
+            assert len(records) == 7
+
+        assert collected == RECORDS
+        assert rounds == 4
+        assert opc == "req-1"
+
+    def test_max_pages_stops_at_page_boundary(self):
+        listing = FakeListing(collection=True)
+
+        records, _, token = _call_with_page_budget(
+            listing, {"compartment_id": "c"}, max_pages=2
+        )
+        assert records == RECORDS[:20]
+        assert len(listing.calls) == 2
+
+        rest, _, token = _call_with_page_budget(
+            listing, {"compartment_id": "c"}, max_pages=2, continuation_token=token
+        )
+        assert rest == RECORDS[20:]
+        assert token is None
+
+    def test_limit_is_capped_by_remaining_budget(self):
+        listing = FakeListing()
+
+        records, _, token = _call_with_page_budget(
+            listing, {"compartment_id": "c"}, max_items=3
+        )
+
+        assert records == RECORDS[:3]
+        assert listing.calls == [{"page": None, "limit": 3}]
+        assert token is not None
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"max_items": 0}, {"max_pages": -1}, {"continuation_token": "not-a-token"}],
+    )
+    def test_rejects_invalid_budget(self, kwargs):
+        with pytest.raises(ValueError):
+            _call_with_page_budget(FakeListing(), {"compartment_id": "c"}, **kwargs)
+
+    @pytest.mark.asyncio
+    async def test_invoke_oci_api_returns_continuation_token(self, monkeypatch):
+        listing = FakeListing()
+
+        class FakeClient:
+            def __init__(self, config, signer=None):
+                pass
+
+            def list_things(self, compartment_id, **kwargs):
+                return listing(compartment_id, **kwargs)
+
+        monkeypatch.setattr(server, "_client_cache", OrderedDict())
+        monkeypatch.setattr(server, "_operation_index", {})
+        monkeypatch.setattr(
+            server, "import_module", lambda name: SimpleNamespace(FakeClient=FakeClient)
+        )
+        monkeypatch.setattr(server, "_get_config_and_signer", lambda: ({}, object()))
+        args = {
+            "client_fqn": "x.y.FakeClient",
+            "operation": "list_things",
+            "params": {"compartment_id": "c", "limit": 10},
+            "max_items": 15,
+        }
+
+        async with Client(mcp) as client:
+            first = (await client.call_tool("invoke_oci_api", args)).data
+            args["continuation_token"] = first["continuation_token"]
+            second = (await client.call_tool("invoke_oci_api", args)).data
+
+        assert first["data"] == RECORDS[:15]
+        assert second["data"] == RECORDS[15:]
+        assert second["continuation_token"] is None
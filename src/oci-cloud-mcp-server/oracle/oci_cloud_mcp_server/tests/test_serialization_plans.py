@@ -0,0 +1,84 @@
+"""
+Tests for the plan-based serializer of OCI SDK responses.
+Copyright (c) 2026, Oracle
+Licensed under the UPL v1.0 https://oss.oracle.com/licenses/upl
+"""
+
+import datetime
+import enum
+
+import oci
+import pytest
+from oracle.oci_cloud_mcp_server import server
+from oracle.oci_cloud_mcp_server.server import _serialize_oci_data
+
+
+@pytest.fixture(autouse=True)
+def fresh_plans(monkeypatch):
+    monkeypatch.setattr(server, "_serialization_plans", {})
+
+
+def _instance(**overrides):
+    fields = dict(
+        id="ocid1.instance",
+        lifecycle_state="RUNNING",
+        time_created=datetime.datetime(2026, 1, 2, 3, 4, 5),
+        shape_config=oci.core.models.InstanceShapeConfig(ocpus=2.0),
+        source_details=oci.core.models.InstanceSourceViaImageDetails(
+            image_id="ocid1.image"
+        ),
+        defined_tags={"ns": {"key": "value"}},
+    )
+    fields.update(overrides)
+    return oci.core.models.Instance(**fields)
+
+
+class Color(enum.Enum):
+    RED = "red"
+
+
+class TestSerializationPlans:
+    def test_matches_oci_to_dict(self):
+        data = [_instance(), _instance(id="ocid1.other", time_created=None)]
+
+        out = _serialize_oci_data(data)
+
+        assert out == oci.util.to_dict(data)
+        assert out[0]["time_created"] == "2026-01-02T03:04:05+00:00"
+        assert out[0]["source_details"]["image_id"] == "ocid1.image"
+
+    def test_skips_unset_attributes(self):
+        instance = _instance()
+        del instance._shape_config
+
+        out = _serialize_oci_data(instance)
+
+        assert "shape_config" not in out
+        assert out == oci.util.to_dict(instance)
+
+    def test_field_plan_is_cached_per_class(self):
+        _serialize_oci_data([_instance(), _instance()])
+
+        assert "id" in server._serialization_plans[oci.core.models.Instance]
+        assert oci.core.models.InstanceSourceViaImageDetails in (
+            server._serialization_plans
+        )
+
+    def test_native_scalars(self):
+        aware = datetime.datetime(
+            2026, 1, 1, tzinfo=datetime.timezone(datetime.timedelta(hours=2))
+        )
+        data = {
+            "date": datetime.date(2026, 1, 1),
+            "aware": aware,
+            "enum": Color.RED,
+            "sentinel": oci.util.NONE_SENTINEL,
+        }
+        expected = {
+            "date": "2026-01-01",
+            "aware": "2026-01-01T00:00:00+02:00",
+            "enum": "red",
+            "sentinel": None,
+        }
+
+        assert _serialize_oci_data(data) == expected
@@ -24,6 +24,7 @@ from oracle.oci_compute_instance_agent_mcp_server.models import (
     map_instance_agent_command_execution,
     map_instance_agent_command_execution_summary,
 )
+from oracle.oci_mcp_common.client_cache import cached_client
 from pydantic import Field
 
 from . import __project__, __version__
@@ -33,6 +34,7 @@ logger = Logger(__name__, level="INFO")
 mcp = FastMCP(name=__project__)
 
 
+@cached_client
 def get_compute_instance_agent_client():
     logger.info("entering get_compute_instance_agent_client")
     config = oci.config.from_file(
@@ -45,7 +47,6 @@ def get_compute_instance_agent_client():
 
     private_key = oci.signer.load_private_key_from_file(config["key_file"])
     token_file = os.path.expanduser(config["security_token_file"])
-    token = None
     with open(token_file, "r") as f:
         token = f.read()
     signer = oci.auth.signers.SecurityTokenSigner(token, private_key)
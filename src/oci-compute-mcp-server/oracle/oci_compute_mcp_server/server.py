@@ -26,6 +26,7 @@ from oracle.oci_compute_mcp_server.models import (
     map_response,
     map_vnic_attachment,
 )
+from oracle.oci_mcp_common.client_cache import cached_client
 from pydantic import Field
 
 from . import __project__, __version__
@@ -35,6 +36,7 @@ logger = Logger(__name__, level="INFO")
 mcp = FastMCP(name=__project__)
 
 
+@cached_client
 def get_compute_client():
     logger.info("entering get_compute_client")
     config = oci.config.from_file(
@@ -46,7 +48,6 @@ def get_compute_client():
 
     private_key = oci.signer.load_private_key_from_file(config["key_file"])
     token_file = os.path.expanduser(config["security_token_file"])
-    token = None
     with open(token_file, "r") as f:
         token = f.read()
     signer = oci.auth.signers.SecurityTokenSigner(token, private_key)
@@ -0,0 +1,97 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+
+Mapping benchmark of the map_* functions: the per-item cost of turning a page
+of OCI SDK objects into the server's Pydantic models.
+
+"before" is how the map_* functions used to map an item, oci.util.to_dict()
+followed by validation of the whole model; "after" is the map_* function,
+which copies the SDK attributes through a cached per-class field list and
+builds the model without validating its untyped fields. Every attribute of
+the SDK objects is set, nested models included, as in a list_* response.
+
+Usage:
+  uv run python benchmarks/bench_mapping.py [items]
+"""
+
+import datetime
+import statistics
+import sys
+import timeit
+
+import oci
+from oracle.oci_database_mcp_server import models
+
+MODELS = (
+    "AutonomousDatabaseSummary",
+    "DbSystemSummary",
+    "CloudVmClusterSummary",
+    "DatabaseSummary",
+    "PluggableDatabaseSummary",
+)
+
+SCALARS = {
+    "str": "sample",
+    "int": 3,
+    "float": 2.5,
+    "bool": True,
+    "datetime": datetime.datetime(2026, 1, 2, 3, 4, 5),
+    "date": datetime.date(2026, 1, 2),
+    "object": {"key": "value"},
+}
+
+
+def sample_value(swagger_type: str, depth: int):
+    if swagger_type in SCALARS:
+        return SCALARS[swagger_type]
+    if swagger_type.startswith("list["):
+        return [sample_value(swagger_type[5:-1], depth)]
+    if swagger_type.startswith("dict("):
+        return {"key": "value"}
+    sdk_class = getattr(oci.database.models, swagger_type, None)
+    if sdk_class is None or depth == 0:
+        return None
+    return sample(sdk_class, depth - 1)
+
+
+def sample(sdk_class, depth: int = 1):
+    o = sdk_class()
+    for name, swagger_type in o.swagger_types.items():
+        try:
+            setattr(o, name, sample_value(swagger_type, depth))
+        except ValueError:
+            pass
+    return o
+
+
+def per_item_us(fn, items, repeat: int = 5) -> float:
+    times = timeit.repeat(lambda: [fn(o) for o in items], number=1, repeat=repeat)
+    return statistics.median(times) / len(items) * 1e6
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    print(f"{'Model':<28} {'Fields':>6} {'Before':>10} {'After':>10} {'Speedup':>8}")
+    for name in MODELS:
+        model = getattr(models, name)
+        mapper = getattr(models, f"map_{name.lower()}")
+        sdk_class = getattr(oci.database.models, name, None)
+        if sdk_class is None:
+            continue
+        items = [sample(sdk_class) for _ in range(count)]
+        # build the validators and the mapper outside of the measurement
+        model(**oci.util.to_dict(items[0]))
+        mapper(items[0])
+
+        before = per_item_us(lambda o: model(**oci.util.to_dict(o)), items)
+        after = per_item_us(mapper, items)
+        print(
+            f"{name:<28} {len(model.model_fields):>6} {before:>8.1f}us "
+            f"{after:>8.1f}us {before / after:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
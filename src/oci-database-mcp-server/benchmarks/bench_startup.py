@@ -0,0 +1,88 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+
+Startup benchmark of the server: imports oracle.oci_database_mcp_server.server
+in fresh interpreters started with `python -X importtime`, first with an
+empty tool schema cache ("cold", as on the first start after an install or
+upgrade) and then with the cache left by the cold run ("warm").
+
+For each run it reports the cumulative import time of the server module and
+of its largest dependencies as measured by -X importtime, the number of model
+families imported, and the peak RSS of the interpreter.
+
+Usage:
+  uv run python benchmarks/bench_startup.py [runs]
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+SERVER = "oracle.oci_database_mcp_server.server"
+MODULES = ("fastmcp", "oci", "oci.database", SERVER)
+
+CHILD = f"""
+import json, resource, sys
+import {SERVER}
+# as main() does on startup
+{SERVER}.tool_schemas.save()
+prefix = "oracle.oci_database_mcp_server.models."
+print(json.dumps({{
+    "families": sum(1 for m in sys.modules if m.startswith(prefix)) - 1,
+    "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+}}))
+"""
+
+
+def import_once(cache_dir: str) -> dict:
+    env = dict(os.environ, ORACLE_MCP_TOOL_SCHEMA_CACHE_DIR=cache_dir)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [os.getcwd(), env.get("PYTHONPATH")])
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-W", "ignore", "-c", CHILD],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    measures = json.loads(result.stdout.splitlines()[-1])
+    # lines look like "import time:  self [us] | cumulative | imported package"
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if name.strip() in MODULES:
+            measures[name.strip()] = int(cumulative) / 1e6
+    return measures
+
+
+def report(label: str, runs: list):
+    columns = "   ".join(
+        f"{module} {statistics.median(run[module] for run in runs):6.3f} s"
+        for module in MODULES
+    )
+    print(
+        f"{label:<5} {columns}   model families {runs[0]['families']}"
+        f"   rss {statistics.median(run['rss_mb'] for run in runs):6.1f} MB"
+    )
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    cold, warm = [], []
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cold.append(import_once(cache_dir))
+            warm.append(import_once(cache_dir))
+    report("cold", cold)
+    report("warm", warm)
+
+
+if __name__ == "__main__":
+    main()
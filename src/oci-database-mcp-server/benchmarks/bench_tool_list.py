@@ -0,0 +1,64 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+
+tools/list benchmark of the tool profiles: for each profile, the number of
+tools listed, the size of the tools/list response as sent to the client
+(JSON), an estimate of its tokens (4 bytes a token), and the median latency
+of a tools/list request through an in-memory MCP client session.
+
+Usage:
+  uv run python benchmarks/bench_tool_list.py [requests]
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+
+from fastmcp import Client
+from oracle.oci_database_mcp_server import server
+
+PROFILES = (
+    "all",
+    "readonly",
+    "autonomous",
+    "exadata",
+    "pdb",
+    "maintenance",
+    "autonomous,readonly",
+    "discover",
+)
+
+
+async def measure(profile: str, requests: int) -> dict:
+    server.tool_groups.apply(profile)
+    async with Client(server.mcp) as client:
+        latencies = []
+        for _ in range(requests):
+            started = time.perf_counter()
+            result = await client.session.list_tools()
+            latencies.append(time.perf_counter() - started)
+    size = len(result.model_dump_json(by_alias=True, exclude_none=True))
+    return {
+        "tools": len(result.tools),
+        "bytes": size,
+        "tokens": size // 4,
+        "latency_ms": statistics.median(latencies) * 1e3,
+    }
+
+
+async def main():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    print(f"{'Profile':<22} {'Tools':>6} {'Bytes':>10} {'~Tokens':>9} {'Latency':>10}")
+    for profile in PROFILES:
+        m = await measure(profile, requests)
+        print(
+            f"{profile:<22} {m['tools']:>6} {m['bytes']:>10,} {m['tokens']:>9,}"
+            f" {m['latency_ms']:>7.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -3,3 +3,9 @@ Copyright (c) 2025, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v1.0 as shown at
 https://oss.oracle.com/licenses/upl.
 """
+
+# the oracle distributions share this package; extending its path lets a
+# server installed in development mode (uv sync) import oracle.oci_mcp_common
+from pkgutil import extend_path
+
+__path__ = extend_path(__path__, __name__)
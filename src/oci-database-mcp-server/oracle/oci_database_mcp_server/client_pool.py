@@ -0,0 +1,147 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import oci
+from oracle.oci_mcp_common.client_cache import get_file_mtimes, get_settled_mtimes
+
+
+class DatabaseClientPool:
+    """
+    Thread-safe pool of oci.database.DatabaseClient instances, one per region,
+    and of the WorkRequestClient instances that track their operations.
+
+    All clients share the config and signer of the configured profile (a
+    SecurityTokenSigner, or the API key signer of a profile without a
+    security token), which are loaded once. When the config, private key or
+    security token file changes on disk (e.g. after `oci session refresh`) the
+    credentials are loaded again and every client is rebuilt on its next use.
+    Files modified within a second of a load are not trusted to be complete,
+    so they are loaded again on the next call.
+    """
+
+    def __init__(self, logger, user_agent: str):
+        self.logger = logger
+        self.user_agent = user_agent
+        self._lock = threading.Lock()
+        self._clients: Dict[Tuple[Any, Optional[str]], Any] = {}
+        self._config: Optional[Dict[str, Any]] = None
+        self._signer = None
+        self._paths: Tuple[str, ...] = ()
+        self._mtimes: Optional[Tuple[int, ...]] = None
+        # (mtimes of the credentials it was listed with, regions)
+        self._regions: Optional[Tuple[Optional[Tuple[int, ...]], List[str]]] = None
+
+    def _load_credentials(self):
+        started = time.time_ns()
+        config_file = os.path.expanduser(
+            os.getenv("OCI_CONFIG_FILE", oci.config.DEFAULT_LOCATION)
+        )
+        config = oci.config.from_file(
+            file_location=config_file,
+            profile_name=os.getenv("OCI_CONFIG_PROFILE", oci.config.DEFAULT_PROFILE),
+        )
+        config["additional_user_agent"] = self.user_agent
+        token_file = config.get("security_token_file")
+        paths = (config_file, config["key_file"])
+        if token_file:
+            paths += (token_file,)
+        # taken before reading the files, so that a change made while they are
+        # read is picked up by the next call
+        mtimes = get_settled_mtimes(paths, started)
+        if token_file:
+            private_key = oci.signer.load_private_key_from_file(config["key_file"])
+            with open(os.path.expanduser(token_file), "r") as f:
+                token = f.read()
+            self._signer = oci.auth.signers.SecurityTokenSigner(token, private_key)
+        else:
+            self._signer = oci.signer.Signer(
+                tenancy=config["tenancy"],
+                user=config["user"],
+                fingerprint=config["fingerprint"],
+                private_key_file_location=config["key_file"],
+                pass_phrase=config.get("pass_phrase"),
+            )
+        self._config = config
+        self._paths = paths
+        self._mtimes = mtimes
+        self._regions = None
+        if self._clients:
+            self.logger.info(
+                f"OCI credentials changed, dropping {len(self._clients)} database clients"
+            )
+        self._clients.clear()
+
+    def _refresh(self):
+        """Loads the credentials if they were never loaded or changed on disk"""
+        if (
+            self._config is None
+            or self._mtimes is None
+            or get_file_mtimes(self._paths) != self._mtimes
+        ):
+            self._load_credentials()
+
+    def _client(self, client_class, region: Optional[str]):
+        with self._lock:
+            self._refresh()
+            key = (client_class, region or self._config.get("region"))
+            client = self._clients.get(key)
+            if client is None:
+                config = self._config
+                if region is not None:
+                    config = dict(config, region=region)
+                client = client_class(config, signer=self._signer)
+                self._clients[key] = client
+            return client
+
+    def get(self, region: Optional[str] = None):
+        """Returns the client of a region, or of the profile's region by default"""
+        return self._client(oci.database.DatabaseClient, region)
+
+    def work_requests(self, region: Optional[str] = None):
+        """Returns the WorkRequestClient of a region, which tracks database operations"""
+        return self._client(oci.work_requests.WorkRequestClient, region)
+
+    def subscribed_regions(self) -> List[str]:
+        """
+        Returns the regions the tenancy is subscribed to and that are ready. The
+        list is kept until the credentials change.
+        """
+        with self._lock:
+            self._refresh()
+            mtimes, tenancy = self._mtimes, self._config["tenancy"]
+            if (
+                mtimes is not None
+                and self._regions is not None
+                and self._regions[0] == mtimes
+            ):
+                return list(self._regions[1])
+        identity = self._client(oci.identity.IdentityClient, None)
+        subscriptions = identity.list_region_subscriptions(tenancy).data
+        regions = [s.region_name for s in subscriptions if s.status == "READY"]
+        with self._lock:
+            if mtimes is not None and self._mtimes == mtimes:
+                self._regions = (mtimes, regions)
+        return list(regions)
+
+    def warm(self, regions: Optional[List[str]] = None) -> List[str]:
+        """
+        Builds the clients of the given regions, or of every subscribed region,
+        ahead of their first use. Returns the regions warmed.
+        """
+        if regions is None:
+            regions = self.subscribed_regions()
+        for region in regions:
+            self.get(region)
+        self.logger.info(f"Warmed database clients for {len(regions)} regions")
+        return regions
+
+    def __len__(self) -> int:
+        return len(self._clients)
@@ -0,0 +1,148 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from oracle.oci_database_mcp_server.pagination import ListPage
+
+# arguments that do not change what a listing returns
+_IGNORED_ARGUMENTS = ("opc_request_id",)
+
+# inventory listings that a change to a resource family can make stale. A
+# tool that changes a resource of another family needs an entry here.
+STALE_INVENTORY: Dict[str, Tuple[str, ...]] = {
+    "pluggable_database": ("databases",),
+}
+
+# verbs of the tools that only read
+_READ_VERBS = ("get", "list")
+
+
+def changed_family(tool_name: str) -> Optional[str]:
+    """
+    Returns the resource family a tool changes, the longest family of
+    STALE_INVENTORY that its name starts with once the verb is dropped
+    (e.g. create_pluggable_database_from_local_clone -> pluggable_database),
+    or None for the tools that only read or change no listed family
+    """
+    verb, _, resource = tool_name.partition("_")
+    if verb in _READ_VERBS:
+        return None
+    families = [
+        family
+        for family in STALE_INVENTORY
+        if resource == family or resource.startswith(family + "_")
+    ]
+    return max(families, key=len, default=None)
+
+
+class InventoryCache:
+    """
+    In-process cache of fleet inventory listings, grouped per (resource type,
+    compartment, region). Within a group, each listing is keyed by the rest
+    of its arguments (filters, page, max_items, fields) and is served for `ttl`
+    seconds (ORACLE_MCP_DATABASE_INVENTORY_TTL, default 300; 0 disables the
+    cache) with the age of the listing.
+    """
+
+    def __init__(self, ttl: Optional[float] = None):
+        self.ttl = (
+            ttl
+            if ttl is not None
+            else float(os.getenv("ORACLE_MCP_DATABASE_INVENTORY_TTL") or 300)
+        )
+        self._lock = threading.Lock()
+        self._groups: Dict[Tuple, Dict[Tuple, Tuple[float, ListPage]]] = {}
+
+    @staticmethod
+    def _query(
+        max_items: Optional[int],
+        fields: Optional[List[str]],
+        arguments: Dict[str, Any],
+    ) -> Tuple:
+        return (max_items, tuple(fields or ())) + tuple(
+            sorted(
+                (name, repr(value))
+                for name, value in arguments.items()
+                if name not in _IGNORED_ARGUMENTS
+            )
+        )
+
+    def get(
+        self,
+        resource_type: str,
+        region: Optional[str],
+        max_items: Optional[int],
+        arguments: Dict[str, Any],
+        fields: Optional[List[str]] = None,
+    ) -> Optional[ListPage]:
+        """Returns the cached listing with its age, or None if it is missing or stale"""
+        group = (resource_type, arguments.get("compartment_id"), region)
+        query = self._query(max_items, fields, arguments)
+        with self._lock:
+            entry = self._groups.get(group, {}).get(query)
+        if entry is None:
+            return None
+        age = time.monotonic() - entry[0]
+        if age >= self.ttl:
+            return None
+        return entry[1].model_copy(update={"age_seconds": round(age, 3)})
+
+    def put(
+        self,
+        resource_type: str,
+        region: Optional[str],
+        max_items: Optional[int],
+        arguments: Dict[str, Any],
+        page: ListPage,
+        fields: Optional[List[str]] = None,
+    ):
+        if self.ttl <= 0:
+            return
+        group = (resource_type, arguments.get("compartment_id"), region)
+        with self._lock:
+            self._groups.setdefault(group, {})[
+                self._query(max_items, fields, arguments)
+            ] = (
+                time.monotonic(),
+                page,
+            )
+
+    def invalidate(
+        self,
+        resource_type: Optional[str] = None,
+        compartment_id: Optional[str] = None,
+        region: Optional[str] = None,
+    ) -> int:
+        """
+        Drops the listings of the groups matching every given argument; a
+        region also matches the listings made without a region. Returns the
+        number of groups dropped.
+        """
+        with self._lock:
+            dropped = [
+                group
+                for group in self._groups
+                if resource_type in (None, group[0])
+                and compartment_id in (None, group[1])
+                and (region is None or group[2] in (None, region))
+            ]
+            for group in dropped:
+                del self._groups[group]
+        return len(dropped)
+
+    def invalidate_family(self, family: str, region: Optional[str] = None) -> int:
+        """
+        Drops the listings in `region` that a change to a resource `family`
+        can make stale. Returns the number of groups dropped.
+        """
+        return sum(
+            self.invalidate(resource_type, region=region)
+            for resource_type in STALE_INVENTORY[family]
+        )
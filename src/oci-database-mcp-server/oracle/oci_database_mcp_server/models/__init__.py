@@ -0,0 +1,186 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+
+Pydantic models of the OCI Database service and the map_* functions that
+build them from OCI SDK models, one module per resource family.
+
+Importing this package is cheap: a model or mapper is imported from its
+family module on first access, e.g. `models.AutonomousDatabase` imports
+models.autonomous. Each family module lists its classes in _FAMILIES; the
+mapper of class `Name` is `map_name`.
+"""
+
+import importlib
+
+from oracle.oci_database_mcp_server.models.base import OCIBaseModel
+
+_FAMILIES = {
+    "autonomous": (
+        "AutonomousContainerDatabaseDataguardAssociation",
+        "AutonomousContainerDatabaseVersionSummary",
+        "AutonomousContainerDatabaseSummary",
+        "AutonomousDatabaseBackupSummary",
+        "AutonomousDatabaseCharacterSets",
+        "AutonomousDatabaseSummary",
+        "AutonomousDatabaseDataguardAssociation",
+        "AutonomousDatabasePeerCollection",
+        "RefreshableCloneCollection",
+        "AutonomousDatabaseSoftwareImageCollection",
+        "AutonomousDbPreviewVersionSummary",
+        "AutonomousDbVersionSummary",
+        "AutonomousVirtualMachineSummary",
+        "AutonomousVmClusterSummary",
+        "CloudAutonomousVmClusterSummary",
+        "AutonomousPatchSummary",
+        "ResourcePoolShapeCollection",
+        "AutonomousContainerDatabase",
+        "AutonomousContainerDatabaseResourceUsage",
+        "AutonomousDatabase",
+        "AutonomousDatabaseBackup",
+        "AutonomousDatabaseWallet",
+        "AutonomousDatabaseSoftwareImage",
+        "AutonomousExadataInfrastructure",
+        "AutonomousPatch",
+        "AutonomousVirtualMachine",
+        "AutonomousVmCluster",
+        "AutonomousVmClusterResourceUsage",
+        "CloudAutonomousVmCluster",
+        "CloudAutonomousVmClusterResourceUsage",
+    ),
+    "database": (
+        "BackupDestinationSummary",
+        "BackupSummary",
+        "DataGuardAssociationSummary",
+        "DatabaseSoftwareImageSummary",
+        "DatabaseSummary",
+        "KeyStoreSummary",
+        "Backup",
+        "BackupDestination",
+        "DataGuardAssociation",
+        "Database",
+        "DatabaseSoftwareImage",
+        "DatabaseUpgradeHistoryEntry",
+        "KeyStore",
+    ),
+    "db_system": (
+        "ConsoleConnectionSummary",
+        "ConsoleHistoryCollection",
+        "DbHomeSummary",
+        "DbNodeSummary",
+        "DbSystemComputePerformanceSummary",
+        "DbSystemShapeSummary",
+        "DbSystemStoragePerformanceSummary",
+        "DbSystemSummary",
+        "DbVersionSummary",
+        "GiMinorVersionSummary",
+        "GiVersionSummary",
+        "ConsoleConnection",
+        "ConsoleHistory",
+        "DbHome",
+        "DbNode",
+        "DbSystem",
+        "DbSystemUpgradeHistoryEntry",
+    ),
+    "exadata": (
+        "ApplicationVipSummary",
+        "CloudExadataInfrastructureSummary",
+        "CloudVmClusterSummary",
+        "DbServerSummary",
+        "ExadataInfrastructureSummary",
+        "ExadbVmClusterUpdateSummary",
+        "ExadbVmClusterSummary",
+        "ExascaleDbStorageVaultSummary",
+        "FlexComponentCollection",
+        "SystemVersionCollection",
+        "VmClusterNetworkSummary",
+        "VmClusterUpdateSummary",
+        "VmClusterSummary",
+        "ApplicationVip",
+        "CloudExadataInfrastructure",
+        "CloudExadataInfrastructureUnallocatedResources",
+        "CloudVmCluster",
+        "ExadataIormConfig",
+        "DbServer",
+        "ExadataInfrastructure",
+        "OCPUs",
+        "ExadataInfrastructureUnAllocatedResources",
+        "ExadbVmCluster",
+        "ExadbVmClusterUpdate",
+        "ExadbVmClusterUpdateHistoryEntry",
+        "ExascaleDbStorageVault",
+        "VmCluster",
+        "VmClusterNetwork",
+        "VmClusterUpdate",
+        "VmClusterUpdateHistoryEntry",
+    ),
+    "external": (
+        "ExternalContainerDatabaseSummary",
+        "ExternalDatabaseConnectorSummary",
+        "ExternalNonContainerDatabaseSummary",
+        "ExternalPluggableDatabaseSummary",
+        "ExternalBackupJob",
+        "ExternalContainerDatabase",
+        "ExternalDatabaseConnector",
+        "ExternalNonContainerDatabase",
+        "ExternalPluggableDatabase",
+    ),
+    "maintenance": (
+        "UpdateSummary",
+        "PatchHistoryEntrySummary",
+        "PatchSummary",
+        "ExecutionActionSummary",
+        "ExecutionWindowSummary",
+        "MaintenanceRunHistorySummary",
+        "MaintenanceRunSummary",
+        "OneoffPatchSummary",
+        "ScheduledActionCollection",
+        "SchedulingPlanCollection",
+        "SchedulingPolicySummary",
+        "SchedulingWindowSummary",
+        "Update",
+        "UpdateHistoryEntry",
+        "Patch",
+        "PatchHistoryEntry",
+        "ExecutionAction",
+        "ExecutionWindow",
+        "InfrastructureTargetVersion",
+        "MaintenanceRun",
+        "MaintenanceRunHistory",
+        "OneoffPatch",
+        "ScheduledAction",
+        "SchedulingPlan",
+        "SchedulingPolicy",
+        "SchedulingWindow",
+    ),
+    "pluggable": (
+        "PluggableDatabase",
+        "CreatePluggableDatabaseDetails",
+        "UpdatePluggableDatabaseDetails",
+        "PluggableDatabaseSummary",
+        "PdbConversionHistoryEntry",
+    ),
+}
+
+_MODULES = {}
+for _family, _classes in _FAMILIES.items():
+    for _class in _classes:
+        _MODULES[_class] = _family
+        _MODULES[f"map_{_class.lower()}"] = _family
+
+__all__ = ["OCIBaseModel", *_MODULES]
+
+
+def __getattr__(name: str):
+    family = _MODULES.get(name)
+    if family is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{family}"), name)
+    # later lookups find the attribute without going through __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return __all__
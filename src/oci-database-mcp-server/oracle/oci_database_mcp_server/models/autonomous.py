@@ -0,0 +1,3641 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+
+Pydantic models of the OCI Database service: Autonomous Databases, Autonomous Container Databases and Autonomous VM clusters.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import oci
+from oracle.oci_database_mcp_server.models.base import OCIBaseModel, map_model
+from pydantic import Field
+
+
+class AutonomousContainerDatabaseDataguardAssociation(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.AutonomousContainerDatabaseDataguardAssociation."""
+
+    apply_lag: Optional[Any] = Field(
+        None,
+        description="The lag time between updates to the primary Autonomous Container Database and application of the redo data on the standby Autonomous Container Database, as computed by the reporting database. Example: `9 seconds`",
+    )
+    apply_rate: Optional[Any] = Field(
+        None,
+        description="The rate at which redo logs are synchronized between the associated Autonomous Container Databases. Example: `180 Mb per second`",
+    )
+    autonomous_container_database_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the autonomous_container_database_id of this AutonomousContainerDatabaseDataguardAssociation. The `OCID`__ of the Autonomous Container Database that has a relationship with the peer Autonomous Container Database. Used only by Autonomous Database on Dedicated Exadata Infrastructure.",
+    )
+    fast_start_fail_over_lag_limit_in_seconds: Optional[Any] = Field(
+        None,
+        description="The lag time for my preference based on data loss tolerance in seconds.",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this AutonomousContainerDatabaseDataguardAssociation. The OCID of the Autonomous Data Guard created for a given Autonomous Container Database.",
+    )
+    is_automatic_failover_enabled: Optional[Any] = Field(
+        None,
+        description="Indicates whether Automatic Failover is enabled for Autonomous Container Database Dataguard Association",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycleState, if available.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this AutonomousContainerDatabaseDataguardAssociation. The current state of Autonomous Data Guard. Allowed values for this property are: "PROVISIONING", "AVAILABLE", "ROLE_CHANGE_IN_PROGRESS", "TERMINATING", "TERMINATED", "FAILED", "UNAVAILABLE", "UPDATING", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    peer_autonomous_container_database_dataguard_association_id: Optional[Any] = Field(
+        None,
+        description="The OCID of the peer Autonomous Container Database-Autonomous Data Guard association.",
+    )
+    peer_autonomous_container_database_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the peer Autonomous Container Database.",
+    )
+    peer_lifecycle_state: Optional[Any] = Field(
+        None,
+        description='The current state of the Autonomous Container Database. Allowed values for this property are: "PROVISIONING", "AVAILABLE", "UPDATING", "TERMINATING", "TERMINATED", "FAILED", "BACKUP_IN_PROGRESS", "RESTORING", "RESTORE_FAILED", "RESTARTING", "MAINTENANCE_IN_PROGRESS", "ROLE_CHANGE_IN_PROGRESS", "ENABLING_AUTONOMOUS_DATA_GUARD", "UNAVAILABLE", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    peer_role: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the peer_role of this AutonomousContainerDatabaseDataguardAssociation. The Data Guard role of the Autonomous Container Database or Autonomous Database, if Autonomous Data Guard is enabled. Allowed values for this property are: "PRIMARY", "STANDBY", "DISABLED_STANDBY", "BACKUP_COPY", "SNAPSHOT_STANDBY", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    protection_mode: Optional[Any] = Field(
+        None,
+        description="The protection mode of this Autonomous Data Guard association. For more information, see `Oracle Data Guard Protection Modes`__ in the Oracle Data Guard documentation. Allowed values for this property are: \"MAXIMUM_AVAILABILITY\", \"MAXIMUM_PERFORMANCE\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    role: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the role of this AutonomousContainerDatabaseDataguardAssociation. The Data Guard role of the Autonomous Container Database or Autonomous Database, if Autonomous Data Guard is enabled. Allowed values for this property are: "PRIMARY", "STANDBY", "DISABLED_STANDBY", "BACKUP_COPY", "SNAPSHOT_STANDBY", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time the Autonomous DataGuard association was created.",
+    )
+    time_last_role_changed: Optional[Any] = Field(
+        None,
+        description="The date and time when the last role change action happened.",
+    )
+    time_last_synced: Optional[Any] = Field(
+        None,
+        description="The date and time of the last update to the apply lag, apply rate, and transport lag values.",
+    )
+    transport_lag: Optional[Any] = Field(
+        None,
+        description="The approximate number of seconds of redo data not yet available on the standby Autonomous Container Database, as computed by the reporting database. Example: `7 seconds`",
+    )
+
+
+def map_autonomouscontainerdatabasedataguardassociation(
+    o: oci.database.models.AutonomousContainerDatabaseDataguardAssociation,
+    fields: Optional[list[str]] = None,
+) -> AutonomousContainerDatabaseDataguardAssociation | None:
+    """Map oci.database.models.AutonomousContainerDatabaseDataguardAssociation → AutonomousContainerDatabaseDataguardAssociation Pydantic model."""
+    return map_model(AutonomousContainerDatabaseDataguardAssociation, o, fields)
+
+
+class AutonomousContainerDatabaseVersionSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.AutonomousContainerDatabaseVersionSummary."""
+
+    details: Optional[Any] = Field(
+        None,
+        description="A URL that points to a detailed description of the Autonomous Container Database version.",
+    )
+    supported_apps: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the supported_apps of this AutonomousContainerDatabaseVersionSummary. The list of applications supported for the given version.",
+    )
+    version: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the version of this AutonomousContainerDatabaseVersionSummary. A valid Oracle Database version for provisioning an Autonomous Container Database.",
+    )
+
+
+def map_autonomouscontainerdatabaseversionsummary(
+    o: oci.database.models.AutonomousContainerDatabaseVersionSummary,
+    fields: Optional[list[str]] = None,
+) -> AutonomousContainerDatabaseVersionSummary | None:
+    """Map oci.database.models.AutonomousContainerDatabaseVersionSummary → AutonomousContainerDatabaseVersionSummary Pydantic model."""
+    return map_model(AutonomousContainerDatabaseVersionSummary, o, fields)
+
+
+class AutonomousContainerDatabaseSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.AutonomousContainerDatabaseSummary."""
+
+    associated_backup_configuration_details: Optional[Any] = Field(
+        None,
+        description="A backup config object holds information about preferred backup destinations only. This object holds information about the associated backup destinations, such as secondary backup destinations created for local backups or remote replicated backups.",
+    )
+    autonomous_exadata_infrastructure_id: Optional[Any] = Field(
+        None,
+        description="**No longer used.** For Autonomous Database on dedicated Exadata infrastructure, the container database is created within a specified `cloudAutonomousVmCluster`.",
+    )
+    autonomous_vm_cluster_id: Optional[Any] = Field(
+        None,
+        description="The OCID of the Autonomous VM Cluster.",
+    )
+    availability_domain: Optional[Any] = Field(
+        None,
+        description="The availability domain of the Autonomous Container Database.",
+    )
+    available_cpus: Optional[float] = Field(
+        None,
+        description="Sum of CPUs available on the Autonomous VM Cluster + Sum of reclaimable CPUs available in the Autonomous Container Database.",
+    )
+    backup_config: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    backup_destination_properties_list: Optional[Any] = Field(
+        None,
+        description="This list describes the backup destination properties associated with the Autonomous Container Database (ACD) 's preferred backup destination. The object at a given index is associated with the destination present at the same index in the backup destination details list of the ACD Backup Configuration.",
+    )
+    cloud_autonomous_vm_cluster_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the cloud Autonomous Exadata VM Cluster.",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this AutonomousContainerDatabaseSummary. The OCID of the compartment.",
+    )
+    compute_model: Optional[Any] = Field(
+        None,
+        description="The compute model of the Autonomous Container Database. For Autonomous Database on Dedicated Exadata Infrastructure, the CPU type (ECPUs or OCPUs) is determined by the parent Autonomous Exadata VM Cluster's compute model. ECPU compute model is the recommended model and OCPU compute model is legacy. See `Compute Models in Autonomous Database on Dedicated Exadata Infrastructure`__ for more details. Allowed values for this property are: \"ECPU\", \"OCPU\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    db_name: Optional[Any] = Field(
+        None,
+        description="The Database name for the Autonomous Container Database. The name must be unique within the Cloud Autonomous VM Cluster, starting with an alphabetic character, followed by 1 to 7 alphanumeric characters.",
+    )
+    db_split_threshold: Optional[Any] = Field(
+        None,
+        description="The CPU value beyond which an Autonomous Database will be opened across multiple nodes. The default value of this attribute is 16 for OCPUs and 64 for ECPUs.",
+    )
+    db_unique_name: Optional[Any] = Field(
+        None,
+        description="**Deprecated.** The `DB_UNIQUE_NAME` value is set by Oracle Cloud Infrastructure. Do not specify a value for this parameter. Specifying a value for this field will cause Terraform operations to fail.",
+    )
+    db_version: Optional[Any] = Field(
+        None,
+        description="Oracle Database version of the Autonomous Container Database.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this AutonomousContainerDatabaseSummary. The user-provided name for the Autonomous Container Database.",
+    )
+    distribution_affinity: Optional[Any] = Field(
+        None,
+        description="Determines whether an Autonomous Database must be opened across the maximum number of nodes or the least number of nodes. By default, Minimum nodes is selected. Allowed values for this property are: \"MINIMUM_DISTRIBUTION\", \"MAXIMUM_DISTRIBUTION\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    dst_file_version: Optional[Any] = Field(
+        None,
+        description="DST Time-Zone File version of the Autonomous Container Database.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this AutonomousContainerDatabaseSummary. The OCID of the Autonomous Container Database.",
+    )
+    infrastructure_type: Optional[Any] = Field(
+        None,
+        description="The infrastructure type this resource belongs to. Allowed values for this property are: \"CLOUD\", \"CLOUD_AT_CUSTOMER\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    is_dst_file_update_enabled: Optional[Any] = Field(
+        None,
+        description="Indicates if an automatic DST Time Zone file update is enabled for the Autonomous Container Database. If enabled along with Release Update, patching will be done in a Non-Rolling manner.",
+    )
+    key_history_entry: Optional[Any] = Field(
+        None,
+        description="Key History Entry.",
+    )
+    key_store_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the key store of Oracle Vault.",
+    )
+    key_store_wallet_name: Optional[Any] = Field(
+        None,
+        description="The wallet name for Oracle Key Vault.",
+    )
+    kms_key_id: Optional[Any] = Field(
+        None,
+        description="The OCID of the key container that is used as the master encryption key in database transparent data encryption (TDE) operations.",
+    )
+    kms_key_version_id: Optional[Any] = Field(
+        None,
+        description="The OCID of the key container version that is used in database transparent data encryption (TDE) operations KMS Key can have multiple key versions. If none is specified, the current key version (latest) of the Key Id is used for the operation. Autonomous Database Serverless does not use key versions, hence is not applicable for Autonomous Database Serverless instances.",
+    )
+    largest_provisionable_autonomous_database_in_cpus: Optional[float] = Field(
+        None,
+        description="The largest Autonomous Database (CPU) that can be created in a new Autonomous Container Database.",
+    )
+    last_maintenance_run_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the last maintenance run.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this AutonomousContainerDatabaseSummary. The current state of the Autonomous Container Database. Allowed values for this property are: "PROVISIONING", "AVAILABLE", "UPDATING", "TERMINATING", "TERMINATED", "FAILED", "BACKUP_IN_PROGRESS", "RESTORING", "RESTORE_FAILED", "RESTARTING", "MAINTENANCE_IN_PROGRESS", "ROLE_CHANGE_IN_PROGRESS", "ENABLING_AUTONOMOUS_DATA_GUARD", "UNAVAILABLE", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    list_one_off_patches: Optional[Any] = Field(
+        None,
+        description="List of One-Off patches that has been successfully applied to Autonomous Container Database",
+    )
+    maintenance_window: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    memory_per_oracle_compute_unit_in_gbs: Optional[Any] = Field(
+        None,
+        description="The amount of memory (in GBs) enabled per ECPU or OCPU in the Autonomous VM Cluster.",
+    )
+    net_services_architecture: Optional[Any] = Field(
+        None,
+        description="Enabling SHARED server architecture enables a database server to allow many client processes to share very few server processes, thereby increasing the number of supported users. Allowed values for this property are: \"DEDICATED\", \"SHARED\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    next_maintenance_run_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the next maintenance run.",
+    )
+    patch_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the last patch applied on the system.",
+    )
+    patch_model: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the patch_model of this AutonomousContainerDatabaseSummary. Database patch model preference. Allowed values for this property are: \"RELEASE_UPDATES\", \"RELEASE_UPDATE_REVISIONS\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    provisionable_cpus: Optional[Any] = Field(
+        None,
+        description="An array of CPU values that can be used to successfully provision a single Autonomous Database.",
+    )
+    provisioned_cpus: Optional[float] = Field(
+        None,
+        description="The number of CPUs provisioned in an Autonomous Container Database.",
+    )
+    reclaimable_cpus: Optional[float] = Field(
+        None,
+        description="CPUs that continue to be included in the count of CPUs available to the Autonomous Container Database even after one of its Autonomous Database is terminated or scaled down. You can release them to the available CPUs at its parent Autonomous VM Cluster level by restarting the Autonomous Container Database.",
+    )
+    recovery_appliance_details: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    reserved_cpus: Optional[float] = Field(
+        None,
+        description="The number of CPUs reserved in an Autonomous Container Database.",
+    )
+    role: Optional[Any] = Field(
+        None,
+        description='The Data Guard role of the Autonomous Container Database or Autonomous Database, if Autonomous Data Guard is enabled. Allowed values for this property are: "PRIMARY", "STANDBY", "DISABLED_STANDBY", "BACKUP_COPY", "SNAPSHOT_STANDBY", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    service_level_agreement_type: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the service_level_agreement_type of this AutonomousContainerDatabaseSummary. The service level agreement type of the container database. The default is STANDARD. Allowed values for this property are: "STANDARD", "MISSION_CRITICAL", "AUTONOMOUS_DATAGUARD", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    standby_maintenance_buffer_in_days: Optional[Any] = Field(
+        None,
+        description="The scheduling detail for the quarterly maintenance window of the standby Autonomous Container Database. This value represents the number of days before scheduled maintenance of the primary database.",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time the Autonomous Container Database was created.",
+    )
+    time_of_last_backup: Optional[Any] = Field(
+        None,
+        description="The timestamp of last successful backup. Here NULL value represents either there are no successful backups or backups are not configured for this Autonomous Container Database.",
+    )
+    time_snapshot_standby_revert: Optional[Any] = Field(
+        None,
+        description="The date and time the Autonomous Container Database will be reverted to Standby from Snapshot Standby.",
+    )
+    total_cpus: Optional[Any] = Field(
+        None,
+        description="The number of CPUs allocated to the Autonomous VM cluster.",
+    )
+    vault_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Oracle Cloud Infrastructure `vault`__. This parameter and `secretId` are required for Customer Managed Keys.",
+    )
+    version_preference: Optional[Any] = Field(
+        None,
+        description="The next maintenance version preference. Allowed values for this property are: \"NEXT_RELEASE_UPDATE\", \"LATEST_RELEASE_UPDATE\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    vm_failover_reservation: Optional[Any] = Field(
+        None,
+        description="The percentage of CPUs reserved across nodes to support node failover. Allowed values are 0%, 25%, and 50%, with 50% being the default option.",
+    )
+
+
+def map_autonomouscontainerdatabasesummary(
+    o: oci.database.models.AutonomousContainerDatabaseSummary,
+    fields: Optional[list[str]] = None,
+) -> AutonomousContainerDatabaseSummary | None:
+    """Map oci.database.models.AutonomousContainerDatabaseSummary → AutonomousContainerDatabaseSummary Pydantic model."""
+    return map_model(AutonomousContainerDatabaseSummary, o, fields)
+
+
+class AutonomousDatabaseBackupSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.AutonomousDatabaseBackupSummary."""
+
+    autonomous_database_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the autonomous_database_id of this AutonomousDatabaseBackupSummary. The `OCID`__ of the Autonomous Database.",
+    )
+    backup_destination_details: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this AutonomousDatabaseBackupSummary. The `OCID`__ of the compartment.",
+    )
+    database_size_in_tbs: Optional[float] = Field(
+        None,
+        description="The size of the database in terabytes at the time the backup was taken.",
+    )
+    db_version: Optional[Any] = Field(
+        None,
+        description="A valid Oracle Database version for Autonomous Database.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this AutonomousDatabaseBackupSummary. The user-friendly name for the backup. The name does not have to be unique.",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this AutonomousDatabaseBackupSummary. The `OCID`__ of the Autonomous Database backup.",
+    )
+    is_automatic: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the is_automatic of this AutonomousDatabaseBackupSummary. Indicates whether the backup is user-initiated or automatic.",
+    )
+    is_restorable: Optional[Any] = Field(
+        None,
+        description="Indicates whether the backup can be used to restore the associated Autonomous Database.",
+    )
+    key_store_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the key store of Oracle Vault.",
+    )
+    key_store_wallet_name: Optional[Any] = Field(
+        None,
+        description="The wallet name for Oracle Key Vault.",
+    )
+    kms_key_id: Optional[Any] = Field(
+        None,
+        description="The OCID of the key container that is used as the master encryption key in database transparent data encryption (TDE) operations.",
+    )
+    kms_key_version_id: Optional[Any] = Field(
+        None,
+        description="The OCID of the key container version that is used in database transparent data encryption (TDE) operations KMS Key can have multiple key versions. If none is specified, the current key version (latest) of the Key Id is used for the operation. Autonomous Database Serverless does not use key versions, hence is not applicable for Autonomous Database Serverless instances.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this AutonomousDatabaseBackupSummary. The current state of the backup. Allowed values for this property are: "CREATING", "ACTIVE", "DELETING", "DELETED", "FAILED", "UPDATING", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    retention_period_in_days: Optional[Any] = Field(
+        None,
+        description="Retention period, in days, for long-term backups",
+    )
+    size_in_tbs: Optional[float] = Field(
+        None,
+        description="The backup size in terrabytes (TB).",
+    )
+    time_available_till: Optional[Any] = Field(
+        None,
+        description="Timestamp until when the backup will be available",
+    )
+    time_ended: Optional[Any] = Field(
+        None,
+        description="The date and time the backup completed.",
+    )
+    time_started: Optional[Any] = Field(
+        None,
+        description="The date and time the backup started.",
+    )
+    type: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the type of this AutonomousDatabaseBackupSummary. The type of backup. Allowed values for this property are: "INCREMENTAL", "FULL", "LONGTERM", "VIRTUAL_FULL", "CUMULATIVE_INCREMENTAL", "ROLL_FORWARD_IMAGE_COPY", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    vault_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Oracle Cloud Infrastructure `vault`__. This parameter and `secretId` are required for Customer Managed Keys.",
+    )
+
+
+def map_autonomousdatabasebackupsummary(
+    o: oci.database.models.AutonomousDatabaseBackupSummary,
+    fields: Optional[list[str]] = None,
+) -> AutonomousDatabaseBackupSummary | None:
+    """Map oci.database.models.AutonomousDatabaseBackupSummary → AutonomousDatabaseBackupSummary Pydantic model."""
+    return map_model(AutonomousDatabaseBackupSummary, o, fields)
+
+
+class AutonomousDatabaseCharacterSets(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.AutonomousDatabaseCharacterSets."""
+
+    name: Optional[Any] = Field(
+        None,
+        description="A valid Oracle character set.",
+    )
+
+
+def map_autonomousdatabasecharactersets(
+    o: oci.database.models.AutonomousDatabaseCharacterSets,
+    fields: Optional[list[str]] = None,
+) -> AutonomousDatabaseCharacterSets | None:
+    """Map oci.database.models.AutonomousDatabaseCharacterSets → AutonomousDatabaseCharacterSets Pydantic model."""
+    return map_model(AutonomousDatabaseCharacterSets, o, fields)
+
+
+class AutonomousDatabaseSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.AutonomousDatabaseSummary."""
+
+    actual_used_data_storage_size_in_tbs: Optional[float] = Field(
+        None,
+        description="The current amount of storage in use for user and system data, in terabytes (TB).",
+    )
+    allocated_storage_size_in_tbs: Optional[float] = Field(
+        None,
+        description="The amount of storage currently allocated for the database tables and billed for, rounded up. When auto-scaling is not enabled, this value is equal to the `dataStorageSizeInTBs` value. You can compare this value to the `actualUsedDataStorageSizeInTBs` value to determine if a manual shrink operation is appropriate for your allocated storage. **Note:** Auto-scaling does not automatically decrease allocated storage when data is deleted from the database.",
+    )
+    apex_details: Optional[Any] = Field(
+        None,
+        description="Information about Oracle APEX Application Development.",
+    )
+    are_primary_whitelisted_ips_used: Optional[Any] = Field(
+        None,
+        description="This field will be null if the Autonomous Database is not Data Guard enabled or Access Control is disabled. It's value would be `TRUE` if Autonomous Database is Data Guard enabled and Access Control is enabled and if the Autonomous Database uses primary IP access control list (ACL) for standby. It's value would be `FALSE` if Autonomous Database is Data Guard enabled and Access Control is enabled and if the Autonomous Database uses different IP access control list (ACL) for standby compared to primary.",
+    )
+    auto_refresh_frequency_in_seconds: Optional[Any] = Field(
+        None,
+        description="The frequency a refreshable clone is refreshed after auto-refresh is enabled. The minimum is 1 hour. The maximum is 7 days. The date and time that auto-refresh is enabled is controlled by the `timeOfAutoRefreshStart` parameter.",
+    )
+    auto_refresh_point_lag_in_seconds: Optional[Any] = Field(
+        None,
+        description="The time, in seconds, the data of the refreshable clone lags the primary database at the point of refresh. The minimum is 0 minutes (0 mins means refresh to the latest available timestamp). The maximum is 7 days. The lag time increases after refreshing until the next data refresh happens.",
+    )
+    autonomous_container_database_id: Optional[Any] = Field(
+        None,
+        description="The Autonomous Container Database `OCID`__. Used only by Autonomous Database on Dedicated Exadata Infrastructure.",
+    )
+    autonomous_maintenance_schedule_type: Optional[Any] = Field(
+        None,
+        description="The maintenance schedule type of the Autonomous Database Serverless. An EARLY maintenance schedule follows a schedule applying patches prior to the REGULAR schedule. A REGULAR maintenance schedule follows the normal cycle Allowed values for this property are: \"EARLY\", \"REGULAR\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    availability_domain: Optional[Any] = Field(
+        None,
+        description="The availability domain where the Autonomous Database Serverless instance is located.",
+    )
+    available_upgrade_versions: Optional[Any] = Field(
+        None,
+        description="List of Oracle Database versions available for a database upgrade. If there are no version upgrades available, this list is empty.",
+    )
+    backup_config: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    backup_retention_period_in_days: Optional[Any] = Field(
+        None,
+        description="Retention period, in days, for long-term backups",
+    )
+    byol_compute_count_limit: Optional[float] = Field(
+        None,
+        description="The maximum number of CPUs allowed with a Bring Your Own License (BYOL), including those used for auto-scaling, disaster recovery, tools, etc. Any CPU usage above this limit is considered as License Included and billed.",
+    )
+    character_set: Optional[Any] = Field(
+        None,
+        description="The character set for the autonomous database. The default is AL32UTF8. Allowed values are: AL32UTF8, AR8ADOS710, AR8ADOS720, AR8APTEC715, AR8ARABICMACS, AR8ASMO8X, AR8ISO8859P6, AR8MSWIN1256, AR8MUSSAD768, AR8NAFITHA711, AR8NAFITHA721, AR8SAKHR706, AR8SAKHR707, AZ8ISO8859P9E, BG8MSWIN, BG8PC437S, BLT8CP921, BLT8ISO8859P13, BLT8MSWIN1257, BLT8PC775, BN8BSCII, CDN8PC863, CEL8ISO8859P14, CL8ISO8859P5, CL8ISOIR111, CL8KOI8R, CL8KOI8U, CL8MACCYRILLICS, CL8MSWIN1251, EE8ISO8859P2, EE8MACCES, EE8MACCROATIANS, EE8MSWIN1250, EE8PC852, EL8DEC, EL8ISO8859P7, EL8MACGREEKS, EL8MSWIN1253, EL8PC437S, EL8PC851, EL8PC869, ET8MSWIN923, HU8ABMOD, HU8CWI2, IN8ISCII, IS8PC861, IW8ISO8859P8, IW8MACHEBREWS, IW8MSWIN1255, IW8PC1507, JA16EUC, JA16EUCTILDE, JA16SJIS, JA16SJISTILDE, JA16VMS, KO16KSC5601, KO16KSCCS, KO16MSWIN949, LA8ISO6937, LA8PASSPORT, LT8MSWIN921, LT8PC772, LT8PC774, LV8PC1117, LV8PC8LR, LV8RST104090, N8PC865, NE8ISO8859P10, NEE8ISO8859P4, RU8BESTA, RU8PC855, RU8PC866, SE8ISO8859P3, TH8MACTHAIS, TH8TISASCII, TR8DEC, TR8MACTURKISHS, TR8MSWIN1254, TR8PC857, US7ASCII, US8PC437, UTF8, VN8MSWIN1258, VN8VN3, WE8DEC, WE8DG, WE8ISO8859P1, WE8ISO8859P15, WE8ISO8859P9, WE8MACROMAN8S, WE8MSWIN1252, WE8NCR4970, WE8NEXTSTEP, WE8PC850, WE8PC858, WE8PC860, WE8ROMAN8, ZHS16CGB231280, ZHS16GBK, ZHT16BIG5, ZHT16CCDC, ZHT16DBT, ZHT16HKSCS, ZHT16MSWIN950, ZHT32EUC, ZHT32SOPS, ZHT32TRIS",
+    )
+    clone_table_space_list: Optional[Any] = Field(
+        None,
+        description="A list of the source Autonomous Database's table space number(s) used to create this partial clone from the backup.",
+    )
+    cluster_placement_group_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the cluster placement group of the Autonomous Serverless Database.",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this AutonomousDatabaseSummary. The `OCID`__ of the compartment.",
+    )
+    compute_count: Optional[float] = Field(
+        None,
+        description="The compute amount (CPUs) available to the database. Minimum and maximum values depend on the compute model and whether the database is an Autonomous Database Serverless instance or an Autonomous Database on Dedicated Exadata Infrastructure. The 'ECPU' compute model requires a minimum value of one, for databases in the elastic resource pool and minimum value of two, otherwise. Required when using the `computeModel` parameter. When using `cpuCoreCount` parameter, it is an error to specify computeCount to a non-null value. Providing `computeModel` and `computeCount` is the preferred method for both OCPU and ECPU.",
+    )
+    compute_model: Optional[Any] = Field(
+        None,
+        description="The compute model of the Autonomous Database. This is required if using the `computeCount` parameter. If using `cpuCoreCount` then it is an error to specify `computeModel` to a non-null value. ECPU compute model is the recommended model and OCPU compute model is legacy. Allowed values for this property are: \"ECPU\", \"OCPU\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    connection_strings: Optional[Any] = Field(
+        None,
+        description="The connection string used to connect to the Autonomous Database. The username for the Service Console is ADMIN. Use the password you entered when creating the Autonomous Database for the password value.",
+    )
+    connection_urls: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    cpu_core_count: Optional[Any] = Field(
+        None,
+        description="The number of CPU cores to be made available to the database. When the ECPU is selected, the value for cpuCoreCount is 0. For Autonomous Database on Dedicated Exadata infrastructure, the maximum number of cores is determined by the infrastructure shape. See `Characteristics of Infrastructure Shapes`__ for shape details. **Note:** This parameter cannot be used with the `ocpuCount` parameter.",
+    )
+    customer_contacts: Optional[Any] = Field(
+        None,
+        description="Customer Contacts.",
+    )
+    data_safe_status: Optional[Any] = Field(
+        None,
+        description='Status of the Data Safe registration for this Autonomous Database. Allowed values for this property are: "REGISTERING", "REGISTERED", "DEREGISTERING", "NOT_REGISTERED", "FAILED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    data_storage_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The quantity of data in the database, in gigabytes. For Autonomous Transaction Processing databases using ECPUs on Serverless Infrastructure, this value is always populated. In all the other cases, this value will be null and `dataStorageSizeInTBs` will be populated instead.",
+    )
+    data_storage_size_in_tbs: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the data_storage_size_in_tbs of this AutonomousDatabaseSummary. The quantity of data in the database, in terabytes. The following points apply to Autonomous Databases on Serverless Infrastructure: - This is an integer field whose value remains null when the data size is in GBs and cannot be converted to TBs (by dividing the GB value by 1024) without rounding error. - To get the exact value of data storage size without rounding error, please see `dataStorageSizeInGBs` of Autonomous Database.",
+    )
+    database_edition: Optional[Any] = Field(
+        None,
+        description="The Oracle Database Edition that applies to the Autonomous databases. Allowed values for this property are: \"STANDARD_EDITION\", \"ENTERPRISE_EDITION\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    database_management_status: Optional[Any] = Field(
+        None,
+        description='Status of Database Management for this Autonomous Database. Allowed values for this property are: "ENABLING", "ENABLED", "DISABLING", "NOT_ENABLED", "FAILED_ENABLING", "FAILED_DISABLING", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    dataguard_region_type: Optional[Any] = Field(
+        None,
+        description="**Deprecated.** The Autonomous Data Guard region type of the Autonomous Database. For Autonomous Database Serverless, Autonomous Data Guard associations have designated primary and standby regions, and these region types do not change when the database changes roles. The standby regions in Autonomous Data Guard associations can be the same region designated as the primary region, or they can be remote regions. Certain database administrative operations may be available only in the primary region of the Autonomous Data Guard association, and cannot be performed when the database using the primary role is operating in a remote Autonomous Data Guard standby region. Allowed values for this property are: \"PRIMARY_DG_REGION\", \"REMOTE_STANDBY_DG_REGION\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    db_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the db_name of this AutonomousDatabaseSummary. The database name.",
+    )
+    db_tools_details: Optional[Any] = Field(
+        None,
+        description="The list of database tools details. This cannot be updated in parallel with any of the following: licenseModel, dbEdition, cpuCoreCount, computeCount, computeModel, whitelistedIps, isMTLSConnectionRequired, openMode, permissionLevel, dbWorkload, privateEndpointLabel, nsgIds, dbVersion, isRefreshable, dbName, scheduledOperations, isLocalDataGuardEnabled, or isFreeTier.",
+    )
+    db_version: Optional[Any] = Field(
+        None,
+        description="A valid Oracle Database version for Autonomous Database.",
+    )
+    db_workload: Optional[Any] = Field(
+        None,
+        description='The Autonomous Database workload type. The following values are valid: - OLTP - indicates an Autonomous Transaction Processing database - DW - indicates an Autonomous Data Warehouse database - AJD - indicates an Autonomous JSON Database - APEX - indicates an Autonomous Database with the Oracle APEX Application Development workload type. This cannot be updated in parallel with any of the following: licenseModel, dbEdition, cpuCoreCount, computeCount, computeModel, adminPassword, whitelistedIps, isMTLSConnectionRequired, privateEndpointLabel, nsgIds, dbVersion, isRefreshable, dbName, scheduledOperations, dbToolsDetails, isLocalDataGuardEnabled, or isFreeTier. Allowed values for this property are: "OLTP", "DW", "AJD", "APEX", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    disaster_recovery_region_type: Optional[Any] = Field(
+        None,
+        description="**Deprecated.** The disaster recovery (DR) region type of the Autonomous Database. For Autonomous Database Serverless instances, DR associations have designated primary and standby regions. These region types do not change when the database changes roles. The standby region in DR associations can be the same region as the primary region, or they can be in a remote regions. Some database administration operations may be available only in the primary region of the DR association, and cannot be performed when the database using the primary role is operating in a remote region. Allowed values for this property are: \"PRIMARY\", \"REMOTE\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="The user-friendly name for the Autonomous Database. The name does not have to be unique.",
+    )
+    encryption_key: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    encryption_key_history_entry: Optional[Any] = Field(
+        None,
+        description="Key History Entry.",
+    )
+    failed_data_recovery_in_seconds: Optional[Any] = Field(
+        None,
+        description="Indicates the number of seconds of data loss for a Data Guard failover.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this AutonomousDatabaseSummary. The `OCID`__ of the Autonomous Database.",
+    )
+    in_memory_area_in_gbs: Optional[Any] = Field(
+        None,
+        description="The area assigned to In-Memory tables in Autonomous Database.",
+    )
+    in_memory_percentage: Optional[Any] = Field(
+        None,
+        description="The percentage of the System Global Area(SGA) assigned to In-Memory tables in Autonomous Database. This property is applicable only to Autonomous Databases on the Exadata Cloud@Customer platform.",
+    )
+    infrastructure_type: Optional[Any] = Field(
+        None,
+        description="The infrastructure type this resource belongs to. Allowed values for this property are: \"CLOUD\", \"CLOUD_AT_CUSTOMER\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    is_access_control_enabled: Optional[Any] = Field(
+        None,
+        description="Indicates if the database-level access control is enabled. If disabled, database access is defined by the network security rules. If enabled, database access is restricted to the IP addresses defined by the rules specified with the `whitelistedIps` property. While specifying `whitelistedIps` rules is optional, if database-level access control is enabled and no rules are specified, the database will become inaccessible. The rules can be added later using the `UpdateAutonomousDatabase` API operation or edit option in console. When creating a database clone, the desired access control setting should be specified. By default, database-level access control will be disabled for the clone. This property is applicable only to Autonomous Databases on the Exadata Cloud@Customer platform. For Autonomous Database Serverless instances, `whitelistedIps` is used.",
+    )
+    is_auto_scaling_enabled: Optional[Any] = Field(
+        None,
+        description="Indicates if auto scaling is enabled for the Autonomous Database CPU core count. The default value is `TRUE`.",
+    )
+    is_auto_scaling_for_storage_enabled: Optional[Any] = Field(
+        None,
+        description="Indicates if auto scaling is enabled for the Autonomous Database storage. The default value is `FALSE`.",
+    )
+    is_backup_retention_locked: Optional[Any] = Field(
+        None,
+        description="Indicates if the Autonomous Database is backup retention locked.",
+    )
+    is_data_guard_enabled: Optional[Any] = Field(
+        None,
+        description="**Deprecated.** Indicates whether the Autonomous Database has local (in-region) Data Guard enabled. Not applicable to cross-region Autonomous Data Guard associations, or to Autonomous Databases using dedicated Exadata infrastructure or Exadata Cloud@Customer infrastructure.",
+    )
+    is_dedicated: Optional[Any] = Field(
+        None,
+        description="True if the database uses `dedicated Exadata infrastructure`__.",
+    )
+    is_dev_tier: Optional[Any] = Field(
+        None,
+        description="Autonomous Database for Developers are fixed-shape Autonomous Databases that developers can use to build and test new applications. On Serverless, these are low-cost and billed per instance, on Dedicated and Cloud@Customer there is no additional cost to create Developer databases. Developer databases come with limited resources and is not intended for large-scale testing and production deployments. When you need more compute or storage resources, you may upgrade to a full paid production database.",
+    )
+    is_free_tier: Optional[Any] = Field(
+        None,
+        description="Indicates if this is an Always Free resource. The default value is false. Note that Always Free Autonomous Databases have 1 CPU and 20GB of memory. For Always Free databases, memory and CPU cannot be scaled. This cannot be updated in parallel with any of the following: licenseModel, dbEdition, cpuCoreCount, computeCount, computeModel, adminPassword, whitelistedIps, isMTLSConnectionRequired, openMode, permissionLevel, privateEndpointLabel, nsgIds, dbVersion, isRefreshable, dbName, scheduledOperations, dbToolsDetails, or isLocalDataGuardEnabled",
+    )
+    is_local_data_guard_enabled: Optional[Any] = Field(
+        None,
+        description="Indicates whether the Autonomous Database has local (in-region) Data Guard enabled. Not applicable to cross-region Autonomous Data Guard associations, or to Autonomous Databases using dedicated Exadata infrastructure or Exadata Cloud@Customer infrastructure.",
+    )
+    is_mtls_connection_required: Optional[Any] = Field(
+        None,
+        description="Specifies if the Autonomous Database requires mTLS connections. This may not be updated in parallel with any of the following: licenseModel, databaseEdition, cpuCoreCount, computeCount, dataStorageSizeInTBs, whitelistedIps, openMode, permissionLevel, db-workload, privateEndpointLabel, nsgIds, customerContacts, dbVersion, scheduledOperations, dbToolsDetails, isLocalDataGuardEnabled, or isFreeTier. Service Change: The default value of the isMTLSConnectionRequired attribute will change from true to false on July 1, 2023 in the following APIs: - CreateAutonomousDatabase - GetAutonomousDatabase - UpdateAutonomousDatabase Details: Prior to the July 1, 2023 change, the isMTLSConnectionRequired attribute default value was true. This applies to Autonomous Database Serverless. Does this impact me? If you use or maintain custom scripts or Terraform scripts referencing the CreateAutonomousDatabase, GetAutonomousDatabase, or UpdateAutonomousDatabase APIs, you want to check, and possibly modify, the scripts for the changed default value of the attribute. Should you choose not to leave your scripts unchanged, the API calls containing this attribute will continue to work, but the default value will switch from true to false. How do I make this change? Using either OCI SDKs or command line tools, update your custom scripts to explicitly set the isMTLSConnectionRequired attribute to true.",
+    )
+    is_preview: Optional[Any] = Field(
+        None,
+        description="Indicates if the Autonomous Database version is a preview version.",
+    )
+    is_reconnect_clone_enabled: Optional[Any] = Field(
+        None,
+        description="Indicates if the refreshable clone can be reconnected to its source database.",
+    )
+    is_refreshable_clone: Optional[Any] = Field(
+        None,
+        description="Indicates if the Autonomous Database is a refreshable clone. This cannot be updated in parallel with any of the following: cpuCoreCount, computeCount, computeModel, adminPassword, whitelistedIps, openMode, permissionLevel, dbWorkload, privateEndpointLabel, nsgIds, dbVersion, dbName, scheduledOperations, dbToolsDetails, isLocalDataGuardEnabled, or isFreeTier.",
+    )
+    is_remote_data_guard_enabled: Optional[Any] = Field(
+        None,
+        description="Indicates whether the Autonomous Database has Cross Region Data Guard enabled. Not applicable to Autonomous Databases using dedicated Exadata infrastructure or Exadata Cloud@Customer infrastructure.",
+    )
+    key_history_entry: Optional[Any] = Field(
+        None,
+        description="Key History Entry.",
+    )
+    key_store_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the key store of Oracle Vault.",
+    )
+    key_store_wallet_name: Optional[Any] = Field(
+        None,
+        description="The wallet name for Oracle Key Vault.",
+    )
+    kms_key_id: Optional[Any] = Field(
+        None,
+        description="The OCID of the key container that is used as the master encryption key in database transparent data encryption (TDE) operations.",
+    )
+    kms_key_lifecycle_details: Optional[Any] = Field(
+        None,
+        description="KMS key lifecycle details.",
+    )
+    kms_key_version_id: Optional[Any] = Field(
+        None,
+        description="The OCID of the key container version that is used in database transparent data encryption (TDE) operations KMS Key can have multiple key versions. If none is specified, the current key version (latest) of the Key Id is used for the operation. Autonomous Database Serverless does not use key versions, hence is not applicable for Autonomous Database Serverless instances.",
+    )
+    license_model: Optional[Any] = Field(
+        None,
+        description="The Oracle license model that applies to the Oracle Autonomous Database. Bring your own license (BYOL) allows you to apply your current on-premises Oracle software licenses to equivalent, highly automated Oracle services in the cloud. License Included allows you to subscribe to new Oracle Database software licenses and the Oracle Database service. Note that when provisioning an `Autonomous Database on dedicated Exadata infrastructure`__, this attribute must be null. It is already set at the Autonomous Exadata Infrastructure level. When provisioning an `Autonomous Database Serverless]`__ database, if a value is not specified, the system defaults the value to `BRING_YOUR_OWN_LICENSE`. Bring your own license (BYOL) also allows you to select the DB edition using the optional parameter. This cannot be updated in parallel with any of the following: cpuCoreCount, computeCount, dataStorageSizeInTBs, adminPassword, isMTLSConnectionRequired, dbWorkload, privateEndpointLabel, nsgIds, dbVersion, dbName, scheduledOperations, dbToolsDetails, or isFreeTier. Allowed values for this property are: \"LICENSE_INCLUDED\", \"BRING_YOUR_OWN_LICENSE\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this AutonomousDatabaseSummary. The current state of the Autonomous Database. Allowed values for this property are: "PROVISIONING", "AVAILABLE", "STOPPING", "STOPPED", "STARTING", "TERMINATING", "TERMINATED", "UNAVAILABLE", "RESTORE_IN_PROGRESS", "RESTORE_FAILED", "BACKUP_IN_PROGRESS", "SCALE_IN_PROGRESS", "AVAILABLE_NEEDS_ATTENTION", "UPDATING", "MAINTENANCE_IN_PROGRESS", "RESTARTING", "RECREATING", "ROLE_CHANGE_IN_PROGRESS", "UPGRADING", "INACCESSIBLE", "STANDBY", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    local_adg_auto_failover_max_data_loss_limit: Optional[Any] = Field(
+        None,
+        description="Parameter that allows users to select an acceptable maximum data loss limit in seconds, up to which Automatic Failover will be triggered when necessary for a Local Autonomous Data Guard",
+    )
+    local_disaster_recovery_type: Optional[Any] = Field(
+        None,
+        description="Indicates the local disaster recovery (DR) type of the Autonomous Database Serverless instance. Autonomous Data Guard (ADG) DR type provides business critical DR with a faster recovery time objective (RTO) during failover or switchover. Backup-based DR type provides lower cost DR with a slower RTO during failover or switchover.",
+    )
+    local_standby_db: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    long_term_backup_schedule: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    memory_per_oracle_compute_unit_in_gbs: Optional[Any] = Field(
+        None,
+        description="The amount of memory (in GBs) enabled per ECPU or OCPU.",
+    )
+    ncharacter_set: Optional[Any] = Field(
+        None,
+        description="The national character set for the autonomous database. The default is AL16UTF16. Allowed values are: AL16UTF16 or UTF8.",
+    )
+    net_services_architecture: Optional[Any] = Field(
+        None,
+        description="Enabling SHARED server architecture enables a database server to allow many client processes to share very few server processes, thereby increasing the number of supported users. Allowed values for this property are: \"DEDICATED\", \"SHARED\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    next_long_term_backup_time_stamp: Optional[Any] = Field(
+        None,
+        description="The date and time when the next long-term backup would be created.",
+    )
+    nsg_ids: Optional[Any] = Field(
+        None,
+        description="The list of `OCIDs`__ for the network security groups (NSGs) to which this resource belongs. Setting this to an empty list removes all resources from all NSGs. For more information about NSGs, see `Security Rules`__. **NsgIds restrictions:** - A network security group (NSG) is optional for Autonomous Databases with private access. The nsgIds list can be empty.",
+    )
+    ocpu_count: Optional[float] = Field(
+        None,
+        description="The number of OCPU cores to be made available to the database. The following points apply: - For Autonomous Databases on Dedicated Exadata Infrastructure, to provision less than 1 core, enter a fractional value in an increment of 0.1. For example, you can provision 0.3 or 0.4 cores, but not 0.35 cores. (Note that fractional OCPU values are not supported for Autonomous Database Serverless instances.) - To provision cores, enter an integer between 1 and the maximum number of cores available for the infrastructure shape. For example, you can provision 2 cores or 3 cores, but not 2.5 cores. This applies to Autonomous Databases on both serverless and dedicated Exadata infrastructure. - For Autonomous Database Serverless instances, this parameter is not used. For Autonomous Databases on Dedicated Exadata Infrastructure, the maximum number of cores is determined by the infrastructure shape. See `Characteristics of Infrastructure Shapes`__ for shape details. **Note:** This parameter cannot be used with the `cpuCoreCount` parameter.",
+    )
+    open_mode: Optional[Any] = Field(
+        None,
+        description="Indicates the Autonomous Database mode. The database can be opened in `READ_ONLY` or `READ_WRITE` mode. This cannot be updated in parallel with any of the following: cpuCoreCount, computeCount, computeModel, adminPassword, whitelistedIps, isMTLSConnectionRequired, dbVersion, isRefreshable, dbName, scheduledOperations, dbToolsDetails, or isFreeTier. Allowed values for this property are: \"READ_ONLY\", \"READ_WRITE\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    operations_insights_status: Optional[Any] = Field(
+        None,
+        description='Status of Operations Insights for this Autonomous Database. Allowed values for this property are: "ENABLING", "ENABLED", "DISABLING", "NOT_ENABLED", "FAILED_ENABLING", "FAILED_DISABLING", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    peer_db_ids: Optional[Any] = Field(
+        None,
+        description="The list of `OCIDs`__ of standby databases located in Autonomous Data Guard remote regions that are associated with the source database. Note that for Autonomous Database Serverless instances, standby databases located in the same region as the source primary database do not have OCIDs.",
+    )
+    permission_level: Optional[Any] = Field(
+        None,
+        description="The Autonomous Database permission level. Restricted mode allows access only by admin users. This cannot be updated in parallel with any of the following: cpuCoreCount, computeCount, computeModel, adminPassword, whitelistedIps, isMTLSConnectionRequired, nsgIds, dbVersion, isRefreshable, dbName, scheduledOperations, dbToolsDetails, or isFreeTier. Allowed values for this property are: \"RESTRICTED\", \"UNRESTRICTED\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    private_endpoint: Optional[Any] = Field(
+        None,
+        description="The private endpoint for the resource.",
+    )
+    private_endpoint_ip: Optional[Any] = Field(
+        None,
+        description="The private endpoint Ip address for the resource.",
+    )
+    private_endpoint_label: Optional[Any] = Field(
+        None,
+        description="The resource's private endpoint label. - Setting the endpoint label to a non-empty string creates a private endpoint database. - Resetting the endpoint label to an empty string, after the creation of the private endpoint database, changes the private endpoint database to a public endpoint database. - Setting the endpoint label to a non-empty string value, updates to a new private endpoint database, when the database is disabled and re-enabled. This setting cannot be updated in parallel with any of the following: licenseModel, dbEdition, cpuCoreCount, computeCount, computeModel, adminPassword, whitelistedIps, isMTLSConnectionRequired, dbWorkload, dbVersion, isRefreshable, dbName, scheduledOperations, dbToolsDetails, or isFreeTier.",
+    )
+    provisionable_cpus: Optional[Any] = Field(
+        None,
+        description="An array of CPU values that an Autonomous Database can be scaled to.",
+    )
+    public_connection_urls: Optional[Any] = Field(
+        None,
+        description="The Public URLs of Private Endpoint database for accessing Oracle Application Express (APEX) and SQL Developer Web with a browser from a Compute instance within your VCN or that has a direct connection to your VCN.",
+    )
+    public_endpoint: Optional[Any] = Field(
+        None,
+        description="The public endpoint for the private endpoint enabled resource.",
+    )
+    refreshable_mode: Optional[Any] = Field(
+        None,
+        description="The refresh mode of the clone. AUTOMATIC indicates that the clone is automatically being refreshed with data from the source Autonomous Database. Allowed values for this property are: \"AUTOMATIC\", \"MANUAL\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    refreshable_status: Optional[Any] = Field(
+        None,
+        description="The refresh status of the clone. REFRESHING indicates that the clone is currently being refreshed with data from the source Autonomous Database. Allowed values for this property are: \"REFRESHING\", \"NOT_REFRESHING\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    remote_disaster_recovery_configuration: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    resource_pool_leader_id: Optional[Any] = Field(
+        None,
+        description="The unique identifier for leader autonomous database OCID `OCID`__.",
+    )
+    resource_pool_summary: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    role: Optional[Any] = Field(
+        None,
+        description='The Data Guard role of the Autonomous Container Database or Autonomous Database, if Autonomous Data Guard is enabled. Allowed values for this property are: "PRIMARY", "STANDBY", "DISABLED_STANDBY", "BACKUP_COPY", "SNAPSHOT_STANDBY", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    scheduled_operations: Optional[Any] = Field(
+        None,
+        description="The list of scheduled operations. Consists of values such as dayOfWeek, scheduledStartTime, scheduledStopTime. This cannot be updated in parallel with any of the following: licenseModel, dbEdition, cpuCoreCount, computeCount, computeModel, whitelistedIps, isMTLSConnectionRequired, openMode, permissionLevel, dbWorkload, privateEndpointLabel, nsgIds, dbVersion, isRefreshable, dbName, dbToolsDetails, isLocalDataGuardEnabled, or isFreeTier.",
+    )
+    security_attributes: Optional[Any] = Field(
+        None,
+        description='Security Attributes for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__. Example: `{"Oracle-ZPR": {"MaxEgressCount": {"value": "42", "mode": "audit"}}}`',
+    )
+    service_console_url: Optional[Any] = Field(
+        None,
+        description="The URL of the Service Console for the Autonomous Database.",
+    )
+    source_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the source Autonomous Database that was cloned to create the current Autonomous Database.",
+    )
+    standby_db: Optional[Any] = Field(
+        None,
+        description="**Deprecated** Autonomous Data Guard standby database details.",
+    )
+    standby_whitelisted_ips: Optional[Any] = Field(
+        None,
+        description='The client IP access control list (ACL). This feature is available for `Autonomous Database Serverless]`__ and on Exadata Cloud@Customer. Only clients connecting from an IP address included in the ACL may access the Autonomous Database instance. If `arePrimaryWhitelistedIpsUsed` is \'TRUE\' then Autonomous Database uses this primary\'s IP access control list (ACL) for the disaster recovery peer called `standbywhitelistedips`. For Autonomous Database Serverless, this is an array of CIDR (classless inter-domain routing) notations for a subnet or VCN OCID (virtual cloud network Oracle Cloud ID). Multiple IPs and VCN OCIDs should be separate strings separated by commas, but if it’s other configurations that need multiple pieces of information then its each piece is connected with semicolon (;) as a delimiter. Example: `["1.1.1.1","1.1.1.0/24","ocid1.vcn.oc1.sea.<unique_id>","ocid1.vcn.oc1.sea.<unique_id1>;1.1.1.1","ocid1.vcn.oc1.sea.<unique_id2>;1.1.0.0/16"]` For Exadata Cloud@Customer, this is an array of IP addresses or CIDR notations. Example: `["1.1.1.1","1.1.1.0/24","1.1.2.25"]` For an update operation, if you want to delete all the IPs in the ACL, use an array with a single empty string entry. This cannot be updated in parallel with any of the following: licenseModel, dbEdition, cpuCoreCount, computeCount, computeModel, adminPassword, isMTLSConnectionRequired, openMode, permissionLevel, dbWorkload, dbVersion, isRefreshable, dbName, scheduledOperations, dbToolsDetails, isLocalDataGuardEnabled, or isFreeTier.',
+    )
+    subnet_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the subnet the resource is associated with. **Subnet Restrictions:** - For bare metal DB systems and for single node virtual machine DB systems, do not use a subnet that overlaps with 192.168.16.16/28. - For Exadata and virtual machine 2-node RAC systems, do not use a subnet that overlaps with 192.168.128.0/20. - For Autonomous Database, setting this will disable public secure access to the database. These subnets are used by the Oracle Clusterware private interconnect on the database instance. Specifying an overlapping subnet will cause the private interconnect to malfunction. This restriction applies to both the client subnet and the backup subnet.",
+    )
+    subscription_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the subscription with which resource needs to be associated with.",
+    )
+    supported_regions_to_clone_to: Optional[Any] = Field(
+        None,
+        description="The list of regions that support the creation of an Autonomous Database clone or an Autonomous Data Guard standby database.",
+    )
+    system_tags: Optional[Any] = Field(
+        None,
+        description="System tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time the Autonomous Database was created.",
+    )
+    time_data_guard_role_changed: Optional[Any] = Field(
+        None,
+        description='The date and time the Autonomous Data Guard role was switched for the Autonomous Database. For databases that have standbys in both the primary Data Guard region and a remote Data Guard standby region, this is the latest timestamp of either the database using the "primary" role in the primary Data Guard region, or database located in the remote Data Guard standby region.',
+    )
+    time_deletion_of_free_autonomous_database: Optional[Any] = Field(
+        None,
+        description="The date and time the Always Free database will be automatically deleted because of inactivity. If the database is in the STOPPED state and without activity until this time, it will be deleted.",
+    )
+    time_disaster_recovery_role_changed: Optional[Any] = Field(
+        None,
+        description="The date and time the Disaster Recovery role was switched for the standby Autonomous Database.",
+    )
+    time_local_data_guard_enabled: Optional[Any] = Field(
+        None,
+        description="The date and time that Autonomous Data Guard was enabled for an Autonomous Database where the standby was provisioned in the same region as the primary database.",
+    )
+    time_maintenance_begin: Optional[Any] = Field(
+        None,
+        description="The date and time when maintenance will begin.",
+    )
+    time_maintenance_end: Optional[Any] = Field(
+        None,
+        description="The date and time when maintenance will end.",
+    )
+    time_of_auto_refresh_start: Optional[Any] = Field(
+        None,
+        description="The the date and time that auto-refreshing will begin for an Autonomous Database refreshable clone. This value controls only the start time for the first refresh operation. Subsequent (ongoing) refresh operations have start times controlled by the value of the `autoRefreshFrequencyInSeconds` parameter.",
+    )
+    time_of_joining_resource_pool: Optional[Any] = Field(
+        None,
+        description="The time the member joined the resource pool.",
+    )
+    time_of_last_failover: Optional[Any] = Field(
+        None,
+        description="The timestamp of the last failover operation.",
+    )
+    time_of_last_refresh: Optional[Any] = Field(
+        None,
+        description="The date and time when last refresh happened.",
+    )
+    time_of_last_refresh_point: Optional[Any] = Field(
+        None,
+        description="The refresh point timestamp (UTC). The refresh point is the time to which the database was most recently refreshed. Data created after the refresh point is not included in the refresh.",
+    )
+    time_of_last_switchover: Optional[Any] = Field(
+        None,
+        description="The timestamp of the last switchover operation for the Autonomous Database.",
+    )
+    time_of_next_refresh: Optional[Any] = Field(
+        None,
+        description="The date and time of next refresh.",
+    )
+    time_reclamation_of_free_autonomous_database: Optional[Any] = Field(
+        None,
+        description="The date and time the Always Free database will be stopped because of inactivity. If this time is reached without any database activity, the database will automatically be put into the STOPPED state.",
+    )
+    time_undeleted: Optional[Any] = Field(
+        None,
+        description="The date and time the Autonomous Database was most recently undeleted.",
+    )
+    time_until_reconnect_clone_enabled: Optional[Any] = Field(
+        None,
+        description="The time and date as an RFC3339 formatted string, e.g., 2022-01-01T12:00:00.000Z, to set the limit for a refreshable clone to be reconnected to its source database.",
+    )
+    total_backup_storage_size_in_gbs: Optional[float] = Field(
+        None,
+        description="The backup storage to the database.",
+    )
+    used_data_storage_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The storage space consumed by Autonomous Database in GBs.",
+    )
+    used_data_storage_size_in_tbs: Optional[Any] = Field(
+        None,
+        description="The amount of storage that has been used for Autonomous Databases in dedicated infrastructure, in terabytes.",
+    )
+    vault_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Oracle Cloud Infrastructure `vault`__. This parameter and `secretId` are required for Customer Managed Keys.",
+    )
+    whitelisted_ips: Optional[Any] = Field(
+        None,
+        description='The client IP access control list (ACL). This feature is available for `Autonomous Database Serverless]`__ and on Exadata Cloud@Customer. Only clients connecting from an IP address included in the ACL may access the Autonomous Database instance. If `arePrimaryWhitelistedIpsUsed` is \'TRUE\' then Autonomous Database uses this primary\'s IP access control list (ACL) for the disaster recovery peer called `standbywhitelistedips`. For Autonomous Database Serverless, this is an array of CIDR (classless inter-domain routing) notations for a subnet or VCN OCID (virtual cloud network Oracle Cloud ID). Multiple IPs and VCN OCIDs should be separate strings separated by commas, but if it’s other configurations that need multiple pieces of information then its each piece is connected with semicolon (;) as a delimiter. Example: `["1.1.1.1","1.1.1.0/24","ocid1.vcn.oc1.sea.<unique_id>","ocid1.vcn.oc1.sea.<unique_id1>;1.1.1.1","ocid1.vcn.oc1.sea.<unique_id2>;1.1.0.0/16"]` For Exadata Cloud@Customer, this is an array of IP addresses or CIDR notations. Example: `["1.1.1.1","1.1.1.0/24","1.1.2.25"]` For an update operation, if you want to delete all the IPs in the ACL, use an array with a single empty string entry. This cannot be updated in parallel with any of the following: licenseModel, dbEdition, cpuCoreCount, computeCount, computeModel, adminPassword, isMTLSConnectionRequired, openMode, permissionLevel, dbWorkload, dbVersion, isRefreshable, dbName, scheduledOperations, dbToolsDetails, isLocalDataGuardEnabled, or isFreeTier.',
+    )
+
+
+def map_autonomousdatabasesummary(
+    o: oci.database.models.AutonomousDatabaseSummary,
+    fields: Optional[list[str]] = None,
+) -> AutonomousDatabaseSummary | None:
+    """Map oci.database.models.AutonomousDatabaseSummary → AutonomousDatabaseSummary Pydantic model."""
+    return map_model(AutonomousDatabaseSummary, o, fields)
+
+
+class AutonomousDatabaseDataguardAssociation(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.AutonomousDatabaseDataguardAssociation."""
+
+    apply_lag: Optional[Any] = Field(
+        None,
+        description="The lag time between updates to the primary database and application of the redo data on the standby database, as computed by the reporting database. Example: `9 seconds`",
+    )
+    apply_rate: Optional[Any] = Field(
+        None,
+        description="The rate at which redo logs are synced between the associated databases. Example: `180 Mb per second`",
+    )
+    autonomous_database_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the autonomous_database_id of this AutonomousDatabaseDataguardAssociation. The `OCID`__ of the Autonomous Database that has a relationship with the peer Autonomous Database.",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this AutonomousDatabaseDataguardAssociation. The OCID of the Autonomous Dataguard created for Autonomous Container Database where given Autonomous Database resides in.",
+    )
+    is_automatic_failover_enabled: Optional[Any] = Field(
+        None,
+        description="Indicates whether Automatic Failover is enabled for Autonomous Container Database Dataguard Association",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycleState, if available.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this AutonomousDatabaseDataguardAssociation. The current state of Autonomous Data Guard. Allowed values for this property are: "PROVISIONING", "AVAILABLE", "ROLE_CHANGE_IN_PROGRESS", "TERMINATING", "TERMINATED", "FAILED", "UNAVAILABLE", "UPDATING", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    peer_autonomous_database_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the peer Autonomous Database.",
+    )
+    peer_autonomous_database_life_cycle_state: Optional[Any] = Field(
+        None,
+        description='The current state of the Autonomous Database. Allowed values for this property are: "PROVISIONING", "AVAILABLE", "STOPPING", "STOPPED", "STARTING", "TERMINATING", "TERMINATED", "UNAVAILABLE", "RESTORE_IN_PROGRESS", "RESTORE_FAILED", "BACKUP_IN_PROGRESS", "SCALE_IN_PROGRESS", "AVAILABLE_NEEDS_ATTENTION", "UPDATING", "MAINTENANCE_IN_PROGRESS", "RESTARTING", "RECREATING", "ROLE_CHANGE_IN_PROGRESS", "UPGRADING", "INACCESSIBLE", "STANDBY", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    peer_role: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the peer_role of this AutonomousDatabaseDataguardAssociation. The Data Guard role of the Autonomous Container Database or Autonomous Database, if Autonomous Data Guard is enabled. Allowed values for this property are: "PRIMARY", "STANDBY", "DISABLED_STANDBY", "BACKUP_COPY", "SNAPSHOT_STANDBY", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    protection_mode: Optional[Any] = Field(
+        None,
+        description="The protection mode of this Autonomous Data Guard association. For more information, see `Oracle Data Guard Protection Modes`__ in the Oracle Data Guard documentation. Allowed values for this property are: \"MAXIMUM_AVAILABILITY\", \"MAXIMUM_PERFORMANCE\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    role: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the role of this AutonomousDatabaseDataguardAssociation. The Data Guard role of the Autonomous Container Database or Autonomous Database, if Autonomous Data Guard is enabled. Allowed values for this property are: "PRIMARY", "STANDBY", "DISABLED_STANDBY", "BACKUP_COPY", "SNAPSHOT_STANDBY", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time the Data Guard association was created.",
+    )
+    time_last_role_changed: Optional[Any] = Field(
+        None,
+        description="The date and time when the last role change action happened.",
+    )
+    time_last_synced: Optional[Any] = Field(
+        None,
+        description="The date and time of the last update to the apply lag, apply rate, and transport lag values.",
+    )
+    transport_lag: Optional[Any] = Field(
+        None,
+        description="The approximate number of seconds of redo data not yet available on the standby Autonomous Container Database, as computed by the reporting database. Example: `7 seconds`",
+    )
+
+
+def map_autonomousdatabasedataguardassociation(
+    o: oci.database.models.AutonomousDatabaseDataguardAssociation,
+    fields: Optional[list[str]] = None,
+) -> AutonomousDatabaseDataguardAssociation | None:
+    """Map oci.database.models.AutonomousDatabaseDataguardAssociation → AutonomousDatabaseDataguardAssociation Pydantic model."""
+    return map_model(AutonomousDatabaseDataguardAssociation, o, fields)
+
+
+class AutonomousDatabasePeerCollection(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.AutonomousDatabasePeerCollection."""
+
+    items: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the items of this AutonomousDatabasePeerCollection. This array holds details about Autonomous Database Peers for Oracle an Autonomous Database.",
+    )
+
+
+def map_autonomousdatabasepeercollection(
+    o: oci.database.models.AutonomousDatabasePeerCollection,
+    fields: Optional[list[str]] = None,
+) -> AutonomousDatabasePeerCollection | None:
+    """Map oci.database.models.AutonomousDatabasePeerCollection → AutonomousDatabasePeerCollection Pydantic model."""
+    return map_model(AutonomousDatabasePeerCollection, o, fields)
+
+
+class RefreshableCloneCollection(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.RefreshableCloneCollection."""
+
+    items: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the items of this RefreshableCloneCollection.",
+    )
+
+
+def map_refreshableclonecollection(
+    o: oci.database.models.RefreshableCloneCollection,
+    fields: Optional[list[str]] = None,
+) -> RefreshableCloneCollection | None:
+    """Map oci.database.models.RefreshableCloneCollection → RefreshableCloneCollection Pydantic model."""
+    return map_model(RefreshableCloneCollection, o, fields)
+
+
+class AutonomousDatabaseSoftwareImageCollection(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.AutonomousDatabaseSoftwareImageCollection."""
+
+    items: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the items of this AutonomousDatabaseSoftwareImageCollection. List of Autonomous Database Software Images.",
+    )
+
+
+def map_autonomousdatabasesoftwareimagecollection(
+    o: oci.database.models.AutonomousDatabaseSoftwareImageCollection,
+    fields: Optional[list[str]] = None,
+) -> AutonomousDatabaseSoftwareImageCollection | None:
+    """Map oci.database.models.AutonomousDatabaseSoftwareImageCollection → AutonomousDatabaseSoftwareImageCollection Pydantic model."""
+    return map_model(AutonomousDatabaseSoftwareImageCollection, o, fields)
+
+
+class AutonomousDbPreviewVersionSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.AutonomousDbPreviewVersionSummary."""
+
+    db_workload: Optional[Any] = Field(
+        None,
+        description='The Autonomous Database workload type. The following values are valid: - OLTP - indicates an Autonomous Transaction Processing database - DW - indicates an Autonomous Data Warehouse database - AJD - indicates an Autonomous JSON Database - APEX - indicates an Autonomous Database with the Oracle APEX Application Development workload type. This cannot be updated in parallel with any of the following: licenseModel, dbEdition, cpuCoreCount, computeCount, computeModel, adminPassword, whitelistedIps, isMTLSConnectionRequired, privateEndpointLabel, nsgIds, dbVersion, isRefreshable, dbName, scheduledOperations, dbToolsDetails, isLocalDataGuardEnabled, or isFreeTier. Allowed values for this property are: "OLTP", "DW", "AJD", "APEX", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    details: Optional[Any] = Field(
+        None,
+        description="A URL that points to a detailed description of the preview version.",
+    )
+    time_preview_begin: Optional[Any] = Field(
+        None,
+        description="The date and time when the preview version availability begins.",
+    )
+    time_preview_end: Optional[Any] = Field(
+        None,
+        description="The date and time when the preview version availability ends.",
+    )
+    version: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the version of this AutonomousDbPreviewVersionSummary. A valid Autonomous Database preview version.",
+    )
+
+
+def map_autonomousdbpreviewversionsummary(
+    o: oci.database.models.AutonomousDbPreviewVersionSummary,
+    fields: Optional[list[str]] = None,
+) -> AutonomousDbPreviewVersionSummary | None:
+    """Map oci.database.models.AutonomousDbPreviewVersionSummary → AutonomousDbPreviewVersionSummary Pydantic model."""
+    return map_model(AutonomousDbPreviewVersionSummary, o, fields)
+
+
+class AutonomousDbVersionSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.AutonomousDbVersionSummary."""
+
+    db_workload: Optional[Any] = Field(
+        None,
+        description='The Autonomous Database workload type. The following values are valid: - OLTP - indicates an Autonomous Transaction Processing database - DW - indicates an Autonomous Data Warehouse database - AJD - indicates an Autonomous JSON Database - APEX - indicates an Autonomous Database with the Oracle APEX Application Development workload type. This cannot be updated in parallel with any of the following: licenseModel, dbEdition, cpuCoreCount, computeCount, computeModel, adminPassword, whitelistedIps, isMTLSConnectionRequired, privateEndpointLabel, nsgIds, dbVersion, isRefreshable, dbName, scheduledOperations, dbToolsDetails, isLocalDataGuardEnabled, or isFreeTier. Allowed values for this property are: "OLTP", "DW", "AJD", "APEX", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    details: Optional[Any] = Field(
+        None,
+        description="A URL that points to a detailed description of the Autonomous Database version.",
+    )
+    is_dedicated: Optional[Any] = Field(
+        None,
+        description="True if the database uses `dedicated Exadata infrastructure`__.",
+    )
+    is_default_for_free: Optional[Any] = Field(
+        None,
+        description="True if this version of the Oracle Database software's default is free.",
+    )
+    is_default_for_paid: Optional[Any] = Field(
+        None,
+        description="True if this version of the Oracle Database software's default is paid.",
+    )
+    is_free_tier_enabled: Optional[Any] = Field(
+        None,
+        description="True if this version of the Oracle Database software can be used for Always-Free Autonomous Databases.",
+    )
+    is_paid_enabled: Optional[Any] = Field(
+        None,
+        description="True if this version of the Oracle Database software has payments enabled.",
+    )
+    version: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the version of this AutonomousDbVersionSummary. A valid Oracle Database version for Autonomous Database.",
+    )
+
+
+def map_autonomousdbversionsummary(
+    o: oci.database.models.AutonomousDbVersionSummary,
+    fields: Optional[list[str]] = None,
+) -> AutonomousDbVersionSummary | None:
+    """Map oci.database.models.AutonomousDbVersionSummary → AutonomousDbVersionSummary Pydantic model."""
+    return map_model(AutonomousDbVersionSummary, o, fields)
+
+
+class AutonomousVirtualMachineSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.AutonomousVirtualMachineSummary."""
+
+    autonomous_vm_cluster_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Autonomous VM Cluster associated with the Autonomous Virtual Machine.",
+    )
+    client_ip_address: Optional[Any] = Field(
+        None,
+        description="Client IP Address.",
+    )
+    cloud_autonomous_vm_cluster_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Cloud Autonomous VM Cluster associated with the Autonomous Virtual Machine.",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the compartment.",
+    )
+    cpu_core_count: Optional[Any] = Field(
+        None,
+        description="The number of CPU cores enabled on the Autonomous Virtual Machine.",
+    )
+    db_node_storage_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The allocated local node storage in GBs on the Autonomous Virtual Machine.",
+    )
+    db_server_display_name: Optional[Any] = Field(
+        None,
+        description="The display name of the dbServer associated with the Autonomous Virtual Machine.",
+    )
+    db_server_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Db server associated with the Autonomous Virtual Machine.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this AutonomousVirtualMachineSummary. The `OCID`__ of the Autonomous Virtual Machine.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this AutonomousVirtualMachineSummary. The current state of the Autonomous Virtual Machine. Allowed values for this property are: "PROVISIONING", "AVAILABLE", "UPDATING", "TERMINATING", "TERMINATED", "FAILED", "MAINTENANCE_IN_PROGRESS", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    memory_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The allocated memory in GBs on the Autonomous Virtual Machine.",
+    )
+    vm_name: Optional[Any] = Field(
+        None,
+        description="The name of the Autonomous Virtual Machine.",
+    )
+
+
+def map_autonomousvirtualmachinesummary(
+    o: oci.database.models.AutonomousVirtualMachineSummary,
+    fields: Optional[list[str]] = None,
+) -> AutonomousVirtualMachineSummary | None:
+    """Map oci.database.models.AutonomousVirtualMachineSummary → AutonomousVirtualMachineSummary Pydantic model."""
+    return map_model(AutonomousVirtualMachineSummary, o, fields)
+
+
+class AutonomousVmClusterSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.AutonomousVmClusterSummary."""
+
+    autonomous_data_storage_percentage: Optional[float] = Field(
+        None,
+        description="The percentage of the data storage used for the Autonomous Databases in an Autonomous VM Cluster.",
+    )
+    autonomous_data_storage_size_in_tbs: Optional[float] = Field(
+        None,
+        description="The data disk group size allocated for Autonomous Databases, in TBs.",
+    )
+    available_autonomous_data_storage_size_in_tbs: Optional[float] = Field(
+        None,
+        description="The data disk group size available for Autonomous Databases, in TBs.",
+    )
+    available_container_databases: Optional[Any] = Field(
+        None,
+        description="The number of Autonomous Container Databases that can be created with the currently available local storage.",
+    )
+    available_cpus: Optional[Any] = Field(
+        None,
+        description="The numnber of CPU cores available.",
+    )
+    available_data_storage_size_in_tbs: Optional[float] = Field(
+        None,
+        description="**Deprecated.** Use `availableAutonomousDataStorageSizeInTBs` for Autonomous Databases' data storage availability in TBs.",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this AutonomousVmClusterSummary. The `OCID`__ of the compartment.",
+    )
+    compute_model: Optional[Any] = Field(
+        None,
+        description="The compute model of the Autonomous VM Cluster. ECPU compute model is the recommended model and OCPU compute model is legacy. See `Compute Models in Autonomous Database on Dedicated Exadata #Infrastructure`__ for more details. Allowed values for this property are: \"ECPU\", \"OCPU\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    cpu_core_count_per_node: Optional[Any] = Field(
+        None,
+        description="The number of CPU cores enabled per VM cluster node.",
+    )
+    cpu_percentage: Optional[float] = Field(
+        None,
+        description="The percentage of total number of CPUs used in an Autonomous VM Cluster.",
+    )
+    cpus_enabled: Optional[Any] = Field(
+        None,
+        description="The number of enabled CPU cores.",
+    )
+    cpus_lowest_scaled_value: Optional[Any] = Field(
+        None,
+        description="The lowest value to which cpus can be scaled down.",
+    )
+    data_storage_size_in_gbs: Optional[float] = Field(
+        None,
+        description="The total data storage allocated in GBs.",
+    )
+    data_storage_size_in_tbs: Optional[float] = Field(
+        None,
+        description="The total data storage allocated in TBs",
+    )
+    db_node_storage_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The local node storage allocated in GBs.",
+    )
+    db_servers: Optional[Any] = Field(
+        None,
+        description="The list of `OCIDs`__ of the Db servers.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this AutonomousVmClusterSummary. The user-friendly name for the Autonomous VM cluster. The name does not need to be unique.",
+    )
+    exadata_infrastructure_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the exadata_infrastructure_id of this AutonomousVmClusterSummary. The `OCID`__ of the Exadata infrastructure.",
+    )
+    exadata_storage_in_tbs_lowest_scaled_value: Optional[float] = Field(
+        None,
+        description="The lowest value to which exadataStorage(in TBs) can be scaled down.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this AutonomousVmClusterSummary. The `OCID`__ of the Autonomous VM cluster.",
+    )
+    is_local_backup_enabled: Optional[Any] = Field(
+        None,
+        description="If true, database backup on local Exadata storage is configured for the Autonomous VM cluster. If false, database backup on local Exadata storage is not available in the Autonomous VM cluster.",
+    )
+    is_mtls_enabled: Optional[Any] = Field(
+        None,
+        description="Enable mutual TLS(mTLS) authentication for database while provisioning a VMCluster. Default is TLS.",
+    )
+    last_maintenance_run_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the last maintenance run.",
+    )
+    license_model: Optional[Any] = Field(
+        None,
+        description="The Oracle license model that applies to the Autonomous VM cluster. The default is LICENSE_INCLUDED. Allowed values for this property are: \"LICENSE_INCLUDED\", \"BRING_YOUR_OWN_LICENSE\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this AutonomousVmClusterSummary. The current state of the Autonomous VM cluster. Allowed values for this property are: "PROVISIONING", "AVAILABLE", "UPDATING", "TERMINATING", "TERMINATED", "FAILED", "MAINTENANCE_IN_PROGRESS", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    maintenance_window: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    max_acds_lowest_scaled_value: Optional[Any] = Field(
+        None,
+        description="The lowest value to which maximum number of ACDs can be scaled down.",
+    )
+    memory_per_oracle_compute_unit_in_gbs: Optional[Any] = Field(
+        None,
+        description="The amount of memory (in GBs) to be enabled per OCPU or ECPU.",
+    )
+    memory_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The memory allocated in GBs.",
+    )
+    next_maintenance_run_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the next maintenance run.",
+    )
+    node_count: Optional[Any] = Field(
+        None,
+        description="The number of nodes in the Autonomous VM Cluster.",
+    )
+    non_provisionable_autonomous_container_databases: Optional[Any] = Field(
+        None,
+        description="The number of non-provisionable Autonomous Container Databases in an Autonomous VM Cluster.",
+    )
+    ocpus_enabled: Optional[float] = Field(
+        None,
+        description="The number of enabled OCPU cores.",
+    )
+    provisionable_autonomous_container_databases: Optional[Any] = Field(
+        None,
+        description="**Deprecated.** Use field totalContainerDatabases.",
+    )
+    provisioned_autonomous_container_databases: Optional[Any] = Field(
+        None,
+        description="The number of provisioned Autonomous Container Databases in an Autonomous VM Cluster.",
+    )
+    provisioned_cpus: Optional[float] = Field(
+        None,
+        description="The number of CPUs provisioned in an Autonomous VM Cluster.",
+    )
+    reclaimable_cpus: Optional[Any] = Field(
+        None,
+        description="CPUs that continue to be included in the count of CPUs available to the Autonomous Container Database even after one of its Autonomous Database is terminated or scaled down. You can release them to the available CPUs at its parent Autonomous VM Cluster level by restarting the Autonomous Container Database.",
+    )
+    reserved_cpus: Optional[float] = Field(
+        None,
+        description="The number of CPUs reserved in an Autonomous VM Cluster.",
+    )
+    scan_listener_port_non_tls: Optional[Any] = Field(
+        None,
+        description="The SCAN Listener Non TLS port number. Default value is 1521.",
+    )
+    scan_listener_port_tls: Optional[Any] = Field(
+        None,
+        description="The SCAN Listener TLS port number. Default value is 2484.",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time that the Autonomous VM cluster was created.",
+    )
+    time_database_ssl_certificate_expires: Optional[Any] = Field(
+        None,
+        description="The date and time of the Database SSL certificate expiration.",
+    )
+    time_ords_certificate_expires: Optional[Any] = Field(
+        None,
+        description="The date and time of the ORDS certificate expiration.",
+    )
+    time_zone: Optional[Any] = Field(
+        None,
+        description="The time zone to use for the Autonomous VM cluster. For details, see `DB System Time Zones`__.",
+    )
+    total_autonomous_data_storage_in_tbs: Optional[float] = Field(
+        None,
+        description="The total data disk group size for Autonomous Databases, in TBs.",
+    )
+    total_container_databases: Optional[Any] = Field(
+        None,
+        description="The total number of Autonomous Container Databases that can be created.",
+    )
+    vm_cluster_network_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the vm_cluster_network_id of this AutonomousVmClusterSummary. The `OCID`__ of the VM cluster network.",
+    )
+
+
+def map_autonomousvmclustersummary(
+    o: oci.database.models.AutonomousVmClusterSummary,
+    fields: Optional[list[str]] = None,
+) -> AutonomousVmClusterSummary | None:
+    """Map oci.database.models.AutonomousVmClusterSummary → AutonomousVmClusterSummary Pydantic model."""
+    return map_model(AutonomousVmClusterSummary, o, fields)
+
+
+class CloudAutonomousVmClusterSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.CloudAutonomousVmClusterSummary."""
+
+    autonomous_data_storage_percentage: Optional[float] = Field(
+        None,
+        description="The percentage of the data storage used for the Autonomous Databases in an Autonomous VM Cluster.",
+    )
+    autonomous_data_storage_size_in_tbs: Optional[float] = Field(
+        None,
+        description="The data disk group size allocated for Autonomous Databases, in TBs.",
+    )
+    availability_domain: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the availability_domain of this CloudAutonomousVmClusterSummary. The name of the availability domain that the cloud Autonomous VM cluster is located in.",
+    )
+    available_autonomous_data_storage_size_in_tbs: Optional[float] = Field(
+        None,
+        description="The data disk group size available for Autonomous Databases, in TBs.",
+    )
+    available_container_databases: Optional[Any] = Field(
+        None,
+        description="The number of Autonomous Container Databases that can be created with the currently available local storage.",
+    )
+    available_cpus: Optional[float] = Field(
+        None,
+        description="CPU cores available for allocation to Autonomous Databases.",
+    )
+    cloud_exadata_infrastructure_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the cloud_exadata_infrastructure_id of this CloudAutonomousVmClusterSummary. The `OCID`__ of the cloud Exadata infrastructure.",
+    )
+    cluster_time_zone: Optional[Any] = Field(
+        None,
+        description="The time zone of the Cloud Autonomous VM Cluster.",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this CloudAutonomousVmClusterSummary. The `OCID`__ of the compartment.",
+    )
+    compute_model: Optional[Any] = Field(
+        None,
+        description="The compute model of the Cloud Autonomous VM Cluster. ECPU compute model is the recommended model and OCPU compute model is legacy. See `Compute Models in Autonomous Database on Dedicated Exadata #Infrastructure`__ for more details. Allowed values for this property are: \"ECPU\", \"OCPU\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    cpu_core_count: Optional[Any] = Field(
+        None,
+        description="The number of CPU cores on the cloud Autonomous VM cluster.",
+    )
+    cpu_core_count_per_node: Optional[Any] = Field(
+        None,
+        description="The number of CPU cores enabled per VM cluster node.",
+    )
+    cpu_percentage: Optional[float] = Field(
+        None,
+        description="The percentage of total number of CPUs used in an Autonomous VM Cluster.",
+    )
+    data_storage_size_in_gbs: Optional[float] = Field(
+        None,
+        description="The total data storage allocated, in gigabytes (GB).",
+    )
+    data_storage_size_in_tbs: Optional[float] = Field(
+        None,
+        description="The total data storage allocated, in terabytes (TB).",
+    )
+    db_node_storage_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The local node storage allocated in GBs.",
+    )
+    db_servers: Optional[Any] = Field(
+        None,
+        description="The list of `OCIDs`__ of the Db servers.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    description: Optional[Any] = Field(
+        None,
+        description="User defined description of the cloud Autonomous VM cluster.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this CloudAutonomousVmClusterSummary. The user-friendly name for the cloud Autonomous VM cluster. The name does not need to be unique.",
+    )
+    domain: Optional[Any] = Field(
+        None,
+        description="The domain name for the cloud Autonomous VM cluster.",
+    )
+    exadata_storage_in_tbs_lowest_scaled_value: Optional[float] = Field(
+        None,
+        description="The lowest value to which exadataStorage (in TBs) can be scaled down.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    hostname: Optional[Any] = Field(
+        None,
+        description="The hostname for the cloud Autonomous VM cluster.",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this CloudAutonomousVmClusterSummary. The `OCID`__ of the Cloud Autonomous VM cluster.",
+    )
+    is_mtls_enabled_vm_cluster: Optional[Any] = Field(
+        None,
+        description="Enable mutual TLS(mTLS) authentication for database at time of provisioning a VMCluster. This is applicable to database TLS Certificates only. Default is TLS",
+    )
+    last_maintenance_run_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the last maintenance run.",
+    )
+    last_update_history_entry_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the last maintenance update history. This value is updated when a maintenance update starts.",
+    )
+    license_model: Optional[Any] = Field(
+        None,
+        description="The Oracle license model that applies to the Oracle Autonomous Database. Bring your own license (BYOL) allows you to apply your current on-premises Oracle software licenses to equivalent, highly automated Oracle services in the cloud. License Included allows you to subscribe to new Oracle Database software licenses and the Oracle Database service. Note that when provisioning an `Autonomous Database on dedicated Exadata infrastructure`__, this attribute must be null. It is already set at the Autonomous Exadata Infrastructure level. When provisioning an `Autonomous Database Serverless]`__ database, if a value is not specified, the system defaults the value to `BRING_YOUR_OWN_LICENSE`. Bring your own license (BYOL) also allows you to select the DB edition using the optional parameter. This cannot be updated in parallel with any of the following: cpuCoreCount, computeCount, dataStorageSizeInTBs, adminPassword, isMTLSConnectionRequired, dbWorkload, privateEndpointLabel, nsgIds, dbVersion, dbName, scheduledOperations, dbToolsDetails, or isFreeTier. Allowed values for this property are: \"LICENSE_INCLUDED\", \"BRING_YOUR_OWN_LICENSE\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this CloudAutonomousVmClusterSummary. The current state of the cloud Autonomous VM cluster. Allowed values for this property are: "PROVISIONING", "AVAILABLE", "UPDATING", "TERMINATING", "TERMINATED", "FAILED", "MAINTENANCE_IN_PROGRESS", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    maintenance_window: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    max_acds_lowest_scaled_value: Optional[Any] = Field(
+        None,
+        description="The lowest value to which maximum number of ACDs can be scaled down.",
+    )
+    memory_per_oracle_compute_unit_in_gbs: Optional[Any] = Field(
+        None,
+        description="The amount of memory (in GBs) enabled per OCPU or ECPU.",
+    )
+    memory_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The memory allocated in GBs.",
+    )
+    next_maintenance_run_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the next maintenance run.",
+    )
+    node_count: Optional[Any] = Field(
+        None,
+        description="The number of database servers in the cloud VM cluster.",
+    )
+    non_provisionable_autonomous_container_databases: Optional[Any] = Field(
+        None,
+        description="The number of non-provisionable Autonomous Container Databases in an Autonomous VM Cluster.",
+    )
+    nsg_ids: Optional[Any] = Field(
+        None,
+        description="The list of `OCIDs`__ for the network security groups (NSGs) to which this resource belongs. Setting this to an empty list removes all resources from all NSGs. For more information about NSGs, see `Security Rules`__. **NsgIds restrictions:** - A network security group (NSG) is optional for Autonomous Databases with private access. The nsgIds list can be empty.",
+    )
+    ocpu_count: Optional[float] = Field(
+        None,
+        description="The number of CPU cores on the cloud Autonomous VM cluster. Only 1 decimal place is allowed for the fractional part.",
+    )
+    ocpus_lowest_scaled_value: Optional[Any] = Field(
+        None,
+        description="The lowest value to which ocpus can be scaled down.",
+    )
+    provisionable_autonomous_container_databases: Optional[Any] = Field(
+        None,
+        description="The number of provisionable Autonomous Container Databases in an Autonomous VM Cluster.",
+    )
+    provisioned_autonomous_container_databases: Optional[Any] = Field(
+        None,
+        description="The number of provisioned Autonomous Container Databases in an Autonomous VM Cluster.",
+    )
+    provisioned_cpus: Optional[float] = Field(
+        None,
+        description="The number of CPUs provisioned in an Autonomous VM Cluster.",
+    )
+    reclaimable_cpus: Optional[float] = Field(
+        None,
+        description="CPUs that continue to be included in the count of CPUs available to the Autonomous Container Database even after one of its Autonomous Database is terminated or scaled down. You can release them to the available CPUs at its parent Autonomous VM Cluster level by restarting the Autonomous Container Database.",
+    )
+    reserved_cpus: Optional[float] = Field(
+        None,
+        description="The number of CPUs reserved in an Autonomous VM Cluster.",
+    )
+    scan_listener_port_non_tls: Optional[Any] = Field(
+        None,
+        description="The SCAN Listener Non TLS port. Default is 1521.",
+    )
+    scan_listener_port_tls: Optional[Any] = Field(
+        None,
+        description="The SCAN Listenenr TLS port. Default is 2484.",
+    )
+    security_attributes: Optional[Any] = Field(
+        None,
+        description='Security Attributes for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__. Example: `{"Oracle-ZPR": {"MaxEgressCount": {"value": "42", "mode": "audit"}}}`',
+    )
+    shape: Optional[Any] = Field(
+        None,
+        description="The model name of the Exadata hardware running the cloud Autonomous VM cluster.",
+    )
+    subnet_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the subnet_id of this CloudAutonomousVmClusterSummary. The `OCID`__ of the subnet the cloud Autonomous VM Cluster is associated with. **Subnet Restrictions:** - For Exadata and virtual machine 2-node RAC DB systems, do not use a subnet that overlaps with 192.168.128.0/20. These subnets are used by the Oracle Clusterware private interconnect on the database instance. Specifying an overlapping subnet will cause the private interconnect to malfunction. This restriction applies to both the client subnet and backup subnet.",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time that the cloud Autonomous VM cluster was created.",
+    )
+    time_database_ssl_certificate_expires: Optional[Any] = Field(
+        None,
+        description="The date and time of Database SSL certificate expiration.",
+    )
+    time_ords_certificate_expires: Optional[Any] = Field(
+        None,
+        description="The date and time of ORDS certificate expiration.",
+    )
+    time_updated: Optional[Any] = Field(
+        None,
+        description="The last date and time that the cloud Autonomous VM cluster was updated.",
+    )
+    total_autonomous_data_storage_in_tbs: Optional[float] = Field(
+        None,
+        description="The total data disk group size for Autonomous Databases, in TBs.",
+    )
+    total_container_databases: Optional[Any] = Field(
+        None,
+        description="The total number of Autonomous Container Databases that can be created with the allocated local storage.",
+    )
+    total_cpus: Optional[float] = Field(
+        None,
+        description="The total number of CPUs in an Autonomous VM Cluster.",
+    )
+
+
+def map_cloudautonomousvmclustersummary(
+    o: oci.database.models.CloudAutonomousVmClusterSummary,
+    fields: Optional[list[str]] = None,
+) -> CloudAutonomousVmClusterSummary | None:
+    """Map oci.database.models.CloudAutonomousVmClusterSummary → CloudAutonomousVmClusterSummary Pydantic model."""
+    return map_model(CloudAutonomousVmClusterSummary, o, fields)
+
+
+class AutonomousPatchSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.AutonomousPatchSummary."""
+
+    autonomous_patch_type: Optional[Any] = Field(
+        None,
+        description='Maintenance run type, either "QUARTERLY" or "TIMEZONE". Allowed values for this property are: "QUARTERLY", "TIMEZONE", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    description: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the description of this AutonomousPatchSummary. The text describing this patch package.",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this AutonomousPatchSummary. The `OCID`__ of the patch.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="A descriptive text associated with the lifecycleState. Typically can contain additional displayable text.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='The current state of the patch as a result of lastAction. Allowed values for this property are: "AVAILABLE", "SUCCESS", "IN_PROGRESS", "FAILED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    patch_model: Optional[Any] = Field(
+        None,
+        description="Database patching model preference. See `My Oracle Support note 2285040.1`__ for information on the Release Update (RU) and Release Update Revision (RUR) patching models. Allowed values for this property are: \"RELEASE_UPDATES\", \"RELEASE_UPDATE_REVISIONS\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    quarter: Optional[Any] = Field(
+        None,
+        description="First month of the quarter in which the patch was released.",
+    )
+    time_released: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the time_released of this AutonomousPatchSummary. The date and time that the patch was released.",
+    )
+    type: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the type of this AutonomousPatchSummary. The type of patch. BUNDLE is one example.",
+    )
+    version: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the version of this AutonomousPatchSummary. The version of this patch package.",
+    )
+    year: Optional[Any] = Field(
+        None,
+        description="Year in which the patch was released.",
+    )
+
+
+def map_autonomouspatchsummary(
+    o: oci.database.models.AutonomousPatchSummary,
+    fields: Optional[list[str]] = None,
+) -> AutonomousPatchSummary | None:
+    """Map oci.database.models.AutonomousPatchSummary → AutonomousPatchSummary Pydantic model."""
+    return map_model(AutonomousPatchSummary, o, fields)
+
+
+class ResourcePoolShapeCollection(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.ResourcePoolShapeCollection."""
+
+    items: Optional[Any] = Field(
+        None,
+        description="List of Autonomous Database resource pools Shapes.",
+    )
+
+
+def map_resourcepoolshapecollection(
+    o: oci.database.models.ResourcePoolShapeCollection,
+    fields: Optional[list[str]] = None,
+) -> ResourcePoolShapeCollection | None:
+    """Map oci.database.models.ResourcePoolShapeCollection → ResourcePoolShapeCollection Pydantic model."""
+    return map_model(ResourcePoolShapeCollection, o, fields)
+
+
+class AutonomousContainerDatabase(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.AutonomousContainerDatabase."""
+
+    associated_backup_configuration_details: Optional[Any] = Field(
+        None,
+        description="A backup config object holds information about preferred backup destinations only. This object holds information about the associated backup destinations, such as secondary backup destinations created for local backups or remote replicated backups.",
+    )
+    autonomous_exadata_infrastructure_id: Optional[Any] = Field(
+        None,
+        description="**No longer used.** For Autonomous Database on dedicated Exadata infrastructure, the container database is created within a specified `cloudAutonomousVmCluster`.",
+    )
+    autonomous_vm_cluster_id: Optional[Any] = Field(
+        None,
+        description="The OCID of the Autonomous VM Cluster.",
+    )
+    availability_domain: Optional[Any] = Field(
+        None,
+        description="The availability domain of the Autonomous Container Database.",
+    )
+    available_cpus: Optional[float] = Field(
+        None,
+        description="Sum of CPUs available on the Autonomous VM Cluster + Sum of reclaimable CPUs available in the Autonomous Container Database.",
+    )
+    backup_config: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    backup_destination_properties_list: Optional[Any] = Field(
+        None,
+        description="This list describes the backup destination properties associated with the Autonomous Container Database (ACD) 's preferred backup destination. The object at a given index is associated with the destination present at the same index in the backup destination details list of the ACD Backup Configuration.",
+    )
+    cloud_autonomous_vm_cluster_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the cloud Autonomous Exadata VM Cluster.",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this AutonomousContainerDatabase. The OCID of the compartment.",
+    )
+    compute_model: Optional[Any] = Field(
+        None,
+        description="The compute model of the Autonomous Container Database. For Autonomous Database on Dedicated Exadata Infrastructure, the CPU type (ECPUs or OCPUs) is determined by the parent Autonomous Exadata VM Cluster's compute model. ECPU compute model is the recommended model and OCPU compute model is legacy. See `Compute Models in Autonomous Database on Dedicated Exadata Infrastructure`__ for more details. Allowed values for this property are: \"ECPU\", \"OCPU\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    db_name: Optional[Any] = Field(
+        None,
+        description="The Database name for the Autonomous Container Database. The name must be unique within the Cloud Autonomous VM Cluster, starting with an alphabetic character, followed by 1 to 7 alphanumeric characters.",
+    )
+    db_split_threshold: Optional[Any] = Field(
+        None,
+        description="The CPU value beyond which an Autonomous Database will be opened across multiple nodes. The default value of this attribute is 16 for OCPUs and 64 for ECPUs.",
+    )
+    db_unique_name: Optional[Any] = Field(
+        None,
+        description="**Deprecated.** The `DB_UNIQUE_NAME` value is set by Oracle Cloud Infrastructure. Do not specify a value for this parameter. Specifying a value for this field will cause Terraform operations to fail.",
+    )
+    db_version: Optional[Any] = Field(
+        None,
+        description="Oracle Database version of the Autonomous Container Database.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this AutonomousContainerDatabase. The user-provided name for the Autonomous Container Database.",
+    )
+    distribution_affinity: Optional[Any] = Field(
+        None,
+        description="Determines whether an Autonomous Database must be opened across the maximum number of nodes or the least number of nodes. By default, Minimum nodes is selected. Allowed values for this property are: \"MINIMUM_DISTRIBUTION\", \"MAXIMUM_DISTRIBUTION\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    dst_file_version: Optional[Any] = Field(
+        None,
+        description="DST Time-Zone File version of the Autonomous Container Database.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this AutonomousContainerDatabase. The OCID of the Autonomous Container Database.",
+    )
+    infrastructure_type: Optional[Any] = Field(
+        None,
+        description="The infrastructure type this resource belongs to. Allowed values for this property are: \"CLOUD\", \"CLOUD_AT_CUSTOMER\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    is_dst_file_update_enabled: Optional[Any] = Field(
+        None,
+        description="Indicates if an automatic DST Time Zone file update is enabled for the Autonomous Container Database. If enabled along with Release Update, patching will be done in a Non-Rolling manner.",
+    )
+    key_history_entry: Optional[Any] = Field(
+        None,
+        description="Key History Entry.",
+    )
+    key_store_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the key store of Oracle Vault.",
+    )
+    key_store_wallet_name: Optional[Any] = Field(
+        None,
+        description="The wallet name for Oracle Key Vault.",
+    )
+    kms_key_id: Optional[Any] = Field(
+        None,
+        description="The OCID of the key container that is used as the master encryption key in database transparent data encryption (TDE) operations.",
+    )
+    kms_key_version_id: Optional[Any] = Field(
+        None,
+        description="The OCID of the key container version that is used in database transparent data encryption (TDE) operations KMS Key can have multiple key versions. If none is specified, the current key version (latest) of the Key Id is used for the operation. Autonomous Database Serverless does not use key versions, hence is not applicable for Autonomous Database Serverless instances.",
+    )
+    largest_provisionable_autonomous_database_in_cpus: Optional[float] = Field(
+        None,
+        description="The largest Autonomous Database (CPU) that can be created in a new Autonomous Container Database.",
+    )
+    last_maintenance_run_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the last maintenance run.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this AutonomousContainerDatabase. The current state of the Autonomous Container Database. Allowed values for this property are: "PROVISIONING", "AVAILABLE", "UPDATING", "TERMINATING", "TERMINATED", "FAILED", "BACKUP_IN_PROGRESS", "RESTORING", "RESTORE_FAILED", "RESTARTING", "MAINTENANCE_IN_PROGRESS", "ROLE_CHANGE_IN_PROGRESS", "ENABLING_AUTONOMOUS_DATA_GUARD", "UNAVAILABLE", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    list_one_off_patches: Optional[Any] = Field(
+        None,
+        description="List of One-Off patches that has been successfully applied to Autonomous Container Database",
+    )
+    maintenance_window: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    memory_per_oracle_compute_unit_in_gbs: Optional[Any] = Field(
+        None,
+        description="The amount of memory (in GBs) enabled per ECPU or OCPU in the Autonomous VM Cluster.",
+    )
+    net_services_architecture: Optional[Any] = Field(
+        None,
+        description="Enabling SHARED server architecture enables a database server to allow many client processes to share very few server processes, thereby increasing the number of supported users. Allowed values for this property are: \"DEDICATED\", \"SHARED\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    next_maintenance_run_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the next maintenance run.",
+    )
+    patch_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the last patch applied on the system.",
+    )
+    patch_model: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the patch_model of this AutonomousContainerDatabase. Database patch model preference. Allowed values for this property are: \"RELEASE_UPDATES\", \"RELEASE_UPDATE_REVISIONS\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    provisionable_cpus: Optional[Any] = Field(
+        None,
+        description="An array of CPU values that can be used to successfully provision a single Autonomous Database.",
+    )
+    provisioned_cpus: Optional[float] = Field(
+        None,
+        description="The number of CPUs provisioned in an Autonomous Container Database.",
+    )
+    reclaimable_cpus: Optional[float] = Field(
+        None,
+        description="CPUs that continue to be included in the count of CPUs available to the Autonomous Container Database even after one of its Autonomous Database is terminated or scaled down. You can release them to the available CPUs at its parent Autonomous VM Cluster level by restarting the Autonomous Container Database.",
+    )
+    recovery_appliance_details: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    reserved_cpus: Optional[float] = Field(
+        None,
+        description="The number of CPUs reserved in an Autonomous Container Database.",
+    )
+    role: Optional[Any] = Field(
+        None,
+        description='The Data Guard role of the Autonomous Container Database or Autonomous Database, if Autonomous Data Guard is enabled. Allowed values for this property are: "PRIMARY", "STANDBY", "DISABLED_STANDBY", "BACKUP_COPY", "SNAPSHOT_STANDBY", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    service_level_agreement_type: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the service_level_agreement_type of this AutonomousContainerDatabase. The service level agreement type of the container database. The default is STANDARD. Allowed values for this property are: "STANDARD", "MISSION_CRITICAL", "AUTONOMOUS_DATAGUARD", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    standby_maintenance_buffer_in_days: Optional[Any] = Field(
+        None,
+        description="The scheduling detail for the quarterly maintenance window of the standby Autonomous Container Database. This value represents the number of days before scheduled maintenance of the primary database.",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time the Autonomous Container Database was created.",
+    )
+    time_of_last_backup: Optional[Any] = Field(
+        None,
+        description="The timestamp of last successful backup. Here NULL value represents either there are no successful backups or backups are not configured for this Autonomous Container Database.",
+    )
+    time_snapshot_standby_revert: Optional[Any] = Field(
+        None,
+        description="The date and time the Autonomous Container Database will be reverted to Standby from Snapshot Standby.",
+    )
+    total_cpus: Optional[Any] = Field(
+        None,
+        description="The number of CPUs allocated to the Autonomous VM cluster.",
+    )
+    vault_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Oracle Cloud Infrastructure `vault`__. This parameter and `secretId` are required for Customer Managed Keys.",
+    )
+    version_preference: Optional[Any] = Field(
+        None,
+        description="The next maintenance version preference. Allowed values for this property are: \"NEXT_RELEASE_UPDATE\", \"LATEST_RELEASE_UPDATE\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    vm_failover_reservation: Optional[Any] = Field(
+        None,
+        description="The percentage of CPUs reserved across nodes to support node failover. Allowed values are 0%, 25%, and 50%, with 50% being the default option.",
+    )
+
+
+def map_autonomouscontainerdatabase(
+    o: oci.database.models.AutonomousContainerDatabase,
+    fields: Optional[list[str]] = None,
+) -> AutonomousContainerDatabase | None:
+    """Map oci.database.models.AutonomousContainerDatabase → AutonomousContainerDatabase Pydantic model."""
+    return map_model(AutonomousContainerDatabase, o, fields)
+
+
+class AutonomousContainerDatabaseResourceUsage(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.AutonomousContainerDatabaseResourceUsage."""
+
+    autonomous_container_database_vm_usage: Optional[Any] = Field(
+        None,
+        description="List of autonomous container database resource usage per autonomous virtual machine.",
+    )
+    available_cpus: Optional[float] = Field(
+        None,
+        description="CPUs available for provisioning or scaling an Autonomous Database in the Autonomous Container Database.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this AutonomousContainerDatabaseResourceUsage. The user-friendly name for the Autonomous Container Database. The name does not need to be unique.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Autonomous Container Database.",
+    )
+    largest_provisionable_autonomous_database_in_cpus: Optional[float] = Field(
+        None,
+        description="Largest provisionable ADB in the Autonomous Container Database.",
+    )
+    provisionable_cpus: Optional[Any] = Field(
+        None,
+        description="Valid list of provisionable CPUs for Autonomous Database.",
+    )
+    provisioned_cpus: Optional[float] = Field(
+        None,
+        description="CPUs / cores assigned to ADBs in the Autonomous Container Database.",
+    )
+    reclaimable_cpus: Optional[float] = Field(
+        None,
+        description="Number of CPUs that are reclaimable or released to the AVMC on Autonomous Container Database restart.",
+    )
+    reserved_cpus: Optional[float] = Field(
+        None,
+        description="CPUs / cores reserved for scalability, resilliency and other overheads. This includes failover, autoscaling and idle instance overhead.",
+    )
+    used_cpus: Optional[float] = Field(
+        None,
+        description="CPUs / cores assigned to the Autonomous Container Database. Sum of provisioned, reserved and reclaimable CPUs/ cores.",
+    )
+
+
+def map_autonomouscontainerdatabaseresourceusage(
+    o: oci.database.models.AutonomousContainerDatabaseResourceUsage,
+    fields: Optional[list[str]] = None,
+) -> AutonomousContainerDatabaseResourceUsage | None:
+    """Map oci.database.models.AutonomousContainerDatabaseResourceUsage → AutonomousContainerDatabaseResourceUsage Pydantic model."""
+    return map_model(AutonomousContainerDatabaseResourceUsage, o, fields)
+
+
+class AutonomousDatabase(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.AutonomousDatabase."""
+
+    actual_used_data_storage_size_in_tbs: Optional[float] = Field(
+        None,
+        description="The current amount of storage in use for user and system data, in terabytes (TB).",
+    )
+    allocated_storage_size_in_tbs: Optional[float] = Field(
+        None,
+        description="The amount of storage currently allocated for the database tables and billed for, rounded up. When auto-scaling is not enabled, this value is equal to the `dataStorageSizeInTBs` value. You can compare this value to the `actualUsedDataStorageSizeInTBs` value to determine if a manual shrink operation is appropriate for your allocated storage. **Note:** Auto-scaling does not automatically decrease allocated storage when data is deleted from the database.",
+    )
+    apex_details: Optional[Any] = Field(
+        None,
+        description="Information about Oracle APEX Application Development.",
+    )
+    are_primary_whitelisted_ips_used: Optional[Any] = Field(
+        None,
+        description="This field will be null if the Autonomous Database is not Data Guard enabled or Access Control is disabled. It's value would be `TRUE` if Autonomous Database is Data Guard enabled and Access Control is enabled and if the Autonomous Database uses primary IP access control list (ACL) for standby. It's value would be `FALSE` if Autonomous Database is Data Guard enabled and Access Control is enabled and if the Autonomous Database uses different IP access control list (ACL) for standby compared to primary.",
+    )
+    auto_refresh_frequency_in_seconds: Optional[Any] = Field(
+        None,
+        description="The frequency a refreshable clone is refreshed after auto-refresh is enabled. The minimum is 1 hour. The maximum is 7 days. The date and time that auto-refresh is enabled is controlled by the `timeOfAutoRefreshStart` parameter.",
+    )
+    auto_refresh_point_lag_in_seconds: Optional[Any] = Field(
+        None,
+        description="The time, in seconds, the data of the refreshable clone lags the primary database at the point of refresh. The minimum is 0 minutes (0 mins means refresh to the latest available timestamp). The maximum is 7 days. The lag time increases after refreshing until the next data refresh happens.",
+    )
+    autonomous_container_database_id: Optional[Any] = Field(
+        None,
+        description="The Autonomous Container Database `OCID`__. Used only by Autonomous Database on Dedicated Exadata Infrastructure.",
+    )
+    autonomous_maintenance_schedule_type: Optional[Any] = Field(
+        None,
+        description="The maintenance schedule type of the Autonomous Database Serverless. An EARLY maintenance schedule follows a schedule applying patches prior to the REGULAR schedule. A REGULAR maintenance schedule follows the normal cycle Allowed values for this property are: \"EARLY\", \"REGULAR\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    availability_domain: Optional[Any] = Field(
+        None,
+        description="The availability domain where the Autonomous Database Serverless instance is located.",
+    )
+    available_upgrade_versions: Optional[Any] = Field(
+        None,
+        description="List of Oracle Database versions available for a database upgrade. If there are no version upgrades available, this list is empty.",
+    )
+    backup_config: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    backup_retention_period_in_days: Optional[Any] = Field(
+        None,
+        description="Retention period, in days, for long-term backups",
+    )
+    byol_compute_count_limit: Optional[float] = Field(
+        None,
+        description="The maximum number of CPUs allowed with a Bring Your Own License (BYOL), including those used for auto-scaling, disaster recovery, tools, etc. Any CPU usage above this limit is considered as License Included and billed.",
+    )
+    character_set: Optional[Any] = Field(
+        None,
+        description="The character set for the autonomous database. The default is AL32UTF8. Allowed values are: AL32UTF8, AR8ADOS710, AR8ADOS720, AR8APTEC715, AR8ARABICMACS, AR8ASMO8X, AR8ISO8859P6, AR8MSWIN1256, AR8MUSSAD768, AR8NAFITHA711, AR8NAFITHA721, AR8SAKHR706, AR8SAKHR707, AZ8ISO8859P9E, BG8MSWIN, BG8PC437S, BLT8CP921, BLT8ISO8859P13, BLT8MSWIN1257, BLT8PC775, BN8BSCII, CDN8PC863, CEL8ISO8859P14, CL8ISO8859P5, CL8ISOIR111, CL8KOI8R, CL8KOI8U, CL8MACCYRILLICS, CL8MSWIN1251, EE8ISO8859P2, EE8MACCES, EE8MACCROATIANS, EE8MSWIN1250, EE8PC852, EL8DEC, EL8ISO8859P7, EL8MACGREEKS, EL8MSWIN1253, EL8PC437S, EL8PC851, EL8PC869, ET8MSWIN923, HU8ABMOD, HU8CWI2, IN8ISCII, IS8PC861, IW8ISO8859P8, IW8MACHEBREWS, IW8MSWIN1255, IW8PC1507, JA16EUC, JA16EUCTILDE, JA16SJIS, JA16SJISTILDE, JA16VMS, KO16KSC5601, KO16KSCCS, KO16MSWIN949, LA8ISO6937, LA8PASSPORT, LT8MSWIN921, LT8PC772, LT8PC774, LV8PC1117, LV8PC8LR, LV8RST104090, N8PC865, NE8ISO8859P10, NEE8ISO8859P4, RU8BESTA, RU8PC855, RU8PC866, SE8ISO8859P3, TH8MACTHAIS, TH8TISASCII, TR8DEC, TR8MACTURKISHS, TR8MSWIN1254, TR8PC857, US7ASCII, US8PC437, UTF8, VN8MSWIN1258, VN8VN3, WE8DEC, WE8DG, WE8ISO8859P1, WE8ISO8859P15, WE8ISO8859P9, WE8MACROMAN8S, WE8MSWIN1252, WE8NCR4970, WE8NEXTSTEP, WE8PC850, WE8PC858, WE8PC860, WE8ROMAN8, ZHS16CGB231280, ZHS16GBK, ZHT16BIG5, ZHT16CCDC, ZHT16DBT, ZHT16HKSCS, ZHT16MSWIN950, ZHT32EUC, ZHT32SOPS, ZHT32TRIS",
+    )
+    clone_table_space_list: Optional[Any] = Field(
+        None,
+        description="A list of the source Autonomous Database's table space number(s) used to create this partial clone from the backup.",
+    )
+    cluster_placement_group_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the cluster placement group of the Autonomous Serverless Database.",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this AutonomousDatabase. The `OCID`__ of the compartment.",
+    )
+    compute_count: Optional[float] = Field(
+        None,
+        description="The compute amount (CPUs) available to the database. Minimum and maximum values depend on the compute model and whether the database is an Autonomous Database Serverless instance or an Autonomous Database on Dedicated Exadata Infrastructure. The 'ECPU' compute model requires a minimum value of one, for databases in the elastic resource pool and minimum value of two, otherwise. Required when using the `computeModel` parameter. When using `cpuCoreCount` parameter, it is an error to specify computeCount to a non-null value. Providing `computeModel` and `computeCount` is the preferred method for both OCPU and ECPU.",
+    )
+    compute_model: Optional[Any] = Field(
+        None,
+        description="The compute model of the Autonomous Database. This is required if using the `computeCount` parameter. If using `cpuCoreCount` then it is an error to specify `computeModel` to a non-null value. ECPU compute model is the recommended model and OCPU compute model is legacy. Allowed values for this property are: \"ECPU\", \"OCPU\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    connection_strings: Optional[Any] = Field(
+        None,
+        description="The connection string used to connect to the Autonomous Database. The username for the Service Console is ADMIN. Use the password you entered when creating the Autonomous Database for the password value.",
+    )
+    connection_urls: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    cpu_core_count: Optional[Any] = Field(
+        None,
+        description="The number of CPU cores to be made available to the database. When the ECPU is selected, the value for cpuCoreCount is 0. For Autonomous Database on Dedicated Exadata infrastructure, the maximum number of cores is determined by the infrastructure shape. See `Characteristics of Infrastructure Shapes`__ for shape details. **Note:** This parameter cannot be used with the `ocpuCount` parameter.",
+    )
+    customer_contacts: Optional[Any] = Field(
+        None,
+        description="Customer Contacts.",
+    )
+    data_safe_status: Optional[Any] = Field(
+        None,
+        description='Status of the Data Safe registration for this Autonomous Database. Allowed values for this property are: "REGISTERING", "REGISTERED", "DEREGISTERING", "NOT_REGISTERED", "FAILED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    data_storage_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The quantity of data in the database, in gigabytes. For Autonomous Transaction Processing databases using ECPUs on Serverless Infrastructure, this value is always populated. In all the other cases, this value will be null and `dataStorageSizeInTBs` will be populated instead.",
+    )
+    data_storage_size_in_tbs: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the data_storage_size_in_tbs of this AutonomousDatabase. The quantity of data in the database, in terabytes. The following points apply to Autonomous Databases on Serverless Infrastructure: - This is an integer field whose value remains null when the data size is in GBs and cannot be converted to TBs (by dividing the GB value by 1024) without rounding error. - To get the exact value of data storage size without rounding error, please see `dataStorageSizeInGBs` of Autonomous Database.",
+    )
+    database_edition: Optional[Any] = Field(
+        None,
+        description="The Oracle Database Edition that applies to the Autonomous databases. Allowed values for this property are: \"STANDARD_EDITION\", \"ENTERPRISE_EDITION\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    database_management_status: Optional[Any] = Field(
+        None,
+        description='Status of Database Management for this Autonomous Database. Allowed values for this property are: "ENABLING", "ENABLED", "DISABLING", "NOT_ENABLED", "FAILED_ENABLING", "FAILED_DISABLING", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    dataguard_region_type: Optional[Any] = Field(
+        None,
+        description="**Deprecated.** The Autonomous Data Guard region type of the Autonomous Database. For Autonomous Database Serverless, Autonomous Data Guard associations have designated primary and standby regions, and these region types do not change when the database changes roles. The standby regions in Autonomous Data Guard associations can be the same region designated as the primary region, or they can be remote regions. Certain database administrative operations may be available only in the primary region of the Autonomous Data Guard association, and cannot be performed when the database using the primary role is operating in a remote Autonomous Data Guard standby region. Allowed values for this property are: \"PRIMARY_DG_REGION\", \"REMOTE_STANDBY_DG_REGION\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    db_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the db_name of this AutonomousDatabase. The database name.",
+    )
+    db_tools_details: Optional[Any] = Field(
+        None,
+        description="The list of database tools details. This cannot be updated in parallel with any of the following: licenseModel, dbEdition, cpuCoreCount, computeCount, computeModel, whitelistedIps, isMTLSConnectionRequired, openMode, permissionLevel, dbWorkload, privateEndpointLabel, nsgIds, dbVersion, isRefreshable, dbName, scheduledOperations, isLocalDataGuardEnabled, or isFreeTier.",
+    )
+    db_version: Optional[Any] = Field(
+        None,
+        description="A valid Oracle Database version for Autonomous Database.",
+    )
+    db_workload: Optional[Any] = Field(
+        None,
+        description='The Autonomous Database workload type. The following values are valid: - OLTP - indicates an Autonomous Transaction Processing database - DW - indicates an Autonomous Data Warehouse database - AJD - indicates an Autonomous JSON Database - APEX - indicates an Autonomous Database with the Oracle APEX Application Development workload type. This cannot be updated in parallel with any of the following: licenseModel, dbEdition, cpuCoreCount, computeCount, computeModel, adminPassword, whitelistedIps, isMTLSConnectionRequired, privateEndpointLabel, nsgIds, dbVersion, isRefreshable, dbName, scheduledOperations, dbToolsDetails, isLocalDataGuardEnabled, or isFreeTier. Allowed values for this property are: "OLTP", "DW", "AJD", "APEX", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    disaster_recovery_region_type: Optional[Any] = Field(
+        None,
+        description="**Deprecated.** The disaster recovery (DR) region type of the Autonomous Database. For Autonomous Database Serverless instances, DR associations have designated primary and standby regions. These region types do not change when the database changes roles. The standby region in DR associations can be the same region as the primary region, or they can be in a remote regions. Some database administration operations may be available only in the primary region of the DR association, and cannot be performed when the database using the primary role is operating in a remote region. Allowed values for this property are: \"PRIMARY\", \"REMOTE\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="The user-friendly name for the Autonomous Database. The name does not have to be unique.",
+    )
+    encryption_key: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    encryption_key_history_entry: Optional[Any] = Field(
+        None,
+        description="Key History Entry.",
+    )
+    failed_data_recovery_in_seconds: Optional[Any] = Field(
+        None,
+        description="Indicates the number of seconds of data loss for a Data Guard failover.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this AutonomousDatabase. The `OCID`__ of the Autonomous Database.",
+    )
+    in_memory_area_in_gbs: Optional[Any] = Field(
+        None,
+        description="The area assigned to In-Memory tables in Autonomous Database.",
+    )
+    in_memory_percentage: Optional[Any] = Field(
+        None,
+        description="The percentage of the System Global Area(SGA) assigned to In-Memory tables in Autonomous Database. This property is applicable only to Autonomous Databases on the Exadata Cloud@Customer platform.",
+    )
+    infrastructure_type: Optional[Any] = Field(
+        None,
+        description="The infrastructure type this resource belongs to. Allowed values for this property are: \"CLOUD\", \"CLOUD_AT_CUSTOMER\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    is_access_control_enabled: Optional[Any] = Field(
+        None,
+        description="Indicates if the database-level access control is enabled. If disabled, database access is defined by the network security rules. If enabled, database access is restricted to the IP addresses defined by the rules specified with the `whitelistedIps` property. While specifying `whitelistedIps` rules is optional, if database-level access control is enabled and no rules are specified, the database will become inaccessible. The rules can be added later using the `UpdateAutonomousDatabase` API operation or edit option in console. When creating a database clone, the desired access control setting should be specified. By default, database-level access control will be disabled for the clone. This property is applicable only to Autonomous Databases on the Exadata Cloud@Customer platform. For Autonomous Database Serverless instances, `whitelistedIps` is used.",
+    )
+    is_auto_scaling_enabled: Optional[Any] = Field(
+        None,
+        description="Indicates if auto scaling is enabled for the Autonomous Database CPU core count. The default value is `TRUE`.",
+    )
+    is_auto_scaling_for_storage_enabled: Optional[Any] = Field(
+        None,
+        description="Indicates if auto scaling is enabled for the Autonomous Database storage. The default value is `FALSE`.",
+    )
+    is_backup_retention_locked: Optional[Any] = Field(
+        None,
+        description="Indicates if the Autonomous Database is backup retention locked.",
+    )
+    is_data_guard_enabled: Optional[Any] = Field(
+        None,
+        description="**Deprecated.** Indicates whether the Autonomous Database has local (in-region) Data Guard enabled. Not applicable to cross-region Autonomous Data Guard associations, or to Autonomous Databases using dedicated Exadata infrastructure or Exadata Cloud@Customer infrastructure.",
+    )
+    is_dedicated: Optional[Any] = Field(
+        None,
+        description="True if the database uses `dedicated Exadata infrastructure`__.",
+    )
+    is_dev_tier: Optional[Any] = Field(
+        None,
+        description="Autonomous Database for Developers are fixed-shape Autonomous Databases that developers can use to build and test new applications. On Serverless, these are low-cost and billed per instance, on Dedicated and Cloud@Customer there is no additional cost to create Developer databases. Developer databases come with limited resources and is not intended for large-scale testing and production deployments. When you need more compute or storage resources, you may upgrade to a full paid production database.",
+    )
+    is_free_tier: Optional[Any] = Field(
+        None,
+        description="Indicates if this is an Always Free resource. The default value is false. Note that Always Free Autonomous Databases have 1 CPU and 20GB of memory. For Always Free databases, memory and CPU cannot be scaled. This cannot be updated in parallel with any of the following: licenseModel, dbEdition, cpuCoreCount, computeCount, computeModel, adminPassword, whitelistedIps, isMTLSConnectionRequired, openMode, permissionLevel, privateEndpointLabel, nsgIds, dbVersion, isRefreshable, dbName, scheduledOperations, dbToolsDetails, or isLocalDataGuardEnabled",
+    )
+    is_local_data_guard_enabled: Optional[Any] = Field(
+        None,
+        description="Indicates whether the Autonomous Database has local (in-region) Data Guard enabled. Not applicable to cross-region Autonomous Data Guard associations, or to Autonomous Databases using dedicated Exadata infrastructure or Exadata Cloud@Customer infrastructure.",
+    )
+    is_mtls_connection_required: Optional[Any] = Field(
+        None,
+        description="Specifies if the Autonomous Database requires mTLS connections. This may not be updated in parallel with any of the following: licenseModel, databaseEdition, cpuCoreCount, computeCount, dataStorageSizeInTBs, whitelistedIps, openMode, permissionLevel, db-workload, privateEndpointLabel, nsgIds, customerContacts, dbVersion, scheduledOperations, dbToolsDetails, isLocalDataGuardEnabled, or isFreeTier. Service Change: The default value of the isMTLSConnectionRequired attribute will change from true to false on July 1, 2023 in the following APIs: - CreateAutonomousDatabase - GetAutonomousDatabase - UpdateAutonomousDatabase Details: Prior to the July 1, 2023 change, the isMTLSConnectionRequired attribute default value was true. This applies to Autonomous Database Serverless. Does this impact me? If you use or maintain custom scripts or Terraform scripts referencing the CreateAutonomousDatabase, GetAutonomousDatabase, or UpdateAutonomousDatabase APIs, you want to check, and possibly modify, the scripts for the changed default value of the attribute. Should you choose not to leave your scripts unchanged, the API calls containing this attribute will continue to work, but the default value will switch from true to false. How do I make this change? Using either OCI SDKs or command line tools, update your custom scripts to explicitly set the isMTLSConnectionRequired attribute to true.",
+    )
+    is_preview: Optional[Any] = Field(
+        None,
+        description="Indicates if the Autonomous Database version is a preview version.",
+    )
+    is_reconnect_clone_enabled: Optional[Any] = Field(
+        None,
+        description="Indicates if the refreshable clone can be reconnected to its source database.",
+    )
+    is_refreshable_clone: Optional[Any] = Field(
+        None,
+        description="Indicates if the Autonomous Database is a refreshable clone. This cannot be updated in parallel with any of the following: cpuCoreCount, computeCount, computeModel, adminPassword, whitelistedIps, openMode, permissionLevel, dbWorkload, privateEndpointLabel, nsgIds, dbVersion, dbName, scheduledOperations, dbToolsDetails, isLocalDataGuardEnabled, or isFreeTier.",
+    )
+    is_remote_data_guard_enabled: Optional[Any] = Field(
+        None,
+        description="Indicates whether the Autonomous Database has Cross Region Data Guard enabled. Not applicable to Autonomous Databases using dedicated Exadata infrastructure or Exadata Cloud@Customer infrastructure.",
+    )
+    key_history_entry: Optional[Any] = Field(
+        None,
+        description="Key History Entry.",
+    )
+    key_store_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the key store of Oracle Vault.",
+    )
+    key_store_wallet_name: Optional[Any] = Field(
+        None,
+        description="The wallet name for Oracle Key Vault.",
+    )
+    kms_key_id: Optional[Any] = Field(
+        None,
+        description="The OCID of the key container that is used as the master encryption key in database transparent data encryption (TDE) operations.",
+    )
+    kms_key_lifecycle_details: Optional[Any] = Field(
+        None,
+        description="KMS key lifecycle details.",
+    )
+    kms_key_version_id: Optional[Any] = Field(
+        None,
+        description="The OCID of the key container version that is used in database transparent data encryption (TDE) operations KMS Key can have multiple key versions. If none is specified, the current key version (latest) of the Key Id is used for the operation. Autonomous Database Serverless does not use key versions, hence is not applicable for Autonomous Database Serverless instances.",
+    )
+    license_model: Optional[Any] = Field(
+        None,
+        description="The Oracle license model that applies to the Oracle Autonomous Database. Bring your own license (BYOL) allows you to apply your current on-premises Oracle software licenses to equivalent, highly automated Oracle services in the cloud. License Included allows you to subscribe to new Oracle Database software licenses and the Oracle Database service. Note that when provisioning an `Autonomous Database on dedicated Exadata infrastructure`__, this attribute must be null. It is already set at the Autonomous Exadata Infrastructure level. When provisioning an `Autonomous Database Serverless]`__ database, if a value is not specified, the system defaults the value to `BRING_YOUR_OWN_LICENSE`. Bring your own license (BYOL) also allows you to select the DB edition using the optional parameter. This cannot be updated in parallel with any of the following: cpuCoreCount, computeCount, dataStorageSizeInTBs, adminPassword, isMTLSConnectionRequired, dbWorkload, privateEndpointLabel, nsgIds, dbVersion, dbName, scheduledOperations, dbToolsDetails, or isFreeTier. Allowed values for this property are: \"LICENSE_INCLUDED\", \"BRING_YOUR_OWN_LICENSE\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this AutonomousDatabase. The current state of the Autonomous Database. Allowed values for this property are: "PROVISIONING", "AVAILABLE", "STOPPING", "STOPPED", "STARTING", "TERMINATING", "TERMINATED", "UNAVAILABLE", "RESTORE_IN_PROGRESS", "RESTORE_FAILED", "BACKUP_IN_PROGRESS", "SCALE_IN_PROGRESS", "AVAILABLE_NEEDS_ATTENTION", "UPDATING", "MAINTENANCE_IN_PROGRESS", "RESTARTING", "RECREATING", "ROLE_CHANGE_IN_PROGRESS", "UPGRADING", "INACCESSIBLE", "STANDBY", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    local_adg_auto_failover_max_data_loss_limit: Optional[Any] = Field(
+        None,
+        description="Parameter that allows users to select an acceptable maximum data loss limit in seconds, up to which Automatic Failover will be triggered when necessary for a Local Autonomous Data Guard",
+    )
+    local_disaster_recovery_type: Optional[Any] = Field(
+        None,
+        description="Indicates the local disaster recovery (DR) type of the Autonomous Database Serverless instance. Autonomous Data Guard (ADG) DR type provides business critical DR with a faster recovery time objective (RTO) during failover or switchover. Backup-based DR type provides lower cost DR with a slower RTO during failover or switchover.",
+    )
+    local_standby_db: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    long_term_backup_schedule: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    memory_per_oracle_compute_unit_in_gbs: Optional[Any] = Field(
+        None,
+        description="The amount of memory (in GBs) enabled per ECPU or OCPU.",
+    )
+    ncharacter_set: Optional[Any] = Field(
+        None,
+        description="The national character set for the autonomous database. The default is AL16UTF16. Allowed values are: AL16UTF16 or UTF8.",
+    )
+    net_services_architecture: Optional[Any] = Field(
+        None,
+        description="Enabling SHARED server architecture enables a database server to allow many client processes to share very few server processes, thereby increasing the number of supported users. Allowed values for this property are: \"DEDICATED\", \"SHARED\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    next_long_term_backup_time_stamp: Optional[Any] = Field(
+        None,
+        description="The date and time when the next long-term backup would be created.",
+    )
+    nsg_ids: Optional[Any] = Field(
+        None,
+        description="The list of `OCIDs`__ for the network security groups (NSGs) to which this resource belongs. Setting this to an empty list removes all resources from all NSGs. For more information about NSGs, see `Security Rules`__. **NsgIds restrictions:** - A network security group (NSG) is optional for Autonomous Databases with private access. The nsgIds list can be empty.",
+    )
+    ocpu_count: Optional[float] = Field(
+        None,
+        description="The number of OCPU cores to be made available to the database. The following points apply: - For Autonomous Databases on Dedicated Exadata Infrastructure, to provision less than 1 core, enter a fractional value in an increment of 0.1. For example, you can provision 0.3 or 0.4 cores, but not 0.35 cores. (Note that fractional OCPU values are not supported for Autonomous Database Serverless instances.) - To provision cores, enter an integer between 1 and the maximum number of cores available for the infrastructure shape. For example, you can provision 2 cores or 3 cores, but not 2.5 cores. This applies to Autonomous Databases on both serverless and dedicated Exadata infrastructure. - For Autonomous Database Serverless instances, this parameter is not used. For Autonomous Databases on Dedicated Exadata Infrastructure, the maximum number of cores is determined by the infrastructure shape. See `Characteristics of Infrastructure Shapes`__ for shape details. **Note:** This parameter cannot be used with the `cpuCoreCount` parameter.",
+    )
+    open_mode: Optional[Any] = Field(
+        None,
+        description="Indicates the Autonomous Database mode. The database can be opened in `READ_ONLY` or `READ_WRITE` mode. This cannot be updated in parallel with any of the following: cpuCoreCount, computeCount, computeModel, adminPassword, whitelistedIps, isMTLSConnectionRequired, dbVersion, isRefreshable, dbName, scheduledOperations, dbToolsDetails, or isFreeTier. Allowed values for this property are: \"READ_ONLY\", \"READ_WRITE\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    operations_insights_status: Optional[Any] = Field(
+        None,
+        description='Status of Operations Insights for this Autonomous Database. Allowed values for this property are: "ENABLING", "ENABLED", "DISABLING", "NOT_ENABLED", "FAILED_ENABLING", "FAILED_DISABLING", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    peer_db_ids: Optional[Any] = Field(
+        None,
+        description="The list of `OCIDs`__ of standby databases located in Autonomous Data Guard remote regions that are associated with the source database. Note that for Autonomous Database Serverless instances, standby databases located in the same region as the source primary database do not have OCIDs.",
+    )
+    permission_level: Optional[Any] = Field(
+        None,
+        description="The Autonomous Database permission level. Restricted mode allows access only by admin users. This cannot be updated in parallel with any of the following: cpuCoreCount, computeCount, computeModel, adminPassword, whitelistedIps, isMTLSConnectionRequired, nsgIds, dbVersion, isRefreshable, dbName, scheduledOperations, dbToolsDetails, or isFreeTier. Allowed values for this property are: \"RESTRICTED\", \"UNRESTRICTED\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    private_endpoint: Optional[Any] = Field(
+        None,
+        description="The private endpoint for the resource.",
+    )
+    private_endpoint_ip: Optional[Any] = Field(
+        None,
+        description="The private endpoint Ip address for the resource.",
+    )
+    private_endpoint_label: Optional[Any] = Field(
+        None,
+        description="The resource's private endpoint label. - Setting the endpoint label to a non-empty string creates a private endpoint database. - Resetting the endpoint label to an empty string, after the creation of the private endpoint database, changes the private endpoint database to a public endpoint database. - Setting the endpoint label to a non-empty string value, updates to a new private endpoint database, when the database is disabled and re-enabled. This setting cannot be updated in parallel with any of the following: licenseModel, dbEdition, cpuCoreCount, computeCount, computeModel, adminPassword, whitelistedIps, isMTLSConnectionRequired, dbWorkload, dbVersion, isRefreshable, dbName, scheduledOperations, dbToolsDetails, or isFreeTier.",
+    )
+    provisionable_cpus: Optional[Any] = Field(
+        None,
+        description="An array of CPU values that an Autonomous Database can be scaled to.",
+    )
+    public_connection_urls: Optional[Any] = Field(
+        None,
+        description="The Public URLs of Private Endpoint database for accessing Oracle Application Express (APEX) and SQL Developer Web with a browser from a Compute instance within your VCN or that has a direct connection to your VCN.",
+    )
+    public_endpoint: Optional[Any] = Field(
+        None,
+        description="The public endpoint for the private endpoint enabled resource.",
+    )
+    refreshable_mode: Optional[Any] = Field(
+        None,
+        description="The refresh mode of the clone. AUTOMATIC indicates that the clone is automatically being refreshed with data from the source Autonomous Database. Allowed values for this property are: \"AUTOMATIC\", \"MANUAL\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    refreshable_status: Optional[Any] = Field(
+        None,
+        description="The refresh status of the clone. REFRESHING indicates that the clone is currently being refreshed with data from the source Autonomous Database. Allowed values for this property are: \"REFRESHING\", \"NOT_REFRESHING\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    remote_disaster_recovery_configuration: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    resource_pool_leader_id: Optional[Any] = Field(
+        None,
+        description="The unique identifier for leader autonomous database OCID `OCID`__.",
+    )
+    resource_pool_summary: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    role: Optional[Any] = Field(
+        None,
+        description='The Data Guard role of the Autonomous Container Database or Autonomous Database, if Autonomous Data Guard is enabled. Allowed values for this property are: "PRIMARY", "STANDBY", "DISABLED_STANDBY", "BACKUP_COPY", "SNAPSHOT_STANDBY", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    scheduled_operations: Optional[Any] = Field(
+        None,
+        description="The list of scheduled operations. Consists of values such as dayOfWeek, scheduledStartTime, scheduledStopTime. This cannot be updated in parallel with any of the following: licenseModel, dbEdition, cpuCoreCount, computeCount, computeModel, whitelistedIps, isMTLSConnectionRequired, openMode, permissionLevel, dbWorkload, privateEndpointLabel, nsgIds, dbVersion, isRefreshable, dbName, dbToolsDetails, isLocalDataGuardEnabled, or isFreeTier.",
+    )
+    security_attributes: Optional[Any] = Field(
+        None,
+        description='Security Attributes for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__. Example: `{"Oracle-ZPR": {"MaxEgressCount": {"value": "42", "mode": "audit"}}}`',
+    )
+    service_console_url: Optional[Any] = Field(
+        None,
+        description="The URL of the Service Console for the Autonomous Database.",
+    )
+    source_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the source Autonomous Database that was cloned to create the current Autonomous Database.",
+    )
+    standby_db: Optional[Any] = Field(
+        None,
+        description="**Deprecated** Autonomous Data Guard standby database details.",
+    )
+    standby_whitelisted_ips: Optional[Any] = Field(
+        None,
+        description='The client IP access control list (ACL). This feature is available for `Autonomous Database Serverless]`__ and on Exadata Cloud@Customer. Only clients connecting from an IP address included in the ACL may access the Autonomous Database instance. If `arePrimaryWhitelistedIpsUsed` is \'TRUE\' then Autonomous Database uses this primary\'s IP access control list (ACL) for the disaster recovery peer called `standbywhitelistedips`. For Autonomous Database Serverless, this is an array of CIDR (classless inter-domain routing) notations for a subnet or VCN OCID (virtual cloud network Oracle Cloud ID). Multiple IPs and VCN OCIDs should be separate strings separated by commas, but if it’s other configurations that need multiple pieces of information then its each piece is connected with semicolon (;) as a delimiter. Example: `["1.1.1.1","1.1.1.0/24","ocid1.vcn.oc1.sea.<unique_id>","ocid1.vcn.oc1.sea.<unique_id1>;1.1.1.1","ocid1.vcn.oc1.sea.<unique_id2>;1.1.0.0/16"]` For Exadata Cloud@Customer, this is an array of IP addresses or CIDR notations. Example: `["1.1.1.1","1.1.1.0/24","1.1.2.25"]` For an update operation, if you want to delete all the IPs in the ACL, use an array with a single empty string entry. This cannot be updated in parallel with any of the following: licenseModel, dbEdition, cpuCoreCount, computeCount, computeModel, adminPassword, isMTLSConnectionRequired, openMode, permissionLevel, dbWorkload, dbVersion, isRefreshable, dbName, scheduledOperations, dbToolsDetails, isLocalDataGuardEnabled, or isFreeTier.',
+    )
+    subnet_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the subnet the resource is associated with. **Subnet Restrictions:** - For bare metal DB systems and for single node virtual machine DB systems, do not use a subnet that overlaps with 192.168.16.16/28. - For Exadata and virtual machine 2-node RAC systems, do not use a subnet that overlaps with 192.168.128.0/20. - For Autonomous Database, setting this will disable public secure access to the database. These subnets are used by the Oracle Clusterware private interconnect on the database instance. Specifying an overlapping subnet will cause the private interconnect to malfunction. This restriction applies to both the client subnet and the backup subnet.",
+    )
+    subscription_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the subscription with which resource needs to be associated with.",
+    )
+    supported_regions_to_clone_to: Optional[Any] = Field(
+        None,
+        description="The list of regions that support the creation of an Autonomous Database clone or an Autonomous Data Guard standby database.",
+    )
+    system_tags: Optional[Any] = Field(
+        None,
+        description="System tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time the Autonomous Database was created.",
+    )
+    time_data_guard_role_changed: Optional[Any] = Field(
+        None,
+        description='The date and time the Autonomous Data Guard role was switched for the Autonomous Database. For databases that have standbys in both the primary Data Guard region and a remote Data Guard standby region, this is the latest timestamp of either the database using the "primary" role in the primary Data Guard region, or database located in the remote Data Guard standby region.',
+    )
+    time_deletion_of_free_autonomous_database: Optional[Any] = Field(
+        None,
+        description="The date and time the Always Free database will be automatically deleted because of inactivity. If the database is in the STOPPED state and without activity until this time, it will be deleted.",
+    )
+    time_disaster_recovery_role_changed: Optional[Any] = Field(
+        None,
+        description="The date and time the Disaster Recovery role was switched for the standby Autonomous Database.",
+    )
+    time_local_data_guard_enabled: Optional[Any] = Field(
+        None,
+        description="The date and time that Autonomous Data Guard was enabled for an Autonomous Database where the standby was provisioned in the same region as the primary database.",
+    )
+    time_maintenance_begin: Optional[Any] = Field(
+        None,
+        description="The date and time when maintenance will begin.",
+    )
+    time_maintenance_end: Optional[Any] = Field(
+        None,
+        description="The date and time when maintenance will end.",
+    )
+    time_of_auto_refresh_start: Optional[Any] = Field(
+        None,
+        description="The the date and time that auto-refreshing will begin for an Autonomous Database refreshable clone. This value controls only the start time for the first refresh operation. Subsequent (ongoing) refresh operations have start times controlled by the value of the `autoRefreshFrequencyInSeconds` parameter.",
+    )
+    time_of_joining_resource_pool: Optional[Any] = Field(
+        None,
+        description="The time the member joined the resource pool.",
+    )
+    time_of_last_failover: Optional[Any] = Field(
+        None,
+        description="The timestamp of the last failover operation.",
+    )
+    time_of_last_refresh: Optional[Any] = Field(
+        None,
+        description="The date and time when last refresh happened.",
+    )
+    time_of_last_refresh_point: Optional[Any] = Field(
+        None,
+        description="The refresh point timestamp (UTC). The refresh point is the time to which the database was most recently refreshed. Data created after the refresh point is not included in the refresh.",
+    )
+    time_of_last_switchover: Optional[Any] = Field(
+        None,
+        description="The timestamp of the last switchover operation for the Autonomous Database.",
+    )
+    time_of_next_refresh: Optional[Any] = Field(
+        None,
+        description="The date and time of next refresh.",
+    )
+    time_reclamation_of_free_autonomous_database: Optional[Any] = Field(
+        None,
+        description="The date and time the Always Free database will be stopped because of inactivity. If this time is reached without any database activity, the database will automatically be put into the STOPPED state.",
+    )
+    time_undeleted: Optional[Any] = Field(
+        None,
+        description="The date and time the Autonomous Database was most recently undeleted.",
+    )
+    time_until_reconnect_clone_enabled: Optional[Any] = Field(
+        None,
+        description="The time and date as an RFC3339 formatted string, e.g., 2022-01-01T12:00:00.000Z, to set the limit for a refreshable clone to be reconnected to its source database.",
+    )
+    total_backup_storage_size_in_gbs: Optional[float] = Field(
+        None,
+        description="The backup storage to the database.",
+    )
+    used_data_storage_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The storage space consumed by Autonomous Database in GBs.",
+    )
+    used_data_storage_size_in_tbs: Optional[Any] = Field(
+        None,
+        description="The amount of storage that has been used for Autonomous Databases in dedicated infrastructure, in terabytes.",
+    )
+    vault_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Oracle Cloud Infrastructure `vault`__. This parameter and `secretId` are required for Customer Managed Keys.",
+    )
+    whitelisted_ips: Optional[Any] = Field(
+        None,
+        description='The client IP access control list (ACL). This feature is available for `Autonomous Database Serverless]`__ and on Exadata Cloud@Customer. Only clients connecting from an IP address included in the ACL may access the Autonomous Database instance. If `arePrimaryWhitelistedIpsUsed` is \'TRUE\' then Autonomous Database uses this primary\'s IP access control list (ACL) for the disaster recovery peer called `standbywhitelistedips`. For Autonomous Database Serverless, this is an array of CIDR (classless inter-domain routing) notations for a subnet or VCN OCID (virtual cloud network Oracle Cloud ID). Multiple IPs and VCN OCIDs should be separate strings separated by commas, but if it’s other configurations that need multiple pieces of information then its each piece is connected with semicolon (;) as a delimiter. Example: `["1.1.1.1","1.1.1.0/24","ocid1.vcn.oc1.sea.<unique_id>","ocid1.vcn.oc1.sea.<unique_id1>;1.1.1.1","ocid1.vcn.oc1.sea.<unique_id2>;1.1.0.0/16"]` For Exadata Cloud@Customer, this is an array of IP addresses or CIDR notations. Example: `["1.1.1.1","1.1.1.0/24","1.1.2.25"]` For an update operation, if you want to delete all the IPs in the ACL, use an array with a single empty string entry. This cannot be updated in parallel with any of the following: licenseModel, dbEdition, cpuCoreCount, computeCount, computeModel, adminPassword, isMTLSConnectionRequired, openMode, permissionLevel, dbWorkload, dbVersion, isRefreshable, dbName, scheduledOperations, dbToolsDetails, isLocalDataGuardEnabled, or isFreeTier.',
+    )
+
+
+def map_autonomousdatabase(
+    o: oci.database.models.AutonomousDatabase,
+    fields: Optional[list[str]] = None,
+) -> AutonomousDatabase | None:
+    """Map oci.database.models.AutonomousDatabase → AutonomousDatabase Pydantic model."""
+    return map_model(AutonomousDatabase, o, fields)
+
+
+class AutonomousDatabaseBackup(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.AutonomousDatabaseBackup."""
+
+    autonomous_database_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the autonomous_database_id of this AutonomousDatabaseBackup. The `OCID`__ of the Autonomous Database.",
+    )
+    backup_destination_details: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this AutonomousDatabaseBackup. The `OCID`__ of the compartment.",
+    )
+    database_size_in_tbs: Optional[float] = Field(
+        None,
+        description="The size of the database in terabytes at the time the backup was taken.",
+    )
+    db_version: Optional[Any] = Field(
+        None,
+        description="A valid Oracle Database version for Autonomous Database.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this AutonomousDatabaseBackup. The user-friendly name for the backup. The name does not have to be unique.",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this AutonomousDatabaseBackup. The `OCID`__ of the Autonomous Database backup.",
+    )
+    is_automatic: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the is_automatic of this AutonomousDatabaseBackup. Indicates whether the backup is user-initiated or automatic.",
+    )
+    is_restorable: Optional[Any] = Field(
+        None,
+        description="Indicates whether the backup can be used to restore the associated Autonomous Database.",
+    )
+    key_store_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the key store of Oracle Vault.",
+    )
+    key_store_wallet_name: Optional[Any] = Field(
+        None,
+        description="The wallet name for Oracle Key Vault.",
+    )
+    kms_key_id: Optional[Any] = Field(
+        None,
+        description="The OCID of the key container that is used as the master encryption key in database transparent data encryption (TDE) operations.",
+    )
+    kms_key_version_id: Optional[Any] = Field(
+        None,
+        description="The OCID of the key container version that is used in database transparent data encryption (TDE) operations KMS Key can have multiple key versions. If none is specified, the current key version (latest) of the Key Id is used for the operation. Autonomous Database Serverless does not use key versions, hence is not applicable for Autonomous Database Serverless instances.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this AutonomousDatabaseBackup. The current state of the backup. Allowed values for this property are: "CREATING", "ACTIVE", "DELETING", "DELETED", "FAILED", "UPDATING", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    retention_period_in_days: Optional[Any] = Field(
+        None,
+        description="Retention period, in days, for long-term backups",
+    )
+    size_in_tbs: Optional[float] = Field(
+        None,
+        description="The backup size in terrabytes (TB).",
+    )
+    time_available_till: Optional[Any] = Field(
+        None,
+        description="Timestamp until when the backup will be available",
+    )
+    time_ended: Optional[Any] = Field(
+        None,
+        description="The date and time the backup completed.",
+    )
+    time_started: Optional[Any] = Field(
+        None,
+        description="The date and time the backup started.",
+    )
+    type: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the type of this AutonomousDatabaseBackup. The type of backup. Allowed values for this property are: "INCREMENTAL", "FULL", "LONGTERM", "VIRTUAL_FULL", "CUMULATIVE_INCREMENTAL", "ROLL_FORWARD_IMAGE_COPY", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    vault_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Oracle Cloud Infrastructure `vault`__. This parameter and `secretId` are required for Customer Managed Keys.",
+    )
+
+
+def map_autonomousdatabasebackup(
+    o: oci.database.models.AutonomousDatabaseBackup,
+    fields: Optional[list[str]] = None,
+) -> AutonomousDatabaseBackup | None:
+    """Map oci.database.models.AutonomousDatabaseBackup → AutonomousDatabaseBackup Pydantic model."""
+    return map_model(AutonomousDatabaseBackup, o, fields)
+
+
+class AutonomousDatabaseWallet(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.AutonomousDatabaseWallet."""
+
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description="The current lifecycle state of the Autonomous Database wallet. Allowed values for this property are: \"ACTIVE\", \"UPDATING\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    time_rotated: Optional[Any] = Field(
+        None,
+        description="The date and time the wallet was last rotated.",
+    )
+
+
+def map_autonomousdatabasewallet(
+    o: oci.database.models.AutonomousDatabaseWallet,
+    fields: Optional[list[str]] = None,
+) -> AutonomousDatabaseWallet | None:
+    """Map oci.database.models.AutonomousDatabaseWallet → AutonomousDatabaseWallet Pydantic model."""
+    return map_model(AutonomousDatabaseWallet, o, fields)
+
+
+class AutonomousDatabaseSoftwareImage(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.AutonomousDatabaseSoftwareImage."""
+
+    autonomous_dsi_one_off_patches: Optional[Any] = Field(
+        None,
+        description="One-off patches included in the Autonomous Database Software Image",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this AutonomousDatabaseSoftwareImage. The `OCID`__ of the compartment.",
+    )
+    database_version: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the database_version of this AutonomousDatabaseSoftwareImage. The database version with which the Autonomous Database Software Image is to be built.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this AutonomousDatabaseSoftwareImage. The user-friendly name for the Autonomous Database Software Image. The name does not have to be unique.",
+    )
+    dst_file_version: Optional[Any] = Field(
+        None,
+        description="DST Time-Zone File version of the Autonomous Container Database.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this AutonomousDatabaseSoftwareImage. The `OCID`__ of the Autonomous Database Software Image.",
+    )
+    image_shape_family: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the image_shape_family of this AutonomousDatabaseSoftwareImage. To what shape the image is meant for. Allowed values for this property are: \"EXACC_SHAPE\", \"EXADATA_SHAPE\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Detailed message for the lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this AutonomousDatabaseSoftwareImage. The current state of the Autonomous Database Software Image. Allowed values for this property are: "AVAILABLE", "FAILED", "PROVISIONING", "EXPIRED", "TERMINATED", "TERMINATING", "UPDATING", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    release_update: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the release_update of this AutonomousDatabaseSoftwareImage. The Release Updates.",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the time_created of this AutonomousDatabaseSoftwareImage. The date and time the Autonomous Database Software Image was created.",
+    )
+
+
+def map_autonomousdatabasesoftwareimage(
+    o: oci.database.models.AutonomousDatabaseSoftwareImage,
+    fields: Optional[list[str]] = None,
+) -> AutonomousDatabaseSoftwareImage | None:
+    """Map oci.database.models.AutonomousDatabaseSoftwareImage → AutonomousDatabaseSoftwareImage Pydantic model."""
+    return map_model(AutonomousDatabaseSoftwareImage, o, fields)
+
+
+class AutonomousExadataInfrastructure(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.AutonomousExadataInfrastructure."""
+
+    availability_domain: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the availability_domain of this AutonomousExadataInfrastructure. The name of the availability domain that the Autonomous Exadata Infrastructure is located in.",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this AutonomousExadataInfrastructure. The OCID of the compartment.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this AutonomousExadataInfrastructure. The user-friendly name for the Autonomous Exadata Infrastructure.",
+    )
+    domain: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the domain of this AutonomousExadataInfrastructure. The domain name for the Autonomous Exadata Infrastructure.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    hostname: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the hostname of this AutonomousExadataInfrastructure. The host name for the Autonomous Exadata Infrastructure node.",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this AutonomousExadataInfrastructure. The OCID of the Autonomous Exadata Infrastructure.",
+    )
+    last_maintenance_run_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the last maintenance run.",
+    )
+    license_model: Optional[Any] = Field(
+        None,
+        description="The Oracle license model that applies to all databases in the Autonomous Exadata Infrastructure. The default is BRING_YOUR_OWN_LICENSE. Allowed values for this property are: \"LICENSE_INCLUDED\", \"BRING_YOUR_OWN_LICENSE\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state of the Autonomous Exadata Infrastructure.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this AutonomousExadataInfrastructure. The current lifecycle state of the Autonomous Exadata Infrastructure. Allowed values for this property are: "PROVISIONING", "AVAILABLE", "UPDATING", "TERMINATING", "TERMINATED", "FAILED", "MAINTENANCE_IN_PROGRESS", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    maintenance_window: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the maintenance_window of this AutonomousExadataInfrastructure.",
+    )
+    next_maintenance_run_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the next maintenance run.",
+    )
+    nsg_ids: Optional[Any] = Field(
+        None,
+        description="The list of `OCIDs`__ for the network security groups (NSGs) to which this resource belongs. Setting this to an empty list removes all resources from all NSGs. For more information about NSGs, see `Security Rules`__. **NsgIds restrictions:** - A network security group (NSG) is optional for Autonomous Databases with private access. The nsgIds list can be empty.",
+    )
+    scan_dns_name: Optional[Any] = Field(
+        None,
+        description="The FQDN of the DNS record for the SCAN IP addresses that are associated with the Autonomous Exadata Infrastructure.",
+    )
+    shape: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the shape of this AutonomousExadataInfrastructure. The shape of the Autonomous Exadata Infrastructure. The shape determines resources to allocate to the Autonomous Exadata Infrastructure (CPU cores, memory and storage).",
+    )
+    subnet_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the subnet_id of this AutonomousExadataInfrastructure. The OCID of the subnet the Autonomous Exadata Infrastructure is associated with. **Subnet Restrictions:** - For Autonomous Databases with Autonomous Exadata Infrastructure, do not use a subnet that overlaps with 192.168.128.0/20 These subnets are used by the Oracle Clusterware private interconnect on the database instance. Specifying an overlapping subnet will cause the private interconnect to malfunction. This restriction applies to both the client subnet and backup subnet.",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time the Autonomous Exadata Infrastructure was created.",
+    )
+    zone_id: Optional[Any] = Field(
+        None,
+        description="The OCID of the zone the Autonomous Exadata Infrastructure is associated with.",
+    )
+
+
+def map_autonomousexadatainfrastructure(
+    o: oci.database.models.AutonomousExadataInfrastructure,
+    fields: Optional[list[str]] = None,
+) -> AutonomousExadataInfrastructure | None:
+    """Map oci.database.models.AutonomousExadataInfrastructure → AutonomousExadataInfrastructure Pydantic model."""
+    return map_model(AutonomousExadataInfrastructure, o, fields)
+
+
+class AutonomousPatch(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.AutonomousPatch."""
+
+    autonomous_patch_type: Optional[Any] = Field(
+        None,
+        description='Maintenance run type, either "QUARTERLY" or "TIMEZONE". Allowed values for this property are: "QUARTERLY", "TIMEZONE", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    description: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the description of this AutonomousPatch. The text describing this patch package.",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this AutonomousPatch. The `OCID`__ of the patch.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="A descriptive text associated with the lifecycleState. Typically can contain additional displayable text.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='The current state of the patch as a result of lastAction. Allowed values for this property are: "AVAILABLE", "SUCCESS", "IN_PROGRESS", "FAILED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    patch_model: Optional[Any] = Field(
+        None,
+        description="Database patching model preference. See `My Oracle Support note 2285040.1`__ for information on the Release Update (RU) and Release Update Revision (RUR) patching models. Allowed values for this property are: \"RELEASE_UPDATES\", \"RELEASE_UPDATE_REVISIONS\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    quarter: Optional[Any] = Field(
+        None,
+        description="First month of the quarter in which the patch was released.",
+    )
+    time_released: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the time_released of this AutonomousPatch. The date and time that the patch was released.",
+    )
+    type: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the type of this AutonomousPatch. The type of patch. BUNDLE is one example.",
+    )
+    version: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the version of this AutonomousPatch. The version of this patch package.",
+    )
+    year: Optional[Any] = Field(
+        None,
+        description="Year in which the patch was released.",
+    )
+
+
+def map_autonomouspatch(
+    o: oci.database.models.AutonomousPatch,
+    fields: Optional[list[str]] = None,
+) -> AutonomousPatch | None:
+    """Map oci.database.models.AutonomousPatch → AutonomousPatch Pydantic model."""
+    return map_model(AutonomousPatch, o, fields)
+
+
+class AutonomousVirtualMachine(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.AutonomousVirtualMachine."""
+
+    autonomous_vm_cluster_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Autonomous VM Cluster associated with the Autonomous Virtual Machine.",
+    )
+    client_ip_address: Optional[Any] = Field(
+        None,
+        description="Client IP Address.",
+    )
+    cloud_autonomous_vm_cluster_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Cloud Autonomous VM Cluster associated with the Autonomous Virtual Machine.",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the compartment.",
+    )
+    cpu_core_count: Optional[Any] = Field(
+        None,
+        description="The number of CPU cores enabled on the Autonomous Virtual Machine.",
+    )
+    db_node_storage_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The allocated local node storage in GBs on the Autonomous Virtual Machine.",
+    )
+    db_server_display_name: Optional[Any] = Field(
+        None,
+        description="The display name of the dbServer associated with the Autonomous Virtual Machine.",
+    )
+    db_server_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Db server associated with the Autonomous Virtual Machine.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this AutonomousVirtualMachine. The `OCID`__ of the Autonomous Virtual Machine.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this AutonomousVirtualMachine. The current state of the Autonomous Virtual Machine. Allowed values for this property are: "PROVISIONING", "AVAILABLE", "UPDATING", "TERMINATING", "TERMINATED", "FAILED", "MAINTENANCE_IN_PROGRESS", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    memory_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The allocated memory in GBs on the Autonomous Virtual Machine.",
+    )
+    vm_name: Optional[Any] = Field(
+        None,
+        description="The name of the Autonomous Virtual Machine.",
+    )
+
+
+def map_autonomousvirtualmachine(
+    o: oci.database.models.AutonomousVirtualMachine,
+    fields: Optional[list[str]] = None,
+) -> AutonomousVirtualMachine | None:
+    """Map oci.database.models.AutonomousVirtualMachine → AutonomousVirtualMachine Pydantic model."""
+    return map_model(AutonomousVirtualMachine, o, fields)
+
+
+class AutonomousVmCluster(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.AutonomousVmCluster."""
+
+    autonomous_data_storage_percentage: Optional[float] = Field(
+        None,
+        description="The percentage of the data storage used for the Autonomous Databases in an Autonomous VM Cluster.",
+    )
+    autonomous_data_storage_size_in_tbs: Optional[float] = Field(
+        None,
+        description="The data disk group size allocated for Autonomous Databases, in TBs.",
+    )
+    available_autonomous_data_storage_size_in_tbs: Optional[float] = Field(
+        None,
+        description="The data disk group size available for Autonomous Databases, in TBs.",
+    )
+    available_container_databases: Optional[Any] = Field(
+        None,
+        description="The number of Autonomous Container Databases that can be created with the currently available local storage.",
+    )
+    available_cpus: Optional[Any] = Field(
+        None,
+        description="The numnber of CPU cores available.",
+    )
+    available_data_storage_size_in_tbs: Optional[float] = Field(
+        None,
+        description="**Deprecated.** Use `availableAutonomousDataStorageSizeInTBs` for Autonomous Databases' data storage availability in TBs.",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this AutonomousVmCluster. The `OCID`__ of the compartment.",
+    )
+    compute_model: Optional[Any] = Field(
+        None,
+        description="The compute model of the Autonomous VM Cluster. ECPU compute model is the recommended model and OCPU compute model is legacy. See `Compute Models in Autonomous Database on Dedicated Exadata #Infrastructure`__ for more details. Allowed values for this property are: \"ECPU\", \"OCPU\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    cpu_core_count_per_node: Optional[Any] = Field(
+        None,
+        description="The number of CPU cores enabled per VM cluster node.",
+    )
+    cpu_percentage: Optional[float] = Field(
+        None,
+        description="The percentage of total number of CPUs used in an Autonomous VM Cluster.",
+    )
+    cpus_enabled: Optional[Any] = Field(
+        None,
+        description="The number of enabled CPU cores.",
+    )
+    cpus_lowest_scaled_value: Optional[Any] = Field(
+        None,
+        description="The lowest value to which cpus can be scaled down.",
+    )
+    data_storage_size_in_gbs: Optional[float] = Field(
+        None,
+        description="The total data storage allocated in GBs.",
+    )
+    data_storage_size_in_tbs: Optional[float] = Field(
+        None,
+        description="The total data storage allocated in TBs",
+    )
+    db_node_storage_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The local node storage allocated in GBs.",
+    )
+    db_servers: Optional[Any] = Field(
+        None,
+        description="The list of `OCIDs`__ of the Db servers.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this AutonomousVmCluster. The user-friendly name for the Autonomous VM cluster. The name does not need to be unique.",
+    )
+    exadata_infrastructure_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the exadata_infrastructure_id of this AutonomousVmCluster. The `OCID`__ of the Exadata infrastructure.",
+    )
+    exadata_storage_in_tbs_lowest_scaled_value: Optional[float] = Field(
+        None,
+        description="The lowest value to which exadataStorage(in TBs) can be scaled down.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this AutonomousVmCluster. The `OCID`__ of the Autonomous VM cluster.",
+    )
+    is_local_backup_enabled: Optional[Any] = Field(
+        None,
+        description="If true, database backup on local Exadata storage is configured for the Autonomous VM cluster. If false, database backup on local Exadata storage is not available in the Autonomous VM cluster.",
+    )
+    is_mtls_enabled: Optional[Any] = Field(
+        None,
+        description="Enable mutual TLS(mTLS) authentication for database while provisioning a VMCluster. Default is TLS.",
+    )
+    last_maintenance_run_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the last maintenance run.",
+    )
+    license_model: Optional[Any] = Field(
+        None,
+        description="The Oracle license model that applies to the Autonomous VM cluster. The default is LICENSE_INCLUDED. Allowed values for this property are: \"LICENSE_INCLUDED\", \"BRING_YOUR_OWN_LICENSE\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this AutonomousVmCluster. The current state of the Autonomous VM cluster. Allowed values for this property are: "PROVISIONING", "AVAILABLE", "UPDATING", "TERMINATING", "TERMINATED", "FAILED", "MAINTENANCE_IN_PROGRESS", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    maintenance_window: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    max_acds_lowest_scaled_value: Optional[Any] = Field(
+        None,
+        description="The lowest value to which maximum number of ACDs can be scaled down.",
+    )
+    memory_per_oracle_compute_unit_in_gbs: Optional[Any] = Field(
+        None,
+        description="The amount of memory (in GBs) to be enabled per OCPU or ECPU.",
+    )
+    memory_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The memory allocated in GBs.",
+    )
+    next_maintenance_run_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the next maintenance run.",
+    )
+    node_count: Optional[Any] = Field(
+        None,
+        description="The number of nodes in the Autonomous VM Cluster.",
+    )
+    non_provisionable_autonomous_container_databases: Optional[Any] = Field(
+        None,
+        description="The number of non-provisionable Autonomous Container Databases in an Autonomous VM Cluster.",
+    )
+    ocpus_enabled: Optional[float] = Field(
+        None,
+        description="The number of enabled OCPU cores.",
+    )
+    provisionable_autonomous_container_databases: Optional[Any] = Field(
+        None,
+        description="**Deprecated.** Use field totalContainerDatabases.",
+    )
+    provisioned_autonomous_container_databases: Optional[Any] = Field(
+        None,
+        description="The number of provisioned Autonomous Container Databases in an Autonomous VM Cluster.",
+    )
+    provisioned_cpus: Optional[float] = Field(
+        None,
+        description="The number of CPUs provisioned in an Autonomous VM Cluster.",
+    )
+    reclaimable_cpus: Optional[Any] = Field(
+        None,
+        description="CPUs that continue to be included in the count of CPUs available to the Autonomous Container Database even after one of its Autonomous Database is terminated or scaled down. You can release them to the available CPUs at its parent Autonomous VM Cluster level by restarting the Autonomous Container Database.",
+    )
+    reserved_cpus: Optional[float] = Field(
+        None,
+        description="The number of CPUs reserved in an Autonomous VM Cluster.",
+    )
+    scan_listener_port_non_tls: Optional[Any] = Field(
+        None,
+        description="The SCAN Listener Non TLS port number. Default value is 1521.",
+    )
+    scan_listener_port_tls: Optional[Any] = Field(
+        None,
+        description="The SCAN Listener TLS port number. Default value is 2484.",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time that the Autonomous VM cluster was created.",
+    )
+    time_database_ssl_certificate_expires: Optional[Any] = Field(
+        None,
+        description="The date and time of the Database SSL certificate expiration.",
+    )
+    time_ords_certificate_expires: Optional[Any] = Field(
+        None,
+        description="The date and time of the ORDS certificate expiration.",
+    )
+    time_zone: Optional[Any] = Field(
+        None,
+        description="The time zone to use for the Autonomous VM cluster. For details, see `DB System Time Zones`__.",
+    )
+    total_autonomous_data_storage_in_tbs: Optional[float] = Field(
+        None,
+        description="The total data disk group size for Autonomous Databases, in TBs.",
+    )
+    total_container_databases: Optional[Any] = Field(
+        None,
+        description="The total number of Autonomous Container Databases that can be created.",
+    )
+    vm_cluster_network_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the vm_cluster_network_id of this AutonomousVmCluster. The `OCID`__ of the VM cluster network.",
+    )
+
+
+def map_autonomousvmcluster(
+    o: oci.database.models.AutonomousVmCluster,
+    fields: Optional[list[str]] = None,
+) -> AutonomousVmCluster | None:
+    """Map oci.database.models.AutonomousVmCluster → AutonomousVmCluster Pydantic model."""
+    return map_model(AutonomousVmCluster, o, fields)
+
+
+class AutonomousVmClusterResourceUsage(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.AutonomousVmClusterResourceUsage."""
+
+    autonomous_data_storage_size_in_tbs: Optional[float] = Field(
+        None,
+        description="The data disk group size allocated for Autonomous Databases, in TBs.",
+    )
+    autonomous_vm_resource_usage: Optional[Any] = Field(
+        None,
+        description="List of autonomous vm cluster resource usages.",
+    )
+    available_autonomous_data_storage_size_in_tbs: Optional[float] = Field(
+        None,
+        description="The data disk group size available for Autonomous Databases, in TBs.",
+    )
+    available_cpus: Optional[float] = Field(
+        None,
+        description="The number of CPU cores available.",
+    )
+    db_node_storage_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The local node storage allocated in GBs.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this AutonomousVmClusterResourceUsage. The user-friendly name for the Autonomous VM cluster. The name does not need to be unique.",
+    )
+    exadata_storage_in_tbs: Optional[float] = Field(
+        None,
+        description="Total exadata storage allocated for the Autonomous VM Cluster. DATA + RECOVERY + SPARSE + any overhead in TBs.",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Autonomous VM cluster.",
+    )
+    is_local_backup_enabled: Optional[Any] = Field(
+        None,
+        description="If true, database backup on local Exadata storage is configured for the Autonomous VM cluster. If false, database backup on local Exadata storage is not available in the Autonomous VM cluster.",
+    )
+    memory_per_oracle_compute_unit_in_gbs: Optional[Any] = Field(
+        None,
+        description="The amount of memory (in GBs) to be enabled per each CPU core.",
+    )
+    memory_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The memory allocated in GBs.",
+    )
+    non_provisionable_autonomous_container_databases: Optional[Any] = Field(
+        None,
+        description="The number of non-provisionable Autonomous Container Databases in an Autonomous VM Cluster.",
+    )
+    provisionable_autonomous_container_databases: Optional[Any] = Field(
+        None,
+        description="The number of provisionable Autonomous Container Databases in an Autonomous VM Cluster.",
+    )
+    provisioned_autonomous_container_databases: Optional[Any] = Field(
+        None,
+        description="The number of provisioned Autonomous Container Databases in an Autonomous VM Cluster.",
+    )
+    provisioned_cpus: Optional[float] = Field(
+        None,
+        description="The number of CPUs provisioned in an Autonomous VM Cluster.",
+    )
+    reclaimable_cpus: Optional[float] = Field(
+        None,
+        description="CPU cores that continue to be included in the count of OCPUs available to the Autonomous Container Database even after one of its Autonomous Database is terminated or scaled down. You can release them to the available OCPUs at its parent AVMC level by restarting the Autonomous Container Database.",
+    )
+    reserved_cpus: Optional[float] = Field(
+        None,
+        description="The number of CPUs reserved in an Autonomous VM Cluster.",
+    )
+    total_container_databases: Optional[Any] = Field(
+        None,
+        description="The total number of Autonomous Container Databases that can be created.",
+    )
+    total_cpus: Optional[float] = Field(
+        None,
+        description="The number of CPU cores enabled on the Autonomous VM cluster.",
+    )
+    used_autonomous_data_storage_size_in_tbs: Optional[float] = Field(
+        None,
+        description="The data disk group size used for Autonomous Databases, in TBs.",
+    )
+    used_cpus: Optional[float] = Field(
+        None,
+        description="The number of CPU cores alloted to the Autonomous Container Databases in an Autonomous VM cluster.",
+    )
+
+
+def map_autonomousvmclusterresourceusage(
+    o: oci.database.models.AutonomousVmClusterResourceUsage,
+    fields: Optional[list[str]] = None,
+) -> AutonomousVmClusterResourceUsage | None:
+    """Map oci.database.models.AutonomousVmClusterResourceUsage → AutonomousVmClusterResourceUsage Pydantic model."""
+    return map_model(AutonomousVmClusterResourceUsage, o, fields)
+
+
+class CloudAutonomousVmCluster(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.CloudAutonomousVmCluster."""
+
+    autonomous_data_storage_percentage: Optional[float] = Field(
+        None,
+        description="The percentage of the data storage used for the Autonomous Databases in an Autonomous VM Cluster.",
+    )
+    autonomous_data_storage_size_in_tbs: Optional[float] = Field(
+        None,
+        description="The data disk group size allocated for Autonomous Databases, in TBs.",
+    )
+    availability_domain: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the availability_domain of this CloudAutonomousVmCluster. The name of the availability domain that the cloud Autonomous VM cluster is located in.",
+    )
+    available_autonomous_data_storage_size_in_tbs: Optional[float] = Field(
+        None,
+        description="The data disk group size available for Autonomous Databases, in TBs.",
+    )
+    available_container_databases: Optional[Any] = Field(
+        None,
+        description="The number of Autonomous Container Databases that can be created with the currently available local storage.",
+    )
+    available_cpus: Optional[float] = Field(
+        None,
+        description="CPU cores available for allocation to Autonomous Databases.",
+    )
+    cloud_exadata_infrastructure_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the cloud_exadata_infrastructure_id of this CloudAutonomousVmCluster. The `OCID`__ of the cloud Exadata infrastructure.",
+    )
+    cluster_time_zone: Optional[Any] = Field(
+        None,
+        description="The time zone of the Cloud Autonomous VM Cluster.",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this CloudAutonomousVmCluster. The `OCID`__ of the compartment.",
+    )
+    compute_model: Optional[Any] = Field(
+        None,
+        description="The compute model of the Cloud Autonomous VM Cluster. ECPU compute model is the recommended model and OCPU compute model is legacy. See `Compute Models in Autonomous Database on Dedicated Exadata #Infrastructure`__ for more details. Allowed values for this property are: \"ECPU\", \"OCPU\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    cpu_core_count: Optional[Any] = Field(
+        None,
+        description="The number of CPU cores on the cloud Autonomous VM cluster.",
+    )
+    cpu_core_count_per_node: Optional[Any] = Field(
+        None,
+        description="The number of CPU cores enabled per VM cluster node.",
+    )
+    cpu_percentage: Optional[float] = Field(
+        None,
+        description="The percentage of total number of CPUs used in an Autonomous VM Cluster.",
+    )
+    data_storage_size_in_gbs: Optional[float] = Field(
+        None,
+        description="The total data storage allocated, in gigabytes (GB).",
+    )
+    data_storage_size_in_tbs: Optional[float] = Field(
+        None,
+        description="The total data storage allocated, in terabytes (TB).",
+    )
+    db_node_storage_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The local node storage allocated in GBs.",
+    )
+    db_servers: Optional[Any] = Field(
+        None,
+        description="The list of `OCIDs`__ of the Db servers.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    description: Optional[Any] = Field(
+        None,
+        description="User defined description of the cloud Autonomous VM cluster.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this CloudAutonomousVmCluster. The user-friendly name for the cloud Autonomous VM cluster. The name does not need to be unique.",
+    )
+    domain: Optional[Any] = Field(
+        None,
+        description="The domain name for the cloud Autonomous VM cluster.",
+    )
+    exadata_storage_in_tbs_lowest_scaled_value: Optional[float] = Field(
+        None,
+        description="The lowest value to which exadataStorage (in TBs) can be scaled down.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    hostname: Optional[Any] = Field(
+        None,
+        description="The hostname for the cloud Autonomous VM cluster.",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this CloudAutonomousVmCluster. The `OCID`__ of the Cloud Autonomous VM cluster.",
+    )
+    is_mtls_enabled_vm_cluster: Optional[Any] = Field(
+        None,
+        description="Enable mutual TLS(mTLS) authentication for database at time of provisioning a VMCluster. This is applicable to database TLS Certificates only. Default is TLS",
+    )
+    last_maintenance_run_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the last maintenance run.",
+    )
+    last_update_history_entry_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the last maintenance update history. This value is updated when a maintenance update starts.",
+    )
+    license_model: Optional[Any] = Field(
+        None,
+        description="The Oracle license model that applies to the Oracle Autonomous Database. Bring your own license (BYOL) allows you to apply your current on-premises Oracle software licenses to equivalent, highly automated Oracle services in the cloud. License Included allows you to subscribe to new Oracle Database software licenses and the Oracle Database service. Note that when provisioning an `Autonomous Database on dedicated Exadata infrastructure`__, this attribute must be null. It is already set at the Autonomous Exadata Infrastructure level. When provisioning an `Autonomous Database Serverless]`__ database, if a value is not specified, the system defaults the value to `BRING_YOUR_OWN_LICENSE`. Bring your own license (BYOL) also allows you to select the DB edition using the optional parameter. This cannot be updated in parallel with any of the following: cpuCoreCount, computeCount, dataStorageSizeInTBs, adminPassword, isMTLSConnectionRequired, dbWorkload, privateEndpointLabel, nsgIds, dbVersion, dbName, scheduledOperations, dbToolsDetails, or isFreeTier. Allowed values for this property are: \"LICENSE_INCLUDED\", \"BRING_YOUR_OWN_LICENSE\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this CloudAutonomousVmCluster. The current state of the cloud Autonomous VM cluster. Allowed values for this property are: "PROVISIONING", "AVAILABLE", "UPDATING", "TERMINATING", "TERMINATED", "FAILED", "MAINTENANCE_IN_PROGRESS", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    maintenance_window: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    max_acds_lowest_scaled_value: Optional[Any] = Field(
+        None,
+        description="The lowest value to which maximum number of ACDs can be scaled down.",
+    )
+    memory_per_oracle_compute_unit_in_gbs: Optional[Any] = Field(
+        None,
+        description="The amount of memory (in GBs) enabled per OCPU or ECPU.",
+    )
+    memory_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The memory allocated in GBs.",
+    )
+    next_maintenance_run_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the next maintenance run.",
+    )
+    node_count: Optional[Any] = Field(
+        None,
+        description="The number of database servers in the cloud VM cluster.",
+    )
+    non_provisionable_autonomous_container_databases: Optional[Any] = Field(
+        None,
+        description="The number of non-provisionable Autonomous Container Databases in an Autonomous VM Cluster.",
+    )
+    nsg_ids: Optional[Any] = Field(
+        None,
+        description="The list of `OCIDs`__ for the network security groups (NSGs) to which this resource belongs. Setting this to an empty list removes all resources from all NSGs. For more information about NSGs, see `Security Rules`__. **NsgIds restrictions:** - A network security group (NSG) is optional for Autonomous Databases with private access. The nsgIds list can be empty.",
+    )
+    ocpu_count: Optional[float] = Field(
+        None,
+        description="The number of CPU cores on the cloud Autonomous VM cluster. Only 1 decimal place is allowed for the fractional part.",
+    )
+    ocpus_lowest_scaled_value: Optional[Any] = Field(
+        None,
+        description="The lowest value to which ocpus can be scaled down.",
+    )
+    provisionable_autonomous_container_databases: Optional[Any] = Field(
+        None,
+        description="The number of provisionable Autonomous Container Databases in an Autonomous VM Cluster.",
+    )
+    provisioned_autonomous_container_databases: Optional[Any] = Field(
+        None,
+        description="The number of provisioned Autonomous Container Databases in an Autonomous VM Cluster.",
+    )
+    provisioned_cpus: Optional[float] = Field(
+        None,
+        description="The number of CPUs provisioned in an Autonomous VM Cluster.",
+    )
+    reclaimable_cpus: Optional[float] = Field(
+        None,
+        description="CPUs that continue to be included in the count of CPUs available to the Autonomous Container Database even after one of its Autonomous Database is terminated or scaled down. You can release them to the available CPUs at its parent Autonomous VM Cluster level by restarting the Autonomous Container Database.",
+    )
+    reserved_cpus: Optional[float] = Field(
+        None,
+        description="The number of CPUs reserved in an Autonomous VM Cluster.",
+    )
+    scan_listener_port_non_tls: Optional[Any] = Field(
+        None,
+        description="The SCAN Listener Non TLS port. Default is 1521.",
+    )
+    scan_listener_port_tls: Optional[Any] = Field(
+        None,
+        description="The SCAN Listenenr TLS port. Default is 2484.",
+    )
+    security_attributes: Optional[Any] = Field(
+        None,
+        description='Security Attributes for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__. Example: `{"Oracle-ZPR": {"MaxEgressCount": {"value": "42", "mode": "audit"}}}`',
+    )
+    shape: Optional[Any] = Field(
+        None,
+        description="The model name of the Exadata hardware running the cloud Autonomous VM cluster.",
+    )
+    subnet_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the subnet_id of this CloudAutonomousVmCluster. The `OCID`__ of the subnet the cloud Autonomous VM Cluster is associated with. **Subnet Restrictions:** - For Exadata and virtual machine 2-node RAC DB systems, do not use a subnet that overlaps with 192.168.128.0/20. These subnets are used by the Oracle Clusterware private interconnect on the database instance. Specifying an overlapping subnet will cause the private interconnect to malfunction. This restriction applies to both the client subnet and backup subnet.",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time that the cloud Autonomous VM cluster was created.",
+    )
+    time_database_ssl_certificate_expires: Optional[Any] = Field(
+        None,
+        description="The date and time of Database SSL certificate expiration.",
+    )
+    time_ords_certificate_expires: Optional[Any] = Field(
+        None,
+        description="The date and time of ORDS certificate expiration.",
+    )
+    time_updated: Optional[Any] = Field(
+        None,
+        description="The last date and time that the cloud Autonomous VM cluster was updated.",
+    )
+    total_autonomous_data_storage_in_tbs: Optional[float] = Field(
+        None,
+        description="The total data disk group size for Autonomous Databases, in TBs.",
+    )
+    total_container_databases: Optional[Any] = Field(
+        None,
+        description="The total number of Autonomous Container Databases that can be created with the allocated local storage.",
+    )
+    total_cpus: Optional[float] = Field(
+        None,
+        description="The total number of CPUs in an Autonomous VM Cluster.",
+    )
+
+
+def map_cloudautonomousvmcluster(
+    o: oci.database.models.CloudAutonomousVmCluster,
+    fields: Optional[list[str]] = None,
+) -> CloudAutonomousVmCluster | None:
+    """Map oci.database.models.CloudAutonomousVmCluster → CloudAutonomousVmCluster Pydantic model."""
+    return map_model(CloudAutonomousVmCluster, o, fields)
+
+
+class CloudAutonomousVmClusterResourceUsage(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.CloudAutonomousVmClusterResourceUsage."""
+
+    autonomous_data_storage_size_in_tbs: Optional[float] = Field(
+        None,
+        description="The data disk group size allocated for Autonomous Databases, in TBs.",
+    )
+    autonomous_vm_resource_usage: Optional[Any] = Field(
+        None,
+        description="List of Autonomous VM resource usages.",
+    )
+    available_autonomous_data_storage_size_in_tbs: Optional[float] = Field(
+        None,
+        description="The data disk group size available for Autonomous Databases, in TBs.",
+    )
+    available_cpus: Optional[float] = Field(
+        None,
+        description="The number of CPU cores available.",
+    )
+    db_node_storage_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The local node storage allocated in GBs.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this CloudAutonomousVmClusterResourceUsage. The user-friendly name for the Autonomous VM cluster. The name does not need to be unique.",
+    )
+    exadata_storage_in_tbs: Optional[float] = Field(
+        None,
+        description="Total exadata storage allocated for the Autonomous VM Cluster. DATA + RECOVERY + SPARSE + any overhead in TBs.",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Cloud Autonomous VM cluster.",
+    )
+    memory_per_oracle_compute_unit_in_gbs: Optional[Any] = Field(
+        None,
+        description="The amount of memory (in GBs) to be enabled per each CPU core.",
+    )
+    memory_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The memory allocated in GBs.",
+    )
+    non_provisionable_autonomous_container_databases: Optional[Any] = Field(
+        None,
+        description="The number of non-provisionable Autonomous Container Databases in an Autonomous VM Cluster.",
+    )
+    provisionable_autonomous_container_databases: Optional[Any] = Field(
+        None,
+        description="The number of provisionable Autonomous Container Databases in an Autonomous VM Cluster.",
+    )
+    provisioned_autonomous_container_databases: Optional[Any] = Field(
+        None,
+        description="The number of provisioned Autonomous Container Databases in an Autonomous VM Cluster.",
+    )
+    provisioned_cpus: Optional[float] = Field(
+        None,
+        description="The number of CPUs provisioned in an Autonomous VM Cluster.",
+    )
+    reclaimable_cpus: Optional[float] = Field(
+        None,
+        description="CPU cores that continue to be included in the count of OCPUs available to the Autonomous Container Database even after one of its Autonomous Database is terminated or scaled down. You can release them to the available OCPUs at its parent AVMC level by restarting the Autonomous Container Database.",
+    )
+    reserved_cpus: Optional[float] = Field(
+        None,
+        description="The number of CPUs reserved in an Autonomous VM Cluster.",
+    )
+    total_container_databases: Optional[Any] = Field(
+        None,
+        description="The total number of Autonomous Container Databases that can be created.",
+    )
+    total_cpus: Optional[float] = Field(
+        None,
+        description="The number of CPU cores enabled on the Cloud Autonomous VM cluster.",
+    )
+    used_autonomous_data_storage_size_in_tbs: Optional[float] = Field(
+        None,
+        description="The data disk group size used for Autonomous Databases, in TBs.",
+    )
+    used_cpus: Optional[float] = Field(
+        None,
+        description="The number of CPU cores alloted to the Autonomous Container Databases in an Cloud Autonomous VM cluster.",
+    )
+
+
+def map_cloudautonomousvmclusterresourceusage(
+    o: oci.database.models.CloudAutonomousVmClusterResourceUsage,
+    fields: Optional[list[str]] = None,
+) -> CloudAutonomousVmClusterResourceUsage | None:
+    """Map oci.database.models.CloudAutonomousVmClusterResourceUsage → CloudAutonomousVmClusterResourceUsage Pydantic model."""
+    return map_model(CloudAutonomousVmClusterResourceUsage, o, fields)
@@ -0,0 +1,169 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import copy
+import datetime
+import functools
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+import oci
+from pydantic import BaseModel, TypeAdapter, create_model
+
+# values that oci.util.to_dict returns unchanged
+_SCALARS = (str, int, float, bool)
+
+_UNTYPED = (Any, Optional[Any])
+
+# mapper of each (Pydantic model, OCI SDK model class) pair
+_mappers: Dict[Tuple[type, type], Callable[[Any], BaseModel]] = {}
+
+# mappers kept, most of them for projections
+_MAX_MAPPERS = 4096
+
+# (key, attribute) pairs of each OCI SDK model class
+_attributes: Dict[type, Tuple[Tuple[str, str], ...]] = {}
+
+
+class OCIBaseModel(BaseModel):
+    """Base model that supports conversion from OCI SDK models."""
+
+    # validators and schemas are built on first use rather than when the
+    # class is defined, so importing a family of models stays cheap
+    model_config = {"arbitrary_types_allowed": True, "defer_build": True}
+
+    @classmethod
+    def from_oci(cls, sdk_obj):
+        """Convert an OCI SDK model into this Pydantic model."""
+        return cls(**oci.util.to_dict(sdk_obj))
+
+
+def _plain(value):
+    """
+    oci.util.to_dict() for the attribute values of SDK objects. Nested SDK
+    models are read straight from their instance attributes through a cached
+    list, rather than through their properties.
+    """
+    value_type = type(value)
+    if value is None or value_type in _SCALARS:
+        return value
+    if value_type is list:
+        return [_plain(item) for item in value]
+    if value_type is dict:
+        return {key: _plain(item) for key, item in value.items()}
+    if value_type is datetime.datetime:
+        # to_dict() puts naive times in UTC
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=datetime.timezone.utc)
+        return value.isoformat(sep="T")
+    attributes = _attributes.get(value_type)
+    if attributes is None:
+        swagger_types = getattr(value, "swagger_types", None)
+        if not isinstance(swagger_types, dict):
+            return oci.util.to_dict(value)
+        attributes = tuple((key, "_" + key) for key in swagger_types)
+        _attributes[value_type] = attributes
+    state = value.__dict__
+    return {
+        key: _plain(state[attribute])
+        for key, attribute in attributes
+        if attribute in state
+    }
+
+
+def _build_mapper(
+    model: Type[OCIBaseModel], swagger_types: Dict[str, str]
+) -> Callable[[Any], OCIBaseModel]:
+    """
+    Builds the mapper of one SDK model class. The fields of the Pydantic model
+    that the SDK model has are listed once; untyped (`Any`) fields are copied
+    from the SDK object's attributes as oci.util.to_dict() would convert them,
+    and only the few typed fields are validated.
+    """
+    # model_construct() skips validation, so it never builds a deferred
+    # model, and its instances could not be serialized
+    if not model.__pydantic_complete__:
+        model.model_rebuild()
+    untyped = []
+    typed = []
+    for name, field in model.model_fields.items():
+        if name not in swagger_types:
+            continue
+        if field.annotation in _UNTYPED:
+            untyped.append((name, "_" + name))
+        else:
+            typed.append((name, "_" + name, TypeAdapter(field.annotation)))
+
+    def mapper(o) -> OCIBaseModel:
+        state = o.__dict__
+        values = {}
+        for name, attribute in untyped:
+            if attribute in state:
+                values[name] = _plain(state[attribute])
+        for name, attribute, adapter in typed:
+            if attribute in state:
+                value = state[attribute]
+                values[name] = (
+                    None if value is None else adapter.validate_python(_plain(value))
+                )
+        return model.model_construct(**values)
+
+    return mapper
+
+
+@functools.lru_cache(maxsize=256)
+def projection(
+    model: Type[OCIBaseModel], fields: Tuple[str, ...]
+) -> Type[OCIBaseModel]:
+    """
+    Returns a model with only the given fields of `model`, which maps and
+    serializes just those
+    """
+    unknown = [name for name in fields if name not in model.model_fields]
+    if unknown:
+        raise ValueError(
+            f"Unknown fields of {model.__name__}: {', '.join(unknown)}. "
+            f"Its fields are: {', '.join(model.model_fields)}"
+        )
+    return create_model(
+        model.__name__,
+        __base__=OCIBaseModel,
+        __module__=model.__module__,
+        **{
+            name: (
+                model.model_fields[name].annotation,
+                copy.copy(model.model_fields[name]),
+            )
+            for name in fields
+        },
+    )
+
+
+def map_model(
+    model: Type[OCIBaseModel], o, fields: Optional[List[str]] = None
+) -> Optional[OCIBaseModel]:
+    """
+    Maps an OCI SDK object to `model`, or to its projection on `fields`. SDK
+    models are trusted and go through a cached per-class mapper; anything
+    else (e.g. a plain dict) is validated, falling back to reading the
+    model's fields off the object.
+    """
+    if not o:
+        return None
+    if fields:
+        model = projection(model, tuple(dict.fromkeys(fields)))
+    swagger_types = getattr(o, "swagger_types", None)
+    if isinstance(swagger_types, dict):
+        key = (model, type(o))
+        mapper = _mappers.get(key)
+        if mapper is None:
+            if len(_mappers) >= _MAX_MAPPERS:
+                _mappers.clear()
+            mapper = _mappers[key] = _build_mapper(model, swagger_types)
+        return mapper(o)
+    try:
+        return model(**oci.util.to_dict(o))
+    except Exception:
+        return model(**{name: getattr(o, name, None) for name in model.model_fields})
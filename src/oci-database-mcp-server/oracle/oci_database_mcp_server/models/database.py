@@ -0,0 +1,1148 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+
+Pydantic models of the OCI Database service: databases, backups, Data Guard associations, key stores and database software images.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import oci
+from oracle.oci_database_mcp_server.models.base import OCIBaseModel, map_model
+from pydantic import Field
+
+
+class BackupDestinationSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.BackupDestinationSummary."""
+
+    associated_databases: Optional[Any] = Field(
+        None,
+        description="List of databases associated with the backup destination.",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the compartment.",
+    )
+    connection_string: Optional[Any] = Field(
+        None,
+        description="For a RECOVERY_APPLIANCE backup destination, the connection string for connecting to the Recovery Appliance.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="The user-provided name of the backup destination.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the backup destination.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="A descriptive text associated with the lifecycleState. Typically contains additional displayable text",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='The current lifecycle state of the backup destination. Allowed values for this property are: "ACTIVE", "FAILED", "DELETED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    local_mount_point_path: Optional[Any] = Field(
+        None,
+        description="The local directory path on each VM cluster node where the NFS server location is mounted. The local directory path and the NFS server location must each be the same across all of the VM cluster nodes. Ensure that the NFS mount is maintained continuously on all of the VM cluster nodes.",
+    )
+    nfs_mount_type: Optional[Any] = Field(
+        None,
+        description="NFS Mount type for backup destination. Allowed values for this property are: \"SELF_MOUNT\", \"AUTOMATED_MOUNT\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    nfs_server: Optional[Any] = Field(
+        None,
+        description="Host names or IP addresses for NFS Auto mount.",
+    )
+    nfs_server_export: Optional[Any] = Field(
+        None,
+        description="Specifies the directory on which to mount the file system",
+    )
+    time_at_which_storage_details_are_updated: Optional[Any] = Field(
+        None,
+        description="The time when the total storage size and the utilized storage size of the backup destination are updated.",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time the backup destination was created.",
+    )
+    total_storage_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The total storage size of the backup destination in GBs, rounded to the nearest integer.",
+    )
+    type: Optional[Any] = Field(
+        None,
+        description="Type of the backup destination. Allowed values for this property are: \"NFS\", \"RECOVERY_APPLIANCE\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    utilized_storage_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The total amount of space utilized on the backup destination (in GBs), rounded to the nearest integer.",
+    )
+    vpc_users: Optional[Any] = Field(
+        None,
+        description="For a RECOVERY_APPLIANCE backup destination, the Virtual Private Catalog (VPC) users that are used to access the Recovery Appliance.",
+    )
+
+
+def map_backupdestinationsummary(
+    o: oci.database.models.BackupDestinationSummary,
+    fields: Optional[list[str]] = None,
+) -> BackupDestinationSummary | None:
+    """Map oci.database.models.BackupDestinationSummary → BackupDestinationSummary Pydantic model."""
+    return map_model(BackupDestinationSummary, o, fields)
+
+
+class BackupSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.BackupSummary."""
+
+    availability_domain: Optional[Any] = Field(
+        None,
+        description="The name of the availability domain where the database backup is stored.",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the compartment.",
+    )
+    database_edition: Optional[Any] = Field(
+        None,
+        description='The Oracle Database edition of the DB system from which the database backup was taken. Allowed values for this property are: "STANDARD_EDITION", "ENTERPRISE_EDITION", "ENTERPRISE_EDITION_HIGH_PERFORMANCE", "ENTERPRISE_EDITION_EXTREME_PERFORMANCE", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    database_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the database.",
+    )
+    database_size_in_gbs: Optional[float] = Field(
+        None,
+        description="The size of the database in gigabytes at the time the backup was taken.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="The user-friendly name for the backup. The name does not have to be unique.",
+    )
+    encryption_key_location_details: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the backup.",
+    )
+    key_store_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the key store of Oracle Vault.",
+    )
+    key_store_wallet_name: Optional[Any] = Field(
+        None,
+        description="The wallet name for Oracle Key Vault.",
+    )
+    kms_key_id: Optional[Any] = Field(
+        None,
+        description="The OCID of the key container that is used as the master encryption key in database transparent data encryption (TDE) operations.",
+    )
+    kms_key_version_id: Optional[Any] = Field(
+        None,
+        description="The OCID of the key container version that is used in database transparent data encryption (TDE) operations KMS Key can have multiple key versions. If none is specified, the current key version (latest) of the Key Id is used for the operation. Autonomous Database Serverless does not use key versions, hence is not applicable for Autonomous Database Serverless instances.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='The current state of the backup. Allowed values for this property are: "CREATING", "ACTIVE", "DELETING", "DELETED", "FAILED", "RESTORING", "CANCELING", "CANCELED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    shape: Optional[Any] = Field(
+        None,
+        description="Shape of the backup's source database.",
+    )
+    time_ended: Optional[Any] = Field(
+        None,
+        description="The date and time the backup was completed.",
+    )
+    time_started: Optional[Any] = Field(
+        None,
+        description="The date and time the backup started.",
+    )
+    type: Optional[Any] = Field(
+        None,
+        description='The type of backup. Allowed values for this property are: "INCREMENTAL", "FULL", "VIRTUAL_FULL", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    vault_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Oracle Cloud Infrastructure `vault`__. This parameter and `secretId` are required for Customer Managed Keys.",
+    )
+    version: Optional[Any] = Field(
+        None,
+        description="Version of the backup's source database",
+    )
+
+
+def map_backupsummary(
+    o: oci.database.models.BackupSummary, fields: Optional[list[str]] = None
+) -> BackupSummary | None:
+    """Map oci.database.models.BackupSummary → BackupSummary Pydantic model."""
+    return map_model(BackupSummary, o, fields)
+
+
+class DataGuardAssociationSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.DataGuardAssociationSummary."""
+
+    apply_lag: Optional[Any] = Field(
+        None,
+        description="The lag time between updates to the primary database and application of the redo data on the standby database, as computed by the reporting database. Example: `9 seconds`",
+    )
+    apply_rate: Optional[Any] = Field(
+        None,
+        description="The rate at which redo logs are synced between the associated databases. Example: `180 Mb per second`",
+    )
+    database_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the database_id of this DataGuardAssociationSummary. The `OCID`__ of the reporting database.",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this DataGuardAssociationSummary. The `OCID`__ of the Data Guard association.",
+    )
+    is_active_data_guard_enabled: Optional[Any] = Field(
+        None,
+        description="True if active Data Guard is enabled.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycleState, if available.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this DataGuardAssociationSummary. The current state of the Data Guard association. Allowed values for this property are: "PROVISIONING", "AVAILABLE", "UPDATING", "TERMINATING", "TERMINATED", "FAILED", "UPGRADING", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    peer_data_guard_association_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the peer database's Data Guard association.",
+    )
+    peer_database_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the associated peer database.",
+    )
+    peer_db_home_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Database Home containing the associated peer database.",
+    )
+    peer_db_system_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the peer_db_system_id of this DataGuardAssociationSummary. The `OCID`__ of the DB system containing the associated peer database.",
+    )
+    peer_role: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the peer_role of this DataGuardAssociationSummary. The role of the peer database in this Data Guard association. Allowed values for this property are: "PRIMARY", "STANDBY", "DISABLED_STANDBY", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    protection_mode: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the protection_mode of this DataGuardAssociationSummary. The protection mode of this Data Guard association. For more information, see `Oracle Data Guard Protection Modes`__ in the Oracle Data Guard documentation. Allowed values for this property are: "MAXIMUM_AVAILABILITY", "MAXIMUM_PERFORMANCE", "MAXIMUM_PROTECTION", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    role: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the role of this DataGuardAssociationSummary. The role of the reporting database in this Data Guard association. Allowed values for this property are: "PRIMARY", "STANDBY", "DISABLED_STANDBY", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time the Data Guard association was created.",
+    )
+    transport_type: Optional[Any] = Field(
+        None,
+        description='The redo transport type used by this Data Guard association. For more information, see `Redo Transport Services`__ in the Oracle Data Guard documentation. Allowed values for this property are: "SYNC", "ASYNC", "FASTSYNC", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+
+
+def map_dataguardassociationsummary(
+    o: oci.database.models.DataGuardAssociationSummary,
+    fields: Optional[list[str]] = None,
+) -> DataGuardAssociationSummary | None:
+    """Map oci.database.models.DataGuardAssociationSummary → DataGuardAssociationSummary Pydantic model."""
+    return map_model(DataGuardAssociationSummary, o, fields)
+
+
+class DatabaseSoftwareImageSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.DatabaseSoftwareImageSummary."""
+
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this DatabaseSoftwareImageSummary. The `OCID`__ of the compartment.",
+    )
+    database_software_image_included_patches: Optional[Any] = Field(
+        None,
+        description="List of one-off patches for Database Homes.",
+    )
+    database_software_image_one_off_patches: Optional[Any] = Field(
+        None,
+        description="List of one-off patches for Database Homes.",
+    )
+    database_version: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the database_version of this DatabaseSoftwareImageSummary. The database version with which the database software image is to be built.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this DatabaseSoftwareImageSummary. The user-friendly name for the database software image. The name does not have to be unique.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this DatabaseSoftwareImageSummary. The `OCID`__ of the database software image.",
+    )
+    image_shape_family: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the image_shape_family of this DatabaseSoftwareImageSummary. To what shape the image is meant for. Allowed values for this property are: "VM_BM_SHAPE", "EXADATA_SHAPE", "EXACC_SHAPE", "EXADBXS_SHAPE", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    image_type: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the image_type of this DatabaseSoftwareImageSummary. The type of software image. Can be grid or database. Allowed values for this property are: \"GRID_IMAGE\", \"DATABASE_IMAGE\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    included_patches_summary: Optional[Any] = Field(
+        None,
+        description="The patches included in the image and the version of the image.",
+    )
+    is_upgrade_supported: Optional[Any] = Field(
+        None,
+        description="True if this Database software image is supported for Upgrade.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Detailed message for the lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this DatabaseSoftwareImageSummary. The current state of the database software image. Allowed values for this property are: "PROVISIONING", "AVAILABLE", "DELETING", "DELETED", "FAILED", "TERMINATING", "TERMINATED", "UPDATING", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    ls_inventory: Optional[Any] = Field(
+        None,
+        description="The output from the OPatch lsInventory command, which is passed as a string.",
+    )
+    patch_set: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the patch_set of this DatabaseSoftwareImageSummary. The PSU or PBP or Release Updates. To get a list of supported versions, use the :func:`list_db_versions` operation.",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the time_created of this DatabaseSoftwareImageSummary. The date and time the database software image was created.",
+    )
+
+
+def map_databasesoftwareimagesummary(
+    o: oci.database.models.DatabaseSoftwareImageSummary,
+    fields: Optional[list[str]] = None,
+) -> DatabaseSoftwareImageSummary | None:
+    """Map oci.database.models.DatabaseSoftwareImageSummary → DatabaseSoftwareImageSummary Pydantic model."""
+    return map_model(DatabaseSoftwareImageSummary, o, fields)
+
+
+class DatabaseSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.DatabaseSummary."""
+
+    character_set: Optional[Any] = Field(
+        None,
+        description="The character set for the database.",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this DatabaseSummary. The `OCID`__ of the compartment.",
+    )
+    connection_strings: Optional[Any] = Field(
+        None,
+        description="The Connection strings used to connect to the Oracle Database.",
+    )
+    data_guard_group: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    database_management_config: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    database_software_image_id: Optional[Any] = Field(
+        None,
+        description="The database software image `OCID`__",
+    )
+    db_backup_config: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    db_home_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Database Home.",
+    )
+    db_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the db_name of this DatabaseSummary. The database name.",
+    )
+    db_system_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the DB system.",
+    )
+    db_unique_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the db_unique_name of this DatabaseSummary. A system-generated name for the database to ensure uniqueness within an Oracle Data Guard group (a primary database and its standby databases). The unique name cannot be changed.",
+    )
+    db_workload: Optional[Any] = Field(
+        None,
+        description="**Deprecated.** The dbWorkload field has been deprecated for Exadata Database Service on Dedicated Infrastructure, Exadata Database Service on Cloud@Customer, and Base Database Service. Support for this attribute will end in November 2023. You may choose to update your custom scripts to exclude the dbWorkload attribute. After November 2023 if you pass a value to the dbWorkload attribute, it will be ignored. The database workload type.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    encryption_key_location_details: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this DatabaseSummary. The `OCID`__ of the database.",
+    )
+    is_cdb: Optional[Any] = Field(
+        None,
+        description="True if the database is a container database.",
+    )
+    key_store_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the key store of Oracle Vault.",
+    )
+    key_store_wallet_name: Optional[Any] = Field(
+        None,
+        description="The wallet name for Oracle Key Vault.",
+    )
+    kms_key_id: Optional[Any] = Field(
+        None,
+        description="The OCID of the key container that is used as the master encryption key in database transparent data encryption (TDE) operations.",
+    )
+    kms_key_version_id: Optional[Any] = Field(
+        None,
+        description="The OCID of the key container version that is used in database transparent data encryption (TDE) operations KMS Key can have multiple key versions. If none is specified, the current key version (latest) of the Key Id is used for the operation. Autonomous Database Serverless does not use key versions, hence is not applicable for Autonomous Database Serverless instances.",
+    )
+    last_backup_duration_in_seconds: Optional[Any] = Field(
+        None,
+        description="The duration when the latest database backup created.",
+    )
+    last_backup_timestamp: Optional[Any] = Field(
+        None,
+        description="The date and time when the latest database backup was created.",
+    )
+    last_failed_backup_timestamp: Optional[Any] = Field(
+        None,
+        description="The date and time when the latest database backup failed.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this DatabaseSummary. The current state of the database. Allowed values for this property are: "PROVISIONING", "AVAILABLE", "UPDATING", "BACKUP_IN_PROGRESS", "UPGRADING", "CONVERTING", "TERMINATING", "TERMINATED", "RESTORE_FAILED", "FAILED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    ncharacter_set: Optional[Any] = Field(
+        None,
+        description="The national character set for the database.",
+    )
+    pdb_name: Optional[Any] = Field(
+        None,
+        description="The name of the pluggable database. The name must begin with an alphabetic character and can contain a maximum of thirty alphanumeric characters. Special characters are not permitted. Pluggable database should not be same as database name.",
+    )
+    sid_prefix: Optional[Any] = Field(
+        None,
+        description="Specifies a prefix for the `Oracle SID` of the database to be created.",
+    )
+    source_database_point_in_time_recovery_timestamp: Optional[Any] = Field(
+        None,
+        description="Point in time recovery timeStamp of the source database at which cloned database system is cloned from the source database system, as described in `RFC 3339`__",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time the database was created.",
+    )
+    vault_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Oracle Cloud Infrastructure `vault`__. This parameter and `secretId` are required for Customer Managed Keys.",
+    )
+    vm_cluster_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the VM cluster.",
+    )
+
+
+def map_databasesummary(
+    o: oci.database.models.DatabaseSummary,
+    fields: Optional[list[str]] = None,
+) -> DatabaseSummary | None:
+    """Map oci.database.models.DatabaseSummary → DatabaseSummary Pydantic model."""
+    return map_model(DatabaseSummary, o, fields)
+
+
+class KeyStoreSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.KeyStoreSummary."""
+
+    associated_databases: Optional[Any] = Field(
+        None,
+        description="List of databases associated with the key store.",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this KeyStoreSummary. The `OCID`__ of the compartment.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this KeyStoreSummary. The user-friendly name for the key store. The name does not need to be unique.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this KeyStoreSummary. The `OCID`__ of the key store.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this KeyStoreSummary. The current state of the key store. Allowed values for this property are: "ACTIVE", "DELETED", "NEEDS_ATTENTION", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time that the key store was created.",
+    )
+    type_details: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the type_details of this KeyStoreSummary.",
+    )
+
+
+def map_keystoresummary(
+    o: oci.database.models.KeyStoreSummary,
+    fields: Optional[list[str]] = None,
+) -> KeyStoreSummary | None:
+    """Map oci.database.models.KeyStoreSummary → KeyStoreSummary Pydantic model."""
+    return map_model(KeyStoreSummary, o, fields)
+
+
+class Backup(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.Backup."""
+
+    availability_domain: Optional[Any] = Field(
+        None,
+        description="The name of the availability domain where the database backup is stored.",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the compartment.",
+    )
+    database_edition: Optional[Any] = Field(
+        None,
+        description='The Oracle Database edition of the DB system from which the database backup was taken. Allowed values for this property are: "STANDARD_EDITION", "ENTERPRISE_EDITION", "ENTERPRISE_EDITION_HIGH_PERFORMANCE", "ENTERPRISE_EDITION_EXTREME_PERFORMANCE", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    database_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the database.",
+    )
+    database_size_in_gbs: Optional[float] = Field(
+        None,
+        description="The size of the database in gigabytes at the time the backup was taken.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="The user-friendly name for the backup. The name does not have to be unique.",
+    )
+    encryption_key_location_details: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the backup.",
+    )
+    key_store_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the key store of Oracle Vault.",
+    )
+    key_store_wallet_name: Optional[Any] = Field(
+        None,
+        description="The wallet name for Oracle Key Vault.",
+    )
+    kms_key_id: Optional[Any] = Field(
+        None,
+        description="The OCID of the key container that is used as the master encryption key in database transparent data encryption (TDE) operations.",
+    )
+    kms_key_version_id: Optional[Any] = Field(
+        None,
+        description="The OCID of the key container version that is used in database transparent data encryption (TDE) operations KMS Key can have multiple key versions. If none is specified, the current key version (latest) of the Key Id is used for the operation. Autonomous Database Serverless does not use key versions, hence is not applicable for Autonomous Database Serverless instances.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='The current state of the backup. Allowed values for this property are: "CREATING", "ACTIVE", "DELETING", "DELETED", "FAILED", "RESTORING", "CANCELING", "CANCELED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    shape: Optional[Any] = Field(
+        None,
+        description="Shape of the backup's source database.",
+    )
+    time_ended: Optional[Any] = Field(
+        None,
+        description="The date and time the backup was completed.",
+    )
+    time_started: Optional[Any] = Field(
+        None,
+        description="The date and time the backup started.",
+    )
+    type: Optional[Any] = Field(
+        None,
+        description='The type of backup. Allowed values for this property are: "INCREMENTAL", "FULL", "VIRTUAL_FULL", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    vault_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Oracle Cloud Infrastructure `vault`__. This parameter and `secretId` are required for Customer Managed Keys.",
+    )
+    version: Optional[Any] = Field(
+        None,
+        description="Version of the backup's source database",
+    )
+
+
+def map_backup(
+    o: oci.database.models.Backup, fields: Optional[list[str]] = None
+) -> Backup | None:
+    """Map oci.database.models.Backup → Backup Pydantic model."""
+    return map_model(Backup, o, fields)
+
+
+class BackupDestination(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.BackupDestination."""
+
+    associated_databases: Optional[Any] = Field(
+        None,
+        description="List of databases associated with the backup destination.",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the compartment.",
+    )
+    connection_string: Optional[Any] = Field(
+        None,
+        description="For a RECOVERY_APPLIANCE backup destination, the connection string for connecting to the Recovery Appliance.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="The user-provided name of the backup destination.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the backup destination.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="A descriptive text associated with the lifecycleState. Typically contains additional displayable text",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='The current lifecycle state of the backup destination. Allowed values for this property are: "ACTIVE", "FAILED", "DELETED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    local_mount_point_path: Optional[Any] = Field(
+        None,
+        description="The local directory path on each VM cluster node where the NFS server location is mounted. The local directory path and the NFS server location must each be the same across all of the VM cluster nodes. Ensure that the NFS mount is maintained continuously on all of the VM cluster nodes.",
+    )
+    nfs_mount_type: Optional[Any] = Field(
+        None,
+        description="NFS Mount type for backup destination. Allowed values for this property are: \"SELF_MOUNT\", \"AUTOMATED_MOUNT\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    nfs_server: Optional[Any] = Field(
+        None,
+        description="Host names or IP addresses for NFS Auto mount.",
+    )
+    nfs_server_export: Optional[Any] = Field(
+        None,
+        description="Specifies the directory on which to mount the file system",
+    )
+    time_at_which_storage_details_are_updated: Optional[Any] = Field(
+        None,
+        description="The time when the total storage size and the utilized storage size of the backup destination are updated.",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time the backup destination was created.",
+    )
+    total_storage_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The total storage size of the backup destination in GBs, rounded to the nearest integer.",
+    )
+    type: Optional[Any] = Field(
+        None,
+        description="Type of the backup destination. Allowed values for this property are: \"NFS\", \"RECOVERY_APPLIANCE\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    utilized_storage_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The total amount of space utilized on the backup destination (in GBs), rounded to the nearest integer.",
+    )
+    vpc_users: Optional[Any] = Field(
+        None,
+        description="For a RECOVERY_APPLIANCE backup destination, the Virtual Private Catalog (VPC) users that are used to access the Recovery Appliance.",
+    )
+
+
+def map_backupdestination(
+    o: oci.database.models.BackupDestination,
+    fields: Optional[list[str]] = None,
+) -> BackupDestination | None:
+    """Map oci.database.models.BackupDestination → BackupDestination Pydantic model."""
+    return map_model(BackupDestination, o, fields)
+
+
+class DataGuardAssociation(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.DataGuardAssociation."""
+
+    apply_lag: Optional[Any] = Field(
+        None,
+        description="The lag time between updates to the primary database and application of the redo data on the standby database, as computed by the reporting database. Example: `9 seconds`",
+    )
+    apply_rate: Optional[Any] = Field(
+        None,
+        description="The rate at which redo logs are synced between the associated databases. Example: `180 Mb per second`",
+    )
+    database_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the database_id of this DataGuardAssociation. The `OCID`__ of the reporting database.",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this DataGuardAssociation. The `OCID`__ of the Data Guard association.",
+    )
+    is_active_data_guard_enabled: Optional[Any] = Field(
+        None,
+        description="True if active Data Guard is enabled.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycleState, if available.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this DataGuardAssociation. The current state of the Data Guard association. Allowed values for this property are: "PROVISIONING", "AVAILABLE", "UPDATING", "TERMINATING", "TERMINATED", "FAILED", "UPGRADING", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    peer_data_guard_association_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the peer database's Data Guard association.",
+    )
+    peer_database_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the associated peer database.",
+    )
+    peer_db_home_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Database Home containing the associated peer database.",
+    )
+    peer_db_system_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the peer_db_system_id of this DataGuardAssociation. The `OCID`__ of the DB system containing the associated peer database.",
+    )
+    peer_role: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the peer_role of this DataGuardAssociation. The role of the peer database in this Data Guard association. Allowed values for this property are: "PRIMARY", "STANDBY", "DISABLED_STANDBY", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    protection_mode: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the protection_mode of this DataGuardAssociation. The protection mode of this Data Guard association. For more information, see `Oracle Data Guard Protection Modes`__ in the Oracle Data Guard documentation. Allowed values for this property are: "MAXIMUM_AVAILABILITY", "MAXIMUM_PERFORMANCE", "MAXIMUM_PROTECTION", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    role: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the role of this DataGuardAssociation. The role of the reporting database in this Data Guard association. Allowed values for this property are: "PRIMARY", "STANDBY", "DISABLED_STANDBY", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time the Data Guard association was created.",
+    )
+    transport_type: Optional[Any] = Field(
+        None,
+        description='The redo transport type used by this Data Guard association. For more information, see `Redo Transport Services`__ in the Oracle Data Guard documentation. Allowed values for this property are: "SYNC", "ASYNC", "FASTSYNC", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+
+
+def map_dataguardassociation(
+    o: oci.database.models.DataGuardAssociation,
+    fields: Optional[list[str]] = None,
+) -> DataGuardAssociation | None:
+    """Map oci.database.models.DataGuardAssociation → DataGuardAssociation Pydantic model."""
+    return map_model(DataGuardAssociation, o, fields)
+
+
+class Database(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.Database."""
+
+    character_set: Optional[Any] = Field(
+        None,
+        description="The character set for the database.",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this Database. The `OCID`__ of the compartment.",
+    )
+    connection_strings: Optional[Any] = Field(
+        None,
+        description="The Connection strings used to connect to the Oracle Database.",
+    )
+    data_guard_group: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    database_management_config: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    database_software_image_id: Optional[Any] = Field(
+        None,
+        description="The database software image `OCID`__",
+    )
+    db_backup_config: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    db_home_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Database Home.",
+    )
+    db_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the db_name of this Database. The database name.",
+    )
+    db_system_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the DB system.",
+    )
+    db_unique_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the db_unique_name of this Database. A system-generated name for the database to ensure uniqueness within an Oracle Data Guard group (a primary database and its standby databases). The unique name cannot be changed.",
+    )
+    db_workload: Optional[Any] = Field(
+        None,
+        description="**Deprecated.** The dbWorkload field has been deprecated for Exadata Database Service on Dedicated Infrastructure, Exadata Database Service on Cloud@Customer, and Base Database Service. Support for this attribute will end in November 2023. You may choose to update your custom scripts to exclude the dbWorkload attribute. After November 2023 if you pass a value to the dbWorkload attribute, it will be ignored. The database workload type.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    encryption_key_location_details: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this Database. The `OCID`__ of the database.",
+    )
+    is_cdb: Optional[Any] = Field(
+        None,
+        description="True if the database is a container database.",
+    )
+    key_store_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the key store of Oracle Vault.",
+    )
+    key_store_wallet_name: Optional[Any] = Field(
+        None,
+        description="The wallet name for Oracle Key Vault.",
+    )
+    kms_key_id: Optional[Any] = Field(
+        None,
+        description="The OCID of the key container that is used as the master encryption key in database transparent data encryption (TDE) operations.",
+    )
+    kms_key_version_id: Optional[Any] = Field(
+        None,
+        description="The OCID of the key container version that is used in database transparent data encryption (TDE) operations KMS Key can have multiple key versions. If none is specified, the current key version (latest) of the Key Id is used for the operation. Autonomous Database Serverless does not use key versions, hence is not applicable for Autonomous Database Serverless instances.",
+    )
+    last_backup_duration_in_seconds: Optional[Any] = Field(
+        None,
+        description="The duration when the latest database backup created.",
+    )
+    last_backup_timestamp: Optional[Any] = Field(
+        None,
+        description="The date and time when the latest database backup was created.",
+    )
+    last_failed_backup_timestamp: Optional[Any] = Field(
+        None,
+        description="The date and time when the latest database backup failed.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this Database. The current state of the database. Allowed values for this property are: "PROVISIONING", "AVAILABLE", "UPDATING", "BACKUP_IN_PROGRESS", "UPGRADING", "CONVERTING", "TERMINATING", "TERMINATED", "RESTORE_FAILED", "FAILED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    ncharacter_set: Optional[Any] = Field(
+        None,
+        description="The national character set for the database.",
+    )
+    pdb_name: Optional[Any] = Field(
+        None,
+        description="The name of the pluggable database. The name must begin with an alphabetic character and can contain a maximum of thirty alphanumeric characters. Special characters are not permitted. Pluggable database should not be same as database name.",
+    )
+    sid_prefix: Optional[Any] = Field(
+        None,
+        description="Specifies a prefix for the `Oracle SID` of the database to be created.",
+    )
+    source_database_point_in_time_recovery_timestamp: Optional[Any] = Field(
+        None,
+        description="Point in time recovery timeStamp of the source database at which cloned database system is cloned from the source database system, as described in `RFC 3339`__",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time the database was created.",
+    )
+    vault_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Oracle Cloud Infrastructure `vault`__. This parameter and `secretId` are required for Customer Managed Keys.",
+    )
+    vm_cluster_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the VM cluster.",
+    )
+
+
+def map_database(
+    o: oci.database.models.Database, fields: Optional[list[str]] = None
+) -> Database | None:
+    """Map oci.database.models.Database → Database Pydantic model."""
+    return map_model(Database, o, fields)
+
+
+class DatabaseSoftwareImage(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.DatabaseSoftwareImage."""
+
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this DatabaseSoftwareImage. The `OCID`__ of the compartment.",
+    )
+    database_software_image_included_patches: Optional[Any] = Field(
+        None,
+        description="List of one-off patches for Database Homes.",
+    )
+    database_software_image_one_off_patches: Optional[Any] = Field(
+        None,
+        description="List of one-off patches for Database Homes.",
+    )
+    database_version: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the database_version of this DatabaseSoftwareImage. The database version with which the database software image is to be built.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this DatabaseSoftwareImage. The user-friendly name for the database software image. The name does not have to be unique.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this DatabaseSoftwareImage. The `OCID`__ of the database software image.",
+    )
+    image_shape_family: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the image_shape_family of this DatabaseSoftwareImage. To what shape the image is meant for. Allowed values for this property are: "VM_BM_SHAPE", "EXADATA_SHAPE", "EXACC_SHAPE", "EXADBXS_SHAPE", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    image_type: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the image_type of this DatabaseSoftwareImage. The type of software image. Can be grid or database. Allowed values for this property are: \"GRID_IMAGE\", \"DATABASE_IMAGE\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    included_patches_summary: Optional[Any] = Field(
+        None,
+        description="The patches included in the image and the version of the image.",
+    )
+    is_upgrade_supported: Optional[Any] = Field(
+        None,
+        description="True if this Database software image is supported for Upgrade.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Detailed message for the lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this DatabaseSoftwareImage. The current state of the database software image. Allowed values for this property are: "PROVISIONING", "AVAILABLE", "DELETING", "DELETED", "FAILED", "TERMINATING", "TERMINATED", "UPDATING", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    ls_inventory: Optional[Any] = Field(
+        None,
+        description="The output from the OPatch lsInventory command, which is passed as a string.",
+    )
+    patch_set: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the patch_set of this DatabaseSoftwareImage. The PSU or PBP or Release Updates. To get a list of supported versions, use the :func:`list_db_versions` operation.",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the time_created of this DatabaseSoftwareImage. The date and time the database software image was created.",
+    )
+
+
+def map_databasesoftwareimage(
+    o: oci.database.models.DatabaseSoftwareImage,
+    fields: Optional[list[str]] = None,
+) -> DatabaseSoftwareImage | None:
+    """Map oci.database.models.DatabaseSoftwareImage → DatabaseSoftwareImage Pydantic model."""
+    return map_model(DatabaseSoftwareImage, o, fields)
+
+
+class DatabaseUpgradeHistoryEntry(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.DatabaseUpgradeHistoryEntry."""
+
+    action: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the action of this DatabaseUpgradeHistoryEntry. The database upgrade action. Allowed values for this property are: "PRECHECK", "UPGRADE", "ROLLBACK", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this DatabaseUpgradeHistoryEntry. The `OCID`__ of the database upgrade history.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this DatabaseUpgradeHistoryEntry. Status of database upgrade history SUCCEEDED|IN_PROGRESS|FAILED. Allowed values for this property are: "SUCCEEDED", "FAILED", "IN_PROGRESS", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    options: Optional[Any] = Field(
+        None,
+        description='Additional upgrade options supported by DBUA(Database Upgrade Assistant). Example: "-upgradeTimezone false -keepEvents"',
+    )
+    source: Optional[Any] = Field(
+        None,
+        description='The source of the Oracle Database software to be used for the upgrade. - Use `DB_HOME` to specify an existing Database Home to upgrade the database. The database is moved to the target Database Home and makes use of the Oracle Database software version of the target Database Home. - Use `DB_VERSION` to specify a generally-available Oracle Database software version to upgrade the database. - Use `DB_SOFTWARE_IMAGE` to specify a `database software image`__ to upgrade the database. Allowed values for this property are: "DB_HOME", "DB_VERSION", "DB_SOFTWARE_IMAGE", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    source_db_home_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Database Home.",
+    )
+    target_database_software_image_id: Optional[Any] = Field(
+        None,
+        description="the database software image used for upgrading database.",
+    )
+    target_db_home_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Database Home.",
+    )
+    target_db_version: Optional[Any] = Field(
+        None,
+        description="A valid Oracle Database version. For a list of supported versions, use the ListDbVersions operation. This cannot be updated in parallel with any of the following: licenseModel, dbEdition, cpuCoreCount, computeCount, computeModel, adminPassword, whitelistedIps, isMTLSConnectionRequired, openMode, permissionLevel, dbWorkload, privateEndpointLabel, nsgIds, isRefreshable, dbName, scheduledOperations, dbToolsDetails, isLocalDataGuardEnabled, or isFreeTier.",
+    )
+    time_ended: Optional[Any] = Field(
+        None,
+        description="The date and time when the database upgrade ended.",
+    )
+    time_started: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the time_started of this DatabaseUpgradeHistoryEntry. The date and time when the database upgrade started.",
+    )
+
+
+def map_databaseupgradehistoryentry(
+    o: oci.database.models.DatabaseUpgradeHistoryEntry,
+    fields: Optional[list[str]] = None,
+) -> DatabaseUpgradeHistoryEntry | None:
+    """Map oci.database.models.DatabaseUpgradeHistoryEntry → DatabaseUpgradeHistoryEntry Pydantic model."""
+    return map_model(DatabaseUpgradeHistoryEntry, o, fields)
+
+
+class KeyStore(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.KeyStore."""
+
+    associated_databases: Optional[Any] = Field(
+        None,
+        description="List of databases associated with the key store.",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this KeyStore. The `OCID`__ of the compartment.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this KeyStore. The user-friendly name for the key store. The name does not need to be unique.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this KeyStore. The `OCID`__ of the key store.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this KeyStore. The current state of the key store. Allowed values for this property are: "ACTIVE", "DELETED", "NEEDS_ATTENTION", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time that the key store was created.",
+    )
+    type_details: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the type_details of this KeyStore.",
+    )
+
+
+def map_keystore(
+    o: oci.database.models.KeyStore, fields: Optional[list[str]] = None
+) -> KeyStore | None:
+    """Map oci.database.models.KeyStore → KeyStore Pydantic model."""
+    return map_model(KeyStore, o, fields)
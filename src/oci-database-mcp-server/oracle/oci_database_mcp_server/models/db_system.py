@@ -0,0 +1,1302 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+
+Pydantic models of the OCI Database service: DB systems, DB nodes, DB homes, consoles and database versions.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import oci
+from oracle.oci_database_mcp_server.models.base import OCIBaseModel, map_model
+from pydantic import Field
+
+
+class ConsoleConnectionSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.ConsoleConnectionSummary."""
+
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this ConsoleConnectionSummary. The OCID of the compartment to contain the console connection.",
+    )
+    connection_string: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the connection_string of this ConsoleConnectionSummary. The SSH connection string for the console connection.",
+    )
+    db_node_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the db_node_id of this ConsoleConnectionSummary. The OCID of the database node.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    fingerprint: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the fingerprint of this ConsoleConnectionSummary. The SSH public key fingerprint for the console connection.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this ConsoleConnectionSummary. The OCID of the console connection.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this ConsoleConnectionSummary. The current state of the console connection. Allowed values for this property are: "ACTIVE", "CREATING", "DELETED", "DELETING", "FAILED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    service_host_key_fingerprint: Optional[Any] = Field(
+        None,
+        description="The SSH public key's fingerprint for the console connection service host.",
+    )
+
+
+def map_consoleconnectionsummary(
+    o: oci.database.models.ConsoleConnectionSummary,
+    fields: Optional[list[str]] = None,
+) -> ConsoleConnectionSummary | None:
+    """Map oci.database.models.ConsoleConnectionSummary → ConsoleConnectionSummary Pydantic model."""
+    return map_model(ConsoleConnectionSummary, o, fields)
+
+
+class ConsoleHistoryCollection(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.ConsoleHistoryCollection."""
+
+    items: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the items of this ConsoleHistoryCollection. List of Db Node console histories.",
+    )
+
+
+def map_consolehistorycollection(
+    o: oci.database.models.ConsoleHistoryCollection,
+    fields: Optional[list[str]] = None,
+) -> ConsoleHistoryCollection | None:
+    """Map oci.database.models.ConsoleHistoryCollection → ConsoleHistoryCollection Pydantic model."""
+    return map_model(ConsoleHistoryCollection, o, fields)
+
+
+class DbHomeSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.DbHomeSummary."""
+
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this DbHomeSummary. The `OCID`__ of the compartment.",
+    )
+    database_software_image_id: Optional[Any] = Field(
+        None,
+        description="The database software image `OCID`__",
+    )
+    db_home_location: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the db_home_location of this DbHomeSummary. The location of the Oracle Database Home.",
+    )
+    db_system_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the DB system.",
+    )
+    db_version: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the db_version of this DbHomeSummary. The Oracle Database version.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this DbHomeSummary. The user-provided name for the Database Home. The name does not need to be unique.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this DbHomeSummary. The `OCID`__ of the Database Home.",
+    )
+    is_unified_auditing_enabled: Optional[Any] = Field(
+        None,
+        description="Indicates whether unified autiding is enabled or not.",
+    )
+    kms_key_id: Optional[Any] = Field(
+        None,
+        description="The OCID of the key container that is used as the master encryption key in database transparent data encryption (TDE) operations.",
+    )
+    last_patch_history_entry_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the last patch history. This value is updated as soon as a patch operation is started.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this DbHomeSummary. The current state of the Database Home. Allowed values for this property are: "PROVISIONING", "AVAILABLE", "UPDATING", "TERMINATING", "TERMINATED", "FAILED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    one_off_patches: Optional[Any] = Field(
+        None,
+        description="List of one-off patches for Database Homes.",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time the Database Home was created.",
+    )
+    vm_cluster_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the VM cluster.",
+    )
+
+
+def map_dbhomesummary(
+    o: oci.database.models.DbHomeSummary, fields: Optional[list[str]] = None
+) -> DbHomeSummary | None:
+    """Map oci.database.models.DbHomeSummary → DbHomeSummary Pydantic model."""
+    return map_model(DbHomeSummary, o, fields)
+
+
+class DbNodeSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.DbNodeSummary."""
+
+    additional_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the planned maintenance.",
+    )
+    backup_ip_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the backup IP address associated with the database node. Use this OCID with either the :func:`get_private_ip` or the :func:`get_public_ip_by_private_ip_id` API to get the IP address needed to make a database connection. **Note:** Applies only to Exadata Cloud Service.",
+    )
+    backup_vnic2_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the second backup VNIC. **Note:** Applies only to Exadata Cloud Service.",
+    )
+    backup_vnic_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the backup VNIC.",
+    )
+    cpu_core_count: Optional[Any] = Field(
+        None,
+        description="The number of CPU cores enabled on the Db node.",
+    )
+    db_node_storage_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The allocated local node storage in GBs on the Db node.",
+    )
+    db_server_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Exacc Db server associated with the database node.",
+    )
+    db_system_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the db_system_id of this DbNodeSummary. The `OCID`__ of the DB system.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    fault_domain: Optional[Any] = Field(
+        None,
+        description="The name of the Fault Domain the instance is contained in.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    host_ip_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the host IP address associated with the database node. Use this OCID with either the :func:`get_private_ip` or the :func:`get_public_ip_by_private_ip_id` API to get the IP address needed to make a database connection. **Note:** Applies only to Exadata Cloud Service.",
+    )
+    hostname: Optional[Any] = Field(
+        None,
+        description="The host name for the database node.",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this DbNodeSummary. The `OCID`__ of the database node.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this DbNodeSummary. The current state of the database node. Allowed values for this property are: "PROVISIONING", "AVAILABLE", "UPDATING", "STOPPING", "STOPPED", "STARTING", "TERMINATING", "TERMINATED", "FAILED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    maintenance_type: Optional[Any] = Field(
+        None,
+        description="The type of database node maintenance. Allowed values for this property are: \"VMDB_REBOOT_MIGRATION\", \"EXADBXS_REBOOT_MIGRATION\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    memory_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The allocated memory in GBs on the Db node.",
+    )
+    software_storage_size_in_gb: Optional[Any] = Field(
+        None,
+        description="The size (in GB) of the block storage volume allocation for the DB system. This attribute applies only for virtual machine DB systems.",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the time_created of this DbNodeSummary. The date and time that the database node was created.",
+    )
+    time_maintenance_window_end: Optional[Any] = Field(
+        None,
+        description="End date and time of maintenance window.",
+    )
+    time_maintenance_window_start: Optional[Any] = Field(
+        None,
+        description="Start date and time of maintenance window.",
+    )
+    total_cpu_core_count: Optional[Any] = Field(
+        None,
+        description="The total number of CPU cores reserved on the Db node.",
+    )
+    vnic2_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the second VNIC. **Note:** Applies only to Exadata Cloud Service.",
+    )
+    vnic_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the vnic_id of this DbNodeSummary. The `OCID`__ of the VNIC.",
+    )
+
+
+def map_dbnodesummary(
+    o: oci.database.models.DbNodeSummary, fields: Optional[list[str]] = None
+) -> DbNodeSummary | None:
+    """Map oci.database.models.DbNodeSummary → DbNodeSummary Pydantic model."""
+    return map_model(DbNodeSummary, o, fields)
+
+
+class DbSystemComputePerformanceSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.DbSystemComputePerformanceSummary."""
+
+    compute_performance_list: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compute_performance_list of this DbSystemComputePerformanceSummary. List of Compute performance details for the specified DB system shape.",
+    )
+    shape: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the shape of this DbSystemComputePerformanceSummary. The shape of the DB system.",
+    )
+
+
+def map_dbsystemcomputeperformancesummary(
+    o: oci.database.models.DbSystemComputePerformanceSummary,
+    fields: Optional[list[str]] = None,
+) -> DbSystemComputePerformanceSummary | None:
+    """Map oci.database.models.DbSystemComputePerformanceSummary → DbSystemComputePerformanceSummary Pydantic model."""
+    return map_model(DbSystemComputePerformanceSummary, o, fields)
+
+
+class DbSystemShapeSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.DbSystemShapeSummary."""
+
+    are_server_types_supported: Optional[Any] = Field(
+        None,
+        description="If true, the shape supports configurable DB and Storage Server types.",
+    )
+    available_core_count: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the available_core_count of this DbSystemShapeSummary. The maximum number of CPU cores that can be enabled on the DB system for this shape.",
+    )
+    available_core_count_per_node: Optional[Any] = Field(
+        None,
+        description="The maximum number of CPU cores per database node that can be enabled for this shape. Only applicable to the flex Exadata shape, ExaCC Elastic shapes and VM Flex shapes.",
+    )
+    available_data_storage_in_t_bs: Optional[Any] = Field(
+        None,
+        description="The maximum DATA storage that can be enabled for this shape.",
+    )
+    available_data_storage_per_server_in_tbs: Optional[float] = Field(
+        None,
+        description="The maximum data storage available per storage server for this shape. Only applicable to ExaCC Elastic shapes.",
+    )
+    available_db_node_per_node_in_gbs: Optional[Any] = Field(
+        None,
+        description="The maximum Db Node storage available per database node for this shape. Only applicable to ExaCC Elastic shapes.",
+    )
+    available_db_node_storage_in_g_bs: Optional[Any] = Field(
+        None,
+        description="The maximum Db Node storage that can be enabled for this shape.",
+    )
+    available_memory_in_gbs: Optional[Any] = Field(
+        None,
+        description="The maximum memory that can be enabled for this shape.",
+    )
+    available_memory_per_node_in_gbs: Optional[Any] = Field(
+        None,
+        description="The maximum memory available per database node for this shape. Only applicable to ExaCC Elastic shapes.",
+    )
+    compute_model: Optional[Any] = Field(
+        None,
+        description="The compute model of the Autonomous Database. This is required if using the `computeCount` parameter. If using `cpuCoreCount` then it is an error to specify `computeModel` to a non-null value. ECPU compute model is the recommended model and OCPU compute model is legacy. Allowed values for this property are: \"ECPU\", \"OCPU\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    core_count_increment: Optional[Any] = Field(
+        None,
+        description="The discrete number by which the CPU core count for this shape can be increased or decreased.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="The display name of the shape used for the DB system.",
+    )
+    max_storage_count: Optional[Any] = Field(
+        None,
+        description="The maximum number of Exadata storage servers available for the Exadata infrastructure.",
+    )
+    maximum_node_count: Optional[Any] = Field(
+        None,
+        description="The maximum number of compute servers available for this shape.",
+    )
+    min_core_count_per_node: Optional[Any] = Field(
+        None,
+        description="The minimum number of CPU cores that can be enabled per node for this shape.",
+    )
+    min_data_storage_in_t_bs: Optional[Any] = Field(
+        None,
+        description="The minimum data storage that need be allocated for this shape.",
+    )
+    min_db_node_storage_per_node_in_g_bs: Optional[Any] = Field(
+        None,
+        description="The minimum Db Node storage that need be allocated per node for this shape.",
+    )
+    min_memory_per_node_in_g_bs: Optional[Any] = Field(
+        None,
+        description="The minimum memory that need be allocated per node for this shape.",
+    )
+    min_storage_count: Optional[Any] = Field(
+        None,
+        description="The minimum number of Exadata storage servers available for the Exadata infrastructure.",
+    )
+    minimum_core_count: Optional[Any] = Field(
+        None,
+        description="The minimum number of CPU cores that can be enabled on the DB system for this shape.",
+    )
+    minimum_node_count: Optional[Any] = Field(
+        None,
+        description="The minimum number of compute servers available for this shape.",
+    )
+    name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the name of this DbSystemShapeSummary. The name of the shape used for the DB system.",
+    )
+    shape: Optional[Any] = Field(
+        None,
+        description="Deprecated. Use `name` instead of `shape`.",
+    )
+    shape_family: Optional[Any] = Field(
+        None,
+        description="The family of the shape used for the DB system.",
+    )
+    shape_type: Optional[Any] = Field(
+        None,
+        description='The shape type for the virtual machine DB system. Shape type is determined by CPU hardware. Valid values are `AMD` , `INTEL`, `INTEL_FLEX_X9` or `AMPERE_FLEX_A1`. Allowed values for this property are: "AMD", "INTEL", "INTEL_FLEX_X9", "AMPERE_FLEX_A1", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+
+
+def map_dbsystemshapesummary(
+    o: oci.database.models.DbSystemShapeSummary,
+    fields: Optional[list[str]] = None,
+) -> DbSystemShapeSummary | None:
+    """Map oci.database.models.DbSystemShapeSummary → DbSystemShapeSummary Pydantic model."""
+    return map_model(DbSystemShapeSummary, o, fields)
+
+
+class DbSystemStoragePerformanceSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.DbSystemStoragePerformanceSummary."""
+
+    data_storage_performance_list: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the data_storage_performance_list of this DbSystemStoragePerformanceSummary. List of storage performance for the DATA disks",
+    )
+    reco_storage_performance_list: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the reco_storage_performance_list of this DbSystemStoragePerformanceSummary. List of storage performance for the RECO disks",
+    )
+    shape_type: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the shape_type of this DbSystemStoragePerformanceSummary. ShapeType of the DbSystems INTEL , AMD, INTEL_FLEX_X9 or AMPERE_FLEX_A1 Allowed values for this property are: "AMD", "INTEL", "INTEL_FLEX_X9", "AMPERE_FLEX_A1", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+
+
+def map_dbsystemstorageperformancesummary(
+    o: oci.database.models.DbSystemStoragePerformanceSummary,
+    fields: Optional[list[str]] = None,
+) -> DbSystemStoragePerformanceSummary | None:
+    """Map oci.database.models.DbSystemStoragePerformanceSummary → DbSystemStoragePerformanceSummary Pydantic model."""
+    return map_model(DbSystemStoragePerformanceSummary, o, fields)
+
+
+class DbSystemSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.DbSystemSummary."""
+
+    availability_domain: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the availability_domain of this DbSystemSummary. The name of the availability domain that the DB system is located in.",
+    )
+    backup_network_nsg_ids: Optional[Any] = Field(
+        None,
+        description="A list of the `OCIDs`__ of the network security groups (NSGs) that the backup network of this DB system belongs to. Setting this to an empty array after the list is created removes the resource from all NSGs. For more information about NSGs, see `Security Rules`__. Applicable only to Exadata systems.",
+    )
+    backup_subnet_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the backup network subnet the DB system is associated with. Applicable only to Exadata DB systems. **Subnet Restriction:** See the subnet restrictions information for **subnetId**.",
+    )
+    cluster_name: Optional[Any] = Field(
+        None,
+        description="The cluster name for Exadata and 2-node RAC virtual machine DB systems. The cluster name must begin with an alphabetic character, and may contain hyphens (-). Underscores (_) are not permitted. The cluster name can be no longer than 11 characters and is not case sensitive.",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this DbSystemSummary. The `OCID`__ of the compartment.",
+    )
+    cpu_core_count: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the cpu_core_count of this DbSystemSummary. The number of CPU cores enabled on the DB system.",
+    )
+    data_collection_options: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    data_storage_percentage: Optional[Any] = Field(
+        None,
+        description="The percentage assigned to DATA storage (user data and database files). The remaining percentage is assigned to RECO storage (database redo logs, archive logs, and recovery manager backups). Accepted values are 40 and 80. The default is 80 percent assigned to DATA storage. Not applicable for virtual machine DB systems.",
+    )
+    data_storage_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The data storage size, in gigabytes, that is currently available to the DB system. Applies only for virtual machine DB systems.",
+    )
+    database_edition: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the database_edition of this DbSystemSummary. The Oracle Database edition that applies to all the databases on the DB system. Allowed values for this property are: "STANDARD_EDITION", "ENTERPRISE_EDITION", "ENTERPRISE_EDITION_HIGH_PERFORMANCE", "ENTERPRISE_EDITION_EXTREME_PERFORMANCE", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    db_system_options: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    disk_redundancy: Optional[Any] = Field(
+        None,
+        description="The type of redundancy configured for the DB system. NORMAL is 2-way redundancy. HIGH is 3-way redundancy. Allowed values for this property are: \"HIGH\", \"NORMAL\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this DbSystemSummary. The user-friendly name for the DB system. The name does not have to be unique.",
+    )
+    domain: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the domain of this DbSystemSummary. The domain name for the DB system.",
+    )
+    fault_domains: Optional[Any] = Field(
+        None,
+        description="List of the Fault Domains in which this DB system is provisioned.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    gi_software_image_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of a grid infrastructure software image. This is a database software image of the type `GRID_IMAGE`.",
+    )
+    hostname: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the hostname of this DbSystemSummary. The hostname for the DB system.",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this DbSystemSummary. The `OCID`__ of the DB system.",
+    )
+    kms_key_id: Optional[Any] = Field(
+        None,
+        description="The OCID of the key container that is used as the master encryption key in database transparent data encryption (TDE) operations.",
+    )
+    last_maintenance_run_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the last maintenance run.",
+    )
+    last_patch_history_entry_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the last patch history. This value is updated as soon as a patch operation starts.",
+    )
+    license_model: Optional[Any] = Field(
+        None,
+        description="The Oracle license model that applies to all the databases on the DB system. The default is LICENSE_INCLUDED. Allowed values for this property are: \"LICENSE_INCLUDED\", \"BRING_YOUR_OWN_LICENSE\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this DbSystemSummary. The current state of the DB system. Allowed values for this property are: "PROVISIONING", "AVAILABLE", "UPDATING", "TERMINATING", "TERMINATED", "FAILED", "MIGRATED", "MAINTENANCE_IN_PROGRESS", "NEEDS_ATTENTION", "UPGRADING", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    listener_port: Optional[Any] = Field(
+        None,
+        description="The port number configured for the listener on the DB system.",
+    )
+    maintenance_window: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    memory_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="Memory allocated to the DB system, in gigabytes.",
+    )
+    next_maintenance_run_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the next maintenance run.",
+    )
+    node_count: Optional[Any] = Field(
+        None,
+        description="The number of nodes in the DB system. For RAC DB systems, the value is greater than 1.",
+    )
+    nsg_ids: Optional[Any] = Field(
+        None,
+        description="The list of `OCIDs`__ for the network security groups (NSGs) to which this resource belongs. Setting this to an empty list removes all resources from all NSGs. For more information about NSGs, see `Security Rules`__. **NsgIds restrictions:** - A network security group (NSG) is optional for Autonomous Databases with private access. The nsgIds list can be empty.",
+    )
+    os_version: Optional[Any] = Field(
+        None,
+        description="The most recent OS Patch Version applied on the DB system.",
+    )
+    point_in_time_data_disk_clone_timestamp: Optional[Any] = Field(
+        None,
+        description="The point in time for a cloned database system when the data disks were cloned from the source database system, as described in `RFC 3339`__.",
+    )
+    reco_storage_size_in_gb: Optional[Any] = Field(
+        None,
+        description="The RECO/REDO storage size, in gigabytes, that is currently allocated to the DB system. Applies only for virtual machine DB systems.",
+    )
+    scan_dns_name: Optional[Any] = Field(
+        None,
+        description="The FQDN of the DNS record for the SCAN IP addresses that are associated with the DB system.",
+    )
+    scan_dns_record_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the DNS record for the SCAN IP addresses that are associated with the DB system.",
+    )
+    scan_ip_ids: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Single Client Access Name (SCAN) IPv4 addresses associated with the DB system. SCAN IPv4 addresses are typically used for load balancing and are not assigned to any interface. Oracle Clusterware directs the requests to the appropriate nodes in the cluster. **Note:** For a single-node DB system, this list is empty.",
+    )
+    scan_ipv6_ids: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Single Client Access Name (SCAN) IPv6 addresses associated with the DB system. SCAN IPv6 addresses are typically used for load balancing and are not assigned to any interface. Oracle Clusterware directs the requests to the appropriate nodes in the cluster. **Note:** For a single-node DB system, this list is empty.",
+    )
+    security_attributes: Optional[Any] = Field(
+        None,
+        description='Security Attributes for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__. Example: `{"Oracle-ZPR": {"MaxEgressCount": {"value": "42", "mode": "audit"}}}`',
+    )
+    shape: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the shape of this DbSystemSummary. The shape of the DB system. The shape determines resources to allocate to the DB system. - For virtual machine shapes, the number of CPU cores and memory - For bare metal and Exadata shapes, the number of CPU cores, storage, and memory",
+    )
+    source_db_system_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the DB system.",
+    )
+    sparse_diskgroup: Optional[Any] = Field(
+        None,
+        description="True, if Sparse Diskgroup is configured for Exadata dbsystem, False, if Sparse diskgroup was not configured.",
+    )
+    ssh_public_keys: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the ssh_public_keys of this DbSystemSummary. The public key portion of one or more key pairs used for SSH access to the DB system.",
+    )
+    storage_volume_performance_mode: Optional[Any] = Field(
+        None,
+        description="The block storage volume performance level. Valid values are `BALANCED` and `HIGH_PERFORMANCE`. See `Block Volume Performance`__ for more information. Allowed values for this property are: \"BALANCED\", \"HIGH_PERFORMANCE\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    subnet_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the subnet_id of this DbSystemSummary. The `OCID`__ of the subnet the DB system is associated with. **Subnet Restrictions:** - For bare metal DB systems and for single node virtual machine DB systems, do not use a subnet that overlaps with 192.168.16.16/28. - For Exadata and virtual machine 2-node RAC DB systems, do not use a subnet that overlaps with 192.168.128.0/20. These subnets are used by the Oracle Clusterware private interconnect on the database instance. Specifying an overlapping subnet will cause the private interconnect to malfunction. This restriction applies to both the client subnet and backup subnet.",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time the DB system was created.",
+    )
+    time_zone: Optional[Any] = Field(
+        None,
+        description="The time zone of the DB system. For details, see `DB System Time Zones`__.",
+    )
+    version: Optional[Any] = Field(
+        None,
+        description="The Oracle Database version of the DB system.",
+    )
+    vip_ids: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the virtual IPv4 (VIP) addresses associated with the DB system. The Cluster Ready Services (CRS) creates and maintains one VIPv4 address for each node in the DB system to enable failover. If one node fails, the VIPv4 is reassigned to another active node in the cluster. **Note:** For a single-node DB system, this list is empty.",
+    )
+    vipv6_ids: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the virtual IPv6 (VIP) addresses associated with the DB system. The Cluster Ready Services (CRS) creates and maintains one VIP IpV6 address for each node in the DB system to enable failover. If one node fails, the VIP is reassigned to another active node in the cluster. **Note:** For a single-node DB system, this list is empty.",
+    )
+    zone_id: Optional[Any] = Field(
+        None,
+        description="The OCID of the zone the DB system is associated with.",
+    )
+
+
+def map_dbsystemsummary(
+    o: oci.database.models.DbSystemSummary,
+    fields: Optional[list[str]] = None,
+) -> DbSystemSummary | None:
+    """Map oci.database.models.DbSystemSummary → DbSystemSummary Pydantic model."""
+    return map_model(DbSystemSummary, o, fields)
+
+
+class DbVersionSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.DbVersionSummary."""
+
+    is_latest_for_major_version: Optional[Any] = Field(
+        None,
+        description="True if this version of the Oracle Database software is the latest version for a release.",
+    )
+    is_preview_db_version: Optional[Any] = Field(
+        None,
+        description="True if this version of the Oracle Database software is the preview version.",
+    )
+    is_upgrade_supported: Optional[Any] = Field(
+        None,
+        description="True if this version of the Oracle Database software is supported for Upgrade.",
+    )
+    supports_pdb: Optional[Any] = Field(
+        None,
+        description="True if this version of the Oracle Database software supports pluggable databases.",
+    )
+    version: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the version of this DbVersionSummary. A valid Oracle Database version.",
+    )
+
+
+def map_dbversionsummary(
+    o: oci.database.models.DbVersionSummary,
+    fields: Optional[list[str]] = None,
+) -> DbVersionSummary | None:
+    """Map oci.database.models.DbVersionSummary → DbVersionSummary Pydantic model."""
+    return map_model(DbVersionSummary, o, fields)
+
+
+class GiMinorVersionSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.GiMinorVersionSummary."""
+
+    grid_image_id: Optional[Any] = Field(
+        None,
+        description="Grid Infrastructure Image Id",
+    )
+    version: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the version of this GiMinorVersionSummary. A valid Oracle Grid Infrastructure (GI) software version.",
+    )
+
+
+def map_giminorversionsummary(
+    o: oci.database.models.GiMinorVersionSummary,
+    fields: Optional[list[str]] = None,
+) -> GiMinorVersionSummary | None:
+    """Map oci.database.models.GiMinorVersionSummary → GiMinorVersionSummary Pydantic model."""
+    return map_model(GiMinorVersionSummary, o, fields)
+
+
+class GiVersionSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.GiVersionSummary."""
+
+    version: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the version of this GiVersionSummary. A valid Oracle Grid Infrastructure (GI) software version.",
+    )
+
+
+def map_giversionsummary(
+    o: oci.database.models.GiVersionSummary,
+    fields: Optional[list[str]] = None,
+) -> GiVersionSummary | None:
+    """Map oci.database.models.GiVersionSummary → GiVersionSummary Pydantic model."""
+    return map_model(GiVersionSummary, o, fields)
+
+
+class ConsoleConnection(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.ConsoleConnection."""
+
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this ConsoleConnection. The OCID of the compartment to contain the console connection.",
+    )
+    connection_string: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the connection_string of this ConsoleConnection. The SSH connection string for the console connection.",
+    )
+    db_node_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the db_node_id of this ConsoleConnection. The OCID of the database node.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    fingerprint: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the fingerprint of this ConsoleConnection. The SSH public key fingerprint for the console connection.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this ConsoleConnection. The OCID of the console connection.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this ConsoleConnection. The current state of the console connection. Allowed values for this property are: "ACTIVE", "CREATING", "DELETED", "DELETING", "FAILED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    service_host_key_fingerprint: Optional[Any] = Field(
+        None,
+        description="The SSH public key's fingerprint for the console connection service host.",
+    )
+
+
+def map_consoleconnection(
+    o: oci.database.models.ConsoleConnection,
+    fields: Optional[list[str]] = None,
+) -> ConsoleConnection | None:
+    """Map oci.database.models.ConsoleConnection → ConsoleConnection Pydantic model."""
+    return map_model(ConsoleConnection, o, fields)
+
+
+class ConsoleHistory(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.ConsoleHistory."""
+
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this ConsoleHistory. The OCID of the compartment containing the console history.",
+    )
+    db_node_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the db_node_id of this ConsoleHistory. The OCID of the database node.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="The user-friendly name for the console history. The name does not need to be unique.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this ConsoleHistory. The OCID of the console history.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this ConsoleHistory. The current state of the console history. Allowed values for this property are: "REQUESTED", "GETTING_HISTORY", "SUCCEEDED", "FAILED", "DELETED", "DELETING", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the time_created of this ConsoleHistory. The date and time the console history was created.",
+    )
+
+
+def map_consolehistory(
+    o: oci.database.models.ConsoleHistory, fields: Optional[list[str]] = None
+) -> ConsoleHistory | None:
+    """Map oci.database.models.ConsoleHistory → ConsoleHistory Pydantic model."""
+    return map_model(ConsoleHistory, o, fields)
+
+
+class DbHome(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.DbHome."""
+
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this DbHome. The `OCID`__ of the compartment.",
+    )
+    database_software_image_id: Optional[Any] = Field(
+        None,
+        description="The database software image `OCID`__",
+    )
+    db_home_location: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the db_home_location of this DbHome. The location of the Oracle Database Home.",
+    )
+    db_system_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the DB system.",
+    )
+    db_version: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the db_version of this DbHome. The Oracle Database version.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this DbHome. The user-provided name for the Database Home. The name does not need to be unique.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this DbHome. The `OCID`__ of the Database Home.",
+    )
+    is_unified_auditing_enabled: Optional[Any] = Field(
+        None,
+        description="Indicates whether unified autiding is enabled or not.",
+    )
+    kms_key_id: Optional[Any] = Field(
+        None,
+        description="The OCID of the key container that is used as the master encryption key in database transparent data encryption (TDE) operations.",
+    )
+    last_patch_history_entry_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the last patch history. This value is updated as soon as a patch operation is started.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this DbHome. The current state of the Database Home. Allowed values for this property are: "PROVISIONING", "AVAILABLE", "UPDATING", "TERMINATING", "TERMINATED", "FAILED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    one_off_patches: Optional[Any] = Field(
+        None,
+        description="List of one-off patches for Database Homes.",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time the Database Home was created.",
+    )
+    vm_cluster_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the VM cluster.",
+    )
+
+
+def map_dbhome(
+    o: oci.database.models.DbHome, fields: Optional[list[str]] = None
+) -> DbHome | None:
+    """Map oci.database.models.DbHome → DbHome Pydantic model."""
+    return map_model(DbHome, o, fields)
+
+
+class DbNode(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.DbNode."""
+
+    additional_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the planned maintenance.",
+    )
+    backup_ip_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the backup IP address associated with the database node. Use this OCID with either the :func:`get_private_ip` or the :func:`get_public_ip_by_private_ip_id` API to get the IP address needed to make a database connection. **Note:** Applies only to Exadata Cloud Service.",
+    )
+    backup_vnic2_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the second backup VNIC. **Note:** Applies only to Exadata Cloud Service.",
+    )
+    backup_vnic_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the backup VNIC.",
+    )
+    cpu_core_count: Optional[Any] = Field(
+        None,
+        description="The number of CPU cores enabled on the Db node.",
+    )
+    db_node_storage_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The allocated local node storage in GBs on the Db node.",
+    )
+    db_server_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Exacc Db server associated with the database node.",
+    )
+    db_system_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the db_system_id of this DbNode. The `OCID`__ of the DB system.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    fault_domain: Optional[Any] = Field(
+        None,
+        description="The name of the Fault Domain the instance is contained in.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    host_ip_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the host IP address associated with the database node. Use this OCID with either the :func:`get_private_ip` or the :func:`get_public_ip_by_private_ip_id` API to get the IP address needed to make a database connection. **Note:** Applies only to Exadata Cloud Service.",
+    )
+    hostname: Optional[Any] = Field(
+        None,
+        description="The host name for the database node.",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this DbNode. The `OCID`__ of the database node.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this DbNode. The current state of the database node. Allowed values for this property are: "PROVISIONING", "AVAILABLE", "UPDATING", "STOPPING", "STOPPED", "STARTING", "TERMINATING", "TERMINATED", "FAILED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    maintenance_type: Optional[Any] = Field(
+        None,
+        description="The type of database node maintenance. Allowed values for this property are: \"VMDB_REBOOT_MIGRATION\", \"EXADBXS_REBOOT_MIGRATION\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    memory_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The allocated memory in GBs on the Db node.",
+    )
+    software_storage_size_in_gb: Optional[Any] = Field(
+        None,
+        description="The size (in GB) of the block storage volume allocation for the DB system. This attribute applies only for virtual machine DB systems.",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the time_created of this DbNode. The date and time that the database node was created.",
+    )
+    time_maintenance_window_end: Optional[Any] = Field(
+        None,
+        description="End date and time of maintenance window.",
+    )
+    time_maintenance_window_start: Optional[Any] = Field(
+        None,
+        description="Start date and time of maintenance window.",
+    )
+    total_cpu_core_count: Optional[Any] = Field(
+        None,
+        description="The total number of CPU cores reserved on the Db node.",
+    )
+    vnic2_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the second VNIC. **Note:** Applies only to Exadata Cloud Service.",
+    )
+    vnic_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the vnic_id of this DbNode. The `OCID`__ of the VNIC.",
+    )
+
+
+def map_dbnode(
+    o: oci.database.models.DbNode, fields: Optional[list[str]] = None
+) -> DbNode | None:
+    """Map oci.database.models.DbNode → DbNode Pydantic model."""
+    return map_model(DbNode, o, fields)
+
+
+class DbSystem(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.DbSystem."""
+
+    availability_domain: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the availability_domain of this DbSystem. The name of the availability domain that the DB system is located in.",
+    )
+    backup_network_nsg_ids: Optional[Any] = Field(
+        None,
+        description="A list of the `OCIDs`__ of the network security groups (NSGs) that the backup network of this DB system belongs to. Setting this to an empty array after the list is created removes the resource from all NSGs. For more information about NSGs, see `Security Rules`__. Applicable only to Exadata systems.",
+    )
+    backup_subnet_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the backup network subnet the DB system is associated with. Applicable only to Exadata DB systems. **Subnet Restriction:** See the subnet restrictions information for **subnetId**.",
+    )
+    cluster_name: Optional[Any] = Field(
+        None,
+        description="The cluster name for Exadata and 2-node RAC virtual machine DB systems. The cluster name must begin with an alphabetic character, and may contain hyphens (-). Underscores (_) are not permitted. The cluster name can be no longer than 11 characters and is not case sensitive.",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this DbSystem. The `OCID`__ of the compartment.",
+    )
+    cpu_core_count: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the cpu_core_count of this DbSystem. The number of CPU cores enabled on the DB system.",
+    )
+    data_collection_options: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    data_storage_percentage: Optional[Any] = Field(
+        None,
+        description="The percentage assigned to DATA storage (user data and database files). The remaining percentage is assigned to RECO storage (database redo logs, archive logs, and recovery manager backups). Accepted values are 40 and 80. The default is 80 percent assigned to DATA storage. Not applicable for virtual machine DB systems.",
+    )
+    data_storage_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The data storage size, in gigabytes, that is currently available to the DB system. Applies only for virtual machine DB systems.",
+    )
+    database_edition: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the database_edition of this DbSystem. The Oracle Database edition that applies to all the databases on the DB system. Allowed values for this property are: "STANDARD_EDITION", "ENTERPRISE_EDITION", "ENTERPRISE_EDITION_HIGH_PERFORMANCE", "ENTERPRISE_EDITION_EXTREME_PERFORMANCE", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    db_system_options: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    disk_redundancy: Optional[Any] = Field(
+        None,
+        description="The type of redundancy configured for the DB system. NORMAL is 2-way redundancy. HIGH is 3-way redundancy. Allowed values for this property are: \"HIGH\", \"NORMAL\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this DbSystem. The user-friendly name for the DB system. The name does not have to be unique.",
+    )
+    domain: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the domain of this DbSystem. The domain name for the DB system.",
+    )
+    fault_domains: Optional[Any] = Field(
+        None,
+        description="List of the Fault Domains in which this DB system is provisioned.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    gi_software_image_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of a grid infrastructure software image. This is a database software image of the type `GRID_IMAGE`.",
+    )
+    hostname: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the hostname of this DbSystem. The hostname for the DB system.",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this DbSystem. The `OCID`__ of the DB system.",
+    )
+    iorm_config_cache: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    kms_key_id: Optional[Any] = Field(
+        None,
+        description="The OCID of the key container that is used as the master encryption key in database transparent data encryption (TDE) operations.",
+    )
+    last_maintenance_run_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the last maintenance run.",
+    )
+    last_patch_history_entry_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the last patch history. This value is updated as soon as a patch operation starts.",
+    )
+    license_model: Optional[Any] = Field(
+        None,
+        description="The Oracle license model that applies to all the databases on the DB system. The default is LICENSE_INCLUDED. Allowed values for this property are: \"LICENSE_INCLUDED\", \"BRING_YOUR_OWN_LICENSE\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this DbSystem. The current state of the DB system. Allowed values for this property are: "PROVISIONING", "AVAILABLE", "UPDATING", "TERMINATING", "TERMINATED", "FAILED", "MIGRATED", "MAINTENANCE_IN_PROGRESS", "NEEDS_ATTENTION", "UPGRADING", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    listener_port: Optional[Any] = Field(
+        None,
+        description="The port number configured for the listener on the DB system.",
+    )
+    maintenance_window: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    memory_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="Memory allocated to the DB system, in gigabytes.",
+    )
+    next_maintenance_run_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the next maintenance run.",
+    )
+    node_count: Optional[Any] = Field(
+        None,
+        description="The number of nodes in the DB system. For RAC DB systems, the value is greater than 1.",
+    )
+    nsg_ids: Optional[Any] = Field(
+        None,
+        description="The list of `OCIDs`__ for the network security groups (NSGs) to which this resource belongs. Setting this to an empty list removes all resources from all NSGs. For more information about NSGs, see `Security Rules`__. **NsgIds restrictions:** - A network security group (NSG) is optional for Autonomous Databases with private access. The nsgIds list can be empty.",
+    )
+    os_version: Optional[Any] = Field(
+        None,
+        description="The most recent OS Patch Version applied on the DB system.",
+    )
+    point_in_time_data_disk_clone_timestamp: Optional[Any] = Field(
+        None,
+        description="The point in time for a cloned database system when the data disks were cloned from the source database system, as described in `RFC 3339`__.",
+    )
+    reco_storage_size_in_gb: Optional[Any] = Field(
+        None,
+        description="The RECO/REDO storage size, in gigabytes, that is currently allocated to the DB system. Applies only for virtual machine DB systems.",
+    )
+    scan_dns_name: Optional[Any] = Field(
+        None,
+        description="The FQDN of the DNS record for the SCAN IP addresses that are associated with the DB system.",
+    )
+    scan_dns_record_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the DNS record for the SCAN IP addresses that are associated with the DB system.",
+    )
+    scan_ip_ids: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Single Client Access Name (SCAN) IPv4 addresses associated with the DB system. SCAN IPv4 addresses are typically used for load balancing and are not assigned to any interface. Oracle Clusterware directs the requests to the appropriate nodes in the cluster. **Note:** For a single-node DB system, this list is empty.",
+    )
+    scan_ipv6_ids: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Single Client Access Name (SCAN) IPv6 addresses associated with the DB system. SCAN IPv6 addresses are typically used for load balancing and are not assigned to any interface. Oracle Clusterware directs the requests to the appropriate nodes in the cluster. **Note:** For a single-node DB system, this list is empty.",
+    )
+    security_attributes: Optional[Any] = Field(
+        None,
+        description='Security Attributes for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__. Example: `{"Oracle-ZPR": {"MaxEgressCount": {"value": "42", "mode": "audit"}}}`',
+    )
+    shape: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the shape of this DbSystem. The shape of the DB system. The shape determines resources to allocate to the DB system. - For virtual machine shapes, the number of CPU cores and memory - For bare metal and Exadata shapes, the number of CPU cores, storage, and memory",
+    )
+    source_db_system_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the DB system.",
+    )
+    sparse_diskgroup: Optional[Any] = Field(
+        None,
+        description="True, if Sparse Diskgroup is configured for Exadata dbsystem, False, if Sparse diskgroup was not configured.",
+    )
+    ssh_public_keys: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the ssh_public_keys of this DbSystem. The public key portion of one or more key pairs used for SSH access to the DB system.",
+    )
+    storage_volume_performance_mode: Optional[Any] = Field(
+        None,
+        description="The block storage volume performance level. Valid values are `BALANCED` and `HIGH_PERFORMANCE`. See `Block Volume Performance`__ for more information. Allowed values for this property are: \"BALANCED\", \"HIGH_PERFORMANCE\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    subnet_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the subnet_id of this DbSystem. The `OCID`__ of the subnet the DB system is associated with. **Subnet Restrictions:** - For bare metal DB systems and for single node virtual machine DB systems, do not use a subnet that overlaps with 192.168.16.16/28. - For Exadata and virtual machine 2-node RAC DB systems, do not use a subnet that overlaps with 192.168.128.0/20. These subnets are used by the Oracle Clusterware private interconnect on the database instance. Specifying an overlapping subnet will cause the private interconnect to malfunction. This restriction applies to both the client subnet and backup subnet.",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time the DB system was created.",
+    )
+    time_zone: Optional[Any] = Field(
+        None,
+        description="The time zone of the DB system. For details, see `DB System Time Zones`__.",
+    )
+    version: Optional[Any] = Field(
+        None,
+        description="The Oracle Database version of the DB system.",
+    )
+    vip_ids: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the virtual IPv4 (VIP) addresses associated with the DB system. The Cluster Ready Services (CRS) creates and maintains one VIPv4 address for each node in the DB system to enable failover. If one node fails, the VIPv4 is reassigned to another active node in the cluster. **Note:** For a single-node DB system, this list is empty.",
+    )
+    vipv6_ids: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the virtual IPv6 (VIP) addresses associated with the DB system. The Cluster Ready Services (CRS) creates and maintains one VIP IpV6 address for each node in the DB system to enable failover. If one node fails, the VIP is reassigned to another active node in the cluster. **Note:** For a single-node DB system, this list is empty.",
+    )
+    zone_id: Optional[Any] = Field(
+        None,
+        description="The OCID of the zone the DB system is associated with.",
+    )
+
+
+def map_dbsystem(
+    o: oci.database.models.DbSystem, fields: Optional[list[str]] = None
+) -> DbSystem | None:
+    """Map oci.database.models.DbSystem → DbSystem Pydantic model."""
+    return map_model(DbSystem, o, fields)
+
+
+class DbSystemUpgradeHistoryEntry(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.DbSystemUpgradeHistoryEntry."""
+
+    action: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the action of this DbSystemUpgradeHistoryEntry. The operating system upgrade action. Allowed values for this property are: "PRECHECK", "ROLLBACK", "UPDATE_SNAPSHOT_RETENTION_DAYS", "UPGRADE", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this DbSystemUpgradeHistoryEntry. The `OCID`__ of the upgrade history entry.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="A descriptive text associated with the lifecycleState. Typically contains additional displayable text.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this DbSystemUpgradeHistoryEntry. The current state of the action. Allowed values for this property are: "IN_PROGRESS", "SUCCEEDED", "FAILED", "NEEDS_ATTENTION", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    new_gi_version: Optional[Any] = Field(
+        None,
+        description="A valid Oracle Grid Infrastructure (GI) software version.",
+    )
+    new_os_version: Optional[Any] = Field(
+        None,
+        description="A valid Oracle Software (OS) version eg. Oracle Linux Server release 8",
+    )
+    old_gi_version: Optional[Any] = Field(
+        None,
+        description="A valid Oracle Grid Infrastructure (GI) software version.",
+    )
+    old_os_version: Optional[Any] = Field(
+        None,
+        description="A valid Oracle Software (OS) version eg. Oracle Linux Server release 8",
+    )
+    snapshot_retention_period_in_days: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the snapshot_retention_period_in_days of this DbSystemUpgradeHistoryEntry. The retention period, in days, for the snapshot that allows you to perform a rollback of the upgrade operation. After this number of days passes, you cannot roll back the upgrade.",
+    )
+    time_ended: Optional[Any] = Field(
+        None,
+        description="The date and time when the upgrade action completed",
+    )
+    time_started: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the time_started of this DbSystemUpgradeHistoryEntry. The date and time when the upgrade action started.",
+    )
+
+
+def map_dbsystemupgradehistoryentry(
+    o: oci.database.models.DbSystemUpgradeHistoryEntry,
+    fields: Optional[list[str]] = None,
+) -> DbSystemUpgradeHistoryEntry | None:
+    """Map oci.database.models.DbSystemUpgradeHistoryEntry → DbSystemUpgradeHistoryEntry Pydantic model."""
+    return map_model(DbSystemUpgradeHistoryEntry, o, fields)
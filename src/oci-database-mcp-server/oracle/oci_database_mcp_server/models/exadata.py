@@ -0,0 +1,3027 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+
+Pydantic models of the OCI Database service: Exadata infrastructure, VM clusters, Exadata Database Service on Exascale and DB servers.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import oci
+from oracle.oci_database_mcp_server.models.base import OCIBaseModel, map_model
+from pydantic import Field
+
+
+class ApplicationVipSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.ApplicationVipSummary."""
+
+    cloud_vm_cluster_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the cloud_vm_cluster_id of this ApplicationVipSummary. The `OCID`__ of the cloud VM cluster associated with the application virtual IP (VIP) address.",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the compartment.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    hostname_label: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the hostname_label of this ApplicationVipSummary. The hostname of the application virtual IP (VIP) address.",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this ApplicationVipSummary. The `OCID`__ of the application virtual IP (VIP) address.",
+    )
+    ip_address: Optional[Any] = Field(
+        None,
+        description="The application virtual IP (VIP) address.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state of the application virtual IP (VIP) address.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this ApplicationVipSummary. The current lifecycle state of the application virtual IP (VIP) address. Allowed values for this property are: "PROVISIONING", "AVAILABLE", "TERMINATING", "TERMINATED", "FAILED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    subnet_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the subnet associated with the application virtual IP (VIP) address.",
+    )
+    time_assigned: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the time_assigned of this ApplicationVipSummary. The date and time when the create operation for the application virtual IP (VIP) address completed.",
+    )
+
+
+def map_applicationvipsummary(
+    o: oci.database.models.ApplicationVipSummary,
+    fields: Optional[list[str]] = None,
+) -> ApplicationVipSummary | None:
+    """Map oci.database.models.ApplicationVipSummary → ApplicationVipSummary Pydantic model."""
+    return map_model(ApplicationVipSummary, o, fields)
+
+
+class CloudExadataInfrastructureSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.CloudExadataInfrastructureSummary."""
+
+    activated_storage_count: Optional[Any] = Field(
+        None,
+        description="The requested number of additional storage servers activated for the Exadata infrastructure.",
+    )
+    additional_storage_count: Optional[Any] = Field(
+        None,
+        description="The requested number of additional storage servers for the Exadata infrastructure.",
+    )
+    availability_domain: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the availability_domain of this CloudExadataInfrastructureSummary. The name of the availability domain that the cloud Exadata infrastructure resource is located in.",
+    )
+    available_storage_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The available storage can be allocated to the cloud Exadata infrastructure resource, in gigabytes (GB).",
+    )
+    cluster_placement_group_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the cluster placement group of the Exadata Infrastructure.",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this CloudExadataInfrastructureSummary. The `OCID`__ of the compartment.",
+    )
+    compute_count: Optional[Any] = Field(
+        None,
+        description="The number of compute servers for the cloud Exadata infrastructure.",
+    )
+    compute_model: Optional[Any] = Field(
+        None,
+        description="The compute model of the Autonomous Database. This is required if using the `computeCount` parameter. If using `cpuCoreCount` then it is an error to specify `computeModel` to a non-null value. ECPU compute model is the recommended model and OCPU compute model is legacy. Allowed values for this property are: \"ECPU\", \"OCPU\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    cpu_count: Optional[Any] = Field(
+        None,
+        description="The total number of CPU cores allocated.",
+    )
+    customer_contacts: Optional[Any] = Field(
+        None,
+        description="The list of customer email addresses that receive information from Oracle about the specified OCI Database service resource. Oracle uses these email addresses to send notifications about planned and unplanned software maintenance updates, information about system hardware, and other information needed by administrators. Up to 10 email addresses can be added to the customer contacts for a cloud Exadata infrastructure instance.",
+    )
+    data_storage_size_in_tbs: Optional[float] = Field(
+        None,
+        description="Size, in terabytes, of the DATA disk group.",
+    )
+    database_server_type: Optional[Any] = Field(
+        None,
+        description="The database server type of the Exadata infrastructure.",
+    )
+    db_node_storage_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The local node storage allocated in GBs.",
+    )
+    db_server_version: Optional[Any] = Field(
+        None,
+        description="The software version of the database servers (dom0) in the cloud Exadata infrastructure. Example: 20.1.15",
+    )
+    defined_file_system_configurations: Optional[Any] = Field(
+        None,
+        description="Details of the file system configuration of the Exadata infrastructure.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this CloudExadataInfrastructureSummary. The user-friendly name for the cloud Exadata infrastructure resource. The name does not need to be unique.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this CloudExadataInfrastructureSummary. The `OCID`__ of the cloud Exadata infrastructure resource.",
+    )
+    is_scheduling_policy_associated: Optional[Any] = Field(
+        None,
+        description="If true, the infrastructure is using granular maintenance scheduling preference.",
+    )
+    last_maintenance_run_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the last maintenance run.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this CloudExadataInfrastructureSummary. The current lifecycle state of the cloud Exadata infrastructure resource. Allowed values for this property are: "PROVISIONING", "AVAILABLE", "UPDATING", "TERMINATING", "TERMINATED", "FAILED", "MAINTENANCE_IN_PROGRESS", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    maintenance_window: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    max_cpu_count: Optional[Any] = Field(
+        None,
+        description="The total number of CPU cores available.",
+    )
+    max_data_storage_in_tbs: Optional[float] = Field(
+        None,
+        description="The total available DATA disk group size.",
+    )
+    max_db_node_storage_in_gbs: Optional[Any] = Field(
+        None,
+        description="The total local node storage available in GBs.",
+    )
+    max_memory_in_gbs: Optional[Any] = Field(
+        None,
+        description="The total memory available in GBs.",
+    )
+    memory_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The memory allocated in GBs.",
+    )
+    monthly_db_server_version: Optional[Any] = Field(
+        None,
+        description="The monthly software version of the database servers (dom0) in the cloud Exadata infrastructure. Example: 20.1.15",
+    )
+    monthly_storage_server_version: Optional[Any] = Field(
+        None,
+        description="The monthly software version of the storage servers (cells) in the cloud Exadata infrastructure. Example: 20.1.15",
+    )
+    next_maintenance_run_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the next maintenance run.",
+    )
+    shape: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the shape of this CloudExadataInfrastructureSummary. The model name of the cloud Exadata infrastructure resource.",
+    )
+    storage_count: Optional[Any] = Field(
+        None,
+        description="The number of storage servers for the cloud Exadata infrastructure.",
+    )
+    storage_server_type: Optional[Any] = Field(
+        None,
+        description="The storage server type of the Exadata infrastructure.",
+    )
+    storage_server_version: Optional[Any] = Field(
+        None,
+        description="The software version of the storage servers (cells) in the cloud Exadata infrastructure. Example: 20.1.15",
+    )
+    subscription_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the subscription with which resource needs to be associated with.",
+    )
+    system_tags: Optional[Any] = Field(
+        None,
+        description="System tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time the cloud Exadata infrastructure resource was created.",
+    )
+    total_storage_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The total storage allocated to the cloud Exadata infrastructure resource, in gigabytes (GB).",
+    )
+
+
+def map_cloudexadatainfrastructuresummary(
+    o: oci.database.models.CloudExadataInfrastructureSummary,
+    fields: Optional[list[str]] = None,
+) -> CloudExadataInfrastructureSummary | None:
+    """Map oci.database.models.CloudExadataInfrastructureSummary → CloudExadataInfrastructureSummary Pydantic model."""
+    return map_model(CloudExadataInfrastructureSummary, o, fields)
+
+
+class CloudVmClusterSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.CloudVmClusterSummary."""
+
+    availability_domain: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the availability_domain of this CloudVmClusterSummary. The name of the availability domain that the cloud Exadata infrastructure resource is located in.",
+    )
+    backup_network_nsg_ids: Optional[Any] = Field(
+        None,
+        description="A list of the `OCIDs`__ of the network security groups (NSGs) that the backup network of this DB system belongs to. Setting this to an empty array after the list is created removes the resource from all NSGs. For more information about NSGs, see `Security Rules`__. Applicable only to Exadata systems.",
+    )
+    backup_subnet_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the backup network subnet associated with the cloud VM cluster. **Subnet Restriction:** See the subnet restrictions information for **subnetId**.",
+    )
+    cloud_automation_update_details: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    cloud_exadata_infrastructure_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the cloud_exadata_infrastructure_id of this CloudVmClusterSummary. The `OCID`__ of the cloud Exadata infrastructure.",
+    )
+    cluster_name: Optional[Any] = Field(
+        None,
+        description="The cluster name for cloud VM cluster. The cluster name must begin with an alphabetic character, and may contain hyphens (-). Underscores (_) are not permitted. The cluster name can be no longer than 11 characters and is not case sensitive.",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this CloudVmClusterSummary. The `OCID`__ of the compartment.",
+    )
+    compute_model: Optional[Any] = Field(
+        None,
+        description="The compute model of the Autonomous Database. This is required if using the `computeCount` parameter. If using `cpuCoreCount` then it is an error to specify `computeModel` to a non-null value. ECPU compute model is the recommended model and OCPU compute model is legacy. Allowed values for this property are: \"ECPU\", \"OCPU\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    cpu_core_count: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the cpu_core_count of this CloudVmClusterSummary. The number of CPU cores enabled on the cloud VM cluster.",
+    )
+    data_collection_options: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    data_storage_percentage: Optional[Any] = Field(
+        None,
+        description="The percentage assigned to DATA storage (user data and database files). The remaining percentage is assigned to RECO storage (database redo logs, archive logs, and recovery manager backups). Accepted values are 35, 40, 60 and 80. The default is 80 percent assigned to DATA storage. See `Storage Configuration`__ in the Exadata documentation for details on the impact of the configuration settings on storage.",
+    )
+    data_storage_size_in_tbs: Optional[float] = Field(
+        None,
+        description="The data disk group size to be allocated in TBs.",
+    )
+    db_node_storage_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The local node storage to be allocated in GBs.",
+    )
+    db_servers: Optional[Any] = Field(
+        None,
+        description="The list of DB servers.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    disk_redundancy: Optional[Any] = Field(
+        None,
+        description="The type of redundancy configured for the cloud Vm cluster. NORMAL is 2-way redundancy. HIGH is 3-way redundancy. Allowed values for this property are: \"HIGH\", \"NORMAL\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this CloudVmClusterSummary. The user-friendly name for the cloud VM cluster. The name does not need to be unique.",
+    )
+    domain: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the domain of this CloudVmClusterSummary. The domain name for the cloud VM cluster.",
+    )
+    file_system_configuration_details: Optional[Any] = Field(
+        None,
+        description="Details of the file system configuration of the VM cluster.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    gi_software_image_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of a grid infrastructure software image. This is a database software image of the type `GRID_IMAGE`.",
+    )
+    gi_version: Optional[Any] = Field(
+        None,
+        description="A valid Oracle Grid Infrastructure (GI) software version.",
+    )
+    hostname: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the hostname of this CloudVmClusterSummary. The hostname for the cloud VM cluster.",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this CloudVmClusterSummary. The `OCID`__ of the cloud VM cluster.",
+    )
+    is_local_backup_enabled: Optional[Any] = Field(
+        None,
+        description="If true, database backup on local Exadata storage is configured for the cloud VM cluster. If false, database backup on local Exadata storage is not available in the cloud VM cluster.",
+    )
+    is_sparse_diskgroup_enabled: Optional[Any] = Field(
+        None,
+        description="If true, sparse disk group is configured for the cloud VM cluster. If false, sparse disk group is not created.",
+    )
+    last_update_history_entry_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the last maintenance update history entry. This value is updated when a maintenance update starts.",
+    )
+    license_model: Optional[Any] = Field(
+        None,
+        description="The Oracle license model that applies to the cloud VM cluster. The default is LICENSE_INCLUDED. Allowed values for this property are: \"LICENSE_INCLUDED\", \"BRING_YOUR_OWN_LICENSE\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this CloudVmClusterSummary. The current state of the cloud VM cluster. Allowed values for this property are: "PROVISIONING", "AVAILABLE", "UPDATING", "TERMINATING", "TERMINATED", "FAILED", "MAINTENANCE_IN_PROGRESS", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    listener_port: Optional[Any] = Field(
+        None,
+        description="The port number configured for the listener on the cloud VM cluster.",
+    )
+    memory_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The memory to be allocated in GBs.",
+    )
+    node_count: Optional[Any] = Field(
+        None,
+        description="The number of nodes in the cloud VM cluster.",
+    )
+    nsg_ids: Optional[Any] = Field(
+        None,
+        description="The list of `OCIDs`__ for the network security groups (NSGs) to which this resource belongs. Setting this to an empty list removes all resources from all NSGs. For more information about NSGs, see `Security Rules`__. **NsgIds restrictions:** - A network security group (NSG) is optional for Autonomous Databases with private access. The nsgIds list can be empty.",
+    )
+    ocpu_count: Optional[float] = Field(
+        None,
+        description="The number of OCPU cores to enable on the cloud VM cluster. Only 1 decimal place is allowed for the fractional part.",
+    )
+    scan_dns_name: Optional[Any] = Field(
+        None,
+        description="The FQDN of the DNS record for the SCAN IP addresses that are associated with the cloud VM cluster.",
+    )
+    scan_dns_record_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the DNS record for the SCAN IP addresses that are associated with the cloud VM cluster.",
+    )
+    scan_ip_ids: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Single Client Access Name (SCAN) IP addresses associated with the cloud VM cluster. SCAN IP addresses are typically used for load balancing and are not assigned to any interface. Oracle Clusterware directs the requests to the appropriate nodes in the cluster. **Note:** For a single-node DB system, this list is empty.",
+    )
+    scan_listener_port_tcp: Optional[Any] = Field(
+        None,
+        description="The TCP Single Client Access Name (SCAN) port. The default port is 1521.",
+    )
+    scan_listener_port_tcp_ssl: Optional[Any] = Field(
+        None,
+        description="The TCPS Single Client Access Name (SCAN) port. The default port is 2484.",
+    )
+    security_attributes: Optional[Any] = Field(
+        None,
+        description='Security Attributes for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__. Example: `{"Oracle-ZPR": {"MaxEgressCount": {"value": "42", "mode": "audit"}}}`',
+    )
+    shape: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the shape of this CloudVmClusterSummary. The model name of the Exadata hardware running the cloud VM cluster.",
+    )
+    ssh_public_keys: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the ssh_public_keys of this CloudVmClusterSummary. The public key portion of one or more key pairs used for SSH access to the cloud VM cluster.",
+    )
+    storage_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The storage allocation for the disk group, in gigabytes (GB).",
+    )
+    subnet_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the subnet_id of this CloudVmClusterSummary. The `OCID`__ of the subnet associated with the cloud VM cluster. **Subnet Restrictions:** - For Exadata and virtual machine 2-node RAC systems, do not use a subnet that overlaps with 192.168.128.0/20. These subnets are used by the Oracle Clusterware private interconnect on the database instance. Specifying an overlapping subnet will cause the private interconnect to malfunction. This restriction applies to both the client subnet and backup subnet.",
+    )
+    subscription_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the subscription with which resource needs to be associated with.",
+    )
+    system_tags: Optional[Any] = Field(
+        None,
+        description="System tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    system_version: Optional[Any] = Field(
+        None,
+        description="Operating system version of the image.",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time that the cloud VM cluster was created.",
+    )
+    time_zone: Optional[Any] = Field(
+        None,
+        description="The time zone of the cloud VM cluster. For details, see `Exadata Infrastructure Time Zones`__.",
+    )
+    vip_ids: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the virtual IP (VIP) addresses associated with the cloud VM cluster. The Cluster Ready Services (CRS) creates and maintains one VIP address for each node in the Exadata Cloud Service instance to enable failover. If one node fails, the VIP is reassigned to another active node in the cluster. **Note:** For a single-node DB system, this list is empty.",
+    )
+    zone_id: Optional[Any] = Field(
+        None,
+        description="The OCID of the zone the cloud VM cluster is associated with.",
+    )
+
+
+def map_cloudvmclustersummary(
+    o: oci.database.models.CloudVmClusterSummary,
+    fields: Optional[list[str]] = None,
+) -> CloudVmClusterSummary | None:
+    """Map oci.database.models.CloudVmClusterSummary → CloudVmClusterSummary Pydantic model."""
+    return map_model(CloudVmClusterSummary, o, fields)
+
+
+class DbServerSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.DbServerSummary."""
+
+    autonomous_virtual_machine_ids: Optional[Any] = Field(
+        None,
+        description="The list of `OCIDs`__ of the Autonomous Virtual Machines associated with the Db server.",
+    )
+    autonomous_vm_cluster_ids: Optional[Any] = Field(
+        None,
+        description="The list of `OCIDs`__ of the Autonomous VM Clusters associated with the Db server.",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the compartment.",
+    )
+    compute_model: Optional[Any] = Field(
+        None,
+        description="The compute model of the Autonomous Database. This is required if using the `computeCount` parameter. If using `cpuCoreCount` then it is an error to specify `computeModel` to a non-null value. ECPU compute model is the recommended model and OCPU compute model is legacy. Allowed values for this property are: \"ECPU\", \"OCPU\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    cpu_core_count: Optional[Any] = Field(
+        None,
+        description="The number of CPU cores enabled on the Db server.",
+    )
+    db_node_ids: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Db nodes associated with the Db server.",
+    )
+    db_node_storage_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The allocated local node storage in GBs on the Db server.",
+    )
+    db_server_patching_details: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="The user-friendly name for the Db server. The name does not need to be unique.",
+    )
+    exadata_infrastructure_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Exadata infrastructure.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Db server.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='The current state of the Db server. Allowed values for this property are: "CREATING", "AVAILABLE", "UNAVAILABLE", "DELETING", "DELETED", "MAINTENANCE_IN_PROGRESS", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    max_cpu_count: Optional[Any] = Field(
+        None,
+        description="The total number of CPU cores available.",
+    )
+    max_db_node_storage_in_gbs: Optional[Any] = Field(
+        None,
+        description="The total local node storage available in GBs.",
+    )
+    max_memory_in_gbs: Optional[Any] = Field(
+        None,
+        description="The total memory available in GBs.",
+    )
+    memory_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The allocated memory in GBs on the Db server.",
+    )
+    shape: Optional[Any] = Field(
+        None,
+        description="The shape of the Db server. The shape determines the amount of CPU, storage, and memory resources available.",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time that the Db Server was created.",
+    )
+    vm_cluster_ids: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the VM Clusters associated with the Db server.",
+    )
+
+
+def map_dbserversummary(
+    o: oci.database.models.DbServerSummary,
+    fields: Optional[list[str]] = None,
+) -> DbServerSummary | None:
+    """Map oci.database.models.DbServerSummary → DbServerSummary Pydantic model."""
+    return map_model(DbServerSummary, o, fields)
+
+
+class ExadataInfrastructureSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.ExadataInfrastructureSummary."""
+
+    activated_storage_count: Optional[Any] = Field(
+        None,
+        description="The requested number of additional storage servers activated for the Exadata infrastructure.",
+    )
+    additional_compute_count: Optional[Any] = Field(
+        None,
+        description="The requested number of additional compute servers for the Exadata infrastructure.",
+    )
+    additional_compute_system_model: Optional[Any] = Field(
+        None,
+        description='Oracle Exadata System Model specification. The system model determines the amount of compute or storage server resources available for use. For more information, please see [System and Shape Configuration Options] ( Allowed values for this property are: "X7", "X8", "X8M", "X9M", "X10M", "X11M", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    additional_storage_count: Optional[Any] = Field(
+        None,
+        description="The requested number of additional storage servers for the Exadata infrastructure.",
+    )
+    admin_network_cidr: Optional[Any] = Field(
+        None,
+        description="The CIDR block for the Exadata administration network.",
+    )
+    availability_domain: Optional[Any] = Field(
+        None,
+        description="The name of the availability domain that the Exadata infrastructure is located in.",
+    )
+    cloud_control_plane_server1: Optional[Any] = Field(
+        None,
+        description="The IP address for the first control plane server.",
+    )
+    cloud_control_plane_server2: Optional[Any] = Field(
+        None,
+        description="The IP address for the second control plane server.",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this ExadataInfrastructureSummary. The `OCID`__ of the compartment.",
+    )
+    compute_count: Optional[Any] = Field(
+        None,
+        description="The number of compute servers for the Exadata infrastructure.",
+    )
+    compute_model: Optional[Any] = Field(
+        None,
+        description="The compute model of the Autonomous Database. This is required if using the `computeCount` parameter. If using `cpuCoreCount` then it is an error to specify `computeModel` to a non-null value. ECPU compute model is the recommended model and OCPU compute model is legacy. Allowed values for this property are: \"ECPU\", \"OCPU\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    contacts: Optional[Any] = Field(
+        None,
+        description="The list of contacts for the Exadata infrastructure.",
+    )
+    corporate_proxy: Optional[Any] = Field(
+        None,
+        description="The corporate network proxy for access to the control plane network.",
+    )
+    cpus_enabled: Optional[Any] = Field(
+        None,
+        description="The number of enabled CPU cores.",
+    )
+    csi_number: Optional[Any] = Field(
+        None,
+        description="The CSI Number of the Exadata infrastructure.",
+    )
+    data_storage_size_in_tbs: Optional[float] = Field(
+        None,
+        description="Size, in terabytes, of the DATA disk group.",
+    )
+    database_server_type: Optional[Any] = Field(
+        None,
+        description="The database server type of the Exadata infrastructure.",
+    )
+    db_node_storage_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The local node storage allocated in GBs.",
+    )
+    db_server_version: Optional[Any] = Field(
+        None,
+        description="The software version of the database servers (dom0) in the Exadata infrastructure.",
+    )
+    defined_file_system_configurations: Optional[Any] = Field(
+        None,
+        description="Details of the file system configuration of the Exadata infrastructure.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this ExadataInfrastructureSummary. The user-friendly name for the Exadata Cloud@Customer infrastructure. The name does not need to be unique.",
+    )
+    dns_server: Optional[Any] = Field(
+        None,
+        description="The list of DNS server IP addresses. Maximum of 3 allowed.",
+    )
+    exascale_config: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    gateway: Optional[Any] = Field(
+        None,
+        description="The gateway for the control plane network.",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this ExadataInfrastructureSummary. The `OCID`__ of the Exadata infrastructure.",
+    )
+    infini_band_network_cidr: Optional[Any] = Field(
+        None,
+        description="The CIDR block for the Exadata InfiniBand interconnect.",
+    )
+    is_cps_offline_report_enabled: Optional[Any] = Field(
+        None,
+        description="Indicates whether cps offline diagnostic report is enabled for this Exadata infrastructure. This will allow a customer to quickly check status themselves and fix problems on their end, saving time and frustration for both Oracle and the customer when they find the CPS in a disconnected state.You can enable offline diagnostic report during Exadata infrastructure provisioning. You can also disable or enable it at any time using the UpdateExadatainfrastructure API.",
+    )
+    is_multi_rack_deployment: Optional[Any] = Field(
+        None,
+        description="Indicates if deployment is Multi-Rack or not.",
+    )
+    is_scheduling_policy_associated: Optional[Any] = Field(
+        None,
+        description="If true, the infrastructure is using granular maintenance scheduling preference.",
+    )
+    last_maintenance_run_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the last maintenance run.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this ExadataInfrastructureSummary. The current lifecycle state of the Exadata infrastructure. Allowed values for this property are: "CREATING", "REQUIRES_ACTIVATION", "ACTIVATING", "ACTIVE", "ACTIVATION_FAILED", "FAILED", "UPDATING", "DELETING", "DELETED", "DISCONNECTED", "MAINTENANCE_IN_PROGRESS", "WAITING_FOR_CONNECTIVITY", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    maintenance_slo_status: Optional[Any] = Field(
+        None,
+        description="A field to capture ‘Maintenance SLO Status’ for the Exadata infrastructure with values ‘OK’, ‘DEGRADED’. Default is ‘OK’ when the infrastructure is provisioned. Allowed values for this property are: \"OK\", \"DEGRADED\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    maintenance_window: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    max_cpu_count: Optional[Any] = Field(
+        None,
+        description="The total number of CPU cores available.",
+    )
+    max_data_storage_in_t_bs: Optional[float] = Field(
+        None,
+        description="The total available DATA disk group size.",
+    )
+    max_db_node_storage_in_g_bs: Optional[Any] = Field(
+        None,
+        description="The total local node storage available in GBs.",
+    )
+    max_memory_in_gbs: Optional[Any] = Field(
+        None,
+        description="The total memory available in GBs.",
+    )
+    memory_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The memory allocated in GBs.",
+    )
+    monthly_db_server_version: Optional[Any] = Field(
+        None,
+        description="The monthly software version of the database servers (dom0) in the Exadata infrastructure.",
+    )
+    multi_rack_configuration_file: Optional[Any] = Field(
+        None,
+        description="The base64 encoded Multi-Rack configuration json file.",
+    )
+    netmask: Optional[Any] = Field(
+        None,
+        description="The netmask for the control plane network.",
+    )
+    network_bonding_mode_details: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    next_maintenance_run_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the next maintenance run.",
+    )
+    ntp_server: Optional[Any] = Field(
+        None,
+        description="The list of NTP server IP addresses. Maximum of 3 allowed.",
+    )
+    rack_serial_number: Optional[Any] = Field(
+        None,
+        description="The serial number for the Exadata infrastructure.",
+    )
+    shape: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the shape of this ExadataInfrastructureSummary. The shape of the Exadata infrastructure. The shape determines the amount of CPU, storage, and memory resources allocated to the instance.",
+    )
+    storage_count: Optional[Any] = Field(
+        None,
+        description="The number of Exadata storage servers for the Exadata infrastructure.",
+    )
+    storage_server_type: Optional[Any] = Field(
+        None,
+        description="The storage server type of the Exadata infrastructure.",
+    )
+    storage_server_version: Optional[Any] = Field(
+        None,
+        description="The software version of the storage servers (cells) in the Exadata infrastructure.",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time the Exadata infrastructure was created.",
+    )
+    time_zone: Optional[Any] = Field(
+        None,
+        description="The time zone of the Exadata infrastructure. For details, see `Exadata Infrastructure Time Zones`__.",
+    )
+
+
+def map_exadatainfrastructuresummary(
+    o: oci.database.models.ExadataInfrastructureSummary,
+    fields: Optional[list[str]] = None,
+) -> ExadataInfrastructureSummary | None:
+    """Map oci.database.models.ExadataInfrastructureSummary → ExadataInfrastructureSummary Pydantic model."""
+    return map_model(ExadataInfrastructureSummary, o, fields)
+
+
+class ExadbVmClusterUpdateSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.ExadbVmClusterUpdateSummary."""
+
+    available_actions: Optional[Any] = Field(
+        None,
+        description='The possible actions performed by the update operation on the infrastructure components. Allowed values for items in this list are: "ROLLING_APPLY", "NON_ROLLING_APPLY", "PRECHECK", "ROLLBACK", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    description: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the description of this ExadbVmClusterUpdateSummary. Details of the maintenance update package.",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this ExadbVmClusterUpdateSummary. The `OCID`__ of the maintenance update.",
+    )
+    last_action: Optional[Any] = Field(
+        None,
+        description='The previous update action performed. Allowed values for this property are: "ROLLING_APPLY", "NON_ROLLING_APPLY", "PRECHECK", "ROLLBACK", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Descriptive text providing additional details about the lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='The current state of the maintenance update. Dependent on value of `lastAction`. Allowed values for this property are: "AVAILABLE", "SUCCESS", "IN_PROGRESS", "FAILED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    time_released: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the time_released of this ExadbVmClusterUpdateSummary. The date and time the maintenance update was released.",
+    )
+    update_type: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the update_type of this ExadbVmClusterUpdateSummary. The type of cloud VM cluster maintenance update. Allowed values for this property are: "GI_UPGRADE", "GI_PATCH", "OS_UPDATE", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    version: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the version of this ExadbVmClusterUpdateSummary. The version of the maintenance update package.",
+    )
+
+
+def map_exadbvmclusterupdatesummary(
+    o: oci.database.models.ExadbVmClusterUpdateSummary,
+    fields: Optional[list[str]] = None,
+) -> ExadbVmClusterUpdateSummary | None:
+    """Map oci.database.models.ExadbVmClusterUpdateSummary → ExadbVmClusterUpdateSummary Pydantic model."""
+    return map_model(ExadbVmClusterUpdateSummary, o, fields)
+
+
+class ExadbVmClusterSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.ExadbVmClusterSummary."""
+
+    availability_domain: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the availability_domain of this ExadbVmClusterSummary. The name of the availability domain in which the Exadata VM cluster on Exascale Infrastructure is located.",
+    )
+    backup_network_nsg_ids: Optional[Any] = Field(
+        None,
+        description="A list of the `OCIDs`__ of the network security groups (NSGs) that the backup network of this DB system belongs to. Setting this to an empty array after the list is created removes the resource from all NSGs. For more information about NSGs, see `Security Rules`__. Applicable only to Exadata systems.",
+    )
+    backup_subnet_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the backup_subnet_id of this ExadbVmClusterSummary. The `OCID`__ of the backup network subnet associated with the Exadata VM cluster on Exascale Infrastructure.",
+    )
+    cluster_name: Optional[Any] = Field(
+        None,
+        description="The cluster name for Exadata VM cluster on Exascale Infrastructure. The cluster name must begin with an alphabetic character, and may contain hyphens (-). Underscores (_) are not permitted. The cluster name can be no longer than 11 characters and is not case sensitive.",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this ExadbVmClusterSummary. The `OCID`__ of the compartment.",
+    )
+    data_collection_options: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this ExadbVmClusterSummary. The user-friendly name for the Exadata VM cluster on Exascale Infrastructure. The name does not need to be unique.",
+    )
+    domain: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the domain of this ExadbVmClusterSummary. A domain name used for the Exadata VM cluster on Exascale Infrastructure. If the Oracle-provided internet and VCN resolver is enabled for the specified subnet, then the domain name for the subnet is used (do not provide one). Otherwise, provide a valid DNS domain name. Hyphens (-) are not permitted. Applies to Exadata Database Service on Exascale Infrastructure only.",
+    )
+    enabled_e_cpu_count: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the enabled_e_cpu_count of this ExadbVmClusterSummary. The number of ECPUs to enable for an Exadata VM cluster on Exascale Infrastructure.",
+    )
+    exascale_db_storage_vault_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the exascale_db_storage_vault_id of this ExadbVmClusterSummary. The `OCID`__ of the Exadata Database Storage Vault.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    gi_version: Optional[Any] = Field(
+        None,
+        description="A valid Oracle Grid Infrastructure (GI) software version.",
+    )
+    grid_image_id: Optional[Any] = Field(
+        None,
+        description="Grid Setup will be done using this grid image id. The grid image id can be extracted from 1. Obtain the supported major versions using API /20160918/giVersions?compartmentId=<compartmentId>&shape=EXADB_XS&availabilityDomain=<AD name> 2. Replace {version} with one of the supported major versions and obtain the supported minor versions using API /20160918/giVersions/{version}/minorVersions?compartmentId=<compartmentId>&shapeFamily=EXADB_XS&availabilityDomain=<AD name>",
+    )
+    grid_image_type: Optional[Any] = Field(
+        None,
+        description="The type of Grid Image Allowed values for this property are: \"RELEASE_UPDATE\", \"CUSTOM_IMAGE\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    hostname: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the hostname of this ExadbVmClusterSummary. The hostname for the Exadata VM cluster on Exascale Infrastructure. The hostname must begin with an alphabetic character, and can contain alphanumeric characters and hyphens (-). For Exadata systems, the maximum length of the hostname is 12 characters. The maximum length of the combined hostname and domain is 63 characters. **Note:** The hostname must be unique within the subnet. If it is not unique, then the Exadata VM cluster on Exascale Infrastructure will fail to provision.",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this ExadbVmClusterSummary. The `OCID`__ of the Exadata VM cluster on Exascale Infrastructure.",
+    )
+    last_update_history_entry_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the last maintenance update history entry. This value is updated when a maintenance update starts.",
+    )
+    license_model: Optional[Any] = Field(
+        None,
+        description="The Oracle license model that applies to the Exadata VM cluster on Exascale Infrastructure. The default is BRING_YOUR_OWN_LICENSE. Allowed values for this property are: \"LICENSE_INCLUDED\", \"BRING_YOUR_OWN_LICENSE\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this ExadbVmClusterSummary. The current state of the Exadata VM cluster on Exascale Infrastructure. Allowed values for this property are: "PROVISIONING", "AVAILABLE", "UPDATING", "TERMINATING", "TERMINATED", "FAILED", "MAINTENANCE_IN_PROGRESS", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    listener_port: Optional[Any] = Field(
+        None,
+        description="The port number configured for the listener on the Exadata VM cluster on Exascale Infrastructure.",
+    )
+    memory_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The memory that you want to be allocated in GBs. Memory is calculated based on 11 GB per VM core reserved.",
+    )
+    node_count: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the node_count of this ExadbVmClusterSummary. The number of nodes in the Exadata VM cluster on Exascale Infrastructure.",
+    )
+    nsg_ids: Optional[Any] = Field(
+        None,
+        description="The list of `OCIDs`__ for the network security groups (NSGs) to which this resource belongs. Setting this to an empty list removes all resources from all NSGs. For more information about NSGs, see `Security Rules`__. **NsgIds restrictions:** - A network security group (NSG) is optional for Autonomous Databases with private access. The nsgIds list can be empty.",
+    )
+    private_zone_id: Optional[Any] = Field(
+        None,
+        description="The private zone ID in which you want DNS records to be created.",
+    )
+    scan_dns_name: Optional[Any] = Field(
+        None,
+        description="The FQDN of the DNS record for the SCAN IP addresses that are associated with the Exadata VM cluster on Exascale Infrastructure.",
+    )
+    scan_dns_record_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the DNS record for the SCAN IP addresses that are associated with the Exadata VM cluster on Exascale Infrastructure.",
+    )
+    scan_ip_ids: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Single Client Access Name (SCAN) IP addresses associated with the Exadata VM cluster on Exascale Infrastructure. SCAN IP addresses are typically used for load balancing and are not assigned to any interface. Oracle Clusterware directs the requests to the appropriate nodes in the cluster. **Note:** For a single-node DB system, this list is empty.",
+    )
+    scan_listener_port_tcp: Optional[Any] = Field(
+        None,
+        description="The TCP Single Client Access Name (SCAN) port. The default port is 1521.",
+    )
+    scan_listener_port_tcp_ssl: Optional[Any] = Field(
+        None,
+        description="The Secured Communication (TCPS) protocol Single Client Access Name (SCAN) port. The default port is 2484.",
+    )
+    security_attributes: Optional[Any] = Field(
+        None,
+        description='Security Attributes for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__. Example: `{"Oracle-ZPR": {"MaxEgressCount": {"value": "42", "mode": "audit"}}}`',
+    )
+    shape: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the shape of this ExadbVmClusterSummary. The shape of the Exadata VM cluster on Exascale Infrastructure resource",
+    )
+    snapshot_file_system_storage: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    ssh_public_keys: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the ssh_public_keys of this ExadbVmClusterSummary. The public key portion of one or more key pairs used for SSH access to the Exadata VM cluster on Exascale Infrastructure.",
+    )
+    subnet_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the subnet_id of this ExadbVmClusterSummary. The `OCID`__ of the subnet associated with the Exadata VM cluster on Exascale Infrastructure.",
+    )
+    system_tags: Optional[Any] = Field(
+        None,
+        description="System tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    system_version: Optional[Any] = Field(
+        None,
+        description="Operating system version of the image.",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time that the Exadata VM cluster on Exascale Infrastructure was created.",
+    )
+    time_zone: Optional[Any] = Field(
+        None,
+        description="The time zone to use for the Exadata VM cluster on Exascale Infrastructure. For details, see `Time Zones`__.",
+    )
+    total_e_cpu_count: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the total_e_cpu_count of this ExadbVmClusterSummary. The number of Total ECPUs for an Exadata VM cluster on Exascale Infrastructure.",
+    )
+    total_file_system_storage: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    vip_ids: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the virtual IP (VIP) addresses associated with the Exadata VM cluster on Exascale Infrastructure. The Cluster Ready Services (CRS) creates and maintains one VIP address for each node in the Exadata Cloud Service instance to enable failover. If one node fails, then the VIP is reassigned to another active node in the cluster.",
+    )
+    vm_file_system_storage: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the vm_file_system_storage of this ExadbVmClusterSummary.",
+    )
+    zone_id: Optional[Any] = Field(
+        None,
+        description="The OCID of the zone with which the Exadata VM cluster on Exascale Infrastructure is associated.",
+    )
+
+
+def map_exadbvmclustersummary(
+    o: oci.database.models.ExadbVmClusterSummary,
+    fields: Optional[list[str]] = None,
+) -> ExadbVmClusterSummary | None:
+    """Map oci.database.models.ExadbVmClusterSummary → ExadbVmClusterSummary Pydantic model."""
+    return map_model(ExadbVmClusterSummary, o, fields)
+
+
+class ExascaleDbStorageVaultSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.ExascaleDbStorageVaultSummary."""
+
+    additional_flash_cache_in_percent: Optional[Any] = Field(
+        None,
+        description="The size of additional Flash Cache in percentage of High Capacity database storage.",
+    )
+    availability_domain: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the availability_domain of this ExascaleDbStorageVaultSummary. The name of the availability domain in which the Exadata Database Storage Vault is located.",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this ExascaleDbStorageVaultSummary. The `OCID`__ of the compartment.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    description: Optional[Any] = Field(
+        None,
+        description="Exadata Database Storage Vault description.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this ExascaleDbStorageVaultSummary. The user-friendly name for the Exadata Database Storage Vault. The name does not need to be unique.",
+    )
+    exadata_infrastructure_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Exadata infrastructure.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    high_capacity_database_storage: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the high_capacity_database_storage of this ExascaleDbStorageVaultSummary.",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this ExascaleDbStorageVaultSummary. The `OCID`__ of the Exadata Database Storage Vault.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the lifecycle_state of this ExascaleDbStorageVaultSummary. The current state of the Exadata Database Storage Vault.",
+    )
+    system_tags: Optional[Any] = Field(
+        None,
+        description="System tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time that the Exadata Database Storage Vault was created.",
+    )
+    time_zone: Optional[Any] = Field(
+        None,
+        description="The time zone that you want to use for the Exadata Database Storage Vault. For details, see `Time Zones`__.",
+    )
+    vm_cluster_count: Optional[Any] = Field(
+        None,
+        description="The number of Exadata VM clusters used the Exadata Database Storage Vault.",
+    )
+
+
+def map_exascaledbstoragevaultsummary(
+    o: oci.database.models.ExascaleDbStorageVaultSummary,
+    fields: Optional[list[str]] = None,
+) -> ExascaleDbStorageVaultSummary | None:
+    """Map oci.database.models.ExascaleDbStorageVaultSummary → ExascaleDbStorageVaultSummary Pydantic model."""
+    return map_model(ExascaleDbStorageVaultSummary, o, fields)
+
+
+class FlexComponentCollection(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.FlexComponentCollection."""
+
+    items: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the items of this FlexComponentCollection.",
+    )
+
+
+def map_flexcomponentcollection(
+    o: oci.database.models.FlexComponentCollection,
+    fields: Optional[list[str]] = None,
+) -> FlexComponentCollection | None:
+    """Map oci.database.models.FlexComponentCollection → FlexComponentCollection Pydantic model."""
+    return map_model(FlexComponentCollection, o, fields)
+
+
+class SystemVersionCollection(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.SystemVersionCollection."""
+
+    items: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the items of this SystemVersionCollection. List of System versions.",
+    )
+
+
+def map_systemversioncollection(
+    o: oci.database.models.SystemVersionCollection,
+    fields: Optional[list[str]] = None,
+) -> SystemVersionCollection | None:
+    """Map oci.database.models.SystemVersionCollection → SystemVersionCollection Pydantic model."""
+    return map_model(SystemVersionCollection, o, fields)
+
+
+class VmClusterNetworkSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.VmClusterNetworkSummary."""
+
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the compartment.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="The user-friendly name for the VM cluster network. The name does not need to be unique.",
+    )
+    dns: Optional[Any] = Field(
+        None,
+        description="The list of DNS server IP addresses. Maximum of 3 allowed.",
+    )
+    dr_scans: Optional[Any] = Field(
+        None,
+        description="The SCAN details for DR network",
+    )
+    exadata_infrastructure_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Exadata infrastructure.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the VM cluster network.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='The current state of the VM cluster network. CREATING - The resource is being created REQUIRES_VALIDATION - The resource is created and may not be usable until it is validated. VALIDATING - The resource is being validated and not available to use. VALIDATED - The resource is validated and is available for consumption by VM cluster. VALIDATION_FAILED - The resource validation has failed and might require user input to be corrected. UPDATING - The resource is being updated and not available to use. ALLOCATED - The resource is is currently being used by VM cluster. TERMINATING - The resource is being deleted and not available to use. TERMINATED - The resource is deleted and unavailable. FAILED - The resource is in a failed state due to validation or other errors. NEEDS_ATTENTION - The resource is in needs attention state as some of it\'s child nodes are not validated and unusable by VM cluster. Allowed values for this property are: "CREATING", "REQUIRES_VALIDATION", "VALIDATING", "VALIDATED", "VALIDATION_FAILED", "UPDATING", "ALLOCATED", "TERMINATING", "TERMINATED", "FAILED", "NEEDS_ATTENTION", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    ntp: Optional[Any] = Field(
+        None,
+        description="The list of NTP server IP addresses. Maximum of 3 allowed.",
+    )
+    scans: Optional[Any] = Field(
+        None,
+        description="The SCAN details.",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time when the VM cluster network was created.",
+    )
+    vm_cluster_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the associated VM Cluster.",
+    )
+    vm_networks: Optional[Any] = Field(
+        None,
+        description="Details of the client and backup networks.",
+    )
+
+
+def map_vmclusternetworksummary(
+    o: oci.database.models.VmClusterNetworkSummary,
+    fields: Optional[list[str]] = None,
+) -> VmClusterNetworkSummary | None:
+    """Map oci.database.models.VmClusterNetworkSummary → VmClusterNetworkSummary Pydantic model."""
+    return map_model(VmClusterNetworkSummary, o, fields)
+
+
+class VmClusterUpdateSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.VmClusterUpdateSummary."""
+
+    available_actions: Optional[Any] = Field(
+        None,
+        description='The possible actions that can be performed using this maintenance update. Allowed values for items in this list are: "ROLLING_APPLY", "PRECHECK", "ROLLBACK", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    description: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the description of this VmClusterUpdateSummary. Details of the maintenance update package.",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this VmClusterUpdateSummary. The `OCID`__ of the maintenance update.",
+    )
+    last_action: Optional[Any] = Field(
+        None,
+        description='The update action performed most recently using this maintenance update. Allowed values for this property are: "ROLLING_APPLY", "PRECHECK", "ROLLBACK", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Descriptive text providing additional details about the lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='The current state of the maintenance update. Dependent on value of `lastAction`. Allowed values for this property are: "AVAILABLE", "SUCCESS", "IN_PROGRESS", "FAILED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    time_released: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the time_released of this VmClusterUpdateSummary. The date and time the maintenance update was released.",
+    )
+    update_type: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the update_type of this VmClusterUpdateSummary. The type of VM cluster maintenance update. Allowed values for this property are: "GI_UPGRADE", "GI_PATCH", "OS_UPDATE", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    version: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the version of this VmClusterUpdateSummary. The version of the maintenance update package.",
+    )
+
+
+def map_vmclusterupdatesummary(
+    o: oci.database.models.VmClusterUpdateSummary,
+    fields: Optional[list[str]] = None,
+) -> VmClusterUpdateSummary | None:
+    """Map oci.database.models.VmClusterUpdateSummary → VmClusterUpdateSummary Pydantic model."""
+    return map_model(VmClusterUpdateSummary, o, fields)
+
+
+class VmClusterSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.VmClusterSummary."""
+
+    availability_domain: Optional[Any] = Field(
+        None,
+        description="The name of the availability domain that the VM cluster is located in.",
+    )
+    cloud_automation_update_details: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the compartment.",
+    )
+    compute_model: Optional[Any] = Field(
+        None,
+        description="The compute model of the Autonomous Database. This is required if using the `computeCount` parameter. If using `cpuCoreCount` then it is an error to specify `computeModel` to a non-null value. ECPU compute model is the recommended model and OCPU compute model is legacy. Allowed values for this property are: \"ECPU\", \"OCPU\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    cpus_enabled: Optional[Any] = Field(
+        None,
+        description="The number of enabled CPU cores.",
+    )
+    data_collection_options: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    data_storage_size_in_gbs: Optional[float] = Field(
+        None,
+        description="Size of the DATA disk group in GBs.",
+    )
+    data_storage_size_in_tbs: Optional[float] = Field(
+        None,
+        description="Size, in terabytes, of the DATA disk group.",
+    )
+    db_node_storage_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The local node storage allocated in GBs.",
+    )
+    db_servers: Optional[Any] = Field(
+        None,
+        description="The list of Db server.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="The user-friendly name for the Exadata Cloud@Customer VM cluster. The name does not need to be unique.",
+    )
+    exadata_infrastructure_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Exadata infrastructure.",
+    )
+    exascale_db_storage_vault_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Exadata Database Storage Vault.",
+    )
+    file_system_configuration_details: Optional[Any] = Field(
+        None,
+        description="Details of the file system configuration of the VM cluster.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    gi_software_image_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of a grid infrastructure software image. This is a database software image of the type `GRID_IMAGE`.",
+    )
+    gi_version: Optional[Any] = Field(
+        None,
+        description="The Oracle Grid Infrastructure software version for the VM cluster.",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the VM cluster.",
+    )
+    is_local_backup_enabled: Optional[Any] = Field(
+        None,
+        description="If true, database backup on local Exadata storage is configured for the VM cluster. If false, database backup on local Exadata storage is not available in the VM cluster.",
+    )
+    is_sparse_diskgroup_enabled: Optional[Any] = Field(
+        None,
+        description="If true, sparse disk group is configured for the VM cluster. If false, sparse disk group is not created.",
+    )
+    last_patch_history_entry_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the last patch history. This value is updated as soon as a patch operation starts.",
+    )
+    license_model: Optional[Any] = Field(
+        None,
+        description="The Oracle license model that applies to the VM cluster. The default is LICENSE_INCLUDED. Allowed values for this property are: \"LICENSE_INCLUDED\", \"BRING_YOUR_OWN_LICENSE\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='The current state of the VM cluster. Allowed values for this property are: "PROVISIONING", "AVAILABLE", "UPDATING", "TERMINATING", "TERMINATED", "FAILED", "MAINTENANCE_IN_PROGRESS", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    memory_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The memory allocated in GBs.",
+    )
+    ocpus_enabled: Optional[float] = Field(
+        None,
+        description="The number of enabled OCPU cores.",
+    )
+    shape: Optional[Any] = Field(
+        None,
+        description="The shape of the Exadata infrastructure. The shape determines the amount of CPU, storage, and memory resources allocated to the instance.",
+    )
+    ssh_public_keys: Optional[Any] = Field(
+        None,
+        description="The public key portion of one or more key pairs used for SSH access to the VM cluster.",
+    )
+    storage_management_type: Optional[Any] = Field(
+        None,
+        description="Specifies whether the type of storage management for the VM cluster is ASM or Exascale. Allowed values for this property are: \"ASM\", \"EXASCALE\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    system_version: Optional[Any] = Field(
+        None,
+        description="Operating system version of the image.",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time that the VM cluster was created.",
+    )
+    time_zone: Optional[Any] = Field(
+        None,
+        description="The time zone of the Exadata infrastructure. For details, see `Exadata Infrastructure Time Zones`__.",
+    )
+    vm_cluster_network_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the VM cluster network.",
+    )
+
+
+def map_vmclustersummary(
+    o: oci.database.models.VmClusterSummary,
+    fields: Optional[list[str]] = None,
+) -> VmClusterSummary | None:
+    """Map oci.database.models.VmClusterSummary → VmClusterSummary Pydantic model."""
+    return map_model(VmClusterSummary, o, fields)
+
+
+class ApplicationVip(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.ApplicationVip."""
+
+    cloud_vm_cluster_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the cloud_vm_cluster_id of this ApplicationVip. The `OCID`__ of the cloud VM cluster associated with the application virtual IP (VIP) address.",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the compartment.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    hostname_label: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the hostname_label of this ApplicationVip. The hostname of the application virtual IP (VIP) address.",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this ApplicationVip. The `OCID`__ of the application virtual IP (VIP) address.",
+    )
+    ip_address: Optional[Any] = Field(
+        None,
+        description="The application virtual IP (VIP) address.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state of the application virtual IP (VIP) address.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this ApplicationVip. The current lifecycle state of the application virtual IP (VIP) address. Allowed values for this property are: "PROVISIONING", "AVAILABLE", "TERMINATING", "TERMINATED", "FAILED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    subnet_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the subnet associated with the application virtual IP (VIP) address.",
+    )
+    time_assigned: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the time_assigned of this ApplicationVip. The date and time when the create operation for the application virtual IP (VIP) address completed.",
+    )
+
+
+def map_applicationvip(
+    o: oci.database.models.ApplicationVip, fields: Optional[list[str]] = None
+) -> ApplicationVip | None:
+    """Map oci.database.models.ApplicationVip → ApplicationVip Pydantic model."""
+    return map_model(ApplicationVip, o, fields)
+
+
+class CloudExadataInfrastructure(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.CloudExadataInfrastructure."""
+
+    activated_storage_count: Optional[Any] = Field(
+        None,
+        description="The requested number of additional storage servers activated for the Exadata infrastructure.",
+    )
+    additional_storage_count: Optional[Any] = Field(
+        None,
+        description="The requested number of additional storage servers for the Exadata infrastructure.",
+    )
+    availability_domain: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the availability_domain of this CloudExadataInfrastructure. The name of the availability domain that the cloud Exadata infrastructure resource is located in.",
+    )
+    available_storage_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The available storage can be allocated to the cloud Exadata infrastructure resource, in gigabytes (GB).",
+    )
+    cluster_placement_group_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the cluster placement group of the Exadata Infrastructure.",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this CloudExadataInfrastructure. The `OCID`__ of the compartment.",
+    )
+    compute_count: Optional[Any] = Field(
+        None,
+        description="The number of compute servers for the cloud Exadata infrastructure.",
+    )
+    compute_model: Optional[Any] = Field(
+        None,
+        description="The compute model of the Autonomous Database. This is required if using the `computeCount` parameter. If using `cpuCoreCount` then it is an error to specify `computeModel` to a non-null value. ECPU compute model is the recommended model and OCPU compute model is legacy. Allowed values for this property are: \"ECPU\", \"OCPU\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    cpu_count: Optional[Any] = Field(
+        None,
+        description="The total number of CPU cores allocated.",
+    )
+    customer_contacts: Optional[Any] = Field(
+        None,
+        description="The list of customer email addresses that receive information from Oracle about the specified OCI Database service resource. Oracle uses these email addresses to send notifications about planned and unplanned software maintenance updates, information about system hardware, and other information needed by administrators. Up to 10 email addresses can be added to the customer contacts for a cloud Exadata infrastructure instance.",
+    )
+    data_storage_size_in_tbs: Optional[float] = Field(
+        None,
+        description="Size, in terabytes, of the DATA disk group.",
+    )
+    database_server_type: Optional[Any] = Field(
+        None,
+        description="The database server type of the Exadata infrastructure.",
+    )
+    db_node_storage_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The local node storage allocated in GBs.",
+    )
+    db_server_version: Optional[Any] = Field(
+        None,
+        description="The software version of the database servers (dom0) in the cloud Exadata infrastructure. Example: 20.1.15",
+    )
+    defined_file_system_configurations: Optional[Any] = Field(
+        None,
+        description="Details of the file system configuration of the Exadata infrastructure.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this CloudExadataInfrastructure. The user-friendly name for the cloud Exadata infrastructure resource. The name does not need to be unique.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this CloudExadataInfrastructure. The `OCID`__ of the cloud Exadata infrastructure resource.",
+    )
+    is_scheduling_policy_associated: Optional[Any] = Field(
+        None,
+        description="If true, the infrastructure is using granular maintenance scheduling preference.",
+    )
+    last_maintenance_run_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the last maintenance run.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this CloudExadataInfrastructure. The current lifecycle state of the cloud Exadata infrastructure resource. Allowed values for this property are: "PROVISIONING", "AVAILABLE", "UPDATING", "TERMINATING", "TERMINATED", "FAILED", "MAINTENANCE_IN_PROGRESS", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    maintenance_window: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    max_cpu_count: Optional[Any] = Field(
+        None,
+        description="The total number of CPU cores available.",
+    )
+    max_data_storage_in_tbs: Optional[float] = Field(
+        None,
+        description="The total available DATA disk group size.",
+    )
+    max_db_node_storage_in_gbs: Optional[Any] = Field(
+        None,
+        description="The total local node storage available in GBs.",
+    )
+    max_memory_in_gbs: Optional[Any] = Field(
+        None,
+        description="The total memory available in GBs.",
+    )
+    memory_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The memory allocated in GBs.",
+    )
+    monthly_db_server_version: Optional[Any] = Field(
+        None,
+        description="The monthly software version of the database servers (dom0) in the cloud Exadata infrastructure. Example: 20.1.15",
+    )
+    monthly_storage_server_version: Optional[Any] = Field(
+        None,
+        description="The monthly software version of the storage servers (cells) in the cloud Exadata infrastructure. Example: 20.1.15",
+    )
+    next_maintenance_run_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the next maintenance run.",
+    )
+    shape: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the shape of this CloudExadataInfrastructure. The model name of the cloud Exadata infrastructure resource.",
+    )
+    storage_count: Optional[Any] = Field(
+        None,
+        description="The number of storage servers for the cloud Exadata infrastructure.",
+    )
+    storage_server_type: Optional[Any] = Field(
+        None,
+        description="The storage server type of the Exadata infrastructure.",
+    )
+    storage_server_version: Optional[Any] = Field(
+        None,
+        description="The software version of the storage servers (cells) in the cloud Exadata infrastructure. Example: 20.1.15",
+    )
+    subscription_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the subscription with which resource needs to be associated with.",
+    )
+    system_tags: Optional[Any] = Field(
+        None,
+        description="System tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time the cloud Exadata infrastructure resource was created.",
+    )
+    total_storage_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The total storage allocated to the cloud Exadata infrastructure resource, in gigabytes (GB).",
+    )
+
+
+def map_cloudexadatainfrastructure(
+    o: oci.database.models.CloudExadataInfrastructure,
+    fields: Optional[list[str]] = None,
+) -> CloudExadataInfrastructure | None:
+    """Map oci.database.models.CloudExadataInfrastructure → CloudExadataInfrastructure Pydantic model."""
+    return map_model(CloudExadataInfrastructure, o, fields)
+
+
+class CloudExadataInfrastructureUnallocatedResources(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.CloudExadataInfrastructureUnallocatedResources."""
+
+    cloud_autonomous_vm_clusters: Optional[Any] = Field(
+        None,
+        description="The list of Cloud Autonomous VM Clusters on the Infrastructure and their associated unallocated resources details.",
+    )
+    cloud_exadata_infrastructure_display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the cloud_exadata_infrastructure_display_name of this CloudExadataInfrastructureUnallocatedResources. The user-friendly name for the Cloud Exadata infrastructure. The name does not need to be unique.",
+    )
+    cloud_exadata_infrastructure_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the cloud_exadata_infrastructure_id of this CloudExadataInfrastructureUnallocatedResources. The `OCID`__ of the Cloud Exadata infrastructure.",
+    )
+    exadata_storage_in_tbs: Optional[float] = Field(
+        None,
+        description="Total unallocated exadata storage in the infrastructure in TBs.",
+    )
+    local_storage_in_gbs: Optional[Any] = Field(
+        None,
+        description="The minimum amount of unallocated storage available across all nodes in the infrastructure.",
+    )
+    memory_in_gbs: Optional[Any] = Field(
+        None,
+        description="The minimum amount of unallocated memory available across all nodes in the infrastructure.",
+    )
+    ocpus: Optional[Any] = Field(
+        None,
+        description="The minimum amount of unallocated ocpus available across all nodes in the infrastructure.",
+    )
+
+
+def map_cloudexadatainfrastructureunallocatedresources(
+    o: oci.database.models.CloudExadataInfrastructureUnallocatedResources,
+    fields: Optional[list[str]] = None,
+) -> CloudExadataInfrastructureUnallocatedResources | None:
+    """Map oci.database.models.CloudExadataInfrastructureUnallocatedResources → CloudExadataInfrastructureUnallocatedResources Pydantic model."""
+    return map_model(CloudExadataInfrastructureUnallocatedResources, o, fields)
+
+
+class CloudVmCluster(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.CloudVmCluster."""
+
+    availability_domain: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the availability_domain of this CloudVmCluster. The name of the availability domain that the cloud Exadata infrastructure resource is located in.",
+    )
+    backup_network_nsg_ids: Optional[Any] = Field(
+        None,
+        description="A list of the `OCIDs`__ of the network security groups (NSGs) that the backup network of this DB system belongs to. Setting this to an empty array after the list is created removes the resource from all NSGs. For more information about NSGs, see `Security Rules`__. Applicable only to Exadata systems.",
+    )
+    backup_subnet_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the backup network subnet associated with the cloud VM cluster. **Subnet Restriction:** See the subnet restrictions information for **subnetId**.",
+    )
+    cloud_automation_update_details: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    cloud_exadata_infrastructure_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the cloud_exadata_infrastructure_id of this CloudVmCluster. The `OCID`__ of the cloud Exadata infrastructure.",
+    )
+    cluster_name: Optional[Any] = Field(
+        None,
+        description="The cluster name for cloud VM cluster. The cluster name must begin with an alphabetic character, and may contain hyphens (-). Underscores (_) are not permitted. The cluster name can be no longer than 11 characters and is not case sensitive.",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this CloudVmCluster. The `OCID`__ of the compartment.",
+    )
+    compute_model: Optional[Any] = Field(
+        None,
+        description="The compute model of the Autonomous Database. This is required if using the `computeCount` parameter. If using `cpuCoreCount` then it is an error to specify `computeModel` to a non-null value. ECPU compute model is the recommended model and OCPU compute model is legacy. Allowed values for this property are: \"ECPU\", \"OCPU\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    cpu_core_count: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the cpu_core_count of this CloudVmCluster. The number of CPU cores enabled on the cloud VM cluster.",
+    )
+    data_collection_options: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    data_storage_percentage: Optional[Any] = Field(
+        None,
+        description="The percentage assigned to DATA storage (user data and database files). The remaining percentage is assigned to RECO storage (database redo logs, archive logs, and recovery manager backups). Accepted values are 35, 40, 60 and 80. The default is 80 percent assigned to DATA storage. See `Storage Configuration`__ in the Exadata documentation for details on the impact of the configuration settings on storage.",
+    )
+    data_storage_size_in_tbs: Optional[float] = Field(
+        None,
+        description="The data disk group size to be allocated in TBs.",
+    )
+    db_node_storage_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The local node storage to be allocated in GBs.",
+    )
+    db_servers: Optional[Any] = Field(
+        None,
+        description="The list of DB servers.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    disk_redundancy: Optional[Any] = Field(
+        None,
+        description="The type of redundancy configured for the cloud Vm cluster. NORMAL is 2-way redundancy. HIGH is 3-way redundancy. Allowed values for this property are: \"HIGH\", \"NORMAL\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this CloudVmCluster. The user-friendly name for the cloud VM cluster. The name does not need to be unique.",
+    )
+    domain: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the domain of this CloudVmCluster. The domain name for the cloud VM cluster.",
+    )
+    file_system_configuration_details: Optional[Any] = Field(
+        None,
+        description="Details of the file system configuration of the VM cluster.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    gi_software_image_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of a grid infrastructure software image. This is a database software image of the type `GRID_IMAGE`.",
+    )
+    gi_version: Optional[Any] = Field(
+        None,
+        description="A valid Oracle Grid Infrastructure (GI) software version.",
+    )
+    hostname: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the hostname of this CloudVmCluster. The hostname for the cloud VM cluster.",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this CloudVmCluster. The `OCID`__ of the cloud VM cluster.",
+    )
+    iorm_config_cache: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    is_local_backup_enabled: Optional[Any] = Field(
+        None,
+        description="If true, database backup on local Exadata storage is configured for the cloud VM cluster. If false, database backup on local Exadata storage is not available in the cloud VM cluster.",
+    )
+    is_sparse_diskgroup_enabled: Optional[Any] = Field(
+        None,
+        description="If true, sparse disk group is configured for the cloud VM cluster. If false, sparse disk group is not created.",
+    )
+    last_update_history_entry_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the last maintenance update history entry. This value is updated when a maintenance update starts.",
+    )
+    license_model: Optional[Any] = Field(
+        None,
+        description="The Oracle license model that applies to the cloud VM cluster. The default is LICENSE_INCLUDED. Allowed values for this property are: \"LICENSE_INCLUDED\", \"BRING_YOUR_OWN_LICENSE\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this CloudVmCluster. The current state of the cloud VM cluster. Allowed values for this property are: "PROVISIONING", "AVAILABLE", "UPDATING", "TERMINATING", "TERMINATED", "FAILED", "MAINTENANCE_IN_PROGRESS", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    listener_port: Optional[Any] = Field(
+        None,
+        description="The port number configured for the listener on the cloud VM cluster.",
+    )
+    memory_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The memory to be allocated in GBs.",
+    )
+    node_count: Optional[Any] = Field(
+        None,
+        description="The number of nodes in the cloud VM cluster.",
+    )
+    nsg_ids: Optional[Any] = Field(
+        None,
+        description="The list of `OCIDs`__ for the network security groups (NSGs) to which this resource belongs. Setting this to an empty list removes all resources from all NSGs. For more information about NSGs, see `Security Rules`__. **NsgIds restrictions:** - A network security group (NSG) is optional for Autonomous Databases with private access. The nsgIds list can be empty.",
+    )
+    ocpu_count: Optional[float] = Field(
+        None,
+        description="The number of OCPU cores to enable on the cloud VM cluster. Only 1 decimal place is allowed for the fractional part.",
+    )
+    scan_dns_name: Optional[Any] = Field(
+        None,
+        description="The FQDN of the DNS record for the SCAN IP addresses that are associated with the cloud VM cluster.",
+    )
+    scan_dns_record_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the DNS record for the SCAN IP addresses that are associated with the cloud VM cluster.",
+    )
+    scan_ip_ids: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Single Client Access Name (SCAN) IP addresses associated with the cloud VM cluster. SCAN IP addresses are typically used for load balancing and are not assigned to any interface. Oracle Clusterware directs the requests to the appropriate nodes in the cluster. **Note:** For a single-node DB system, this list is empty.",
+    )
+    scan_listener_port_tcp: Optional[Any] = Field(
+        None,
+        description="The TCP Single Client Access Name (SCAN) port. The default port is 1521.",
+    )
+    scan_listener_port_tcp_ssl: Optional[Any] = Field(
+        None,
+        description="The TCPS Single Client Access Name (SCAN) port. The default port is 2484.",
+    )
+    security_attributes: Optional[Any] = Field(
+        None,
+        description='Security Attributes for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__. Example: `{"Oracle-ZPR": {"MaxEgressCount": {"value": "42", "mode": "audit"}}}`',
+    )
+    shape: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the shape of this CloudVmCluster. The model name of the Exadata hardware running the cloud VM cluster.",
+    )
+    ssh_public_keys: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the ssh_public_keys of this CloudVmCluster. The public key portion of one or more key pairs used for SSH access to the cloud VM cluster.",
+    )
+    storage_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The storage allocation for the disk group, in gigabytes (GB).",
+    )
+    subnet_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the subnet_id of this CloudVmCluster. The `OCID`__ of the subnet associated with the cloud VM cluster. **Subnet Restrictions:** - For Exadata and virtual machine 2-node RAC systems, do not use a subnet that overlaps with 192.168.128.0/20. These subnets are used by the Oracle Clusterware private interconnect on the database instance. Specifying an overlapping subnet will cause the private interconnect to malfunction. This restriction applies to both the client subnet and backup subnet.",
+    )
+    subscription_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the subscription with which resource needs to be associated with.",
+    )
+    system_tags: Optional[Any] = Field(
+        None,
+        description="System tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    system_version: Optional[Any] = Field(
+        None,
+        description="Operating system version of the image.",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time that the cloud VM cluster was created.",
+    )
+    time_zone: Optional[Any] = Field(
+        None,
+        description="The time zone of the cloud VM cluster. For details, see `Exadata Infrastructure Time Zones`__.",
+    )
+    vip_ids: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the virtual IP (VIP) addresses associated with the cloud VM cluster. The Cluster Ready Services (CRS) creates and maintains one VIP address for each node in the Exadata Cloud Service instance to enable failover. If one node fails, the VIP is reassigned to another active node in the cluster. **Note:** For a single-node DB system, this list is empty.",
+    )
+    zone_id: Optional[Any] = Field(
+        None,
+        description="The OCID of the zone the cloud VM cluster is associated with.",
+    )
+
+
+def map_cloudvmcluster(
+    o: oci.database.models.CloudVmCluster, fields: Optional[list[str]] = None
+) -> CloudVmCluster | None:
+    """Map oci.database.models.CloudVmCluster → CloudVmCluster Pydantic model."""
+    return map_model(CloudVmCluster, o, fields)
+
+
+class ExadataIormConfig(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.ExadataIormConfig."""
+
+    db_plans: Optional[Any] = Field(
+        None,
+        description="An array of IORM settings for all the database in the Exadata DB system.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current `lifecycleState`.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='The current state of IORM configuration for the Exadata DB system. Allowed values for this property are: "BOOTSTRAPPING", "ENABLED", "DISABLED", "UPDATING", "FAILED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    objective: Optional[Any] = Field(
+        None,
+        description='The current value for the IORM objective. The default is `AUTO`. Allowed values for this property are: "LOW_LATENCY", "HIGH_THROUGHPUT", "BALANCED", "AUTO", "BASIC", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+
+
+def map_exadataiormconfig(
+    o: oci.database.models.ExadataIormConfig,
+    fields: Optional[list[str]] = None,
+) -> ExadataIormConfig | None:
+    """Map oci.database.models.ExadataIormConfig → ExadataIormConfig Pydantic model."""
+    return map_model(ExadataIormConfig, o, fields)
+
+
+class DbServer(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.DbServer."""
+
+    autonomous_virtual_machine_ids: Optional[Any] = Field(
+        None,
+        description="The list of `OCIDs`__ of the Autonomous Virtual Machines associated with the Db server.",
+    )
+    autonomous_vm_cluster_ids: Optional[Any] = Field(
+        None,
+        description="The list of `OCIDs`__ of the Autonomous VM Clusters associated with the Db server.",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the compartment.",
+    )
+    compute_model: Optional[Any] = Field(
+        None,
+        description="The compute model of the Autonomous Database. This is required if using the `computeCount` parameter. If using `cpuCoreCount` then it is an error to specify `computeModel` to a non-null value. ECPU compute model is the recommended model and OCPU compute model is legacy. Allowed values for this property are: \"ECPU\", \"OCPU\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    cpu_core_count: Optional[Any] = Field(
+        None,
+        description="The number of CPU cores enabled on the Db server.",
+    )
+    db_node_ids: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Db nodes associated with the Db server.",
+    )
+    db_node_storage_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The allocated local node storage in GBs on the Db server.",
+    )
+    db_server_patching_details: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="The user-friendly name for the Db server. The name does not need to be unique.",
+    )
+    exadata_infrastructure_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Exadata infrastructure.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Db server.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='The current state of the Db server. Allowed values for this property are: "CREATING", "AVAILABLE", "UNAVAILABLE", "DELETING", "DELETED", "MAINTENANCE_IN_PROGRESS", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    max_cpu_count: Optional[Any] = Field(
+        None,
+        description="The total number of CPU cores available.",
+    )
+    max_db_node_storage_in_gbs: Optional[Any] = Field(
+        None,
+        description="The total local node storage available in GBs.",
+    )
+    max_memory_in_gbs: Optional[Any] = Field(
+        None,
+        description="The total memory available in GBs.",
+    )
+    memory_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The allocated memory in GBs on the Db server.",
+    )
+    shape: Optional[Any] = Field(
+        None,
+        description="The shape of the Db server. The shape determines the amount of CPU, storage, and memory resources available.",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time that the Db Server was created.",
+    )
+    vm_cluster_ids: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the VM Clusters associated with the Db server.",
+    )
+
+
+def map_dbserver(
+    o: oci.database.models.DbServer, fields: Optional[list[str]] = None
+) -> DbServer | None:
+    """Map oci.database.models.DbServer → DbServer Pydantic model."""
+    return map_model(DbServer, o, fields)
+
+
+class ExadataInfrastructure(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.ExadataInfrastructure."""
+
+    activated_storage_count: Optional[Any] = Field(
+        None,
+        description="The requested number of additional storage servers activated for the Exadata infrastructure.",
+    )
+    additional_compute_count: Optional[Any] = Field(
+        None,
+        description="The requested number of additional compute servers for the Exadata infrastructure.",
+    )
+    additional_compute_system_model: Optional[Any] = Field(
+        None,
+        description='Oracle Exadata System Model specification. The system model determines the amount of compute or storage server resources available for use. For more information, please see [System and Shape Configuration Options] ( Allowed values for this property are: "X7", "X8", "X8M", "X9M", "X10M", "X11M", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    additional_storage_count: Optional[Any] = Field(
+        None,
+        description="The requested number of additional storage servers for the Exadata infrastructure.",
+    )
+    admin_network_cidr: Optional[Any] = Field(
+        None,
+        description="The CIDR block for the Exadata administration network.",
+    )
+    availability_domain: Optional[Any] = Field(
+        None,
+        description="The name of the availability domain that the Exadata infrastructure is located in.",
+    )
+    cloud_control_plane_server1: Optional[Any] = Field(
+        None,
+        description="The IP address for the first control plane server.",
+    )
+    cloud_control_plane_server2: Optional[Any] = Field(
+        None,
+        description="The IP address for the second control plane server.",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this ExadataInfrastructure. The `OCID`__ of the compartment.",
+    )
+    compute_count: Optional[Any] = Field(
+        None,
+        description="The number of compute servers for the Exadata infrastructure.",
+    )
+    compute_model: Optional[Any] = Field(
+        None,
+        description="The compute model of the Autonomous Database. This is required if using the `computeCount` parameter. If using `cpuCoreCount` then it is an error to specify `computeModel` to a non-null value. ECPU compute model is the recommended model and OCPU compute model is legacy. Allowed values for this property are: \"ECPU\", \"OCPU\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    contacts: Optional[Any] = Field(
+        None,
+        description="The list of contacts for the Exadata infrastructure.",
+    )
+    corporate_proxy: Optional[Any] = Field(
+        None,
+        description="The corporate network proxy for access to the control plane network.",
+    )
+    cpus_enabled: Optional[Any] = Field(
+        None,
+        description="The number of enabled CPU cores.",
+    )
+    csi_number: Optional[Any] = Field(
+        None,
+        description="The CSI Number of the Exadata infrastructure.",
+    )
+    data_storage_size_in_tbs: Optional[float] = Field(
+        None,
+        description="Size, in terabytes, of the DATA disk group.",
+    )
+    database_server_type: Optional[Any] = Field(
+        None,
+        description="The database server type of the Exadata infrastructure.",
+    )
+    db_node_storage_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The local node storage allocated in GBs.",
+    )
+    db_server_version: Optional[Any] = Field(
+        None,
+        description="The software version of the database servers (dom0) in the Exadata infrastructure.",
+    )
+    defined_file_system_configurations: Optional[Any] = Field(
+        None,
+        description="Details of the file system configuration of the Exadata infrastructure.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this ExadataInfrastructure. The user-friendly name for the Exadata Cloud@Customer infrastructure. The name does not need to be unique.",
+    )
+    dns_server: Optional[Any] = Field(
+        None,
+        description="The list of DNS server IP addresses. Maximum of 3 allowed.",
+    )
+    exascale_config: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    gateway: Optional[Any] = Field(
+        None,
+        description="The gateway for the control plane network.",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this ExadataInfrastructure. The `OCID`__ of the Exadata infrastructure.",
+    )
+    infini_band_network_cidr: Optional[Any] = Field(
+        None,
+        description="The CIDR block for the Exadata InfiniBand interconnect.",
+    )
+    is_cps_offline_report_enabled: Optional[Any] = Field(
+        None,
+        description="Indicates whether cps offline diagnostic report is enabled for this Exadata infrastructure. This will allow a customer to quickly check status themselves and fix problems on their end, saving time and frustration for both Oracle and the customer when they find the CPS in a disconnected state.You can enable offline diagnostic report during Exadata infrastructure provisioning. You can also disable or enable it at any time using the UpdateExadatainfrastructure API.",
+    )
+    is_multi_rack_deployment: Optional[Any] = Field(
+        None,
+        description="Indicates if deployment is Multi-Rack or not.",
+    )
+    is_scheduling_policy_associated: Optional[Any] = Field(
+        None,
+        description="If true, the infrastructure is using granular maintenance scheduling preference.",
+    )
+    last_maintenance_run_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the last maintenance run.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this ExadataInfrastructure. The current lifecycle state of the Exadata infrastructure. Allowed values for this property are: "CREATING", "REQUIRES_ACTIVATION", "ACTIVATING", "ACTIVE", "ACTIVATION_FAILED", "FAILED", "UPDATING", "DELETING", "DELETED", "DISCONNECTED", "MAINTENANCE_IN_PROGRESS", "WAITING_FOR_CONNECTIVITY", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    maintenance_slo_status: Optional[Any] = Field(
+        None,
+        description="A field to capture ‘Maintenance SLO Status’ for the Exadata infrastructure with values ‘OK’, ‘DEGRADED’. Default is ‘OK’ when the infrastructure is provisioned. Allowed values for this property are: \"OK\", \"DEGRADED\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    maintenance_window: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    max_cpu_count: Optional[Any] = Field(
+        None,
+        description="The total number of CPU cores available.",
+    )
+    max_data_storage_in_t_bs: Optional[float] = Field(
+        None,
+        description="The total available DATA disk group size.",
+    )
+    max_db_node_storage_in_g_bs: Optional[Any] = Field(
+        None,
+        description="The total local node storage available in GBs.",
+    )
+    max_memory_in_gbs: Optional[Any] = Field(
+        None,
+        description="The total memory available in GBs.",
+    )
+    memory_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The memory allocated in GBs.",
+    )
+    monthly_db_server_version: Optional[Any] = Field(
+        None,
+        description="The monthly software version of the database servers (dom0) in the Exadata infrastructure.",
+    )
+    multi_rack_configuration_file: Optional[Any] = Field(
+        None,
+        description="The base64 encoded Multi-Rack configuration json file.",
+    )
+    netmask: Optional[Any] = Field(
+        None,
+        description="The netmask for the control plane network.",
+    )
+    network_bonding_mode_details: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    next_maintenance_run_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the next maintenance run.",
+    )
+    ntp_server: Optional[Any] = Field(
+        None,
+        description="The list of NTP server IP addresses. Maximum of 3 allowed.",
+    )
+    rack_serial_number: Optional[Any] = Field(
+        None,
+        description="The serial number for the Exadata infrastructure.",
+    )
+    shape: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the shape of this ExadataInfrastructure. The shape of the Exadata infrastructure. The shape determines the amount of CPU, storage, and memory resources allocated to the instance.",
+    )
+    storage_count: Optional[Any] = Field(
+        None,
+        description="The number of Exadata storage servers for the Exadata infrastructure.",
+    )
+    storage_server_type: Optional[Any] = Field(
+        None,
+        description="The storage server type of the Exadata infrastructure.",
+    )
+    storage_server_version: Optional[Any] = Field(
+        None,
+        description="The software version of the storage servers (cells) in the Exadata infrastructure.",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time the Exadata infrastructure was created.",
+    )
+    time_zone: Optional[Any] = Field(
+        None,
+        description="The time zone of the Exadata infrastructure. For details, see `Exadata Infrastructure Time Zones`__.",
+    )
+
+
+def map_exadatainfrastructure(
+    o: oci.database.models.ExadataInfrastructure,
+    fields: Optional[list[str]] = None,
+) -> ExadataInfrastructure | None:
+    """Map oci.database.models.ExadataInfrastructure → ExadataInfrastructure Pydantic model."""
+    return map_model(ExadataInfrastructure, o, fields)
+
+
+class OCPUs(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.OCPUs."""
+
+    by_workload_type: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    consumed_cpu: Optional[float] = Field(
+        None,
+        description="The total number of consumed OCPUs in the Autonomous Exadata Infrastructure instance.",
+    )
+    total_cpu: Optional[float] = Field(
+        None,
+        description="The total number of OCPUs in the Autonomous Exadata Infrastructure instance.",
+    )
+
+
+def map_ocpus(
+    o: oci.database.models.OCPUs, fields: Optional[list[str]] = None
+) -> OCPUs | None:
+    """Map oci.database.models.OCPUs → OCPUs Pydantic model."""
+    return map_model(OCPUs, o, fields)
+
+
+class ExadataInfrastructureUnAllocatedResources(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.ExadataInfrastructureUnAllocatedResources."""
+
+    autonomous_vm_clusters: Optional[Any] = Field(
+        None,
+        description="The list of Autonomous VM Clusters on the Infra and their associated unallocated resources details",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this ExadataInfrastructureUnAllocatedResources. The user-friendly name for the Exadata Cloud@Customer infrastructure. The name does not need to be unique.",
+    )
+    exadata_storage_in_tbs: Optional[float] = Field(
+        None,
+        description="Total unallocated exadata storage in the infrastructure in TBs.",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this ExadataInfrastructureUnAllocatedResources. The `OCID`__ of the Exadata infrastructure.",
+    )
+    local_storage_in_gbs: Optional[Any] = Field(
+        None,
+        description="The minimum amount of un allocated storage that is available across all nodes in the infrastructure.",
+    )
+    memory_in_gbs: Optional[Any] = Field(
+        None,
+        description="The minimum amount of un allocated memory that is available across all nodes in the infrastructure.",
+    )
+    ocpus: Optional[Any] = Field(
+        None,
+        description="The minimum amount of un allocated ocpus that is available across all nodes in the infrastructure.",
+    )
+
+
+def map_exadatainfrastructureunallocatedresources(
+    o: oci.database.models.ExadataInfrastructureUnAllocatedResources,
+    fields: Optional[list[str]] = None,
+) -> ExadataInfrastructureUnAllocatedResources | None:
+    """Map oci.database.models.ExadataInfrastructureUnAllocatedResources → ExadataInfrastructureUnAllocatedResources Pydantic model."""
+    return map_model(ExadataInfrastructureUnAllocatedResources, o, fields)
+
+
+class ExadbVmCluster(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.ExadbVmCluster."""
+
+    availability_domain: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the availability_domain of this ExadbVmCluster. The name of the availability domain in which the Exadata VM cluster on Exascale Infrastructure is located.",
+    )
+    backup_network_nsg_ids: Optional[Any] = Field(
+        None,
+        description="A list of the `OCIDs`__ of the network security groups (NSGs) that the backup network of this DB system belongs to. Setting this to an empty array after the list is created removes the resource from all NSGs. For more information about NSGs, see `Security Rules`__. Applicable only to Exadata systems.",
+    )
+    backup_subnet_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the backup_subnet_id of this ExadbVmCluster. The `OCID`__ of the backup network subnet associated with the Exadata VM cluster on Exascale Infrastructure.",
+    )
+    cluster_name: Optional[Any] = Field(
+        None,
+        description="The cluster name for Exadata VM cluster on Exascale Infrastructure. The cluster name must begin with an alphabetic character, and may contain hyphens (-). Underscores (_) are not permitted. The cluster name can be no longer than 11 characters and is not case sensitive.",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this ExadbVmCluster. The `OCID`__ of the compartment.",
+    )
+    data_collection_options: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this ExadbVmCluster. The user-friendly name for the Exadata VM cluster on Exascale Infrastructure. The name does not need to be unique.",
+    )
+    domain: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the domain of this ExadbVmCluster. A domain name used for the Exadata VM cluster on Exascale Infrastructure. If the Oracle-provided internet and VCN resolver is enabled for the specified subnet, then the domain name for the subnet is used (do not provide one). Otherwise, provide a valid DNS domain name. Hyphens (-) are not permitted. Applies to Exadata Database Service on Exascale Infrastructure only.",
+    )
+    enabled_e_cpu_count: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the enabled_e_cpu_count of this ExadbVmCluster. The number of ECPUs to enable for an Exadata VM cluster on Exascale Infrastructure.",
+    )
+    exascale_db_storage_vault_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the exascale_db_storage_vault_id of this ExadbVmCluster. The `OCID`__ of the Exadata Database Storage Vault.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    gi_version: Optional[Any] = Field(
+        None,
+        description="A valid Oracle Grid Infrastructure (GI) software version.",
+    )
+    grid_image_id: Optional[Any] = Field(
+        None,
+        description="Grid Setup will be done using this grid image id. The grid image id can be extracted from 1. Obtain the supported major versions using API /20160918/giVersions?compartmentId=<compartmentId>&shape=EXADB_XS&availabilityDomain=<AD name> 2. Replace {version} with one of the supported major versions and obtain the supported minor versions using API /20160918/giVersions/{version}/minorVersions?compartmentId=<compartmentId>&shapeFamily=EXADB_XS&availabilityDomain=<AD name>",
+    )
+    grid_image_type: Optional[Any] = Field(
+        None,
+        description="The type of Grid Image Allowed values for this property are: \"RELEASE_UPDATE\", \"CUSTOM_IMAGE\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    hostname: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the hostname of this ExadbVmCluster. The hostname for the Exadata VM cluster on Exascale Infrastructure. The hostname must begin with an alphabetic character, and can contain alphanumeric characters and hyphens (-). For Exadata systems, the maximum length of the hostname is 12 characters. The maximum length of the combined hostname and domain is 63 characters. **Note:** The hostname must be unique within the subnet. If it is not unique, then the Exadata VM cluster on Exascale Infrastructure will fail to provision.",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this ExadbVmCluster. The `OCID`__ of the Exadata VM cluster on Exascale Infrastructure.",
+    )
+    iorm_config_cache: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    last_update_history_entry_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the last maintenance update history entry. This value is updated when a maintenance update starts.",
+    )
+    license_model: Optional[Any] = Field(
+        None,
+        description="The Oracle license model that applies to the Exadata VM cluster on Exascale Infrastructure. The default is BRING_YOUR_OWN_LICENSE. Allowed values for this property are: \"LICENSE_INCLUDED\", \"BRING_YOUR_OWN_LICENSE\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this ExadbVmCluster. The current state of the Exadata VM cluster on Exascale Infrastructure. Allowed values for this property are: "PROVISIONING", "AVAILABLE", "UPDATING", "TERMINATING", "TERMINATED", "FAILED", "MAINTENANCE_IN_PROGRESS", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    listener_port: Optional[Any] = Field(
+        None,
+        description="The port number configured for the listener on the Exadata VM cluster on Exascale Infrastructure.",
+    )
+    memory_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The memory that you want to be allocated in GBs. Memory is calculated based on 11 GB per VM core reserved.",
+    )
+    node_count: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the node_count of this ExadbVmCluster. The number of nodes in the Exadata VM cluster on Exascale Infrastructure.",
+    )
+    nsg_ids: Optional[Any] = Field(
+        None,
+        description="The list of `OCIDs`__ for the network security groups (NSGs) to which this resource belongs. Setting this to an empty list removes all resources from all NSGs. For more information about NSGs, see `Security Rules`__. **NsgIds restrictions:** - A network security group (NSG) is optional for Autonomous Databases with private access. The nsgIds list can be empty.",
+    )
+    private_zone_id: Optional[Any] = Field(
+        None,
+        description="The private zone ID in which you want DNS records to be created.",
+    )
+    scan_dns_name: Optional[Any] = Field(
+        None,
+        description="The FQDN of the DNS record for the SCAN IP addresses that are associated with the Exadata VM cluster on Exascale Infrastructure.",
+    )
+    scan_dns_record_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the DNS record for the SCAN IP addresses that are associated with the Exadata VM cluster on Exascale Infrastructure.",
+    )
+    scan_ip_ids: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Single Client Access Name (SCAN) IP addresses associated with the Exadata VM cluster on Exascale Infrastructure. SCAN IP addresses are typically used for load balancing and are not assigned to any interface. Oracle Clusterware directs the requests to the appropriate nodes in the cluster. **Note:** For a single-node DB system, this list is empty.",
+    )
+    scan_listener_port_tcp: Optional[Any] = Field(
+        None,
+        description="The TCP Single Client Access Name (SCAN) port. The default port is 1521.",
+    )
+    scan_listener_port_tcp_ssl: Optional[Any] = Field(
+        None,
+        description="The Secured Communication (TCPS) protocol Single Client Access Name (SCAN) port. The default port is 2484.",
+    )
+    security_attributes: Optional[Any] = Field(
+        None,
+        description='Security Attributes for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__. Example: `{"Oracle-ZPR": {"MaxEgressCount": {"value": "42", "mode": "audit"}}}`',
+    )
+    shape: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the shape of this ExadbVmCluster. The shape of the Exadata VM cluster on Exascale Infrastructure resource",
+    )
+    snapshot_file_system_storage: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    ssh_public_keys: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the ssh_public_keys of this ExadbVmCluster. The public key portion of one or more key pairs used for SSH access to the Exadata VM cluster on Exascale Infrastructure.",
+    )
+    subnet_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the subnet_id of this ExadbVmCluster. The `OCID`__ of the subnet associated with the Exadata VM cluster on Exascale Infrastructure.",
+    )
+    system_tags: Optional[Any] = Field(
+        None,
+        description="System tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    system_version: Optional[Any] = Field(
+        None,
+        description="Operating system version of the image.",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time that the Exadata VM cluster on Exascale Infrastructure was created.",
+    )
+    time_zone: Optional[Any] = Field(
+        None,
+        description="The time zone to use for the Exadata VM cluster on Exascale Infrastructure. For details, see `Time Zones`__.",
+    )
+    total_e_cpu_count: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the total_e_cpu_count of this ExadbVmCluster. The number of Total ECPUs for an Exadata VM cluster on Exascale Infrastructure.",
+    )
+    total_file_system_storage: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    vip_ids: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the virtual IP (VIP) addresses associated with the Exadata VM cluster on Exascale Infrastructure. The Cluster Ready Services (CRS) creates and maintains one VIP address for each node in the Exadata Cloud Service instance to enable failover. If one node fails, then the VIP is reassigned to another active node in the cluster.",
+    )
+    vm_file_system_storage: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the vm_file_system_storage of this ExadbVmCluster.",
+    )
+    zone_id: Optional[Any] = Field(
+        None,
+        description="The OCID of the zone with which the Exadata VM cluster on Exascale Infrastructure is associated.",
+    )
+
+
+def map_exadbvmcluster(
+    o: oci.database.models.ExadbVmCluster, fields: Optional[list[str]] = None
+) -> ExadbVmCluster | None:
+    """Map oci.database.models.ExadbVmCluster → ExadbVmCluster Pydantic model."""
+    return map_model(ExadbVmCluster, o, fields)
+
+
+class ExadbVmClusterUpdate(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.ExadbVmClusterUpdate."""
+
+    available_actions: Optional[Any] = Field(
+        None,
+        description='The possible actions performed by the update operation on the infrastructure components. Allowed values for items in this list are: "ROLLING_APPLY", "NON_ROLLING_APPLY", "PRECHECK", "ROLLBACK", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    description: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the description of this ExadbVmClusterUpdate. Details of the maintenance update package.",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this ExadbVmClusterUpdate. The `OCID`__ of the maintenance update.",
+    )
+    last_action: Optional[Any] = Field(
+        None,
+        description='The previous update action performed. Allowed values for this property are: "ROLLING_APPLY", "NON_ROLLING_APPLY", "PRECHECK", "ROLLBACK", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Descriptive text providing additional details about the lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='The current state of the maintenance update. Dependent on value of `lastAction`. Allowed values for this property are: "AVAILABLE", "SUCCESS", "IN_PROGRESS", "FAILED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    time_released: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the time_released of this ExadbVmClusterUpdate. The date and time the maintenance update was released.",
+    )
+    update_type: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the update_type of this ExadbVmClusterUpdate. The type of cloud VM cluster maintenance update. Allowed values for this property are: "GI_UPGRADE", "GI_PATCH", "OS_UPDATE", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    version: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the version of this ExadbVmClusterUpdate. The version of the maintenance update package.",
+    )
+
+
+def map_exadbvmclusterupdate(
+    o: oci.database.models.ExadbVmClusterUpdate,
+    fields: Optional[list[str]] = None,
+) -> ExadbVmClusterUpdate | None:
+    """Map oci.database.models.ExadbVmClusterUpdate → ExadbVmClusterUpdate Pydantic model."""
+    return map_model(ExadbVmClusterUpdate, o, fields)
+
+
+class ExadbVmClusterUpdateHistoryEntry(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.ExadbVmClusterUpdateHistoryEntry."""
+
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this ExadbVmClusterUpdateHistoryEntry. The `OCID`__ of the maintenance update history entry.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Descriptive text providing additional details about the lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this ExadbVmClusterUpdateHistoryEntry. The current lifecycle state of the maintenance update operation. Allowed values for this property are: "IN_PROGRESS", "SUCCEEDED", "FAILED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    time_completed: Optional[Any] = Field(
+        None,
+        description="The date and time when the maintenance update action completed.",
+    )
+    time_started: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the time_started of this ExadbVmClusterUpdateHistoryEntry. The date and time when the maintenance update action started.",
+    )
+    update_action: Optional[Any] = Field(
+        None,
+        description='The update action. Allowed values for this property are: "ROLLING_APPLY", "NON_ROLLING_APPLY", "PRECHECK", "ROLLBACK", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    update_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the update_id of this ExadbVmClusterUpdateHistoryEntry. The `OCID`__ of the maintenance update.",
+    )
+    update_type: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the update_type of this ExadbVmClusterUpdateHistoryEntry. The type of cloud VM cluster maintenance update. Allowed values for this property are: "GI_UPGRADE", "GI_PATCH", "OS_UPDATE", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    version: Optional[Any] = Field(
+        None,
+        description="The version of the maintenance update package.",
+    )
+
+
+def map_exadbvmclusterupdatehistoryentry(
+    o: oci.database.models.ExadbVmClusterUpdateHistoryEntry,
+    fields: Optional[list[str]] = None,
+) -> ExadbVmClusterUpdateHistoryEntry | None:
+    """Map oci.database.models.ExadbVmClusterUpdateHistoryEntry → ExadbVmClusterUpdateHistoryEntry Pydantic model."""
+    return map_model(ExadbVmClusterUpdateHistoryEntry, o, fields)
+
+
+class ExascaleDbStorageVault(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.ExascaleDbStorageVault."""
+
+    additional_flash_cache_in_percent: Optional[Any] = Field(
+        None,
+        description="The size of additional Flash Cache in percentage of High Capacity database storage.",
+    )
+    availability_domain: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the availability_domain of this ExascaleDbStorageVault. The name of the availability domain in which the Exadata Database Storage Vault is located.",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this ExascaleDbStorageVault. The `OCID`__ of the compartment.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    description: Optional[Any] = Field(
+        None,
+        description="Exadata Database Storage Vault description.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this ExascaleDbStorageVault. The user-friendly name for the Exadata Database Storage Vault. The name does not need to be unique.",
+    )
+    exadata_infrastructure_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Exadata infrastructure.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    high_capacity_database_storage: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the high_capacity_database_storage of this ExascaleDbStorageVault.",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this ExascaleDbStorageVault. The `OCID`__ of the Exadata Database Storage Vault.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this ExascaleDbStorageVault. The current state of the Exadata Database Storage Vault. Allowed values for this property are: "PROVISIONING", "AVAILABLE", "UPDATING", "TERMINATING", "TERMINATED", "FAILED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    system_tags: Optional[Any] = Field(
+        None,
+        description="System tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time that the Exadata Database Storage Vault was created.",
+    )
+    time_zone: Optional[Any] = Field(
+        None,
+        description="The time zone that you want to use for the Exadata Database Storage Vault. For details, see `Time Zones`__.",
+    )
+    vm_cluster_count: Optional[Any] = Field(
+        None,
+        description="The number of Exadata VM clusters used the Exadata Database Storage Vault.",
+    )
+    vm_cluster_ids: Optional[Any] = Field(
+        None,
+        description="The List of Exadata VM cluster on Exascale Infrastructure `OCIDs`__ **Note:** If Exadata Database Storage Vault is not used for any Exadata VM cluster on Exascale Infrastructure, this list is empty.",
+    )
+
+
+def map_exascaledbstoragevault(
+    o: oci.database.models.ExascaleDbStorageVault,
+    fields: Optional[list[str]] = None,
+) -> ExascaleDbStorageVault | None:
+    """Map oci.database.models.ExascaleDbStorageVault → ExascaleDbStorageVault Pydantic model."""
+    return map_model(ExascaleDbStorageVault, o, fields)
+
+
+class VmCluster(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.VmCluster."""
+
+    availability_domain: Optional[Any] = Field(
+        None,
+        description="The name of the availability domain that the VM cluster is located in.",
+    )
+    cloud_automation_update_details: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the compartment.",
+    )
+    compute_model: Optional[Any] = Field(
+        None,
+        description="The compute model of the Autonomous Database. This is required if using the `computeCount` parameter. If using `cpuCoreCount` then it is an error to specify `computeModel` to a non-null value. ECPU compute model is the recommended model and OCPU compute model is legacy. Allowed values for this property are: \"ECPU\", \"OCPU\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    cpus_enabled: Optional[Any] = Field(
+        None,
+        description="The number of enabled CPU cores.",
+    )
+    data_collection_options: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    data_storage_size_in_gbs: Optional[float] = Field(
+        None,
+        description="Size of the DATA disk group in GBs.",
+    )
+    data_storage_size_in_tbs: Optional[float] = Field(
+        None,
+        description="Size, in terabytes, of the DATA disk group.",
+    )
+    db_node_storage_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The local node storage allocated in GBs.",
+    )
+    db_servers: Optional[Any] = Field(
+        None,
+        description="The list of Db server.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="The user-friendly name for the Exadata Cloud@Customer VM cluster. The name does not need to be unique.",
+    )
+    exadata_infrastructure_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Exadata infrastructure.",
+    )
+    exascale_db_storage_vault_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Exadata Database Storage Vault.",
+    )
+    file_system_configuration_details: Optional[Any] = Field(
+        None,
+        description="Details of the file system configuration of the VM cluster.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    gi_software_image_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of a grid infrastructure software image. This is a database software image of the type `GRID_IMAGE`.",
+    )
+    gi_version: Optional[Any] = Field(
+        None,
+        description="The Oracle Grid Infrastructure software version for the VM cluster.",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the VM cluster.",
+    )
+    is_local_backup_enabled: Optional[Any] = Field(
+        None,
+        description="If true, database backup on local Exadata storage is configured for the VM cluster. If false, database backup on local Exadata storage is not available in the VM cluster.",
+    )
+    is_sparse_diskgroup_enabled: Optional[Any] = Field(
+        None,
+        description="If true, sparse disk group is configured for the VM cluster. If false, sparse disk group is not created.",
+    )
+    last_patch_history_entry_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the last patch history. This value is updated as soon as a patch operation starts.",
+    )
+    license_model: Optional[Any] = Field(
+        None,
+        description="The Oracle license model that applies to the VM cluster. The default is LICENSE_INCLUDED. Allowed values for this property are: \"LICENSE_INCLUDED\", \"BRING_YOUR_OWN_LICENSE\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='The current state of the VM cluster. Allowed values for this property are: "PROVISIONING", "AVAILABLE", "UPDATING", "TERMINATING", "TERMINATED", "FAILED", "MAINTENANCE_IN_PROGRESS", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    memory_size_in_gbs: Optional[Any] = Field(
+        None,
+        description="The memory allocated in GBs.",
+    )
+    ocpus_enabled: Optional[float] = Field(
+        None,
+        description="The number of enabled OCPU cores.",
+    )
+    shape: Optional[Any] = Field(
+        None,
+        description="The shape of the Exadata infrastructure. The shape determines the amount of CPU, storage, and memory resources allocated to the instance.",
+    )
+    ssh_public_keys: Optional[Any] = Field(
+        None,
+        description="The public key portion of one or more key pairs used for SSH access to the VM cluster.",
+    )
+    storage_management_type: Optional[Any] = Field(
+        None,
+        description="Specifies whether the type of storage management for the VM cluster is ASM or Exascale. Allowed values for this property are: \"ASM\", \"EXASCALE\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    system_version: Optional[Any] = Field(
+        None,
+        description="Operating system version of the image.",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time that the VM cluster was created.",
+    )
+    time_zone: Optional[Any] = Field(
+        None,
+        description="The time zone of the Exadata infrastructure. For details, see `Exadata Infrastructure Time Zones`__.",
+    )
+    vm_cluster_network_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the VM cluster network.",
+    )
+
+
+def map_vmcluster(
+    o: oci.database.models.VmCluster, fields: Optional[list[str]] = None
+) -> VmCluster | None:
+    """Map oci.database.models.VmCluster → VmCluster Pydantic model."""
+    return map_model(VmCluster, o, fields)
+
+
+class VmClusterNetwork(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.VmClusterNetwork."""
+
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the compartment.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="The user-friendly name for the VM cluster network. The name does not need to be unique.",
+    )
+    dns: Optional[Any] = Field(
+        None,
+        description="The list of DNS server IP addresses. Maximum of 3 allowed.",
+    )
+    dr_scans: Optional[Any] = Field(
+        None,
+        description="The SCAN details for DR network",
+    )
+    exadata_infrastructure_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Exadata infrastructure.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the VM cluster network.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='The current state of the VM cluster network. CREATING - The resource is being created REQUIRES_VALIDATION - The resource is created and may not be usable until it is validated. VALIDATING - The resource is being validated and not available to use. VALIDATED - The resource is validated and is available for consumption by VM cluster. VALIDATION_FAILED - The resource validation has failed and might require user input to be corrected. UPDATING - The resource is being updated and not available to use. ALLOCATED - The resource is is currently being used by VM cluster. TERMINATING - The resource is being deleted and not available to use. TERMINATED - The resource is deleted and unavailable. FAILED - The resource is in a failed state due to validation or other errors. NEEDS_ATTENTION - The resource is in needs attention state as some of it\'s child nodes are not validated and unusable by VM cluster. Allowed values for this property are: "CREATING", "REQUIRES_VALIDATION", "VALIDATING", "VALIDATED", "VALIDATION_FAILED", "UPDATING", "ALLOCATED", "TERMINATING", "TERMINATED", "FAILED", "NEEDS_ATTENTION", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    ntp: Optional[Any] = Field(
+        None,
+        description="The list of NTP server IP addresses. Maximum of 3 allowed.",
+    )
+    scans: Optional[Any] = Field(
+        None,
+        description="The SCAN details.",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time when the VM cluster network was created.",
+    )
+    vm_cluster_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the associated VM Cluster.",
+    )
+    vm_networks: Optional[Any] = Field(
+        None,
+        description="Details of the client and backup networks.",
+    )
+
+
+def map_vmclusternetwork(
+    o: oci.database.models.VmClusterNetwork,
+    fields: Optional[list[str]] = None,
+) -> VmClusterNetwork | None:
+    """Map oci.database.models.VmClusterNetwork → VmClusterNetwork Pydantic model."""
+    return map_model(VmClusterNetwork, o, fields)
+
+
+class VmClusterUpdate(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.VmClusterUpdate."""
+
+    available_actions: Optional[Any] = Field(
+        None,
+        description='The possible actions that can be performed using this maintenance update. Allowed values for items in this list are: "ROLLING_APPLY", "PRECHECK", "ROLLBACK", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    description: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the description of this VmClusterUpdate. Details of the maintenance update package.",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this VmClusterUpdate. The `OCID`__ of the maintenance update.",
+    )
+    last_action: Optional[Any] = Field(
+        None,
+        description='The update action performed most recently using this maintenance update. Allowed values for this property are: "ROLLING_APPLY", "PRECHECK", "ROLLBACK", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Descriptive text providing additional details about the lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='The current state of the maintenance update. Dependent on value of `lastAction`. Allowed values for this property are: "AVAILABLE", "SUCCESS", "IN_PROGRESS", "FAILED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    time_released: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the time_released of this VmClusterUpdate. The date and time the maintenance update was released.",
+    )
+    update_type: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the update_type of this VmClusterUpdate. The type of VM cluster maintenance update. Allowed values for this property are: "GI_UPGRADE", "GI_PATCH", "OS_UPDATE", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    version: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the version of this VmClusterUpdate. The version of the maintenance update package.",
+    )
+
+
+def map_vmclusterupdate(
+    o: oci.database.models.VmClusterUpdate,
+    fields: Optional[list[str]] = None,
+) -> VmClusterUpdate | None:
+    """Map oci.database.models.VmClusterUpdate → VmClusterUpdate Pydantic model."""
+    return map_model(VmClusterUpdate, o, fields)
+
+
+class VmClusterUpdateHistoryEntry(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.VmClusterUpdateHistoryEntry."""
+
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this VmClusterUpdateHistoryEntry. The `OCID`__ of the maintenance update history entry.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Descriptive text providing additional details about the lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this VmClusterUpdateHistoryEntry. The current lifecycle state of the maintenance update operation. Allowed values for this property are: "IN_PROGRESS", "SUCCEEDED", "FAILED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    time_completed: Optional[Any] = Field(
+        None,
+        description="The date and time when the maintenance update action completed.",
+    )
+    time_started: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the time_started of this VmClusterUpdateHistoryEntry. The date and time when the maintenance update action started.",
+    )
+    update_action: Optional[Any] = Field(
+        None,
+        description='The update action performed using this maintenance update. Allowed values for this property are: "ROLLING_APPLY", "PRECHECK", "ROLLBACK", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    update_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the update_id of this VmClusterUpdateHistoryEntry. The `OCID`__ of the maintenance update.",
+    )
+    update_type: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the update_type of this VmClusterUpdateHistoryEntry. The type of VM cluster maintenance update. Allowed values for this property are: "GI_UPGRADE", "GI_PATCH", "OS_UPDATE", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+
+
+def map_vmclusterupdatehistoryentry(
+    o: oci.database.models.VmClusterUpdateHistoryEntry,
+    fields: Optional[list[str]] = None,
+) -> VmClusterUpdateHistoryEntry | None:
+    """Map oci.database.models.VmClusterUpdateHistoryEntry → VmClusterUpdateHistoryEntry Pydantic model."""
+    return map_model(VmClusterUpdateHistoryEntry, o, fields)
@@ -0,0 +1,744 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+
+Pydantic models of the OCI Database service: external container, non-container and pluggable databases.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import oci
+from oracle.oci_database_mcp_server.models.base import OCIBaseModel, map_model
+from pydantic import Field
+
+
+class ExternalContainerDatabaseSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.ExternalContainerDatabaseSummary."""
+
+    character_set: Optional[Any] = Field(
+        None,
+        description="The character set of the external database.",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this ExternalContainerDatabaseSummary. The `OCID`__ of the compartment.",
+    )
+    database_configuration: Optional[Any] = Field(
+        None,
+        description="The Oracle Database configuration Allowed values for this property are: \"RAC\", \"SINGLE_INSTANCE\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    database_edition: Optional[Any] = Field(
+        None,
+        description='The Oracle Database edition. Allowed values for this property are: "STANDARD_EDITION", "ENTERPRISE_EDITION", "ENTERPRISE_EDITION_HIGH_PERFORMANCE", "ENTERPRISE_EDITION_EXTREME_PERFORMANCE", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    database_management_config: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    database_version: Optional[Any] = Field(
+        None,
+        description="The Oracle Database version.",
+    )
+    db_id: Optional[Any] = Field(
+        None,
+        description="The Oracle Database ID, which identifies an Oracle Database located outside of Oracle Cloud.",
+    )
+    db_packs: Optional[Any] = Field(
+        None,
+        description="The database packs licensed for the external Oracle Database.",
+    )
+    db_unique_name: Optional[Any] = Field(
+        None,
+        description="The `DB_UNIQUE_NAME` of the external database.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this ExternalContainerDatabaseSummary. The user-friendly name for the external database. The name does not have to be unique.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this ExternalContainerDatabaseSummary. The `OCID`__ of the Oracle Cloud Infrastructure external database resource.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this ExternalContainerDatabaseSummary. The current state of the Oracle Cloud Infrastructure external database resource. Allowed values for this property are: "PROVISIONING", "NOT_CONNECTED", "AVAILABLE", "UPDATING", "TERMINATING", "TERMINATED", "FAILED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    ncharacter_set: Optional[Any] = Field(
+        None,
+        description="The national character of the external database.",
+    )
+    stack_monitoring_config: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the time_created of this ExternalContainerDatabaseSummary. The date and time the database was created.",
+    )
+    time_zone: Optional[Any] = Field(
+        None,
+        description="The time zone of the external database. It is a time zone offset (a character type in the format '[+|-]TZH:TZM') or a time zone region name, depending on how the time zone value was specified when the database was created / last altered.",
+    )
+
+
+def map_externalcontainerdatabasesummary(
+    o: oci.database.models.ExternalContainerDatabaseSummary,
+    fields: Optional[list[str]] = None,
+) -> ExternalContainerDatabaseSummary | None:
+    """Map oci.database.models.ExternalContainerDatabaseSummary → ExternalContainerDatabaseSummary Pydantic model."""
+    return map_model(ExternalContainerDatabaseSummary, o, fields)
+
+
+class ExternalDatabaseConnectorSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.ExternalDatabaseConnectorSummary."""
+
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this ExternalDatabaseConnectorSummary. The `OCID`__ of the compartment.",
+    )
+    connection_status: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the connection_status of this ExternalDatabaseConnectorSummary. The status of connectivity to the external database.",
+    )
+    connector_type: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the connector_type of this ExternalDatabaseConnectorSummary. The type of connector used by the external database resource. Allowed values for this property are: \"MACS\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this ExternalDatabaseConnectorSummary. The user-friendly name for the :func:`create_external_database_connector_details`. The name does not have to be unique.",
+    )
+    external_database_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the external_database_id of this ExternalDatabaseConnectorSummary. The `OCID`__ of the external database resource.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this ExternalDatabaseConnectorSummary. The `OCID`__ of the :func:`create_external_database_connector_details`.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the lifecycle_state of this ExternalDatabaseConnectorSummary. The current lifecycle state of the external database connector resource.",
+    )
+    time_connection_status_last_updated: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the time_connection_status_last_updated of this ExternalDatabaseConnectorSummary. The date and time the `connectionStatus` of this external connector was last updated.",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the time_created of this ExternalDatabaseConnectorSummary. The date and time the external connector was created.",
+    )
+
+
+def map_externaldatabaseconnectorsummary(
+    o: oci.database.models.ExternalDatabaseConnectorSummary,
+    fields: Optional[list[str]] = None,
+) -> ExternalDatabaseConnectorSummary | None:
+    """Map oci.database.models.ExternalDatabaseConnectorSummary → ExternalDatabaseConnectorSummary Pydantic model."""
+    return map_model(ExternalDatabaseConnectorSummary, o, fields)
+
+
+class ExternalNonContainerDatabaseSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.ExternalNonContainerDatabaseSummary."""
+
+    character_set: Optional[Any] = Field(
+        None,
+        description="The character set of the external database.",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this ExternalNonContainerDatabaseSummary. The `OCID`__ of the compartment.",
+    )
+    database_configuration: Optional[Any] = Field(
+        None,
+        description="The Oracle Database configuration Allowed values for this property are: \"RAC\", \"SINGLE_INSTANCE\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    database_edition: Optional[Any] = Field(
+        None,
+        description='The Oracle Database edition. Allowed values for this property are: "STANDARD_EDITION", "ENTERPRISE_EDITION", "ENTERPRISE_EDITION_HIGH_PERFORMANCE", "ENTERPRISE_EDITION_EXTREME_PERFORMANCE", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    database_management_config: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    database_version: Optional[Any] = Field(
+        None,
+        description="The Oracle Database version.",
+    )
+    db_id: Optional[Any] = Field(
+        None,
+        description="The Oracle Database ID, which identifies an Oracle Database located outside of Oracle Cloud.",
+    )
+    db_packs: Optional[Any] = Field(
+        None,
+        description="The database packs licensed for the external Oracle Database.",
+    )
+    db_unique_name: Optional[Any] = Field(
+        None,
+        description="The `DB_UNIQUE_NAME` of the external database.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this ExternalNonContainerDatabaseSummary. The user-friendly name for the external database. The name does not have to be unique.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this ExternalNonContainerDatabaseSummary. The `OCID`__ of the Oracle Cloud Infrastructure external database resource.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this ExternalNonContainerDatabaseSummary. The current state of the Oracle Cloud Infrastructure external database resource. Allowed values for this property are: "PROVISIONING", "NOT_CONNECTED", "AVAILABLE", "UPDATING", "TERMINATING", "TERMINATED", "FAILED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    ncharacter_set: Optional[Any] = Field(
+        None,
+        description="The national character of the external database.",
+    )
+    operations_insights_config: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    stack_monitoring_config: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the time_created of this ExternalNonContainerDatabaseSummary. The date and time the database was created.",
+    )
+    time_zone: Optional[Any] = Field(
+        None,
+        description="The time zone of the external database. It is a time zone offset (a character type in the format '[+|-]TZH:TZM') or a time zone region name, depending on how the time zone value was specified when the database was created / last altered.",
+    )
+
+
+def map_externalnoncontainerdatabasesummary(
+    o: oci.database.models.ExternalNonContainerDatabaseSummary,
+    fields: Optional[list[str]] = None,
+) -> ExternalNonContainerDatabaseSummary | None:
+    """Map oci.database.models.ExternalNonContainerDatabaseSummary → ExternalNonContainerDatabaseSummary Pydantic model."""
+    return map_model(ExternalNonContainerDatabaseSummary, o, fields)
+
+
+class ExternalPluggableDatabaseSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.ExternalPluggableDatabaseSummary."""
+
+    character_set: Optional[Any] = Field(
+        None,
+        description="The character set of the external database.",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this ExternalPluggableDatabaseSummary. The `OCID`__ of the compartment.",
+    )
+    database_configuration: Optional[Any] = Field(
+        None,
+        description="The Oracle Database configuration Allowed values for this property are: \"RAC\", \"SINGLE_INSTANCE\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    database_edition: Optional[Any] = Field(
+        None,
+        description='The Oracle Database edition. Allowed values for this property are: "STANDARD_EDITION", "ENTERPRISE_EDITION", "ENTERPRISE_EDITION_HIGH_PERFORMANCE", "ENTERPRISE_EDITION_EXTREME_PERFORMANCE", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    database_management_config: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    database_version: Optional[Any] = Field(
+        None,
+        description="The Oracle Database version.",
+    )
+    db_id: Optional[Any] = Field(
+        None,
+        description="The Oracle Database ID, which identifies an Oracle Database located outside of Oracle Cloud.",
+    )
+    db_packs: Optional[Any] = Field(
+        None,
+        description="The database packs licensed for the external Oracle Database.",
+    )
+    db_unique_name: Optional[Any] = Field(
+        None,
+        description="The `DB_UNIQUE_NAME` of the external database.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this ExternalPluggableDatabaseSummary. The user-friendly name for the external database. The name does not have to be unique.",
+    )
+    external_container_database_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the external_container_database_id of this ExternalPluggableDatabaseSummary. The `OCID`__ of the :func:`create_external_container_database_details` that contains the specified :func:`create_external_pluggable_database_details` resource.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this ExternalPluggableDatabaseSummary. The `OCID`__ of the Oracle Cloud Infrastructure external database resource.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this ExternalPluggableDatabaseSummary. The current state of the Oracle Cloud Infrastructure external database resource. Allowed values for this property are: "PROVISIONING", "NOT_CONNECTED", "AVAILABLE", "UPDATING", "TERMINATING", "TERMINATED", "FAILED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    ncharacter_set: Optional[Any] = Field(
+        None,
+        description="The national character of the external database.",
+    )
+    operations_insights_config: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    source_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the the non-container database that was converted to a pluggable database to create this resource.",
+    )
+    stack_monitoring_config: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the time_created of this ExternalPluggableDatabaseSummary. The date and time the database was created.",
+    )
+    time_zone: Optional[Any] = Field(
+        None,
+        description="The time zone of the external database. It is a time zone offset (a character type in the format '[+|-]TZH:TZM') or a time zone region name, depending on how the time zone value was specified when the database was created / last altered.",
+    )
+
+
+def map_externalpluggabledatabasesummary(
+    o: oci.database.models.ExternalPluggableDatabaseSummary,
+    fields: Optional[list[str]] = None,
+) -> ExternalPluggableDatabaseSummary | None:
+    """Map oci.database.models.ExternalPluggableDatabaseSummary → ExternalPluggableDatabaseSummary Pydantic model."""
+    return map_model(ExternalPluggableDatabaseSummary, o, fields)
+
+
+class ExternalBackupJob(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.ExternalBackupJob."""
+
+    backup_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the backup_id of this ExternalBackupJob. The `OCID`__ of the associated backup resource.",
+    )
+    bucket_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the bucket_name of this ExternalBackupJob. The name of the Swift compartment bucket where the backup should be stored.",
+    )
+    provisioning: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the provisioning of this ExternalBackupJob. An indicator for the provisioning state of the resource. If `TRUE`, the resource is still being provisioned.",
+    )
+    swift_password: Optional[Any] = Field(
+        None,
+        description="The auth token to use for access to the Swift compartment bucket that will store the standalone backup. For information about auth tokens, see `Working with Auth Tokens`__.",
+    )
+    swift_path: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the swift_path of this ExternalBackupJob. The Swift path to use as a destination for the standalone backup.",
+    )
+    tag: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the tag of this ExternalBackupJob. The tag for RMAN to apply to the backup.",
+    )
+    user_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the user_name of this ExternalBackupJob. The Swift user name to use for transferring the standalone backup to the designated Swift compartment bucket.",
+    )
+
+
+def map_externalbackupjob(
+    o: oci.database.models.ExternalBackupJob,
+    fields: Optional[list[str]] = None,
+) -> ExternalBackupJob | None:
+    """Map oci.database.models.ExternalBackupJob → ExternalBackupJob Pydantic model."""
+    return map_model(ExternalBackupJob, o, fields)
+
+
+class ExternalContainerDatabase(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.ExternalContainerDatabase."""
+
+    character_set: Optional[Any] = Field(
+        None,
+        description="The character set of the external database.",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this ExternalContainerDatabase. The `OCID`__ of the compartment.",
+    )
+    database_configuration: Optional[Any] = Field(
+        None,
+        description="The Oracle Database configuration Allowed values for this property are: \"RAC\", \"SINGLE_INSTANCE\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    database_edition: Optional[Any] = Field(
+        None,
+        description='The Oracle Database edition. Allowed values for this property are: "STANDARD_EDITION", "ENTERPRISE_EDITION", "ENTERPRISE_EDITION_HIGH_PERFORMANCE", "ENTERPRISE_EDITION_EXTREME_PERFORMANCE", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    database_management_config: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    database_version: Optional[Any] = Field(
+        None,
+        description="The Oracle Database version.",
+    )
+    db_id: Optional[Any] = Field(
+        None,
+        description="The Oracle Database ID, which identifies an Oracle Database located outside of Oracle Cloud.",
+    )
+    db_packs: Optional[Any] = Field(
+        None,
+        description="The database packs licensed for the external Oracle Database.",
+    )
+    db_unique_name: Optional[Any] = Field(
+        None,
+        description="The `DB_UNIQUE_NAME` of the external database.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this ExternalContainerDatabase. The user-friendly name for the external database. The name does not have to be unique.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this ExternalContainerDatabase. The `OCID`__ of the Oracle Cloud Infrastructure external database resource.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this ExternalContainerDatabase. The current state of the Oracle Cloud Infrastructure external database resource. Allowed values for this property are: "PROVISIONING", "NOT_CONNECTED", "AVAILABLE", "UPDATING", "TERMINATING", "TERMINATED", "FAILED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    ncharacter_set: Optional[Any] = Field(
+        None,
+        description="The national character of the external database.",
+    )
+    stack_monitoring_config: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the time_created of this ExternalContainerDatabase. The date and time the database was created.",
+    )
+    time_zone: Optional[Any] = Field(
+        None,
+        description="The time zone of the external database. It is a time zone offset (a character type in the format '[+|-]TZH:TZM') or a time zone region name, depending on how the time zone value was specified when the database was created / last altered.",
+    )
+
+
+def map_externalcontainerdatabase(
+    o: oci.database.models.ExternalContainerDatabase,
+    fields: Optional[list[str]] = None,
+) -> ExternalContainerDatabase | None:
+    """Map oci.database.models.ExternalContainerDatabase → ExternalContainerDatabase Pydantic model."""
+    return map_model(ExternalContainerDatabase, o, fields)
+
+
+class ExternalDatabaseConnector(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.ExternalDatabaseConnector."""
+
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this ExternalDatabaseConnector. The `OCID`__ of the compartment.",
+    )
+    connection_status: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the connection_status of this ExternalDatabaseConnector. The status of connectivity to the external database.",
+    )
+    connector_type: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the connector_type of this ExternalDatabaseConnector. The type of connector used by the external database resource. Allowed values for this property are: \"MACS\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this ExternalDatabaseConnector. The user-friendly name for the :func:`create_external_database_connector_details`. The name does not have to be unique.",
+    )
+    external_database_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the external_database_id of this ExternalDatabaseConnector. The `OCID`__ of the external database resource.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this ExternalDatabaseConnector. The `OCID`__ of the :func:`create_external_database_connector_details`.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this ExternalDatabaseConnector. The current lifecycle state of the external database connector resource. Allowed values for this property are: "PROVISIONING", "AVAILABLE", "UPDATING", "TERMINATING", "TERMINATED", "FAILED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    time_connection_status_last_updated: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the time_connection_status_last_updated of this ExternalDatabaseConnector. The date and time the connectionStatus of this external connector was last updated.",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the time_created of this ExternalDatabaseConnector. The date and time the external connector was created.",
+    )
+
+
+def map_externaldatabaseconnector(
+    o: oci.database.models.ExternalDatabaseConnector,
+    fields: Optional[list[str]] = None,
+) -> ExternalDatabaseConnector | None:
+    """Map oci.database.models.ExternalDatabaseConnector → ExternalDatabaseConnector Pydantic model."""
+    return map_model(ExternalDatabaseConnector, o, fields)
+
+
+class ExternalNonContainerDatabase(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.ExternalNonContainerDatabase."""
+
+    character_set: Optional[Any] = Field(
+        None,
+        description="The character set of the external database.",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this ExternalNonContainerDatabase. The `OCID`__ of the compartment.",
+    )
+    database_configuration: Optional[Any] = Field(
+        None,
+        description="The Oracle Database configuration Allowed values for this property are: \"RAC\", \"SINGLE_INSTANCE\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    database_edition: Optional[Any] = Field(
+        None,
+        description='The Oracle Database edition. Allowed values for this property are: "STANDARD_EDITION", "ENTERPRISE_EDITION", "ENTERPRISE_EDITION_HIGH_PERFORMANCE", "ENTERPRISE_EDITION_EXTREME_PERFORMANCE", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    database_management_config: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    database_version: Optional[Any] = Field(
+        None,
+        description="The Oracle Database version.",
+    )
+    db_id: Optional[Any] = Field(
+        None,
+        description="The Oracle Database ID, which identifies an Oracle Database located outside of Oracle Cloud.",
+    )
+    db_packs: Optional[Any] = Field(
+        None,
+        description="The database packs licensed for the external Oracle Database.",
+    )
+    db_unique_name: Optional[Any] = Field(
+        None,
+        description="The `DB_UNIQUE_NAME` of the external database.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this ExternalNonContainerDatabase. The user-friendly name for the external database. The name does not have to be unique.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this ExternalNonContainerDatabase. The `OCID`__ of the Oracle Cloud Infrastructure external database resource.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this ExternalNonContainerDatabase. The current state of the Oracle Cloud Infrastructure external database resource. Allowed values for this property are: "PROVISIONING", "NOT_CONNECTED", "AVAILABLE", "UPDATING", "TERMINATING", "TERMINATED", "FAILED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    ncharacter_set: Optional[Any] = Field(
+        None,
+        description="The national character of the external database.",
+    )
+    operations_insights_config: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    stack_monitoring_config: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the time_created of this ExternalNonContainerDatabase. The date and time the database was created.",
+    )
+    time_zone: Optional[Any] = Field(
+        None,
+        description="The time zone of the external database. It is a time zone offset (a character type in the format '[+|-]TZH:TZM') or a time zone region name, depending on how the time zone value was specified when the database was created / last altered.",
+    )
+
+
+def map_externalnoncontainerdatabase(
+    o: oci.database.models.ExternalNonContainerDatabase,
+    fields: Optional[list[str]] = None,
+) -> ExternalNonContainerDatabase | None:
+    """Map oci.database.models.ExternalNonContainerDatabase → ExternalNonContainerDatabase Pydantic model."""
+    return map_model(ExternalNonContainerDatabase, o, fields)
+
+
+class ExternalPluggableDatabase(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.ExternalPluggableDatabase."""
+
+    character_set: Optional[Any] = Field(
+        None,
+        description="The character set of the external database.",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this ExternalPluggableDatabase. The `OCID`__ of the compartment.",
+    )
+    database_configuration: Optional[Any] = Field(
+        None,
+        description="The Oracle Database configuration Allowed values for this property are: \"RAC\", \"SINGLE_INSTANCE\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    database_edition: Optional[Any] = Field(
+        None,
+        description='The Oracle Database edition. Allowed values for this property are: "STANDARD_EDITION", "ENTERPRISE_EDITION", "ENTERPRISE_EDITION_HIGH_PERFORMANCE", "ENTERPRISE_EDITION_EXTREME_PERFORMANCE", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    database_management_config: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    database_version: Optional[Any] = Field(
+        None,
+        description="The Oracle Database version.",
+    )
+    db_id: Optional[Any] = Field(
+        None,
+        description="The Oracle Database ID, which identifies an Oracle Database located outside of Oracle Cloud.",
+    )
+    db_packs: Optional[Any] = Field(
+        None,
+        description="The database packs licensed for the external Oracle Database.",
+    )
+    db_unique_name: Optional[Any] = Field(
+        None,
+        description="The `DB_UNIQUE_NAME` of the external database.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this ExternalPluggableDatabase. The user-friendly name for the external database. The name does not have to be unique.",
+    )
+    external_container_database_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the external_container_database_id of this ExternalPluggableDatabase. The `OCID`__ of the :func:`create_external_container_database_details` that contains the specified :func:`create_external_pluggable_database_details` resource.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this ExternalPluggableDatabase. The `OCID`__ of the Oracle Cloud Infrastructure external database resource.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this ExternalPluggableDatabase. The current state of the Oracle Cloud Infrastructure external database resource. Allowed values for this property are: "PROVISIONING", "NOT_CONNECTED", "AVAILABLE", "UPDATING", "TERMINATING", "TERMINATED", "FAILED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    ncharacter_set: Optional[Any] = Field(
+        None,
+        description="The national character of the external database.",
+    )
+    operations_insights_config: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    source_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the the non-container database that was converted to a pluggable database to create this resource.",
+    )
+    stack_monitoring_config: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the time_created of this ExternalPluggableDatabase. The date and time the database was created.",
+    )
+    time_zone: Optional[Any] = Field(
+        None,
+        description="The time zone of the external database. It is a time zone offset (a character type in the format '[+|-]TZH:TZM') or a time zone region name, depending on how the time zone value was specified when the database was created / last altered.",
+    )
+
+
+def map_externalpluggabledatabase(
+    o: oci.database.models.ExternalPluggableDatabase,
+    fields: Optional[list[str]] = None,
+) -> ExternalPluggableDatabase | None:
+    """Map oci.database.models.ExternalPluggableDatabase → ExternalPluggableDatabase Pydantic model."""
+    return map_model(ExternalPluggableDatabase, o, fields)
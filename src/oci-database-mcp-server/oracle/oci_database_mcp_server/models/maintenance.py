@@ -0,0 +1,1642 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+
+Pydantic models of the OCI Database service: maintenance runs, patches, updates and scheduling policies.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import oci
+from oracle.oci_database_mcp_server.models.base import OCIBaseModel, map_model
+from pydantic import Field
+
+
+class UpdateSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.UpdateSummary."""
+
+    available_actions: Optional[Any] = Field(
+        None,
+        description='The possible actions performed by the update operation on the infrastructure components. Allowed values for items in this list are: "ROLLING_APPLY", "NON_ROLLING_APPLY", "PRECHECK", "ROLLBACK", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    description: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the description of this UpdateSummary. Details of the maintenance update package.",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this UpdateSummary. The `OCID`__ of the maintenance update.",
+    )
+    last_action: Optional[Any] = Field(
+        None,
+        description='The previous update action performed. Allowed values for this property are: "ROLLING_APPLY", "NON_ROLLING_APPLY", "PRECHECK", "ROLLBACK", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Descriptive text providing additional details about the lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='The current state of the maintenance update. Dependent on value of `lastAction`. Allowed values for this property are: "AVAILABLE", "SUCCESS", "IN_PROGRESS", "FAILED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    time_released: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the time_released of this UpdateSummary. The date and time the maintenance update was released.",
+    )
+    update_type: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the update_type of this UpdateSummary. The type of cloud VM cluster maintenance update. Allowed values for this property are: "GI_UPGRADE", "GI_PATCH", "OS_UPDATE", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    version: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the version of this UpdateSummary. The version of the maintenance update package.",
+    )
+
+
+def map_updatesummary(
+    o: oci.database.models.UpdateSummary, fields: Optional[list[str]] = None
+) -> UpdateSummary | None:
+    """Map oci.database.models.UpdateSummary → UpdateSummary Pydantic model."""
+    return map_model(UpdateSummary, o, fields)
+
+
+class PatchHistoryEntrySummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.PatchHistoryEntrySummary."""
+
+    action: Optional[Any] = Field(
+        None,
+        description="The action being performed or was completed. Allowed values for this property are: \"APPLY\", \"PRECHECK\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this PatchHistoryEntrySummary. The `OCID`__ of the patch history entry.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="A descriptive text associated with the lifecycleState. Typically contains additional displayable text.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this PatchHistoryEntrySummary. The current state of the action. Allowed values for this property are: "IN_PROGRESS", "SUCCEEDED", "FAILED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    patch_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the patch_id of this PatchHistoryEntrySummary. The `OCID`__ of the patch.",
+    )
+    patch_type: Optional[Any] = Field(
+        None,
+        description='The type of Patch operation. Allowed values for this property are: "OS", "DB", "GI", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    time_ended: Optional[Any] = Field(
+        None,
+        description="The date and time when the patch action completed",
+    )
+    time_started: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the time_started of this PatchHistoryEntrySummary. The date and time when the patch action started.",
+    )
+
+
+def map_patchhistoryentrysummary(
+    o: oci.database.models.PatchHistoryEntrySummary,
+    fields: Optional[list[str]] = None,
+) -> PatchHistoryEntrySummary | None:
+    """Map oci.database.models.PatchHistoryEntrySummary → PatchHistoryEntrySummary Pydantic model."""
+    return map_model(PatchHistoryEntrySummary, o, fields)
+
+
+class PatchSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.PatchSummary."""
+
+    available_actions: Optional[Any] = Field(
+        None,
+        description="Actions that can possibly be performed using this patch. Allowed values for items in this list are: \"APPLY\", \"PRECHECK\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    description: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the description of this PatchSummary. The text describing this patch package.",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this PatchSummary. The `OCID`__ of the patch.",
+    )
+    last_action: Optional[Any] = Field(
+        None,
+        description="Action that is currently being performed or was completed last. Allowed values for this property are: \"APPLY\", \"PRECHECK\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="A descriptive text associated with the lifecycleState. Typically can contain additional displayable text.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='The current state of the patch as a result of lastAction. Allowed values for this property are: "AVAILABLE", "SUCCESS", "IN_PROGRESS", "FAILED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    time_released: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the time_released of this PatchSummary. The date and time that the patch was released.",
+    )
+    version: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the version of this PatchSummary. The version of this patch package.",
+    )
+
+
+def map_patchsummary(
+    o: oci.database.models.PatchSummary, fields: Optional[list[str]] = None
+) -> PatchSummary | None:
+    """Map oci.database.models.PatchSummary → PatchSummary Pydantic model."""
+    return map_model(PatchSummary, o, fields)
+
+
+class ExecutionActionSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.ExecutionActionSummary."""
+
+    action_members: Optional[Any] = Field(
+        None,
+        description="List of action members of this execution action.",
+    )
+    action_params: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the action_params of this ExecutionActionSummary. Map<ParamName, ParamValue> where a key value pair describes the specific action parameter. Example: `{"count": "3"}`',
+    )
+    action_type: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the action_type of this ExecutionActionSummary. The action type of the execution action being performed Allowed values for this property are: "DB_SERVER_FULL_SOFTWARE_UPDATE", "STORAGE_SERVER_FULL_SOFTWARE_UPDATE", "NETWORK_SWITCH_FULL_SOFTWARE_UPDATE", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this ExecutionActionSummary. The `OCID`__ of the compartment.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    description: Optional[Any] = Field(
+        None,
+        description="Description of the execution action.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this ExecutionActionSummary. The user-friendly name for the execution action. The name does not need to be unique.",
+    )
+    estimated_time_in_mins: Optional[Any] = Field(
+        None,
+        description="The estimated time of the execution action in minutes.",
+    )
+    execution_action_order: Optional[Any] = Field(
+        None,
+        description="The priority order of the execution action.",
+    )
+    execution_window_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the execution_window_id of this ExecutionActionSummary. The `OCID`__ of the execution window resource the execution action belongs to.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this ExecutionActionSummary. The `OCID`__ of the execution action.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this ExecutionActionSummary. The current state of the execution action. Valid states are SCHEDULED, IN_PROGRESS, FAILED, CANCELED, UPDATING, DELETED, SUCCEEDED and PARTIAL_SUCCESS. Allowed values for this property are: "SCHEDULED", "IN_PROGRESS", "FAILED", "CANCELED", "UPDATING", "DELETED", "SUCCEEDED", "PARTIAL_SUCCESS", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    lifecycle_substate: Optional[Any] = Field(
+        None,
+        description='The current sub-state of the execution action. Valid states are DURATION_EXCEEDED, MAINTENANCE_IN_PROGRESS and WAITING. Allowed values for this property are: "DURATION_EXCEEDED", "MAINTENANCE_IN_PROGRESS", "WAITING", "RESCHEDULED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time the execution action was created.",
+    )
+    time_updated: Optional[Any] = Field(
+        None,
+        description="The last date and time that the execution action was updated.",
+    )
+    total_time_taken_in_mins: Optional[Any] = Field(
+        None,
+        description="The total time taken by corresponding resource activity in minutes.",
+    )
+
+
+def map_executionactionsummary(
+    o: oci.database.models.ExecutionActionSummary,
+    fields: Optional[list[str]] = None,
+) -> ExecutionActionSummary | None:
+    """Map oci.database.models.ExecutionActionSummary → ExecutionActionSummary Pydantic model."""
+    return map_model(ExecutionActionSummary, o, fields)
+
+
+class ExecutionWindowSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.ExecutionWindowSummary."""
+
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this ExecutionWindowSummary. The `OCID`__ of the compartment.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    description: Optional[Any] = Field(
+        None,
+        description="Description of the execution window.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this ExecutionWindowSummary. The user-friendly name for the execution window. The name does not need to be unique.",
+    )
+    estimated_time_in_mins: Optional[Any] = Field(
+        None,
+        description="The estimated time of the execution window in minutes.",
+    )
+    execution_resource_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the execution_resource_id of this ExecutionWindowSummary. The `OCID`__ of the execution resource the execution window belongs to.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this ExecutionWindowSummary. The `OCID`__ of the execution window.",
+    )
+    is_enforced_duration: Optional[Any] = Field(
+        None,
+        description="Indicates if duration the user plans to allocate for scheduling window is strictly enforced. The default value is `FALSE`.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this ExecutionWindowSummary. The current state of the Schedule Policy. Valid states are CREATED, SCHEDULED, IN_PROGRESS, FAILED, CANCELED, UPDATING, DELETED, SUCCEEDED and PARTIAL_SUCCESS. Allowed values for this property are: "CREATED", "SCHEDULED", "IN_PROGRESS", "FAILED", "CANCELED", "UPDATING", "DELETED", "SUCCEEDED", "PARTIAL_SUCCESS", "CREATING", "DELETING", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    lifecycle_substate: Optional[Any] = Field(
+        None,
+        description='The current sub-state of the execution window. Valid states are DURATION_EXCEEDED, MAINTENANCE_IN_PROGRESS and WAITING. Allowed values for this property are: "DURATION_EXCEEDED", "MAINTENANCE_IN_PROGRESS", "WAITING", "RESCHEDULED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time the execution window was created.",
+    )
+    time_ended: Optional[Any] = Field(
+        None,
+        description="The date and time that the execution window ended.",
+    )
+    time_scheduled: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the time_scheduled of this ExecutionWindowSummary. The scheduled start date and time of the execution window.",
+    )
+    time_started: Optional[Any] = Field(
+        None,
+        description="The date and time that the execution window was started.",
+    )
+    time_updated: Optional[Any] = Field(
+        None,
+        description="The last date and time that the execution window was updated.",
+    )
+    total_time_taken_in_mins: Optional[Any] = Field(
+        None,
+        description="The total time taken by corresponding resource activity in minutes.",
+    )
+    window_duration_in_mins: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the window_duration_in_mins of this ExecutionWindowSummary. Duration window allows user to set a duration they plan to allocate for Scheduling window. The duration is in minutes.",
+    )
+    window_type: Optional[Any] = Field(
+        None,
+        description="The execution window is of PLANNED or UNPLANNED type. Allowed values for this property are: \"PLANNED\", \"UNPLANNED\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+
+
+def map_executionwindowsummary(
+    o: oci.database.models.ExecutionWindowSummary,
+    fields: Optional[list[str]] = None,
+) -> ExecutionWindowSummary | None:
+    """Map oci.database.models.ExecutionWindowSummary → ExecutionWindowSummary Pydantic model."""
+    return map_model(ExecutionWindowSummary, o, fields)
+
+
+class MaintenanceRunHistorySummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.MaintenanceRunHistorySummary."""
+
+    current_execution_window: Optional[Any] = Field(
+        None,
+        description="The OCID of the current execution window.",
+    )
+    db_servers_history_details: Optional[Any] = Field(
+        None,
+        description="List of database server history details.",
+    )
+    granular_maintenance_history: Optional[Any] = Field(
+        None,
+        description="The list of granular maintenance history details.",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this MaintenanceRunHistorySummary. The OCID of the maintenance run history.",
+    )
+    maintenance_run_details: Optional[Any] = Field(
+        None,
+        description="",
+    )
+
+
+def map_maintenancerunhistorysummary(
+    o: oci.database.models.MaintenanceRunHistorySummary,
+    fields: Optional[list[str]] = None,
+) -> MaintenanceRunHistorySummary | None:
+    """Map oci.database.models.MaintenanceRunHistorySummary → MaintenanceRunHistorySummary Pydantic model."""
+    return map_model(MaintenanceRunHistorySummary, o, fields)
+
+
+class MaintenanceRunSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.MaintenanceRunSummary."""
+
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this MaintenanceRunSummary. The OCID of the compartment.",
+    )
+    current_custom_action_timeout_in_mins: Optional[Any] = Field(
+        None,
+        description="Extend current custom action timeout between the current database servers during waiting state, from 0 (zero) to 30 minutes.",
+    )
+    current_patching_component: Optional[Any] = Field(
+        None,
+        description="The name of the current infrastruture component that is getting patched.",
+    )
+    custom_action_timeout_in_mins: Optional[Any] = Field(
+        None,
+        description="Determines the amount of time the system will wait before the start of each database server patching operation. Specify a number of minutes, from 15 to 120.",
+    )
+    database_software_image_id: Optional[Any] = Field(
+        None,
+        description="The Autonomous Database Software Image `OCID`__",
+    )
+    description: Optional[Any] = Field(
+        None,
+        description="Description of the maintenance run.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this MaintenanceRunSummary. The user-friendly name for the maintenance run.",
+    )
+    estimated_component_patching_start_time: Optional[Any] = Field(
+        None,
+        description="The estimated start time of the next infrastruture component patching operation.",
+    )
+    estimated_patching_time: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this MaintenanceRunSummary. The OCID of the maintenance run.",
+    )
+    is_custom_action_timeout_enabled: Optional[Any] = Field(
+        None,
+        description="If true, enables the configuration of a custom action timeout (waiting period) between database servers patching operations.",
+    )
+    is_dst_file_update_enabled: Optional[Any] = Field(
+        None,
+        description="Indicates if an automatic DST Time Zone file update is enabled for the Autonomous Container Database. If enabled along with Release Update, patching will be done in a Non-Rolling manner.",
+    )
+    is_maintenance_run_granular: Optional[Any] = Field(
+        None,
+        description="If `FALSE`, the maintenance run doesn't support granular maintenance.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this MaintenanceRunSummary. The current state of the maintenance run. For Autonomous Database Serverless instances, valid states are IN_PROGRESS, SUCCEEDED, and FAILED. Allowed values for this property are: "SCHEDULED", "IN_PROGRESS", "SUCCEEDED", "SKIPPED", "FAILED", "UPDATING", "DELETING", "DELETED", "CANCELED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    maintenance_subtype: Optional[Any] = Field(
+        None,
+        description='Maintenance sub-type. Allowed values for this property are: "QUARTERLY", "HARDWARE", "CRITICAL", "INFRASTRUCTURE", "DATABASE", "ONEOFF", "SECURITY_MONTHLY", "TIMEZONE", "CUSTOM_DATABASE_SOFTWARE_IMAGE", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    maintenance_type: Optional[Any] = Field(
+        None,
+        description="Maintenance type. Allowed values for this property are: \"PLANNED\", \"UNPLANNED\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    patch_failure_count: Optional[Any] = Field(
+        None,
+        description="Contain the patch failure count.",
+    )
+    patch_id: Optional[Any] = Field(
+        None,
+        description="The unique identifier of the patch. The identifier string includes the patch type, the Oracle Database version, and the patch creation date (using the format YYMMDD). For example, the identifier `ru_patch_19.9.0.0_201030` is used for an RU patch for Oracle Database 19.9.0.0 that was released October 30, 2020.",
+    )
+    patching_end_time: Optional[Any] = Field(
+        None,
+        description="The time when the patching operation ended.",
+    )
+    patching_mode: Optional[Any] = Field(
+        None,
+        description='Cloud Exadata infrastructure node patching method, either "ROLLING" or "NONROLLING". Default value is ROLLING. *IMPORTANT*: Non-rolling infrastructure patching involves system down time. See `Oracle-Managed Infrastructure Maintenance Updates`__ for more information. Allowed values for this property are: "ROLLING", "NONROLLING", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    patching_start_time: Optional[Any] = Field(
+        None,
+        description="The time when the patching operation started.",
+    )
+    patching_status: Optional[Any] = Field(
+        None,
+        description='The status of the patching operation. Allowed values for this property are: "PATCHING", "WAITING", "SCHEDULED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    peer_maintenance_run_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the maintenance run for the Autonomous Data Guard association's peer container database.",
+    )
+    target_db_server_version: Optional[Any] = Field(
+        None,
+        description="The target software version for the database server patching operation.",
+    )
+    target_resource_id: Optional[Any] = Field(
+        None,
+        description="The ID of the target resource on which the maintenance run occurs.",
+    )
+    target_resource_type: Optional[Any] = Field(
+        None,
+        description='The type of the target resource on which the maintenance run occurs. Allowed values for this property are: "AUTONOMOUS_EXADATA_INFRASTRUCTURE", "AUTONOMOUS_CONTAINER_DATABASE", "EXADATA_DB_SYSTEM", "CLOUD_EXADATA_INFRASTRUCTURE", "EXACC_INFRASTRUCTURE", "AUTONOMOUS_VM_CLUSTER", "AUTONOMOUS_DATABASE", "CLOUD_AUTONOMOUS_VM_CLUSTER", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    target_storage_server_version: Optional[Any] = Field(
+        None,
+        description="The target Cell version that is to be patched to.",
+    )
+    time_ended: Optional[Any] = Field(
+        None,
+        description="The date and time the maintenance run was completed.",
+    )
+    time_scheduled: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the time_scheduled of this MaintenanceRunSummary. The date and time the maintenance run is scheduled to occur.",
+    )
+    time_started: Optional[Any] = Field(
+        None,
+        description="The date and time the maintenance run starts.",
+    )
+    total_time_taken_in_mins: Optional[Any] = Field(
+        None,
+        description="The total time taken by corresponding resource activity in minutes.",
+    )
+
+
+def map_maintenancerunsummary(
+    o: oci.database.models.MaintenanceRunSummary,
+    fields: Optional[list[str]] = None,
+) -> MaintenanceRunSummary | None:
+    """Map oci.database.models.MaintenanceRunSummary → MaintenanceRunSummary Pydantic model."""
+    return map_model(MaintenanceRunSummary, o, fields)
+
+
+class OneoffPatchSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.OneoffPatchSummary."""
+
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this OneoffPatchSummary. The `OCID`__ of the compartment.",
+    )
+    db_version: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the db_version of this OneoffPatchSummary. A valid Oracle Database version. For a list of supported versions, use the ListDbVersions operation. This cannot be updated in parallel with any of the following: licenseModel, dbEdition, cpuCoreCount, computeCount, computeModel, adminPassword, whitelistedIps, isMTLSConnectionRequired, openMode, permissionLevel, dbWorkload, privateEndpointLabel, nsgIds, isRefreshable, dbName, scheduledOperations, dbToolsDetails, isLocalDataGuardEnabled, or isFreeTier.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this OneoffPatchSummary. One-off patch name.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this OneoffPatchSummary. The `OCID`__ of the one-off patch.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Detailed message for the lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this OneoffPatchSummary. The current state of the one-off patch. Allowed values for this property are: "CREATING", "AVAILABLE", "UPDATING", "INACTIVE", "FAILED", "EXPIRED", "DELETING", "DELETED", "TERMINATING", "TERMINATED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    one_off_patches: Optional[Any] = Field(
+        None,
+        description="List of one-off patches for Database Homes.",
+    )
+    release_update: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the release_update of this OneoffPatchSummary. The PSU or PBP or Release Updates. To get a list of supported versions, use the :func:`list_db_versions` operation.",
+    )
+    sha256_sum: Optional[Any] = Field(
+        None,
+        description="SHA-256 checksum of the one-off patch.",
+    )
+    size_in_kbs: Optional[float] = Field(
+        None,
+        description="The size of one-off patch in kilobytes.",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the time_created of this OneoffPatchSummary. The date and time one-off patch was created.",
+    )
+    time_of_expiration: Optional[Any] = Field(
+        None,
+        description="The date and time until which the one-off patch will be available for download.",
+    )
+    time_updated: Optional[Any] = Field(
+        None,
+        description="The date and time one-off patch was updated.",
+    )
+
+
+def map_oneoffpatchsummary(
+    o: oci.database.models.OneoffPatchSummary,
+    fields: Optional[list[str]] = None,
+) -> OneoffPatchSummary | None:
+    """Map oci.database.models.OneoffPatchSummary → OneoffPatchSummary Pydantic model."""
+    return map_model(OneoffPatchSummary, o, fields)
+
+
+class ScheduledActionCollection(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.ScheduledActionCollection."""
+
+    items: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the items of this ScheduledActionCollection. List of Scheduled Action resources.",
+    )
+
+
+def map_scheduledactioncollection(
+    o: oci.database.models.ScheduledActionCollection,
+    fields: Optional[list[str]] = None,
+) -> ScheduledActionCollection | None:
+    """Map oci.database.models.ScheduledActionCollection → ScheduledActionCollection Pydantic model."""
+    return map_model(ScheduledActionCollection, o, fields)
+
+
+class SchedulingPlanCollection(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.SchedulingPlanCollection."""
+
+    items: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the items of this SchedulingPlanCollection. List of Scheduling Plan resources.",
+    )
+
+
+def map_schedulingplancollection(
+    o: oci.database.models.SchedulingPlanCollection,
+    fields: Optional[list[str]] = None,
+) -> SchedulingPlanCollection | None:
+    """Map oci.database.models.SchedulingPlanCollection → SchedulingPlanCollection Pydantic model."""
+    return map_model(SchedulingPlanCollection, o, fields)
+
+
+class SchedulingPolicySummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.SchedulingPolicySummary."""
+
+    cadence: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the cadence of this SchedulingPolicySummary. The cadence period. Allowed values for this property are: "HALFYEARLY", "QUARTERLY", "MONTHLY", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    cadence_start_month: Optional[Any] = Field(
+        None,
+        description="Start of the month to be followed during the cadence period.",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this SchedulingPolicySummary. The `OCID`__ of the compartment.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this SchedulingPolicySummary. The user-friendly name for the Scheduling Policy. The name does not need to be unique.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this SchedulingPolicySummary. The `OCID`__ of the Scheduling Policy.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this SchedulingPolicySummary. The current state of the Scheduling Policy. Valid states are CREATING, NEEDS_ATTENTION, ACTIVE, UPDATING, FAILED, DELETING and DELETED. Allowed values for this property are: "CREATING", "NEEDS_ATTENTION", "AVAILABLE", "UPDATING", "FAILED", "DELETING", "DELETED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time the Scheduling Policy was created.",
+    )
+    time_next_window_starts: Optional[Any] = Field(
+        None,
+        description="The date and time of the next scheduling window associated with the schedulingPolicy is planned to start.",
+    )
+    time_updated: Optional[Any] = Field(
+        None,
+        description="The last date and time that the Scheduling Policy was updated.",
+    )
+
+
+def map_schedulingpolicysummary(
+    o: oci.database.models.SchedulingPolicySummary,
+    fields: Optional[list[str]] = None,
+) -> SchedulingPolicySummary | None:
+    """Map oci.database.models.SchedulingPolicySummary → SchedulingPolicySummary Pydantic model."""
+    return map_model(SchedulingPolicySummary, o, fields)
+
+
+class SchedulingWindowSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.SchedulingWindowSummary."""
+
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the compartment.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="The user-friendly name for the Scheduling Window. The name does not need to be unique.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this SchedulingWindowSummary. The `OCID`__ of the Scheduling Window.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this SchedulingWindowSummary. The current state of the Scheduling Window. Valid states are CREATING, ACTIVE, UPDATING, FAILED, DELETING and DELETED. Allowed values for this property are: "CREATING", "AVAILABLE", "UPDATING", "FAILED", "DELETING", "DELETED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    scheduling_policy_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the scheduling_policy_id of this SchedulingWindowSummary. The `OCID`__ of the Scheduling Policy.",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time the Scheduling Window was created.",
+    )
+    time_next_scheduling_window_starts: Optional[Any] = Field(
+        None,
+        description="The date and time of the next upcoming window associated within the schedulingWindow is planned to start.",
+    )
+    time_updated: Optional[Any] = Field(
+        None,
+        description="The last date and time that the Scheduling Window was updated.",
+    )
+    window_preference: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the window_preference of this SchedulingWindowSummary.",
+    )
+
+
+def map_schedulingwindowsummary(
+    o: oci.database.models.SchedulingWindowSummary,
+    fields: Optional[list[str]] = None,
+) -> SchedulingWindowSummary | None:
+    """Map oci.database.models.SchedulingWindowSummary → SchedulingWindowSummary Pydantic model."""
+    return map_model(SchedulingWindowSummary, o, fields)
+
+
+class Update(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.Update."""
+
+    available_actions: Optional[Any] = Field(
+        None,
+        description='The possible actions performed by the update operation on the infrastructure components. Allowed values for items in this list are: "ROLLING_APPLY", "NON_ROLLING_APPLY", "PRECHECK", "ROLLBACK", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    description: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the description of this Update. Details of the maintenance update package.",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this Update. The `OCID`__ of the maintenance update.",
+    )
+    last_action: Optional[Any] = Field(
+        None,
+        description='The previous update action performed. Allowed values for this property are: "ROLLING_APPLY", "NON_ROLLING_APPLY", "PRECHECK", "ROLLBACK", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Descriptive text providing additional details about the lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='The current state of the maintenance update. Dependent on value of `lastAction`. Allowed values for this property are: "AVAILABLE", "SUCCESS", "IN_PROGRESS", "FAILED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    time_released: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the time_released of this Update. The date and time the maintenance update was released.",
+    )
+    update_type: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the update_type of this Update. The type of cloud VM cluster maintenance update. Allowed values for this property are: "GI_UPGRADE", "GI_PATCH", "OS_UPDATE", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    version: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the version of this Update. The version of the maintenance update package.",
+    )
+
+
+def map_update(
+    o: oci.database.models.Update, fields: Optional[list[str]] = None
+) -> Update | None:
+    """Map oci.database.models.Update → Update Pydantic model."""
+    return map_model(Update, o, fields)
+
+
+class UpdateHistoryEntry(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.UpdateHistoryEntry."""
+
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this UpdateHistoryEntry. The `OCID`__ of the maintenance update history entry.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Descriptive text providing additional details about the lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this UpdateHistoryEntry. The current lifecycle state of the maintenance update operation. Allowed values for this property are: "IN_PROGRESS", "SUCCEEDED", "FAILED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    time_completed: Optional[Any] = Field(
+        None,
+        description="The date and time when the maintenance update action completed.",
+    )
+    time_started: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the time_started of this UpdateHistoryEntry. The date and time when the maintenance update action started.",
+    )
+    update_action: Optional[Any] = Field(
+        None,
+        description='The update action. Allowed values for this property are: "ROLLING_APPLY", "NON_ROLLING_APPLY", "PRECHECK", "ROLLBACK", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    update_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the update_id of this UpdateHistoryEntry. The `OCID`__ of the maintenance update.",
+    )
+    update_type: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the update_type of this UpdateHistoryEntry. The type of cloud VM cluster maintenance update. Allowed values for this property are: "GI_UPGRADE", "GI_PATCH", "OS_UPDATE", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+
+
+def map_updatehistoryentry(
+    o: oci.database.models.UpdateHistoryEntry,
+    fields: Optional[list[str]] = None,
+) -> UpdateHistoryEntry | None:
+    """Map oci.database.models.UpdateHistoryEntry → UpdateHistoryEntry Pydantic model."""
+    return map_model(UpdateHistoryEntry, o, fields)
+
+
+class Patch(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.Patch."""
+
+    available_actions: Optional[Any] = Field(
+        None,
+        description="Actions that can possibly be performed using this patch. Allowed values for items in this list are: \"APPLY\", \"PRECHECK\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    description: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the description of this Patch. The text describing this patch package.",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this Patch. The `OCID`__ of the patch.",
+    )
+    last_action: Optional[Any] = Field(
+        None,
+        description="Action that is currently being performed or was completed last. Allowed values for this property are: \"APPLY\", \"PRECHECK\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="A descriptive text associated with the lifecycleState. Typically can contain additional displayable text.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='The current state of the patch as a result of lastAction. Allowed values for this property are: "AVAILABLE", "SUCCESS", "IN_PROGRESS", "FAILED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    time_released: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the time_released of this Patch. The date and time that the patch was released.",
+    )
+    version: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the version of this Patch. The version of this patch package.",
+    )
+
+
+def map_patch(
+    o: oci.database.models.Patch, fields: Optional[list[str]] = None
+) -> Patch | None:
+    """Map oci.database.models.Patch → Patch Pydantic model."""
+    return map_model(Patch, o, fields)
+
+
+class PatchHistoryEntry(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.PatchHistoryEntry."""
+
+    action: Optional[Any] = Field(
+        None,
+        description="The action being performed or was completed. Allowed values for this property are: \"APPLY\", \"PRECHECK\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this PatchHistoryEntry. The `OCID`__ of the patch history entry.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="A descriptive text associated with the lifecycleState. Typically contains additional displayable text.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this PatchHistoryEntry. The current state of the action. Allowed values for this property are: "IN_PROGRESS", "SUCCEEDED", "FAILED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    patch_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the patch_id of this PatchHistoryEntry. The `OCID`__ of the patch.",
+    )
+    patch_type: Optional[Any] = Field(
+        None,
+        description='The type of Patch operation. Allowed values for this property are: "OS", "DB", "GI", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    time_ended: Optional[Any] = Field(
+        None,
+        description="The date and time when the patch action completed",
+    )
+    time_started: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the time_started of this PatchHistoryEntry. The date and time when the patch action started.",
+    )
+
+
+def map_patchhistoryentry(
+    o: oci.database.models.PatchHistoryEntry,
+    fields: Optional[list[str]] = None,
+) -> PatchHistoryEntry | None:
+    """Map oci.database.models.PatchHistoryEntry → PatchHistoryEntry Pydantic model."""
+    return map_model(PatchHistoryEntry, o, fields)
+
+
+class ExecutionAction(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.ExecutionAction."""
+
+    action_members: Optional[Any] = Field(
+        None,
+        description="List of action members of this execution action.",
+    )
+    action_params: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the action_params of this ExecutionAction. Map<ParamName, ParamValue> where a key value pair describes the specific action parameter. Example: `{"count": "3"}`',
+    )
+    action_type: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the action_type of this ExecutionAction. The action type of the execution action being performed Allowed values for this property are: "DB_SERVER_FULL_SOFTWARE_UPDATE", "STORAGE_SERVER_FULL_SOFTWARE_UPDATE", "NETWORK_SWITCH_FULL_SOFTWARE_UPDATE", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this ExecutionAction. The `OCID`__ of the compartment.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    description: Optional[Any] = Field(
+        None,
+        description="Description of the execution action.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this ExecutionAction. The user-friendly name for the execution action. The name does not need to be unique.",
+    )
+    estimated_time_in_mins: Optional[Any] = Field(
+        None,
+        description="The estimated time of the execution action in minutes.",
+    )
+    execution_action_order: Optional[Any] = Field(
+        None,
+        description="The priority order of the execution action.",
+    )
+    execution_window_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the execution_window_id of this ExecutionAction. The `OCID`__ of the execution window resource the execution action belongs to.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this ExecutionAction. The `OCID`__ of the execution action.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this ExecutionAction. The current state of the execution action. Valid states are SCHEDULED, IN_PROGRESS, FAILED, CANCELED, UPDATING, DELETED, SUCCEEDED and PARTIAL_SUCCESS. Allowed values for this property are: "SCHEDULED", "IN_PROGRESS", "FAILED", "CANCELED", "UPDATING", "DELETED", "SUCCEEDED", "PARTIAL_SUCCESS", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    lifecycle_substate: Optional[Any] = Field(
+        None,
+        description='The current sub-state of the execution action. Valid states are DURATION_EXCEEDED, MAINTENANCE_IN_PROGRESS and WAITING. Allowed values for this property are: "DURATION_EXCEEDED", "MAINTENANCE_IN_PROGRESS", "WAITING", "RESCHEDULED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time the execution action was created.",
+    )
+    time_updated: Optional[Any] = Field(
+        None,
+        description="The last date and time that the execution action was updated.",
+    )
+    total_time_taken_in_mins: Optional[Any] = Field(
+        None,
+        description="The total time taken by corresponding resource activity in minutes.",
+    )
+
+
+def map_executionaction(
+    o: oci.database.models.ExecutionAction,
+    fields: Optional[list[str]] = None,
+) -> ExecutionAction | None:
+    """Map oci.database.models.ExecutionAction → ExecutionAction Pydantic model."""
+    return map_model(ExecutionAction, o, fields)
+
+
+class ExecutionWindow(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.ExecutionWindow."""
+
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this ExecutionWindow. The `OCID`__ of the compartment.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    description: Optional[Any] = Field(
+        None,
+        description="Description of the execution window.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this ExecutionWindow. The user-friendly name for the execution window. The name does not need to be unique.",
+    )
+    estimated_time_in_mins: Optional[Any] = Field(
+        None,
+        description="The estimated time of the execution window in minutes.",
+    )
+    execution_resource_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the execution_resource_id of this ExecutionWindow. The `OCID`__ of the execution resource the execution window belongs to.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this ExecutionWindow. The `OCID`__ of the execution window.",
+    )
+    is_enforced_duration: Optional[Any] = Field(
+        None,
+        description="Indicates if duration the user plans to allocate for scheduling window is strictly enforced. The default value is `FALSE`.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this ExecutionWindow. The current state of the Schedule Policy. Valid states are CREATED, SCHEDULED, IN_PROGRESS, FAILED, CANCELED, UPDATING, DELETED, SUCCEEDED and PARTIAL_SUCCESS. Allowed values for this property are: "CREATED", "SCHEDULED", "IN_PROGRESS", "FAILED", "CANCELED", "UPDATING", "DELETED", "SUCCEEDED", "PARTIAL_SUCCESS", "CREATING", "DELETING", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    lifecycle_substate: Optional[Any] = Field(
+        None,
+        description='The current sub-state of the execution window. Valid states are DURATION_EXCEEDED, MAINTENANCE_IN_PROGRESS and WAITING. Allowed values for this property are: "DURATION_EXCEEDED", "MAINTENANCE_IN_PROGRESS", "WAITING", "RESCHEDULED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time the execution window was created.",
+    )
+    time_ended: Optional[Any] = Field(
+        None,
+        description="The date and time that the execution window ended.",
+    )
+    time_scheduled: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the time_scheduled of this ExecutionWindow. The scheduled start date and time of the execution window.",
+    )
+    time_started: Optional[Any] = Field(
+        None,
+        description="The date and time that the execution window was started.",
+    )
+    time_updated: Optional[Any] = Field(
+        None,
+        description="The last date and time that the execution window was updated.",
+    )
+    total_time_taken_in_mins: Optional[Any] = Field(
+        None,
+        description="The total time taken by corresponding resource activity in minutes.",
+    )
+    window_duration_in_mins: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the window_duration_in_mins of this ExecutionWindow. Duration window allows user to set a duration they plan to allocate for Scheduling window. The duration is in minutes.",
+    )
+    window_type: Optional[Any] = Field(
+        None,
+        description="The execution window is of PLANNED or UNPLANNED type. Allowed values for this property are: \"PLANNED\", \"UNPLANNED\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+
+
+def map_executionwindow(
+    o: oci.database.models.ExecutionWindow,
+    fields: Optional[list[str]] = None,
+) -> ExecutionWindow | None:
+    """Map oci.database.models.ExecutionWindow → ExecutionWindow Pydantic model."""
+    return map_model(ExecutionWindow, o, fields)
+
+
+class InfrastructureTargetVersion(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.InfrastructureTargetVersion."""
+
+    target_db_version_history_entry: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the target_db_version_history_entry of this InfrastructureTargetVersion. The history entry of the target system software version for the database server patching operation.",
+    )
+    target_resource_id: Optional[Any] = Field(
+        None,
+        description="The OCID of the target Exadata Infrastructure resource that will receive the maintenance update.",
+    )
+    target_resource_type: Optional[Any] = Field(
+        None,
+        description='The resource type of the target Exadata infrastructure resource that will receive the system software update. Allowed values for this property are: "EXADATA_DB_SYSTEM", "CLOUD_EXADATA_INFRASTRUCTURE", "EXACC_INFRASTRUCTURE", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    target_storage_version_history_entry: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the target_storage_version_history_entry of this InfrastructureTargetVersion. The history entry of the target storage cell system software version for the storage cell patching operation.",
+    )
+
+
+def map_infrastructuretargetversion(
+    o: oci.database.models.InfrastructureTargetVersion,
+    fields: Optional[list[str]] = None,
+) -> InfrastructureTargetVersion | None:
+    """Map oci.database.models.InfrastructureTargetVersion → InfrastructureTargetVersion Pydantic model."""
+    return map_model(InfrastructureTargetVersion, o, fields)
+
+
+class MaintenanceRun(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.MaintenanceRun."""
+
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this MaintenanceRun. The OCID of the compartment.",
+    )
+    current_custom_action_timeout_in_mins: Optional[Any] = Field(
+        None,
+        description="Extend current custom action timeout between the current database servers during waiting state, from 0 (zero) to 30 minutes.",
+    )
+    current_patching_component: Optional[Any] = Field(
+        None,
+        description="The name of the current infrastruture component that is getting patched.",
+    )
+    custom_action_timeout_in_mins: Optional[Any] = Field(
+        None,
+        description="Determines the amount of time the system will wait before the start of each database server patching operation. Specify a number of minutes, from 15 to 120.",
+    )
+    database_software_image_id: Optional[Any] = Field(
+        None,
+        description="The Autonomous Database Software Image `OCID`__",
+    )
+    description: Optional[Any] = Field(
+        None,
+        description="Description of the maintenance run.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this MaintenanceRun. The user-friendly name for the maintenance run.",
+    )
+    estimated_component_patching_start_time: Optional[Any] = Field(
+        None,
+        description="The estimated start time of the next infrastruture component patching operation.",
+    )
+    estimated_patching_time: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this MaintenanceRun. The OCID of the maintenance run.",
+    )
+    is_custom_action_timeout_enabled: Optional[Any] = Field(
+        None,
+        description="If true, enables the configuration of a custom action timeout (waiting period) between database servers patching operations.",
+    )
+    is_dst_file_update_enabled: Optional[Any] = Field(
+        None,
+        description="Indicates if an automatic DST Time Zone file update is enabled for the Autonomous Container Database. If enabled along with Release Update, patching will be done in a Non-Rolling manner.",
+    )
+    is_maintenance_run_granular: Optional[Any] = Field(
+        None,
+        description="If `FALSE`, the maintenance run doesn't support granular maintenance.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this MaintenanceRun. The current state of the maintenance run. For Autonomous Database Serverless instances, valid states are IN_PROGRESS, SUCCEEDED, and FAILED. Allowed values for this property are: "SCHEDULED", "IN_PROGRESS", "SUCCEEDED", "SKIPPED", "FAILED", "UPDATING", "DELETING", "DELETED", "CANCELED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    maintenance_subtype: Optional[Any] = Field(
+        None,
+        description='Maintenance sub-type. Allowed values for this property are: "QUARTERLY", "HARDWARE", "CRITICAL", "INFRASTRUCTURE", "DATABASE", "ONEOFF", "SECURITY_MONTHLY", "TIMEZONE", "CUSTOM_DATABASE_SOFTWARE_IMAGE", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    maintenance_type: Optional[Any] = Field(
+        None,
+        description="Maintenance type. Allowed values for this property are: \"PLANNED\", \"UNPLANNED\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    patch_failure_count: Optional[Any] = Field(
+        None,
+        description="Contain the patch failure count.",
+    )
+    patch_id: Optional[Any] = Field(
+        None,
+        description="The unique identifier of the patch. The identifier string includes the patch type, the Oracle Database version, and the patch creation date (using the format YYMMDD). For example, the identifier `ru_patch_19.9.0.0_201030` is used for an RU patch for Oracle Database 19.9.0.0 that was released October 30, 2020.",
+    )
+    patching_end_time: Optional[Any] = Field(
+        None,
+        description="The time when the patching operation ended.",
+    )
+    patching_mode: Optional[Any] = Field(
+        None,
+        description='Cloud Exadata infrastructure node patching method, either "ROLLING" or "NONROLLING". Default value is ROLLING. *IMPORTANT*: Non-rolling infrastructure patching involves system down time. See `Oracle-Managed Infrastructure Maintenance Updates`__ for more information. Allowed values for this property are: "ROLLING", "NONROLLING", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    patching_start_time: Optional[Any] = Field(
+        None,
+        description="The time when the patching operation started.",
+    )
+    patching_status: Optional[Any] = Field(
+        None,
+        description='The status of the patching operation. Allowed values for this property are: "PATCHING", "WAITING", "SCHEDULED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    peer_maintenance_run_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the maintenance run for the Autonomous Data Guard association's peer container database.",
+    )
+    target_db_server_version: Optional[Any] = Field(
+        None,
+        description="The target software version for the database server patching operation.",
+    )
+    target_resource_id: Optional[Any] = Field(
+        None,
+        description="The ID of the target resource on which the maintenance run occurs.",
+    )
+    target_resource_type: Optional[Any] = Field(
+        None,
+        description='The type of the target resource on which the maintenance run occurs. Allowed values for this property are: "AUTONOMOUS_EXADATA_INFRASTRUCTURE", "AUTONOMOUS_CONTAINER_DATABASE", "EXADATA_DB_SYSTEM", "CLOUD_EXADATA_INFRASTRUCTURE", "EXACC_INFRASTRUCTURE", "AUTONOMOUS_VM_CLUSTER", "AUTONOMOUS_DATABASE", "CLOUD_AUTONOMOUS_VM_CLUSTER", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    target_storage_server_version: Optional[Any] = Field(
+        None,
+        description="The target Cell version that is to be patched to.",
+    )
+    time_ended: Optional[Any] = Field(
+        None,
+        description="The date and time the maintenance run was completed.",
+    )
+    time_scheduled: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the time_scheduled of this MaintenanceRun. The date and time the maintenance run is scheduled to occur.",
+    )
+    time_started: Optional[Any] = Field(
+        None,
+        description="The date and time the maintenance run starts.",
+    )
+    total_time_taken_in_mins: Optional[Any] = Field(
+        None,
+        description="The total time taken by corresponding resource activity in minutes.",
+    )
+
+
+def map_maintenancerun(
+    o: oci.database.models.MaintenanceRun, fields: Optional[list[str]] = None
+) -> MaintenanceRun | None:
+    """Map oci.database.models.MaintenanceRun → MaintenanceRun Pydantic model."""
+    return map_model(MaintenanceRun, o, fields)
+
+
+class MaintenanceRunHistory(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.MaintenanceRunHistory."""
+
+    current_execution_window: Optional[Any] = Field(
+        None,
+        description="The OCID of the current execution window.",
+    )
+    db_servers_history_details: Optional[Any] = Field(
+        None,
+        description="List of database server history details.",
+    )
+    granular_maintenance_history: Optional[Any] = Field(
+        None,
+        description="The list of granular maintenance history details.",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this MaintenanceRunHistory. The OCID of the maintenance run history.",
+    )
+    maintenance_run_details: Optional[Any] = Field(
+        None,
+        description="",
+    )
+
+
+def map_maintenancerunhistory(
+    o: oci.database.models.MaintenanceRunHistory,
+    fields: Optional[list[str]] = None,
+) -> MaintenanceRunHistory | None:
+    """Map oci.database.models.MaintenanceRunHistory → MaintenanceRunHistory Pydantic model."""
+    return map_model(MaintenanceRunHistory, o, fields)
+
+
+class OneoffPatch(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.OneoffPatch."""
+
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this OneoffPatch. The `OCID`__ of the compartment.",
+    )
+    db_version: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the db_version of this OneoffPatch. A valid Oracle Database version. For a list of supported versions, use the ListDbVersions operation. This cannot be updated in parallel with any of the following: licenseModel, dbEdition, cpuCoreCount, computeCount, computeModel, adminPassword, whitelistedIps, isMTLSConnectionRequired, openMode, permissionLevel, dbWorkload, privateEndpointLabel, nsgIds, isRefreshable, dbName, scheduledOperations, dbToolsDetails, isLocalDataGuardEnabled, or isFreeTier.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this OneoffPatch. One-off patch name.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this OneoffPatch. The `OCID`__ of the one-off patch.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Detailed message for the lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this OneoffPatch. The current state of the one-off patch. Allowed values for this property are: "CREATING", "AVAILABLE", "UPDATING", "INACTIVE", "FAILED", "EXPIRED", "DELETING", "DELETED", "TERMINATING", "TERMINATED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    one_off_patches: Optional[Any] = Field(
+        None,
+        description="List of one-off patches for Database Homes.",
+    )
+    release_update: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the release_update of this OneoffPatch. The PSU or PBP or Release Updates. To get a list of supported versions, use the :func:`list_db_versions` operation.",
+    )
+    sha256_sum: Optional[Any] = Field(
+        None,
+        description="SHA-256 checksum of the one-off patch.",
+    )
+    size_in_kbs: Optional[float] = Field(
+        None,
+        description="The size of one-off patch in kilobytes.",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the time_created of this OneoffPatch. The date and time one-off patch was created.",
+    )
+    time_of_expiration: Optional[Any] = Field(
+        None,
+        description="The date and time until which the one-off patch will be available for download.",
+    )
+    time_updated: Optional[Any] = Field(
+        None,
+        description="The date and time one-off patch was updated.",
+    )
+
+
+def map_oneoffpatch(
+    o: oci.database.models.OneoffPatch, fields: Optional[list[str]] = None
+) -> OneoffPatch | None:
+    """Map oci.database.models.OneoffPatch → OneoffPatch Pydantic model."""
+    return map_model(OneoffPatch, o, fields)
+
+
+class ScheduledAction(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.ScheduledAction."""
+
+    action_members: Optional[Any] = Field(
+        None,
+        description="The list of action members in a scheduled action.",
+    )
+    action_order: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the action_order of this ScheduledAction. The order of the scheduled action.",
+    )
+    action_params: Optional[Any] = Field(
+        None,
+        description='Map<ParamName, ParamValue> where a key value pair describes the specific action parameter. Example: `{"count": "3"}`',
+    )
+    action_type: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the action_type of this ScheduledAction. The type of the scheduled action being performed Allowed values for this property are: "DB_SERVER_FULL_SOFTWARE_UPDATE", "STORAGE_SERVER_FULL_SOFTWARE_UPDATE", "NETWORK_SWITCH_FULL_SOFTWARE_UPDATE", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this ScheduledAction. The `OCID`__ of the compartment.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this ScheduledAction. The display name of the Scheduled Action.",
+    )
+    estimated_time_in_mins: Optional[Any] = Field(
+        None,
+        description="The estimated patching time for the scheduled action.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this ScheduledAction. The `OCID`__ of the Scheduled Action.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this ScheduledAction. The current state of the Scheduled Action. Valid states are CREATING, NEEDS_ATTENTION, AVAILABLE, UPDATING, FAILED, DELETING and DELETED. Allowed values for this property are: "CREATING", "NEEDS_ATTENTION", "AVAILABLE", "UPDATING", "FAILED", "DELETING", "DELETED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    scheduling_plan_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the scheduling_plan_id of this ScheduledAction. The `OCID`__ of the Scheduling Plan.",
+    )
+    scheduling_window_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the Scheduling Window.",
+    )
+    system_tags: Optional[Any] = Field(
+        None,
+        description="System tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the time_created of this ScheduledAction. The date and time the Scheduled Action Resource was created.",
+    )
+    time_updated: Optional[Any] = Field(
+        None,
+        description="The date and time the Scheduled Action Resource was updated.",
+    )
+
+
+def map_scheduledaction(
+    o: oci.database.models.ScheduledAction,
+    fields: Optional[list[str]] = None,
+) -> ScheduledAction | None:
+    """Map oci.database.models.ScheduledAction → ScheduledAction Pydantic model."""
+    return map_model(ScheduledAction, o, fields)
+
+
+class SchedulingPlan(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.SchedulingPlan."""
+
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this SchedulingPlan. The `OCID`__ of the compartment.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="The display name of the Scheduling Plan.",
+    )
+    estimated_time_in_mins: Optional[Any] = Field(
+        None,
+        description="The estimated time for the Scheduling Plan.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this SchedulingPlan. The `OCID`__ of the Scheduling Plan.",
+    )
+    is_using_recommended_scheduled_actions: Optional[Any] = Field(
+        None,
+        description="If true, recommended scheduled actions will be generated for the scheduling plan.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this SchedulingPlan. The current state of the Scheduling Plan. Valid states are CREATING, NEEDS_ATTENTION, AVAILABLE, UPDATING, FAILED, DELETING and DELETED. Allowed values for this property are: "CREATING", "NEEDS_ATTENTION", "AVAILABLE", "UPDATING", "FAILED", "DELETING", "DELETED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    plan_intent: Optional[Any] = Field(
+        None,
+        description="The current intent the Scheduling Plan. Valid states is EXADATA_INFRASTRUCTURE_FULL_SOFTWARE_UPDATE. Allowed values for this property are: \"EXADATA_INFRASTRUCTURE_FULL_SOFTWARE_UPDATE\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    resource_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the resource_id of this SchedulingPlan. The `OCID`__ of the resource.",
+    )
+    scheduling_policy_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the scheduling_policy_id of this SchedulingPlan. The `OCID`__ of the Scheduling Policy.",
+    )
+    service_type: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the service_type of this SchedulingPlan. The service type of the Scheduling Plan. Allowed values for this property are: "EXACC", "EXACS", "FPPPCS", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    system_tags: Optional[Any] = Field(
+        None,
+        description="System tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the time_created of this SchedulingPlan. The date and time the Scheduling Plan Resource was created.",
+    )
+    time_updated: Optional[Any] = Field(
+        None,
+        description="The date and time the Scheduling Plan Resource was updated.",
+    )
+
+
+def map_schedulingplan(
+    o: oci.database.models.SchedulingPlan, fields: Optional[list[str]] = None
+) -> SchedulingPlan | None:
+    """Map oci.database.models.SchedulingPlan → SchedulingPlan Pydantic model."""
+    return map_model(SchedulingPlan, o, fields)
+
+
+class SchedulingPolicy(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.SchedulingPolicy."""
+
+    cadence: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the cadence of this SchedulingPolicy. The cadence period. Allowed values for this property are: "HALFYEARLY", "QUARTERLY", "MONTHLY", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    cadence_start_month: Optional[Any] = Field(
+        None,
+        description="Start of the month to be followed during the cadence period.",
+    )
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this SchedulingPolicy. The `OCID`__ of the compartment.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the display_name of this SchedulingPolicy. The user-friendly name for the Scheduling Policy. The name does not need to be unique.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this SchedulingPolicy. The `OCID`__ of the Scheduling Policy.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this SchedulingPolicy. The current state of the Scheduling Policy. Valid states are CREATING, NEEDS_ATTENTION, ACTIVE, UPDATING, FAILED, DELETING and DELETED. Allowed values for this property are: "CREATING", "NEEDS_ATTENTION", "AVAILABLE", "UPDATING", "FAILED", "DELETING", "DELETED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time the Scheduling Policy was created.",
+    )
+    time_next_window_starts: Optional[Any] = Field(
+        None,
+        description="The date and time of the next scheduling window associated with the schedulingPolicy is planned to start.",
+    )
+    time_updated: Optional[Any] = Field(
+        None,
+        description="The last date and time that the Scheduling Policy was updated.",
+    )
+
+
+def map_schedulingpolicy(
+    o: oci.database.models.SchedulingPolicy,
+    fields: Optional[list[str]] = None,
+) -> SchedulingPolicy | None:
+    """Map oci.database.models.SchedulingPolicy → SchedulingPolicy Pydantic model."""
+    return map_model(SchedulingPolicy, o, fields)
+
+
+class SchedulingWindow(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.SchedulingWindow."""
+
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the compartment.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    display_name: Optional[Any] = Field(
+        None,
+        description="The user-friendly name for the Scheduling Window. The name does not need to be unique.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this SchedulingWindow. The `OCID`__ of the Scheduling Window.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this SchedulingWindow. The current state of the Scheduling Window. Valid states are CREATING, ACTIVE, UPDATING, FAILED, DELETING and DELETED. Allowed values for this property are: "CREATING", "AVAILABLE", "UPDATING", "FAILED", "DELETING", "DELETED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    scheduling_policy_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the scheduling_policy_id of this SchedulingWindow. The `OCID`__ of the Scheduling Policy.",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="The date and time the Scheduling Window was created.",
+    )
+    time_next_scheduling_window_starts: Optional[Any] = Field(
+        None,
+        description="The date and time of the next upcoming window associated within the schedulingWindow is planned to start.",
+    )
+    time_updated: Optional[Any] = Field(
+        None,
+        description="The last date and time that the Scheduling Window was updated.",
+    )
+    window_preference: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the window_preference of this SchedulingWindow.",
+    )
+
+
+def map_schedulingwindow(
+    o: oci.database.models.SchedulingWindow,
+    fields: Optional[list[str]] = None,
+) -> SchedulingWindow | None:
+    """Map oci.database.models.SchedulingWindow → SchedulingWindow Pydantic model."""
+    return map_model(SchedulingWindow, o, fields)
@@ -0,0 +1,295 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+
+Pydantic models of the OCI Database service: pluggable databases.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Optional
+
+import oci
+from oracle.oci_database_mcp_server.models.base import OCIBaseModel, map_model
+from pydantic import Field
+
+
+class PluggableDatabase(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.PluggableDatabase."""
+
+    compartment_id: Optional[str] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this PluggableDatabase. The `OCID`__ of the compartment. __ https://docs.cloud.oracle.com/Content/General/Concepts/identifiers.htm",
+    )
+    connection_strings: Optional[str] = Field(None, description="")
+    container_database_id: Optional[str] = Field(
+        None,
+        description="**[Required]** Gets the container_database_id of this PluggableDatabase. The `OCID`__ of the CDB. __ https://docs.cloud.oracle.com/Content/General/Concepts/identifiers.htm",
+    )
+    defined_tags: Optional[str] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__. __ https://docs.cloud.oracle.com/Content/General/Concepts/resourcetags.htm",
+    )
+    freeform_tags: Optional[str] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}` __ https://docs.cloud.oracle.com/Content/General/Concepts/resourcetags.htm',
+    )
+    id: Optional[str] = Field(
+        None,
+        description="**[Required]** Gets the id of this PluggableDatabase. The `OCID`__ of the pluggable database. __ https://docs.cloud.oracle.com/Content/General/Concepts/identifiers.htm",
+    )
+    is_restricted: Optional[bool] = Field(
+        None,
+        description="The restricted mode of the pluggable database. If a pluggable database is opened in restricted mode, the user needs both create a session and have restricted session privileges to connect to it.",
+    )
+    kms_key_id: Optional[str] = Field(
+        None,
+        description="The OCID of the key container that is used as the master encryption key in database transparent data encryption (TDE) operations.",
+    )
+    kms_key_version_id: Optional[str] = Field(
+        None,
+        description="The OCID of the key container version that is used in database transparent data encryption (TDE) operations KMS Key can have multiple key versions. If none is specified, the current key version (latest) of the Key Id is used for the operation. Autonomous Database Serverless does not use key versions, hence is not applicable for Autonomous Database Serverless instances.",
+    )
+    lifecycle_details: Optional[str] = Field(
+        None, description="Detailed message for the lifecycle state."
+    )
+    lifecycle_state: Optional[str] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this PluggableDatabase. The current state of the pluggable database. Allowed values for this property are: "PROVISIONING", "AVAILABLE", "TERMINATING", "TERMINATED", "UPDATING", "FAILED", "RELOCATING", "RELOCATED", "REFRESHING", "RESTORE_IN_PROGRESS", "RESTORE_FAILED", "BACKUP_IN_PROGRESS", "DISABLED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    open_mode: Optional[str] = Field(
+        None,
+        description='**[Required]** Gets the open_mode of this PluggableDatabase. **Deprecated.** Use :func:`pluggable_database_node_level_details` for OpenMode details. The mode that pluggable database is in. Open mode can only be changed to READ_ONLY or MIGRATE directly from the backend (within the Oracle Database software). Allowed values for this property are: "READ_ONLY", "READ_WRITE", "MOUNTED", "MIGRATE", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    pdb_name: Optional[str] = Field(
+        None,
+        description="**[Required]** Gets the pdb_name of this PluggableDatabase. The name for the pluggable database (PDB). The name is unique in the context of a :class:`Database`. The name must begin with an alphabetic character and can contain a maximum of thirty alphanumeric characters. Special characters are not permitted. The pluggable database name should not be same as the container database name.",
+    )
+    pdb_node_level_details: Optional[list[dict]] = Field(
+        None,
+        description='Pluggable Database Node Level Details. Example: [{"nodeName" : "node1", "openMode" : "READ_WRITE"}, {"nodeName" : "node2", "openMode" : "READ_ONLY"}]',
+    )
+    pluggable_database_management_config: Optional[dict] = Field(None, description="")
+    refreshable_clone_config: Optional[dict] = Field(None, description="")
+    time_created: Optional[datetime] = Field(
+        None,
+        description="**[Required]** Gets the time_created of this PluggableDatabase. The date and time the pluggable database was created.",
+    )
+
+
+def map_pluggabledatabase(
+    o: oci.database.models.PluggableDatabase,
+    fields: Optional[list[str]] = None,
+) -> PluggableDatabase | None:
+    """Map oci.database.models.PluggableDatabase → PluggableDatabase Pydantic model."""
+    return map_model(PluggableDatabase, o, fields)
+
+
+class CreatePluggableDatabaseDetails(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.CreatePluggableDatabaseDetails."""
+
+    container_database_admin_password: Optional[str] = Field(
+        None,
+        description="The DB system administrator password of the Container Database.",
+    )
+    container_database_id: Optional[str] = Field(
+        None,
+        description="**[Required]** Gets the container_database_id of this CreatePluggableDatabaseDetails. The `OCID`__ of the CDB __ https://docs.cloud.oracle.com/Content/General/Concepts/identifiers.htm",
+    )
+    defined_tags: Optional[str] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__. __ https://docs.cloud.oracle.com/Content/General/Concepts/resourcetags.htm",
+    )
+    freeform_tags: Optional[str] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}` __ https://docs.cloud.oracle.com/Content/General/Concepts/resourcetags.htm',
+    )
+    pdb_admin_password: Optional[str] = Field(
+        None,
+        description="A strong password for PDB Admin. The password must be at least nine characters and contain at least two uppercase, two lowercase, two numbers, and two special characters. The special characters must be _, \\#, or -.",
+    )
+    pdb_creation_type_details: Optional[dict] = Field(None, description="")
+    pdb_name: Optional[str] = Field(
+        None,
+        description="**[Required]** Gets the pdb_name of this CreatePluggableDatabaseDetails. The name for the pluggable database (PDB). The name is unique in the context of a :class:`Database`. The name must begin with an alphabetic character and can contain a maximum of thirty alphanumeric characters. Special characters are not permitted. The pluggable database name should not be same as the container database name.",
+    )
+    should_create_pdb_backup: Optional[bool] = Field(
+        None,
+        description="Indicates whether to take Pluggable Database Backup after the operation.",
+    )
+    should_pdb_admin_account_be_locked: Optional[bool] = Field(
+        None,
+        description="The locked mode of the pluggable database admin account. If false, the user needs to provide the PDB Admin Password to connect to it. If true, the pluggable database will be locked and user cannot login to it.",
+    )
+    tde_wallet_password: Optional[str] = Field(
+        None, description="The existing TDE wallet password of the CDB."
+    )
+
+
+def map_createpluggabledatabasedetails(
+    o: oci.database.models.CreatePluggableDatabaseDetails,
+    fields: Optional[list[str]] = None,
+) -> CreatePluggableDatabaseDetails | None:
+    """Map oci.database.models.CreatePluggableDatabaseDetails → CreatePluggableDatabaseDetails Pydantic model."""
+    return map_model(CreatePluggableDatabaseDetails, o, fields)
+
+
+class UpdatePluggableDatabaseDetails(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.UpdatePluggableDatabaseDetails."""
+
+    defined_tags: Optional[str] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__. __ https://docs.cloud.oracle.com/Content/General/Concepts/resourcetags.htm",
+    )
+    freeform_tags: Optional[str] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}` __ https://docs.cloud.oracle.com/Content/General/Concepts/resourcetags.htm',
+    )
+
+
+def map_updatepluggabledatabasedetails(
+    o: oci.database.models.UpdatePluggableDatabaseDetails,
+    fields: Optional[list[str]] = None,
+) -> UpdatePluggableDatabaseDetails | None:
+    """Map oci.database.models.UpdatePluggableDatabaseDetails → UpdatePluggableDatabaseDetails Pydantic model."""
+    return map_model(UpdatePluggableDatabaseDetails, o, fields)
+
+
+class PluggableDatabaseSummary(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.PluggableDatabaseSummary."""
+
+    compartment_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the compartment_id of this PluggableDatabaseSummary. The `OCID`__ of the compartment.",
+    )
+    connection_strings: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    container_database_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the container_database_id of this PluggableDatabaseSummary. The `OCID`__ of the CDB.",
+    )
+    defined_tags: Optional[Any] = Field(
+        None,
+        description="Defined tags for this resource. Each key is predefined and scoped to a namespace. For more information, see `Resource Tags`__.",
+    )
+    freeform_tags: Optional[Any] = Field(
+        None,
+        description='Free-form tags for this resource. Each tag is a simple key-value pair with no predefined name, type, or namespace. For more information, see `Resource Tags`__. Example: `{"Department": "Finance"}`',
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this PluggableDatabaseSummary. The `OCID`__ of the pluggable database.",
+    )
+    is_restricted: Optional[Any] = Field(
+        None,
+        description="The restricted mode of the pluggable database. If a pluggable database is opened in restricted mode, the user needs both create a session and have restricted session privileges to connect to it.",
+    )
+    kms_key_id: Optional[Any] = Field(
+        None,
+        description="The OCID of the key container that is used as the master encryption key in database transparent data encryption (TDE) operations.",
+    )
+    kms_key_version_id: Optional[Any] = Field(
+        None,
+        description="The OCID of the key container version that is used in database transparent data encryption (TDE) operations KMS Key can have multiple key versions. If none is specified, the current key version (latest) of the Key Id is used for the operation. Autonomous Database Serverless does not use key versions, hence is not applicable for Autonomous Database Serverless instances.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Detailed message for the lifecycle state.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this PluggableDatabaseSummary. The current state of the pluggable database. Allowed values for this property are: "PROVISIONING", "AVAILABLE", "TERMINATING", "TERMINATED", "UPDATING", "FAILED", "RELOCATING", "RELOCATED", "REFRESHING", "RESTORE_IN_PROGRESS", "RESTORE_FAILED", "BACKUP_IN_PROGRESS", "DISABLED", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    open_mode: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the open_mode of this PluggableDatabaseSummary. **Deprecated.** Use :func:`pluggable_database_node_level_details` for OpenMode details. The mode that pluggable database is in. Open mode can only be changed to READ_ONLY or MIGRATE directly from the backend (within the Oracle Database software). Allowed values for this property are: "READ_ONLY", "READ_WRITE", "MOUNTED", "MIGRATE", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    pdb_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the pdb_name of this PluggableDatabaseSummary. The name for the pluggable database (PDB). The name is unique in the context of a :class:`Database`. The name must begin with an alphabetic character and can contain a maximum of thirty alphanumeric characters. Special characters are not permitted. The pluggable database name should not be same as the container database name.",
+    )
+    pdb_node_level_details: Optional[Any] = Field(
+        None,
+        description='Pluggable Database Node Level Details. Example: [{"nodeName" : "node1", "openMode" : "READ_WRITE"}, {"nodeName" : "node2", "openMode" : "READ_ONLY"}]',
+    )
+    pluggable_database_management_config: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    refreshable_clone_config: Optional[Any] = Field(
+        None,
+        description="",
+    )
+    time_created: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the time_created of this PluggableDatabaseSummary. The date and time the pluggable database was created.",
+    )
+
+
+def map_pluggabledatabasesummary(
+    o: oci.database.models.PluggableDatabaseSummary,
+    fields: Optional[list[str]] = None,
+) -> PluggableDatabaseSummary | None:
+    """Map oci.database.models.PluggableDatabaseSummary → PluggableDatabaseSummary Pydantic model."""
+    return map_model(PluggableDatabaseSummary, o, fields)
+
+
+class PdbConversionHistoryEntry(OCIBaseModel):
+    """Pydantic model mirroring oci.database.models.PdbConversionHistoryEntry."""
+
+    action: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the action of this PdbConversionHistoryEntry. The operations used to convert a non-container database to a pluggable database. - Use `PRECHECK` to run a pre-check operation on non-container database prior to converting it into a pluggable database. - Use `CONVERT` to convert a non-container database into a pluggable database. - Use `SYNC` if the non-container database was manually converted into a pluggable database using the dbcli command-line utility. Databases may need to be converted manually if the CONVERT action fails when converting a non-container database using the API. - Use `SYNC_ROLLBACK` if the conversion of a non-container database into a pluggable database was manually rolled back using the dbcli command line utility. Conversions may need to be manually rolled back if the CONVERT action fails when converting a non-container database using the API. Allowed values for this property are: "PRECHECK", "CONVERT", "SYNC", "SYNC_ROLLBACK", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    additional_cdb_params: Optional[Any] = Field(
+        None,
+        description="Additional container database parameter.",
+    )
+    cdb_name: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the cdb_name of this PdbConversionHistoryEntry. The database name. The name must begin with an alphabetic character and can contain a maximum of 8 alphanumeric characters. Special characters are not permitted. The database name must be unique in the tenancy.",
+    )
+    id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the id of this PdbConversionHistoryEntry. The `OCID`__ of the database conversion history.",
+    )
+    lifecycle_details: Optional[Any] = Field(
+        None,
+        description="Additional information about the current lifecycle state for the conversion operation.",
+    )
+    lifecycle_state: Optional[Any] = Field(
+        None,
+        description='**[Required]** Gets the lifecycle_state of this PdbConversionHistoryEntry. Status of an operation performed during the conversion of a non-container database to a pluggable database. Allowed values for this property are: "SUCCEEDED", "FAILED", "IN_PROGRESS", \'UNKNOWN_ENUM_VALUE\'. Any unrecognized values returned by a service will be mapped to \'UNKNOWN_ENUM_VALUE\'.',
+    )
+    source_database_id: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the source_database_id of this PdbConversionHistoryEntry. The `OCID`__ of the database.",
+    )
+    target: Optional[Any] = Field(
+        None,
+        description="The target container database of the pluggable database created by the database conversion operation. Currently, the database conversion operation only supports creating the pluggable database in a new container database. - Use `NEW_DATABASE` to specify that the pluggable database be created within a new container database in the same database home. Allowed values for this property are: \"NEW_DATABASE\", 'UNKNOWN_ENUM_VALUE'. Any unrecognized values returned by a service will be mapped to 'UNKNOWN_ENUM_VALUE'.",
+    )
+    target_database_id: Optional[Any] = Field(
+        None,
+        description="The `OCID`__ of the database.",
+    )
+    time_ended: Optional[Any] = Field(
+        None,
+        description="The date and time when the database conversion operation ended.",
+    )
+    time_started: Optional[Any] = Field(
+        None,
+        description="**[Required]** Gets the time_started of this PdbConversionHistoryEntry. The date and time when the database conversion operation started.",
+    )
+
+
+def map_pdbconversionhistoryentry(
+    o: oci.database.models.PdbConversionHistoryEntry,
+    fields: Optional[list[str]] = None,
+) -> PdbConversionHistoryEntry | None:
+    """Map oci.database.models.PdbConversionHistoryEntry → PdbConversionHistoryEntry Pydantic model."""
+    return map_model(PdbConversionHistoryEntry, o, fields)
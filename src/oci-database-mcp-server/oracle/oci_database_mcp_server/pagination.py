@@ -0,0 +1,177 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import base64
+import json
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Generic, List, Optional, Tuple, TypeVar
+
+from pydantic import BaseModel, Field
+
+T = TypeVar("T")
+
+DEFAULT_MAX_ITEMS = int(os.getenv("ORACLE_MCP_DATABASE_MAX_ITEMS") or 1000)
+
+# page tokens that resume inside a page carry this prefix
+_CURSOR_PREFIX = "mcp-page."
+
+# fetches the next page of a listing while the current one is mapped
+_prefetcher = ThreadPoolExecutor(
+    max_workers=int(os.getenv("ORACLE_MCP_DATABASE_PREFETCH_WORKERS") or 8),
+    thread_name_prefix="list-prefetch",
+)
+
+# lists the regions of a multi-region call
+_region_pool = ThreadPoolExecutor(
+    max_workers=int(os.getenv("ORACLE_MCP_DATABASE_REGION_WORKERS") or 8),
+    thread_name_prefix="list-region",
+)
+
+
+class RegionPage(BaseModel, Generic[T]):
+    """Items of one region of a multi-region listing"""
+
+    region: str = Field(..., description="The region listed.")
+    items: List[T] = Field(default_factory=list, description="The items listed.")
+    next_page: Optional[str] = Field(
+        None,
+        description=(
+            "Pass as `page`, with this `region`, to continue the listing of the "
+            "region; null when it is complete."
+        ),
+    )
+    error: Optional[str] = Field(
+        None, description="Why the region could not be listed, if it failed."
+    )
+    age_seconds: Optional[float] = Field(
+        None,
+        description=(
+            "Seconds since the items were listed from OCI, when they come from "
+            "the inventory cache; null when they were listed for this call."
+        ),
+    )
+
+
+class ListPage(BaseModel, Generic[T]):
+    """Items of a listing, with the token to continue it"""
+
+    items: List[T] = Field(default_factory=list, description="The items listed.")
+    next_page: Optional[str] = Field(
+        None,
+        description=(
+            "Pass as `page` to continue the listing after these items; null when "
+            "the listing is complete."
+        ),
+    )
+    regions: Optional[List[RegionPage[T]]] = Field(
+        None,
+        description=(
+            "The listing of each region, when the tool was called with `regions`; "
+            "`items` is empty then."
+        ),
+    )
+    age_seconds: Optional[float] = Field(
+        None,
+        description=(
+            "Seconds since the items were listed from OCI, when they come from "
+            "the inventory cache; null when they were listed for this call."
+        ),
+    )
+
+
+def encode_page(token: Optional[str], skip: int) -> Optional[str]:
+    """Returns the page token resuming `skip` items into the page of `token`"""
+    if not skip:
+        return token
+    cursor = json.dumps({"page": token, "skip": skip}).encode("utf-8")
+    return _CURSOR_PREFIX + base64.urlsafe_b64encode(cursor).decode("ascii")
+
+
+def decode_page(page: Optional[str]) -> Tuple[Optional[str], int]:
+    """Returns the OCI page token and the number of its items already listed"""
+    if not page or not page.startswith(_CURSOR_PREFIX):
+        return page, 0
+    try:
+        cursor = json.loads(base64.urlsafe_b64decode(page[len(_CURSOR_PREFIX) :]))
+        return cursor["page"], int(cursor["skip"])
+    except (ValueError, KeyError, TypeError):
+        raise ValueError(f"Invalid page token: {page}")
+
+
+def paginate(
+    list_call: Callable[..., Any],
+    map_item: Callable[[Any], T],
+    max_items: Optional[int] = None,
+    **kwargs,
+) -> ListPage[T]:
+    """
+    Calls an OCI list operation page after page until `max_items` items
+    (default ORACLE_MCP_DATABASE_MAX_ITEMS) are listed or the listing ends.
+
+    The next page is requested in the background as soon as a page arrives,
+    so it is fetched while the items of the current page are mapped. When
+    the budget ends inside a page, the returned `next_page` resumes at the
+    first item not returned.
+    """
+    budget = max_items if max_items and max_items > 0 else DEFAULT_MAX_ITEMS
+    token, skip = decode_page(kwargs.pop("page", None))
+
+    def fetch(page_token: Optional[str]):
+        if page_token:
+            return list_call(page=page_token, **kwargs)
+        return list_call(**kwargs)
+
+    items: List[T] = []
+    response = fetch(token)
+    while True:
+        data = list(response.data or [])[skip:]
+        next_token = getattr(response, "next_page", None)
+        if not isinstance(next_token, str):
+            next_token = None
+        remaining = budget - len(items)
+        if len(data) > remaining:
+            items.extend(map_item(item) for item in data[:remaining])
+            return ListPage.model_construct(
+                items=items, next_page=encode_page(token, skip + remaining)
+            )
+        prefetch: Optional[Future] = None
+        if next_token and len(data) < remaining:
+            prefetch = _prefetcher.submit(fetch, next_token)
+        try:
+            items.extend(map_item(item) for item in data)
+        except BaseException:
+            if prefetch is not None:
+                prefetch.cancel()
+            raise
+        if prefetch is None:
+            return ListPage.model_construct(items=items, next_page=next_token)
+        token, skip = next_token, 0
+        response = prefetch.result()
+
+
+def paginate_regions(
+    regions: List[str], list_region: Callable[[str], ListPage[T]]
+) -> ListPage[T]:
+    """
+    Lists every region concurrently with `list_region(region)`. A region that
+    fails is reported with its error; the others are listed.
+    """
+
+    def list_one(region: str) -> RegionPage[T]:
+        try:
+            page = list_region(region)
+        except Exception as e:
+            return RegionPage.model_construct(region=region, items=[], error=str(e))
+        return RegionPage.model_construct(
+            region=region,
+            items=page.items,
+            next_page=page.next_page,
+            age_seconds=page.age_seconds,
+        )
+
+    pages = list(_region_pool.map(list_one, dict.fromkeys(regions)))
+    return ListPage.model_construct(items=[], next_page=None, regions=pages)
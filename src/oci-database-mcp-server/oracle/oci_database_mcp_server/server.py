@@ -4,316 +4,218 @@ Licensed under the Universal Permissive License v1.0 as shown at
 https://oss.oracle.com/licenses/upl.
 """
 
+from __future__ import annotations
+
+import argparse
+import asyncio
+import functools
 import os
+import threading
 from logging import Logger
-from typing import Annotated, Any, Optional
+from typing import Annotated, Any, Dict, Optional
 
 import oci
 from fastmcp import FastMCP
+from fastmcp.server.dependencies import get_context
+from fastmcp.server.middleware import Middleware
+from fastmcp.tools import FunctionTool
 from oci.database.models import (
     CreatePluggableDatabaseFromLocalCloneDetails,
     CreatePluggableDatabaseFromRelocateDetails,
     CreatePluggableDatabaseFromRemoteCloneDetails,
 )
 from oci.util import to_dict
-from oracle.oci_database_mcp_server.models import (
-    ApplicationVip,
-    ApplicationVipSummary,
-    AutonomousContainerDatabase,
-    AutonomousContainerDatabaseDataguardAssociation,
-    AutonomousContainerDatabaseResourceUsage,
-    AutonomousContainerDatabaseSummary,
-    AutonomousContainerDatabaseVersionSummary,
-    AutonomousDatabase,
-    AutonomousDatabaseBackup,
-    AutonomousDatabaseBackupSummary,
-    AutonomousDatabaseCharacterSets,
-    AutonomousDatabaseDataguardAssociation,
-    AutonomousDatabasePeerCollection,
-    AutonomousDatabaseSoftwareImage,
-    AutonomousDatabaseSoftwareImageCollection,
-    AutonomousDatabaseSummary,
-    AutonomousDatabaseWallet,
-    AutonomousDbPreviewVersionSummary,
-    AutonomousDbVersionSummary,
-    AutonomousExadataInfrastructure,
-    AutonomousPatch,
-    AutonomousPatchSummary,
-    AutonomousVirtualMachine,
-    AutonomousVirtualMachineSummary,
-    AutonomousVmCluster,
-    AutonomousVmClusterResourceUsage,
-    AutonomousVmClusterSummary,
-    Backup,
-    BackupDestination,
-    BackupDestinationSummary,
-    BackupSummary,
-    CloudAutonomousVmCluster,
-    CloudAutonomousVmClusterResourceUsage,
-    CloudAutonomousVmClusterSummary,
-    CloudExadataInfrastructure,
-    CloudExadataInfrastructureSummary,
-    CloudExadataInfrastructureUnallocatedResources,
-    CloudVmCluster,
-    CloudVmClusterSummary,
-    ConsoleConnection,
-    ConsoleConnectionSummary,
-    ConsoleHistory,
-    ConsoleHistoryCollection,
-    CreatePluggableDatabaseDetails,
-    Database,
-    DatabaseSoftwareImage,
-    DatabaseSoftwareImageSummary,
-    DatabaseSummary,
-    DatabaseUpgradeHistoryEntry,
-    DataGuardAssociation,
-    DataGuardAssociationSummary,
-    DbHome,
-    DbHomeSummary,
-    DbNode,
-    DbNodeSummary,
-    DbServer,
-    DbServerSummary,
-    DbSystem,
-    DbSystemComputePerformanceSummary,
-    DbSystemShapeSummary,
-    DbSystemStoragePerformanceSummary,
-    DbSystemSummary,
-    DbSystemUpgradeHistoryEntry,
-    DbVersionSummary,
-    ExadataInfrastructure,
-    ExadataInfrastructureSummary,
-    ExadataInfrastructureUnAllocatedResources,
-    ExadataIormConfig,
-    ExadbVmCluster,
-    ExadbVmClusterSummary,
-    ExadbVmClusterUpdate,
-    ExadbVmClusterUpdateHistoryEntry,
-    ExadbVmClusterUpdateSummary,
-    ExascaleDbStorageVault,
-    ExascaleDbStorageVaultSummary,
-    ExecutionAction,
-    ExecutionActionSummary,
-    ExecutionWindow,
-    ExecutionWindowSummary,
-    ExternalBackupJob,
-    ExternalContainerDatabase,
-    ExternalContainerDatabaseSummary,
-    ExternalDatabaseConnector,
-    ExternalDatabaseConnectorSummary,
-    ExternalNonContainerDatabase,
-    ExternalNonContainerDatabaseSummary,
-    ExternalPluggableDatabase,
-    ExternalPluggableDatabaseSummary,
-    FlexComponentCollection,
-    GiMinorVersionSummary,
-    GiVersionSummary,
-    InfrastructureTargetVersion,
-    KeyStore,
-    KeyStoreSummary,
-    MaintenanceRun,
-    MaintenanceRunHistory,
-    MaintenanceRunHistorySummary,
-    MaintenanceRunSummary,
-    OCPUs,
-    OneoffPatch,
-    OneoffPatchSummary,
-    Patch,
-    PatchHistoryEntry,
-    PatchHistoryEntrySummary,
-    PatchSummary,
-    PdbConversionHistoryEntry,
-    PluggableDatabase,
-    PluggableDatabaseSummary,
-    RefreshableCloneCollection,
-    ResourcePoolShapeCollection,
-    ScheduledAction,
-    ScheduledActionCollection,
-    SchedulingPlan,
-    SchedulingPlanCollection,
-    SchedulingPolicy,
-    SchedulingPolicySummary,
-    SchedulingWindow,
-    SchedulingWindowSummary,
-    SystemVersionCollection,
-    Update,
-    UpdateHistoryEntry,
-    UpdatePluggableDatabaseDetails,
-    UpdateSummary,
-    VmCluster,
-    VmClusterNetwork,
-    VmClusterNetworkSummary,
-    VmClusterSummary,
-    VmClusterUpdate,
-    VmClusterUpdateHistoryEntry,
-    VmClusterUpdateSummary,
-    map_applicationvip,
-    map_applicationvipsummary,
-    map_autonomouscontainerdatabase,
-    map_autonomouscontainerdatabasedataguardassociation,
-    map_autonomouscontainerdatabaseresourceusage,
-    map_autonomouscontainerdatabasesummary,
-    map_autonomouscontainerdatabaseversionsummary,
-    map_autonomousdatabase,
-    map_autonomousdatabasebackup,
-    map_autonomousdatabasebackupsummary,
-    map_autonomousdatabasecharactersets,
-    map_autonomousdatabasedataguardassociation,
-    map_autonomousdatabasepeercollection,
-    map_autonomousdatabasesoftwareimage,
-    map_autonomousdatabasesoftwareimagecollection,
-    map_autonomousdatabasesummary,
-    map_autonomousdatabasewallet,
-    map_autonomousdbpreviewversionsummary,
-    map_autonomousdbversionsummary,
-    map_autonomousexadatainfrastructure,
-    map_autonomouspatch,
-    map_autonomouspatchsummary,
-    map_autonomousvirtualmachine,
-    map_autonomousvirtualmachinesummary,
-    map_autonomousvmcluster,
-    map_autonomousvmclusterresourceusage,
-    map_autonomousvmclustersummary,
-    map_backup,
-    map_backupdestination,
-    map_backupdestinationsummary,
-    map_backupsummary,
-    map_cloudautonomousvmcluster,
-    map_cloudautonomousvmclusterresourceusage,
-    map_cloudautonomousvmclustersummary,
-    map_cloudexadatainfrastructure,
-    map_cloudexadatainfrastructuresummary,
-    map_cloudexadatainfrastructureunallocatedresources,
-    map_cloudvmcluster,
-    map_cloudvmclustersummary,
-    map_consoleconnection,
-    map_consoleconnectionsummary,
-    map_consolehistory,
-    map_consolehistorycollection,
-    map_database,
-    map_databasesoftwareimage,
-    map_databasesoftwareimagesummary,
-    map_databasesummary,
-    map_databaseupgradehistoryentry,
-    map_dataguardassociation,
-    map_dataguardassociationsummary,
-    map_dbhome,
-    map_dbhomesummary,
-    map_dbnode,
-    map_dbnodesummary,
-    map_dbserver,
-    map_dbserversummary,
-    map_dbsystem,
-    map_dbsystemcomputeperformancesummary,
-    map_dbsystemshapesummary,
-    map_dbsystemstorageperformancesummary,
-    map_dbsystemsummary,
-    map_dbsystemupgradehistoryentry,
-    map_dbversionsummary,
-    map_exadatainfrastructure,
-    map_exadatainfrastructuresummary,
-    map_exadatainfrastructureunallocatedresources,
-    map_exadataiormconfig,
-    map_exadbvmcluster,
-    map_exadbvmclustersummary,
-    map_exadbvmclusterupdate,
-    map_exadbvmclusterupdatehistoryentry,
-    map_exadbvmclusterupdatesummary,
-    map_exascaledbstoragevault,
-    map_exascaledbstoragevaultsummary,
-    map_executionaction,
-    map_executionactionsummary,
-    map_executionwindow,
-    map_executionwindowsummary,
-    map_externalbackupjob,
-    map_externalcontainerdatabase,
-    map_externalcontainerdatabasesummary,
-    map_externaldatabaseconnector,
-    map_externaldatabaseconnectorsummary,
-    map_externalnoncontainerdatabase,
-    map_externalnoncontainerdatabasesummary,
-    map_externalpluggabledatabase,
-    map_externalpluggabledatabasesummary,
-    map_flexcomponentcollection,
-    map_giminorversionsummary,
-    map_giversionsummary,
-    map_infrastructuretargetversion,
-    map_keystore,
-    map_keystoresummary,
-    map_maintenancerun,
-    map_maintenancerunhistory,
-    map_maintenancerunhistorysummary,
-    map_maintenancerunsummary,
-    map_ocpus,
-    map_oneoffpatch,
-    map_oneoffpatchsummary,
-    map_patch,
-    map_patchhistoryentry,
-    map_patchhistoryentrysummary,
-    map_patchsummary,
-    map_pdbconversionhistoryentry,
-    map_pluggabledatabase,
-    map_pluggabledatabasesummary,
-    map_refreshableclonecollection,
-    map_resourcepoolshapecollection,
-    map_scheduledaction,
-    map_scheduledactioncollection,
-    map_schedulingplan,
-    map_schedulingplancollection,
-    map_schedulingpolicy,
-    map_schedulingpolicysummary,
-    map_schedulingwindow,
-    map_schedulingwindowsummary,
-    map_systemversioncollection,
-    map_update,
-    map_updatehistoryentry,
-    map_updatesummary,
-    map_vmcluster,
-    map_vmclusternetwork,
-    map_vmclusternetworksummary,
-    map_vmclustersummary,
-    map_vmclusterupdate,
-    map_vmclusterupdatehistoryentry,
-    map_vmclusterupdatesummary,
+from oracle.oci_database_mcp_server import models
+from oracle.oci_database_mcp_server.client_pool import DatabaseClientPool
+from oracle.oci_database_mcp_server.inventory import InventoryCache, changed_family
+from oracle.oci_database_mcp_server.pagination import (
+    ListPage,
+    paginate,
+    paginate_regions,
 )
+from oracle.oci_database_mcp_server.tool_cache import ToolSchemaCache
+from oracle.oci_database_mcp_server.tool_groups import GROUPS, ToolGroups
+from oracle.oci_database_mcp_server.waiters import parse_states, wait_for_state
 
 from . import __project__, __version__
 
 logger = Logger(__name__, level="INFO")
 mcp = FastMCP(name=__project__)
 
+# Tool schemas are cached on disk, so that startup does not build (or even
+# import) the models of every tool
+tool_schemas = ToolSchemaCache(logger)
+
+# every tool of the server, enabled or not
+registered_tools: Dict[str, FunctionTool] = {}
+
+
+def tool(**kwargs):
+    register = tool_schemas.tool(mcp, **kwargs)
+
+    def decorator(fn) -> FunctionTool:
+        registered = register(fn)
+        registered_tools[registered.name] = registered
+        return registered
+
+    return decorator
+
+
+# One DatabaseClient per region, all signing with the same credentials
+_user_agent_name = __project__.split("oracle.", 1)[1].split("-server", 1)[0]
+client_pool = DatabaseClientPool(logger, f"{_user_agent_name}/{__version__}")
+
+# Listings of the fleet inventory, reused while fresh
+inventory = InventoryCache()
+
+
+class InventoryInvalidation(Middleware):
+    """
+    Drops the inventory listings in the region of a tool call that changed a
+    resource, once the call succeeds
+    """
+
+    async def on_call_tool(self, context, call_next):
+        result = await call_next(context)
+        family = changed_family(context.message.name)
+        if family is not None:
+            region = (context.message.arguments or {}).get("region")
+            inventory.invalidate_family(family, region)
+        return result
+
+
+mcp.add_middleware(InventoryInvalidation())
+
 
 def get_database_client(region: str = None):
-    config = oci.config.from_file(
-        file_location=os.getenv("OCI_CONFIG_FILE", oci.config.DEFAULT_LOCATION),
-        profile_name=os.getenv("OCI_CONFIG_PROFILE", oci.config.DEFAULT_PROFILE),
-    )
-    user_agent_name = __project__.split("oracle.", 1)[1].split("-server", 1)[0]
-    config["additional_user_agent"] = f"{user_agent_name}/{__version__}"
-    private_key = oci.signer.load_private_key_from_file(config["key_file"])
-    token_file = config["security_token_file"]
-    with open(token_file, "r") as f:
-        token = f.read()
-    signer = oci.auth.signers.SecurityTokenSigner(token, private_key)
-    if region is None:
-        return oci.database.DatabaseClient(config, signer=signer)
-    regional_config = config.copy()
-    regional_config["region"] = region
-    return oci.database.DatabaseClient(regional_config, signer=signer)
+    return client_pool.get(region)
+
+
+ALL_SUBSCRIBED = ("all subscribed", "all", "subscribed")
+
+
+def resolve_regions(regions: list[str] | str) -> list[str]:
+    """
+    Returns the regions of a `regions` argument: a list or comma-separated
+    string of region identifiers, or "all subscribed"
+    """
+    if isinstance(regions, str):
+        regions = regions.split(",")
+    regions = [region.strip() for region in regions if region and region.strip()]
+    if len(regions) == 1 and regions[0].lower() in ALL_SUBSCRIBED:
+        return client_pool.subscribed_regions()
+    return regions
+
+
+def list_resources(
+    operation: str,
+    map_item,
+    region: Optional[str],
+    regions: Optional[list[str] | str],
+    max_items: Optional[int],
+    fields: Optional[list[str]] = None,
+    inventory_type: Optional[str] = None,
+    refresh: bool = False,
+    **kwargs,
+) -> ListPage:
+    """
+    Lists with the `operation` of DatabaseClient in `region`, or concurrently
+    in each of `regions`, mapping only `fields` of each item if given.
+    Listings of an `inventory_type` are served from the inventory cache while
+    they are fresh, unless `refresh` is set.
+    """
+    if fields:
+        map_item = functools.partial(map_item, fields=fields)
+
+    def list_region(name: Optional[str]) -> ListPage:
+        if inventory_type and not refresh:
+            cached = inventory.get(inventory_type, name, max_items, kwargs, fields)
+            if cached is not None:
+                return cached
+        client = get_database_client(name)
+        page = paginate(getattr(client, operation), map_item, max_items, **kwargs)
+        if inventory_type:
+            inventory.put(inventory_type, name, max_items, kwargs, page, fields)
+        return page
+
+    if not regions:
+        return list_region(region)
+    if kwargs.get("page"):
+        raise ValueError(
+            "A page token continues the listing of a single region, "
+            "pass it with `region` instead of `regions`"
+        )
+    return paginate_regions(resolve_regions(regions), list_region)
 
 
 def call_create_pdb(client, details, opc_retry_token=None, opc_request_id=None):
+    """Returns the created pluggable database and the id of its work request"""
     kwargs = {"create_pluggable_database_details": details.__dict__}
     if opc_retry_token:
         kwargs["opc_retry_token"] = opc_retry_token
     if opc_request_id:
         kwargs["opc_request_id"] = opc_request_id
     response = client.create_pluggable_database(**kwargs)
-    return map_pluggabledatabase(response.data)
+    return (
+        models.map_pluggabledatabase(response.data),
+        response.headers.get("opc-work-request-id"),
+    )
+
+
+# arguments of the tools that can wait for the pluggable database they change
+WaitForState = Annotated[
+    Optional[list[str] | str],
+    (
+        "Lifecycle states to wait for before returning, e.g. AVAILABLE"
+        " (or TERMINATED for a delete); returns as soon as the request"
+        " is accepted by default. The operation's work request and then"
+        " the pluggable database are polled with exponential backoff, and"
+        " each poll is sent as a progress notification."
+    ),
+]
+MaxWaitSeconds = Annotated[
+    Optional[float],
+    "Longest to wait for `wait_for_state`, 1800 seconds by default.",
+]
+
+
+async def wait_for_pluggable_database(
+    region: Optional[str],
+    pluggable_database_id: str,
+    states: list[str] | str,
+    max_wait_seconds: Optional[float],
+    work_request_id: Optional[str] = None,
+) -> Optional[models.PluggableDatabase]:
+    """
+    Waits for a pluggable database to reach one of `states`, following the
+    work request of the operation if there is one, and reports each poll to
+    the client as progress. The listings the accepted change made stale are
+    dropped before waiting; InventoryInvalidation drops them again after.
+    """
+    inventory.invalidate_family("pluggable_database", region)
+    client = get_database_client(region)
+    get_work_request = None
+    if work_request_id:
+        work_requests = client_pool.work_requests(region)
+
+        def get_work_request():
+            return work_requests.get_work_request(work_request_id).data
+
+    def get_resource():
+        return client.get_pluggable_database(pluggable_database_id).data
+
+    pdb = await wait_for_state(
+        get_resource,
+        parse_states(states),
+        get_work_request,
+        max_wait_seconds,
+        get_context().report_progress,
+    )
+    return models.map_pluggabledatabase(pdb)
 
 
-@mcp.tool(description="Deletes the specified pluggable database.")
-def delete_pluggable_database(
+@tool(description="Deletes the specified pluggable database.")
+async def delete_pluggable_database(
     pluggable_database_id: Annotated[
         Optional[str],
         "The database `OCID`__. __ https://docs.cloud.oracle.com/Content/General/Concepts/identifiers.htm",
@@ -325,6 +227,8 @@ def delete_pluggable_database(
     opc_request_id: Annotated[
         Optional[str], "Unique identifier for the request."
     ] = None,
+    wait_for_state: WaitForState = None,
+    max_wait_seconds: MaxWaitSeconds = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
@@ -338,60 +242,80 @@ def delete_pluggable_database(
             kwargs["if_match"] = if_match
         if opc_request_id is not None:
             kwargs["opc_request_id"] = opc_request_id
-        response: oci.response.Response = client.delete_pluggable_database(**kwargs)
+        response: oci.response.Response = await asyncio.to_thread(
+            client.delete_pluggable_database, **kwargs
+        )
+        if wait_for_state:
+            return await wait_for_pluggable_database(
+                region,
+                pluggable_database_id,
+                wait_for_state,
+                max_wait_seconds,
+                response.headers.get("opc-work-request-id"),
+            )
         return to_dict(response.data)
     except Exception as e:
         logger.error(f"Error in delete_pluggable_database tool: {e}")
         raise
 
 
-@mcp.tool(description="Gets information about the specified pluggable database.")
+@tool(description="Gets information about the specified pluggable database.")
 def get_pluggable_database(
     pluggable_database_id: Annotated[
         Optional[str],
         "The database `OCID`__. __ https://docs.cloud.oracle.com/Content/General/Concepts/identifiers.htm",
     ],
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> PluggableDatabase:
+) -> models.PluggableDatabase:
     try:
         client = get_database_client(region)
         kwargs = {}
         kwargs["pluggable_database_id"] = pluggable_database_id
         response: oci.response.Response = client.get_pluggable_database(**kwargs)
-        return map_pluggabledatabase(response.data)
+        return models.map_pluggabledatabase(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_pluggable_database tool: {e}")
         raise
 
 
-@mcp.tool(description="Updates the specified pluggable database.")
-def update_pluggable_database(
+@tool(description="Updates the specified pluggable database.")
+async def update_pluggable_database(
     pluggable_database_id: Annotated[
         Optional[str],
         "The database `OCID`__. __ https://docs.cloud.oracle.com/Content/General/Concepts/identifiers.htm",
     ],
     update_pluggable_database_details: Annotated[
-        dict | UpdatePluggableDatabaseDetails,
+        dict | models.UpdatePluggableDatabaseDetails,
         "Request to perform pluggable database update.",
     ],
     if_match: Annotated[
         Optional[str],
         "For optimistic concurrency control. In the PUT or DELETE call for a resource, set the `if-match` parameter to the value of the etag from a previous GET or POST response for that resource. The resource will be updated or deleted only if the etag you provide matches the resource's current etag value.",
     ] = None,
+    wait_for_state: WaitForState = None,
+    max_wait_seconds: MaxWaitSeconds = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> PluggableDatabase:
+) -> models.PluggableDatabase:
     try:
         client = get_database_client(region)
         kwargs = {}
         kwargs["pluggable_database_id"] = pluggable_database_id
         if isinstance(
-            update_pluggable_database_details, UpdatePluggableDatabaseDetails
+            update_pluggable_database_details, models.UpdatePluggableDatabaseDetails
         ):
             kwargs["update_pluggable_database_details"] = to_dict(
                 update_pluggable_database_details
@@ -402,15 +326,25 @@ def update_pluggable_database(
             )
         if if_match is not None:
             kwargs["if_match"] = if_match
-        response: oci.response.Response = client.update_pluggable_database(**kwargs)
-        return map_pluggabledatabase(response.data)
+        response: oci.response.Response = await asyncio.to_thread(
+            client.update_pluggable_database, **kwargs
+        )
+        if wait_for_state:
+            return await wait_for_pluggable_database(
+                region,
+                pluggable_database_id,
+                wait_for_state,
+                max_wait_seconds,
+                response.headers.get("opc-work-request-id"),
+            )
+        return models.map_pluggabledatabase(response.data)
     except Exception as e:
         logger.error(f"Error in update_pluggable_database tool: {e}")
         raise
 
 
-@mcp.tool(description="Create a new pluggable database.")
-def create_pluggable_database(
+@tool(description="Create a new pluggable database.")
+async def create_pluggable_database(
     pdb_name: str,
     container_database_id: str,
     pdb_admin_password: str,
@@ -422,6 +356,8 @@ def create_pluggable_database(
     defined_tags: Optional[dict] = None,
     opc_retry_token: Optional[str] = None,
     opc_request_id: Optional[str] = None,
+    wait_for_state: WaitForState = None,
+    max_wait_seconds: MaxWaitSeconds = None,
     region: Optional[str] = None,
 ):
     try:
@@ -446,18 +382,25 @@ def create_pluggable_database(
         if opc_request_id is not None:
             kwargs["opc_request_id"] = opc_request_id
 
-        resp = client.create_pluggable_database(**kwargs)
-        return map_pluggabledatabase(resp.data)
+        resp = await asyncio.to_thread(client.create_pluggable_database, **kwargs)
+        pdb = models.map_pluggabledatabase(resp.data)
+        if wait_for_state:
+            return await wait_for_pluggable_database(
+                region,
+                pdb.id,
+                wait_for_state,
+                max_wait_seconds,
+                resp.headers.get("opc-work-request-id"),
+            )
+        return pdb
 
     except Exception as e:
         logger.error(f"Error in create_pdb_new: {e}")
         raise
 
 
-@mcp.tool(
-    description="Create a pluggable database from a local clone (LOCAL_CLONE_PDB)."
-)
-def create_pluggable_database_from_local_clone(
+@tool(description="Create a pluggable database from a local clone (LOCAL_CLONE_PDB).")
+async def create_pluggable_database_from_local_clone(
     pdb_name: str,
     container_database_id: str,
     pdb_admin_password: str,
@@ -472,6 +415,8 @@ def create_pluggable_database_from_local_clone(
     defined_tags: Optional[dict] = None,
     opc_retry_token: Optional[str] = None,
     opc_request_id: Optional[str] = None,
+    wait_for_state: WaitForState = None,
+    max_wait_seconds: MaxWaitSeconds = None,
     region: Optional[str] = None,
 ):
     try:
@@ -484,7 +429,7 @@ def create_pluggable_database_from_local_clone(
             source_pluggable_database_id=source_pluggable_database_id,
         )
 
-        details = CreatePluggableDatabaseDetails(
+        details = models.CreatePluggableDatabaseDetails(
             pdb_name=pdb_name,
             container_database_id=container_database_id,
             pdb_admin_password=pdb_admin_password,
@@ -497,7 +442,14 @@ def create_pluggable_database_from_local_clone(
             pdb_creation_type_details=to_dict(clone_details),
         )
 
-        return call_create_pdb(client, details, opc_retry_token, opc_request_id)
+        pdb, work_request_id = await asyncio.to_thread(
+            call_create_pdb, client, details, opc_retry_token, opc_request_id
+        )
+        if wait_for_state:
+            return await wait_for_pluggable_database(
+                region, pdb.id, wait_for_state, max_wait_seconds, work_request_id
+            )
+        return pdb
 
     except Exception as e:
         logger.error(f"Error in create_pdb_from_local_clone: {e}")
@@ -505,10 +457,10 @@ def create_pluggable_database_from_local_clone(
 
 
 # 2) Remote Clone
-@mcp.tool(
+@tool(
     description="Create a pluggable database by cloning from a remote source CDB (REMOTE_CLONE_PDB)."
 )
-def create_pluggable_database_from_remote_clone(
+async def create_pluggable_database_from_remote_clone(
     pdb_name: str,
     container_database_id: str,
     pdb_admin_password: str,
@@ -524,6 +476,8 @@ def create_pluggable_database_from_remote_clone(
     defined_tags: Optional[dict] = None,
     opc_retry_token: Optional[str] = None,
     opc_request_id: Optional[str] = None,
+    wait_for_state: WaitForState = None,
+    max_wait_seconds: MaxWaitSeconds = None,
     region: Optional[str] = None,
 ):
     try:
@@ -537,7 +491,7 @@ def create_pluggable_database_from_remote_clone(
             source_container_database_admin_password=source_container_database_admin_password,
         )
 
-        details = CreatePluggableDatabaseDetails(
+        details = models.CreatePluggableDatabaseDetails(
             pdb_name=pdb_name,
             container_database_id=container_database_id,
             pdb_admin_password=pdb_admin_password,
@@ -550,17 +504,24 @@ def create_pluggable_database_from_remote_clone(
             pdb_creation_type_details=to_dict(remote_details),
         )
 
-        return call_create_pdb(client, details, opc_retry_token, opc_request_id)
+        pdb, work_request_id = await asyncio.to_thread(
+            call_create_pdb, client, details, opc_retry_token, opc_request_id
+        )
+        if wait_for_state:
+            return await wait_for_pluggable_database(
+                region, pdb.id, wait_for_state, max_wait_seconds, work_request_id
+            )
+        return pdb
 
     except Exception as e:
         logger.error(f"Error in create_pdb_from_remote_clone: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description="Relocate (move) a pluggable database from a source CDB into the target CDB (RELOCATE_PDB)."
 )
-def create_pluggable_database_from_relocate(
+async def create_pluggable_database_from_relocate(
     pdb_name: str,
     container_database_id: str,
     pdb_admin_password: str,
@@ -576,6 +537,8 @@ def create_pluggable_database_from_relocate(
     defined_tags: Optional[dict] = None,
     opc_retry_token: Optional[str] = None,
     opc_request_id: Optional[str] = None,
+    wait_for_state: WaitForState = None,
+    max_wait_seconds: MaxWaitSeconds = None,
     region: Optional[str] = None,
 ):
     try:
@@ -589,7 +552,7 @@ def create_pluggable_database_from_relocate(
             source_container_database_admin_password=source_container_database_admin_password,
         )
 
-        details = CreatePluggableDatabaseDetails(
+        details = models.CreatePluggableDatabaseDetails(
             pdb_name=pdb_name,
             container_database_id=container_database_id,
             pdb_admin_password=pdb_admin_password,
@@ -602,14 +565,21 @@ def create_pluggable_database_from_relocate(
             pdb_creation_type_details=to_dict(relocate_details),
         )
 
-        return call_create_pdb(client, details, opc_retry_token, opc_request_id)
+        pdb, work_request_id = await asyncio.to_thread(
+            call_create_pdb, client, details, opc_retry_token, opc_request_id
+        )
+        if wait_for_state:
+            return await wait_for_pluggable_database(
+                region, pdb.id, wait_for_state, max_wait_seconds, work_request_id
+            )
+        return pdb
 
     except Exception as e:
         logger.error(f"Error in create_pdb_from_relocate: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets a list of application virtual IP (VIP) addresses on a cloud VM cluster."
     )
@@ -658,13 +628,35 @@ def list_application_vips(
             '"TERMINATED", "FAILED"'
         ),
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[ApplicationVipSummary]:
+) -> ListPage[models.ApplicationVipSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["compartment_id"] = compartment_id
         kwargs["cloud_vm_cluster_id"] = cloud_vm_cluster_id
@@ -680,14 +672,21 @@ def list_application_vips(
             kwargs["sort_by"] = sort_by
         if lifecycle_state is not None:
             kwargs["lifecycle_state"] = lifecycle_state
-        response: oci.response.Response = client.list_application_vips(**kwargs)
-        return [map_applicationvipsummary(item) for item in response.data]
+        return list_resources(
+            "list_application_vips",
+            models.map_applicationvipsummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
+        )
     except Exception as e:
         logger.error(f"Error in list_application_vips tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets a list of the Autonomous Container Databases with Autonomous Data Guard-"
         "enabled associated with the specified Autonomous Container Database."
@@ -703,26 +702,50 @@ def list_autonomous_container_database_dataguard_associations(
     page: Annotated[
         Optional[Any], ("The pagination token to continue listing from.")
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[AutonomousContainerDatabaseDataguardAssociation]:
+) -> ListPage[models.AutonomousContainerDatabaseDataguardAssociation]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["autonomous_container_database_id"] = autonomous_container_database_id
         if limit is not None:
             kwargs["limit"] = limit
         if page is not None:
             kwargs["page"] = page
-        response: oci.response.Response = (
-            client.list_autonomous_container_database_dataguard_associations(**kwargs)
+        return list_resources(
+            "list_autonomous_container_database_dataguard_associations",
+            models.map_autonomouscontainerdatabasedataguardassociation,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
         )
-        return [
-            map_autonomouscontainerdatabasedataguardassociation(item)
-            for item in response.data
-        ]
     except Exception as e:
         logger.error(
             f"Error in list_autonomous_container_database_dataguard_associations tool: {e}"
@@ -730,9 +753,7 @@ def list_autonomous_container_database_dataguard_associations(
         raise
 
 
-@mcp.tool(
-    description=("Gets a list of supported Autonomous Container Database versions.")
-)
+@tool(description=("Gets a list of supported Autonomous Container Database versions."))
 def list_autonomous_container_database_versions(
     compartment_id: Annotated[Optional[Any], ("The compartment `OCID`__.")],
     service_component: Annotated[
@@ -758,13 +779,35 @@ def list_autonomous_container_database_versions(
             'descending (`DESC`). Allowed values are: "ASC", "DESC"'
         ),
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[AutonomousContainerDatabaseVersionSummary]:
+) -> ListPage[models.AutonomousContainerDatabaseVersionSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["compartment_id"] = compartment_id
         kwargs["service_component"] = service_component
@@ -776,19 +819,21 @@ def list_autonomous_container_database_versions(
             kwargs["opc_request_id"] = opc_request_id
         if sort_order is not None:
             kwargs["sort_order"] = sort_order
-        response: oci.response.Response = (
-            client.list_autonomous_container_database_versions(**kwargs)
+        return list_resources(
+            "list_autonomous_container_database_versions",
+            models.map_autonomouscontainerdatabaseversionsummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
         )
-        return [
-            map_autonomouscontainerdatabaseversionsummary(item)
-            for item in response.data
-        ]
     except Exception as e:
         logger.error(f"Error in list_autonomous_container_database_versions tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets a list of the Autonomous Container Databases in the specified compartment."
     )
@@ -871,13 +916,35 @@ def list_autonomous_container_databases(
     cloud_autonomous_vm_cluster_id: Annotated[
         Optional[Any], ("The cloud Autonomous VM Cluster `OCID`__.")
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[AutonomousContainerDatabaseSummary]:
+) -> ListPage[models.AutonomousContainerDatabaseSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["compartment_id"] = compartment_id
         if autonomous_exadata_infrastructure_id is not None:
@@ -906,16 +973,21 @@ def list_autonomous_container_databases(
             kwargs["service_level_agreement_type"] = service_level_agreement_type
         if cloud_autonomous_vm_cluster_id is not None:
             kwargs["cloud_autonomous_vm_cluster_id"] = cloud_autonomous_vm_cluster_id
-        response: oci.response.Response = client.list_autonomous_container_databases(
-            **kwargs
+        return list_resources(
+            "list_autonomous_container_databases",
+            models.map_autonomouscontainerdatabasesummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
         )
-        return [map_autonomouscontainerdatabasesummary(item) for item in response.data]
     except Exception as e:
         logger.error(f"Error in list_autonomous_container_databases tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets a list of Autonomous Database backups based on either the"
         "`autonomousDatabaseId` or `compartmentId` specified as a query parameter."
@@ -975,13 +1047,35 @@ def list_autonomous_database_backups(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[AutonomousDatabaseBackupSummary]:
+) -> ListPage[models.AutonomousDatabaseBackupSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         if autonomous_database_id is not None:
             kwargs["autonomous_database_id"] = autonomous_database_id
@@ -1003,16 +1097,21 @@ def list_autonomous_database_backups(
             kwargs["type"] = type
         if opc_request_id is not None:
             kwargs["opc_request_id"] = opc_request_id
-        response: oci.response.Response = client.list_autonomous_database_backups(
-            **kwargs
+        return list_resources(
+            "list_autonomous_database_backups",
+            models.map_autonomousdatabasebackupsummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
         )
-        return [map_autonomousdatabasebackupsummary(item) for item in response.data]
     except Exception as e:
         logger.error(f"Error in list_autonomous_database_backups tool: {e}")
         raise
 
 
-@mcp.tool(description=("Gets a list of supported character sets."))
+@tool(description=("Gets a list of supported character sets."))
 def list_autonomous_database_character_sets(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
@@ -1045,7 +1144,7 @@ def list_autonomous_database_character_sets(
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[AutonomousDatabaseCharacterSets]:
+) -> list[models.AutonomousDatabaseCharacterSets]:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -1060,13 +1159,15 @@ def list_autonomous_database_character_sets(
         response: oci.response.Response = (
             client.list_autonomous_database_character_sets(**kwargs)
         )
-        return [map_autonomousdatabasecharactersets(item) for item in response.data]
+        return [
+            models.map_autonomousdatabasecharactersets(item) for item in response.data
+        ]
     except Exception as e:
         logger.error(f"Error in list_autonomous_database_character_sets tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Lists the Autonomous Database clones for the specified Autonomous Database."
     )
@@ -1131,13 +1232,35 @@ def list_autonomous_database_clones(
             'type exactly. Allowed values are: "REFRESHABLE_CLONE"'
         ),
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[AutonomousDatabaseSummary]:
+) -> ListPage[models.AutonomousDatabaseSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["compartment_id"] = compartment_id
         kwargs["autonomous_database_id"] = autonomous_database_id
@@ -1157,16 +1280,21 @@ def list_autonomous_database_clones(
             kwargs["sort_by"] = sort_by
         if clone_type is not None:
             kwargs["clone_type"] = clone_type
-        response: oci.response.Response = client.list_autonomous_database_clones(
-            **kwargs
+        return list_resources(
+            "list_autonomous_database_clones",
+            models.map_autonomousdatabasesummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
         )
-        return [map_autonomousdatabasesummary(item) for item in response.data]
     except Exception as e:
         logger.error(f"Error in list_autonomous_database_clones tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets a list of the Autonomous Data Guard-enabled databases associated with the"
         "specified Autonomous Database."
@@ -1180,25 +1308,50 @@ def list_autonomous_database_dataguard_associations(
     page: Annotated[
         Optional[Any], ("The pagination token to continue listing from.")
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[AutonomousDatabaseDataguardAssociation]:
+) -> ListPage[models.AutonomousDatabaseDataguardAssociation]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["autonomous_database_id"] = autonomous_database_id
         if limit is not None:
             kwargs["limit"] = limit
         if page is not None:
             kwargs["page"] = page
-        response: oci.response.Response = (
-            client.list_autonomous_database_dataguard_associations(**kwargs)
+        return list_resources(
+            "list_autonomous_database_dataguard_associations",
+            models.map_autonomousdatabasedataguardassociation,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
         )
-        return [
-            map_autonomousdatabasedataguardassociation(item) for item in response.data
-        ]
     except Exception as e:
         logger.error(
             f"Error in list_autonomous_database_dataguard_associations tool: {e}"
@@ -1206,7 +1359,7 @@ def list_autonomous_database_dataguard_associations(
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Lists the Autonomous Database peers for the specified Autonomous Database."
     )
@@ -1222,13 +1375,35 @@ def list_autonomous_database_peers(
     page: Annotated[
         Optional[Any], ("The pagination token to continue listing from.")
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[AutonomousDatabasePeerCollection]:
+) -> ListPage[models.AutonomousDatabasePeerCollection]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["autonomous_database_id"] = autonomous_database_id
         if opc_request_id is not None:
@@ -1237,16 +1412,21 @@ def list_autonomous_database_peers(
             kwargs["limit"] = limit
         if page is not None:
             kwargs["page"] = page
-        response: oci.response.Response = client.list_autonomous_database_peers(
-            **kwargs
+        return list_resources(
+            "list_autonomous_database_peers",
+            models.map_autonomousdatabasepeercollection,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
         )
-        return [map_autonomousdatabasepeercollection(item) for item in response.data]
     except Exception as e:
         logger.error(f"Error in list_autonomous_database_peers tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Lists the OCIDs of the Autonomous Database local and connected remote"
         "refreshable clones with the region where they exist for the specified source"
@@ -1264,13 +1444,35 @@ def list_autonomous_database_refreshable_clones(
     page: Annotated[
         Optional[Any], ("The pagination token to continue listing from.")
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[RefreshableCloneCollection]:
+) -> ListPage[models.RefreshableCloneCollection]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["autonomous_database_id"] = autonomous_database_id
         if opc_request_id is not None:
@@ -1279,16 +1481,21 @@ def list_autonomous_database_refreshable_clones(
             kwargs["limit"] = limit
         if page is not None:
             kwargs["page"] = page
-        response: oci.response.Response = (
-            client.list_autonomous_database_refreshable_clones(**kwargs)
+        return list_resources(
+            "list_autonomous_database_refreshable_clones",
+            models.map_refreshableclonecollection,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
         )
-        return [map_refreshableclonecollection(item) for item in response.data]
     except Exception as e:
         logger.error(f"Error in list_autonomous_database_refreshable_clones tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets a list of the Autonomous Database Software Images in the specified"
         "compartment."
@@ -1344,13 +1551,35 @@ def list_autonomous_database_software_images(
             "display name given. The match is not case sensitive."
         ),
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[AutonomousDatabaseSoftwareImageCollection]:
+) -> ListPage[models.AutonomousDatabaseSoftwareImageCollection]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["compartment_id"] = compartment_id
         kwargs["image_shape_family"] = image_shape_family
@@ -1368,19 +1597,21 @@ def list_autonomous_database_software_images(
             kwargs["opc_request_id"] = opc_request_id
         if display_name is not None:
             kwargs["display_name"] = display_name
-        response: oci.response.Response = (
-            client.list_autonomous_database_software_images(**kwargs)
+        return list_resources(
+            "list_autonomous_database_software_images",
+            models.map_autonomousdatabasesoftwareimagecollection,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
         )
-        return [
-            map_autonomousdatabasesoftwareimagecollection(item)
-            for item in response.data
-        ]
     except Exception as e:
         logger.error(f"Error in list_autonomous_database_software_images tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets a list of Autonomous Databases based on the query parameters specified."
     )
@@ -1514,13 +1745,42 @@ def list_autonomous_databases(
         Optional[Any],
         ("The database `OCID`__ of the resourcepool Leader Autonomous" "Database."),
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    refresh: Annotated[
+        bool,
+        (
+            "List from OCI even if the inventory cache has a fresh listing of"
+            " these arguments, and cache the new listing."
+        ),
+    ] = False,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[AutonomousDatabaseSummary]:
+) -> ListPage[models.AutonomousDatabaseSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["compartment_id"] = compartment_id
         if autonomous_container_database_id is not None:
@@ -1559,14 +1819,23 @@ def list_autonomous_databases(
             kwargs["is_resource_pool_leader"] = is_resource_pool_leader
         if resource_pool_leader_id is not None:
             kwargs["resource_pool_leader_id"] = resource_pool_leader_id
-        response: oci.response.Response = client.list_autonomous_databases(**kwargs)
-        return [map_autonomousdatabasesummary(item) for item in response.data]
+        return list_resources(
+            "list_autonomous_databases",
+            models.map_autonomousdatabasesummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            inventory_type="autonomous_databases",
+            refresh=refresh,
+            **kwargs,
+        )
     except Exception as e:
         logger.error(f"Error in list_autonomous_databases tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets a list of supported Autonomous Database versions. Note that preview version"
         "software is only available for"
@@ -1600,13 +1869,35 @@ def list_autonomous_db_preview_versions(
             'descending (`DESC`). Allowed values are: "ASC", "DESC"'
         ),
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[AutonomousDbPreviewVersionSummary]:
+) -> ListPage[models.AutonomousDbPreviewVersionSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["compartment_id"] = compartment_id
         if limit is not None:
@@ -1619,16 +1910,21 @@ def list_autonomous_db_preview_versions(
             kwargs["sort_by"] = sort_by
         if sort_order is not None:
             kwargs["sort_order"] = sort_order
-        response: oci.response.Response = client.list_autonomous_db_preview_versions(
-            **kwargs
+        return list_resources(
+            "list_autonomous_db_preview_versions",
+            models.map_autonomousdbpreviewversionsummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
         )
-        return [map_autonomousdbpreviewversionsummary(item) for item in response.data]
     except Exception as e:
         logger.error(f"Error in list_autonomous_db_preview_versions tool: {e}")
         raise
 
 
-@mcp.tool(description=("Gets a list of supported Autonomous Database versions."))
+@tool(description=("Gets a list of supported Autonomous Database versions."))
 def list_autonomous_db_versions(
     compartment_id: Annotated[Optional[Any], ("The compartment `OCID`__.")],
     limit: Annotated[
@@ -1655,13 +1951,35 @@ def list_autonomous_db_versions(
             'descending (`DESC`). Allowed values are: "ASC", "DESC"'
         ),
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[AutonomousDbVersionSummary]:
+) -> ListPage[models.AutonomousDbVersionSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["compartment_id"] = compartment_id
         if limit is not None:
@@ -1674,14 +1992,21 @@ def list_autonomous_db_versions(
             kwargs["db_workload"] = db_workload
         if sort_order is not None:
             kwargs["sort_order"] = sort_order
-        response: oci.response.Response = client.list_autonomous_db_versions(**kwargs)
-        return [map_autonomousdbversionsummary(item) for item in response.data]
+        return list_resources(
+            "list_autonomous_db_versions",
+            models.map_autonomousdbversionsummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
+        )
     except Exception as e:
         logger.error(f"Error in list_autonomous_db_versions tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Lists the Autonomous Virtual Machines in the specified Autonomous VM Cluster and"
         "Compartment."
@@ -1711,13 +2036,35 @@ def list_autonomous_virtual_machines(
             '"MAINTENANCE_IN_PROGRESS"'
         ),
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[AutonomousVirtualMachineSummary]:
+) -> ListPage[models.AutonomousVirtualMachineSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["compartment_id"] = compartment_id
         kwargs["autonomous_vm_cluster_id"] = autonomous_vm_cluster_id
@@ -1729,16 +2076,21 @@ def list_autonomous_virtual_machines(
             kwargs["opc_request_id"] = opc_request_id
         if lifecycle_state is not None:
             kwargs["lifecycle_state"] = lifecycle_state
-        response: oci.response.Response = client.list_autonomous_virtual_machines(
-            **kwargs
+        return list_resources(
+            "list_autonomous_virtual_machines",
+            models.map_autonomousvirtualmachinesummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
         )
-        return [map_autonomousvirtualmachinesummary(item) for item in response.data]
     except Exception as e:
         logger.error(f"Error in list_autonomous_virtual_machines tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets a list of Exadata Cloud@Customer Autonomous VM clusters in the specified"
         "compartment. To list Autonomous VM Clusters in the Oracle Cloud, see"
@@ -1794,13 +2146,35 @@ def list_autonomous_vm_clusters(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[AutonomousVmClusterSummary]:
+) -> ListPage[models.AutonomousVmClusterSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["compartment_id"] = compartment_id
         if exadata_infrastructure_id is not None:
@@ -1819,16 +2193,21 @@ def list_autonomous_vm_clusters(
             kwargs["display_name"] = display_name
         if opc_request_id is not None:
             kwargs["opc_request_id"] = opc_request_id
-        response: oci.response.Response = client.list_autonomous_vm_clusters(**kwargs)
-        return [map_autonomousvmclustersummary(item) for item in response.data]
+        return list_resources(
+            "list_autonomous_vm_clusters",
+            models.map_autonomousvmclustersummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
+        )
     except Exception as e:
         logger.error(f"Error in list_autonomous_vm_clusters tool: {e}")
         raise
 
 
-@mcp.tool(
-    description=("Gets a list of backup destinations in the specified compartment.")
-)
+@tool(description=("Gets a list of backup destinations in the specified compartment."))
 def list_backup_destination(
     compartment_id: Annotated[Optional[Any], ("The compartment `OCID`__.")],
     limit: Annotated[
@@ -1847,13 +2226,35 @@ def list_backup_destination(
             "of the Backup Destination."
         ),
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[BackupDestinationSummary]:
+) -> ListPage[models.BackupDestinationSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["compartment_id"] = compartment_id
         if limit is not None:
@@ -1864,14 +2265,21 @@ def list_backup_destination(
             kwargs["opc_request_id"] = opc_request_id
         if type is not None:
             kwargs["type"] = type
-        response: oci.response.Response = client.list_backup_destination(**kwargs)
-        return [map_backupdestinationsummary(item) for item in response.data]
+        return list_resources(
+            "list_backup_destination",
+            models.map_backupdestinationsummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
+        )
     except Exception as e:
         logger.error(f"Error in list_backup_destination tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets a list of backups based on the `databaseId` or `compartmentId` specified."
         "Either one of these query parameters must be provided."
@@ -1895,13 +2303,35 @@ def list_backups(
             '"VIRTUALMACHINE", "EXADATA", "EXACC", "EXADB_XS"'
         ),
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[BackupSummary]:
+) -> ListPage[models.BackupSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         if database_id is not None:
             kwargs["database_id"] = database_id
@@ -1913,14 +2343,21 @@ def list_backups(
             kwargs["page"] = page
         if shape_family is not None:
             kwargs["shape_family"] = shape_family
-        response: oci.response.Response = client.list_backups(**kwargs)
-        return [map_backupsummary(item) for item in response.data]
+        return list_resources(
+            "list_backups",
+            models.map_backupsummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
+        )
     except Exception as e:
         logger.error(f"Error in list_backups tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Lists Autonomous Exadata VM clusters in the Oracle cloud. For Exadata"
         "Cloud@Customer systems, see :func:`list_autonomous_vm_clusters`."
@@ -1985,13 +2422,35 @@ def list_cloud_autonomous_vm_clusters(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[CloudAutonomousVmClusterSummary]:
+) -> ListPage[models.CloudAutonomousVmClusterSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["compartment_id"] = compartment_id
         if cloud_exadata_infrastructure_id is not None:
@@ -2012,16 +2471,21 @@ def list_cloud_autonomous_vm_clusters(
             kwargs["display_name"] = display_name
         if opc_request_id is not None:
             kwargs["opc_request_id"] = opc_request_id
-        response: oci.response.Response = client.list_cloud_autonomous_vm_clusters(
-            **kwargs
+        return list_resources(
+            "list_cloud_autonomous_vm_clusters",
+            models.map_cloudautonomousvmclustersummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
         )
-        return [map_cloudautonomousvmclustersummary(item) for item in response.data]
     except Exception as e:
         logger.error(f"Error in list_cloud_autonomous_vm_clusters tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets a list of the cloud Exadata infrastructure resources in the specified"
         "compartment. Applies to Exadata Cloud Service instances and Autonomous Database"
@@ -2080,13 +2544,35 @@ def list_cloud_exadata_infrastructures(
             "cluster placement group ID exactly."
         ),
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[CloudExadataInfrastructureSummary]:
+) -> ListPage[models.CloudExadataInfrastructureSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["compartment_id"] = compartment_id
         if limit is not None:
@@ -2105,16 +2591,21 @@ def list_cloud_exadata_infrastructures(
             kwargs["display_name"] = display_name
         if cluster_placement_group_id is not None:
             kwargs["cluster_placement_group_id"] = cluster_placement_group_id
-        response: oci.response.Response = client.list_cloud_exadata_infrastructures(
-            **kwargs
+        return list_resources(
+            "list_cloud_exadata_infrastructures",
+            models.map_cloudexadatainfrastructuresummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
         )
-        return [map_cloudexadatainfrastructuresummary(item) for item in response.data]
     except Exception as e:
         logger.error(f"Error in list_cloud_exadata_infrastructures tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Lists the maintenance updates that can be applied to the specified cloud VM"
         "cluster. Applies to Exadata Cloud Service instances only."
@@ -2139,13 +2630,35 @@ def list_cloud_vm_cluster_updates(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[UpdateSummary]:
+) -> ListPage[models.UpdateSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["cloud_vm_cluster_id"] = cloud_vm_cluster_id
         if update_type is not None:
@@ -2156,14 +2669,21 @@ def list_cloud_vm_cluster_updates(
             kwargs["page"] = page
         if opc_request_id is not None:
             kwargs["opc_request_id"] = opc_request_id
-        response: oci.response.Response = client.list_cloud_vm_cluster_updates(**kwargs)
-        return [map_updatesummary(item) for item in response.data]
+        return list_resources(
+            "list_cloud_vm_cluster_updates",
+            models.map_updatesummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
+        )
     except Exception as e:
         logger.error(f"Error in list_cloud_vm_cluster_updates tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets a list of the cloud VM clusters in the specified compartment. Applies to"
         "Exadata Cloud Service instances and Autonomous Database on dedicated Exadata"
@@ -2222,13 +2742,42 @@ def list_cloud_vm_clusters(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    refresh: Annotated[
+        bool,
+        (
+            "List from OCI even if the inventory cache has a fresh listing of"
+            " these arguments, and cache the new listing."
+        ),
+    ] = False,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[CloudVmClusterSummary]:
+) -> ListPage[models.CloudVmClusterSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["compartment_id"] = compartment_id
         if cloud_exadata_infrastructure_id is not None:
@@ -2247,35 +2796,42 @@ def list_cloud_vm_clusters(
             kwargs["display_name"] = display_name
         if opc_request_id is not None:
             kwargs["opc_request_id"] = opc_request_id
-        response: oci.response.Response = client.list_cloud_vm_clusters(**kwargs)
-        return [map_cloudvmclustersummary(item) for item in response.data]
+        return list_resources(
+            "list_cloud_vm_clusters",
+            models.map_cloudvmclustersummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            inventory_type="cloud_vm_clusters",
+            refresh=refresh,
+            **kwargs,
+        )
     except Exception as e:
         logger.error(f"Error in list_cloud_vm_clusters tool: {e}")
         raise
 
 
-@mcp.tool(
-    description=("Lists the console connections for the specified database node.")
-)
+@tool(description=("Lists the console connections for the specified database node."))
 def list_console_connections(
     db_node_id: Annotated[Optional[Any], ("The database node `OCID`__.")],
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[ConsoleConnectionSummary]:
+) -> list[models.ConsoleConnectionSummary]:
     try:
         client = get_database_client(region)
         kwargs = {}
         kwargs["db_node_id"] = db_node_id
         response: oci.response.Response = client.list_console_connections(**kwargs)
-        return [map_consoleconnectionsummary(item) for item in response.data]
+        return [models.map_consoleconnectionsummary(item) for item in response.data]
     except Exception as e:
         logger.error(f"Error in list_console_connections tool: {e}")
         raise
 
 
-@mcp.tool(description=("Lists the console histories for the specified database node."))
+@tool(description=("Lists the console histories for the specified database node."))
 def list_console_histories(
     db_node_id: Annotated[Optional[Any], ("The database node `OCID`__.")],
     limit: Annotated[
@@ -2320,13 +2876,35 @@ def list_console_histories(
             "display name given. The match is not case sensitive."
         ),
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[ConsoleHistoryCollection]:
+) -> ListPage[models.ConsoleHistoryCollection]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["db_node_id"] = db_node_id
         if limit is not None:
@@ -2343,16 +2921,21 @@ def list_console_histories(
             kwargs["lifecycle_state"] = lifecycle_state
         if display_name is not None:
             kwargs["display_name"] = display_name
-        response: oci.response.Response = client.list_console_histories(**kwargs)
-        return [map_consolehistorycollection(item) for item in response.data]
+        return list_resources(
+            "list_console_histories",
+            models.map_consolehistorycollection,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
+        )
     except Exception as e:
         logger.error(f"Error in list_console_histories tool: {e}")
         raise
 
 
-@mcp.tool(
-    description=("Lists the patches applicable to the requested container database.")
-)
+@tool(description=("Lists the patches applicable to the requested container database."))
 def list_container_database_patches(
     autonomous_container_database_id: Annotated[
         Optional[Any], ("The Autonomous Container Database `OCID`__.")
@@ -2371,13 +2954,35 @@ def list_container_database_patches(
             'Allowed values are: "QUARTERLY", "TIMEZONE"'
         ),
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[AutonomousPatchSummary]:
+) -> ListPage[models.AutonomousPatchSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["autonomous_container_database_id"] = autonomous_container_database_id
         kwargs["compartment_id"] = compartment_id
@@ -2387,16 +2992,21 @@ def list_container_database_patches(
             kwargs["page"] = page
         if autonomous_patch_type is not None:
             kwargs["autonomous_patch_type"] = autonomous_patch_type
-        response: oci.response.Response = client.list_container_database_patches(
-            **kwargs
+        return list_resources(
+            "list_container_database_patches",
+            models.map_autonomouspatchsummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
         )
-        return [map_autonomouspatchsummary(item) for item in response.data]
     except Exception as e:
         logger.error(f"Error in list_container_database_patches tool: {e}")
         raise
 
 
-@mcp.tool(description=("Lists all Data Guard associations for the specified database."))
+@tool(description=("Lists all Data Guard associations for the specified database."))
 def list_data_guard_associations(
     database_id: Annotated[Optional[Any], ("The database `OCID`__.")],
     limit: Annotated[
@@ -2405,27 +3015,56 @@ def list_data_guard_associations(
     page: Annotated[
         Optional[Any], ("The pagination token to continue listing from.")
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[DataGuardAssociationSummary]:
+) -> ListPage[models.DataGuardAssociationSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["database_id"] = database_id
         if limit is not None:
             kwargs["limit"] = limit
         if page is not None:
             kwargs["page"] = page
-        response: oci.response.Response = client.list_data_guard_associations(**kwargs)
-        return [map_dataguardassociationsummary(item) for item in response.data]
+        return list_resources(
+            "list_data_guard_associations",
+            models.map_dataguardassociationsummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
+        )
     except Exception as e:
         logger.error(f"Error in list_data_guard_associations tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets a list of the database software images in the specified compartment."
     )
@@ -2502,13 +3141,35 @@ def list_database_software_images(
             "versions which are supported for Upgrade."
         ),
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[DatabaseSoftwareImageSummary]:
+) -> ListPage[models.DatabaseSoftwareImageSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["compartment_id"] = compartment_id
         if limit is not None:
@@ -2533,14 +3194,21 @@ def list_database_software_images(
             )
         if is_upgrade_supported is not None:
             kwargs["is_upgrade_supported"] = is_upgrade_supported
-        response: oci.response.Response = client.list_database_software_images(**kwargs)
-        return [map_databasesoftwareimagesummary(item) for item in response.data]
+        return list_resources(
+            "list_database_software_images",
+            models.map_databasesoftwareimagesummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
+        )
     except Exception as e:
         logger.error(f"Error in list_database_software_images tool: {e}")
         raise
 
 
-@mcp.tool(description=("Gets a list of the databases in the specified Database Home."))
+@tool(description=("Gets a list of the databases in the specified Database Home."))
 def list_databases(
     compartment_id: Annotated[Optional[Any], ("The compartment `OCID`__.")],
     db_home_id: Annotated[Optional[Any], ("A Database Home `OCID`__.")] = None,
@@ -2593,13 +3261,42 @@ def list_databases(
             "database name given. The match is not case sensitive."
         ),
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    refresh: Annotated[
+        bool,
+        (
+            "List from OCI even if the inventory cache has a fresh listing of"
+            " these arguments, and cache the new listing."
+        ),
+    ] = False,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[DatabaseSummary]:
+) -> ListPage[models.DatabaseSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["compartment_id"] = compartment_id
         if db_home_id is not None:
@@ -2618,14 +3315,23 @@ def list_databases(
             kwargs["lifecycle_state"] = lifecycle_state
         if db_name is not None:
             kwargs["db_name"] = db_name
-        response: oci.response.Response = client.list_databases(**kwargs)
-        return [map_databasesummary(item) for item in response.data]
+        return list_resources(
+            "list_databases",
+            models.map_databasesummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            inventory_type="databases",
+            refresh=refresh,
+            **kwargs,
+        )
     except Exception as e:
         logger.error(f"Error in list_databases tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Lists the history of patch operations on the specified Database Home."
     )
@@ -2638,29 +3344,56 @@ def list_db_home_patch_history_entries(
     page: Annotated[
         Optional[Any], ("The pagination token to continue listing from.")
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[PatchHistoryEntrySummary]:
+) -> ListPage[models.PatchHistoryEntrySummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["db_home_id"] = db_home_id
         if limit is not None:
             kwargs["limit"] = limit
         if page is not None:
             kwargs["page"] = page
-        response: oci.response.Response = client.list_db_home_patch_history_entries(
-            **kwargs
+        return list_resources(
+            "list_db_home_patch_history_entries",
+            models.map_patchhistoryentrysummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
         )
-        return [map_patchhistoryentrysummary(item) for item in response.data]
     except Exception as e:
         logger.error(f"Error in list_db_home_patch_history_entries tool: {e}")
         raise
 
 
-@mcp.tool(description=("Lists patches applicable to the requested Database Home."))
+@tool(description=("Lists patches applicable to the requested Database Home."))
 def list_db_home_patches(
     db_home_id: Annotated[Optional[Any], ("The Database Home `OCID`__.")],
     limit: Annotated[
@@ -2669,27 +3402,56 @@ def list_db_home_patches(
     page: Annotated[
         Optional[Any], ("The pagination token to continue listing from.")
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[PatchSummary]:
+) -> ListPage[models.PatchSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["db_home_id"] = db_home_id
         if limit is not None:
             kwargs["limit"] = limit
         if page is not None:
             kwargs["page"] = page
-        response: oci.response.Response = client.list_db_home_patches(**kwargs)
-        return [map_patchsummary(item) for item in response.data]
+        return list_resources(
+            "list_db_home_patches",
+            models.map_patchsummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
+        )
     except Exception as e:
         logger.error(f"Error in list_db_home_patches tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Lists the Database Homes in the specified DB system and compartment. A Database"
         "Home is a directory where Oracle Database software is installed."
@@ -2757,13 +3519,35 @@ def list_db_homes(
             "display name given. The match is not case sensitive."
         ),
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[DbHomeSummary]:
+) -> ListPage[models.DbHomeSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["compartment_id"] = compartment_id
         if db_system_id is not None:
@@ -2786,14 +3570,21 @@ def list_db_homes(
             kwargs["lifecycle_state"] = lifecycle_state
         if display_name is not None:
             kwargs["display_name"] = display_name
-        response: oci.response.Response = client.list_db_homes(**kwargs)
-        return [map_dbhomesummary(item) for item in response.data]
+        return list_resources(
+            "list_db_homes",
+            models.map_dbhomesummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
+        )
     except Exception as e:
         logger.error(f"Error in list_db_homes tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Lists the database nodes in the specified DB system and compartment. A database"
         "node is a server running database software."
@@ -2843,13 +3634,35 @@ def list_db_nodes(
     db_server_id: Annotated[
         Optional[Any], ("The `OCID`__ of the Exacc Db server.")
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[DbNodeSummary]:
+) -> ListPage[models.DbNodeSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["compartment_id"] = compartment_id
         if db_system_id is not None:
@@ -2868,14 +3681,21 @@ def list_db_nodes(
             kwargs["lifecycle_state"] = lifecycle_state
         if db_server_id is not None:
             kwargs["db_server_id"] = db_server_id
-        response: oci.response.Response = client.list_db_nodes(**kwargs)
-        return [map_dbnodesummary(item) for item in response.data]
+        return list_resources(
+            "list_db_nodes",
+            models.map_dbnodesummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
+        )
     except Exception as e:
         logger.error(f"Error in list_db_nodes tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Lists the Exadata DB servers in the ExadataInfrastructureId and specified"
         "compartment."
@@ -2925,13 +3745,35 @@ def list_db_servers(
             "display name given. The match is not case sensitive."
         ),
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[DbServerSummary]:
+) -> ListPage[models.DbServerSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["compartment_id"] = compartment_id
         kwargs["exadata_infrastructure_id"] = exadata_infrastructure_id
@@ -2949,14 +3791,21 @@ def list_db_servers(
             kwargs["lifecycle_state"] = lifecycle_state
         if display_name is not None:
             kwargs["display_name"] = display_name
-        response: oci.response.Response = client.list_db_servers(**kwargs)
-        return [map_dbserversummary(item) for item in response.data]
+        return list_resources(
+            "list_db_servers",
+            models.map_dbserversummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
+        )
     except Exception as e:
         logger.error(f"Error in list_db_servers tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets a list of expected compute performance parameters for a virtual machine DB"
         "system based on system configuration."
@@ -2977,7 +3826,7 @@ def list_db_system_compute_performances(
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[DbSystemComputePerformanceSummary]:
+) -> list[models.DbSystemComputePerformanceSummary]:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -2988,13 +3837,15 @@ def list_db_system_compute_performances(
         response: oci.response.Response = client.list_db_system_compute_performances(
             **kwargs
         )
-        return [map_dbsystemcomputeperformancesummary(item) for item in response.data]
+        return [
+            models.map_dbsystemcomputeperformancesummary(item) for item in response.data
+        ]
     except Exception as e:
         logger.error(f"Error in list_db_system_compute_performances tool: {e}")
         raise
 
 
-@mcp.tool(description=("Lists the patches applicable to the specified DB system."))
+@tool(description=("Lists the patches applicable to the specified DB system."))
 def list_db_system_patches(
     db_system_id: Annotated[Optional[Any], ("The DB system `OCID`__.")],
     limit: Annotated[
@@ -3003,27 +3854,56 @@ def list_db_system_patches(
     page: Annotated[
         Optional[Any], ("The pagination token to continue listing from.")
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[PatchSummary]:
+) -> ListPage[models.PatchSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["db_system_id"] = db_system_id
         if limit is not None:
             kwargs["limit"] = limit
         if page is not None:
             kwargs["page"] = page
-        response: oci.response.Response = client.list_db_system_patches(**kwargs)
-        return [map_patchsummary(item) for item in response.data]
+        return list_resources(
+            "list_db_system_patches",
+            models.map_patchsummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
+        )
     except Exception as e:
         logger.error(f"Error in list_db_system_patches tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets a list of the shapes that can be used to launch a new DB system. The shape"
         "determines resources to allocate to the DB system - CPU cores and memory for VM"
@@ -3041,13 +3921,35 @@ def list_db_system_shapes(
     page: Annotated[
         Optional[Any], ("The pagination token to continue listing from.")
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[DbSystemShapeSummary]:
+) -> ListPage[models.DbSystemShapeSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["compartment_id"] = compartment_id
         if availability_domain is not None:
@@ -3056,14 +3958,21 @@ def list_db_system_shapes(
             kwargs["limit"] = limit
         if page is not None:
             kwargs["page"] = page
-        response: oci.response.Response = client.list_db_system_shapes(**kwargs)
-        return [map_dbsystemshapesummary(item) for item in response.data]
+        return list_resources(
+            "list_db_system_shapes",
+            models.map_dbsystemshapesummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
+        )
     except Exception as e:
         logger.error(f"Error in list_db_system_shapes tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets a list of possible expected storage performance parameters of a VMDB System"
         "based on Configuration."
@@ -3091,7 +4000,7 @@ def list_db_system_storage_performances(
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[DbSystemStoragePerformanceSummary]:
+) -> list[models.DbSystemStoragePerformanceSummary]:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -3103,13 +4012,15 @@ def list_db_system_storage_performances(
         response: oci.response.Response = client.list_db_system_storage_performances(
             **kwargs
         )
-        return [map_dbsystemstorageperformancesummary(item) for item in response.data]
+        return [
+            models.map_dbsystemstorageperformancesummary(item) for item in response.data
+        ]
     except Exception as e:
         logger.error(f"Error in list_db_system_storage_performances tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Lists the DB systems in the specified compartment. You can specify a `backupId`"
         "to list only the DB systems that support creating a database using this backup"
@@ -3176,13 +4087,42 @@ def list_db_systems(
             "display name given. The match is not case sensitive."
         ),
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    refresh: Annotated[
+        bool,
+        (
+            "List from OCI even if the inventory cache has a fresh listing of"
+            " these arguments, and cache the new listing."
+        ),
+    ] = False,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[DbSystemSummary]:
+) -> ListPage[models.DbSystemSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["compartment_id"] = compartment_id
         if limit is not None:
@@ -3201,14 +4141,23 @@ def list_db_systems(
             kwargs["availability_domain"] = availability_domain
         if display_name is not None:
             kwargs["display_name"] = display_name
-        response: oci.response.Response = client.list_db_systems(**kwargs)
-        return [map_dbsystemsummary(item) for item in response.data]
+        return list_resources(
+            "list_db_systems",
+            models.map_dbsystemsummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            inventory_type="db_systems",
+            refresh=refresh,
+            **kwargs,
+        )
     except Exception as e:
         logger.error(f"Error in list_db_systems tool: {e}")
         raise
 
 
-@mcp.tool(description=("Gets a list of supported Oracle Database versions."))
+@tool(description=("Gets a list of supported Oracle Database versions."))
 def list_db_versions(
     compartment_id: Annotated[Optional[Any], ("The compartment `OCID`__.")],
     limit: Annotated[
@@ -3258,13 +4207,35 @@ def list_db_versions(
             "images."
         ),
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[DbVersionSummary]:
+) -> ListPage[models.DbVersionSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["compartment_id"] = compartment_id
         if limit is not None:
@@ -3283,14 +4254,21 @@ def list_db_versions(
             kwargs["is_database_software_image_supported"] = (
                 is_database_software_image_supported
             )
-        response: oci.response.Response = client.list_db_versions(**kwargs)
-        return [map_dbversionsummary(item) for item in response.data]
+        return list_resources(
+            "list_db_versions",
+            models.map_dbversionsummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
+        )
     except Exception as e:
         logger.error(f"Error in list_db_versions tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Lists the Exadata infrastructure resources in the specified compartment. Applies"
         "to Exadata Cloud@Customer instances only."
@@ -3349,13 +4327,35 @@ def list_exadata_infrastructures(
             'response. Allowed values are: "multiRackConfigurationFile"'
         ),
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[ExadataInfrastructureSummary]:
+) -> ListPage[models.ExadataInfrastructureSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["compartment_id"] = compartment_id
         if limit is not None:
@@ -3374,14 +4374,21 @@ def list_exadata_infrastructures(
             kwargs["display_name"] = display_name
         if excluded_fields is not None:
             kwargs["excluded_fields"] = excluded_fields
-        response: oci.response.Response = client.list_exadata_infrastructures(**kwargs)
-        return [map_exadatainfrastructuresummary(item) for item in response.data]
+        return list_resources(
+            "list_exadata_infrastructures",
+            models.map_exadatainfrastructuresummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
+        )
     except Exception as e:
         logger.error(f"Error in list_exadata_infrastructures tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Lists the maintenance updates that can be applied to the specified Exadata VM"
         "cluster on Exascale Infrastructure."
@@ -3415,13 +4422,35 @@ def list_exadb_vm_cluster_updates(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[ExadbVmClusterUpdateSummary]:
+) -> ListPage[models.ExadbVmClusterUpdateSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["exadb_vm_cluster_id"] = exadb_vm_cluster_id
         if update_type is not None:
@@ -3434,14 +4463,21 @@ def list_exadb_vm_cluster_updates(
             kwargs["page"] = page
         if opc_request_id is not None:
             kwargs["opc_request_id"] = opc_request_id
-        response: oci.response.Response = client.list_exadb_vm_cluster_updates(**kwargs)
-        return [map_exadbvmclusterupdatesummary(item) for item in response.data]
+        return list_resources(
+            "list_exadb_vm_cluster_updates",
+            models.map_exadbvmclusterupdatesummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
+        )
     except Exception as e:
         logger.error(f"Error in list_exadb_vm_cluster_updates tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets a list of the Exadata VM clusters on Exascale Infrastructure in the"
         "specified compartment. Applies to Exadata Database Service on Exascale"
@@ -3501,13 +4537,35 @@ def list_exadb_vm_clusters(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[ExadbVmClusterSummary]:
+) -> ListPage[models.ExadbVmClusterSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["compartment_id"] = compartment_id
         if limit is not None:
@@ -3526,14 +4584,21 @@ def list_exadb_vm_clusters(
             kwargs["display_name"] = display_name
         if opc_request_id is not None:
             kwargs["opc_request_id"] = opc_request_id
-        response: oci.response.Response = client.list_exadb_vm_clusters(**kwargs)
-        return [map_exadbvmclustersummary(item) for item in response.data]
+        return list_resources(
+            "list_exadb_vm_clusters",
+            models.map_exadbvmclustersummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
+        )
     except Exception as e:
         logger.error(f"Error in list_exadb_vm_clusters tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets a list of the Exadata Database Storage Vaults in the specified compartment."
     )
@@ -3585,17 +4650,39 @@ def list_exascale_db_storage_vaults(
     exadata_infrastructure_id: Annotated[
         Optional[Any],
         (
-            "A filter to return only list of Vaults that are linked to"
-            "the exadata infrastructure Id."
+            "A filter to return only list of Vaults that are linked to"
+            "the exadata infrastructure Id."
+        ),
+    ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
         ),
     ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[ExascaleDbStorageVaultSummary]:
+) -> ListPage[models.ExascaleDbStorageVaultSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["compartment_id"] = compartment_id
         if limit is not None:
@@ -3614,16 +4701,21 @@ def list_exascale_db_storage_vaults(
             kwargs["opc_request_id"] = opc_request_id
         if exadata_infrastructure_id is not None:
             kwargs["exadata_infrastructure_id"] = exadata_infrastructure_id
-        response: oci.response.Response = client.list_exascale_db_storage_vaults(
-            **kwargs
+        return list_resources(
+            "list_exascale_db_storage_vaults",
+            models.map_exascaledbstoragevaultsummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
         )
-        return [map_exascaledbstoragevaultsummary(item) for item in response.data]
     except Exception as e:
         logger.error(f"Error in list_exascale_db_storage_vaults tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=("Lists the execution action resources in the specified compartment.")
 )
 def list_execution_actions(
@@ -3677,13 +4769,35 @@ def list_execution_actions(
             "display name given. The match is not case sensitive."
         ),
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[ExecutionActionSummary]:
+) -> ListPage[models.ExecutionActionSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["compartment_id"] = compartment_id
         if limit is not None:
@@ -3702,14 +4816,21 @@ def list_execution_actions(
             kwargs["execution_window_id"] = execution_window_id
         if display_name is not None:
             kwargs["display_name"] = display_name
-        response: oci.response.Response = client.list_execution_actions(**kwargs)
-        return [map_executionactionsummary(item) for item in response.data]
+        return list_resources(
+            "list_execution_actions",
+            models.map_executionactionsummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
+        )
     except Exception as e:
         logger.error(f"Error in list_execution_actions tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=("Lists the execution window resources in the specified compartment.")
 )
 def list_execution_windows(
@@ -3764,13 +4885,35 @@ def list_execution_windows(
             "display name given. The match is not case sensitive."
         ),
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[ExecutionWindowSummary]:
+) -> ListPage[models.ExecutionWindowSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["compartment_id"] = compartment_id
         if limit is not None:
@@ -3789,14 +4932,21 @@ def list_execution_windows(
             kwargs["lifecycle_state"] = lifecycle_state
         if display_name is not None:
             kwargs["display_name"] = display_name
-        response: oci.response.Response = client.list_execution_windows(**kwargs)
-        return [map_executionwindowsummary(item) for item in response.data]
+        return list_resources(
+            "list_execution_windows",
+            models.map_executionwindowsummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
+        )
     except Exception as e:
         logger.error(f"Error in list_execution_windows tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets a list of the external container databases in the specified compartment."
     )
@@ -3845,13 +4995,35 @@ def list_external_container_databases(
             "display name given. The match is not case sensitive."
         ),
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[ExternalContainerDatabaseSummary]:
+) -> ListPage[models.ExternalContainerDatabaseSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["compartment_id"] = compartment_id
         if opc_request_id is not None:
@@ -3868,16 +5040,21 @@ def list_external_container_databases(
             kwargs["lifecycle_state"] = lifecycle_state
         if display_name is not None:
             kwargs["display_name"] = display_name
-        response: oci.response.Response = client.list_external_container_databases(
-            **kwargs
+        return list_resources(
+            "list_external_container_databases",
+            models.map_externalcontainerdatabasesummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
         )
-        return [map_externalcontainerdatabasesummary(item) for item in response.data]
     except Exception as e:
         logger.error(f"Error in list_external_container_databases tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets a list of the external database connectors in the specified compartment."
     )
@@ -3930,13 +5107,35 @@ def list_external_database_connectors(
             "display name given. The match is not case sensitive."
         ),
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[ExternalDatabaseConnectorSummary]:
+) -> ListPage[models.ExternalDatabaseConnectorSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["compartment_id"] = compartment_id
         kwargs["external_database_id"] = external_database_id
@@ -3954,16 +5153,21 @@ def list_external_database_connectors(
             kwargs["lifecycle_state"] = lifecycle_state
         if display_name is not None:
             kwargs["display_name"] = display_name
-        response: oci.response.Response = client.list_external_database_connectors(
-            **kwargs
+        return list_resources(
+            "list_external_database_connectors",
+            models.map_externaldatabaseconnectorsummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
         )
-        return [map_externaldatabaseconnectorsummary(item) for item in response.data]
     except Exception as e:
         logger.error(f"Error in list_external_database_connectors tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets a list of the ExternalNonContainerDatabases in the specified compartment."
     )
@@ -4012,13 +5216,35 @@ def list_external_non_container_databases(
             "display name given. The match is not case sensitive."
         ),
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[ExternalNonContainerDatabaseSummary]:
+) -> ListPage[models.ExternalNonContainerDatabaseSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["compartment_id"] = compartment_id
         if opc_request_id is not None:
@@ -4035,16 +5261,21 @@ def list_external_non_container_databases(
             kwargs["lifecycle_state"] = lifecycle_state
         if display_name is not None:
             kwargs["display_name"] = display_name
-        response: oci.response.Response = client.list_external_non_container_databases(
-            **kwargs
+        return list_resources(
+            "list_external_non_container_databases",
+            models.map_externalnoncontainerdatabasesummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
         )
-        return [map_externalnoncontainerdatabasesummary(item) for item in response.data]
     except Exception as e:
         logger.error(f"Error in list_external_non_container_databases tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets a list of the :func:`create_external_pluggable_database_details`"
     )
@@ -4096,13 +5327,35 @@ def list_external_pluggable_databases(
             "display name given. The match is not case sensitive."
         ),
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[ExternalPluggableDatabaseSummary]:
+) -> ListPage[models.ExternalPluggableDatabaseSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["compartment_id"] = compartment_id
         if opc_request_id is not None:
@@ -4121,16 +5374,21 @@ def list_external_pluggable_databases(
             kwargs["lifecycle_state"] = lifecycle_state
         if display_name is not None:
             kwargs["display_name"] = display_name
-        response: oci.response.Response = client.list_external_pluggable_databases(
-            **kwargs
+        return list_resources(
+            "list_external_pluggable_databases",
+            models.map_externalpluggabledatabasesummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
         )
-        return [map_externalpluggabledatabasesummary(item) for item in response.data]
     except Exception as e:
         logger.error(f"Error in list_external_pluggable_databases tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets a list of the flex components that can be used to launch a new DB system."
         "The flex component determines resources to allocate to the DB system - Database"
@@ -4174,13 +5432,35 @@ def list_flex_components(
     page: Annotated[
         Optional[Any], ("The pagination token to continue listing from.")
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[FlexComponentCollection]:
+) -> ListPage[models.FlexComponentCollection]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["compartment_id"] = compartment_id
         if name is not None:
@@ -4195,14 +5475,21 @@ def list_flex_components(
             kwargs["limit"] = limit
         if page is not None:
             kwargs["page"] = page
-        response: oci.response.Response = client.list_flex_components(**kwargs)
-        return [map_flexcomponentcollection(item) for item in response.data]
+        return list_resources(
+            "list_flex_components",
+            models.map_flexcomponentcollection,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
+        )
     except Exception as e:
         logger.error(f"Error in list_flex_components tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets a list of supported Oracle Grid Infrastructure minor versions for the given"
         "major version and shape family."
@@ -4259,13 +5546,35 @@ def list_gi_version_minor_versions(
     page: Annotated[
         Optional[Any], ("The pagination token to continue listing from.")
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[GiMinorVersionSummary]:
+) -> ListPage[models.GiMinorVersionSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["version"] = version
         if availability_domain is not None:
@@ -4288,16 +5597,21 @@ def list_gi_version_minor_versions(
             kwargs["limit"] = limit
         if page is not None:
             kwargs["page"] = page
-        response: oci.response.Response = client.list_gi_version_minor_versions(
-            **kwargs
+        return list_resources(
+            "list_gi_version_minor_versions",
+            models.map_giminorversionsummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
         )
-        return [map_giminorversionsummary(item) for item in response.data]
     except Exception as e:
         logger.error(f"Error in list_gi_version_minor_versions tool: {e}")
         raise
 
 
-@mcp.tool(description=("Gets a list of supported GI versions."))
+@tool(description=("Gets a list of supported GI versions."))
 def list_gi_versions(
     compartment_id: Annotated[Optional[Any], ("The compartment `OCID`__.")],
     limit: Annotated[
@@ -4320,13 +5634,35 @@ def list_gi_versions(
         Optional[Any],
         ("The target availability domain. Only passed if the limit is" "AD-specific."),
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[GiVersionSummary]:
+) -> ListPage[models.GiVersionSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["compartment_id"] = compartment_id
         if limit is not None:
@@ -4339,14 +5675,21 @@ def list_gi_versions(
             kwargs["shape"] = shape
         if availability_domain is not None:
             kwargs["availability_domain"] = availability_domain
-        response: oci.response.Response = client.list_gi_versions(**kwargs)
-        return [map_giversionsummary(item) for item in response.data]
+        return list_resources(
+            "list_gi_versions",
+            models.map_giversionsummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
+        )
     except Exception as e:
         logger.error(f"Error in list_gi_versions tool: {e}")
         raise
 
 
-@mcp.tool(description=("Gets a list of key stores in the specified compartment."))
+@tool(description=("Gets a list of key stores in the specified compartment."))
 def list_key_stores(
     compartment_id: Annotated[Optional[Any], ("The compartment `OCID`__.")],
     limit: Annotated[
@@ -4358,13 +5701,35 @@ def list_key_stores(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[KeyStoreSummary]:
+) -> ListPage[models.KeyStoreSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["compartment_id"] = compartment_id
         if limit is not None:
@@ -4373,14 +5738,21 @@ def list_key_stores(
             kwargs["page"] = page
         if opc_request_id is not None:
             kwargs["opc_request_id"] = opc_request_id
-        response: oci.response.Response = client.list_key_stores(**kwargs)
-        return [map_keystoresummary(item) for item in response.data]
+        return list_resources(
+            "list_key_stores",
+            models.map_keystoresummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
+        )
     except Exception as e:
         logger.error(f"Error in list_key_stores tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets a list of the maintenance run histories in the specified compartment."
     )
@@ -4455,13 +5827,35 @@ def list_maintenance_run_history(
             '"CUSTOM_DATABASE_SOFTWARE_IMAGE"'
         ),
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[MaintenanceRunHistorySummary]:
+) -> ListPage[models.MaintenanceRunHistorySummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["compartment_id"] = compartment_id
         if target_resource_id is not None:
@@ -4484,16 +5878,21 @@ def list_maintenance_run_history(
             kwargs["availability_domain"] = availability_domain
         if maintenance_subtype is not None:
             kwargs["maintenance_subtype"] = maintenance_subtype
-        response: oci.response.Response = client.list_maintenance_run_history(**kwargs)
-        return [map_maintenancerunhistorysummary(item) for item in response.data]
+        return list_resources(
+            "list_maintenance_run_history",
+            models.map_maintenancerunhistorysummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
+        )
     except Exception as e:
         logger.error(f"Error in list_maintenance_run_history tool: {e}")
         raise
 
 
-@mcp.tool(
-    description=("Gets a list of the maintenance runs in the specified compartment.")
-)
+@tool(description=("Gets a list of the maintenance runs in the specified compartment."))
 def list_maintenance_runs(
     compartment_id: Annotated[Optional[Any], ("The compartment `OCID`__.")],
     target_resource_id: Annotated[Optional[Any], ("The target resource ID.")] = None,
@@ -4564,13 +5963,35 @@ def list_maintenance_runs(
             '"CUSTOM_DATABASE_SOFTWARE_IMAGE"'
         ),
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[MaintenanceRunSummary]:
+) -> ListPage[models.MaintenanceRunSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["compartment_id"] = compartment_id
         if target_resource_id is not None:
@@ -4593,14 +6014,21 @@ def list_maintenance_runs(
             kwargs["availability_domain"] = availability_domain
         if maintenance_subtype is not None:
             kwargs["maintenance_subtype"] = maintenance_subtype
-        response: oci.response.Response = client.list_maintenance_runs(**kwargs)
-        return [map_maintenancerunsummary(item) for item in response.data]
+        return list_resources(
+            "list_maintenance_runs",
+            models.map_maintenancerunsummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
+        )
     except Exception as e:
         logger.error(f"Error in list_maintenance_runs tool: {e}")
         raise
 
 
-@mcp.tool(description=("Lists one-off patches in the specified compartment."))
+@tool(description=("Lists one-off patches in the specified compartment."))
 def list_oneoff_patches(
     compartment_id: Annotated[Optional[Any], ("The compartment `OCID`__.")],
     limit: Annotated[
@@ -4646,13 +6074,35 @@ def list_oneoff_patches(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[OneoffPatchSummary]:
+) -> ListPage[models.OneoffPatchSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["compartment_id"] = compartment_id
         if limit is not None:
@@ -4669,14 +6119,21 @@ def list_oneoff_patches(
             kwargs["display_name"] = display_name
         if opc_request_id is not None:
             kwargs["opc_request_id"] = opc_request_id
-        response: oci.response.Response = client.list_oneoff_patches(**kwargs)
-        return [map_oneoffpatchsummary(item) for item in response.data]
+        return list_resources(
+            "list_oneoff_patches",
+            models.map_oneoffpatchsummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
+        )
     except Exception as e:
         logger.error(f"Error in list_oneoff_patches tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets a list of the pluggable databases in a database or compartment. You must"
         "provide either a `databaseId` or `compartmentId` value."
@@ -4726,13 +6183,35 @@ def list_pluggable_databases(
             "entire name given. The match is not case sensitive."
         ),
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[PluggableDatabaseSummary]:
+) -> ListPage[models.PluggableDatabaseSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         if compartment_id is not None:
             kwargs["compartment_id"] = compartment_id
@@ -4750,14 +6229,21 @@ def list_pluggable_databases(
             kwargs["lifecycle_state"] = lifecycle_state
         if pdb_name is not None:
             kwargs["pdb_name"] = pdb_name
-        response: oci.response.Response = client.list_pluggable_databases(**kwargs)
-        return [map_pluggabledatabasesummary(item) for item in response.data]
+        return list_resources(
+            "list_pluggable_databases",
+            models.map_pluggabledatabasesummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
+        )
     except Exception as e:
         logger.error(f"Error in list_pluggable_databases tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=("Lists the Scheduled Action resources in the specified compartment.")
 )
 def list_scheduled_actions(
@@ -4823,13 +6309,35 @@ def list_scheduled_actions(
             '"FAILED", "DELETING", "DELETED"'
         ),
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[ScheduledActionCollection]:
+) -> ListPage[models.ScheduledActionCollection]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["compartment_id"] = compartment_id
         if limit is not None:
@@ -4852,16 +6360,21 @@ def list_scheduled_actions(
             kwargs["id"] = id
         if lifecycle_state is not None:
             kwargs["lifecycle_state"] = lifecycle_state
-        response: oci.response.Response = client.list_scheduled_actions(**kwargs)
-        return [map_scheduledactioncollection(item) for item in response.data]
+        return list_resources(
+            "list_scheduled_actions",
+            models.map_scheduledactioncollection,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
+        )
     except Exception as e:
         logger.error(f"Error in list_scheduled_actions tool: {e}")
         raise
 
 
-@mcp.tool(
-    description=("Lists the Scheduling Plan resources in the specified compartment.")
-)
+@tool(description=("Lists the Scheduling Plan resources in the specified compartment."))
 def list_scheduling_plans(
     compartment_id: Annotated[Optional[Any], ("The compartment `OCID`__.")],
     limit: Annotated[
@@ -4925,13 +6438,35 @@ def list_scheduling_plans(
             "Schedule Plan id exactly."
         ),
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[SchedulingPlanCollection]:
+) -> ListPage[models.SchedulingPlanCollection]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["compartment_id"] = compartment_id
         if limit is not None:
@@ -4954,14 +6489,21 @@ def list_scheduling_plans(
             kwargs["resource_id"] = resource_id
         if id is not None:
             kwargs["id"] = id
-        response: oci.response.Response = client.list_scheduling_plans(**kwargs)
-        return [map_schedulingplancollection(item) for item in response.data]
+        return list_resources(
+            "list_scheduling_plans",
+            models.map_schedulingplancollection,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
+        )
     except Exception as e:
         logger.error(f"Error in list_scheduling_plans tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=("Lists the Scheduling Policy resources in the specified compartment.")
 )
 def list_scheduling_policies(
@@ -5008,13 +6550,35 @@ def list_scheduling_policies(
             "display name given. The match is not case sensitive."
         ),
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[SchedulingPolicySummary]:
+) -> ListPage[models.SchedulingPolicySummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["compartment_id"] = compartment_id
         if limit is not None:
@@ -5031,14 +6595,21 @@ def list_scheduling_policies(
             kwargs["lifecycle_state"] = lifecycle_state
         if display_name is not None:
             kwargs["display_name"] = display_name
-        response: oci.response.Response = client.list_scheduling_policies(**kwargs)
-        return [map_schedulingpolicysummary(item) for item in response.data]
+        return list_resources(
+            "list_scheduling_policies",
+            models.map_schedulingpolicysummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
+        )
     except Exception as e:
         logger.error(f"Error in list_scheduling_policies tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=("Lists the Scheduling Window resources in the specified compartment.")
 )
 def list_scheduling_windows(
@@ -5086,13 +6657,35 @@ def list_scheduling_windows(
             "display name given. The match is not case sensitive."
         ),
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[SchedulingWindowSummary]:
+) -> ListPage[models.SchedulingWindowSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["scheduling_policy_id"] = scheduling_policy_id
         if compartment_id is not None:
@@ -5111,14 +6704,21 @@ def list_scheduling_windows(
             kwargs["lifecycle_state"] = lifecycle_state
         if display_name is not None:
             kwargs["display_name"] = display_name
-        response: oci.response.Response = client.list_scheduling_windows(**kwargs)
-        return [map_schedulingwindowsummary(item) for item in response.data]
+        return list_resources(
+            "list_scheduling_windows",
+            models.map_schedulingwindowsummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
+        )
     except Exception as e:
         logger.error(f"Error in list_scheduling_windows tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets a list of supported Exadata system versions for a given shape and GI"
         "version."
@@ -5144,13 +6744,35 @@ def list_system_versions(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[SystemVersionCollection]:
+) -> ListPage[models.SystemVersionCollection]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["compartment_id"] = compartment_id
         kwargs["shape"] = shape
@@ -5163,14 +6785,21 @@ def list_system_versions(
             kwargs["sort_order"] = sort_order
         if opc_request_id is not None:
             kwargs["opc_request_id"] = opc_request_id
-        response: oci.response.Response = client.list_system_versions(**kwargs)
-        return [map_systemversioncollection(item) for item in response.data]
+        return list_resources(
+            "list_system_versions",
+            models.map_systemversioncollection,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
+        )
     except Exception as e:
         logger.error(f"Error in list_system_versions tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets a list of the VM cluster networks in the specified compartment. Applies to"
         "Exadata Cloud@Customer instances only."
@@ -5225,13 +6854,35 @@ def list_vm_cluster_networks(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[VmClusterNetworkSummary]:
+) -> ListPage[models.VmClusterNetworkSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["exadata_infrastructure_id"] = exadata_infrastructure_id
         kwargs["compartment_id"] = compartment_id
@@ -5249,14 +6900,21 @@ def list_vm_cluster_networks(
             kwargs["display_name"] = display_name
         if opc_request_id is not None:
             kwargs["opc_request_id"] = opc_request_id
-        response: oci.response.Response = client.list_vm_cluster_networks(**kwargs)
-        return [map_vmclusternetworksummary(item) for item in response.data]
+        return list_resources(
+            "list_vm_cluster_networks",
+            models.map_vmclusternetworksummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
+        )
     except Exception as e:
         logger.error(f"Error in list_vm_cluster_networks tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Lists the patches applicable to the specified VM cluster in an Exadata"
         "Cloud@Customer system."
@@ -5270,27 +6928,56 @@ def list_vm_cluster_patches(
     page: Annotated[
         Optional[Any], ("The pagination token to continue listing from.")
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[PatchSummary]:
+) -> ListPage[models.PatchSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["vm_cluster_id"] = vm_cluster_id
         if limit is not None:
             kwargs["limit"] = limit
         if page is not None:
             kwargs["page"] = page
-        response: oci.response.Response = client.list_vm_cluster_patches(**kwargs)
-        return [map_patchsummary(item) for item in response.data]
+        return list_resources(
+            "list_vm_cluster_patches",
+            models.map_patchsummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
+        )
     except Exception as e:
         logger.error(f"Error in list_vm_cluster_patches tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Lists the maintenance updates that can be applied to the specified VM cluster."
         "Applies to Exadata Cloud@Customer instances only."
@@ -5323,13 +7010,35 @@ def list_vm_cluster_updates(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[VmClusterUpdateSummary]:
+) -> ListPage[models.VmClusterUpdateSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["vm_cluster_id"] = vm_cluster_id
         if update_type is not None:
@@ -5342,14 +7051,21 @@ def list_vm_cluster_updates(
             kwargs["page"] = page
         if opc_request_id is not None:
             kwargs["opc_request_id"] = opc_request_id
-        response: oci.response.Response = client.list_vm_cluster_updates(**kwargs)
-        return [map_vmclusterupdatesummary(item) for item in response.data]
+        return list_resources(
+            "list_vm_cluster_updates",
+            models.map_vmclusterupdatesummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
+        )
     except Exception as e:
         logger.error(f"Error in list_vm_cluster_updates tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Lists the VM clusters in the specified compartment. Applies to Exadata"
         "Cloud@Customer instances only."
@@ -5401,16 +7117,38 @@ def list_vm_clusters(
             "display name given. The match is not case sensitive."
         ),
     ] = None,
-    opc_request_id: Annotated[
-        Optional[Any], ("Unique identifier for the request.")
+    opc_request_id: Annotated[
+        Optional[Any], ("Unique identifier for the request.")
+    ] = None,
+    max_items: Annotated[
+        Optional[int],
+        (
+            "The maximum number of items to return across pages (default 1000)."
+            " When more items remain, `next_page` continues the listing."
+        ),
+    ] = None,
+    regions: Annotated[
+        Optional[list[str] | str],
+        (
+            "Regions to list concurrently instead of `region`: a list of region"
+            ' identifiers, or "all subscribed" for every region the tenancy is'
+            " subscribed to. Each region is listed with its own `max_items`."
+        ),
+    ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
     ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[VmClusterSummary]:
+) -> ListPage[models.VmClusterSummary]:
     try:
-        client = get_database_client(region)
         kwargs = {}
         kwargs["compartment_id"] = compartment_id
         if exadata_infrastructure_id is not None:
@@ -5429,14 +7167,21 @@ def list_vm_clusters(
             kwargs["display_name"] = display_name
         if opc_request_id is not None:
             kwargs["opc_request_id"] = opc_request_id
-        response: oci.response.Response = client.list_vm_clusters(**kwargs)
-        return [map_vmclustersummary(item) for item in response.data]
+        return list_resources(
+            "list_vm_clusters",
+            models.map_vmclustersummary,
+            region,
+            regions,
+            max_items,
+            fields=fields,
+            **kwargs,
+        )
     except Exception as e:
         logger.error(f"Error in list_vm_clusters tool: {e}")
         raise
 
 
-@mcp.tool(description=("Lists available resource pools shapes."))
+@tool(description=("Lists available resource pools shapes."))
 def resource_pool_shapes(
     if_match: Annotated[
         Optional[Any],
@@ -5474,7 +7219,7 @@ def resource_pool_shapes(
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> list[ResourcePoolShapeCollection]:
+) -> list[models.ResourcePoolShapeCollection]:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -5489,13 +7234,13 @@ def resource_pool_shapes(
         if opc_request_id is not None:
             kwargs["opc_request_id"] = opc_request_id
         response: oci.response.Response = client.resource_pool_shapes(**kwargs)
-        return [map_resourcepoolshapecollection(item) for item in response.data]
+        return [models.map_resourcepoolshapecollection(item) for item in response.data]
     except Exception as e:
         logger.error(f"Error in resource_pool_shapes tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets information about a specified application virtual IP (VIP) address."
     )
@@ -5507,11 +7252,19 @@ def get_application_vip(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> ApplicationVip:
+) -> models.ApplicationVip:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -5519,24 +7272,32 @@ def get_application_vip(
         if opc_request_id is not None:
             kwargs["opc_request_id"] = opc_request_id
         response: oci.response.Response = client.get_application_vip(**kwargs)
-        return map_applicationvip(response.data)
+        return models.map_applicationvip(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_application_vip tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=("Gets information about the specified Autonomous Container Database.")
 )
 def get_autonomous_container_database(
     autonomous_container_database_id: Annotated[
         Optional[Any], ("The Autonomous Container Database `OCID`__.")
     ],
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> AutonomousContainerDatabase:
+) -> models.AutonomousContainerDatabase:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -5544,13 +7305,13 @@ def get_autonomous_container_database(
         response: oci.response.Response = client.get_autonomous_container_database(
             **kwargs
         )
-        return map_autonomouscontainerdatabase(response.data)
+        return models.map_autonomouscontainerdatabase(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_autonomous_container_database tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets an Autonomous Container Database enabled with Autonomous Data Guard"
         "associated with the specified Autonomous Container Database."
@@ -5567,11 +7328,19 @@ def get_autonomous_container_database_dataguard_association(
             "association `OCID`__."
         ),
     ],
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> AutonomousContainerDatabaseDataguardAssociation:
+) -> models.AutonomousContainerDatabaseDataguardAssociation:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -5582,7 +7351,9 @@ def get_autonomous_container_database_dataguard_association(
         response: oci.response.Response = (
             client.get_autonomous_container_database_dataguard_association(**kwargs)
         )
-        return map_autonomouscontainerdatabasedataguardassociation(response.data)
+        return models.map_autonomouscontainerdatabasedataguardassociation(
+            response.data, fields
+        )
     except Exception as e:
         logger.error(
             f"Error in get_autonomous_container_database_dataguard_association tool: {e}"
@@ -5590,7 +7361,7 @@ def get_autonomous_container_database_dataguard_association(
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Get resource usage details for the specified Autonomous Container Database."
     )
@@ -5602,11 +7373,19 @@ def get_autonomous_container_database_resource_usage(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> AutonomousContainerDatabaseResourceUsage:
+) -> models.AutonomousContainerDatabaseResourceUsage:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -5616,7 +7395,9 @@ def get_autonomous_container_database_resource_usage(
         response: oci.response.Response = (
             client.get_autonomous_container_database_resource_usage(**kwargs)
         )
-        return map_autonomouscontainerdatabaseresourceusage(response.data)
+        return models.map_autonomouscontainerdatabaseresourceusage(
+            response.data, fields
+        )
     except Exception as e:
         logger.error(
             f"Error in get_autonomous_container_database_resource_usage tool: {e}"
@@ -5624,17 +7405,25 @@ def get_autonomous_container_database_resource_usage(
         raise
 
 
-@mcp.tool(description=("Gets the details of the specified Autonomous Database."))
+@tool(description=("Gets the details of the specified Autonomous Database."))
 def get_autonomous_database(
     autonomous_database_id: Annotated[Optional[Any], ("The database `OCID`__.")],
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> AutonomousDatabase:
+) -> models.AutonomousDatabase:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -5642,15 +7431,13 @@ def get_autonomous_database(
         if opc_request_id is not None:
             kwargs["opc_request_id"] = opc_request_id
         response: oci.response.Response = client.get_autonomous_database(**kwargs)
-        return map_autonomousdatabase(response.data)
+        return models.map_autonomousdatabase(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_autonomous_database tool: {e}")
         raise
 
 
-@mcp.tool(
-    description=("Gets information about the specified Autonomous Database backup.")
-)
+@tool(description=("Gets information about the specified Autonomous Database backup."))
 def get_autonomous_database_backup(
     autonomous_database_backup_id: Annotated[
         Optional[Any], ("The `OCID`__ of the Autonomous Database backup.")
@@ -5658,11 +7445,19 @@ def get_autonomous_database_backup(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> AutonomousDatabaseBackup:
+) -> models.AutonomousDatabaseBackup:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -5672,13 +7467,13 @@ def get_autonomous_database_backup(
         response: oci.response.Response = client.get_autonomous_database_backup(
             **kwargs
         )
-        return map_autonomousdatabasebackup(response.data)
+        return models.map_autonomousdatabasebackup(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_autonomous_database_backup tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets an Autonomous Data Guard-enabled database associated with the specified"
         "Autonomous Database."
@@ -5696,11 +7491,19 @@ def get_autonomous_database_dataguard_association(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> AutonomousDatabaseDataguardAssociation:
+) -> models.AutonomousDatabaseDataguardAssociation:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -5713,7 +7516,7 @@ def get_autonomous_database_dataguard_association(
         response: oci.response.Response = (
             client.get_autonomous_database_dataguard_association(**kwargs)
         )
-        return map_autonomousdatabasedataguardassociation(response.data)
+        return models.map_autonomousdatabasedataguardassociation(response.data, fields)
     except Exception as e:
         logger.error(
             f"Error in get_autonomous_database_dataguard_association tool: {e}"
@@ -5721,16 +7524,24 @@ def get_autonomous_database_dataguard_association(
         raise
 
 
-@mcp.tool(description=("Gets the Autonomous Database regional wallet details."))
+@tool(description=("Gets the Autonomous Database regional wallet details."))
 def get_autonomous_database_regional_wallet(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> AutonomousDatabaseWallet:
+) -> models.AutonomousDatabaseWallet:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -5739,13 +7550,13 @@ def get_autonomous_database_regional_wallet(
         response: oci.response.Response = (
             client.get_autonomous_database_regional_wallet(**kwargs)
         )
-        return map_autonomousdatabasewallet(response.data)
+        return models.map_autonomousdatabasewallet(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_autonomous_database_regional_wallet tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets information about the specified Autonomous Database Software Image."
     )
@@ -5757,11 +7568,19 @@ def get_autonomous_database_software_image(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> AutonomousDatabaseSoftwareImage:
+) -> models.AutonomousDatabaseSoftwareImage:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -5773,25 +7592,31 @@ def get_autonomous_database_software_image(
         response: oci.response.Response = client.get_autonomous_database_software_image(
             **kwargs
         )
-        return map_autonomousdatabasesoftwareimage(response.data)
+        return models.map_autonomousdatabasesoftwareimage(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_autonomous_database_software_image tool: {e}")
         raise
 
 
-@mcp.tool(
-    description=("Gets the wallet details for the specified Autonomous Database.")
-)
+@tool(description=("Gets the wallet details for the specified Autonomous Database."))
 def get_autonomous_database_wallet(
     autonomous_database_id: Annotated[Optional[Any], ("The database `OCID`__.")],
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> AutonomousDatabaseWallet:
+) -> models.AutonomousDatabaseWallet:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -5801,13 +7626,13 @@ def get_autonomous_database_wallet(
         response: oci.response.Response = client.get_autonomous_database_wallet(
             **kwargs
         )
-        return map_autonomousdatabasewallet(response.data)
+        return models.map_autonomousdatabasewallet(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_autonomous_database_wallet tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "**Deprecated.** Use the :func:`get_cloud_exadata_infrastructure` operation to"
         "get details of an Exadata Infrastructure resource and the"
@@ -5819,11 +7644,19 @@ def get_autonomous_exadata_infrastructure(
     autonomous_exadata_infrastructure_id: Annotated[
         Optional[Any], ("The Autonomous Exadata Infrastructure `OCID`__.")
     ],
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> AutonomousExadataInfrastructure:
+) -> models.AutonomousExadataInfrastructure:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -5833,32 +7666,40 @@ def get_autonomous_exadata_infrastructure(
         response: oci.response.Response = client.get_autonomous_exadata_infrastructure(
             **kwargs
         )
-        return map_autonomousexadatainfrastructure(response.data)
+        return models.map_autonomousexadatainfrastructure(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_autonomous_exadata_infrastructure tool: {e}")
         raise
 
 
-@mcp.tool(description=("Gets information about a specific autonomous patch."))
+@tool(description=("Gets information about a specific autonomous patch."))
 def get_autonomous_patch(
     autonomous_patch_id: Annotated[Optional[Any], ("The autonomous patch `OCID`__.")],
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> AutonomousPatch:
+) -> models.AutonomousPatch:
     try:
         client = get_database_client(region)
         kwargs = {}
         kwargs["autonomous_patch_id"] = autonomous_patch_id
         response: oci.response.Response = client.get_autonomous_patch(**kwargs)
-        return map_autonomouspatch(response.data)
+        return models.map_autonomouspatch(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_autonomous_patch tool: {e}")
         raise
 
 
-@mcp.tool(description=("Gets the details of specific Autonomous Virtual Machine."))
+@tool(description=("Gets the details of specific Autonomous Virtual Machine."))
 def get_autonomous_virtual_machine(
     autonomous_virtual_machine_id: Annotated[
         Optional[Any], ("The Autonomous Virtual machine `OCID`__.")
@@ -5866,11 +7707,19 @@ def get_autonomous_virtual_machine(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> AutonomousVirtualMachine:
+) -> models.AutonomousVirtualMachine:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -5880,13 +7729,13 @@ def get_autonomous_virtual_machine(
         response: oci.response.Response = client.get_autonomous_virtual_machine(
             **kwargs
         )
-        return map_autonomousvirtualmachine(response.data)
+        return models.map_autonomousvirtualmachine(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_autonomous_virtual_machine tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets information about the specified Autonomous VM cluster for an Exadata"
         "Cloud@Customer system. To get information about an Autonomous VM Cluster in the"
@@ -5900,11 +7749,19 @@ def get_autonomous_vm_cluster(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> AutonomousVmCluster:
+) -> models.AutonomousVmCluster:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -5912,13 +7769,13 @@ def get_autonomous_vm_cluster(
         if opc_request_id is not None:
             kwargs["opc_request_id"] = opc_request_id
         response: oci.response.Response = client.get_autonomous_vm_cluster(**kwargs)
-        return map_autonomousvmcluster(response.data)
+        return models.map_autonomousvmcluster(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_autonomous_vm_cluster tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Get the resource usage details for the specified Autonomous Exadata VM cluster."
     )
@@ -5930,11 +7787,19 @@ def get_autonomous_vm_cluster_resource_usage(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> AutonomousVmClusterResourceUsage:
+) -> models.AutonomousVmClusterResourceUsage:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -5944,32 +7809,40 @@ def get_autonomous_vm_cluster_resource_usage(
         response: oci.response.Response = (
             client.get_autonomous_vm_cluster_resource_usage(**kwargs)
         )
-        return map_autonomousvmclusterresourceusage(response.data)
+        return models.map_autonomousvmclusterresourceusage(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_autonomous_vm_cluster_resource_usage tool: {e}")
         raise
 
 
-@mcp.tool(description=("Gets information about the specified backup."))
+@tool(description=("Gets information about the specified backup."))
 def get_backup(
     backup_id: Annotated[Optional[Any], ("The backup `OCID`__.")],
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> Backup:
+) -> models.Backup:
     try:
         client = get_database_client(region)
         kwargs = {}
         kwargs["backup_id"] = backup_id
         response: oci.response.Response = client.get_backup(**kwargs)
-        return map_backup(response.data)
+        return models.map_backup(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_backup tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets information about the specified backup destination in an Exadata"
         "Cloud@Customer system."
@@ -5982,11 +7855,19 @@ def get_backup_destination(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> BackupDestination:
+) -> models.BackupDestination:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -5994,13 +7875,13 @@ def get_backup_destination(
         if opc_request_id is not None:
             kwargs["opc_request_id"] = opc_request_id
         response: oci.response.Response = client.get_backup_destination(**kwargs)
-        return map_backupdestination(response.data)
+        return models.map_backupdestination(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_backup_destination tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets information about the specified Autonomous Exadata VM cluster in the Oracle"
         "cloud. For Exadata Cloud@Custustomer systems, see"
@@ -6014,11 +7895,19 @@ def get_cloud_autonomous_vm_cluster(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> CloudAutonomousVmCluster:
+) -> models.CloudAutonomousVmCluster:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -6028,13 +7917,13 @@ def get_cloud_autonomous_vm_cluster(
         response: oci.response.Response = client.get_cloud_autonomous_vm_cluster(
             **kwargs
         )
-        return map_cloudautonomousvmcluster(response.data)
+        return models.map_cloudautonomousvmcluster(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_cloud_autonomous_vm_cluster tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Get the resource usage details for the specified Cloud Autonomous Exadata VM"
         "cluster."
@@ -6047,11 +7936,19 @@ def get_cloud_autonomous_vm_cluster_resource_usage(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> CloudAutonomousVmClusterResourceUsage:
+) -> models.CloudAutonomousVmClusterResourceUsage:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -6061,7 +7958,7 @@ def get_cloud_autonomous_vm_cluster_resource_usage(
         response: oci.response.Response = (
             client.get_cloud_autonomous_vm_cluster_resource_usage(**kwargs)
         )
-        return map_cloudautonomousvmclusterresourceusage(response.data)
+        return models.map_cloudautonomousvmclusterresourceusage(response.data, fields)
     except Exception as e:
         logger.error(
             f"Error in get_cloud_autonomous_vm_cluster_resource_usage tool: {e}"
@@ -6069,7 +7966,7 @@ def get_cloud_autonomous_vm_cluster_resource_usage(
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets information about the specified cloud Exadata infrastructure resource."
         "Applies to Exadata Cloud Service instances and Autonomous Database on dedicated"
@@ -6083,11 +7980,19 @@ def get_cloud_exadata_infrastructure(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> CloudExadataInfrastructure:
+) -> models.CloudExadataInfrastructure:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -6097,13 +8002,13 @@ def get_cloud_exadata_infrastructure(
         response: oci.response.Response = client.get_cloud_exadata_infrastructure(
             **kwargs
         )
-        return map_cloudexadatainfrastructure(response.data)
+        return models.map_cloudexadatainfrastructure(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_cloud_exadata_infrastructure tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets unallocated resources information for the specified Cloud Exadata"
         "infrastructure."
@@ -6119,11 +8024,19 @@ def get_cloud_exadata_infrastructure_unallocated_resources(
     db_servers: Annotated[
         Optional[Any], ("The list of `OCIDs`__ of the Db servers.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> CloudExadataInfrastructureUnallocatedResources:
+) -> models.CloudExadataInfrastructureUnallocatedResources:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -6135,7 +8048,9 @@ def get_cloud_exadata_infrastructure_unallocated_resources(
         response: oci.response.Response = (
             client.get_cloud_exadata_infrastructure_unallocated_resources(**kwargs)
         )
-        return map_cloudexadatainfrastructureunallocatedresources(response.data)
+        return models.map_cloudexadatainfrastructureunallocatedresources(
+            response.data, fields
+        )
     except Exception as e:
         logger.error(
             f"Error in get_cloud_exadata_infrastructure_unallocated_resources tool: {e}"
@@ -6143,7 +8058,7 @@ def get_cloud_exadata_infrastructure_unallocated_resources(
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets information about the specified cloud VM cluster. Applies to Exadata Cloud"
         "Service instances and Autonomous Database on dedicated Exadata infrastructure"
@@ -6155,11 +8070,19 @@ def get_cloud_vm_cluster(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> CloudVmCluster:
+) -> models.CloudVmCluster:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -6167,13 +8090,13 @@ def get_cloud_vm_cluster(
         if opc_request_id is not None:
             kwargs["opc_request_id"] = opc_request_id
         response: oci.response.Response = client.get_cloud_vm_cluster(**kwargs)
-        return map_cloudvmcluster(response.data)
+        return models.map_cloudvmcluster(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_cloud_vm_cluster tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets the IORM configuration for the specified cloud VM cluster in an Exadata"
         "Cloud Service instance."
@@ -6184,11 +8107,19 @@ def get_cloud_vm_cluster_iorm_config(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> ExadataIormConfig:
+) -> models.ExadataIormConfig:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -6198,13 +8129,13 @@ def get_cloud_vm_cluster_iorm_config(
         response: oci.response.Response = client.get_cloud_vm_cluster_iorm_config(
             **kwargs
         )
-        return map_exadataiormconfig(response.data)
+        return models.map_exadataiormconfig(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_cloud_vm_cluster_iorm_config tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets information about a specified maintenance update package for a cloud VM"
         "cluster. Applies to Exadata Cloud Service instances only."
@@ -6216,11 +8147,19 @@ def get_cloud_vm_cluster_update(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> Update:
+) -> models.Update:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -6229,13 +8168,13 @@ def get_cloud_vm_cluster_update(
         if opc_request_id is not None:
             kwargs["opc_request_id"] = opc_request_id
         response: oci.response.Response = client.get_cloud_vm_cluster_update(**kwargs)
-        return map_update(response.data)
+        return models.map_update(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_cloud_vm_cluster_update tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets the maintenance update history details for the specified update history"
         "entry. Applies to Exadata Cloud Service instances only."
@@ -6249,11 +8188,19 @@ def get_cloud_vm_cluster_update_history_entry(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> UpdateHistoryEntry:
+) -> models.UpdateHistoryEntry:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -6264,13 +8211,13 @@ def get_cloud_vm_cluster_update_history_entry(
         response: oci.response.Response = (
             client.get_cloud_vm_cluster_update_history_entry(**kwargs)
         )
-        return map_updatehistoryentry(response.data)
+        return models.map_updatehistoryentry(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_cloud_vm_cluster_update_history_entry tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=("Gets the specified database node console connection's information.")
 )
 def get_console_connection(
@@ -6278,24 +8225,32 @@ def get_console_connection(
     console_connection_id: Annotated[
         Optional[Any], ("The OCID of the console connection.")
     ],
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> ConsoleConnection:
+) -> models.ConsoleConnection:
     try:
         client = get_database_client(region)
         kwargs = {}
         kwargs["db_node_id"] = db_node_id
         kwargs["console_connection_id"] = console_connection_id
         response: oci.response.Response = client.get_console_connection(**kwargs)
-        return map_consoleconnection(response.data)
+        return models.map_consoleconnection(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_console_connection tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=("Gets information about the specified database node console history.")
 )
 def get_console_history(
@@ -6304,11 +8259,19 @@ def get_console_history(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> ConsoleHistory:
+) -> models.ConsoleHistory:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -6317,13 +8280,13 @@ def get_console_history(
         if opc_request_id is not None:
             kwargs["opc_request_id"] = opc_request_id
         response: oci.response.Response = client.get_console_history(**kwargs)
-        return map_consolehistory(response.data)
+        return models.map_consolehistory(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_console_history tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Retrieves the specified database node console history contents upto a megabyte."
     )
@@ -6353,7 +8316,7 @@ def get_console_history_content(
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets the specified Data Guard association's configuration information."
     )
@@ -6363,62 +8326,86 @@ def get_data_guard_association(
     data_guard_association_id: Annotated[
         Optional[Any], ("The Data Guard association's `OCID`__.")
     ],
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> DataGuardAssociation:
+) -> models.DataGuardAssociation:
     try:
         client = get_database_client(region)
         kwargs = {}
         kwargs["database_id"] = database_id
         kwargs["data_guard_association_id"] = data_guard_association_id
         response: oci.response.Response = client.get_data_guard_association(**kwargs)
-        return map_dataguardassociation(response.data)
+        return models.map_dataguardassociation(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_data_guard_association tool: {e}")
         raise
 
 
-@mcp.tool(description=("Gets information about the specified database."))
+@tool(description=("Gets information about the specified database."))
 def get_database(
     database_id: Annotated[Optional[Any], ("The database `OCID`__.")],
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> Database:
+) -> models.Database:
     try:
         client = get_database_client(region)
         kwargs = {}
         kwargs["database_id"] = database_id
         response: oci.response.Response = client.get_database(**kwargs)
-        return map_database(response.data)
+        return models.map_database(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_database tool: {e}")
         raise
 
 
-@mcp.tool(description=("Gets information about the specified database software image."))
+@tool(description=("Gets information about the specified database software image."))
 def get_database_software_image(
     database_software_image_id: Annotated[Optional[Any], ("The DB system `OCID`__.")],
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> DatabaseSoftwareImage:
+) -> models.DatabaseSoftwareImage:
     try:
         client = get_database_client(region)
         kwargs = {}
         kwargs["database_software_image_id"] = database_software_image_id
         response: oci.response.Response = client.get_database_software_image(**kwargs)
-        return map_databasesoftwareimage(response.data)
+        return models.map_databasesoftwareimage(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_database_software_image tool: {e}")
         raise
 
 
-@mcp.tool(description=("gets the upgrade history for a specified database."))
+@tool(description=("gets the upgrade history for a specified database."))
 def get_database_upgrade_history_entry(
     database_id: Annotated[Optional[Any], ("The database `OCID`__.")],
     upgrade_history_entry_id: Annotated[
@@ -6427,11 +8414,19 @@ def get_database_upgrade_history_entry(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> DatabaseUpgradeHistoryEntry:
+) -> models.DatabaseUpgradeHistoryEntry:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -6442,53 +8437,69 @@ def get_database_upgrade_history_entry(
         response: oci.response.Response = client.get_database_upgrade_history_entry(
             **kwargs
         )
-        return map_databaseupgradehistoryentry(response.data)
+        return models.map_databaseupgradehistoryentry(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_database_upgrade_history_entry tool: {e}")
         raise
 
 
-@mcp.tool(description=("Gets information about the specified Database Home."))
+@tool(description=("Gets information about the specified Database Home."))
 def get_db_home(
     db_home_id: Annotated[Optional[Any], ("The Database Home `OCID`__.")],
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> DbHome:
+) -> models.DbHome:
     try:
         client = get_database_client(region)
         kwargs = {}
         kwargs["db_home_id"] = db_home_id
         response: oci.response.Response = client.get_db_home(**kwargs)
-        return map_dbhome(response.data)
+        return models.map_dbhome(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_db_home tool: {e}")
         raise
 
 
-@mcp.tool(description=("Gets information about a specified patch package."))
+@tool(description=("Gets information about a specified patch package."))
 def get_db_home_patch(
     db_home_id: Annotated[Optional[Any], ("The Database Home `OCID`__.")],
     patch_id: Annotated[Optional[Any], ("The `OCID`__ of the patch.")],
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> Patch:
+) -> models.Patch:
     try:
         client = get_database_client(region)
         kwargs = {}
         kwargs["db_home_id"] = db_home_id
         kwargs["patch_id"] = patch_id
         response: oci.response.Response = client.get_db_home_patch(**kwargs)
-        return map_patch(response.data)
+        return models.map_patch(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_db_home_patch tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=("Gets the patch history details for the specified patchHistoryEntryId")
 )
 def get_db_home_patch_history_entry(
@@ -6496,11 +8507,19 @@ def get_db_home_patch_history_entry(
     patch_history_entry_id: Annotated[
         Optional[Any], ("The `OCID`__ of the patch history entry.")
     ],
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> PatchHistoryEntry:
+) -> models.PatchHistoryEntry:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -6509,32 +8528,40 @@ def get_db_home_patch_history_entry(
         response: oci.response.Response = client.get_db_home_patch_history_entry(
             **kwargs
         )
-        return map_patchhistoryentry(response.data)
+        return models.map_patchhistoryentry(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_db_home_patch_history_entry tool: {e}")
         raise
 
 
-@mcp.tool(description=("Gets information about the specified database node."))
+@tool(description=("Gets information about the specified database node."))
 def get_db_node(
     db_node_id: Annotated[Optional[Any], ("The database node `OCID`__.")],
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> DbNode:
+) -> models.DbNode:
     try:
         client = get_database_client(region)
         kwargs = {}
         kwargs["db_node_id"] = db_node_id
         response: oci.response.Response = client.get_db_node(**kwargs)
-        return map_dbnode(response.data)
+        return models.map_dbnode(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_db_node tool: {e}")
         raise
 
 
-@mcp.tool(description=("Gets information about the Exadata Db server."))
+@tool(description=("Gets information about the Exadata Db server."))
 def get_db_server(
     exadata_infrastructure_id: Annotated[
         Optional[Any], ("The `OCID`__ of the ExadataInfrastructure.")
@@ -6543,11 +8570,19 @@ def get_db_server(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> DbServer:
+) -> models.DbServer:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -6556,53 +8591,69 @@ def get_db_server(
         if opc_request_id is not None:
             kwargs["opc_request_id"] = opc_request_id
         response: oci.response.Response = client.get_db_server(**kwargs)
-        return map_dbserver(response.data)
+        return models.map_dbserver(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_db_server tool: {e}")
         raise
 
 
-@mcp.tool(description=("Gets information about the specified DB system."))
+@tool(description=("Gets information about the specified DB system."))
 def get_db_system(
     db_system_id: Annotated[Optional[Any], ("The DB system `OCID`__.")],
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> DbSystem:
+) -> models.DbSystem:
     try:
         client = get_database_client(region)
         kwargs = {}
         kwargs["db_system_id"] = db_system_id
         response: oci.response.Response = client.get_db_system(**kwargs)
-        return map_dbsystem(response.data)
+        return models.map_dbsystem(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_db_system tool: {e}")
         raise
 
 
-@mcp.tool(description=("Gets information the specified patch."))
+@tool(description=("Gets information the specified patch."))
 def get_db_system_patch(
     db_system_id: Annotated[Optional[Any], ("The DB system `OCID`__.")],
     patch_id: Annotated[Optional[Any], ("The `OCID`__ of the patch.")],
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> Patch:
+) -> models.Patch:
     try:
         client = get_database_client(region)
         kwargs = {}
         kwargs["db_system_id"] = db_system_id
         kwargs["patch_id"] = patch_id
         response: oci.response.Response = client.get_db_system_patch(**kwargs)
-        return map_patch(response.data)
+        return models.map_patch(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_db_system_patch tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets the details of the specified patch operation on the specified DB system."
     )
@@ -6612,11 +8663,19 @@ def get_db_system_patch_history_entry(
     patch_history_entry_id: Annotated[
         Optional[Any], ("The `OCID`__ of the patch history entry.")
     ],
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> PatchHistoryEntry:
+) -> models.PatchHistoryEntry:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -6625,13 +8684,13 @@ def get_db_system_patch_history_entry(
         response: oci.response.Response = client.get_db_system_patch_history_entry(
             **kwargs
         )
-        return map_patchhistoryentry(response.data)
+        return models.map_patchhistoryentry(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_db_system_patch_history_entry tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets the details of the specified operating system upgrade operation for the"
         "specified DB system."
@@ -6645,11 +8704,19 @@ def get_db_system_upgrade_history_entry(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> DbSystemUpgradeHistoryEntry:
+) -> models.DbSystemUpgradeHistoryEntry:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -6660,13 +8727,13 @@ def get_db_system_upgrade_history_entry(
         response: oci.response.Response = client.get_db_system_upgrade_history_entry(
             **kwargs
         )
-        return map_dbsystemupgradehistoryentry(response.data)
+        return models.map_dbsystemupgradehistoryentry(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_db_system_upgrade_history_entry tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets information about the specified Exadata infrastructure. Applies to Exadata"
         "Cloud@Customer instances only."
@@ -6686,11 +8753,19 @@ def get_exadata_infrastructure(
             'response. Allowed values are: "multiRackConfigurationFile"'
         ),
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> ExadataInfrastructure:
+) -> models.ExadataInfrastructure:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -6700,13 +8775,13 @@ def get_exadata_infrastructure(
         if excluded_fields is not None:
             kwargs["excluded_fields"] = excluded_fields
         response: oci.response.Response = client.get_exadata_infrastructure(**kwargs)
-        return map_exadatainfrastructure(response.data)
+        return models.map_exadatainfrastructure(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_exadata_infrastructure tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets details of the available and consumed OCPUs for the specified Autonomous"
         "Exadata Infrastructure resource."
@@ -6719,11 +8794,19 @@ def get_exadata_infrastructure_ocpus(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> OCPUs:
+) -> models.OCPUs:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -6735,13 +8818,13 @@ def get_exadata_infrastructure_ocpus(
         response: oci.response.Response = client.get_exadata_infrastructure_ocpus(
             **kwargs
         )
-        return map_ocpus(response.data)
+        return models.map_ocpus(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_exadata_infrastructure_ocpus tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets un allocated resources information for the specified Exadata"
         "infrastructure. Applies to Exadata Cloud@Customer instances only."
@@ -6757,11 +8840,19 @@ def get_exadata_infrastructure_un_allocated_resources(
     db_servers: Annotated[
         Optional[Any], ("The list of `OCIDs`__ of the Db servers.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> ExadataInfrastructureUnAllocatedResources:
+) -> models.ExadataInfrastructureUnAllocatedResources:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -6773,7 +8864,9 @@ def get_exadata_infrastructure_un_allocated_resources(
         response: oci.response.Response = (
             client.get_exadata_infrastructure_un_allocated_resources(**kwargs)
         )
-        return map_exadatainfrastructureunallocatedresources(response.data)
+        return models.map_exadatainfrastructureunallocatedresources(
+            response.data, fields
+        )
     except Exception as e:
         logger.error(
             f"Error in get_exadata_infrastructure_un_allocated_resources tool: {e}"
@@ -6781,7 +8874,7 @@ def get_exadata_infrastructure_un_allocated_resources(
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets the IORM configuration settings for the specified cloud Exadata DB system."
     )
@@ -6791,11 +8884,19 @@ def get_exadata_iorm_config(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> ExadataIormConfig:
+) -> models.ExadataIormConfig:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -6803,13 +8904,13 @@ def get_exadata_iorm_config(
         if opc_request_id is not None:
             kwargs["opc_request_id"] = opc_request_id
         response: oci.response.Response = client.get_exadata_iorm_config(**kwargs)
-        return map_exadataiormconfig(response.data)
+        return models.map_exadataiormconfig(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_exadata_iorm_config tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets information about the specified Exadata VM cluster on Exascale"
         "Infrastructure. Applies to Exadata Database Service on Exascale Infrastructure"
@@ -6823,11 +8924,19 @@ def get_exadb_vm_cluster(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> ExadbVmCluster:
+) -> models.ExadbVmCluster:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -6835,13 +8944,13 @@ def get_exadb_vm_cluster(
         if opc_request_id is not None:
             kwargs["opc_request_id"] = opc_request_id
         response: oci.response.Response = client.get_exadb_vm_cluster(**kwargs)
-        return map_exadbvmcluster(response.data)
+        return models.map_exadbvmcluster(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_exadb_vm_cluster tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets information about a specified maintenance update package for a Exadata VM"
         "cluster on Exascale Infrastructure."
@@ -6855,11 +8964,19 @@ def get_exadb_vm_cluster_update(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> ExadbVmClusterUpdate:
+) -> models.ExadbVmClusterUpdate:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -6868,13 +8985,13 @@ def get_exadb_vm_cluster_update(
         if opc_request_id is not None:
             kwargs["opc_request_id"] = opc_request_id
         response: oci.response.Response = client.get_exadb_vm_cluster_update(**kwargs)
-        return map_exadbvmclusterupdate(response.data)
+        return models.map_exadbvmclusterupdate(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_exadb_vm_cluster_update tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets the maintenance update history details for the specified update history"
         "entry."
@@ -6890,11 +9007,19 @@ def get_exadb_vm_cluster_update_history_entry(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> ExadbVmClusterUpdateHistoryEntry:
+) -> models.ExadbVmClusterUpdateHistoryEntry:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -6905,13 +9030,13 @@ def get_exadb_vm_cluster_update_history_entry(
         response: oci.response.Response = (
             client.get_exadb_vm_cluster_update_history_entry(**kwargs)
         )
-        return map_exadbvmclusterupdatehistoryentry(response.data)
+        return models.map_exadbvmclusterupdatehistoryentry(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_exadb_vm_cluster_update_history_entry tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets information about the specified Exadata Database Storage Vaults in the"
         "specified compartment."
@@ -6924,11 +9049,19 @@ def get_exascale_db_storage_vault(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> ExascaleDbStorageVault:
+) -> models.ExascaleDbStorageVault:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -6936,23 +9069,31 @@ def get_exascale_db_storage_vault(
         if opc_request_id is not None:
             kwargs["opc_request_id"] = opc_request_id
         response: oci.response.Response = client.get_exascale_db_storage_vault(**kwargs)
-        return map_exascaledbstoragevault(response.data)
+        return models.map_exascaledbstoragevault(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_exascale_db_storage_vault tool: {e}")
         raise
 
 
-@mcp.tool(description=("Gets information about the specified execution action."))
+@tool(description=("Gets information about the specified execution action."))
 def get_execution_action(
     execution_action_id: Annotated[Optional[Any], ("The execution action `OCID`__.")],
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> ExecutionAction:
+) -> models.ExecutionAction:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -6960,23 +9101,31 @@ def get_execution_action(
         if opc_request_id is not None:
             kwargs["opc_request_id"] = opc_request_id
         response: oci.response.Response = client.get_execution_action(**kwargs)
-        return map_executionaction(response.data)
+        return models.map_executionaction(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_execution_action tool: {e}")
         raise
 
 
-@mcp.tool(description=("Gets information about the specified execution window."))
+@tool(description=("Gets information about the specified execution window."))
 def get_execution_window(
     execution_window_id: Annotated[Optional[Any], ("The execution window `OCID`__.")],
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> ExecutionWindow:
+) -> models.ExecutionWindow:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -6984,34 +9133,40 @@ def get_execution_window(
         if opc_request_id is not None:
             kwargs["opc_request_id"] = opc_request_id
         response: oci.response.Response = client.get_execution_window(**kwargs)
-        return map_executionwindow(response.data)
+        return models.map_executionwindow(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_execution_window tool: {e}")
         raise
 
 
-@mcp.tool(description=("Gets information about the specified external backup job."))
+@tool(description=("Gets information about the specified external backup job."))
 def get_external_backup_job(
     backup_id: Annotated[Optional[Any], ("The backup `OCID`__.")],
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> ExternalBackupJob:
+) -> models.ExternalBackupJob:
     try:
         client = get_database_client(region)
         kwargs = {}
         kwargs["backup_id"] = backup_id
         response: oci.response.Response = client.get_external_backup_job(**kwargs)
-        return map_externalbackupjob(response.data)
+        return models.map_externalbackupjob(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_external_backup_job tool: {e}")
         raise
 
 
-@mcp.tool(
-    description=("Gets information about the specified external container database.")
-)
+@tool(description=("Gets information about the specified external container database."))
 def get_external_container_database(
     external_container_database_id: Annotated[
         Optional[Any], ("The ExternalContainerDatabase `OCID`__.")
@@ -7019,11 +9174,19 @@ def get_external_container_database(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> ExternalContainerDatabase:
+) -> models.ExternalContainerDatabase:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -7033,15 +9196,13 @@ def get_external_container_database(
         response: oci.response.Response = client.get_external_container_database(
             **kwargs
         )
-        return map_externalcontainerdatabase(response.data)
+        return models.map_externalcontainerdatabase(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_external_container_database tool: {e}")
         raise
 
 
-@mcp.tool(
-    description=("Gets information about the specified external database connector.")
-)
+@tool(description=("Gets information about the specified external database connector."))
 def get_external_database_connector(
     external_database_connector_id: Annotated[
         Optional[Any],
@@ -7053,11 +9214,19 @@ def get_external_database_connector(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> ExternalDatabaseConnector:
+) -> models.ExternalDatabaseConnector:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -7067,13 +9236,13 @@ def get_external_database_connector(
         response: oci.response.Response = client.get_external_database_connector(
             **kwargs
         )
-        return map_externaldatabaseconnector(response.data)
+        return models.map_externaldatabaseconnector(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_external_database_connector tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=("Gets information about a specific external non-container database.")
 )
 def get_external_non_container_database(
@@ -7083,11 +9252,19 @@ def get_external_non_container_database(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> ExternalNonContainerDatabase:
+) -> models.ExternalNonContainerDatabase:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -7099,13 +9276,13 @@ def get_external_non_container_database(
         response: oci.response.Response = client.get_external_non_container_database(
             **kwargs
         )
-        return map_externalnoncontainerdatabase(response.data)
+        return models.map_externalnoncontainerdatabase(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_external_non_container_database tool: {e}")
         raise
 
 
-@mcp.tool(description=("Gets information about a specific"))
+@tool(description=("Gets information about a specific"))
 def get_external_pluggable_database(
     external_pluggable_database_id: Annotated[
         Optional[Any], ("The ExternalPluggableDatabaseId `OCID`__.")
@@ -7113,11 +9290,19 @@ def get_external_pluggable_database(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> ExternalPluggableDatabase:
+) -> models.ExternalPluggableDatabase:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -7127,13 +9312,13 @@ def get_external_pluggable_database(
         response: oci.response.Response = client.get_external_pluggable_database(
             **kwargs
         )
-        return map_externalpluggabledatabase(response.data)
+        return models.map_externalpluggabledatabase(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_external_pluggable_database tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets details of the Exadata Infrastructure target system software versions that"
         "can be applied to the specified infrastructure resource for maintenance updates."
@@ -7156,11 +9341,19 @@ def get_infrastructure_target_versions(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> InfrastructureTargetVersion:
+) -> models.InfrastructureTargetVersion:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -7174,23 +9367,31 @@ def get_infrastructure_target_versions(
         response: oci.response.Response = client.get_infrastructure_target_versions(
             **kwargs
         )
-        return map_infrastructuretargetversion(response.data)
+        return models.map_infrastructuretargetversion(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_infrastructure_target_versions tool: {e}")
         raise
 
 
-@mcp.tool(description=("Gets information about the specified key store."))
+@tool(description=("Gets information about the specified key store."))
 def get_key_store(
     key_store_id: Annotated[Optional[Any], ("The `OCID`__ of the key store.")],
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> KeyStore:
+) -> models.KeyStore:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -7198,63 +9399,87 @@ def get_key_store(
         if opc_request_id is not None:
             kwargs["opc_request_id"] = opc_request_id
         response: oci.response.Response = client.get_key_store(**kwargs)
-        return map_keystore(response.data)
+        return models.map_keystore(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_key_store tool: {e}")
         raise
 
 
-@mcp.tool(description=("Gets information about the specified maintenance run."))
+@tool(description=("Gets information about the specified maintenance run."))
 def get_maintenance_run(
     maintenance_run_id: Annotated[Optional[Any], ("The maintenance run OCID.")],
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> MaintenanceRun:
+) -> models.MaintenanceRun:
     try:
         client = get_database_client(region)
         kwargs = {}
         kwargs["maintenance_run_id"] = maintenance_run_id
         response: oci.response.Response = client.get_maintenance_run(**kwargs)
-        return map_maintenancerun(response.data)
+        return models.map_maintenancerun(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_maintenance_run tool: {e}")
         raise
 
 
-@mcp.tool(description=("Gets information about the specified maintenance run history."))
+@tool(description=("Gets information about the specified maintenance run history."))
 def get_maintenance_run_history(
     maintenance_run_history_id: Annotated[
         Optional[Any], ("The maintenance run history OCID.")
     ],
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> MaintenanceRunHistory:
+) -> models.MaintenanceRunHistory:
     try:
         client = get_database_client(region)
         kwargs = {}
         kwargs["maintenance_run_history_id"] = maintenance_run_history_id
         response: oci.response.Response = client.get_maintenance_run_history(**kwargs)
-        return map_maintenancerunhistory(response.data)
+        return models.map_maintenancerunhistory(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_maintenance_run_history tool: {e}")
         raise
 
 
-@mcp.tool(description=("Gets information about the specified one-off patch."))
+@tool(description=("Gets information about the specified one-off patch."))
 def get_oneoff_patch(
     oneoff_patch_id: Annotated[Optional[Any], ("The one-off patch `OCID`__.")],
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> OneoffPatch:
+) -> models.OneoffPatch:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -7262,13 +9487,13 @@ def get_oneoff_patch(
         if opc_request_id is not None:
             kwargs["opc_request_id"] = opc_request_id
         response: oci.response.Response = client.get_oneoff_patch(**kwargs)
-        return map_oneoffpatch(response.data)
+        return models.map_oneoffpatch(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_oneoff_patch tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets the details of operations performed to convert the specified database from"
         "non-container (non-CDB) to pluggable (PDB)."
@@ -7282,11 +9507,19 @@ def get_pdb_conversion_history_entry(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> PdbConversionHistoryEntry:
+) -> models.PdbConversionHistoryEntry:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -7297,23 +9530,31 @@ def get_pdb_conversion_history_entry(
         response: oci.response.Response = client.get_pdb_conversion_history_entry(
             **kwargs
         )
-        return map_pdbconversionhistoryentry(response.data)
+        return models.map_pdbconversionhistoryentry(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_pdb_conversion_history_entry tool: {e}")
         raise
 
 
-@mcp.tool(description=("Gets information about the specified Scheduled Action."))
+@tool(description=("Gets information about the specified Scheduled Action."))
 def get_scheduled_action(
     scheduled_action_id: Annotated[Optional[Any], ("The Scheduled Action `OCID`__.")],
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> ScheduledAction:
+) -> models.ScheduledAction:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -7321,23 +9562,31 @@ def get_scheduled_action(
         if opc_request_id is not None:
             kwargs["opc_request_id"] = opc_request_id
         response: oci.response.Response = client.get_scheduled_action(**kwargs)
-        return map_scheduledaction(response.data)
+        return models.map_scheduledaction(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_scheduled_action tool: {e}")
         raise
 
 
-@mcp.tool(description=("Gets information about the specified Scheduling Plan."))
+@tool(description=("Gets information about the specified Scheduling Plan."))
 def get_scheduling_plan(
     scheduling_plan_id: Annotated[Optional[Any], ("The Schedule Plan `OCID`__.")],
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> SchedulingPlan:
+) -> models.SchedulingPlan:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -7345,23 +9594,31 @@ def get_scheduling_plan(
         if opc_request_id is not None:
             kwargs["opc_request_id"] = opc_request_id
         response: oci.response.Response = client.get_scheduling_plan(**kwargs)
-        return map_schedulingplan(response.data)
+        return models.map_schedulingplan(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_scheduling_plan tool: {e}")
         raise
 
 
-@mcp.tool(description=("Gets information about the specified Scheduling Policy."))
+@tool(description=("Gets information about the specified Scheduling Policy."))
 def get_scheduling_policy(
     scheduling_policy_id: Annotated[Optional[Any], ("The Scheduling Policy `OCID`__.")],
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> SchedulingPolicy:
+) -> models.SchedulingPolicy:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -7369,24 +9626,32 @@ def get_scheduling_policy(
         if opc_request_id is not None:
             kwargs["opc_request_id"] = opc_request_id
         response: oci.response.Response = client.get_scheduling_policy(**kwargs)
-        return map_schedulingpolicy(response.data)
+        return models.map_schedulingpolicy(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_scheduling_policy tool: {e}")
         raise
 
 
-@mcp.tool(description=("Gets information about the specified Scheduling Window."))
+@tool(description=("Gets information about the specified Scheduling Window."))
 def get_scheduling_window(
     scheduling_policy_id: Annotated[Optional[Any], ("The Scheduling Policy `OCID`__.")],
     scheduling_window_id: Annotated[Optional[Any], ("The Scheduling Window `OCID`__.")],
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> SchedulingWindow:
+) -> models.SchedulingWindow:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -7395,13 +9660,13 @@ def get_scheduling_window(
         if opc_request_id is not None:
             kwargs["opc_request_id"] = opc_request_id
         response: oci.response.Response = client.get_scheduling_window(**kwargs)
-        return map_schedulingwindow(response.data)
+        return models.map_schedulingwindow(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_scheduling_window tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets information about the VM cluster. Applies to Exadata Cloud@Customer"
         "instances only."
@@ -7412,11 +9677,19 @@ def get_vm_cluster(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> VmCluster:
+) -> models.VmCluster:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -7424,13 +9697,13 @@ def get_vm_cluster(
         if opc_request_id is not None:
             kwargs["opc_request_id"] = opc_request_id
         response: oci.response.Response = client.get_vm_cluster(**kwargs)
-        return map_vmcluster(response.data)
+        return models.map_vmcluster(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_vm_cluster tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets information about the specified VM cluster network. Applies to Exadata"
         "Cloud@Customer instances only."
@@ -7446,11 +9719,19 @@ def get_vm_cluster_network(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> VmClusterNetwork:
+) -> models.VmClusterNetwork:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -7459,34 +9740,42 @@ def get_vm_cluster_network(
         if opc_request_id is not None:
             kwargs["opc_request_id"] = opc_request_id
         response: oci.response.Response = client.get_vm_cluster_network(**kwargs)
-        return map_vmclusternetwork(response.data)
+        return models.map_vmclusternetwork(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_vm_cluster_network tool: {e}")
         raise
 
 
-@mcp.tool(description=("Gets information about a specified patch package."))
+@tool(description=("Gets information about a specified patch package."))
 def get_vm_cluster_patch(
     vm_cluster_id: Annotated[Optional[Any], ("The VM cluster `OCID`__.")],
     patch_id: Annotated[Optional[Any], ("The `OCID`__ of the patch.")],
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> Patch:
+) -> models.Patch:
     try:
         client = get_database_client(region)
         kwargs = {}
         kwargs["vm_cluster_id"] = vm_cluster_id
         kwargs["patch_id"] = patch_id
         response: oci.response.Response = client.get_vm_cluster_patch(**kwargs)
-        return map_patch(response.data)
+        return models.map_patch(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_vm_cluster_patch tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets the patch history details for the specified patch history entry."
     )
@@ -7496,11 +9785,19 @@ def get_vm_cluster_patch_history_entry(
     patch_history_entry_id: Annotated[
         Optional[Any], ("The `OCID`__ of the patch history entry.")
     ],
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> PatchHistoryEntry:
+) -> models.PatchHistoryEntry:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -7509,13 +9806,13 @@ def get_vm_cluster_patch_history_entry(
         response: oci.response.Response = client.get_vm_cluster_patch_history_entry(
             **kwargs
         )
-        return map_patchhistoryentry(response.data)
+        return models.map_patchhistoryentry(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_vm_cluster_patch_history_entry tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets information about a specified maintenance update package for a VM cluster."
         "Applies to Exadata Cloud@Customer instances only."
@@ -7527,11 +9824,19 @@ def get_vm_cluster_update(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> VmClusterUpdate:
+) -> models.VmClusterUpdate:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -7540,13 +9845,13 @@ def get_vm_cluster_update(
         if opc_request_id is not None:
             kwargs["opc_request_id"] = opc_request_id
         response: oci.response.Response = client.get_vm_cluster_update(**kwargs)
-        return map_vmclusterupdate(response.data)
+        return models.map_vmclusterupdate(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_vm_cluster_update tool: {e}")
         raise
 
 
-@mcp.tool(
+@tool(
     description=(
         "Gets the maintenance update history details for the specified update history"
         "entry. Applies to Exadata Cloud@Customer instances only."
@@ -7560,11 +9865,19 @@ def get_vm_cluster_update_history_entry(
     opc_request_id: Annotated[
         Optional[Any], ("Unique identifier for the request.")
     ] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        (
+            'Attributes to return, e.g. ["id", "display_name",'
+            ' "lifecycle_state"]; all of them by default. Only these'
+            " attributes are mapped and returned."
+        ),
+    ] = None,
     region: Annotated[
         str,
         "Region to execute the request (Use list_subscribed_regions_tool from identity server to get proper region identifier), if no region is specified then default will be picked",
     ] = None,
-) -> VmClusterUpdateHistoryEntry:
+) -> models.VmClusterUpdateHistoryEntry:
     try:
         client = get_database_client(region)
         kwargs = {}
@@ -7575,13 +9888,98 @@ def get_vm_cluster_update_history_entry(
         response: oci.response.Response = client.get_vm_cluster_update_history_entry(
             **kwargs
         )
-        return map_vmclusterupdatehistoryentry(response.data)
+        return models.map_vmclusterupdatehistoryentry(response.data, fields)
     except Exception as e:
         logger.error(f"Error in get_vm_cluster_update_history_entry tool: {e}")
         raise
 
 
+@tool(
+    description=(
+        "Lists the groups of database tools, with their number of tools and how"
+        " many of them are enabled. Use enable_tool_groups to enable the tools"
+        " of a group before calling them."
+    )
+)
+def list_tool_groups() -> list[dict]:
+    try:
+        return tool_groups.describe()
+    except Exception as e:
+        logger.error(f"Error in list_tool_groups tool: {e}")
+        raise
+
+
+@tool(
+    description=(
+        "Enables the tools of the given groups, after which they are listed and"
+        " can be called. The groups are enabled for the whole server, i.e. for"
+        " every session, not only this one. Returns the names of the tools"
+        " enabled."
+    )
+)
+def enable_tool_groups(
+    groups: Annotated[
+        list[str],
+        f"Groups to enable: {', '.join(GROUPS)}, or all",
+    ],
+) -> list[str]:
+    try:
+        enabled = tool_groups.enable(groups)
+        logger.info(f"Enabled {len(enabled)} tools of {', '.join(groups)}")
+        return enabled
+    except Exception as e:
+        logger.error(f"Error in enable_tool_groups tool: {e}")
+        raise
+
+
+# Only the tools of the profile are listed; the discovery tools enable the
+# other groups on demand in the `discover` profile
+tool_groups = ToolGroups(registered_tools, ("list_tool_groups", "enable_tool_groups"))
+tool_groups.apply(os.getenv("ORACLE_MCP_DATABASE_TOOL_PROFILE"))
+
+
+def warm_clients(setting: Optional[str]):
+    """
+    Builds the clients of ORACLE_MCP_DATABASE_WARM_REGIONS: `subscribed` for
+    every region the tenancy is subscribed to, or a comma-separated list
+    """
+    if not setting:
+        return
+    regions = None
+    if setting.strip().lower() != "subscribed":
+        regions = [region.strip() for region in setting.split(",") if region.strip()]
+    try:
+        client_pool.warm(regions)
+    except Exception as e:
+        logger.warning(f"Could not warm database clients: {e}")
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="OCI Database Service MCP server")
+    parser.add_argument(
+        "--profile",
+        help=(
+            "Tools to serve: comma-separated groups"
+            f" ({', '.join(GROUPS)}), all, readonly or discover"
+            " (default: ORACLE_MCP_DATABASE_TOOL_PROFILE, or all)"
+        ),
+    )
+    return parser.parse_args(argv)
+
+
 def main():
+    args = parse_args()
+    tool_schemas.save()
+    if args.profile:
+        enabled = tool_groups.apply(args.profile)
+        logger.info(f"Serving {len(enabled)} tools of the {args.profile} profile")
+    warming = threading.Thread(
+        target=warm_clients,
+        args=(os.getenv("ORACLE_MCP_DATABASE_WARM_REGIONS"),),
+        name="warm-database-clients",
+        daemon=True,
+    )
+    warming.start()
     mcp.run()
 
 
@@ -0,0 +1,201 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import os
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from oracle.oci_database_mcp_server import server
+from oracle.oci_database_mcp_server.client_pool import DatabaseClientPool
+
+
+@pytest.fixture
+def credentials(tmp_path, monkeypatch):
+    config = {
+        "region": "us-ashburn-1",
+        "tenancy": "ocid1.tenancy",
+    }
+    yield from make_credentials(tmp_path, monkeypatch, config, token=True)
+
+
+@pytest.fixture
+def api_key_credentials(tmp_path, monkeypatch):
+    config = {
+        "region": "us-ashburn-1",
+        "tenancy": "ocid1.tenancy",
+        "user": "ocid1.user",
+        "fingerprint": "00:00",
+    }
+    yield from make_credentials(tmp_path, monkeypatch, config, token=False)
+
+
+def make_credentials(tmp_path, monkeypatch, config, token):
+    config_file = tmp_path / "config"
+    key_file = tmp_path / "key.pem"
+    token_file = tmp_path / "token"
+    for path in (config_file, key_file, token_file):
+        path.write_text("")
+    token_file.write_text("token-1")
+    for path in (config_file, key_file, token_file):
+        set_age(path, 60)
+    monkeypatch.setenv("OCI_CONFIG_FILE", str(config_file))
+    config = dict(config, key_file=str(key_file))
+    if token:
+        config["security_token_file"] = str(token_file)
+
+    with patch("oci.config.from_file", side_effect=lambda **_: dict(config)), patch(
+        "oci.signer.load_private_key_from_file"
+    ), patch(
+        "oci.auth.signers.SecurityTokenSigner",
+        side_effect=lambda token, key: SimpleNamespace(token=token),
+    ), patch(
+        "oci.signer.Signer",
+        side_effect=lambda **kwargs: SimpleNamespace(token=None, **kwargs),
+    ), patch(
+        "oci.database.DatabaseClient",
+        side_effect=lambda config, signer: SimpleNamespace(
+            region=config["region"], signer=signer, config=config
+        ),
+    ), patch(
+        "oci.identity.IdentityClient"
+    ) as identity:
+        yield SimpleNamespace(
+            config_file=config_file, token_file=token_file, identity=identity
+        )
+
+
+def set_age(path, seconds):
+    mtime_ns = time.time_ns() - seconds * 1_000_000_000
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def touch_later(path, text):
+    path.write_text(text)
+    set_age(path, 30)
+
+
+class TestDatabaseClientPool:
+    def test_one_client_per_region(self, credentials):
+        pool = DatabaseClientPool(MagicMock(), "oci-database-mcp/1.0")
+
+        default = pool.get()
+        phoenix = pool.get("us-phoenix-1")
+
+        assert pool.get() is default
+        assert pool.get("us-ashburn-1") is default
+        assert pool.get("us-phoenix-1") is phoenix
+        assert phoenix.region == "us-phoenix-1"
+        assert phoenix.signer is default.signer
+        assert phoenix.config["additional_user_agent"] == "oci-database-mcp/1.0"
+        assert len(pool) == 2
+
+    def test_refreshed_token_rebuilds_the_clients(self, credentials):
+        pool = DatabaseClientPool(MagicMock(), "oci-database-mcp/1.0")
+        before = pool.get("us-phoenix-1")
+
+        touch_later(credentials.token_file, "token-2")
+        after = pool.get("us-phoenix-1")
+
+        assert after is not before
+        assert (before.signer.token, after.signer.token) == ("token-1", "token-2")
+        assert pool.get("us-phoenix-1") is after
+
+    def test_just_written_credentials_are_loaded_again(self, credentials):
+        pool = DatabaseClientPool(MagicMock(), "oci-database-mcp/1.0")
+        credentials.token_file.write_text("token-2")
+
+        first = pool.get()
+        assert pool.get() is not first
+
+        set_age(credentials.token_file, 30)
+        settled = pool.get()
+        assert pool.get() is settled
+        assert settled.signer.token == "token-2"
+
+    def test_concurrent_callers_share_a_client(self, credentials):
+        pool = DatabaseClientPool(MagicMock(), "oci-database-mcp/1.0")
+        start = threading.Barrier(8)
+        clients = []
+
+        def get():
+            start.wait()
+            clients.append(pool.get("us-phoenix-1"))
+
+        threads = [threading.Thread(target=get) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(client) for client in clients}) == 1
+
+    def test_warm_subscribed_regions(self, credentials):
+        credentials.identity.return_value.list_region_subscriptions.return_value.data = [
+            SimpleNamespace(region_name="us-ashburn-1", status="READY"),
+            SimpleNamespace(region_name="us-phoenix-1", status="READY"),
+            SimpleNamespace(region_name="eu-paris-1", status="IN_PROGRESS"),
+        ]
+        pool = DatabaseClientPool(MagicMock(), "oci-database-mcp/1.0")
+
+        assert pool.warm() == ["us-ashburn-1", "us-phoenix-1"]
+        # the identity client and the two database clients
+        assert len(pool) == 3
+        credentials.identity.return_value.list_region_subscriptions.assert_called_once_with(
+            "ocid1.tenancy"
+        )
+
+    def test_subscribed_regions_are_kept_until_credentials_change(self, credentials):
+        list_region_subscriptions = (
+            credentials.identity.return_value.list_region_subscriptions
+        )
+        list_region_subscriptions.return_value.data = [
+            SimpleNamespace(region_name="us-ashburn-1", status="READY"),
+        ]
+        pool = DatabaseClientPool(MagicMock(), "oci-database-mcp/1.0")
+
+        assert pool.subscribed_regions() == ["us-ashburn-1"]
+        assert pool.subscribed_regions() == ["us-ashburn-1"]
+        assert credentials.identity.call_count == 1
+        assert list_region_subscriptions.call_count == 1
+
+        touch_later(credentials.token_file, "token-2")
+        assert pool.subscribed_regions() == ["us-ashburn-1"]
+        assert credentials.identity.call_count == 2
+        assert list_region_subscriptions.call_count == 2
+
+    def test_api_key_profile(self, api_key_credentials):
+        pool = DatabaseClientPool(MagicMock(), "oci-database-mcp/1.0")
+        client = pool.get()
+
+        assert client.signer.user == "ocid1.user"
+        assert pool.get() is client
+
+        touch_later(api_key_credentials.config_file, "[DEFAULT]")
+        assert pool.get() is not client
+
+
+class TestWarmClients:
+    def test_region_list(self):
+        with patch.object(server.client_pool, "warm") as warm:
+            server.warm_clients(" us-phoenix-1, eu-paris-1 ,")
+            server.warm_clients("Subscribed")
+            server.warm_clients(None)
+
+        assert [c.args for c in warm.call_args_list] == [
+            (["us-phoenix-1", "eu-paris-1"],),
+            (None,),
+        ]
+
+    def test_failures_are_logged(self):
+        with patch.object(
+            server.client_pool, "warm", side_effect=RuntimeError("no config")
+        ), patch.object(server, "logger") as logger:
+            server.warm_clients("subscribed")
+
+        assert "no config" in logger.warning.call_args.args[0]
@@ -1553,7 +1553,7 @@ async def test_create_pluggable_database_from_local_clone(mock_call, mock_get_cl
     mock_client = MagicMock()
     mock_get_client.return_value = mock_client
 
-    mock_call.return_value = {"ok": True}
+    mock_call.return_value = ({"ok": True}, None)
 
     async with Client(mcp) as client:
         response = await client.call_tool(
@@ -1577,7 +1577,7 @@ async def test_create_pluggable_database_from_remote_clone(mock_call, mock_get_c
     mock_client = MagicMock()
     mock_get_client.return_value = mock_client
 
-    mock_call.return_value = {"ok": True}
+    mock_call.return_value = ({"ok": True}, None)
 
     async with Client(mcp) as client:
         response = await client.call_tool(
@@ -1602,7 +1602,7 @@ async def test_create_pluggable_database_from_relocate(mock_call, mock_get_clien
     mock_client = MagicMock()
     mock_get_client.return_value = mock_client
 
-    mock_call.return_value = {"ok": True}
+    mock_call.return_value = ({"ok": True}, None)
 
     async with Client(mcp) as client:
         response = await client.call_tool(
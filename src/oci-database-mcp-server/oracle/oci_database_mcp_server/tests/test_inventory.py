@@ -0,0 +1,155 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastmcp import Client
+from oracle.oci_database_mcp_server import server
+from oracle.oci_database_mcp_server.inventory import (
+    STALE_INVENTORY,
+    InventoryCache,
+    changed_family,
+)
+from oracle.oci_database_mcp_server.pagination import ListPage
+
+ARGUMENTS = {"compartment_id": "ocid1.compartment", "lifecycle_state": "AVAILABLE"}
+
+
+def listing(*ids):
+    return ListPage.model_construct(items=[{"id": i} for i in ids], next_page=None)
+
+
+class TestInventoryCache:
+    def test_fresh_listings_are_served_with_their_age(self):
+        cache = InventoryCache(ttl=60)
+        with patch("time.monotonic", return_value=100.0):
+            cache.put("databases", "r1", None, ARGUMENTS, listing("a"))
+        with patch("time.monotonic", return_value=112.5):
+            cached = cache.get(
+                "databases", "r1", None, dict(ARGUMENTS, opc_request_id="x")
+            )
+        with patch("time.monotonic", return_value=160.0):
+            stale = cache.get("databases", "r1", None, ARGUMENTS)
+
+        assert cached.items == [{"id": "a"}]
+        assert cached.age_seconds == 12.5
+        assert stale is None
+        assert cache.get("databases", "r1", 10, ARGUMENTS) is None
+        assert cache.get("databases", "r2", None, ARGUMENTS) is None
+
+    def test_invalidate(self):
+        cache = InventoryCache(ttl=60)
+        for resource_type in ("databases", "db_systems"):
+            for region in ("r1", "r2", None):
+                cache.put(resource_type, region, None, ARGUMENTS, listing("a"))
+
+        # a region also drops the listings made in the default region
+        assert cache.invalidate("databases", region="r1") == 2
+        assert cache.get("databases", "r2", None, ARGUMENTS) is not None
+        assert cache.invalidate(compartment_id="ocid1.other") == 0
+        assert cache.invalidate("db_systems") == 3
+        assert cache.invalidate() == 1
+
+    def test_invalidate_family(self):
+        cache = InventoryCache(ttl=60)
+        for resource_type in ("databases", "db_systems"):
+            for region in ("r1", "r2"):
+                cache.put(resource_type, region, None, ARGUMENTS, listing("a"))
+
+        assert cache.invalidate_family("pluggable_database", "r1") == 1
+        assert cache.get("databases", "r2", None, ARGUMENTS) is not None
+        assert cache.get("db_systems", "r1", None, ARGUMENTS) is not None
+
+    def test_zero_ttl_disables_the_cache(self):
+        cache = InventoryCache(ttl=0)
+        cache.put("databases", None, None, ARGUMENTS, listing("a"))
+
+        assert cache.get("databases", None, None, ARGUMENTS) is None
+
+
+@pytest.mark.parametrize(
+    "tool_name, family",
+    [
+        ("delete_pluggable_database", "pluggable_database"),
+        ("create_pluggable_database_from_local_clone", "pluggable_database"),
+        ("get_pluggable_database", None),
+        ("list_pluggable_databases", None),
+        ("resource_pool_shapes", None),
+        ("enable_tool_groups", None),
+    ],
+)
+def test_changed_family(tool_name, family):
+    assert changed_family(tool_name) == family
+
+
+# tools that do not change any OCI resource
+READ_TOOLS = ("resource_pool_shapes", "enable_tool_groups")
+
+
+def test_every_mutating_tool_has_a_resource_family():
+    mutating = [
+        name
+        for name in server.registered_tools
+        if not name.startswith(("get_", "list_")) and name not in READ_TOOLS
+    ]
+
+    assert mutating
+    assert [
+        name for name in mutating if changed_family(name) not in STALE_INVENTORY
+    ] == []
+
+
+@pytest.mark.asyncio
+async def test_tools_reuse_and_refresh_listings():
+    client = MagicMock()
+    client.list_databases.return_value = SimpleNamespace(
+        data=[{"id": "ocid1.database"}], next_page=None
+    )
+    arguments = {"compartment_id": "ocid1.compartment", "db_home_id": "ocid1.dbhome"}
+
+    with patch.object(server, "inventory", InventoryCache(ttl=60)), patch.object(
+        server, "get_database_client", return_value=client
+    ):
+        async with Client(server.mcp) as mcp_client:
+            first = await mcp_client.call_tool("list_databases", arguments)
+            second = await mcp_client.call_tool("list_databases", arguments)
+            refreshed = await mcp_client.call_tool(
+                "list_databases", dict(arguments, refresh=True)
+            )
+            await mcp_client.call_tool(
+                "delete_pluggable_database", {"pluggable_database_id": "ocid1.pdb"}
+            )
+            after_delete = await mcp_client.call_tool("list_databases", arguments)
+
+    assert first.structured_content["age_seconds"] is None
+    assert second.structured_content["age_seconds"] >= 0
+    assert second.structured_content["items"] == first.structured_content["items"]
+    assert refreshed.structured_content["age_seconds"] is None
+    assert after_delete.structured_content["age_seconds"] is None
+    assert client.list_databases.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_changes_keep_the_listings():
+    client = MagicMock()
+    client.delete_pluggable_database.side_effect = RuntimeError("conflict")
+    cache = InventoryCache(ttl=60)
+    cache.put("databases", "r1", None, ARGUMENTS, listing("a"))
+
+    with patch.object(server, "inventory", cache), patch.object(
+        server, "get_database_client", return_value=client
+    ):
+        async with Client(server.mcp) as mcp_client:
+            result = await mcp_client.call_tool(
+                "delete_pluggable_database",
+                {"pluggable_database_id": "ocid1.pdb", "region": "r1"},
+                raise_on_error=False,
+            )
+
+    assert result.is_error
+    assert cache.get("databases", "r1", None, ARGUMENTS) is not None
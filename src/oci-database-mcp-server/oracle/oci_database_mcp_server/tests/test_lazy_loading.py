@@ -0,0 +1,167 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastmcp import Client, FastMCP
+from oracle.oci_database_mcp_server import models, server
+from oracle.oci_database_mcp_server.tool_cache import ToolSchemaCache
+
+PACKAGE_ROOT = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+IMPORT_AND_CALL = """
+import asyncio, json, sys
+from unittest.mock import MagicMock, patch
+from fastmcp import Client
+from oracle.oci_database_mcp_server import server
+
+# as main() does on startup
+server.tool_schemas.save()
+
+def families():
+    prefix = "oracle.oci_database_mcp_server.models."
+    return sorted(m[len(prefix):] for m in sys.modules if m.startswith(prefix))
+
+after_import = families()
+
+async def call():
+    client = MagicMock()
+    client.get_pluggable_database.return_value.data = {"id": "ocid1.pdb"}
+    with patch.object(server, "get_database_client", return_value=client):
+        async with Client(server.mcp) as mcp_client:
+            await mcp_client.call_tool(
+                "get_pluggable_database", {"pluggable_database_id": "ocid1.pdb"}
+            )
+
+asyncio.run(call())
+print(json.dumps({
+    "misses": server.tool_schemas.misses,
+    "after_import": after_import,
+    "after_call": families(),
+}))
+"""
+
+
+def import_server(cache_dir):
+    env = dict(os.environ, ORACLE_MCP_TOOL_SCHEMA_CACHE_DIR=str(cache_dir))
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [PACKAGE_ROOT, env.get("PYTHONPATH")])
+    )
+    output = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", IMPORT_AND_CALL],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+async def server_tools():
+    return await server.mcp.get_tools()
+
+
+class TestModelsPackage:
+    def test_names_resolve_to_their_family(self):
+        assert models.AutonomousDatabase.__module__.endswith("models.autonomous")
+        assert models.map_pluggabledatabase.__module__.endswith("models.pluggable")
+        assert models.MaintenanceRun.__module__.endswith("models.maintenance")
+        assert "AutonomousDatabase" in dir(models)
+
+    def test_unknown_name(self):
+        with pytest.raises(AttributeError, match="NotAModel"):
+            models.NotAModel
+
+
+class TestToolSchemaCache:
+    @pytest.mark.asyncio
+    async def test_cached_tools_match_generated_tools(self, tmp_path):
+        functions = [tool.fn for tool in (await server_tools()).values()]
+
+        cold = ToolSchemaCache(MagicMock(), str(tmp_path), sources=[])
+        cold_mcp = FastMCP("cold")
+        for fn in functions:
+            cold.tool(cold_mcp, description=f"{fn.__name__} tool")(fn)
+        cold.save()
+
+        warm = ToolSchemaCache(MagicMock(), str(tmp_path), sources=[])
+        warm_mcp = FastMCP("warm")
+        for fn in functions:
+            warm.tool(warm_mcp, description=f"{fn.__name__} tool")(fn)
+        warm.save()
+
+        assert (cold.hits, cold.misses) == (0, len(functions))
+        assert (warm.hits, warm.misses) == (len(functions), 0)
+        cold_tools = await cold_mcp.get_tools()
+        warm_tools = await warm_mcp.get_tools()
+        assert [tool.to_mcp_tool().model_dump() for tool in warm_tools.values()] == [
+            tool.to_mcp_tool().model_dump() for tool in cold_tools.values()
+        ]
+
+        client = MagicMock()
+        client.get_pluggable_database.return_value.data = {"id": "ocid1.pdb"}
+        with patch.object(server, "get_database_client", return_value=client):
+            async with Client(warm_mcp) as mcp_client:
+                result = await mcp_client.call_tool(
+                    "get_pluggable_database", {"pluggable_database_id": "ocid1.pdb"}
+                )
+        assert result.structured_content["id"] == "ocid1.pdb"
+
+    def test_sources_and_versions_key_the_cache(self, tmp_path):
+        source = tmp_path / "server.py"
+        source.write_text("one")
+        first = ToolSchemaCache(MagicMock(), str(tmp_path), sources=[str(source)])
+        source.write_text("two")
+        second = ToolSchemaCache(MagicMock(), str(tmp_path), sources=[str(source)])
+
+        assert first.path != second.path
+        assert ToolSchemaCache(MagicMock(), str(tmp_path)).path.startswith(
+            str(tmp_path / "tools-")
+        )
+
+    def test_unreadable_cache(self, tmp_path):
+        logger = MagicMock()
+        path = ToolSchemaCache(logger, str(tmp_path), sources=[]).path
+        with open(path, "w") as cache_file:
+            cache_file.write("{not json")
+
+        assert ToolSchemaCache(logger, str(tmp_path), sources=[]).schemas == {}
+        logger.warning.assert_called_once()
+
+        with open(path, "w") as cache_file:
+            cache_file.write("[]")
+        assert ToolSchemaCache(logger, str(tmp_path), sources=[]).schemas == {}
+
+    def test_unwritable_cache(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        logger = MagicMock()
+        cache = ToolSchemaCache(logger, str(blocker / "cache"), sources=[])
+
+        cache.tool(FastMCP("test"))(server.get_pluggable_database.fn)
+        cache.save()
+
+        assert "Could not write" in logger.warning.call_args.args[0]
+
+
+class TestStartup:
+    def test_models_are_imported_on_first_tool_call(self, tmp_path):
+        cold = import_server(tmp_path)
+        warm = import_server(tmp_path)
+
+        assert cold["misses"] > 100
+        assert warm["misses"] == 0
+        # without cached schemas every family is built to generate them
+        assert "autonomous" in cold["after_import"]
+        assert warm["after_import"] == ["base"]
+        assert warm["after_call"] == ["base", "pluggable"]
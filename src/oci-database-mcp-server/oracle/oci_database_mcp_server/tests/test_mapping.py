@@ -0,0 +1,96 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import datetime
+from types import SimpleNamespace
+
+import oci
+import pytest
+from oracle.oci_database_mcp_server import models
+from pydantic import ValidationError
+
+SCALARS = {
+    "str": "sample",
+    "int": 3,
+    "float": 2,  # an int, as the service often returns for float fields
+    "bool": True,
+    "datetime": datetime.datetime(2026, 1, 2, 3, 4, 5),
+    "date": datetime.date(2026, 1, 2),
+    "object": {"key": "value"},
+}
+
+
+def sample_value(swagger_type: str, depth: int):
+    if swagger_type in SCALARS:
+        return SCALARS[swagger_type]
+    if swagger_type.startswith("list["):
+        return [sample_value(swagger_type[5:-1], depth)]
+    if swagger_type.startswith("dict("):
+        return {"key": "value"}
+    sdk_class = getattr(oci.database.models, swagger_type, None)
+    if sdk_class is None or depth == 0:
+        return None
+    return sample(sdk_class, depth - 1)
+
+
+def sample(sdk_class, depth: int = 1):
+    """An SDK object with every attribute set, nested models included"""
+    o = sdk_class()
+    for name, swagger_type in o.swagger_types.items():
+        try:
+            setattr(o, name, sample_value(swagger_type, depth))
+        except ValueError:
+            pass  # an enum of a request model, which rejects unknown values
+    return o
+
+
+MAPPED = [
+    name
+    for family in models._FAMILIES.values()
+    for name in family
+    if hasattr(oci.database.models, name)
+]
+
+
+@pytest.mark.parametrize("name", MAPPED)
+def test_fast_path_matches_validation(name):
+    model = getattr(models, name)
+    o = sample(getattr(oci.database.models, name))
+
+    mapper = getattr(models, f"map_{name.lower()}")
+    try:
+        validated = model(**oci.util.to_dict(o))
+    except ValidationError:
+        # e.g. the tags of PluggableDatabase, typed as strings
+        with pytest.raises(ValidationError):
+            mapper(o)
+        return
+    mapped = mapper(o)
+
+    assert mapped.model_dump(mode="json") == validated.model_dump(mode="json")
+    assert mapped.model_fields_set == validated.model_fields_set
+
+
+def test_typed_fields_are_coerced():
+    o = oci.database.models.PluggableDatabase(
+        id="ocid1.pdb", time_created=datetime.datetime(2026, 1, 2)
+    )
+    o.is_restricted = None
+
+    pdb = models.map_pluggabledatabase(o)
+
+    assert pdb.time_created == datetime.datetime(
+        2026, 1, 2, tzinfo=datetime.timezone.utc
+    )
+    assert pdb.is_restricted is None
+
+
+def test_other_objects_are_validated():
+    assert models.map_pluggabledatabase(None) is None
+    assert models.map_pluggabledatabase({"id": "ocid1.pdb"}).id == "ocid1.pdb"
+    assert (
+        models.map_pluggabledatabase(SimpleNamespace(id="ocid1.pdb")).id == "ocid1.pdb"
+    )
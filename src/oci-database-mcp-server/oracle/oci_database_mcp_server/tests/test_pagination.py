@@ -0,0 +1,184 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastmcp import Client
+from oracle.oci_database_mcp_server import server
+from oracle.oci_database_mcp_server.pagination import (
+    decode_page,
+    paginate,
+    paginate_regions,
+)
+
+
+class FakeListing:
+    """An OCI list operation over `total` items served `page_size` at a time"""
+
+    def __init__(self, total: int, page_size: int):
+        self.total = total
+        self.page_size = page_size
+        self.calls = []
+
+    def __call__(self, page=None, **kwargs):
+        self.calls.append(page)
+        start = int(page or 0)
+        end = min(start + self.page_size, self.total)
+        return SimpleNamespace(
+            data=[{"id": f"ocid1.{i}"} for i in range(start, end)],
+            next_page=str(end) if end < self.total else None,
+        )
+
+
+def identity(item):
+    return item
+
+
+class TestPaginate:
+    def test_lists_every_page(self):
+        listing = FakeListing(total=25, page_size=10)
+
+        page = paginate(listing, identity, compartment_id="ocid1.compartment")
+
+        assert [item["id"] for item in page.items] == [f"ocid1.{i}" for i in range(25)]
+        assert page.next_page is None
+        assert listing.calls == [None, "10", "20"]
+
+    def test_stops_at_max_items_and_resumes(self):
+        listing = FakeListing(total=25, page_size=10)
+
+        first = paginate(listing, identity, max_items=15)
+        second = paginate(listing, identity, max_items=15, page=first.next_page)
+
+        assert len(first.items) == 15
+        assert decode_page(first.next_page) == ("10", 5)
+        # the third page is not fetched once the budget is reached
+        assert listing.calls == [None, "10", "10", "20"]
+        assert first.items + second.items == FakeListing(25, 25)().data
+        assert second.next_page is None
+
+    def test_budget_ending_on_a_page_boundary(self):
+        listing = FakeListing(total=25, page_size=10)
+
+        page = paginate(listing, identity, max_items=10)
+
+        assert page.next_page == "10"
+        assert listing.calls == [None]
+
+    def test_next_page_is_fetched_while_mapping(self):
+        listing = FakeListing(total=20, page_size=10)
+        fetched = threading.Event()
+
+        def fetch(page=None, **kwargs):
+            response = listing(page, **kwargs)
+            if page:
+                fetched.set()
+            return response
+
+        def map_item(item):
+            # mapping the first page waits for the second to be requested
+            if item["id"] == "ocid1.9":
+                assert fetched.wait(timeout=5)
+            return item
+
+        assert len(paginate(fetch, map_item).items) == 20
+
+    def test_prefetch_errors_are_raised(self):
+        listing = FakeListing(total=20, page_size=10)
+
+        def fetch(page=None, **kwargs):
+            if page:
+                raise RuntimeError("throttled")
+            return listing(page, **kwargs)
+
+        with pytest.raises(RuntimeError, match="throttled"):
+            paginate(fetch, identity)
+
+    def test_invalid_page_token(self):
+        with pytest.raises(ValueError, match="Invalid page token"):
+            paginate(FakeListing(1, 1), identity, page="mcp-page.not-base64!")
+
+
+class TestPaginateRegions:
+    def test_regions_are_listed_concurrently(self):
+        started = threading.Barrier(3, timeout=5)
+        listings = {region: FakeListing(5, 10) for region in ("r1", "r2", "r3")}
+
+        def list_region(region):
+            # every region waits until all three are being listed
+            started.wait()
+            return paginate(listings[region], identity)
+
+        page = paginate_regions(["r1", "r2", "r3"], list_region)
+
+        assert [region.region for region in page.regions] == ["r1", "r2", "r3"]
+        assert [len(region.items) for region in page.regions] == [5, 5, 5]
+        assert page.items == []
+
+    def test_failed_region_is_isolated(self):
+        def list_region(region):
+            if region == "bad":
+                raise RuntimeError("NotAuthorizedOrNotFound")
+            return paginate(FakeListing(15, 10), identity, max_items=10)
+
+        page = paginate_regions(["good", "bad"], list_region)
+
+        good, bad = page.regions
+        assert (len(good.items), good.next_page, good.error) == (10, "10", None)
+        assert (bad.items, bad.error) == ([], "NotAuthorizedOrNotFound")
+
+
+@pytest.mark.asyncio
+async def test_list_tool_returns_next_page():
+    listing = FakeListing(total=30, page_size=10)
+    client = MagicMock()
+    client.list_autonomous_databases.side_effect = listing
+
+    with patch.object(server, "get_database_client", return_value=client):
+        async with Client(server.mcp) as mcp_client:
+            result = await mcp_client.call_tool(
+                "list_autonomous_databases",
+                {"compartment_id": "ocid1.compartment", "max_items": 20},
+            )
+
+    assert len(result.structured_content["items"]) == 20
+    assert result.structured_content["next_page"] == "20"
+    assert listing.calls == [None, "10"]
+
+
+@pytest.mark.asyncio
+async def test_list_tool_in_all_subscribed_regions():
+    clients = {}
+
+    def client_of(region):
+        client = clients.setdefault(region, MagicMock())
+        client.list_db_systems.side_effect = FakeListing(total=2, page_size=10)
+        return client
+
+    with patch.object(
+        server, "get_database_client", side_effect=client_of
+    ), patch.object(
+        server.client_pool, "subscribed_regions", return_value=["r1", "r2"]
+    ):
+        async with Client(server.mcp) as mcp_client:
+            result = await mcp_client.call_tool(
+                "list_db_systems",
+                {"compartment_id": "ocid1.compartment", "regions": "all subscribed"},
+            )
+
+    regions = result.structured_content["regions"]
+    assert [(r["region"], len(r["items"])) for r in regions] == [("r1", 2), ("r2", 2)]
+    with pytest.raises(ValueError, match="single region"):
+        server.list_resources(
+            "list_db_systems", dict, None, ["r1", "r2"], None, page="10"
+        )
+    assert server.resolve_regions(["us-ashburn-1", " eu-paris-1 "]) == [
+        "us-ashburn-1",
+        "eu-paris-1",
+    ]
@@ -0,0 +1,86 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import oci
+import pytest
+from fastmcp import Client
+from oracle.oci_database_mcp_server import models, server
+from oracle.oci_database_mcp_server.inventory import InventoryCache
+
+FIELDS = ["id", "display_name", "lifecycle_state"]
+
+
+def autonomous_database():
+    return oci.database.models.AutonomousDatabaseSummary(
+        id="ocid1.autonomousdatabase",
+        display_name="orders",
+        lifecycle_state="AVAILABLE",
+        compartment_id="ocid1.compartment",
+        cpu_core_count=2,
+        freeform_tags={"team": "orders"},
+    )
+
+
+class TestProjection:
+    def test_only_the_fields_are_mapped(self):
+        projected = models.map_autonomousdatabasesummary(autonomous_database(), FIELDS)
+
+        assert projected.model_dump() == {
+            "id": "ocid1.autonomousdatabase",
+            "display_name": "orders",
+            "lifecycle_state": "AVAILABLE",
+        }
+        assert models.map_autonomousdatabasesummary(
+            {"id": "ocid1.adb", "cpu_core_count": 2}, ["id"]
+        ).model_dump() == {"id": "ocid1.adb"}
+
+    def test_projections_are_reused(self):
+        first = models.map_autonomousdatabasesummary(autonomous_database(), FIELDS)
+        second = models.map_autonomousdatabasesummary(autonomous_database(), FIELDS)
+
+        assert type(first) is type(second)
+        assert type(first).__name__ == "AutonomousDatabaseSummary"
+
+    def test_unknown_field(self):
+        with pytest.raises(ValueError, match="Unknown fields of DbSystem: name"):
+            models.map_dbsystem(oci.database.models.DbSystem(id="ocid1"), ["name"])
+
+
+@pytest.mark.asyncio
+async def test_tools_return_only_the_fields():
+    client = MagicMock()
+    client.list_autonomous_databases.return_value = SimpleNamespace(
+        data=[autonomous_database()], next_page=None
+    )
+    client.get_autonomous_database.return_value.data = (
+        oci.database.models.AutonomousDatabase(id="ocid1.adb", db_name="orders")
+    )
+
+    with patch.object(server, "inventory", InventoryCache(ttl=60)), patch.object(
+        server, "get_database_client", return_value=client
+    ):
+        async with Client(server.mcp) as mcp_client:
+            listed = await mcp_client.call_tool(
+                "list_autonomous_databases",
+                {"compartment_id": "ocid1.compartment", "fields": FIELDS},
+            )
+            full = await mcp_client.call_tool(
+                "list_autonomous_databases", {"compartment_id": "ocid1.compartment"}
+            )
+            got = await mcp_client.call_tool(
+                "get_autonomous_database",
+                {"autonomous_database_id": "ocid1.adb", "fields": ["db_name"]},
+            )
+
+    assert set(listed.structured_content["items"][0]) == set(FIELDS)
+    # the projected listing is cached apart from the full one
+    assert full.structured_content["items"][0]["cpu_core_count"] == 2
+    assert client.list_autonomous_databases.call_count == 2
+    assert len(listed.content[0].text) * 10 < len(full.content[0].text)
+    assert got.structured_content == {"db_name": "orders"}
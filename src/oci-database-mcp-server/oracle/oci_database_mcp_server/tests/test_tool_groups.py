@@ -0,0 +1,75 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import pytest
+from fastmcp import Client
+from fastmcp.exceptions import ToolError
+from oracle.oci_database_mcp_server import server
+from oracle.oci_database_mcp_server.tool_groups import groups_of, parse_profile
+
+DISCOVERY_TOOLS = ["enable_tool_groups", "list_tool_groups"]
+
+
+@pytest.fixture
+def tool_groups():
+    yield server.tool_groups
+    server.tool_groups.apply("all")
+
+
+class TestToolGroups:
+    def test_every_tool_has_a_group(self):
+        ungrouped = [
+            name
+            for name in server.registered_tools
+            if name not in DISCOVERY_TOOLS and not groups_of(name)
+        ]
+
+        assert ungrouped == []
+        assert groups_of("list_autonomous_vm_clusters") == ["autonomous", "exadata"]
+        assert groups_of("create_pluggable_database") == ["pdb"]
+        assert groups_of("list_db_home_patches") == ["db_system", "maintenance"]
+
+    def test_profiles(self, tool_groups):
+        every = tool_groups.apply(None)
+        readonly = tool_groups.apply("readonly")
+        pdb = tool_groups.apply(" PDB, readonly ")
+        discover = tool_groups.apply("discover")
+
+        assert len(every) == len(server.registered_tools) - 2
+        assert "create_pluggable_database" not in readonly
+        assert "resource_pool_shapes" in readonly
+        assert pdb == [
+            "get_external_pluggable_database",
+            "get_pdb_conversion_history_entry",
+            "get_pluggable_database",
+            "list_external_pluggable_databases",
+            "list_pluggable_databases",
+        ]
+        assert discover == DISCOVERY_TOOLS
+        with pytest.raises(ValueError, match="Unknown tool groups: adb"):
+            parse_profile("autonomous,adb")
+
+
+@pytest.mark.asyncio
+async def test_discovery_enables_groups(tool_groups):
+    tool_groups.apply("discover")
+
+    async with Client(server.mcp) as mcp_client:
+        listed = [t.name for t in await mcp_client.list_tools()]
+        with pytest.raises(ToolError):
+            await mcp_client.call_tool(
+                "get_pluggable_database", {"pluggable_database_id": "ocid1.pdb"}
+            )
+        enabled = await mcp_client.call_tool("enable_tool_groups", {"groups": ["pdb"]})
+        groups = await mcp_client.call_tool("list_tool_groups", {})
+        relisted = [t.name for t in await mcp_client.list_tools()]
+
+    assert sorted(listed) == DISCOVERY_TOOLS
+    assert "create_pluggable_database" in enabled.structured_content["result"]
+    assert {"group": "pdb", "tools": 11, "enabled": 11} in groups.structured_content[
+        "result"
+    ]
+    assert len(relisted) == 13
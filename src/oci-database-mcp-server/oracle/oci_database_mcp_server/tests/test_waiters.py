@@ -0,0 +1,225 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import asyncio
+import itertools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import oci
+import pytest
+from fastmcp import Client
+from oracle.oci_database_mcp_server import server, waiters
+from oracle.oci_database_mcp_server.waiters import backoff, parse_states, wait_for_state
+
+
+def polls(*results):
+    """A blocking OCI get returning each of `results` in turn, raising exceptions"""
+    results = iter(results)
+
+    def get():
+        result = next(results)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    return get
+
+
+def pdb(state):
+    return SimpleNamespace(id="ocid1.pdb", lifecycle_state=state)
+
+
+def work_request(status, percent):
+    return SimpleNamespace(
+        id="ocid1.workrequest",
+        operation_type="CREATE_PLUGGABLE_DATABASE",
+        status=status,
+        percent_complete=percent,
+    )
+
+
+def not_found():
+    return oci.exceptions.ServiceError(404, "NotAuthorizedOrNotFound", {}, "gone")
+
+
+class TestWaitForState:
+    @pytest.mark.asyncio
+    async def test_follows_the_work_request_then_the_resource(self):
+        progress = []
+
+        async def report_progress(progress_value, total, message):
+            progress.append((progress_value, message))
+
+        resource = await wait_for_state(
+            polls(pdb("PROVISIONING"), pdb("AVAILABLE")),
+            ["AVAILABLE"],
+            polls(work_request("IN_PROGRESS", 40.0), work_request("SUCCEEDED", 100)),
+            report_progress=report_progress,
+            initial_delay=0,
+        )
+
+        assert resource.lifecycle_state == "AVAILABLE"
+        assert progress == [
+            (1, "Work request CREATE_PLUGGABLE_DATABASE IN_PROGRESS, 40% complete"),
+            (2, "Work request CREATE_PLUGGABLE_DATABASE SUCCEEDED, 100% complete"),
+            (3, "PROVISIONING"),
+            (4, "AVAILABLE"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failures(self):
+        with pytest.raises(
+            RuntimeError, match="Work request ocid1.workrequest .* FAILED"
+        ):
+            await wait_for_state(
+                polls(), ["AVAILABLE"], polls(work_request("FAILED", 10))
+            )
+        with pytest.raises(RuntimeError, match="ocid1.pdb is FAILED"):
+            await wait_for_state(polls(pdb("FAILED")), ["AVAILABLE"])
+        with pytest.raises(oci.exceptions.ServiceError):
+            await wait_for_state(polls(not_found()), ["AVAILABLE"])
+
+    @pytest.mark.asyncio
+    async def test_deleted_resource_is_terminated(self):
+        assert (
+            await wait_for_state(
+                polls(pdb("TERMINATING"), not_found()), ["TERMINATED"], initial_delay=0
+            )
+            is None
+        )
+
+    @pytest.mark.asyncio
+    async def test_timeout(self):
+        with pytest.raises(TimeoutError, match="ocid1.pdb to be AVAILABLE"):
+            await wait_for_state(
+                polls(*[pdb("UPDATING")] * 10),
+                ["AVAILABLE"],
+                max_wait_seconds=0.05,
+                initial_delay=0.02,
+            )
+
+    @pytest.mark.asyncio
+    async def test_sleeping_waiters_hold_no_thread(self):
+        loop = asyncio.get_running_loop()
+        loop.set_default_executor(ThreadPoolExecutor(max_workers=2))
+        released = asyncio.Event()
+
+        def get_resource():
+            return pdb("AVAILABLE" if released.is_set() else "PROVISIONING")
+
+        async def release():
+            await asyncio.sleep(0.2)
+            released.set()
+
+        started = time.monotonic()
+        results = await asyncio.gather(
+            release(),
+            *[
+                wait_for_state(get_resource, ["AVAILABLE"], initial_delay=0.1)
+                for _ in range(200)
+            ],
+        )
+
+        # 200 waiters on 2 threads would take 10s if they slept on them
+        assert time.monotonic() - started < 3
+        assert all(r.lifecycle_state == "AVAILABLE" for r in results[1:])
+
+    def test_backoff_and_states(self):
+        with patch("random.uniform", return_value=1.0):
+            assert list(itertools.islice(backoff(1, 5), 5)) == [1, 2, 4, 5, 5]
+        assert parse_states(" available, Terminated ,") == ["AVAILABLE", "TERMINATED"]
+
+
+@pytest.mark.asyncio
+async def test_tool_waits_and_reports_progress():
+    client = MagicMock()
+    client.create_pluggable_database.return_value = SimpleNamespace(
+        data=oci.database.models.PluggableDatabase(
+            id="ocid1.pdb", lifecycle_state="PROVISIONING"
+        ),
+        headers={"opc-work-request-id": "ocid1.workrequest"},
+    )
+    client.get_pluggable_database.side_effect = [
+        SimpleNamespace(
+            data=oci.database.models.PluggableDatabase(
+                id="ocid1.pdb", lifecycle_state=state
+            )
+        )
+        for state in ("PROVISIONING", "AVAILABLE")
+    ]
+    work_requests = MagicMock()
+    work_requests.get_work_request.side_effect = [
+        SimpleNamespace(data=work_request(status, percent))
+        for status, percent in (("IN_PROGRESS", 50), ("SUCCEEDED", 100))
+    ]
+    progress = []
+
+    async def progress_handler(progress_value, total, message):
+        progress.append(message)
+
+    with patch.object(server, "get_database_client", return_value=client), patch.object(
+        server.client_pool, "work_requests", return_value=work_requests
+    ), patch.object(waiters, "INITIAL_DELAY", 0):
+        async with Client(server.mcp, progress_handler=progress_handler) as mcp_client:
+            result = await mcp_client.call_tool(
+                "create_pluggable_database",
+                {
+                    "pdb_name": "PDB1",
+                    "container_database_id": "ocid1.cdb",
+                    "pdb_admin_password": "pwd",
+                    "wait_for_state": "available",
+                },
+            )
+
+    assert result.structured_content["lifecycle_state"] == "AVAILABLE"
+    work_requests.get_work_request.assert_called_with("ocid1.workrequest")
+    assert progress == [
+        "Work request CREATE_PLUGGABLE_DATABASE IN_PROGRESS, 50% complete",
+        "Work request CREATE_PLUGGABLE_DATABASE SUCCEEDED, 100% complete",
+        "PROVISIONING",
+        "AVAILABLE",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_clone_follows_its_work_request():
+    client = MagicMock()
+    client.create_pluggable_database.return_value = SimpleNamespace(
+        data=oci.database.models.PluggableDatabase(
+            id="ocid1.pdb", lifecycle_state="PROVISIONING"
+        ),
+        headers={"opc-work-request-id": "ocid1.workrequest"},
+    )
+    client.get_pluggable_database.return_value = SimpleNamespace(
+        data=oci.database.models.PluggableDatabase(
+            id="ocid1.pdb", lifecycle_state="AVAILABLE"
+        )
+    )
+    work_requests = MagicMock()
+    work_requests.get_work_request.return_value = SimpleNamespace(
+        data=work_request("SUCCEEDED", 100)
+    )
+
+    with patch.object(server, "get_database_client", return_value=client), patch.object(
+        server.client_pool, "work_requests", return_value=work_requests
+    ), patch.object(waiters, "INITIAL_DELAY", 0):
+        async with Client(server.mcp) as mcp_client:
+            result = await mcp_client.call_tool(
+                "create_pluggable_database_from_local_clone",
+                {
+                    "pdb_name": "PDB1",
+                    "container_database_id": "ocid1.cdb",
+                    "pdb_admin_password": "pwd",
+                    "source_pluggable_database_id": "ocid1.source",
+                    "wait_for_state": "AVAILABLE",
+                },
+            )
+
+    assert result.structured_content["lifecycle_state"] == "AVAILABLE"
+    work_requests.get_work_request.assert_called_with("ocid1.workrequest")
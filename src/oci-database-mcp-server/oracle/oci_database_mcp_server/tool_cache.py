@@ -0,0 +1,127 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import glob
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+from typing import Any, Callable, Dict, List, Optional
+
+import fastmcp
+import pydantic
+from fastmcp.tools import FunctionTool
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _package_sources() -> List[str]:
+    return sorted(
+        glob.glob(os.path.join(_PACKAGE_DIR, "*.py"))
+        + glob.glob(os.path.join(_PACKAGE_DIR, "models", "*.py"))
+    )
+
+
+class ToolSchemaCache:
+    """
+    On-disk cache of the input and output JSON schemas of the server's tools.
+
+    Generating the schemas of every tool builds every Pydantic model of the
+    server, which is most of its startup time. The schemas are cached in
+    tools-<digest>.json in ORACLE_MCP_TOOL_SCHEMA_CACHE_DIR (default
+    ~/.cache/oracle.oci-database-mcp-server), where the digest covers the
+    package sources and the fastmcp and pydantic versions, so any change to
+    the tools starts a new file. A tool registered from cached schemas builds
+    its argument validator, and imports its models, on its first call.
+    """
+
+    _default_cache_dir = os.path.join(
+        os.path.expanduser("~"), ".cache", "oracle.oci-database-mcp-server"
+    )
+
+    def __init__(
+        self, logger, cache_dir: str = "", sources: Optional[List[str]] = None
+    ):
+        self.logger = logger
+        self.cache_dir = (
+            cache_dir
+            or os.getenv("ORACLE_MCP_TOOL_SCHEMA_CACHE_DIR")
+            or self._default_cache_dir
+        )
+        digest = hashlib.sha256(
+            f"{fastmcp.__version__} {pydantic.VERSION}".encode("utf-8")
+        )
+        for source in _package_sources() if sources is None else sources:
+            with open(source, "rb") as source_file:
+                digest.update(source_file.read())
+        self.path = os.path.join(
+            self.cache_dir, f"tools-{digest.hexdigest()[:16]}.json"
+        )
+        self.schemas: Dict[str, Dict[str, Any]] = self._load()
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path, "r") as cache_file:
+                schemas = json.load(cache_file)
+            return schemas if isinstance(schemas, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Could not read tool schema cache {self.path}: {e}")
+            return {}
+
+    def tool(
+        self, mcp, name: Optional[str] = None, description: Optional[str] = None
+    ) -> Callable[[Callable], FunctionTool]:
+        """Decorator registering a function as a tool of `mcp`, like mcp.tool()"""
+
+        def decorator(fn: Callable) -> FunctionTool:
+            tool_name = name or fn.__name__
+            cached = self.schemas.get(tool_name)
+            if cached is not None:
+                tool = FunctionTool(
+                    fn=fn,
+                    name=tool_name,
+                    description=description or inspect.getdoc(fn),
+                    parameters=cached["parameters"],
+                    output_schema=cached["output_schema"],
+                )
+                self.hits += 1
+            else:
+                tool = FunctionTool.from_function(
+                    fn, name=tool_name, description=description
+                )
+                self.schemas[tool_name] = {
+                    "parameters": tool.parameters,
+                    "output_schema": tool.output_schema,
+                }
+                self.misses += 1
+            mcp.add_tool(tool)
+            return tool
+
+        return decorator
+
+    def save(self):
+        """Writes the cache file if some tool schemas were not cached yet"""
+        if not self.misses:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as cache_file:
+                    json.dump(self.schemas, cache_file)
+                os.replace(temp_path, self.path)
+            except BaseException:
+                os.remove(temp_path)
+                raise
+        except OSError as e:
+            self.logger.warning(f"Could not write tool schema cache {self.path}: {e}")
+            return
+        self.logger.info(f"Cached the schemas of {self.misses} tools in {self.path}")
@@ -0,0 +1,142 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Set
+
+from fastmcp.tools import FunctionTool
+
+# families of tools, matched against the resource part of their names (the
+# name without its list_/get_/create_/update_/delete_ verb); a tool can be in
+# several families
+GROUPS: Dict[str, re.Pattern] = {
+    "autonomous": re.compile(r"^(cloud_)?autonomous"),
+    "exadata": re.compile(
+        r"^(cloud_|autonomous_)?(exadata|exadb|exascale)|vm_cluster"
+        r"|^(db_server|flex_component|application_vip|infrastructure_target)"
+    ),
+    "pdb": re.compile(r"pluggable|^pdb_"),
+    "db_system": re.compile(
+        r"^(db_system|db_home|db_node|database|data_guard|backup|console"
+        r"|key_store|db_version|container_database|oneoff_patch|gi_version"
+        r"|system_version|resource_pool_shapes)"
+    ),
+    "external": re.compile(r"^external"),
+    "maintenance": re.compile(
+        r"patch|update|upgrade|maintenance|schedul|^execution_|(^|_)version"
+    ),
+}
+
+# profile of every tool
+ALL = "all"
+
+# limits a profile to the tools that only read
+READONLY = "readonly"
+
+# profile of the discovery tools only, which enable groups on demand
+DISCOVER = "discover"
+
+_VERB = re.compile(r"^(list|get|create|update|delete)_")
+
+_READ_VERBS = ("list_", "get_")
+
+# tools that only read although their names have no read verb
+_READ_TOOLS = ("resource_pool_shapes",)
+
+
+def groups_of(name: str) -> List[str]:
+    """Returns the groups of the tool named `name`"""
+    resource = _VERB.sub("", name)
+    return [group for group, pattern in GROUPS.items() if pattern.search(resource)]
+
+
+def is_readonly(name: str) -> bool:
+    return name.startswith(_READ_VERBS) or name in _READ_TOOLS
+
+
+def parse_profile(profile: Optional[str]) -> List[str]:
+    """
+    Returns the parts of a profile: a comma-separated list of groups, `all`,
+    `discover` and `readonly`. Raises ValueError for unknown parts.
+    """
+    parts = [part.strip().lower() for part in (profile or ALL).split(",")]
+    parts = [part for part in parts if part] or [ALL]
+    unknown = [
+        part
+        for part in parts
+        if part not in GROUPS and part not in (ALL, READONLY, DISCOVER)
+    ]
+    if unknown:
+        raise ValueError(
+            f"Unknown tool groups: {', '.join(unknown)}. The groups are: "
+            f"{', '.join([*GROUPS, ALL, READONLY, DISCOVER])}"
+        )
+    return parts
+
+
+class ToolGroups:
+    """
+    Enables the tools of a profile (ORACLE_MCP_DATABASE_TOOL_PROFILE or
+    --profile), so that tools/list only lists those. `discovery_tools` are
+    enabled in the `discover` profile only, and enable groups on demand.
+    Tools are enabled server-wide: a group enabled in one session is enabled
+    in every session.
+    """
+
+    def __init__(self, tools: Dict[str, FunctionTool], discovery_tools: Iterable[str]):
+        self.tools = tools
+        self.discovery_tools: Set[str] = set(discovery_tools)
+        self.readonly = False
+
+    def _members(self, group: str) -> List[str]:
+        return [
+            name
+            for name in self.tools
+            if name not in self.discovery_tools
+            and (group == ALL or group in groups_of(name))
+            and (not self.readonly or is_readonly(name))
+        ]
+
+    def apply(self, profile: Optional[str]) -> List[str]:
+        """Enables the tools of `profile` only; returns their names"""
+        parts = parse_profile(profile)
+        self.readonly = READONLY in parts
+        groups = [part for part in parts if part not in (READONLY, DISCOVER)]
+        if not groups and DISCOVER not in parts:
+            groups = [ALL]
+        enabled = {name for group in groups for name in self._members(group)}
+        if DISCOVER in parts:
+            enabled |= self.discovery_tools
+        for name, tool in self.tools.items():
+            if name in enabled:
+                tool.enable()
+            else:
+                tool.disable()
+        return sorted(enabled)
+
+    def enable(self, groups: List[str]) -> List[str]:
+        """Enables the tools of `groups` besides those enabled; returns the newly enabled"""
+        enabled = []
+        for group in parse_profile(",".join(groups)):
+            for name in self._members(group):
+                if not self.tools[name].enabled:
+                    self.tools[name].enable()
+                    enabled.append(name)
+        return enabled
+
+    def describe(self) -> List[Dict]:
+        """Each group with its number of tools and of enabled tools"""
+        described = []
+        for group in GROUPS:
+            members = self._members(group)
+            described.append(
+                {
+                    "group": group,
+                    "tools": len(members),
+                    "enabled": sum(self.tools[name].enabled for name in members),
+                }
+            )
+        return described
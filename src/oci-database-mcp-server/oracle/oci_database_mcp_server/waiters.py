@@ -0,0 +1,126 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import asyncio
+import os
+import random
+from typing import Any, Awaitable, Callable, Iterator, List, Optional
+
+import oci
+
+# longest a tool waits for a state, unless its call says otherwise
+DEFAULT_MAX_WAIT_SECONDS = float(
+    os.getenv("ORACLE_MCP_DATABASE_MAX_WAIT_SECONDS") or 1800
+)
+
+INITIAL_DELAY = 2.0
+MAX_DELAY = 30.0
+
+# lifecycle states a resource does not leave
+_FAILED_STATES = ("FAILED", "TERMINATED")
+
+_FAILED_WORK_REQUEST_STATUSES = ("FAILED", "CANCELED")
+
+
+def parse_states(states: List[str] | str) -> List[str]:
+    """Returns the states of a `wait_for_state` argument: a list or comma-separated string"""
+    if isinstance(states, str):
+        states = states.split(",")
+    return [state.strip().upper() for state in states if state and state.strip()]
+
+
+def backoff(
+    initial: float = INITIAL_DELAY, maximum: float = MAX_DELAY
+) -> Iterator[float]:
+    """
+    Delays between polls, doubling from `initial` up to `maximum`. Each delay
+    is jittered down by up to half, so that waiters started together do not
+    poll together.
+    """
+    delay = initial
+    while True:
+        yield delay * random.uniform(0.5, 1.0)
+        delay = min(delay * 2, maximum)
+
+
+async def wait_for_state(
+    get_resource: Callable[[], Any],
+    states: List[str],
+    get_work_request: Optional[Callable[[], Any]] = None,
+    max_wait_seconds: Optional[float] = None,
+    report_progress: Optional[
+        Callable[[float, Optional[float], Optional[str]], Awaitable[None]]
+    ] = None,
+    initial_delay: Optional[float] = None,
+    max_delay: Optional[float] = None,
+) -> Any:
+    """
+    Waits until the resource that `get_resource` returns is in one of
+    `states`, and returns it. If the operation has a work request, it is
+    followed to completion first, since its resource may only be created or
+    change state once the work request has started.
+
+    `get_resource` and `get_work_request` are blocking OCI calls; they run on
+    the default executor, and the waiter sleeps on the event loop between
+    them, so that waiting holds no thread. A resource that is gone (404) is
+    returned as None if TERMINATED is one of `states`. Each poll is reported
+    through `report_progress`. Raises RuntimeError if the work request or the
+    resource fails, and TimeoutError after `max_wait_seconds`.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + (
+        DEFAULT_MAX_WAIT_SECONDS if max_wait_seconds is None else max_wait_seconds
+    )
+    delays = backoff(
+        INITIAL_DELAY if initial_delay is None else initial_delay,
+        MAX_DELAY if max_delay is None else max_delay,
+    )
+    polls = 0
+
+    async def pause(waiting_for: str):
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            raise TimeoutError(f"Timed out waiting for {waiting_for}")
+        await asyncio.sleep(min(next(delays), remaining))
+
+    async def report(message: str):
+        nonlocal polls
+        polls += 1
+        if report_progress is not None:
+            await report_progress(polls, None, message)
+
+    while get_work_request is not None:
+        work_request = await asyncio.to_thread(get_work_request)
+        await report(
+            f"Work request {work_request.operation_type} {work_request.status}, "
+            f"{work_request.percent_complete or 0:.0f}% complete"
+        )
+        if work_request.status == "SUCCEEDED":
+            break
+        if work_request.status in _FAILED_WORK_REQUEST_STATUSES:
+            raise RuntimeError(
+                f"Work request {work_request.id} ({work_request.operation_type}) "
+                f"{work_request.status}"
+            )
+        await pause(f"work request {work_request.id}")
+
+    while True:
+        try:
+            resource = await asyncio.to_thread(get_resource)
+        except oci.exceptions.ServiceError as e:
+            if e.status != 404 or "TERMINATED" not in states:
+                raise
+            await report("TERMINATED")
+            return None
+        state = resource.lifecycle_state
+        await report(state)
+        if state in states:
+            return resource
+        if state in _FAILED_STATES:
+            raise RuntimeError(
+                f"{resource.id} is {state}, it will not be {' or '.join(states)}"
+            )
+        await pause(f"{resource.id} to be {' or '.join(states)}, it is {state}")
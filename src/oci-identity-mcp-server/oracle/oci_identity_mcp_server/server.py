@@ -26,6 +26,7 @@ from oracle.oci_identity_mcp_server.models import (
     map_tenancy,
     map_user,
 )
+from oracle.oci_mcp_common.client_cache import cached_client
 from pydantic import Field
 
 from . import __project__, __version__
@@ -35,6 +36,7 @@ logger = Logger(__name__, level="INFO")
 mcp = FastMCP(name=__project__)
 
 
+@cached_client
 def get_identity_client():
     config = oci.config.from_file(
         file_location=os.getenv("OCI_CONFIG_FILE", oci.config.DEFAULT_LOCATION),
@@ -28,6 +28,7 @@ from oracle.oci_logging_mcp_server.scripts import (
     SEARCH_LOG_SCRIPT,
     get_script_content,
 )
+from oracle.oci_mcp_common.client_cache import cached_client
 from pydantic import Field
 
 from . import __project__
@@ -37,6 +38,7 @@ logger = Logger(__name__, level="INFO")
 mcp = FastMCP(name=__project__)
 
 
+@cached_client
 def get_logging_client():
     logger.info("entering get_logging_client")
     config = oci.config.from_file(
@@ -46,13 +48,13 @@ def get_logging_client():
 
     private_key = oci.signer.load_private_key_from_file(config["key_file"])
     token_file = os.path.expanduser(config["security_token_file"])
-    token = None
     with open(token_file, "r") as f:
         token = f.read()
     signer = oci.auth.signers.SecurityTokenSigner(token, private_key)
     return oci.logging.LoggingManagementClient(config, signer=signer)
 
 
+@cached_client
 def get_logging_search_client():
     logger.info("entering get_logging_client")
     config = oci.config.from_file(
@@ -62,7 +64,6 @@ def get_logging_search_client():
 
     private_key = oci.signer.load_private_key_from_file(config["key_file"])
     token_file = os.path.expanduser(config["security_token_file"])
-    token = None
     with open(token_file, "r") as f:
         token = f.read()
     signer = oci.auth.signers.SecurityTokenSigner(token, private_key)
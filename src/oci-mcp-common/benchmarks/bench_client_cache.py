@@ -0,0 +1,107 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+
+Measures the per-call overhead of a cached_client factory with a cold cache
+(config parse, key load, token read, signer and client construction on every
+call) against a warm cache (mtime checks only), for one of the clients that
+the servers' get_*_client() factories build.
+
+Usage: uv run python benchmarks/bench_client_cache.py [iterations] [client]
+
+where client is a path below the oci package, core.ComputeClient by default.
+"""
+
+import os
+import sys
+import tempfile
+import time
+from functools import reduce
+
+import oci
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from oracle.oci_mcp_common.client_cache import cached_client
+
+
+def write_credentials(directory: str) -> str:
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    key_file = os.path.join(directory, "key.pem")
+    with open(key_file, "wb") as f:
+        f.write(
+            key.private_bytes(
+                encoding=serialization.Encoding.PEM,
+                format=serialization.PrivateFormat.TraditionalOpenSSL,
+                encryption_algorithm=serialization.NoEncryption(),
+            )
+        )
+    token_file = os.path.join(directory, "token")
+    with open(token_file, "w") as f:
+        f.write("header.payload.signature")
+    config_file = os.path.join(directory, "config")
+    with open(config_file, "w") as f:
+        f.write(
+            "[DEFAULT]\n"
+            "user=ocid1.user.oc1..bench\n"
+            "fingerprint=00:00:00:00:00:00:00:00:00:00:00:00:00:00:00:00\n"
+            "tenancy=ocid1.tenancy.oc1..bench\n"
+            "region=us-ashburn-1\n"
+            f"key_file={key_file}\n"
+            f"security_token_file={token_file}\n"
+        )
+    # clients built from files written a moment ago are not cached
+    an_hour_ago = time.time() - 3600
+    for path in (key_file, token_file, config_file):
+        os.utime(path, (an_hour_ago, an_hour_ago))
+    return config_file
+
+
+def time_calls(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1000
+
+
+def make_factory(client_class):
+    def get_client():
+        config = oci.config.from_file(
+            file_location=os.environ["OCI_CONFIG_FILE"],
+            profile_name=os.environ["OCI_CONFIG_PROFILE"],
+        )
+        private_key = oci.signer.load_private_key_from_file(config["key_file"])
+        with open(os.path.expanduser(config["security_token_file"])) as f:
+            token = f.read()
+        signer = oci.auth.signers.SecurityTokenSigner(token, private_key)
+        return client_class(config, signer=signer)
+
+    return cached_client(get_client)
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    client_name = sys.argv[2] if len(sys.argv) > 2 else "core.ComputeClient"
+    client_class = reduce(getattr, client_name.split("."), oci)
+    with tempfile.TemporaryDirectory() as directory:
+        os.environ["OCI_CONFIG_FILE"] = write_credentials(directory)
+        os.environ["OCI_CONFIG_PROFILE"] = "DEFAULT"
+        get_client = make_factory(client_class)
+
+        def cold():
+            get_client.cache_clear()
+            return get_client()
+
+        cold_ms = time_calls(cold, iterations)
+        get_client()
+        warm_ms = time_calls(get_client, iterations)
+
+    print(f"client:               {client_name}")
+    print(f"iterations:           {iterations}")
+    print(f"uncached per call:    {cold_ms:.3f} ms")
+    print(f"cached per call:      {warm_ms:.3f} ms")
+    print(f"speedup:              {cold_ms / warm_ms:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
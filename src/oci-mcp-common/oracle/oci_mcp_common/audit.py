@@ -0,0 +1,175 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import atexit
+import datetime
+import json
+import logging
+import os
+import queue
+import re
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, Optional
+
+from fastmcp.server.middleware import Middleware
+
+_OPC_REQUEST_ID = re.compile(r'"?opc-request-id"?\s*[:=]\s*"?([\w/.:-]+)')
+
+
+class JsonLineFormatter(logging.Formatter):
+    """Formats records as JSON lines, with the fields of an `audit` extra merged in"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = {
+            "time": datetime.datetime.fromtimestamp(
+                record.created, datetime.timezone.utc
+            ).isoformat(),
+            "logger": record.name,
+            "level": record.levelname,
+            "message": record.getMessage(),
+        }
+        line.update(getattr(record, "audit", None) or {})
+        dropped = getattr(record, "dropped", 0)
+        if dropped:
+            line["dropped"] = dropped
+        return json.dumps(line, default=str)
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    QueueHandler on a bounded queue. When the queue is full, records are
+    either dropped (`block=False`) or the logging thread waits for room. The
+    number of dropped records is reported on the next record that gets in.
+    """
+
+    def __init__(self, log_queue: queue.Queue, block: bool = False):
+        super().__init__(log_queue)
+        self.block = block
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord):
+        if self.block:
+            self.queue.put(record)
+            return
+        if self.dropped:
+            record.dropped = self.dropped
+        try:
+            self.queue.put_nowait(record)
+            self.dropped = 0
+        except queue.Full:
+            self.dropped += 1
+
+
+class AuditQueueListener(QueueListener):
+    """
+    QueueListener whose stop() can be called again once stopped: it is
+    registered to run at exit, and may have been stopped before that
+    (QueueListener.stop raises on a second call before Python 3.12.3).
+    """
+
+    def stop(self):
+        if self._thread is not None:
+            super().stop()
+
+
+def initAuditLogger(logger) -> AuditQueueListener:
+    """
+    Sends the records of `logger` as JSON lines to a rotating audit log file.
+
+    The logging call only puts the record on a bounded queue; a background
+    QueueListener thread writes and rotates the file. Configured with
+    ORACLE_MCP_AUDIT_LOG_FILE (default /tmp/audit.log),
+    ORACLE_MCP_AUDIT_LOG_MAX_BYTES (default 5 MiB),
+    ORACLE_MCP_AUDIT_LOG_BACKUP_COUNT (default 1),
+    ORACLE_MCP_AUDIT_LOG_QUEUE_SIZE (default 10000) and
+    ORACLE_MCP_AUDIT_LOG_OVERFLOW (`drop`, the default, or `block`).
+    """
+    file_handler = RotatingFileHandler(
+        os.getenv("ORACLE_MCP_AUDIT_LOG_FILE") or "/tmp/audit.log",
+        maxBytes=int(os.getenv("ORACLE_MCP_AUDIT_LOG_MAX_BYTES") or 5 * 1024 * 1024),
+        backupCount=int(os.getenv("ORACLE_MCP_AUDIT_LOG_BACKUP_COUNT") or 1),
+    )
+    file_handler.setLevel(logging.INFO)
+    file_handler.setFormatter(JsonLineFormatter())
+
+    log_queue: queue.Queue = queue.Queue(
+        int(os.getenv("ORACLE_MCP_AUDIT_LOG_QUEUE_SIZE") or 10000)
+    )
+    overflow = (os.getenv("ORACLE_MCP_AUDIT_LOG_OVERFLOW") or "drop").lower()
+    handler = BoundedQueueHandler(log_queue, block=overflow == "block")
+    handler.setLevel(logging.INFO)
+
+    listener = AuditQueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    # flush the queue on exit
+    atexit.register(listener.stop)
+
+    logger.addHandler(handler)
+    return listener
+
+
+def _find_opc_request_id(result: Any) -> Optional[str]:
+    if isinstance(result, dict) and set(result) == {"result"}:
+        result = result["result"]
+    if not isinstance(result, dict):
+        return None
+    for key in ("opc_request_id", "opc-request-id"):
+        if result.get(key):
+            return str(result[key])
+    output = result.get("output")
+    if isinstance(output, dict) and output.get("opc-request-id"):
+        return str(output["opc-request-id"])
+    match = _OPC_REQUEST_ID.search(str(result.get("error") or ""))
+    return match.group(1) if match else None
+
+
+def _has_failed(result: Any) -> bool:
+    """
+    Whether a tool result reports a failure. A result with a returncode (a CLI
+    command) failed unless it exited with 0, whatever it printed to stderr;
+    other results failed when they carry an error.
+    """
+    if not isinstance(result, dict):
+        return False
+    if "returncode" in result:
+        return result["returncode"] != 0
+    return bool(result.get("error"))
+
+
+class AuditMiddleware(Middleware):
+    """
+    Writes an audit record for every tool call with the tool name, its
+    duration, the opc-request-id of the OCI request when the result has one,
+    and the outcome: `success`, `error` when the tool returned a failure (a
+    nonzero returncode, or an error without a returncode), or `exception`
+    when it raised.
+    """
+
+    def __init__(self, logger):
+        self.logger = logger
+
+    async def on_call_tool(self, context, call_next):
+        tool = context.message.name
+        started = time.perf_counter()
+        audit = {"tool": tool}
+        try:
+            result = await call_next(context)
+        except Exception as e:
+            audit.update(outcome="exception", error=str(e))
+            raise
+        else:
+            content = result.structured_content
+            if isinstance(content, dict) and set(content) == {"result"}:
+                content = content["result"]
+            audit.update(
+                outcome="error" if _has_failed(content) else "success",
+                opc_request_id=_find_opc_request_id(content),
+            )
+            return result
+        finally:
+            audit["duration_ms"] = round((time.perf_counter() - started) * 1000, 3)
+            self.logger.info(f"tool call {tool}", extra={"audit": audit})
@@ -0,0 +1,78 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import functools
+import os
+import threading
+import time
+from typing import Callable, Optional, TypeVar
+
+import oci
+
+Client = TypeVar("Client")
+
+# a file modified this close to the start of a build may have been rewritten
+# after the build read it (file timestamps can lag the clock by a tick), so a
+# client built from it is not cached
+_SETTLE_NS = 1_000_000_000
+
+
+def get_file_mtimes(paths: tuple) -> Optional[tuple]:
+    """Returns the mtimes of the given files, or None if any of them is missing"""
+    try:
+        return tuple(os.stat(os.path.expanduser(path)).st_mtime_ns for path in paths)
+    except (OSError, TypeError):
+        return None
+
+
+def get_settled_mtimes(paths: tuple, started_ns: int) -> Optional[tuple]:
+    """
+    Returns the mtimes of the files a client was built from, the build having
+    started at `started_ns` (time.time_ns()), or None if any of them is missing
+    or was modified too close to the build for the client to be cached
+    """
+    mtimes = get_file_mtimes(paths)
+    if mtimes is None or max(mtimes) >= started_ns - _SETTLE_NS:
+        return None
+    return mtimes
+
+
+def cached_client(factory: Callable[[], Client]) -> Callable[[], Client]:
+    """
+    Caches the client that `factory` builds from the OCI config file and
+    profile (OCI_CONFIG_FILE, OCI_CONFIG_PROFILE), and with it its signer and
+    connection pool. The client is reused until its config, private key or
+    security token file changes on disk, so that a refreshed session token is
+    picked up on the next call. A client whose files cannot be stat'ed, or
+    were modified while it was built, is not cached.
+    """
+    cache: dict = {}
+    lock = threading.Lock()
+
+    @functools.wraps(factory)
+    def get_client() -> Client:
+        config_file = os.getenv("OCI_CONFIG_FILE", oci.config.DEFAULT_LOCATION)
+        profile = os.getenv("OCI_CONFIG_PROFILE", oci.config.DEFAULT_PROFILE)
+        key = (config_file, profile)
+        with lock:
+            cached = cache.get(key)
+        if cached is not None:
+            paths, mtimes, client = cached
+            if get_file_mtimes(paths) == mtimes:
+                return client
+
+        started = time.time_ns()
+        client = factory()
+        config = client.base_client.config
+        paths = (config_file, config.get("key_file"), config.get("security_token_file"))
+        mtimes = get_settled_mtimes(paths, started)
+        if mtimes is not None:
+            with lock:
+                cache[key] = (paths, mtimes, client)
+        return client
+
+    get_client.cache_clear = cache.clear
+    return get_client
@@ -0,0 +1,210 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import json
+import logging
+import queue
+import threading
+import time
+from logging.handlers import QueueListener
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastmcp import Client, FastMCP
+from oracle.oci_mcp_common.audit import (
+    AuditMiddleware,
+    BoundedQueueHandler,
+    _find_opc_request_id,
+    _has_failed,
+    initAuditLogger,
+)
+
+
+@pytest.fixture
+def audit_log(tmp_path, monkeypatch):
+    path = tmp_path / "audit.log"
+    monkeypatch.setenv("ORACLE_MCP_AUDIT_LOG_FILE", str(path))
+    logger = logging.Logger("audit-test", level="INFO")
+    listener = initAuditLogger(logger)
+
+    def read():
+        listener.stop()
+        return [json.loads(line) for line in path.read_text().splitlines()]
+
+    yield logger, read
+    listener.stop()
+
+
+def record(message="message"):
+    return logging.LogRecord("test", logging.INFO, __file__, 1, message, None, None)
+
+
+class TestAuditLogger:
+    def test_json_lines(self, audit_log):
+        logger, read = audit_log
+
+        logger.info("plain %s", "message")
+        logger.info("tool call", extra={"audit": {"tool": "t", "outcome": "success"}})
+        logger.debug("not audited")
+
+        lines = read()
+        assert [line["message"] for line in lines] == ["plain message", "tool call"]
+        assert lines[0]["level"] == "INFO"
+        assert lines[1]["tool"] == "t"
+        assert lines[1]["outcome"] == "success"
+
+    def test_logging_does_not_wait_for_the_file(self, tmp_path, monkeypatch):
+        path = tmp_path / "audit.log"
+        monkeypatch.setenv("ORACLE_MCP_AUDIT_LOG_FILE", str(path))
+        logger = logging.Logger("slow-disk-test", level="INFO")
+        listener = initAuditLogger(logger)
+        file_handler = listener.handlers[0]
+        emit = file_handler.emit
+        release = threading.Event()
+        monkeypatch.setattr(
+            file_handler, "emit", lambda record: release.wait(5) and emit(record)
+        )
+
+        started = time.perf_counter()
+        for i in range(100):
+            logger.info(f"message {i}")
+        assert time.perf_counter() - started < 1
+        assert isinstance(logger.handlers[0], BoundedQueueHandler)
+
+        release.set()
+        listener.stop()
+        assert len(path.read_text().splitlines()) == 100
+
+    def test_rotation_is_configurable(self, tmp_path, monkeypatch):
+        path = tmp_path / "audit.log"
+        monkeypatch.setenv("ORACLE_MCP_AUDIT_LOG_FILE", str(path))
+        monkeypatch.setenv("ORACLE_MCP_AUDIT_LOG_MAX_BYTES", "200")
+        monkeypatch.setenv("ORACLE_MCP_AUDIT_LOG_BACKUP_COUNT", "3")
+        logger = logging.Logger("rotation-test", level="INFO")
+        listener = initAuditLogger(logger)
+
+        for i in range(20):
+            logger.info(f"message {i}")
+        listener.stop()
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "audit.log",
+            "audit.log.1",
+            "audit.log.2",
+            "audit.log.3",
+        ]
+
+    def test_stop_can_be_repeated(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("ORACLE_MCP_AUDIT_LOG_FILE", str(tmp_path / "audit.log"))
+        listener = initAuditLogger(logging.Logger("stop-test", level="INFO"))
+        listener.stop()
+
+        # before Python 3.12.3, QueueListener.stop fails once stopped; the
+        # exit hook stops the listener again
+        with patch.object(QueueListener, "stop", side_effect=AttributeError) as stop:
+            listener.stop()
+        stop.assert_not_called()
+
+
+class TestBoundedQueueHandler:
+    def test_drop_when_full(self):
+        handler = BoundedQueueHandler(queue.Queue(2))
+
+        for i in range(5):
+            handler.handle(record(f"message {i}"))
+        assert handler.dropped == 3
+
+        handler.queue.get_nowait()
+        handler.handle(record("after drops"))
+        records = [handler.queue.get_nowait() for _ in range(2)]
+        assert records[1].message == "after drops"
+        assert records[1].dropped == 3
+        assert handler.dropped == 0
+
+    def test_block_when_full(self):
+        handler = BoundedQueueHandler(queue.Queue(1), block=True)
+        handler.handle(record("first"))
+        done = threading.Event()
+
+        def log_second():
+            handler.handle(record("second"))
+            done.set()
+
+        thread = threading.Thread(target=log_second)
+        thread.start()
+        assert not done.wait(0.1)
+
+        assert handler.queue.get().message == "first"
+        thread.join(5)
+        assert done.is_set()
+        assert handler.queue.get().message == "second"
+        assert handler.dropped == 0
+
+
+class TestAuditMiddleware:
+    @pytest.mark.parametrize(
+        "result, expected",
+        [
+            ({"opc_request_id": "ABC/DEF"}, "ABC/DEF"),
+            ({"result": {"opc-request-id": "XYZ"}}, "XYZ"),
+            ({"output": {"opc-request-id": "OUT"}}, "OUT"),
+            (
+                {"error": 'ServiceError: {"opc-request-id": "ERR/1", "status": 404}'},
+                "ERR/1",
+            ),
+            ({"error": "plain error"}, None),
+            ("not a dict", None),
+        ],
+    )
+    def test_find_opc_request_id(self, result, expected):
+        assert _find_opc_request_id(result) == expected
+
+    @pytest.mark.parametrize(
+        "result, failed",
+        [
+            ({"output": "ok", "error": "WARNING: deprecated", "returncode": 0}, False),
+            ({"output": None, "error": "ServiceError", "returncode": 1}, True),
+            ({"output": None, "error": "timed out", "returncode": None}, True),
+            ({"error": "denied"}, True),
+            ({"data": [], "error": None}, False),
+            ("not a dict", False),
+        ],
+    )
+    def test_has_failed(self, result, failed):
+        assert _has_failed(result) is failed
+
+    @pytest.mark.asyncio
+    async def test_tool_calls_are_audited(self):
+        mcp = FastMCP("audit-test")
+
+        @mcp.tool
+        def list_things() -> dict:
+            return {"data": [], "opc_request_id": "REQ-1"}
+
+        @mcp.tool
+        def get_thing(thing_id: str) -> dict:
+            return {"error": f'ServiceError: {{"opc-request-id": "REQ-2/{thing_id}"}}'}
+
+        logger = MagicMock()
+        mcp.add_middleware(AuditMiddleware(logger))
+        async with Client(mcp) as client:
+            await client.call_tool("list_things", {})
+            await client.call_tool("get_thing", {"thing_id": "x"})
+            with pytest.raises(Exception):
+                await client.call_tool("get_thing", {})
+
+        audits = [call.kwargs["extra"]["audit"] for call in logger.info.call_args_list]
+        assert [audit["tool"] for audit in audits] == [
+            "list_things",
+            "get_thing",
+            "get_thing",
+        ]
+        assert audits[0]["outcome"] == "success"
+        assert audits[0]["opc_request_id"] == "REQ-1"
+        assert audits[1]["outcome"] == "error"
+        assert audits[1]["opc_request_id"] == "REQ-2/x"
+        assert audits[2]["outcome"] == "exception"
+        assert all(audit["duration_ms"] >= 0 for audit in audits)
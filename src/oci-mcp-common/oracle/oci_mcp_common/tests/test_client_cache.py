@@ -0,0 +1,132 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at
+https://oss.oracle.com/licenses/upl.
+"""
+
+import os
+import time
+
+import oci
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from oracle.oci_mcp_common.client_cache import (
+    cached_client,
+    get_file_mtimes,
+    get_settled_mtimes,
+)
+
+# the clients of the servers' get_*_client() factories
+CLIENTS = [
+    oci.artifacts.ArtifactsClient,
+    oci.cloud_guard.CloudGuardClient,
+    oci.cloud_migrations.MigrationClient,
+    oci.compute_instance_agent.ComputeInstanceAgentClient,
+    oci.core.ComputeClient,
+    oci.core.VirtualNetworkClient,
+    oci.identity.IdentityClient,
+    oci.logging.LoggingManagementClient,
+    oci.loggingsearch.LogSearchClient,
+    oci.monitoring.MonitoringClient,
+    oci.network_load_balancer.NetworkLoadBalancerClient,
+    oci.object_storage.ObjectStorageClient,
+    oci.resource_search.ResourceSearchClient,
+    oci.usage_api.UsageapiClient,
+]
+
+
+def set_age(path, seconds: int):
+    mtime_ns = time.time_ns() - seconds * 1_000_000_000
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture(scope="module")
+def private_key() -> bytes:
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    return key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.TraditionalOpenSSL,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+
+
+@pytest.fixture
+def credentials(tmp_path, monkeypatch, private_key):
+    """A session token profile whose files were written a minute ago"""
+    key_file = tmp_path / "key.pem"
+    key_file.write_bytes(private_key)
+    token_file = tmp_path / "token"
+    token_file.write_text("header.payload.signature")
+    config_file = tmp_path / "config"
+    config_file.write_text(
+        "[SESSION]\n"
+        "fingerprint=00:00:00:00:00:00:00:00:00:00:00:00:00:00:00:00\n"
+        "tenancy=ocid1.tenancy.oc1..test\n"
+        "region=us-ashburn-1\n"
+        f"key_file={key_file}\n"
+        f"security_token_file={token_file}\n"
+    )
+    for path in (config_file, key_file, token_file):
+        set_age(path, 60)
+    monkeypatch.setenv("OCI_CONFIG_FILE", str(config_file))
+    monkeypatch.setenv("OCI_CONFIG_PROFILE", "SESSION")
+    return config_file, key_file, token_file
+
+
+@pytest.mark.parametrize("client_class", CLIENTS, ids=lambda c: c.__name__)
+def test_client_is_cached_until_credentials_change(client_class, credentials):
+    config_file, key_file, token_file = credentials
+    built = []
+
+    @cached_client
+    def get_client():
+        config = oci.config.from_file(
+            file_location=os.getenv("OCI_CONFIG_FILE"),
+            profile_name=os.getenv("OCI_CONFIG_PROFILE"),
+        )
+        private_key = oci.signer.load_private_key_from_file(config["key_file"])
+        with open(config["security_token_file"], "r") as f:
+            token = f.read()
+        signer = oci.auth.signers.SecurityTokenSigner(token, private_key)
+        client = client_class(config, signer=signer)
+        built.append(client)
+        return client
+
+    first = get_client()
+
+    assert isinstance(first, client_class)
+    assert get_client() is first
+    assert len(built) == 1
+
+    # a refreshed session token, key or config invalidates the cached client
+    for path in (token_file, key_file, config_file):
+        set_age(path, 30 + len(built))
+        rebuilt = get_client()
+
+        assert rebuilt is built[-1] is not first
+        assert get_client() is rebuilt
+    assert len(built) == 4
+
+    # a file that has just been written may change again under the build
+    token_file.write_text("header.payload.signature")
+    assert get_client() is not get_client()
+
+    set_age(token_file, 60)
+    get_client.cache_clear()
+    assert get_client() is get_client() is built[-1]
+
+    # a missing file is never taken as unchanged
+    assert get_file_mtimes((config_file, token_file.with_name("gone"))) is None
+
+
+def test_settled_mtimes(tmp_path):
+    old, new = tmp_path / "old", tmp_path / "new"
+    old.write_text("old")
+    new.write_text("new")
+    set_age(old, 60)
+    started = time.time_ns()
+
+    assert get_settled_mtimes((old,), started) == get_file_mtimes((old,))
+    assert get_settled_mtimes((old, new), started) is None
+    assert get_settled_mtimes((old, tmp_path / "gone"), started) is None
@@ -13,6 +13,7 @@ import oci
 from fastmcp import Context, FastMCP
 from oci import Response
 from oci.monitoring.models import ListMetricsDetails, SummarizeMetricsDataDetails
+from oracle.oci_mcp_common.client_cache import cached_client
 from oracle.oci_monitoring_mcp_server.alarm_models import (
     AlarmSummary,
     map_alarm_summary,
@@ -41,6 +42,7 @@ mcp = FastMCP(
 )
 
 
+@cached_client
 def get_monitoring_client():
     logger.info("entering get_monitoring_client")
     config = oci.config.from_file(
@@ -52,7 +54,6 @@ def get_monitoring_client():
 
     private_key = oci.signer.load_private_key_from_file(config["key_file"])
     token_file = os.path.expanduser(config["security_token_file"])
-    token = None
     with open(token_file, "r") as f:
         token = f.read()
     signer = oci.auth.signers.SecurityTokenSigner(token, private_key)
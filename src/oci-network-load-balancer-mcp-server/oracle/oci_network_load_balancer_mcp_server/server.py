@@ -10,6 +10,7 @@ from typing import Literal, Optional
 
 import oci
 from fastmcp import FastMCP
+from oracle.oci_mcp_common.client_cache import cached_client
 from oracle.oci_network_load_balancer_mcp_server.models import (
     Backend,
     BackendSet,
@@ -29,6 +30,7 @@ logger = Logger(__name__, level="INFO")
 mcp = FastMCP(name=__project__)
 
 
+@cached_client
 def get_nlb_client():
     logger.info("entering get_nlb_client")
     config = oci.config.from_file(
@@ -39,7 +41,6 @@ def get_nlb_client():
     config["additional_user_agent"] = f"{user_agent_name}/{__version__}"
     private_key = oci.signer.load_private_key_from_file(config["key_file"])
     token_file = os.path.expanduser(config["security_token_file"])
-    token = None
     with open(token_file, "r") as f:
         token = f.read()
     signer = oci.auth.signers.SecurityTokenSigner(token, private_key)
@@ -10,6 +10,7 @@ from typing import Annotated
 
 import oci
 from fastmcp import FastMCP
+from oracle.oci_mcp_common.client_cache import cached_client
 from oracle.oci_networking_mcp_server.models import (
     NetworkSecurityGroup,
     Response,
@@ -33,6 +34,7 @@ logger = Logger(__name__, level="INFO")
 mcp = FastMCP(name=__project__)
 
 
+@cached_client
 def get_networking_client():
     config = oci.config.from_file(
         file_location=os.getenv("OCI_CONFIG_FILE", oci.config.DEFAULT_LOCATION),
@@ -42,7 +44,6 @@ def get_networking_client():
     config["additional_user_agent"] = f"{user_agent_name}/{__version__}"
     private_key = oci.signer.load_private_key_from_file(config["key_file"])
     token_file = os.path.expanduser(config["security_token_file"])
-    token = None
     with open(token_file, "r") as f:
         token = f.read()
     signer = oci.auth.signers.SecurityTokenSigner(token, private_key)
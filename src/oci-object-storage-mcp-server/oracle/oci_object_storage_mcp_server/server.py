@@ -10,6 +10,7 @@ from typing import Annotated, List
 
 import oci
 from fastmcp import FastMCP
+from oracle.oci_mcp_common.client_cache import cached_client
 from oracle.oci_object_storage_mcp_server.models import (
     Bucket,
     BucketSummary,
@@ -29,6 +30,7 @@ logger = Logger(__name__, level="INFO")
 mcp = FastMCP(name=__project__)
 
 
+@cached_client
 def get_object_storage_client():
     config = oci.config.from_file(
         file_location=os.getenv("OCI_CONFIG_FILE", oci.config.DEFAULT_LOCATION),
@@ -39,7 +41,6 @@ def get_object_storage_client():
 
     private_key = oci.signer.load_private_key_from_file(config["key_file"])
     token_file = os.path.expanduser(config["security_token_file"])
-    token = None
     with open(token_file, "r") as f:
         token = f.read()
     signer = oci.auth.signers.SecurityTokenSigner(token, private_key)
@@ -10,6 +10,7 @@ from typing import Optional
 
 import oci
 from fastmcp import FastMCP
+from oracle.oci_mcp_common.client_cache import cached_client
 from oracle.oci_registry_mcp_server.models import (
     ContainerRepository,
     Response,
@@ -25,6 +26,7 @@ logger = Logger(__name__, level="INFO")
 mcp = FastMCP(name=__project__)
 
 
+@cached_client
 def get_ocir_client():
     config = oci.config.from_file(
         file_location=os.getenv("OCI_CONFIG_FILE", oci.config.DEFAULT_LOCATION),
@@ -36,7 +38,6 @@ def get_ocir_client():
 
     private_key = oci.signer.load_private_key_from_file(config["key_file"])
     token_file = os.path.expanduser(config["security_token_file"])
-    token = None
     with open(token_file, "r") as f:
         token = f.read()
     signer = oci.auth.signers.SecurityTokenSigner(token, private_key)
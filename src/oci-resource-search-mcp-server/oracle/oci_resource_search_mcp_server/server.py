@@ -11,6 +11,7 @@ from typing import Optional
 import oci
 from fastmcp import FastMCP
 from oci.resource_search.models import FreeTextSearchDetails, StructuredSearchDetails
+from oracle.oci_mcp_common.client_cache import cached_client
 from oracle.oci_resource_search_mcp_server.models import (
     ResourceSummary,
     map_resource_summary,
@@ -24,6 +25,7 @@ logger = Logger(__name__, level="INFO")
 mcp = FastMCP(name=__project__)
 
 
+@cached_client
 def get_search_client():
     logger.info("entering get_search_client")
     config = oci.config.from_file(
@@ -36,7 +38,6 @@ def get_search_client():
 
     private_key = oci.signer.load_private_key_from_file(config["key_file"])
     token_file = os.path.expanduser(config["security_token_file"])
-    token = None
     with open(token_file, "r") as f:
         token = f.read()
     signer = oci.auth.signers.SecurityTokenSigner(token, private_key)
@@ -11,6 +11,7 @@ from typing import Annotated
 import oci
 from fastmcp import FastMCP
 from oci.usage_api.models import RequestSummarizedUsagesDetails
+from oracle.oci_mcp_common.client_cache import cached_client
 
 from . import __project__, __version__
 
@@ -19,6 +20,7 @@ logger = Logger(__name__, level="INFO")
 mcp = FastMCP(name=__project__)
 
 
+@cached_client
 def get_usage_client():
     logger.info("entering get_monitoring_client")
     config = oci.config.from_file(
@@ -30,7 +32,6 @@ def get_usage_client():
 
     private_key = oci.signer.load_private_key_from_file(config["key_file"])
     token_file = os.path.expanduser(config["security_token_file"])
-    token = None
     with open(token_file, "r") as f:
         token = f.read()
     signer = oci.auth.signers.SecurityTokenSigner(token, private_key)